@@ -85,8 +85,6 @@ def dimensionality(z_array=None, z_object=None, pt_array=None,
 
     """
 
-    lo_dimensionality = []
-
     if z_array is not None:
         pt_obj = MTpt.PhaseTensor(z_array=z_array)
     elif z_object is not None:
@@ -104,21 +102,9 @@ def dimensionality(z_array=None, z_object=None, pt_array=None,
 
     # use criteria from Bibby et al. 2005 for determining the dimensionality
     # for each frequency of the pt/z array:
-    for idx_f in range(len(pt_obj.pt)):
-        #1. determine skew value...
-        skew = pt_obj.beta[idx_f]
-            #compare with threshold for 3D
-        if np.abs(skew) > skew_threshold:
-            lo_dimensionality.append(3)
-        else:
-            # 2.check for eccentricity:
-            ecc = pt_obj._pi1()[0][idx_f] / pt_obj._pi2()[0][idx_f]
-            if ecc > eccentricity_threshold:
-                lo_dimensionality.append(2)
-            else:
-                lo_dimensionality.append(1)
-
-    return np.array(lo_dimensionality)
+    return _dimensionality_from_pt(pt_obj.pt,
+                                   skew_threshold=skew_threshold,
+                                   eccentricity_threshold=eccentricity_threshold)
 
 
 def strike_angle(z_array=None, z_object=None, pt_array=None,
@@ -192,37 +178,9 @@ def strike_angle(z_array=None, z_object=None, pt_array=None,
                 'Input argument is not an instance of the PhaseTensor class')
         pt_obj = pt_object
 
-    lo_dims = dimensionality(pt_object=pt_obj,
-                             skew_threshold=skew_threshold,
-                             eccentricity_threshold=eccentricity_threshold)
-
-    lo_strikes = []
-
-    for idx, dim in enumerate(lo_dims):
-        if dim == 1:
-            lo_strikes.append((np.nan, np.nan))
-#            continue
-        
-        elif dim == 3:
-            lo_strikes.append((np.nan, np.nan))
-
-        else:
-            a = pt_obj.alpha[idx]
-            b = pt_obj.beta[idx]
-    
-            strike1 = (a - b) % 180
-            
-            # change so that values range from -90 to +90
-            # add alternative strikes to account for ambiguity
-            if strike1 > 90:
-                strike1 -= 180
-                strike2 = strike1 + 90
-            else:
-                strike2 = strike1 - 90
-        
-            lo_strikes.append((strike1, strike2))
-
-    return np.array(lo_strikes)
+    return _strike_from_pt(pt_obj.pt,
+                           skew_threshold=skew_threshold,
+                           eccentricity_threshold=eccentricity_threshold)
 
 
 def eccentricity(z_array=None, z_object=None, pt_array=None, pt_object=None):
@@ -283,21 +241,421 @@ def eccentricity(z_array=None, z_object=None, pt_array=None, pt_object=None):
                 'Input argument is not an instance of the PhaseTensor class')
         pt_obj = pt_object
 
-    lo_ecc = []
-    lo_eccerr = []
-
     if not isinstance(pt_obj, MTpt.PhaseTensor):
         raise MTex.MTpyError_PT(
             'Input argument is not an instance of the PhaseTensor class')
 
-    for idx_f in range(len(pt_obj.pt)):
-        lo_ecc.append(pt_obj._pi1()[0][idx_f] / pt_obj._pi2()[0][idx_f])
+    return _eccentricity_from_pt(pt_obj.pt, pt_obj.pt_err)
+
+
+def resolve_strike_ambiguity(strike_array, strike_approx=0):
+    """
+    Choose one of the two strike angles returned by strike_angle, the one
+    closest to an approximate strike, resolving the 90 degree ambiguity.
+
+    Arguments
+    ------------
+
+        **strike_array** : np.ndarray(..., 2)
+                           strike angles in degrees, last axis holds the
+                           two ambiguous angles as returned by strike_angle
+                           or SurveyGeometry.strike_angle
+
+        **strike_approx** : float or np.ndarray
+                            approximate strike angle in degrees, can be
+                            an array that broadcasts to strike_array[..., 0]
+                            *default* is 0
+
+    Returns
+    ----------
+
+        **strike** : np.ndarray(...)
+                     strike angle closest to strike_approx, nan where the
+                     strike is not defined
+
+    Examples
+    ----------
+        :Resolve Strike: ::
+
+            >>> import mtpy.analysis.geometry as geometry
+            >>> strike = geometry.strike_angle(z_object=z_obj)
+            >>> strike = geometry.resolve_strike_ambiguity(strike, 30)
+
+    """
+    strike_array = np.asarray(strike_array, dtype=float)
+    strike_approx = np.asarray(strike_approx, dtype=float)[..., np.newaxis]
+
+    # angular distance on a 180 degree circle
+    diff = np.abs((strike_array - strike_approx + 90) % 180 - 90)
+    # nan entries are never chosen unless both are nan
+    diff[np.isnan(diff)] = np.inf
+    index = np.argmin(diff, axis=-1)[..., np.newaxis]
+
+    return np.take_along_axis(strike_array, index, axis=-1)[..., 0]
+
+
+def _z2pt_array(z_array, z_err_array=None):
+    """
+    Vectorized version of mtpy.analysis.pt.z2pt for an array of impedance
+    tensors of any leading shape (..., 2, 2).
+
+    Singular impedance tensors give a phase tensor of zeros, the same as
+    PhaseTensor does frequency by frequency.  NaN impedances give NaN phase
+    tensors so that padded station x frequency stacks can be used.
+    """
+    z_array = np.asarray(z_array)
+    x = np.real(z_array)
+    y = np.imag(z_array)
+
+    det_x = x[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * x[..., 1, 0]
+    singular = det_x == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_det = np.where(singular, 0, 1. / det_x)
+    abs_inv = np.abs(inv_det)
+
+    pt_array = np.zeros(z_array.shape, dtype=float)
+    pt_array[..., 0, 0] = x[..., 1, 1] * y[..., 0, 0] - x[..., 0, 1] * y[..., 1, 0]
+    pt_array[..., 0, 1] = x[..., 1, 1] * y[..., 0, 1] - x[..., 0, 1] * y[..., 1, 1]
+    pt_array[..., 1, 0] = x[..., 0, 0] * y[..., 1, 0] - x[..., 1, 0] * y[..., 0, 0]
+    pt_array[..., 1, 1] = x[..., 0, 0] * y[..., 1, 1] - x[..., 1, 0] * y[..., 0, 1]
+    pt_array *= inv_det[..., np.newaxis, np.newaxis]
+
+    if z_err_array is None:
+        return pt_array, None
+
+    e = np.asarray(z_err_array, dtype=float)
+    p = pt_array
+    pt_err_array = np.zeros_like(pt_array)
+
+    # same Gaussian error propagation as z2pt for a single matrix
+    pt_err_array[..., 0, 0] = abs_inv * np.sqrt(
+        (p[..., 0, 0] * x[..., 1, 1] * e[..., 0, 0]) ** 2 +
+        (p[..., 0, 0] * x[..., 0, 1] * e[..., 1, 0]) ** 2 +
+        ((y[..., 0, 0] * x[..., 1, 0] - x[..., 0, 0] * y[..., 1, 0]) *
+         abs_inv * x[..., 0, 0] * e[..., 0, 1]) ** 2 +
+        ((y[..., 1, 0] * x[..., 0, 0] - x[..., 1, 0] * y[..., 1, 1]) *
+         abs_inv * x[..., 0, 1] * e[..., 1, 1]) ** 2 +
+        (x[..., 1, 1] * e[..., 0, 0]) ** 2 +
+        (x[..., 0, 1] * e[..., 1, 0]) ** 2)
+
+    pt_err_array[..., 0, 1] = abs_inv * np.sqrt(
+        (p[..., 0, 1] * x[..., 1, 1] * e[..., 0, 0]) ** 2 +
+        (p[..., 0, 1] * x[..., 0, 1] * e[..., 1, 0]) ** 2 +
+        ((y[..., 0, 1] * x[..., 1, 0] - x[..., 0, 0] * y[..., 1, 1]) *
+         abs_inv * x[..., 1, 1] * e[..., 0, 1]) ** 2 +
+        ((y[..., 1, 1] * x[..., 0, 0] - x[..., 0, 1] * y[..., 1, 0]) *
+         abs_inv * x[..., 0, 1] * e[..., 1, 1]) ** 2 +
+        (x[..., 1, 1] * e[..., 0, 1]) ** 2 +
+        (x[..., 0, 1] * e[..., 1, 1]) ** 2)
+
+    pt_err_array[..., 1, 0] = abs_inv * np.sqrt(
+        (p[..., 1, 0] * x[..., 1, 0] * e[..., 0, 1]) ** 2 +
+        (p[..., 1, 0] * x[..., 0, 0] * e[..., 1, 1]) ** 2 +
+        ((y[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * y[..., 1, 1]) *
+         abs_inv * x[..., 1, 0] * e[..., 0, 0]) ** 2 +
+        ((y[..., 1, 0] * x[..., 0, 1] - x[..., 1, 1] * y[..., 0, 0]) *
+         abs_inv * x[..., 0, 0] * e[..., 0, 1]) ** 2 +
+        (x[..., 1, 0] * e[..., 0, 0]) ** 2 +
+        (x[..., 0, 0] * e[..., 1, 0]) ** 2)
+
+    pt_err_array[..., 1, 1] = abs_inv * np.sqrt(
+        (p[..., 1, 1] * x[..., 1, 0] * e[..., 0, 1]) ** 2 +
+        (p[..., 1, 1] * x[..., 0, 0] * e[..., 1, 1]) ** 2 +
+        ((y[..., 0, 1] * x[..., 1, 1] - x[..., 0, 1] * y[..., 1, 1]) *
+         abs_inv * x[..., 1, 0] * e[..., 0, 0]) ** 2 +
+        ((y[..., 1, 1] * x[..., 0, 1] - x[..., 1, 1] * y[..., 0, 1]) *
+         abs_inv * x[..., 0, 0] * e[..., 0, 1]) ** 2 +
+        (x[..., 1, 0] * e[..., 0, 1]) ** 2 +
+        (x[..., 0, 0] * e[..., 1, 1]) ** 2)
+
+    return pt_array, pt_err_array
+
+
+def _pi_from_pt(pt_array, pt_err_array=None):
+    """
+    Pi1 and Pi2 after Bibby et al. 2005 for an array of phase tensors of any
+    leading shape (..., 2, 2), same as PhaseTensor._pi1 and _pi2.
+
+    Returns pi1, pi1_err, pi2, pi2_err, errors are None if pt_err_array is
+    None.
+    """
+    pt = np.asarray(pt_array, dtype=float)
+    a = pt[..., 0, 0] - pt[..., 1, 1]
+    b = pt[..., 0, 1] + pt[..., 1, 0]
+    c = pt[..., 0, 0] + pt[..., 1, 1]
+    d = pt[..., 0, 1] - pt[..., 1, 0]
+
+    pi1 = 0.5 * np.sqrt(a ** 2 + b ** 2)
+    pi2 = 0.5 * np.sqrt(c ** 2 + d ** 2)
+
+    if pt_err_array is None:
+        return pi1, None, pi2, None
+
+    err = np.asarray(pt_err_array, dtype=float)
+    diag_err = err[..., 0, 0] ** 2 + err[..., 1, 1] ** 2
+    off_err = err[..., 0, 1] ** 2 + err[..., 1, 0] ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pi1_err = 1. / pi1 * np.sqrt(a ** 2 * diag_err + b ** 2 * off_err)
+        pi2_err = 1. / pi2 * np.sqrt(c ** 2 * diag_err + d ** 2 * off_err)
+
+    return pi1, pi1_err, pi2, pi2_err
 
-        ecc_err = None
-        if (pt_obj._pi1()[1] is not None) and (pt_obj._pi2()[1] is not None):
-            ecc_err = np.sqrt((pt_obj._pi1()[1][idx_f] / pt_obj._pi1()[0][idx_f]) ** 2 +\
-                              (pt_obj._pi2()[1][idx_f] / pt_obj._pi2()[0][idx_f]) ** 2)
 
-        lo_eccerr.append(ecc_err)
+def _dimensionality_from_pt(pt_array, skew_threshold=5,
+                            eccentricity_threshold=0.1):
+    """
+    Dimensionality [ 1 | 2 | 3 ] for an array of phase tensors of any
+    leading shape (..., 2, 2) following Bibby et al. 2005.
+    """
+    pt = np.asarray(pt_array, dtype=float)
+    beta = np.degrees(0.5 * np.arctan2(pt[..., 0, 1] - pt[..., 1, 0],
+                                       pt[..., 0, 0] + pt[..., 1, 1]))
+    pi1, pi1_err, pi2, pi2_err = _pi_from_pt(pt)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ecc = pi1 / pi2
+
+    dims = np.ones(beta.shape, dtype=int)
+    with np.errstate(invalid='ignore'):
+        dims[ecc > eccentricity_threshold] = 2
+        dims[np.abs(beta) > skew_threshold] = 3
+
+    return dims
+
+
+def _strike_from_pt(pt_array, skew_threshold=5, eccentricity_threshold=0.1):
+    """
+    Strike angles (..., 2) in degrees for an array of phase tensors of any
+    leading shape (..., 2, 2), nan where the phase tensor is not 2-D.
+    """
+    pt = np.asarray(pt_array, dtype=float)
+    dims = _dimensionality_from_pt(pt,
+                                   skew_threshold=skew_threshold,
+                                   eccentricity_threshold=eccentricity_threshold)
+
+    alpha = np.degrees(0.5 * np.arctan2(pt[..., 0, 1] + pt[..., 1, 0],
+                                        pt[..., 0, 0] - pt[..., 1, 1]))
+    beta = np.degrees(0.5 * np.arctan2(pt[..., 0, 1] - pt[..., 1, 0],
+                                       pt[..., 0, 0] + pt[..., 1, 1]))
+
+    strike1 = (alpha - beta) % 180
+    # change so that values range from -90 to +90
+    # add alternative strikes to account for ambiguity
+    upper = strike1 > 90
+    strike1[upper] -= 180
+    strike2 = np.where(upper, strike1 + 90, strike1 - 90)
+
+    strikes = np.stack([strike1, strike2], axis=-1)
+    strikes[dims != 2] = np.nan
+
+    return strikes
+
+
+def _eccentricity_from_pt(pt_array, pt_err_array=None):
+    """
+    Eccentricity and its error for an array of phase tensors of any leading
+    shape (..., 2, 2), the error is None if pt_err_array is None.
+    """
+    pi1, pi1_err, pi2, pi2_err = _pi_from_pt(pt_array, pt_err_array)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ecc = pi1 / pi2
+        if pi1_err is None or pi2_err is None:
+            return ecc, None
+        ecc_err = np.sqrt((pi1_err / pi1) ** 2 + (pi2_err / pi2) ** 2)
+
+    return ecc, ecc_err * ecc
+
+
+class SurveyGeometry(object):
+    """
+    Geometry analysis of a whole survey at once.
+
+    Takes a station x frequency stack of impedance or phase tensors and
+    computes dimensionality, strike angles and eccentricity for every entry
+    in one vectorized call.  Results are cached for each set of thresholds
+    so repeated plotting of the same dataset does not recompute them.
 
-    return np.array(lo_ecc), np.array(lo_eccerr)*np.array(lo_ecc)
+    Stations with different frequencies are put onto the union of all
+    frequencies, entries a station does not have are NaN and come out as
+    dimensionality 1 and strike NaN.
+
+    Arguments
+    ------------
+
+        **z_array** : np.ndarray(ns, nf, 2, 2)
+                      impedance tensors for all stations and frequencies
+                      *default* is None
+
+        **z_err_array** : np.ndarray(ns, nf, 2, 2)
+                          impedance errors
+                          *default* is None
+
+        **pt_array** : np.ndarray(ns, nf, 2, 2)
+                       phase tensors for all stations and frequencies
+                       *default* is None
+
+        **pt_err_array** : np.ndarray(ns, nf, 2, 2)
+                           phase tensor errors
+                           *default* is None
+
+        **mt_obj_list** : list of mtpy.core.mt.MT
+                          MT objects to build the stack from
+                          *default* is None
+
+        **freq** : np.ndarray(nf)
+                   frequencies of the stack, set from mt_obj_list if given
+                   *default* is None
+
+    ====================== ====================================================
+    Attributes             Description
+    ====================== ====================================================
+    freq                   frequencies of the stack (nf)
+    freq_index             list of index arrays, one per station, mapping the
+                           station's frequencies into freq, only set when
+                           built from mt_obj_list
+    pt                     phase tensor stack (ns, nf, 2, 2)
+    pt_err                 phase tensor error stack (ns, nf, 2, 2) or None
+    station_list           station names if built from mt_obj_list
+    ====================== ====================================================
+
+    Examples
+    ----------
+        :Survey Strike: ::
+
+            >>> import mtpy.analysis.geometry as geometry
+            >>> survey = geometry.SurveyGeometry(mt_obj_list=mt_list)
+            >>> dims = survey.dimensionality(skew_threshold=3)
+            >>> strike = survey.strike_angle(skew_threshold=3)
+            >>> # strike for the first station on its own frequencies
+            >>> strike[0, survey.freq_index[0]]
+
+    """
+
+    def __init__(self, z_array=None, z_err_array=None, pt_array=None,
+                 pt_err_array=None, mt_obj_list=None, freq=None):
+
+        self.freq = freq
+        self.freq_index = None
+        self.station_list = None
+        self._cache = {}
+
+        if mt_obj_list is not None:
+            z_array, z_err_array = self._stack_mt_obj_list(mt_obj_list)
+
+        if z_array is not None:
+            z_array = np.asarray(z_array)
+            if z_array.shape[-2:] != (2, 2):
+                raise MTex.MTpyError_Z('z_array must have shape (..., 2, 2) '
+                                       'not {0}'.format(z_array.shape))
+            self.pt, self.pt_err = _z2pt_array(z_array, z_err_array)
+        elif pt_array is not None:
+            pt_array = np.asarray(pt_array, dtype=float)
+            if pt_array.shape[-2:] != (2, 2):
+                raise MTex.MTpyError_PT('pt_array must have shape (..., 2, 2) '
+                                        'not {0}'.format(pt_array.shape))
+            self.pt = pt_array
+            self.pt_err = pt_err_array
+        else:
+            raise MTex.MTpyError_inputarguments('Need to input z_array, '
+                                                'pt_array or mt_obj_list')
+
+    def _stack_mt_obj_list(self, mt_obj_list):
+        """
+        put impedances of all stations onto the union of their frequencies
+        """
+        self.freq = np.unique(np.hstack([mt_obj.Z.freq
+                                         for mt_obj in mt_obj_list]))[::-1]
+        self.station_list = [mt_obj.station for mt_obj in mt_obj_list]
+        self.freq_index = []
+
+        ns = len(mt_obj_list)
+        nf = self.freq.size
+        z_array = np.zeros((ns, nf, 2, 2), dtype=complex)
+        z_array[:] = np.nan
+        z_err_array = None
+        if np.all([mt_obj.Z.z_err is not None for mt_obj in mt_obj_list]):
+            z_err_array = np.zeros((ns, nf, 2, 2), dtype=float)
+            z_err_array[:] = np.nan
+
+        # freq is sorted descending, search on the reversed view
+        for ii, mt_obj in enumerate(mt_obj_list):
+            f_index = nf - 1 - np.searchsorted(self.freq[::-1], mt_obj.Z.freq)
+            self.freq_index.append(f_index)
+            z_array[ii, f_index] = mt_obj.Z.z
+            if z_err_array is not None:
+                z_err_array[ii, f_index] = mt_obj.Z.z_err
+
+        return z_array, z_err_array
+
+    def reset_cache(self):
+        """
+        clear cached results, call if pt is changed in place
+        """
+        self._cache = {}
+
+    def dimensionality(self, skew_threshold=5, eccentricity_threshold=0.1):
+        """
+        Dimensionality of every station and frequency.
+
+        See mtpy.analysis.geometry.dimensionality for a description of the
+        thresholds.
+
+        Returns
+        ----------
+            **dimensions** : np.ndarray(ns, nf, dtype=int)
+                             values are [ 1 | 2 | 3 ]
+        """
+        key = ('dimensionality', skew_threshold, eccentricity_threshold)
+        if key not in self._cache:
+            self._cache[key] = _dimensionality_from_pt(
+                self.pt,
+                skew_threshold=skew_threshold,
+                eccentricity_threshold=eccentricity_threshold)
+        return self._cache[key]
+
+    def strike_angle(self, skew_threshold=5, eccentricity_threshold=0.1,
+                     strike_approx=None):
+        """
+        Strike angles of every station and frequency.
+
+        See mtpy.analysis.geometry.strike_angle for a description of the
+        thresholds.
+
+        Arguments
+        ------------
+            **strike_approx** : float or np.ndarray
+                                if given the 90 degree ambiguity is resolved
+                                by choosing the angle closest to this value,
+                                see resolve_strike_ambiguity
+                                *default* is None
+
+        Returns
+        ----------
+            **strike** : np.ndarray(ns, nf, 2) or np.ndarray(ns, nf)
+                         strike angles in degrees, nan where not 2-D.
+                         Only one angle is returned if strike_approx is given.
+        """
+        key = ('strike', skew_threshold, eccentricity_threshold)
+        if key not in self._cache:
+            self._cache[key] = _strike_from_pt(
+                self.pt,
+                skew_threshold=skew_threshold,
+                eccentricity_threshold=eccentricity_threshold)
+
+        if strike_approx is not None:
+            return resolve_strike_ambiguity(self._cache[key], strike_approx)
+        return self._cache[key]
+
+    def eccentricity(self):
+        """
+        Eccentricity of every station and frequency.
+
+        Returns
+        ----------
+            **eccentricity** : np.ndarray(ns, nf)
+
+            **eccentricity_err** : np.ndarray(ns, nf) or None
+        """
+        key = ('eccentricity',)
+        if key not in self._cache:
+            self._cache[key] = _eccentricity_from_pt(self.pt, self.pt_err)
+        return self._cache[key]
@@ -277,6 +277,109 @@ def calculate_depth_nb(z_object=None, z_array=None, periods=None):
 #    return np.array(lo_nb_max), np.array(lo_nb_min)
 
 
+def calculate_depth_nb_array(z_array, periods):
+    """
+    Vectorized version of calculate_depth_nb for a stack of impedance
+    tensors, for example all stations and periods of a survey at once.
+
+    Follows the same steps as calculate_depth_nb: strike angles are
+    estimated from the phase tensor, 3D parts are discarded and the strike
+    is linearly interpolated over them, Z is rotated onto the strike and
+    both off-diagonal modes are transformed by Niblett-Bostick.
+
+    Entries that are NaN (for instance stations padded to a common number
+    of periods) come out as NaN.
+
+    Arguments
+    -------------
+        *z_array* : np.ndarray [num_stations, num_periods, 2, 2]
+                    impedance tensors, a single station (num_periods, 2, 2)
+                    is also accepted
+
+        *periods* : np.ndarray [num_stations, num_periods] or (num_periods)
+                    periods in seconds for each entry of z_array
+
+    Returns
+    ------------------
+        *depth_array* : np.ndarray([num_stations,] num_periods,
+                                   dtype=['period', 'depth_min', 'depth_max',
+                                          'rho_min', 'rho_max'])
+                        numpy structured array with the same keywords as
+                        calculate_depth_nb
+
+    Example
+    ------------
+        >>> import mtpy.analysis.niblettbostick as nb
+        >>> depth_cube = nb.calculate_depth_nb_array(z_stack, period_stack)
+        >>> depth_cube['depth_max'][0]
+    """
+    z_array = np.asarray(z_array)
+    periods = np.broadcast_to(np.asarray(periods, dtype=float),
+                              z_array.shape[:-2])
+
+    # strike and dimensionality of all entries at once
+    pt_array = MTge._z2pt_array(z_array)[0]
+    dimensions = MTge._dimensionality_from_pt(pt_array)
+    angles = np.nan_to_num(MTge._strike_from_pt(pt_array)[..., 0])
+
+    # interpolate strike angle from the 1D/2D parts onto all periods,
+    # outside the range of the 1D/2D parts the strike is 0
+    flat_shape = (-1, periods.shape[-1])
+    flat_periods = periods.reshape(flat_shape)
+    flat_angles = angles.reshape(flat_shape)
+    flat_good = ((dimensions != 3) &
+                 np.isfinite(periods) &
+                 np.all(np.isfinite(z_array), axis=(-2, -1))).reshape(flat_shape)
+
+    strike_angles = np.zeros(flat_periods.shape)
+    for ii in range(flat_periods.shape[0]):
+        good = flat_good[ii]
+        if not good.any():
+            continue
+        order = np.argsort(flat_periods[ii, good])
+        strike_angles[ii] = np.interp(flat_periods[ii],
+                                      flat_periods[ii, good][order],
+                                      flat_angles[ii, good][order],
+                                      left=0, right=0)
+    strike_angles = strike_angles.reshape(periods.shape)
+
+    # rotate z onto strike, same rotation as mtpy.core.z.Z.rotate
+    phi = np.radians(strike_angles % 360)
+    cphi = np.cos(phi)
+    sphi = np.sin(phi)
+    rot_mat = np.zeros(periods.shape + (2, 2))
+    rot_mat[..., 0, 0] = cphi
+    rot_mat[..., 0, 1] = sphi
+    rot_mat[..., 1, 0] = -sphi
+    rot_mat[..., 1, 1] = cphi
+    z_rot = np.matmul(np.matmul(rot_mat, z_array),
+                      np.swapaxes(rot_mat, -1, -2))
+
+    # at this point we assume that the two modes are the off-diagonal elements
+    # TE is element (1,2), TM at (2,1)
+    freq = 1. / periods
+    te_rho, te_depth = rhophi2rhodepth(np.abs(z_rot[..., 0, 1]) ** 2 / freq * 0.2,
+                                       np.rad2deg(np.angle(z_rot[..., 0, 1])),
+                                       periods)
+    tm_rho, tm_depth = rhophi2rhodepth(np.abs(z_rot[..., 1, 0]) ** 2 / freq * 0.2,
+                                       np.rad2deg(np.angle(z_rot[..., 1, 0])),
+                                       periods)
+
+    depth_array = np.zeros(periods.shape,
+                           dtype=[('period', np.float),
+                                  ('depth_min', np.float),
+                                  ('depth_max', np.float),
+                                  ('rho_min', np.float),
+                                  ('rho_max', np.float)])
+    depth_array['period'] = periods
+    depth_array['depth_min'] = np.minimum(te_depth, tm_depth)
+    depth_array['depth_max'] = np.maximum(te_depth, tm_depth)
+    depth_array['rho_min'] = np.minimum(te_rho, tm_rho)
+    depth_array['rho_max'] = np.maximum(te_rho, tm_rho)
+
+    return depth_array
+
+
 def calculate_rho_minmax(z_object=None, z_array=None, periods=None):
     """
     Determine 2 arrays of Niblett-Bostick transformed aparent resistivities:
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Convert many MT response files to another format at once.
+
+Input files (.edi, .j, .xml, .zmm/.zrr/.zss) are found from a directory or a
+glob pattern, their format is detected from the extension or the first line
+of the file, and each file is read into an mt.MT object and written out in a
+pool of processes.  Files whose output is newer than the input are skipped,
+so a survey can be converted again after adding or reprocessing a few
+stations.
+
+:Example: ::
+
+    >>> import mtpy.core.batch_convert as batch_convert
+    >>> results = batch_convert.batch_convert(r"/home/mt/survey/*.j",
+    ...                                       save_dir=r"/home/mt/edi")
+    >>> failed = [res for res in results if res.status == 'failed']
+
+or from the command line ::
+
+    mtpy_convert "/home/mt/survey/*.j" -o /home/mt/edi -t edi
+
+"""
+
+# ==============================================================================
+import glob
+import multiprocessing
+import os
+import traceback
+from collections import namedtuple
+
+import click
+
+import mtpy.core.mt as mt
+from mtpy.utils.mtpylog import MtPyLog
+
+_logger = MtPyLog.get_mtpy_logger(__name__)
+
+# file extension --> file type read by mt.MT.read_mt_file
+INPUT_TYPE_DICT = {'edi': 'edi',
+                   'j': 'j',
+                   'xml': 'xml',
+                   'zmm': 'zmm',
+                   'zrr': 'zmm',
+                   'zss': 'zmm'}
+
+# file types written by mt.MT.write_mt_file
+OUTPUT_TYPE_LIST = ['edi', 'xml']
+
+ConvertResult = namedtuple('ConvertResult', ['fn', 'out_fn', 'status',
+                                             'error'])
+ConvertResult.__doc__ = """
+result of converting one file, status is one of 'converted', 'skipped' or
+'failed', error holds the traceback of a failed file
+"""
+
+
+# ==============================================================================
+def get_file_type(fn):
+    """
+    get the type of an MT response file from its extension, or if the
+    extension is not known from the first line of the file.
+
+    :param fn: full path to file
+    :type fn: string
+
+    :returns: [ 'edi' | 'j' | 'xml' | 'zmm' | None ]
+    :rtype: string
+    """
+    ext = os.path.splitext(fn)[1][1:].lower()
+    if ext in INPUT_TYPE_DICT:
+        return INPUT_TYPE_DICT[ext]
+
+    try:
+        with open(fn, 'r', errors='replace') as fid:
+            line = fid.readline().strip().lower()
+    except (IOError, OSError):
+        return None
+
+    if line.startswith('>head'):
+        return 'edi'
+    elif line.startswith('<?xml'):
+        return 'xml'
+    elif line.startswith('#') and 'birrp' in line:
+        return 'j'
+    elif line.startswith('**') and 'impedance' in line:
+        return 'zmm'
+
+    return None
+
+
+def find_mt_files(path, input_types=None, recursive=False):
+    """
+    find MT response files in a directory or from a glob pattern.
+
+    :param path: directory or glob pattern, eg. r"/home/mt/survey/*.j"
+    :type path: string
+
+    :param input_types: file types to keep, *default* is all supported types
+    :type input_types: list
+
+    :param recursive: search sub directories of a directory, or allow ** in
+                      a glob pattern
+    :type recursive: boolean
+
+    :returns: list of (file name, file type) sorted by file name
+    :rtype: list
+    """
+    if input_types is None:
+        input_types = sorted(set(INPUT_TYPE_DICT.values()))
+
+    if os.path.isdir(path):
+        if recursive:
+            fn_list = [os.path.join(root, fn)
+                       for root, dirs, files in os.walk(path) for fn in files]
+        else:
+            fn_list = [os.path.join(path, fn) for fn in os.listdir(path)]
+    else:
+        fn_list = glob.glob(path, recursive=recursive)
+
+    mt_fn_list = []
+    for fn in sorted(fn_list):
+        if not os.path.isfile(fn):
+            continue
+        file_type = get_file_type(fn)
+        if file_type in input_types:
+            mt_fn_list.append((fn, file_type))
+
+    return mt_fn_list
+
+
+def convert_file(fn, out_fn, input_type=None, output_type='edi',
+                 overwrite=False):
+    """
+    convert a single MT response file, any error is caught and returned in
+    the result.
+
+    :param fn: full path to input file
+    :param out_fn: full path to output file
+    :param input_type: type of input file, *default* is from the extension
+    :param output_type: [ 'edi' | 'xml' ]
+    :param overwrite: convert even if out_fn is newer than fn
+
+    :returns: result of the conversion
+    :rtype: ConvertResult
+    """
+    try:
+        if not overwrite and os.path.isfile(out_fn) and \
+                os.path.getmtime(out_fn) >= os.path.getmtime(fn):
+            return ConvertResult(fn, out_fn, 'skipped', None)
+
+        mt_obj = mt.MT()
+        mt_obj.read_mt_file(fn, file_type=input_type)
+
+        # the writers make a unique file name instead of over writing
+        if os.path.isfile(out_fn):
+            os.remove(out_fn)
+        new_fn = mt_obj.write_mt_file(save_dir=os.path.dirname(out_fn),
+                                      fn_basename=os.path.basename(out_fn),
+                                      file_type=output_type)
+        return ConvertResult(fn, new_fn, 'converted', None)
+    except Exception:
+        return ConvertResult(fn, out_fn, 'failed', traceback.format_exc())
+
+
+def _convert_file(args):
+    """
+    unpack arguments for the process pool
+    """
+    return convert_file(*args)
+
+
+def batch_convert(path, save_dir=None, output_type='edi', input_types=None,
+                  recursive=False, overwrite=False, n_processes=None):
+    """
+    convert all the MT response files in a directory or glob pattern to
+    another format, the files are converted in a pool of processes.
+
+    Output files are named after the input file with the new extension.
+    Input files whose output is newer are skipped unless overwrite is True.
+    Errors do not stop the conversion, they are returned in the results.
+
+    :param path: directory or glob pattern of input files
+    :type path: string
+
+    :param save_dir: directory to save files to, *default* is None which
+                     saves each file next to its input file
+    :type save_dir: string
+
+    :param output_type: [ 'edi' | 'xml' ]
+    :type output_type: string
+
+    :param input_types: input file types to convert, *default* is all types
+    :type input_types: list
+
+    :param recursive: search sub directories of path
+    :type recursive: boolean
+
+    :param overwrite: convert all files even if outputs are up to date
+    :type overwrite: boolean
+
+    :param n_processes: number of processes, *default* is None, which uses
+                        the number of cpus
+    :type n_processes: int
+
+    :returns: one result for each input file, in the order of the inputs
+    :rtype: list of ConvertResult
+
+    :Example: ::
+
+        >>> import mtpy.core.batch_convert as batch_convert
+        >>> results = batch_convert.batch_convert(r"/home/mt/j_files",
+        ...                                       save_dir=r"/home/mt/xml",
+        ...                                       output_type='xml')
+    """
+    if output_type not in OUTPUT_TYPE_LIST:
+        raise mt.MTError('Output type {0} not supported, use one of {1}'.format(
+            output_type, OUTPUT_TYPE_LIST))
+
+    if save_dir is not None and not os.path.isdir(save_dir):
+        os.makedirs(save_dir)
+
+    results = []
+    task_list = []
+    out_fn_dict = {}
+    for fn, input_type in find_mt_files(path, input_types=input_types,
+                                        recursive=recursive):
+        out_dir = save_dir if save_dir is not None else os.path.dirname(fn)
+        out_fn = os.path.join(out_dir, '{0}.{1}'.format(
+            os.path.splitext(os.path.basename(fn))[0], output_type))
+        key = os.path.normcase(os.path.abspath(out_fn))
+
+        # never write over an input or another output
+        if key == os.path.normcase(os.path.abspath(fn)):
+            results.append(ConvertResult(fn, out_fn, 'failed',
+                                         'Output would over write the input'))
+        elif key in out_fn_dict:
+            results.append(ConvertResult(fn, out_fn, 'failed',
+                                         'Output is already written from '
+                                         '{0}'.format(out_fn_dict[key])))
+        else:
+            out_fn_dict[key] = fn
+            results.append(None)
+            task_list.append((fn, out_fn, input_type, output_type, overwrite))
+
+    if len(task_list) < 2 or n_processes == 1:
+        convert_list = [_convert_file(task) for task in task_list]
+    else:
+        if n_processes is None:
+            n_processes = multiprocessing.cpu_count()
+        # send files in chunks so there is little overhead for many files
+        chunksize = max(1, len(task_list) // (4 * n_processes))
+        pool = multiprocessing.Pool(n_processes)
+        try:
+            convert_list = pool.map(_convert_file, task_list,
+                                    chunksize=chunksize)
+        finally:
+            pool.close()
+            pool.join()
+
+    convert_iter = iter(convert_list)
+    results = [res if res is not None else next(convert_iter)
+               for res in results]
+
+    for status in ['converted', 'skipped', 'failed']:
+        _logger.info('{0} {1} files'.format(
+            status, len([res for res in results if res.status == status])))
+
+    return results
+
+
+# ==============================================================================
+# command line interface
+# ==============================================================================
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.argument('path')
+@click.option('-o', '--output-dir', default=None,
+              help="Directory to save files to, default is next to each input.")
+@click.option('-t', '--output-type', default='edi',
+              type=click.Choice(OUTPUT_TYPE_LIST), help="Output file type.")
+@click.option('-i', '--input-type', multiple=True,
+              type=click.Choice(sorted(set(INPUT_TYPE_DICT.values()))),
+              help="Only convert these input types, can be repeated.")
+@click.option('-r', '--recursive', is_flag=True,
+              help="Search sub directories, or allow ** in a glob pattern.")
+@click.option('-f', '--overwrite', is_flag=True,
+              help="Convert files even if the output is newer than the input.")
+@click.option('-n', '--n-processes', default=None, type=int,
+              help="Number of processes, default is the number of cpus.")
+def main(path, output_dir, output_type, input_type, recursive, overwrite,
+         n_processes):
+    '''
+    PATH: directory or quoted glob pattern of MT response files
+    (.edi, .j, .xml, .zmm, .zrr, .zss) to convert.
+    '''
+    results = batch_convert(path, save_dir=output_dir,
+                            output_type=output_type,
+                            input_types=list(input_type) or None,
+                            recursive=recursive, overwrite=overwrite,
+                            n_processes=n_processes)
+
+    failed = [res for res in results if res.status == 'failed']
+    for res in failed:
+        click.echo('Failed to convert {0}:\n{1}'.format(res.fn, res.error),
+                   err=True)
+    click.echo('Converted {0}, skipped {1}, failed {2} of {3} files'.format(
+        len([res for res in results if res.status == 'converted']),
+        len([res for res in results if res.status == 'skipped']),
+        len(failed), len(results)))
+
+    if len(failed) > 0:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,9 @@
 # ==============================================================================
 import os
 import datetime
+import functools
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 
 import mtpy.utils.gis_tools as gis_tools
@@ -589,33 +592,10 @@ class Edi(object):
                                                                         latlon_format=latlon_format)
         dsect_lines = self.Data_sect.write_data_sect(over_dict={'nfreq': len(self.Z.freq)})
 
-        # write out frequencies
-        freq_lines = [self._data_header_str.format('frequencies'.upper())]
-        freq_lines += self._write_data_block(self.Z.freq, 'freq')
-
-        # write out rotation angles
-        zrot_lines = [self._data_header_str.format(
-                      'impedance rotation angles'.upper())]
-        zrot_lines += self._write_data_block(self.Z.rotation_angle, 'zrot')
-
-        # write out data only impedance and tipper
-        z_data_lines = [self._data_header_str.format('impedances'.upper())]
         self.Z.z = np.nan_to_num(self.Z.z)
         self.Z.z_err = np.nan_to_num(self.Z.z_err)
         self.Tipper.tipper = np.nan_to_num(self.Tipper.tipper)
         self.Tipper.tipper_err = np.nan_to_num(self.Tipper.tipper_err)
-        for ii in range(2):
-            for jj in range(2):
-                z_lines_real = self._write_data_block(self.Z.z[:, ii, jj].real,
-                                                      self._z_labels[2 * ii + jj][0])
-                z_lines_imag = self._write_data_block(self.Z.z[:, ii, jj].imag,
-                                                      self._z_labels[2 * ii + jj][1])
-                z_lines_var = self._write_data_block(self.Z.z_err[:, ii, jj]**2.,
-                                                     self._z_labels[2 * ii + jj][2])
-
-                z_data_lines += z_lines_real
-                z_data_lines += z_lines_imag
-                z_data_lines += z_lines_var
 
         if self.Tipper.tipper is not None and np.all(self.Tipper.tipper == 0):
             trot_lines = ['']
@@ -637,32 +617,45 @@ class Edi(object):
                 # write out tipper lines
                 t_data_lines = [self._data_header_str.format('tipper'.upper())]
                 for jj in range(2):
-                    t_lines_real = self._write_data_block(self.Tipper.tipper[:, 0, jj].real,
-                                                          self._t_labels[jj][0])
-                    t_lines_imag = self._write_data_block(self.Tipper.tipper[:, 0, jj].imag,
-                                                          self._t_labels[jj][1])
-                    t_lines_var = self._write_data_block(self.Tipper.tipper_err[:, 0, jj]**2.,
-                                                         self._t_labels[jj][2])
-
-                    t_data_lines += t_lines_real
-                    t_data_lines += t_lines_imag
-                    t_data_lines += t_lines_var
+                    t_data_lines += self._write_data_block(self.Tipper.tipper[:, 0, jj].real,
+                                                           self._t_labels[jj][0])
+                    t_data_lines += self._write_data_block(self.Tipper.tipper[:, 0, jj].imag,
+                                                           self._t_labels[jj][1])
+                    t_data_lines += self._write_data_block(self.Tipper.tipper_err[:, 0, jj]**2.,
+                                                           self._t_labels[jj][2])
             except AttributeError:
                 trot_lines = ['']
                 t_data_lines = ['']
 
-        edi_lines = header_lines + \
-                    info_lines + \
-                    define_lines + \
-                    dsect_lines + \
-                    freq_lines + \
-                    zrot_lines + \
-                    z_data_lines + \
-                    trot_lines + \
-                    t_data_lines + ['>END']
-
+        # stream the sections to the file as they are formatted
         with open(new_edi_fn, 'w') as fid:
-            fid.write(''.join(edi_lines))
+            fid.write(''.join(header_lines + info_lines + define_lines +
+                              dsect_lines))
+
+            # write out frequencies
+            fid.write(self._data_header_str.format('frequencies'.upper()))
+            fid.write(''.join(self._write_data_block(self.Z.freq, 'freq')))
+
+            # write out rotation angles
+            fid.write(self._data_header_str.format(
+                      'impedance rotation angles'.upper()))
+            fid.write(''.join(self._write_data_block(self.Z.rotation_angle,
+                                                     'zrot')))
+
+            # write out data only impedance and tipper
+            fid.write(self._data_header_str.format('impedances'.upper()))
+            for ii in range(2):
+                for jj in range(2):
+                    z_labels = self._z_labels[2 * ii + jj]
+                    fid.write(''.join(
+                        self._write_data_block(self.Z.z[:, ii, jj].real,
+                                               z_labels[0]) +
+                        self._write_data_block(self.Z.z[:, ii, jj].imag,
+                                               z_labels[1]) +
+                        self._write_data_block(self.Z.z_err[:, ii, jj]**2.,
+                                               z_labels[2])))
+
+            fid.write(''.join(trot_lines + t_data_lines + ['>END']))
 
         self._logger.info('Wrote {0}'.format(new_edi_fn))
         return new_edi_fn
@@ -700,20 +693,16 @@ class Edi(object):
             raise MTex.MTpyError_EDI(
                 'Cannot write block for {0}'.format(data_key))
 
-        for d_index, d_comp in enumerate(data_comp_arr, 1):
-            if d_comp == 0.0 and data_key.lower() not in ['zrot', 'trot']:
-                d_comp = float(self.Header.empty)
-            # write the string in the specified format
-            num_str = '{0:{1}}'.format(d_comp, self._num_format)
+        data_comp_arr = np.asarray(data_comp_arr, dtype=float)
+        if data_key.lower() not in ['zrot', 'trot']:
+            data_comp_arr = np.where(data_comp_arr == 0.0,
+                                     float(self.Header.empty), data_comp_arr)
 
-            # check to see if a new line is needed
-            if d_index % self._block_len == 0:
-                num_str += '\n'
-            # at the end of the block add a return
-            if d_index == data_comp_arr.size:
-                num_str += '\n'
-
-            block_lines.append(num_str)
+        # format the whole block in one go
+        block_lines.append(_get_block_template(data_comp_arr.size,
+                                               self._num_format,
+                                               self._block_len).format(
+                                               *data_comp_arr.tolist()))
 
         return block_lines
 
@@ -775,6 +764,77 @@ class Edi(object):
 # ==============================================================================
 # Index finder
 # ==============================================================================
+@functools.lru_cache(maxsize=64)
+def _get_block_template(n_values, num_format, block_len):
+    """
+    format string for a data block of n_values, block_len values on a line
+    and an extra return at the end of the block
+    """
+    template = []
+    for d_index in range(1, n_values + 1):
+        num_str = '{:' + num_format + '}'
+        # check to see if a new line is needed
+        if d_index % block_len == 0:
+            num_str += '\n'
+        # at the end of the block add a return
+        if d_index == n_values:
+            num_str += '\n'
+        template.append(num_str)
+
+    return ''.join(template)
+
+
+def write_edi_files(edi_obj_list, new_edi_fn_list=None, n_threads=None,
+                    longitude_format='LON', latlon_format='dms'):
+    """
+    Write many .edi files at once, the files are written concurrently by a
+    pool of threads.
+
+    :param edi_obj_list: list of Edi objects to write
+    :type edi_obj_list: list
+
+    :param new_edi_fn_list: full paths to the new edi files, one for each
+                            Edi object.  *default* is None, see
+                            Edi.write_edi_file
+    :type new_edi_fn_list: list
+
+    :param n_threads: number of threads, *default* is None, which uses the
+                      number of cpus
+    :type n_threads: int
+
+    :returns: list of full paths to the new edi files
+    :rtype: list
+
+    :Example: ::
+
+        >>> import mtpy.core.edi as mtedi
+        >>> edi_list = [mtedi.Edi(edi_fn=fn) for fn in edi_fn_list]
+        >>> mtedi.write_edi_files(edi_list, new_fn_list)
+    """
+    if new_edi_fn_list is None:
+        new_edi_fn_list = [None] * len(edi_obj_list)
+    if len(new_edi_fn_list) != len(edi_obj_list):
+        raise MTex.MTpyError_EDI('Need one file name for each Edi object, '
+                                 'got {0} and {1}'.format(len(new_edi_fn_list),
+                                                          len(edi_obj_list)))
+
+    def write_one(edi_fn_pair):
+        edi_obj, new_edi_fn = edi_fn_pair
+        return edi_obj.write_edi_file(new_edi_fn=new_edi_fn,
+                                      longitude_format=longitude_format,
+                                      latlon_format=latlon_format)
+
+    if len(edi_obj_list) < 2 or n_threads == 1:
+        return [write_one(pair) for pair in zip(edi_obj_list, new_edi_fn_list)]
+
+    pool = ThreadPool(n_threads)
+    try:
+        return pool.map(write_one, list(zip(edi_obj_list, new_edi_fn_list)))
+    finally:
+        pool.close()
+        pool.join()
+
+
 class index_locator(object):
     def __init__(self, component_list):
         self.ex = None
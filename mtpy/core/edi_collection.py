@@ -21,6 +21,7 @@ import numpy as np
 import pandas as pd
 from shapely.geometry import Point  # , Polygon, LineString, LinearRing
 
+import mtpy.core.edi as mtedi
 import mtpy.core.mt as mt
 import mtpy.imaging.mtplottools as mtplottools
 from mtpy.utils.mtpy_decorator import deprecated
@@ -546,12 +547,15 @@ class EdiCollection(object):
             writer = csv.writer(csvf)
             writer.writerow(csv_header)
 
+            # depths of all stations and periods are computed once
+            depth_cube = mtpy.imaging.penetration.PenetrationDepthCube(self.mt_obj_list)
+
             for freq in freq_list:
                 pdlist = []
 
-                stations, periods, pen_depth_det, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( self.mt_obj_list, 1.0/freq)  # whichrho='det')
-                stations, periods, pen_depth_zxy, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( self.mt_obj_list, 1.0/freq,whichrho='zxy')
-                stations, periods, pen_depth_zyx, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( self.mt_obj_list, 1.0/freq,whichrho='zyx')
+                stations, periods, pen_depth_det, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( depth_cube, 1.0/freq)  # whichrho='det')
+                stations, periods, pen_depth_zxy, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( depth_cube, 1.0/freq,whichrho='zxy')
+                stations, periods, pen_depth_zyx, latlons = mtpy.imaging.penetration.get_penetration_depth_by_period( depth_cube, 1.0/freq,whichrho='zyx')
 
 
                 for iter in range(len(stations)):
@@ -737,6 +741,8 @@ class EdiCollection(object):
             period_list = np.array(self.get_periods_by_stats())
         # end if
 
+        edi_obj_list = []
+        edi_fn_list = []
         for mt_obj in self.mt_obj_list:
             # interpolate each station onto the period list
             # check bounds of period list
@@ -770,16 +776,17 @@ class EdiCollection(object):
                 interp_z, interp_t = mt_obj.interpolate(1. / interp_periods)
 
                 if dest_dir is not None and os.path.isdir(dest_dir):
-                    mt_obj.write_mt_file(
-                        save_dir=dest_dir,
-                        fn_basename=mt_obj.station,
-                        file_type='edi',
-                        new_Z_obj=interp_z,
-                        new_Tipper_obj=interp_t,
-                        longitude_format=longitude_format)
+                    edi_obj_list.append(mt_obj._make_edi_object(
+                        new_Z=interp_z, new_Tipper=interp_t))
+                    edi_fn_list.append(os.path.join(
+                        dest_dir, '{0}.edi'.format(mt_obj.station)))
             else:
                 pass
         # end for
+
+        # write all the stations at once
+        mtedi.write_edi_files(edi_obj_list, edi_fn_list,
+                              longitude_format=longitude_format)
     # end func
 
         return
@@ -9,6 +9,7 @@
 #==============================================================================
 import numpy as np
 import os
+import warnings
 
 import mtpy.core.z as mtz
 #==============================================================================
@@ -178,6 +179,80 @@ class JFile(object):
             
         self.metadata_dict = metadata_dict
         
+    def _read_data_blocks(self, data_lines, z_keys, t_keys):
+        """
+        read the component blocks of a j-file, all the numbers are parsed in
+        one go.
+        
+        Numbers that cannot be read and masked values of -999 or nan are set
+        to 0. If a period is repeated within a component the last one is
+        kept.
+        
+        :return: z_dict, t_dict with keys of component, each value is an
+                 array of [period, real, imaginary, error] sorted by period
+        """
+        # find which component block each line of numbers belongs to
+        d_key = None
+        key_list = []
+        num_lines = []
+        for d_line in data_lines:
+            # check to see if we are at the beginning of a component block, if so 
+            # set the dictionary key to that value
+            if 'z' in d_line.lower():
+                d_key = d_line.strip().split()[0].lower()
+            # if we are at the number of periods line, skip it
+            elif len(d_line.strip().split(None, 1)) <= 1 and 'r' not in d_line.lower():
+                continue
+            elif 'r' in d_line.lower():
+                break
+            elif d_key is not None:
+                key_list.append(d_key)
+                num_lines.append(d_line)
+        
+        num_cols = len(num_lines[0].split()) if len(num_lines) > 0 else 4
+        num_str = ' '.join(num_lines)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            values = np.fromstring(num_str, dtype=np.float, sep=' ')
+        
+        if values.size == len(num_lines) * num_cols:
+            values = values.reshape(len(num_lines), num_cols)[:, 0:4]
+        else:
+            # some lines are different lengths or have numbers that can not
+            # be read, which will be set to 0
+            values = np.array([[self._read_float(d_value) for d_value in 
+                                d_line.strip().split()[0:4]]
+                               for d_line in num_lines], dtype=np.float)
+        values = values.reshape(-1, 4)
+        
+        # need to check for masked points represented by
+        # birrp as -999, apparently
+        values[np.where((values == -999) | np.isnan(values))] = 0.0
+        
+        key_arr = np.array(key_list, dtype=str)
+        comp_dicts = []
+        for keys in [z_keys, t_keys]:
+            comp_dict = {}
+            for c_key in keys:
+                # keep the last of any repeated period, sorted by period
+                c_values = values[np.where(key_arr == c_key)][::-1]
+                periods, p_index = np.unique(c_values[:, 0], return_index=True)
+                comp_dict[c_key] = c_values[p_index]
+            comp_dicts.append(comp_dict)
+        
+        return comp_dicts
+    
+    @staticmethod
+    def _read_float(d_value):
+        """
+        convert a string to float, 0 if it cannot be converted, which is 
+        assumed to be a masked number when writing to an .edi file
+        """
+        try:
+            return float(d_value)
+        except ValueError:
+            return 0.0
+        
     def read_j_file(self, j_fn=None):
         """
         read_j_file will read in a *.j file output by BIRRP (better than reading lots of *.<k>r<l>.rf files)
@@ -214,74 +289,27 @@ class JFile(object):
                       if not '>' in j_line and not '#' in j_line][1:]
                           
         # sometimes birrp outputs some missing periods, so the best way to deal with 
-        # this that I could come up with was to get things into dictionaries with 
-        # key words that are the period values, then fill in Z and T from there
-        # leaving any missing values as 0
-        
-        # make empty dictionary that have keys as the component 
-        z_dict = dict([(z_key, {}) for z_key in list(z_index_dict.keys())])
-        t_dict = dict([(t_key, {}) for t_key in list(t_index_dict.keys())])
-        for d_line in data_lines:
-            # check to see if we are at the beginning of a component block, if so 
-            # set the dictionary key to that value
-            if 'z' in d_line.lower():
-                d_key = d_line.strip().split()[0].lower()
-            # if we are at the number of periods line, skip it
-            elif len(d_line.strip().split()) == 1 and 'r' not in d_line.lower():
-                continue
-            elif 'r' in d_line.lower():
-                break
-            # get the numbers into the correct dictionary with a key as period and
-            # for now we will leave the numbers as a list, which we will parse later
-            else:
-                # split the line up into each number
-                d_list = d_line.strip().split()
-                
-                # make a copy of the list to be sure we don't rewrite any values,
-                # not sure if this is necessary at the moment
-                d_value_list = list(d_list)
-                for d_index, d_value in enumerate(d_list):
-                    # check to see if the column number can be converted into a float
-                    # if it can't, then it will be set to 0, which is assumed to be
-                    # a masked number when writing to an .edi file
-                                       
-                    try:
-                        d_value = float(d_value)
-                        # need to check for masked points represented by
-                        # birrp as -999, apparently
-                        if d_value == -999 or np.isnan(d_value):
-                            d_value_list[d_index] = 0.0
-                        else:
-                            d_value_list[d_index] = d_value
-                    except ValueError:
-                        d_value_list[d_index] = 0.0
-                
-                # put the numbers in the correct dictionary as:
-                # key = period, value = [real, imaginary, error]
-                if d_key in list(z_index_dict.keys()):
-                    z_dict[d_key][d_value_list[0]] = d_value_list[1:4]
-                elif d_key in list(t_index_dict.keys()):
-                    t_dict[d_key][d_value_list[0]] = d_value_list[1:4]
+        # this that I could come up with was to get arrays for each component
+        # sorted by period, then fill in Z and T from there leaving any
+        # missing values as 0
+        z_dict, t_dict = self._read_data_blocks(data_lines, 
+                                                list(z_index_dict.keys()),
+                                                list(t_index_dict.keys()))
         
         # --> now we need to get the set of periods for all components  
         # check to see if there is any tipper data output          
-
-        all_periods = []            
-        for z_key in list(z_index_dict.keys()):
-            for f_key in list(z_dict[z_key].keys()):
-                all_periods.append(f_key)
-        
-        if len(list(t_dict['tzx'].keys())) == 0:
+        comp_list = sorted(z_index_dict.keys())
+        if len(t_dict['tzx']) == 0:
             print('Could not find any Tipper data in {0}'.format(self.j_fn))
             find_tipper = False
-  
         else:
-            for t_key in list(t_index_dict.keys()):
-                for f_key in list(t_dict[t_key].keys()):
-                    all_periods.append(f_key)
+            comp_list += sorted(t_index_dict.keys())
             find_tipper = True
         
-        all_periods = np.array(sorted(list(set(all_periods))))
+        all_periods = np.unique(np.concatenate(
+            [z_dict[z_key][:, 0] for z_key in z_index_dict.keys()] + 
+            [t_dict[t_key][:, 0] for t_key in t_index_dict.keys()
+             if find_tipper]))
         all_periods = all_periods[np.nonzero(all_periods)]
         num_per = len(all_periods)
         
@@ -292,28 +320,34 @@ class JFile(object):
         t_arr = np.zeros((num_per, 1, 2), dtype=np.complex)
         t_err_arr = np.zeros((num_per, 1, 2), dtype=np.float)
         
-        for p_index, per in enumerate(all_periods):
-            for z_key in sorted(z_index_dict.keys()):
-                kk = z_index_dict[z_key][0]
-                ll = z_index_dict[z_key][1]
-                try:
-                    z_value = z_dict[z_key][per][0]+1j*z_dict[z_key][per][1]
-                    z_arr[p_index, kk, ll] = z_value
-                    z_err_arr[p_index, kk, ll] = z_dict[z_key][per][2]
-                except KeyError:
-                    print('No value found for period {0:.4g}'.format(per))
-                    print('For component {0}'.format(z_key))
-            if find_tipper is True:
-                for t_key in sorted(t_index_dict.keys()):
-                    kk = t_index_dict[t_key][0]
-                    ll = t_index_dict[t_key][1]
-                    try:
-                        t_value = t_dict[t_key][per][0]+1j*t_dict[t_key][per][1]
-                        t_arr[p_index, kk, ll] = t_value
-                        t_err_arr[p_index, kk, ll] = t_dict[t_key][per][2]
-                    except KeyError:
-                        print('No value found for period {0:.4g}'.format(per))
-                        print('For component {0}'.format(t_key))
+        found_arr = np.zeros((num_per, len(comp_list)), dtype=np.bool)
+        for c_index, c_key in enumerate(comp_list):
+            if c_key in z_index_dict:
+                c_arr, c_err_arr = z_arr, z_err_arr
+                kk, ll = z_index_dict[c_key]
+                c_values = z_dict[c_key]
+            else:
+                c_arr, c_err_arr = t_arr, t_err_arr
+                kk, ll = t_index_dict[c_key]
+                c_values = t_dict[c_key]
+            
+            # index of each period in the component, if it has the period
+            p_index = np.searchsorted(c_values[:, 0], all_periods)
+            if c_values.shape[0] == 0:
+                # empty component block, all the periods are missing
+                found = np.zeros(num_per, dtype=np.bool)
+            else:
+                p_index[p_index == c_values.shape[0]] = 0
+                found = c_values[p_index, 0] == all_periods
+            found_arr[:, c_index] = found
+            
+            c_arr[found, kk, ll] = c_values[p_index[found], 1] + \
+                                   1j * c_values[p_index[found], 2]
+            c_err_arr[found, kk, ll] = c_values[p_index[found], 3]
+            
+        for p_index, c_index in np.argwhere(~found_arr):
+            print('No value found for period {0:.4g}'.format(all_periods[p_index]))
+            print('For component {0}'.format(comp_list[c_index]))
         
         # put the results into mtpy objects
         freq = 1./all_periods 
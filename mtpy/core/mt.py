@@ -157,9 +157,9 @@ class MT(object):
 
         self.save_dir = os.getcwd()
         self.original_file_type = None
+        self._fn = None
         if fn is not None:
             self.read_mt_file(fn)
-            self._fn = os.path.normpath(os.path.abspath(fn))  # store file reference
 
         # provide key words to fill values if an edi file does not exist
         for key in list(kwargs.keys()):
@@ -365,6 +365,9 @@ class MT(object):
         if file_type is None:
             file_type = os.path.splitext(fn)[1][1:].lower()
 
+        # store file reference
+        self._fn = os.path.normpath(os.path.abspath(fn))
+
         if file_type.lower() == 'edi':
             self._read_edi_file(fn)
         elif file_type.lower() == 'j':
@@ -639,6 +642,24 @@ class MT(object):
         :rtype edi_fn: string
         """
 
+        edi_obj = self._make_edi_object(new_Z=new_Z, new_Tipper=new_Tipper)
+
+        # --> write edi file
+        edi_fn = edi_obj.write_edi_file(new_edi_fn=new_edi_fn, 
+                                        longitude_format=longitude_format,
+                                        latlon_format=latlon_format)
+
+        return edi_fn
+
+    def _make_edi_object(self, new_Z=None, new_Tipper=None):
+        """
+        make an mtpy.core.edi.Edi object from the MT object, ready to be
+        written, see _write_edi_file
+
+        :returns edi_obj: Edi object
+        :rtype edi_obj: mtpy.core.edi.Edi
+        """
+
         # get header information, mostly from site
         edi_obj = MTedi.Edi()
         edi_obj.Header = self._edi_set_header()
@@ -667,12 +688,7 @@ class MT(object):
         # set rotation angle
         # edi_obj.zrot = self.rotation_angle
 
-        # --> write edi file
-        edi_fn = edi_obj.write_edi_file(new_edi_fn=new_edi_fn, 
-                                        longitude_format=longitude_format,
-                                        latlon_format=latlon_format)
-
-        return edi_fn
+        return edi_obj
 
     def _edi_set_header(self):
         """
@@ -1323,7 +1339,7 @@ class MT(object):
         xml_obj = self._xml_set_processing(xml_obj)
         xml_obj = self._xml_set_site_layout(xml_obj)
         
-        xml_obj.write_xml_file(xml_fn)
+        return xml_obj.write_xml_file(xml_fn)
 
     def _xml_set_site(self, xml_obj):
         """
@@ -1343,7 +1359,7 @@ class MT(object):
         try:
             xml_obj.Site.Orientation.attr = {'angle_to_geographic_north':\
                                              '{0:.2f}'.format(self.Site.Location.declination)}
-        except ValueError:
+        except (TypeError, ValueError):
             xml_obj.Site.Orientation.attr = {'angle_to_geographic_north': '0.00'}
         
         xml_obj.Site.Location.Latitude.value = self.lat
@@ -2031,7 +2047,7 @@ class Site(object):
     def year_collected(self):
         try:
             return self._start_dt.year
-        except TypeError:
+        except AttributeError:
             return None
     @year_collected.setter
     def year_collected(self, value):
@@ -7,6 +7,8 @@ Created on Thu Sep 28 12:34:23 2017
 #==============================================================================
 # Imports
 #==============================================================================
+import warnings
+
 import numpy as np
 import mtpy.core.z as mtz
 import mtpy.utils.gis_tools as gis_tools
@@ -211,14 +213,16 @@ class ZMM(ZMMHeader):
         self.read_header()
         self.initialize_arrays() 
         
-        ### read each data block and fill the appropriate array
-        for ii, period_block in enumerate(self._get_period_blocks()):
-            data_block = self._read_period_block(period_block)
-            self.period[ii] = data_block['period']
-            
-            self._fill_tf_array_from_block(data_block['tf'], ii)
-            self._fill_sig_array_from_block(data_block['sig'], ii)
-            self._fill_res_array_from_block(data_block['res'], ii)
+        ### read all the data blocks in one go, if the file is not laid out
+        ### as expected read each data block and fill the appropriate array
+        if not self._read_data_blocks():
+            for ii, period_block in enumerate(self._get_period_blocks()):
+                data_block = self._read_period_block(period_block)
+                self.period[ii] = data_block['period']
+
+                self._fill_tf_array_from_block(data_block['tf'], ii)
+                self._fill_sig_array_from_block(data_block['sig'], ii)
+                self._fill_res_array_from_block(data_block['res'], ii)
             
         ### make Z and Tipper
         self.Z = self.calculate_impedance()
@@ -230,6 +234,79 @@ class ZMM(ZMMHeader):
             self.Tipper = mtz.Tipper()
             print('*** No HZ found cannot calculate induction vectors. ***')
         
+    def _read_data_blocks(self):
+        """
+        read every period block with a single numeric parse.
+
+        Each block has the same number of lines, with n = num_channels - 2
+        predicted channels:
+            * period line, number of data line and transfer function label
+            * n lines of transfer functions, 2 complex values each
+            * signal power label
+            * 2 lines of lower triangular signal power, 3 complex values
+            * residual covariance label
+            * n lines of lower triangular residual covariance,
+              n * (n + 1) / 2 complex values
+
+        so the numeric lines of all blocks are picked out by position and
+        parsed at once.
+
+        :return: True if the blocks were read, False if the file does not
+                 follow the layout and needs to be read block by block.
+        """
+        n_out = self.num_channels - 2
+        n_tf = 2 * n_out
+        n_sig = 3
+        n_res = n_out * (n_out + 1) // 2
+        block_len = 7 + 2 * n_out
+        tf_lines = list(range(3, 3 + n_out))
+        sig_lines = [4 + n_out, 5 + n_out]
+        res_lines = list(range(7 + n_out, block_len))
+
+        with open(self.z_fn, 'r') as fid:
+            lines = fid.read().lower().split('\n')
+        lines = lines[self._header_count:]
+        num_blocks = len(lines) // block_len
+        if num_blocks == 0 or num_blocks > self.num_freq:
+            return False
+
+        blocks = np.array(lines[:num_blocks * block_len],
+                          dtype=np.object).reshape(num_blocks, block_len)
+        if not all(['period' in line for line in blocks[:, 0]]):
+            return False
+        # anything left after the blocks has to be blank
+        if ''.join(lines[num_blocks * block_len:]).strip() != '':
+            return False
+
+        num_str = ' '.join(blocks[:, tf_lines + sig_lines + res_lines].ravel())
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            values = np.fromstring(num_str, dtype=np.float, sep=' ')
+        if values.size != num_blocks * 2 * (n_tf + n_sig + n_res):
+            return False
+
+        # pairs of real and imaginary values are complex numbers
+        values = values.view(np.complex).reshape(num_blocks,
+                                                 n_tf + n_sig + n_res)
+
+        self.period[:num_blocks] = [float(line.strip().split(':')[1].split()[0])
+                                    for line in blocks[:, 0]]
+        self.transfer_functions[:num_blocks] = \
+            values[:, 0:n_tf].reshape(num_blocks, n_out, 2)
+
+        sig = values[:, n_tf:n_tf + n_sig]
+        self.sigma_s[:num_blocks, 0, 0] = sig[:, 0]
+        self.sigma_s[:num_blocks, 1, 0] = sig[:, 1]
+        self.sigma_s[:num_blocks, 0, 1] = sig[:, 1]
+        self.sigma_s[:num_blocks, 1, 1] = sig[:, 2]
+
+        res = values[:, n_tf + n_sig:]
+        jj, kk = np.tril_indices(n_out)
+        self.sigma_e[:num_blocks, kk, jj] = res.conjugate()
+        self.sigma_e[:num_blocks, jj, kk] = res
+
+        return True
+
     def _get_period_blocks(self):
         """
         split file into period blocks
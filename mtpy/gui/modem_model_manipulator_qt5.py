@@ -68,6 +68,11 @@ class ModEM_Model_Manipulator(QtWidgets.QMainWindow):
         self.menu_properties_cb_action = self.menu_properties.addAction("Resistivity Limits")
         self.menu_properties_cb_action.triggered.connect(self.set_res_limits)
 
+        self.menu_edit = self.menuBar().addMenu("&Edit")
+        self.menu_edit_undo_action = self.menu_edit.addAction("Undo")
+        self.menu_edit_undo_action.setShortcut("Ctrl+Z")
+        self.menu_edit_undo_action.triggered.connect(self.model_widget.undo_edit)
+
         self.menu_tools = self.menuBar().addMenu("Tools")
         self.menu_tools_pad_action = self.menu_tools.addAction("Pad Fill")
         self.menu_tools_pad_action.triggered.connect(self.pad_fill)
@@ -357,6 +362,18 @@ class ModelWidget(QtWidgets.QWidget):
         self.location_ax = None
         self.new_res_model = None
 
+        # the meshes are made once and then only their colour arrays are
+        # updated, station markers on the cross sections change with index
+        self.map_mesh = None
+        self.east_mesh = None
+        self.north_mesh = None
+        self._map_station_artist = None
+        self._east_station_artists = []
+        self._north_station_artists = []
+
+        # undo stack of the edits made to new_res_model
+        self.res_history = modem.ModelEditHistory()
+
         self.units = 'km'
         self.scale = 1000.
         self.res_value = 100
@@ -605,6 +622,9 @@ class ModelWidget(QtWidgets.QWidget):
 
         self.data_obj = modem.Data()
         self.data_obj.read_data_file(self._data_fn)
+        if self._map_station_artist is not None:
+            self._map_station_artist.remove()
+            self._map_station_artist = None
         if self.map_ax is not None:
             self.redraw_plots()
 
@@ -623,6 +643,13 @@ class ModelWidget(QtWidgets.QWidget):
         self.model_obj.read_model_file(self._model_fn)
         ## make a copy of the resistivity model to manipulate
         self.new_res_model = self.model_obj.res_model.copy()
+        self.res_history.clear()
+        self.map_mesh = None
+        self.east_mesh = None
+        self.north_mesh = None
+        self._map_station_artist = None
+        self._east_station_artists = []
+        self._north_station_artists = []
 
         # set slider bar intervals
         # need the minus 1 cause we are using the value of the slider as
@@ -759,9 +786,17 @@ class ModelWidget(QtWidgets.QWidget):
 
     def undo(self):
         """
-        reset the resistivity model to its original
+        undo the last edit of the resistivity model
         """
-        self.new_res_model = self.model_obj.res_model.copy()
+        if self.res_history.undo(self.new_res_model) is None:
+            print('Nothing to undo')
+
+    def undo_edit(self):
+        """
+        undo the last edit and show the model
+        """
+        self.undo()
+        self.update_res_plots()
 
     def initialize_vectors(self):
         """
@@ -881,19 +916,25 @@ class ModelWidget(QtWidgets.QWidget):
         """
         redraw map view
         """
-        self.map_ax.pcolormesh(self.plot_east_map,
-                               self.plot_north_map,
-                               np.log10(self.new_res_model[:, :, self.map_index].T),
-                               cmap=self.cmap,
-                               vmin=self.res_limits[0],
-                               vmax=self.res_limits[1])
-        if self.data_fn is not None:
-            self.map_ax.scatter(self.data_obj.station_locations.rel_east/self.scale,
+        plot_res = np.log10(self.new_res_model[:, :, self.map_index].T)
+        if self.map_mesh is None:
+            self.map_mesh = self.map_ax.pcolormesh(self.plot_east_map,
+                                                   self.plot_north_map,
+                                                   plot_res,
+                                                   cmap=self.cmap,
+                                                   vmin=self.res_limits[0],
+                                                   vmax=self.res_limits[1])
+        else:
+            self.map_mesh.set_array(plot_res.ravel())
+            self.map_mesh.set_clim(self.res_limits)
+
+        if self.data_fn is not None and self._map_station_artist is None:
+            self._map_station_artist = self.map_ax.scatter(self.data_obj.station_locations.rel_east/self.scale,
                                 self.data_obj.station_locations.rel_north/self.scale,
                                 marker='v',
                                 c='k',
                                 s=10)
-        self.map_canvas.draw()
+        self.map_canvas.draw_idle()
 
     def set_east_index(self):
         self.east_index = int(self.east_slider.value())
@@ -908,40 +949,44 @@ class ModelWidget(QtWidgets.QWidget):
         """
         redraw east view
         """
-        xlim = self.east_ax.get_xlim()
-        ylim = self.east_ax.get_ylim()
+        plot_res = np.log10(self.new_res_model[:, self.east_index, :])
+        if self.east_mesh is None:
+            xlim = self.east_ax.get_xlim()
+            ylim = self.east_ax.get_ylim()
+            self.east_mesh = self.east_ax.pcolormesh(self.plot_north_z,
+                                                     self.plot_z_north,
+                                                     plot_res,
+                                                     cmap=self.cmap,
+                                                     vmin=self.res_limits[0],
+                                                     vmax=self.res_limits[1])
+            self.east_ax.set_ylim(ylim)
+            self.east_ax.set_xlim(xlim)
+        else:
+            self.east_mesh.set_array(plot_res.ravel())
+            self.east_mesh.set_clim(self.res_limits)
 
-        self.east_ax.cla()
-        self.east_ax.plot(self.east_north_line_xlist,
-                          self.east_north_line_ylist,
-                          lw=.25,
-                          color='k')
-        self.east_ax.plot(self.east_z_line_xlist,
-                          self.east_z_line_ylist,
-                          lw=.25,
-                          color='k')
-        self.east_ax.pcolormesh(self.plot_north_z,
-                               self.plot_z_north,
-                               np.log10(self.new_res_model[:, self.east_index, :]),
-                               cmap=self.cmap,
-                               vmin=self.res_limits[0],
-                               vmax=self.res_limits[1])
+        # stations close to the cross section
+        for artist in self._east_station_artists:
+            artist.remove()
+        self._east_station_artists = []
 
         line = self.get_stations_east()
         if line is not None:
-            self.east_ax.scatter(line['rel_north']/self.scale,
-                                 line['rel_elev']/self.scale,
-                                 marker='v',  c='cyan', s=50,
-                                 edgecolors='k')
+            self._east_station_artists.append(
+                self.east_ax.scatter(line['rel_north']/self.scale,
+                                     line['rel_elev']/self.scale,
+                                     marker='v',  c='cyan', s=50,
+                                     edgecolors='k'))
 
             self.location_ax.scatter(line['rel_east']/self.scale,
                                      line['rel_north']/self.scale,
                                      marker='v',  c='k', s=30,
                                      edgecolors='cyan')
-            self.location_canvas.draw()
+            self.location_canvas.draw_idle()
 
             for ss in line:
-                self.east_ax.text(ss['rel_north']/self.scale,
+                self._east_station_artists.append(
+                    self.east_ax.text(ss['rel_north']/self.scale,
                                   ss['rel_elev']/self.scale - .2,
                                   ss['station'],
                                   va='bottom', ha='center',
@@ -950,13 +995,9 @@ class ModelWidget(QtWidgets.QWidget):
                                   clip_on=True,
                                   bbox={'boxstyle':"square",
                                         'ec':'k',
-                                        'fc':'w'})
+                                        'fc':'w'}))
 
-        self.east_ax.set_xlabel('Northing {0}'.format(self.units))
-        self.east_ax.set_ylabel('Depth {0}'.format(self.units))
-        self.east_ax.set_ylim(ylim)
-        self.east_ax.set_xlim(xlim)
-        self.east_canvas.draw()
+        self.east_canvas.draw_idle()
 
     def redraw_location(self):
         """
@@ -1022,54 +1063,57 @@ class ModelWidget(QtWidgets.QWidget):
         """
         redraw north view
         """
-        ylim = self.north_ax.get_ylim()
-        xlim = self.north_ax.get_xlim()
-        self.north_ax.cla()
-        self.north_ax.plot(self.north_east_line_xlist,
-                           self.north_east_line_ylist,
-                           lw=.25,
-                           color='k')
-        self.north_ax.plot(self.north_z_line_xlist,
-                           self.north_z_line_ylist,
-                           lw=.25,
-                           color='k')
-        self.north_ax.pcolormesh(self.plot_east_z,
-                                 self.plot_z_east,
-                                 np.log10(self.new_res_model[self.north_index, :, :]),
-                                 cmap=self.cmap,
-                                 vmin=self.res_limits[0],
-                                 vmax=self.res_limits[1])
+        plot_res = np.log10(self.new_res_model[self.north_index, :, :])
+        if self.north_mesh is None:
+            ylim = self.north_ax.get_ylim()
+            xlim = self.north_ax.get_xlim()
+            self.north_mesh = self.north_ax.pcolormesh(self.plot_east_z,
+                                                       self.plot_z_east,
+                                                       plot_res,
+                                                       cmap=self.cmap,
+                                                       vmin=self.res_limits[0],
+                                                       vmax=self.res_limits[1])
+            self.north_ax.set_xlabel('Easting {0}'.format(self.units))
+            self.north_ax.set_ylabel('Elevation {0}'.format(self.units))
+            self.north_ax.set_ylim(ylim)
+            self.north_ax.set_xlim(xlim)
+        else:
+            self.north_mesh.set_array(plot_res.ravel())
+            self.north_mesh.set_clim(self.res_limits)
+
+        # stations close to the cross section
+        for artist in self._north_station_artists:
+            artist.remove()
+        self._north_station_artists = []
 
         line = self.get_stations_north()
 
         if line is not None:
-            self.north_ax.scatter(line['rel_east']/self.scale,
-                                  line['rel_elev']/self.scale,
-                                  marker='v',  c='cyan', s=50,
-                                  edgecolors='k')
+            self._north_station_artists.append(
+                self.north_ax.scatter(line['rel_east']/self.scale,
+                                      line['rel_elev']/self.scale,
+                                      marker='v',  c='cyan', s=50,
+                                      edgecolors='k'))
             self.location_ax.scatter(line['rel_east']/self.scale,
                                      line['rel_north']/self.scale,
                                      marker='v',  c='k', s=30,
                                      edgecolors='cyan')
-            self.location_canvas.draw()
+            self.location_canvas.draw_idle()
 
             for ss in line:
-                self.north_ax.text(ss['rel_east']/self.scale,
-                                   ss['rel_elev']/self.scale - .2,
-                                   ss['station'],
-                                   va='bottom', ha='center',
-                                   fontdict={'weight':'bold',
-                                            'size':10},
-                                  clip_on=True,
-                                  bbox={'boxstyle':"square",
-                                        'ec':'k',
-                                        'fc':'w'})
-
-        self.north_ax.set_xlabel('Easting {0}'.format(self.units))
-        self.north_ax.set_ylabel('Elevation {0}'.format(self.units))
-        self.north_ax.set_ylim(ylim)
-        self.north_ax.set_xlim(xlim)
-        self.north_canvas.draw()
+                self._north_station_artists.append(
+                    self.north_ax.text(ss['rel_east']/self.scale,
+                                       ss['rel_elev']/self.scale - .2,
+                                       ss['station'],
+                                       va='bottom', ha='center',
+                                       fontdict={'weight':'bold',
+                                                'size':10},
+                                       clip_on=True,
+                                       bbox={'boxstyle':"square",
+                                             'ec':'k',
+                                             'fc':'w'}))
+
+        self.north_canvas.draw_idle()
 
     def get_stations_north(self):
         """
@@ -1149,11 +1193,7 @@ class ModelWidget(QtWidgets.QWidget):
         y_change = self._get_change_index(y1, y2, self.model_obj.grid_north)
 
         #reset values of resistivity
-        for xx in x_change:
-            for yy in y_change:
-                if self.model_obj.res_model[yy, xx, self.map_index] < 1E10:
-                    self.new_res_model[yy, xx, self.map_index] = self.res_value
-        self.redraw_plots()
+        self.set_res_block(np.ix_(y_change, x_change, [self.map_index]))
 
     def east_on_pick(self, eclick, erelease):
         """
@@ -1166,12 +1206,7 @@ class ModelWidget(QtWidgets.QWidget):
         y_change = self._get_change_index(y1, y2, self.model_obj.grid_z)
 
         #reset values of resistivity
-        for xx in x_change:
-            for yy in y_change:
-                if self.model_obj.res_model[xx, self.east_index, yy] < 1E10:
-                    self.new_res_model[xx, self.east_index, yy] = self.res_value
-
-        self.redraw_plots()
+        self.set_res_block(np.ix_(x_change, [self.east_index], y_change))
 
     def north_on_pick(self, eclick, erelease):
         """
@@ -1184,12 +1219,19 @@ class ModelWidget(QtWidgets.QWidget):
         y_change = self._get_change_index(y1, y2, self.model_obj.grid_z)
 
         #reset values of resistivity
-        for xx in x_change:
-            for yy in y_change:
-                if self.model_obj.res_model[self.north_index, xx, yy] < 1E10:
-                    self.new_res_model[self.north_index, xx, yy] = self.res_value
+        self.set_res_block(np.ix_([self.north_index], x_change, y_change))
 
-        self.redraw_plots()
+    def set_res_block(self, index):
+        """
+        set the cells of new_res_model[index] to res_value, leaving the air
+        cells as they are
+        """
+        new_res = np.where(self.model_obj.res_model[index] < 1E10,
+                           self.res_value,
+                           self.new_res_model[index])
+        self.res_history.set(self.new_res_model, index, new_res)
+
+        self.update_res_plots()
 
     def _get_change_index(self, y1, y2, grid_dir):
         """
@@ -1227,6 +1269,25 @@ class ModelWidget(QtWidgets.QWidget):
         self.redraw_north()
         self.redraw_location()
 
+    def update_res_plots(self):
+        """
+        show the edited resistivity model, only the colours of the map and
+        cross sections are updated
+        """
+        for mesh, plot_res, canvas in [(self.map_mesh,
+                                        self.new_res_model[:, :, self.map_index].T,
+                                        self.map_canvas),
+                                       (self.east_mesh,
+                                        self.new_res_model[:, self.east_index, :],
+                                        self.east_canvas),
+                                       (self.north_mesh,
+                                        self.new_res_model[self.north_index, :, :],
+                                        self.north_canvas)]:
+            if mesh is None:
+                continue
+            mesh.set_array(np.log10(plot_res).ravel())
+            canvas.draw_idle()
+
     def location_pick(self, event):
         """
         change the index of the location line either e-w or n-s.
@@ -1281,6 +1342,7 @@ class ModelWidget(QtWidgets.QWidget):
         y_range = np.append(np.arange(avg_range), np.arange(-avg_range, 0, 1))
 
         x_index, y_index = np.meshgrid(x_range, y_range)
+        self.res_history.save(self.new_res_model, np.s_[:, :, :])
         for zz in range(self.new_res_model.shape[2]):
             self.new_res_model[:, :, zz] = self.mask_elevation_cells(self.new_res_model[:, :, zz])
             avg_res_value = np.mean([np.median(self.new_res_model[x_index, y_index, zz]),
@@ -1299,15 +1361,14 @@ class ModelWidget(QtWidgets.QWidget):
         elev_index = np.where(self.model_obj.res_model > 1E10)
         self.new_res_model[elev_index] = 1E12
 
-        self.redraw_plots()
+        self.update_res_plots()
 
     def undo_tools(self):
         """
-        undo fill outside area
+        undo fill outside area or smoothing
         """
 
-        self.undo()
-        self.redraw_plots()
+        self.undo_edit()
 
     def set_smooth_params(self):
         """
@@ -1329,8 +1390,7 @@ class ModelWidget(QtWidgets.QWidget):
 
         gauss = (1./(2*np.pi*sigma))*np.exp(-((gx**2)+(gy**2))/(2*sigma))
 
-
-
+        self.res_history.save(self.new_res_model, np.s_[:, :, :])
         for zz in range(self.new_res_model.shape[2]):
             ### need to take into account elevation cells
             self.new_res_model[:, :, zz] = self.mask_elevation_cells(self.new_res_model[:, :, zz])
@@ -1341,7 +1401,7 @@ class ModelWidget(QtWidgets.QWidget):
         elev_index = np.where(self.model_obj.res_model > 1E10)
         self.new_res_model[elev_index] = 1E12
 
-        self.redraw_plots()
+        self.update_res_plots()
 
     def mask_elevation_cells(self, res_array):
         """
@@ -1352,45 +1412,45 @@ class ModelWidget(QtWidgets.QWidget):
 
         return res_array
 
+    def copy_slice(self, axis, index, copy_index, keep_air=True):
+        """
+        copy the slice at index along axis to the slices between index and
+        copy_index, copy_index is not included
+
+        :param keep_air: keep air cells of the original model as air
+        """
+        copy_index = min(max(copy_index, 0), self.new_res_model.shape[axis])
+        if copy_index > index:
+            copy_range = slice(index, copy_index)
+        else:
+            copy_range = slice(copy_index, index)
+
+        block_index = [slice(None)] * 3
+        block_index[axis] = copy_range
+        block_index = tuple(block_index)
+
+        new_res = np.take(self.new_res_model, [index], axis=axis)
+        if keep_air:
+            new_res = np.where(self.model_obj.res_model[block_index] > 1E10,
+                               1E12,
+                               new_res)
+        self.res_history.set(self.new_res_model, block_index, new_res)
+
+        self.update_res_plots()
+
     def map_copy_down(self):
         """
         copy the current map down the number of layers given
         """
-        o_shape = (self.new_res_model.shape[0],
-                   self.new_res_model.shape[1],
-                   1)
         # need to add 1 to the index to make sure that copy number is observed
-        copy_index = self.map_index+(self.map_copy_num+1)
-        if copy_index > self.new_res_model.shape[2]:
-            copy_index = self.new_res_model.shape[2]
-#        for m_index in range(self.map_index, copy_index, 1):
-#            nax = np.where(self.new_res_model[:, :, m_index] <1E12)
-#            self.new_res_model[nax] =
-#        na_index = np.where(self.new_res_model[:, :, self.map_index] < 1E10)
-#        print(na_index)
-        self.new_res_model[:, : , self.map_index:copy_index] = \
-            self.new_res_model[:, :, self.map_index].reshape(o_shape)
-
-        #self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_map()
+        self.copy_slice(2, self.map_index, self.map_index+(self.map_copy_num+1),
+                        keep_air=False)
 
     def map_copy_up(self):
         """
         copy the current map up the number of layers given
         """
-        o_shape = (self.new_res_model.shape[0],
-                   self.new_res_model.shape[1],
-                   1)
-
-        copy_index = self.map_index-(self.map_copy_num+1)
-        if copy_index < 0:
-            copy_index = 0
-        self.new_res_model[:, :, copy_index:self.map_index] = \
-            self.new_res_model[:, :, self.map_index].reshape(o_shape)
-        self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_map()
+        self.copy_slice(2, self.map_index, self.map_index-(self.map_copy_num+1))
 
     def set_map_copy_num(self):
         """
@@ -1403,39 +1463,13 @@ class ModelWidget(QtWidgets.QWidget):
         """
         copy the current cross section east by east_copy_num
         """
-        o_shape = (self.new_res_model.shape[0],
-                   1,
-                   self.new_res_model.shape[2])
-
-        copy_index = self.east_index+(self.east_copy_num+1)
-        if copy_index > self.new_res_model.shape[1]:
-            copy_index = self.new_res_model.shape[1]
-
-        self.new_res_model[:, self.east_index:copy_index, :] = \
-            self.new_res_model[:, self.east_index, :].reshape(o_shape)
-
-        self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_east()
+        self.copy_slice(1, self.east_index, self.east_index+(self.east_copy_num+1))
 
     def east_copy_west(self):
         """
         copy the current cross section west by east_copy_num
         """
-        o_shape = (self.new_res_model.shape[0],
-                   1,
-                   self.new_res_model.shape[2])
-
-        copy_index = self.east_index-(self.east_copy_num+1)
-        if copy_index < 0:
-            copy_index = 0
-
-        self.new_res_model[:, copy_index:self.east_index, :] = \
-            self.new_res_model[:, self.east_index, :].reshape(o_shape)
-
-        self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_east()
+        self.copy_slice(1, self.east_index, self.east_index-(self.east_copy_num+1))
 
     def set_east_copy_num(self):
         """
@@ -1448,37 +1482,13 @@ class ModelWidget(QtWidgets.QWidget):
         """
         copy the current cross section south by north_copy_num
         """
-        o_shape = (1,
-                   self.new_res_model.shape[1],
-                   self.new_res_model.shape[2])
-
-        copy_index = self.north_index-(self.north_copy_num+1)
-        if copy_index > self.new_res_model.shape[0]:
-            copy_index = self.new_res_model.shape[0]
-
-        self.new_res_model[copy_index:self.north_index, :, :] = \
-            self.new_res_model[self.north_index, :, :].reshape(o_shape)
-        self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_north()
+        self.copy_slice(0, self.north_index, self.north_index-(self.north_copy_num+1))
 
     def north_copy_north(self):
         """
         copy the current cross section north by north_copy_num
         """
-        o_shape = (1,
-                   self.new_res_model.shape[1],
-                   self.new_res_model.shape[2])
-
-        copy_index = self.north_index+(self.north_copy_num+1)
-        if copy_index > self.new_res_model.shape[0]:
-            copy_index = self.new_res_model.shape[0]
-
-        self.new_res_model[self.north_index:copy_index:, :, :] = \
-            self.new_res_model[self.north_index, :, :].reshape(o_shape)
-        self.new_res_model[np.where(self.model_obj.res_model > 1E10)] = 1E12
-
-        self.redraw_north()
+        self.copy_slice(0, self.north_index, self.north_index+(self.north_copy_num+1))
 
     def set_north_copy_num(self):
         """
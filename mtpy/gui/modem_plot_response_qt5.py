@@ -14,6 +14,8 @@ JP 2016
 # Imports
 #==============================================================================
 # standard imports
+import collections
+import copy
 import os
 import sys
 
@@ -279,6 +281,20 @@ class PlotResponses(QtWidgets.QWidget):
         self._key = 'z'
         self._ax_index = 0
         self.ax_list = None
+        self._z_comp_list = [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+        # persistent artists, these are only remade when the layout of the
+        # plot changes, otherwise the data are updated in place
+        self._artist_key = None
+        self._data_artists = None
+        self._resp_artists = None
+        self._legend_list = None
+        self._mask_artists = []
+        self._title = None
+
+        # last parsed data and response files keyed by (file name, mtime)
+        self._data_cache = collections.OrderedDict()
+        self._data_cache_size = 4
         
         self.setup_ui()
         
@@ -298,14 +314,12 @@ class PlotResponses(QtWidgets.QWidget):
         self._data_fn = os.path.abspath(data_fn)
         self.file_watcher_dfn.addPath(self._data_fn)
         
-        # create new modem data object
-        self.modem_data = modem.Data()
-        self.modem_data.read_data_file(self._data_fn)
-        
         # make a back up copy that will be unchanged
-        # that way we can revert back
-        self._modem_data_copy = modem.Data()
-        self._modem_data_copy.read_data_file(self._data_fn)
+        # that way we can revert back, the file is only read once
+        self._modem_data_copy = self._read_data_file(self._data_fn)
+        
+        # create new modem data object to edit
+        self.modem_data = copy.deepcopy(self._modem_data_copy)
         
         self.dirpath = os.path.dirname(self._data_fn)
         
@@ -327,10 +341,31 @@ class PlotResponses(QtWidgets.QWidget):
     @resp_fn.setter
     def resp_fn(self, resp_fn):
         self._resp_fn = os.path.abspath(resp_fn)
-        self.modem_resp = modem.Data()
-
-        self.modem_resp.read_data_file(self._resp_fn)
+        self.modem_resp = self._read_data_file(self._resp_fn)
         self.plot() 
+
+    def _read_data_file(self, data_fn):
+        """
+        read a data or response file into a modem.Data object, the file is
+        only parsed again if it changed on disk
+        """
+        key = (data_fn, os.path.getmtime(data_fn))
+        if key in self._data_cache:
+            self._data_cache[key] = self._data_cache.pop(key)
+            return self._data_cache[key]
+
+        # forget older versions of the file and the least recently used files
+        for old_key in list(self._data_cache.keys()):
+            if old_key[0] == data_fn:
+                del self._data_cache[old_key]
+        while len(self._data_cache) >= self._data_cache_size:
+            self._data_cache.popitem(last=False)
+
+        data_obj = modem.Data()
+        data_obj.read_data_file(data_fn)
+        self._data_cache[key] = data_obj
+
+        return data_obj
         
     @property
     def plot_z(self):
@@ -438,14 +473,24 @@ class PlotResponses(QtWidgets.QWidget):
     def apply_edits(self):
         self.plot()
         
-    def plot(self):
+    def redraw_plot(self):
         """
-        plot the data
+        rebuild the figure from scratch, use this after changing the plot
+        settings
         """
+        self._artist_key = None
+        self.plot()
 
-        if self.station is None:
-            return
+    def _get_plot_arrays(self):
+        """
+        get the arrays to plot for the current station, in the order of
+        ax_list
             
+        :returns: list of (period, value, error) of the data, list of
+                  (period, value) of the response and list of rms labels for
+                  the legends.  The response lists are None if there is no
+                  response for the station.
+        """
         z_obj = self.modem_data.mt_dict[self.station].Z
         t_obj = self.modem_data.mt_dict[self.station].Tipper
         period = self.modem_data.period_list
@@ -453,6 +498,128 @@ class PlotResponses(QtWidgets.QWidget):
         # need to make sure that resistivity and phase is computed
         z_obj.compute_resistivity_phase()
 
+        #convert to apparent resistivity and phase
+        if self.plot_z == True:
+            scaling = 1./np.sqrt(z_obj.freq)[:, np.newaxis, np.newaxis]
+            plot_res = abs(z_obj.z.real*scaling)
+            plot_res_err = abs(z_obj.z_err*scaling)
+            plot_phase = abs(z_obj.z.imag*scaling)
+            plot_phase_err = abs(z_obj.z_err*scaling)
+        elif self.plot_z == False:
+            plot_res = z_obj.resistivity
+            plot_res_err = z_obj.resistivity_err
+            plot_phase = z_obj.phase
+            plot_phase_err = z_obj.phase_err
+
+        #find locations where points have been masked
+        nz_list = [np.nonzero(z_obj.z[:, ii, jj])[0]
+                   for ii, jj in self._z_comp_list]
+        nzt_list = [np.nonzero(t_obj.tipper[:, 0, jj])[0] for jj in range(2)]
+
+        data_list = []
+        for value, error in [(plot_res, plot_res_err),
+                             (plot_phase, plot_phase_err)]:
+            for nz, (ii, jj) in zip(nz_list, self._z_comp_list):
+                data_list.append((period[nz], value[nz, ii, jj],
+                                  error[nz, ii, jj]))
+        for jj, nz in enumerate(nzt_list):
+            data_list.append((period[nz], t_obj.tipper[nz, 0, jj].real,
+                              t_obj.tipper_err[nz, 0, jj]))
+            data_list.append((period[nz], t_obj.tipper[nz, 0, jj].imag,
+                              t_obj.tipper_err[nz, 0, jj]))
+
+        if self.modem_resp is None or \
+           self.station not in self.modem_resp.mt_dict:
+            return data_list, None, None
+
+        resp_z_obj = self.modem_resp.mt_dict[self.station].Z
+        resp_z_err = np.nan_to_num((z_obj.z-resp_z_obj.z)/z_obj.z_err)
+        resp_z_obj.compute_resistivity_phase()
+
+        resp_t_obj = self.modem_resp.mt_dict[self.station].Tipper
+        resp_t_err = np.nan_to_num((t_obj.tipper-resp_t_obj.tipper)/t_obj.tipper_err)
+
+        try:
+            resp_period = 1./resp_z_obj.freq
+        except TypeError:
+            resp_period = 1./resp_t_obj.freq
+
+        #convert to apparent resistivity and phase
+        if self.plot_z == True:
+            scaling = 1./np.sqrt(resp_z_obj.freq)[:, np.newaxis, np.newaxis]
+            r_plot_res = abs(resp_z_obj.z.real*scaling)
+            r_plot_phase = abs(resp_z_obj.z.imag*scaling)
+        elif self.plot_z == False:
+            r_plot_res = resp_z_obj.resistivity
+            r_plot_phase = resp_z_obj.phase
+
+        #find locations where points have been masked
+        nz_r_list = [np.nonzero(resp_z_obj.z[:, ii, jj])[0]
+                     for ii, jj in self._z_comp_list]
+        nzt_r_list = [np.nonzero(resp_t_obj.tipper[:, 0, jj])[0]
+                      for jj in range(2)]
+
+        resp_list = []
+        for value in [r_plot_res, r_plot_phase]:
+            for nz_r, (ii, jj) in zip(nz_r_list, self._z_comp_list):
+                resp_list.append((resp_period[nz_r], value[nz_r, ii, jj]))
+        for jj, nz_r in enumerate(nzt_r_list):
+            resp_list.append((resp_period[nz_r],
+                              resp_t_obj.tipper[nz_r, 0, jj].real))
+            resp_list.append((resp_period[nz_r],
+                              resp_t_obj.tipper[nz_r, 0, jj].imag))
+
+        rms_label_list = []
+        for nz_r, (ii, jj), comp in zip(nz_r_list, self._z_comp_list,
+                                        ['xx', 'xy', 'yx', 'yy']):
+            rms_label_list.append('$Z^m_{'+comp+'}$ '+
+                                  'rms={0:.2f}'.format(resp_z_err[nz_r, ii, jj].std()))
+        rms_label_list += ['$T^m_{x}$ '+
+                           'rms={0:.2f}'.format(resp_t_err[nzt_list[0], 0, 0].std()),
+                           '$T^m_{y}$'+
+                           'rms={0:.2f}'.format(resp_t_err[nzt_list[1], 0, 1].std())]
+
+        return data_list, resp_list, rms_label_list
+
+    def plot(self):
+        """
+        plot the data
+
+        The axes and artists are only made when the layout of the plot
+        changes, for instance when switching between impedance and
+        resistivity and phase.  Otherwise the data of the existing artists
+        are updated, which keeps switching between stations fast.
+        """
+
+        if self.station is None:
+            return
+
+        data_list, resp_list, rms_label_list = self._get_plot_arrays()
+
+        t_obj = self.modem_data.mt_dict[self.station].Tipper
+        if np.all(t_obj.tipper == 0.0) == True:
+            plot_tipper = False
+        else:
+            plot_tipper = True
+
+        artist_key = (self.plot_z, plot_tipper, resp_list is None,
+                      id(self.modem_data), id(self.modem_resp),
+                      tuple([len(d_arr[0]) > 0 for d_arr in data_list]))
+        if artist_key == self._artist_key and self.ax_list is not None:
+            self._update_plot(data_list, resp_list, rms_label_list)
+        else:
+            self._artist_key = artist_key
+            self.plot_tipper = plot_tipper
+            self._build_plot(data_list, resp_list, rms_label_list)
+
+        self.mpl_widget.draw()
+
+    def _build_plot(self, data_list, resp_list, rms_label_list):
+        """
+        make the axes and the artists for the current station
+        """
+        period = self.modem_data.period_list
+
         plt.rcParams['font.size'] = self.plot_settings.fs
         fontdict = {'size':self.plot_settings.fs+2, 'weight':'bold'} 
 
@@ -475,43 +642,18 @@ class PlotResponses(QtWidgets.QWidget):
                  'e_capthick':self.plot_settings.e_capthick,
                  'picker':3} 
 
-        #convert to apparent resistivity and phase
         if self.plot_z == True:
-            scaling = np.zeros_like(z_obj.z)
-            for ii in range(2):
-                for jj in range(2):
-                    scaling[:, ii, jj] = 1./np.sqrt(z_obj.freq)
-            plot_res = abs(z_obj.z.real*scaling)
-            plot_res_err = abs(z_obj.z_err*scaling)
-            plot_phase = abs(z_obj.z.imag*scaling)
-            plot_phase_err = abs(z_obj.z_err*scaling)
             h_ratio = [1, 1, .5]
             
         elif self.plot_z == False:
-            plot_res = z_obj.resistivity
-            plot_res_err = z_obj.resistivity_err
-            plot_phase = z_obj.phase
-            plot_phase_err = z_obj.phase_err
             h_ratio = [1.5, 1, .5]
         
-        #find locations where points have been masked
-        nzxx = np.nonzero(z_obj.z[:, 0, 0])[0]
-        nzxy = np.nonzero(z_obj.z[:, 0, 1])[0]
-        nzyx = np.nonzero(z_obj.z[:, 1, 0])[0]
-        nzyy = np.nonzero(z_obj.z[:, 1, 1])[0]
-        ntx = np.nonzero(t_obj.tipper[:, 0, 0])[0]
-        nty = np.nonzero(t_obj.tipper[:, 0, 1])[0]
-        
-
         self.figure.clf()
-        self.figure.suptitle(str(self.station), fontdict=fontdict)
+        self._mask_artists = []
+        self._title = self.figure.suptitle(str(self.station),
+                                           fontdict=fontdict)
         
         #set the grid of subplots
-        if np.all(t_obj.tipper == 0.0) == True:
-            self.plot_tipper = False
-        else:
-            self.plot_tipper = True
-            
         gs = gridspec.GridSpec(3, 4, height_ratios=h_ratio)
         gs.update(wspace=self.plot_settings.subplot_wspace,
                    left=self.plot_settings.subplot_left,
@@ -540,136 +682,32 @@ class PlotResponses(QtWidgets.QWidget):
                         axtxr, axtxi, axtyr, axtyi]
         
 
-        # plot data response
-        erxx = mtplottools.plot_errorbar(axrxx, 
-                                         period[nzxx], 
-                                         plot_res[nzxx, 0, 0], 
-                                         plot_res_err[nzxx, 0, 0],
-                                         **kw_xx)
-        erxy = mtplottools.plot_errorbar(axrxy, 
-                                         period[nzxy], 
-                                         plot_res[nzxy, 0, 1], 
-                                         plot_res_err[nzxy, 0, 1],
-                                         **kw_xx)
-        eryx = mtplottools.plot_errorbar(axryx, 
-                                         period[nzyx], 
-                                         plot_res[nzyx, 1, 0], 
-                                         plot_res_err[nzyx, 1, 0],
-                                         **kw_yy)
-        eryy = mtplottools.plot_errorbar(axryy, 
-                                         period[nzyy], 
-                                         plot_res[nzyy, 1, 1], 
-                                         plot_res_err[nzyy, 1, 1],
-                                         **kw_yy)
-        #plot phase                         
-        epxx = mtplottools.plot_errorbar(axpxx, 
-                                         period[nzxx], 
-                                         plot_phase[nzxx, 0, 0], 
-                                         plot_phase_err[nzxx, 0, 0],
-                                         **kw_xx)
-        epxy = mtplottools.plot_errorbar(axpxy, 
-                                         period[nzxy], 
-                                         plot_phase[nzxy, 0, 1], 
-                                         plot_phase_err[nzxy, 0, 1],
-                                         **kw_xx)
-        epyx = mtplottools.plot_errorbar(axpyx, 
-                                         period[nzyx], 
-                                         plot_phase[nzyx, 1, 0], 
-                                         plot_phase_err[nzyx, 1, 0],
-                                         **kw_yy)
-        epyy = mtplottools.plot_errorbar(axpyy, 
-                                         period[nzyy], 
-                                         plot_phase[nzyy, 1, 1], 
-                                         plot_phase_err[nzyy, 1, 1],
-                                         **kw_yy)
+        # plot data response, xx and xy components in one color and yx and
+        # yy in the other, tipper is only plotted if there is any
+        self._data_artists = []
+        self._err_list = []
+        for aa, (ax, (d_period, d_value, d_error)) in \
+                enumerate(zip(self.ax_list, data_list)):
+            if aa > 7 and self.plot_tipper == False:
+                self._data_artists.append(None)
+                self._err_list.append([None, None, None])
+                continue
                                       
-        #plot tipper
-        if self.plot_tipper == True:
-            ertx = mtplottools.plot_errorbar(axtxr, 
-                                             period[ntx],
-                                             t_obj.tipper[ntx, 0, 0].real,
-                                             t_obj.tipper_err[ntx, 0, 0],
-                                             **kw_xx)
-            erty = mtplottools.plot_errorbar(axtyr, 
-                                             period[nty],
-                                             t_obj.tipper[nty, 0, 1].real,
-                                             t_obj.tipper_err[nty, 0, 1],
-                                             **kw_yy)
+            if aa % 4 < 2:
+                kw = kw_xx
+            else:
+                kw = kw_yy
+            eb = mtplottools.plot_errorbar(ax, d_period, d_value, d_error,
+                                           **kw)
+            self._data_artists.append(eb)
                                      
-            eptx = mtplottools.plot_errorbar(axtxi, 
-                                             period[ntx],
-                                             t_obj.tipper[ntx, 0, 0].imag,
-                                             t_obj.tipper_err[ntx, 0, 0],
-                                             **kw_xx)
-            epty = mtplottools.plot_errorbar(axtyi, 
-                                             period[nty],
-                                             t_obj.tipper[nty, 0, 1].imag,
-                                             t_obj.tipper_err[nty, 0, 1],
-                                             **kw_yy)
-        
-        #----------------------------------------------
-        # get error bar list for editing later        
-        if self.plot_tipper == False: 
+            #----------------------------------------------
+            # get error bar list for editing later
             try:                   
-                self._err_list = [[erxx[1][0], erxx[1][1], erxx[2][0]],
-                                  [erxy[1][0], erxy[1][1], erxy[2][0]],
-                                  [eryx[1][0], eryx[1][1], eryx[2][0]],
-                                  [eryy[1][0], eryy[1][1], eryy[2][0]], 
-                                  [epxx[1][0], epxx[1][1], epxx[2][0]],
-                                  [epxy[1][0], epxy[1][1], epxy[2][0]],
-                                  [epyx[1][0], epyx[1][1], epyx[2][0]],
-                                  [epyy[1][0], epyy[1][1], epyy[2][0]]]
-                line_list = [[erxx[0]], [erxy[0]], [eryx[0]], [eryy[0]]]
-            except IndexError:
-                print('Found no Z components for {0}'.format(self.station))
-                line_list = [[None], [None], 
-                             [None], [None]]
-                                     
-                self._err_list = [[None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None]]
-
-        else:
-            try:                    
-                line_list = [[erxx[0]], [erxy[0]], 
-                             [eryx[0]], [eryy[0]],
-                             [ertx[0]], [erty[0]]]
-                                     
-                self._err_list = [[erxx[1][0], erxx[1][1], erxx[2][0]],
-                                  [erxy[1][0], erxy[1][1], erxy[2][0]],
-                                  [eryx[1][0], eryx[1][1], eryx[2][0]],
-                                  [eryy[1][0], eryy[1][1], eryy[2][0]],
-                                  [epxx[1][0], epxx[1][1], epxx[2][0]],
-                                  [epxy[1][0], epxy[1][1], epxy[2][0]],
-                                  [epyx[1][0], epyx[1][1], epyx[2][0]],
-                                  [epyy[1][0], epyy[1][1], epyy[2][0]],
-                                  [ertx[1][0], ertx[1][1], ertx[2][0]],
-                                  [eptx[1][0], eptx[1][1], eptx[2][0]],
-                                  [erty[1][0], erty[1][1], erty[2][0]],
-                                  [epty[1][0], epty[1][1], epty[2][0]]]
+                self._err_list.append([eb[1][0], eb[1][1], eb[2][0]])
             except IndexError:
                 print('Found no Z components for {0}'.format(self.station))
-                line_list = [[None], [None], 
-                             [None], [None],
-                             [None], [None]]
-                                     
-                self._err_list = [[None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None],
-                                  [None, None, None]]
+                self._err_list.append([None, None, None])
         
         #------------------------------------------
         # make things look nice        
@@ -717,11 +755,8 @@ class PlotResponses(QtWidgets.QWidget):
         #set axis properties
         for aa, ax in enumerate(self.ax_list):
             ax.tick_params(axis='y', pad=self.plot_settings.ylabel_pad)
-            ylabels = ax.get_yticks().tolist()
             if aa < 8:
-                ylabels[-1] = ''
-                ylabels[0] = ''
-                ax.set_yticklabels(ylabels)
+                self._set_y_tick_labels(ax)
                 plt.setp(ax.get_xticklabels(), visible=False)
                 if self.plot_z == True:
                     ax.set_yscale('log', nonposy='clip')
@@ -764,185 +799,122 @@ class PlotResponses(QtWidgets.QWidget):
             
         ##----------------------------------------------
         #plot model response
-        if self.modem_resp is not None:
-            try:
-                resp_z_obj = self.modem_resp.mt_dict[self.station].Z
-                resp_z_err = np.nan_to_num((z_obj.z-resp_z_obj.z)/z_obj.z_err)
-                resp_z_obj.compute_resistivity_phase()
-                
-                resp_t_obj = self.modem_resp.mt_dict[self.station].Tipper
-                resp_t_err = np.nan_to_num((t_obj.tipper-resp_t_obj.tipper)/t_obj.tipper_err)
-            except KeyError:
+        self._resp_artists = None
+        self._legend_list = None
+        if resp_list is None:
+            if self.modem_resp is not None:
                 print('Could not find {0} in .resp file'.format(self.station))
-                self.mpl_widget.draw()
-                return
+            return
+                
+        #--> make key word dictionaries for plotting
+        kw_xx = {'color':self.plot_settings.ctem,
+                 'marker':self.plot_settings.mtem,
+                 'ms':self.plot_settings.ms,
+                 'ls':':',
+                 'lw':self.plot_settings.lw,
+                 'e_capsize':self.plot_settings.e_capsize,
+                 'e_capthick':self.plot_settings.e_capthick}
             
-            try:
-                resp_period = 1./resp_z_obj.freq
-            except TypeError:
-                resp_period = 1./resp_t_obj.freq
+        kw_yy = {'color':self.plot_settings.ctmm,
+                 'marker':self.plot_settings.mtmm,
+                 'ms':self.plot_settings.ms,
+                 'ls':':',
+                 'lw':self.plot_settings.lw,
+                 'e_capsize':self.plot_settings.e_capsize,
+                 'e_capthick':self.plot_settings.e_capthick}
                 
-            #convert to apparent resistivity and phase
-            if self.plot_z == True:
-                scaling = np.zeros_like(resp_z_obj.z)
-                for ii in range(2):
-                    for jj in range(2):
-                        scaling[:, ii, jj] = 1./np.sqrt(resp_z_obj.freq)
-                r_plot_res = abs(resp_z_obj.z.real*scaling)
-                r_plot_phase = abs(resp_z_obj.z.imag*scaling)
+        self._resp_artists = []
+        for aa, (ax, (r_period, r_value)) in \
+                enumerate(zip(self.ax_list, resp_list)):
+            if aa > 7 and self.plot_tipper == False:
+                self._resp_artists.append(None)
+                continue
                 
-            elif self.plot_z == False:
-                r_plot_res = resp_z_obj.resistivity
-                r_plot_phase = resp_z_obj.phase
+            if aa % 4 < 2:
+                kw = kw_xx
+            else:
+                kw = kw_yy
+            self._resp_artists.append(mtplottools.plot_errorbar(ax,
+                                                                r_period,
+                                                                r_value,
+                                                                None,
+                                                                **kw))
                 
-            #find locations where points have been masked
-            nzxx_r = np.nonzero(resp_z_obj.z[:, 0, 0])[0]
-            nzxy_r = np.nonzero(resp_z_obj.z[:, 0, 1])[0]
-            nzyx_r = np.nonzero(resp_z_obj.z[:, 1, 0])[0]
-            nzyy_r = np.nonzero(resp_z_obj.z[:, 1, 1])[0]
-            ntx_r = np.nonzero(resp_t_obj.tipper[:, 0, 0])[0]
-            nty_r = np.nonzero(resp_t_obj.tipper[:, 0, 1])[0]
+        legend_index_list = [0, 1, 2, 3]
+        if self.plot_tipper == True:
+            legend_index_list += [8, 10]
 
-            rms_xx = resp_z_err[nzxx_r, 0, 0].std()
-            rms_xy = resp_z_err[nzxy_r, 0, 1].std()
-            rms_yx = resp_z_err[nzyx_r, 1, 0].std()
-            rms_yy = resp_z_err[nzyy_r, 1, 1].std()
+        self._legend_list = []
+        for aa, ax_index in enumerate(legend_index_list):
+            self._legend_list.append(self.ax_list[ax_index].legend(
+                      [self._data_artists[ax_index][0],
+                       self._resp_artists[ax_index][0]],
+                      label_list[aa] + [rms_label_list[aa]],
+                      loc=self.plot_settings.legend_loc,
+                      bbox_to_anchor=self.plot_settings.legend_pos,
+                      markerscale=self.plot_settings.legend_marker_scale,
+                      borderaxespad=self.plot_settings.legend_border_axes_pad,
+                      labelspacing=self.plot_settings.legend_label_spacing,
+                      handletextpad=self.plot_settings.legend_handle_text_pad,
+                      borderpad=self.plot_settings.legend_border_pad,
+                      prop={'size':max([self.plot_settings.fs, 5])}))
             
-            #--> make key word dictionaries for plotting
-            kw_xx = {'color':self.plot_settings.ctem,
-                     'marker':self.plot_settings.mtem,
-                     'ms':self.plot_settings.ms,
-                     'ls':':',
-                     'lw':self.plot_settings.lw,
-                     'e_capsize':self.plot_settings.e_capsize,
-                     'e_capthick':self.plot_settings.e_capthick}        
+    def _update_plot(self, data_list, resp_list, rms_label_list):
+        """
+        put the data of the current station into the existing artists
+        """
+        # the masked points belong to the last station
+        for artist in self._mask_artists:
+            artist.remove()
+        self._mask_artists = []
            
-            kw_yy = {'color':self.plot_settings.ctmm,
-                     'marker':self.plot_settings.mtmm,
-                     'ms':self.plot_settings.ms,
-                     'ls':':',
-                     'lw':self.plot_settings.lw,
-                     'e_capsize':self.plot_settings.e_capsize,
-                     'e_capthick':self.plot_settings.e_capthick}
+        self._title.set_text(str(self.station))
             
-            # plot data response
-            rerxx = mtplottools.plot_errorbar(axrxx, 
-                                             resp_period[nzxx_r], 
-                                             r_plot_res[nzxx_r, 0, 0], 
-                                             None,
-                                             **kw_xx)
-            rerxy = mtplottools.plot_errorbar(axrxy, 
-                                             resp_period[nzxy_r], 
-                                             r_plot_res[nzxy_r, 0, 1], 
-                                             None,
-                                             **kw_xx)
-            reryx = mtplottools.plot_errorbar(axryx, 
-                                             resp_period[nzyx_r], 
-                                             r_plot_res[nzyx_r, 1, 0], 
-                                             None,
-                                             **kw_yy)
-            reryy = mtplottools.plot_errorbar(axryy, 
-                                             resp_period[nzyy_r], 
-                                             r_plot_res[nzyy_r, 1, 1], 
-                                             None,
-                                             **kw_yy)
-            #plot phase                         
-            repxx = mtplottools.plot_errorbar(axpxx, 
-                                             resp_period[nzxx_r], 
-                                             r_plot_phase[nzxx_r, 0, 0], 
-                                             None,
-                                             **kw_xx)
-            repxy = mtplottools.plot_errorbar(axpxy, 
-                                             resp_period[nzxy_r], 
-                                             r_plot_phase[nzxy_r, 0, 1], 
-                                             None,
-                                             **kw_xx)
-            repyx = mtplottools.plot_errorbar(axpyx, 
-                                             resp_period[nzyx_r], 
-                                             r_plot_phase[nzyx_r, 1, 0], 
-                                             None,
-                                             **kw_yy)
-            repyy = mtplottools.plot_errorbar(axpyy, 
-                                             resp_period[nzyy_r], 
-                                             r_plot_phase[nzyy_r, 1, 1], 
-                                             None,
-                                             **kw_yy)
+        for aa, ax in enumerate(self.ax_list):
+            if self._data_artists[aa] is not None:
+                self._set_errorbar_data(self._data_artists[aa],
+                                        *data_list[aa])
+            if self._resp_artists is not None and \
+               self._resp_artists[aa] is not None:
+                self._resp_artists[aa][0].set_data(*resp_list[aa])
                                           
-            #plot tipper
-            if self.plot_tipper == True:
-                rertx = mtplottools.plot_errorbar(axtxr, 
-                                                 resp_period[ntx_r],
-                                                 resp_t_obj.tipper[ntx_r, 0, 0].real,
-                                                 None,
-                                                 **kw_xx)
-                rerty = mtplottools.plot_errorbar(axtyr, 
-                                                 resp_period[nty_r],
-                                                 resp_t_obj.tipper[nty_r, 0, 1].real,
-                                                 None,
-                                                 **kw_yy)
+            # rescale the y-axis, axes with limits set are left as is
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+            if 3 < aa < 8 and self.plot_z == False:
+                self._set_y_tick_labels(ax)
                                          
-                reptx = mtplottools.plot_errorbar(axtxi, 
-                                                 resp_period[ntx_r],
-                                                 resp_t_obj.tipper[ntx_r, 0, 0].imag,
-                                                 None,
-                                                 **kw_xx)
-                repty = mtplottools.plot_errorbar(axtyi, 
-                                                 resp_period[nty_r],
-                                                 resp_t_obj.tipper[nty_r, 0, 1].imag,
-                                                 None,
-                                                 **kw_yy)
+        if self._legend_list is not None:
+            for legend, rms_label in zip(self._legend_list, rms_label_list):
+                legend.get_texts()[1].set_text(rms_label)
                              
-            if self.plot_tipper == False:
-                line_list[0] += [rerxx[0]]
-                line_list[1] += [rerxy[0]]
-                line_list[2] += [reryx[0]]
-                line_list[3] += [reryy[0]]
-                label_list[0] += ['$Z^m_{xx}$ '+
-                                   'rms={0:.2f}'.format(rms_xx)]
-                label_list[1] += ['$Z^m_{xy}$ '+
-                               'rms={0:.2f}'.format(rms_xy)]
-                label_list[2] += ['$Z^m_{yx}$ '+
-                               'rms={0:.2f}'.format(rms_yx)]
-                label_list[3] += ['$Z^m_{yy}$ '+
-                               'rms={0:.2f}'.format(rms_yy)]
-            else:
-                line_list[0] += [rerxx[0]]
-                line_list[1] += [rerxy[0]]
-                line_list[2] += [reryx[0]]
-                line_list[3] += [reryy[0]]
-                line_list[4] += [rertx[0]]
-                line_list[5] += [rerty[0]]
-                label_list[0] += ['$Z^m_{xx}$ '+
-                                   'rms={0:.2f}'.format(rms_xx)]
-                label_list[1] += ['$Z^m_{xy}$ '+
-                               'rms={0:.2f}'.format(rms_xy)]
-                label_list[2] += ['$Z^m_{yx}$ '+
-                               'rms={0:.2f}'.format(rms_yx)]
-                label_list[3] += ['$Z^m_{yy}$ '+
-                               'rms={0:.2f}'.format(rms_yy)]
-                label_list[4] += ['$T^m_{x}$ '+
-                                'rms={0:.2f}'.format(resp_t_err[ntx, 0, 0].std())]
-                label_list[5] += ['$T^m_{y}$'+
-                                'rms={0:.2f}'.format(resp_t_err[nty, 0, 1].std())]
+    @staticmethod
+    def _set_errorbar_data(errorbar_object, x_array, y_array, y_error):
+        """
+        set new data to an error bar object made by
+        mtpy.imaging.mtplottools.plot_errorbar
+        """
+        data_line, cap_lines, bar_lines = errorbar_object
+        data_line.set_data(x_array, y_array)
+        if len(cap_lines) == 2:
+            cap_lines[0].set_data(x_array, y_array-y_error)
+            cap_lines[1].set_data(x_array, y_array+y_error)
+        if len(bar_lines) > 0:
+            bar_lines[0].set_segments(np.stack(
+                [np.column_stack([x_array, y_array-y_error]),
+                 np.column_stack([x_array, y_array+y_error])], axis=1))
             
-            legend_ax_list = self.ax_list[0:4]
-            if self.plot_tipper == True:
-                legend_ax_list += [self.ax_list[-4], self.ax_list[-2]]
+    @staticmethod
+    def _set_y_tick_labels(ax):
+        """
+        remove the top and bottom y tick labels so they do not overlap with
+        the axes above and below
+        """
+        ylabels = ax.get_yticks().tolist()
+        ylabels[-1] = ''
+        ylabels[0] = ''
+        ax.set_yticklabels(ylabels)
                 
-            for aa, ax in enumerate(legend_ax_list):
-                ax.legend(line_list[aa],
-                          label_list[aa],
-                          loc=self.plot_settings.legend_loc,
-                          bbox_to_anchor=self.plot_settings.legend_pos,
-                          markerscale=self.plot_settings.legend_marker_scale,
-                          borderaxespad=self.plot_settings.legend_border_axes_pad,
-                          labelspacing=self.plot_settings.legend_label_spacing,
-                          handletextpad=self.plot_settings.legend_handle_text_pad,
-                          borderpad=self.plot_settings.legend_border_pad,
-                          prop={'size':max([self.plot_settings.fs, 5])})
-        
-        self.mpl_widget.draw()
-        
     def on_pick(self, event):
         """
         mask a data point when it is clicked on.  
@@ -996,18 +968,20 @@ class PlotResponses(QtWidgets.QWidget):
                             self._comp_index_x, self._comp_index_y] = 0+0j
             
             # plot the points as masked
-            self._ax.plot(data_period, data_value, color=(0, 0, 0),
-                          marker='x', 
-                          ms=self.plot_settings.ms*2,
-                          mew=4)
+            mask_list = self._ax.plot(data_period, data_value,
+                                      color=(0, 0, 0),
+                                      marker='x', 
+                                      ms=self.plot_settings.ms*2,
+                                      mew=4)
                           
-            self._ax2.plot(data_period, data_value_2, color=(0, 0, 0),
-                          marker='x', 
-                          ms=self.plot_settings.ms*2,
-                          mew=4)
+            mask_list += self._ax2.plot(data_period, data_value_2,
+                                        color=(0, 0, 0),
+                                        marker='x', 
+                                        ms=self.plot_settings.ms*2,
+                                        mew=4)
+            self._mask_artists += mask_list
                           
-            self._ax.figure.canvas.draw()
-            self._ax2.figure.canvas.draw()
+            self.mpl_widget.draw_idle()
         
         # Increase error bars
         if event.mouseevent.button == 3:
@@ -1071,8 +1045,7 @@ class PlotResponses(QtWidgets.QWidget):
             self._err_list[self._ax_index][1].set_data(ncap_u)
             self._err_list[self._ax_index][2].get_paths()[e_index].vertices = eb
                                        
-            # need to redraw the figure
-            self._ax.figure.canvas.draw()
+            self.mpl_widget.draw_idle()
                           
     def in_axes(self, event):
         """
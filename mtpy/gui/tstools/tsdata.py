@@ -9,9 +9,18 @@ from datetime import datetime
 
 import re
 
+from mtpy.gui.tstools.tspyramid import MinMaxPyramid, PyramidCache
 
 class TSData():
-    def __init__(self, filename: str = None, numofsamples: int = 400, cachesize = 1e8):
+    def __init__(self, filename: str = None, numofsamples: int = 400, cachesize = 1e8,
+                 pyramidbins: int = 2**20, chunklength: int = 2**22):
+        """
+        numofsamples: number of points of a waveform to display
+        cachesize: size in bytes of the min/max pyramids kept in memory
+        pyramidbins: maximum number of bins of the finest level of a pyramid, shorter
+                     windows are read from disc
+        chunklength: number of samples read at a time while building a pyramid
+        """
         self.wavelist = {}
         self.wavemeta = {}
         print(("ini","!"*10))
@@ -19,9 +28,11 @@ class TSData():
         if filename is not None:
             self.loadFile(filename)
 
-        self.wavecache = {}
         self.numofsamples = numofsamples
         self.cachesize = cachesize
+        self.pyramidbins = pyramidbins
+        self.chunklength = chunklength
+        self.wavecache = PyramidCache(cachesize)
 
 
     def loadFile(self, filename: str):
@@ -44,82 +55,68 @@ class TSData():
         print((len(self.wavemeta)))
 
     def getwaveform(self, waveform: str, starttime: datetime=None, endtime: datetime=None):
+        _, channel, wavename = self.wavemeta[waveform]
 
-        if starttime is None or endtime is None:
-            timewindow = None
-        else:
-            timewindow = endtime.timestamp-starttime.timestamp
+        pyramid = self.getpyramid(waveform)
+        wave = pyramid.getwindow(None if starttime is None else starttime.timestamp,
+                                 None if endtime is None else endtime.timestamp,
+                                 self.numofsamples)
 
-        if waveform in self.wavecache and (timewindow is None or abs(self.wavecache[waveform][0] - timewindow)/timewindow<0.1):
-            return self.readcache(waveform, starttime, endtime)
-        elif self.writecache(waveform, timewindow):
-            return self.readcache(waveform, starttime, endtime)
-        else:
+        if wave is None:
+            # the window is shorter than the finest level of the pyramid, read the raw samples
             outwave, wavename, start_date, end_date, gaps= self.readdisc(waveform, starttime, endtime)
             wave = np.vstack((outwave.times() + outwave.meta['starttime'].timestamp, outwave.data))
-
-            wave = wave[:, wave[0, :] != np.nan]
-            wave = wave[:, wave[1, :] != np.nan]
             return wave, wavename, start_date, end_date, gaps
 
+        return wave, wavename, channel.start_date, channel.end_date, self.getgaps(waveform)
 
-    def writecache(self, waveform, timewindow):
-        #print('writecache', timewindow)
-        _, channel, _ = self.wavemeta[waveform]
-        if (channel.end_date - channel.start_date) / channel.sample_rate < self.cachesize:
-            outwave, wavename, start_date, end_date, gaps = \
-                self.readdisc(waveform, channel.start_date, channel.end_date, False)
-
-            if timewindow is None:
-                timewindow = end_date - start_date
-
-
-            rate = timewindow*channel.sample_rate/self.numofsamples
-            rate = int(rate)
-
-            if rate == 0:
-                pass
-            else:
-                if rate <= 1:
-                    pass
-                elif rate > 16:
-                    tmp = trace.Trace()
-                    tmp.data = outwave.data[::rate].copy()
-                    tmp.meta['delta'] = outwave.meta['delta'] * rate
-                    tmp.meta['starttime'] = outwave.meta['starttime']
-                    outwave = tmp  # .decimate(1, True)
-                elif rate >= 1:
-                    outwave.decimate(rate)
-
-            wave = np.vstack((outwave.times() + outwave.meta['starttime'].timestamp, outwave.data))
-            wave = np.array(wave).copy()
-            self.wavecache[waveform] = timewindow, wave , wavename, start_date, end_date, gaps
-
-
-            return True
-        else:
-            return False
+    def getpyramid(self, waveform: str):
+        pyramid = self.wavecache.get(waveform)
+        if pyramid is None:
+            pyramid = self.buildpyramid(waveform)
+            self.wavecache.put(waveform, pyramid)
+        return pyramid
 
-    def readcache(self, waveform: str, starttime: datetime, endtime: datetime):
-        #print('readcache', starttime, endtime)
-        timewindow, wave, wavename, start_date, end_date, gaps = self.wavecache[waveform]
-
-        if starttime is None:
-            starttime = start_date
-
-        if endtime is None:
-            endtime = end_date
-
-
-
-        head = int((starttime - start_date)/(wave[0,1]-wave[0,0]))
-        tail = int((endtime - start_date) / (wave[0,1] - wave[0,0]))
-
-        if tail >= wave.shape[1]:
-            tail = wave.shape[1]-1
-        outwave = wave[:,head: tail]
+    def buildpyramid(self, waveform: str):
+        """
+        build the min/max pyramid of a waveform in one pass over the recording, reading
+        chunklength samples at a time
+        """
+        rawdata, channel, wavename = self.wavemeta[waveform]
+        ntwk = re.sub('([^.]+)(.*)','\\1', wavename)
+        sttn = re.sub('([^.]+\.)([^.]+)(.*)','\\2', wavename)
 
-        return outwave, wavename, start_date, end_date, gaps
+        pyramid = MinMaxPyramid(channel.start_date.timestamp, channel.end_date.timestamp,
+                                channel.sample_rate, self.pyramidbins)
+
+        chunktime = self.chunklength / channel.sample_rate
+        chunkstart = channel.start_date
+        while True:
+            # chunks share their end samples, which does not change the envelopes
+            chunkend = min(chunkstart + chunktime, channel.end_date)
+            outwave = rawdata.get_waveforms(network=ntwk, station=sttn, location=channel.location_code, \
+                        channel=channel.code, starttime=chunkstart, endtime=chunkend, tag="raw_recording")
+            outwave.sort(['starttime'])
+            for w in outwave:
+                pyramid.add(w.meta['starttime'].timestamp, w.data)
+
+            if chunkend >= channel.end_date:
+                break
+            chunkstart = chunkend
+        pyramid.finalize()
+
+        return pyramid
+
+    def getgaps(self, waveform: str):
+        """
+        gaps of a waveform from its pyramid, in the format of obspy Stream.get_gaps
+        """
+        _, channel, wavename = self.wavemeta[waveform]
+        pyramid = self.getpyramid(waveform)
+
+        ntwk, sttn, location, code = wavename.split('.')
+        return [[ntwk, sttn, location, code, UTCDateTime(start), UTCDateTime(end), end - start,
+                 int(round((end - start) * channel.sample_rate)) - 1] for start, end in pyramid.gaps]
 
     def getsegments(self, waveform: str):
         rawdata, channel, wavename = self.wavemeta[waveform]
@@ -157,11 +154,7 @@ class TSData():
         if len(outwave)>0:
             gaps = outwave.get_gaps()
 
-            mergewave = outwave[0]
-            for w in outwave[1:]:
-                mergewave = mergewave.__add__(w,fill_value=fill_value)
-
-            outwave = mergewave
+            outwave = outwave.merge(fill_value=fill_value)[0]
 
 
 
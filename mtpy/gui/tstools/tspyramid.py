@@ -0,0 +1,166 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+
+class MinMaxPyramid():
+    """
+    Min/max envelopes of a waveform at power-of-two levels.
+
+    Level k holds the minimum and maximum of bins of 2**k samples. The pyramid
+    is built in one streaming pass by calling add() with consecutive pieces of
+    the waveform, then finalize(). Only levels from baselevel up are kept, where
+    baselevel is chosen so that the finest level has at most maxbins bins; shorter
+    windows have to be read from the raw samples.
+
+    Bins without samples are nan, and gaps between pieces are kept in gaps as
+    (gap start, gap end) timestamps.
+    """
+    def __init__(self, starttime: float, endtime: float, sample_rate: float, maxbins: int = 2**20):
+        self.starttime = starttime
+        self.sample_rate = sample_rate
+        self.npts = int(round((endtime - starttime) * sample_rate)) + 1
+
+        self.baselevel = max(0, int(math.ceil(math.log2(float(self.npts) / maxbins))))
+        nbins = -(-self.npts // 2**self.baselevel)
+        self.levels = [(np.full(nbins, np.nan), np.full(nbins, np.nan))]
+
+        self.gaps = []
+        self._lastend = None
+
+    @property
+    def endtime(self):
+        return self.starttime + (self.npts - 1) / self.sample_rate
+
+    @property
+    def nbytes(self):
+        return sum(mins.nbytes + maxs.nbytes for mins, maxs in self.levels)
+
+    def add(self, starttime: float, data: np.ndarray):
+        """
+        add a piece of the waveform starting at timestamp starttime, pieces have to
+        be added in time order, but may overlap
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if len(data) == 0:
+            return
+
+        if self._lastend is not None and starttime - self._lastend > 1.5 / self.sample_rate:
+            self.gaps.append((self._lastend, starttime))
+        endtime = starttime + (len(data) - 1) / self.sample_rate
+        if self._lastend is None or endtime > self._lastend:
+            self._lastend = endtime
+
+        # keep samples within the pyramid
+        offset = int(round((starttime - self.starttime) * self.sample_rate))
+        if offset < 0:
+            data = data[-offset:]
+            offset = 0
+        data = data[:max(0, self.npts - offset)]
+        if len(data) == 0:
+            return
+
+        # reduce the samples into bins of the base level, the first and last bins may
+        # be shared with neighbouring pieces
+        binsize = 2**self.baselevel
+        firstbin = offset // binsize
+        starts = np.arange(binsize - offset % binsize, len(data), binsize)
+        starts = np.concatenate(([0], starts))
+        bins = slice(firstbin, firstbin + len(starts))
+
+        mins, maxs = self.levels[0]
+        mins[bins] = np.fmin(mins[bins], np.fmin.reduceat(data, starts))
+        maxs[bins] = np.fmax(maxs[bins], np.fmax.reduceat(data, starts))
+
+    def finalize(self):
+        """
+        build the coarser levels from the base level, down to a single bin
+        """
+        del self.levels[1:]
+        mins, maxs = self.levels[0]
+        with np.errstate(invalid='ignore'):
+            while len(mins) > 1:
+                if len(mins) % 2:
+                    mins = np.append(mins, np.nan)
+                    maxs = np.append(maxs, np.nan)
+                mins = np.fmin(mins[0::2], mins[1::2])
+                maxs = np.fmax(maxs[0::2], maxs[1::2])
+                self.levels.append((mins, maxs))
+
+    def getlevel(self, starttime: float, endtime: float, numofsamples: int):
+        """
+        coarsest level that still has numofsamples bins between starttime and endtime,
+        or None if the window needs a level finer than the base level
+        """
+        nsamples = (endtime - starttime) * self.sample_rate
+        if nsamples < numofsamples * 2**self.baselevel:
+            return None
+
+        level = int(math.floor(math.log2(nsamples / numofsamples)))
+        return min(level, self.baselevel + len(self.levels) - 1)
+
+    def getwindow(self, starttime: float = None, endtime: float = None, numofsamples: int = 400):
+        """
+        envelope of the waveform between timestamps starttime and endtime from the
+        coarsest level that still gives numofsamples points.
+
+        returns a (2, n) array of times and values, with the minimum of each bin at
+        its start and the maximum at its middle, or None if the window is too short
+        for the base level
+        """
+        if starttime is None:
+            starttime = self.starttime
+        if endtime is None:
+            endtime = self.endtime
+
+        level = self.getlevel(starttime, endtime, numofsamples)
+        if level is None:
+            return None
+
+        mins, maxs = self.levels[level - self.baselevel]
+        binlength = 2**level / self.sample_rate
+        head = max(0, int(math.floor((starttime - self.starttime) / binlength)))
+        tail = min(len(mins), int(math.floor((endtime - self.starttime) / binlength)) + 1)
+        head = min(head, tail)
+
+        times = self.starttime + np.arange(head, tail) * binlength
+        wave = np.empty((2, 2 * (tail - head)))
+        wave[0, 0::2] = times
+        wave[0, 1::2] = times + binlength / 2
+        wave[1, 0::2] = mins[head:tail]
+        wave[1, 1::2] = maxs[head:tail]
+        return wave
+
+
+class PyramidCache():
+    """
+    least recently used cache of pyramids, or anything with nbytes, that keeps the
+    total size within maxbytes; the most recent item is always kept
+    """
+    def __init__(self, maxbytes: float = 1e8):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, item):
+        if key in self._items:
+            self.nbytes -= self._items.pop(key).nbytes
+        self._items[key] = item
+        self.nbytes += item.nbytes
+
+        while self.nbytes > self.maxbytes and len(self._items) > 1:
+            _, olditem = self._items.popitem(last=False)
+            self.nbytes -= olditem.nbytes
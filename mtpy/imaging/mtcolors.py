@@ -469,6 +469,9 @@ def get_plot_color(colorx, comp, cmap, ckmin=None, ckmax=None, bounds=None):
     """
     gets the color for the given compnent, color array and cmap
 
+    colorx can be a single value or an array of values, for an array the
+    colors are returned as an array of RGBA values.
+
     Note: we now use the linearSegmentedColorMap objects, instead of the get_color function
     """
 
@@ -527,8 +530,18 @@ def get_plot_color(colorx, comp, cmap, ckmin=None, ckmax=None, bounds=None):
         norm = colors.Normalize(bounds[0], bounds[-1])
         step = abs(bounds[1] - bounds[0])
         ### need to get the color into a bin so as to not smear the colors.
-        
-        if colorx > max(bounds):
+
+        if np.ndim(colorx) > 0:
+            # same binning for an array of values
+            colorx = np.asarray(colorx, dtype=float)
+            with np.errstate(invalid='ignore'):
+                binned = np.trunc(step * np.round((colorx - np.sign(colorx) *
+                                                   (abs(colorx) % step)) / step))
+                binned[abs(colorx) <= step] = 0
+                binned[colorx < min(bounds)] = min(bounds)
+                binned[colorx > max(bounds)] = max(bounds)
+            colorx = binned
+        elif colorx > max(bounds):
             colorx = max(bounds)
         elif colorx < min(bounds):
             colorx = min(bounds)
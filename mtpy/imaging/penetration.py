@@ -26,6 +26,7 @@ from mpl_toolkits.axes_grid1 import make_axes_locatable
 from scipy.interpolate import griddata
 
 import mtpy
+import mtpy.analysis.niblettbostick as MTnb
 import mtpy.modeling.occam2d_rewrite as occam2d
 from .imaging_base import ImagingBase, ParameterError, ImagingError
 from mtpy.core import mt as mt
@@ -173,15 +174,18 @@ class Depth2D(ImagingBase):
         else:
             fontsize = 16
 
+        # compute depths of all stations once for all selected periods
+        depth_cube = PenetrationDepthCube(pr.edi_list)
+
         self._fig = plt.figure(figsize=(8, 6), dpi=80)
         self._fig.set_tight_layout(True)
         for selected_period in self._selected_periods:
             if period_by_index:
                 (stations, periods, pen, _) = get_penetration_depth_by_index(
-                    pr.edi_list, selected_period, whichrho=self._rho)
+                    depth_cube, selected_period, whichrho=self._rho)
             else:
                 (stations, periods, pen, _) = get_penetration_depth_by_period(
-                    pr.edi_list, selected_period, whichrho=self._rho, ptol=self._ptol)
+                    depth_cube, selected_period, whichrho=self._rho, ptol=self._ptol)
 
             line_label = "Period=%.2e s" % selected_period
 
@@ -259,6 +263,7 @@ class Depth3D(ImagingBase):
         self._period = None
         self._period_fmt = None
         self._ptol = ptol
+        self._depth_cube = None
         self.set_data(edis)
         # self._set_edis(edis)
         self.set_rho(rho)
@@ -280,14 +285,18 @@ class Depth3D(ImagingBase):
         if z_unit not in ('m', 'km'):
             raise ParameterError("z_unit has to be m or km.")
 
+        # depths are computed once for the data and reused for other periods
+        if self._depth_cube is None:
+            self._depth_cube = PenetrationDepthCube(self._data)
+
         if period_by_index:  # self._period is considered as an index
             if not isinstance(self._period, int):
                 self._logger.warning("period value is not integer but used as an index.")
-            (stations, periods, pendep, latlons) = get_penetration_depth_by_index(self._data,
+            (stations, periods, pendep, latlons) = get_penetration_depth_by_index(self._depth_cube,
                                                                                   int(self._period),
                                                                                   whichrho=self._rho)
         else:
-            (stations, periods, pendep, latlons) = get_penetration_depth_by_period(self._data,
+            (stations, periods, pendep, latlons) = get_penetration_depth_by_period(self._depth_cube,
                                                                                    self._period,
                                                                                    whichrho=self._rho, ptol=self._ptol)
 
@@ -482,6 +491,7 @@ class Depth3D(ImagingBase):
     def set_data(self, data):
         # this plot need a list of edi files
         self._set_edis(data)
+        self._depth_cube = None
 
     def set_rho(self, rho):
         if rho is None or rho in DEFAULT_RHOLIST:
@@ -512,67 +522,16 @@ def get_penetration_depth_by_index(mt_obj_list, per_index, whichrho='det'):
 
     Parameters
     ----------
-    mt_obj_list : list of MT
-        List of stations as MT objects.
-    selected_period : float
-        The period in seconds to plot depth for.
-    ptol : float
-        Tolerance to use when finding nearest period to selected period.
-        If abs(selected_period - nearest_period) is greater than
-        ptol * selected_period, then the period is discarded and will
-        appear as a gap in the plot.
+    mt_obj_list : list of MT or PenetrationDepthCube
+        List of stations as MT objects, or a PenetrationDepthCube built from
+        them so depths computed before are reused.
+    per_index : int
+        Index of the period in each station's period list.
     whichrho : str
         'det', 'zxy' or 'zyx'. The component to plot.
     """
-    scale_param = np.sqrt(1.0 / (2.0 * np.pi * 4 * np.pi * 10 ** (-7)))
-
-    # per_index=0,1,2,....
-    periods = []
-    pen_depth = []
-    stations = []
-    latlons = []
-    for mt_obj in mt_obj_list:
-        if isinstance(mt_obj, str) and os.path.isfile(mt_obj):
-            mt_obj = mt.MT(mt_obj)
-        elif not isinstance(mt_obj, mt.MT):
-            raise Exception("Unsupported list of objects %s" % type(mt_obj))
-        # station id
-        stations.append(mt_obj.station)
-        # latlons
-        latlons.append((mt_obj.lat, mt_obj.lon))
-        # the attribute Z
-        zeta = mt_obj.Z
-
-        if per_index >= len(zeta.freq):
-            _logger.debug(
-                "Number of frequecies (Max per_index)= %s", len(
-                    zeta.freq))
-            raise Exception(
-                "Index out_of_range Error: period index must be less than number of periods in zeta.freq")
-
-        per = 1.0 / zeta.freq[per_index]
-        periods.append(per)
-
-        if whichrho == 'zxy':
-            penetration_depth = - scale_param * \
-                np.sqrt(zeta.resistivity[per_index, 0, 1] * per)
-        elif whichrho == 'zyx':
-            penetration_depth = - scale_param * \
-                np.sqrt(zeta.resistivity[per_index, 1, 0] * per)
-        elif whichrho == 'det':  # the 2X2 complex Z-matrix's determinant abs value
-            # determinant value at the given period index
-            det2 = np.abs(zeta.det[per_index])
-            penetration_depth = -scale_param * np.sqrt(0.2 * per * det2 * per)
-        else:
-            _logger.critical(
-                "unsupported method to compute penetration depth: %s",
-                whichrho)
-            # sys.exit(100)
-            raise Exception("unsupported method to compute penetratoin depth: %s" % whichrho)
-
-        pen_depth.append(penetration_depth)
-
-    return stations, periods, pen_depth, latlons
+    depth_cube = get_depth_cube(mt_obj_list)
+    return depth_cube.get_depth_by_index(per_index, whichrho=whichrho)
 
 
 def load_edi_files(edi_path, file_list=None):
@@ -593,73 +552,175 @@ def get_penetration_depth_by_period(mt_obj_list, selected_period, ptol=0.1, whic
     A tolerance of ptol=10% is used to identify the relevant edi files which contain the period of interest.
 
     :param ptol: freq error/tolerance, need to be consistent with phase_tensor_map.py, default is 0.1
-    :param edi_file_list: edi file list of mt object list
-    :param period_sec: the float number value of the period in second: 0.1, ...20.0
+    :param mt_obj_list: edi file list, mt object list or PenetrationDepthCube
+    :param selected_period: the float number value of the period in second: 0.1, ...20.0
     :param whichrho:
     :return: tuple of (stations, periods, penetrationdepth, lat-lons-pairs)
     """
-    scale_param = np.sqrt(1.0 / (2.0 * np.pi * 4 * np.pi * 10 ** (-7)))
+    depth_cube = get_depth_cube(mt_obj_list)
+    return depth_cube.get_depth_by_period(selected_period, ptol=ptol,
+                                          whichrho=whichrho)
 
-    # per_index=0,1,2,....
-    periods = []
-    pen_depth = []
-    stations = []
-    latlons = []
-
-    _logger.info("Getting nearest period to {} for all stations".format(selected_period))
-    for mt_obj in mt_obj_list:
-        if isinstance(mt_obj, str) and os.path.isfile(mt_obj):
-            mt_obj = mt.MT(mt_obj)
-        elif not isinstance(mt_obj, mt.MT):
-            raise Exception("Unsupported list of objects %s" % type(mt_obj))
-
-        # station id
-        stations.append(mt_obj.station)
-        # latlons
-        latlons.append((mt_obj.lat, mt_obj.lon))
-
-        # the attribute Z
-        zeta = mt_obj.Z
-        per_index = np.argmin(np.fabs(zeta.freq - 1.0/selected_period))
-        per = 1.0 / zeta.freq[per_index]
-
-        print("********* The period-index=%s corresponding to the selected_period %s"%(per_index, selected_period))
-
-        if abs(selected_period - per) > (selected_period) * ptol:
-            print("************** Different the selected period =", selected_period, per)
-            #periods.append(np.nan)
-            periods.append(selected_period)
-            pen_depth.append(np.nan)
-            _logger.warning("Nearest period {} on station {} was beyond tolerance of {} ".format(per, mt_obj.Site.id, ptol))
-            pass
-        else:      # Otherwise do this block to compute the edi's pen-depth correspond to the selected_period
 
-            print("********* Include this period at the index ", per,  per_index)
-            periods.append(per)
+def get_depth_cube(mt_obj_list):
+    """
+    return mt_obj_list if it is already a PenetrationDepthCube, otherwise
+    build one from the list of MT objects or edi files
+    """
+    if isinstance(mt_obj_list, PenetrationDepthCube):
+        return mt_obj_list
+    return PenetrationDepthCube(mt_obj_list)
+
+
+class PenetrationDepthCube(object):
+    """
+    Penetration depths of all stations and periods of a survey, computed in
+    one vectorized pass into (station, period) arrays.
+
+    Edi files are read once when the cube is built.  Depths are computed
+    the first time a component is asked for and then cached, so successive
+    1D/2D/3D penetration plots and csv exports reuse them.
+
+    Stations with fewer periods are padded with NaN, the period index of
+    each station is kept as in its own data file.
+
+    ====================== ====================================================
+    Attributes             Description
+    ====================== ====================================================
+    mt_obj_list            list of MT objects
+    station_list           list of station names
+    latlons                list of (lat, lon) for each station
+    freq                   np.ndarray(num_stations, max_num_freq) frequencies
+    num_freq               np.ndarray(num_stations) number of frequencies
+    z                      np.ndarray(num_stations, max_num_freq, 2, 2)
+    ====================== ====================================================
+
+    Example
+    ------------
+        >>> depth_cube = PenetrationDepthCube(mt_obj_list)
+        >>> depth_cube.get_depth('det')[0]
+        >>> stations, periods, depths, latlons = \\
+        >>>     get_penetration_depth_by_period(depth_cube, 10.)
+    """
 
+    scale_param = np.sqrt(1.0 / (2.0 * np.pi * 4 * np.pi * 10 ** (-7)))
+
+    def __init__(self, mt_obj_list):
+        self.mt_obj_list = []
+        for mt_obj in mt_obj_list:
+            if isinstance(mt_obj, str) and os.path.isfile(mt_obj):
+                mt_obj = mt.MT(mt_obj)
+            elif not isinstance(mt_obj, mt.MT):
+                raise Exception("Unsupported list of objects %s" % type(mt_obj))
+            self.mt_obj_list.append(mt_obj)
+
+        self.station_list = [mt_obj.station for mt_obj in self.mt_obj_list]
+        self.latlons = [(mt_obj.lat, mt_obj.lon) for mt_obj in self.mt_obj_list]
+
+        self.num_freq = np.array([mt_obj.Z.freq.size
+                                  for mt_obj in self.mt_obj_list], dtype=int)
+        num_stations = len(self.mt_obj_list)
+        max_num_freq = self.num_freq.max() if num_stations > 0 else 0
+
+        self.freq = np.zeros((num_stations, max_num_freq))
+        self.freq[:] = np.nan
+        self.z = np.zeros((num_stations, max_num_freq, 2, 2), dtype=complex)
+        self.z[:] = np.nan
+        for ii, mt_obj in enumerate(self.mt_obj_list):
+            self.freq[ii, :self.num_freq[ii]] = mt_obj.Z.freq
+            self.z[ii, :self.num_freq[ii]] = mt_obj.Z.z
+
+        self._depth_dict = {}
+        self._nb_depth = None
+
+    @property
+    def period(self):
+        """periods (num_stations, max_num_freq), NaN padded"""
+        return 1.0 / self.freq
+
+    @property
+    def nb_depth(self):
+        """
+        Niblett-Bostick depth transform of all stations and periods, see
+        mtpy.analysis.niblettbostick.calculate_depth_nb_array
+        """
+        if self._nb_depth is None:
+            self._nb_depth = MTnb.calculate_depth_nb_array(self.z, self.period)
+        return self._nb_depth
+
+    def get_depth(self, whichrho='det'):
+        """
+        skin depth of all stations and periods in meters
+
+        :param whichrho: 'det', 'zxy' or 'zyx'
+        :return: np.ndarray(num_stations, max_num_freq), NaN padded
+        """
+        if whichrho not in self._depth_dict:
+            period = self.period
             if whichrho == 'zxy':
-                penetration_depth = scale_param * \
-                    np.sqrt(zeta.resistivity[per_index, 0, 1] * per)
+                res = np.abs(self.z[:, :, 0, 1]) ** 2 * period * 0.2
+                depth = self.scale_param * np.sqrt(res * period)
             elif whichrho == 'zyx':
-                penetration_depth = scale_param * \
-                    np.sqrt(zeta.resistivity[per_index, 1, 0] * per)
+                res = np.abs(self.z[:, :, 1, 0]) ** 2 * period * 0.2
+                depth = self.scale_param * np.sqrt(res * period)
             elif whichrho == 'det':  # the 2X2 complex Z-matrix's determinant abs value
-                # determinant value at the given period index
-                det2 = np.abs(zeta.det[per_index])
-                penetration_depth = scale_param * np.sqrt(0.2 * per * det2 * per)
+                det2 = np.abs(np.linalg.det(self.z))
+                depth = self.scale_param * np.sqrt(0.2 * period * det2 * period)
             else:
                 _logger.critical(
                     "unsupported method to compute penetration depth: %s",
                     whichrho)
-                # sys.exit(100)
                 raise Exception("unsupported method to compute penetratoin depth: %s" % whichrho)
+            self._depth_dict[whichrho] = depth
+
+        return self._depth_dict[whichrho]
 
-            pen_depth.append(penetration_depth)
+    def get_depth_by_index(self, per_index, whichrho='det'):
+        """
+        penetration depth of every station at the given period index, depths
+        are negative as in get_penetration_depth_by_index
 
-    # The returned 4 lists should have equal length!!!
-    _logger.debug("The length of stations, periods, pen_depth, latlons: %s,%s,%s,%s ", len(stations), len(periods), len(pen_depth), len(latlons) )
+        :return: tuple of (stations, periods, penetrationdepth, lat-lons-pairs)
+        """
+        if np.any(per_index >= self.num_freq):
+            _logger.debug(
+                "Number of frequecies (Max per_index)= %s", self.num_freq.min())
+            raise Exception(
+                "Index out_of_range Error: period index must be less than number of periods in zeta.freq")
 
-    return stations, periods, pen_depth, latlons
+        depth = self.get_depth(whichrho)
+        periods = self.period[:, per_index]
+
+        return (list(self.station_list), periods.tolist(),
+                (-depth[:, per_index]).tolist(), list(self.latlons))
+
+    def get_depth_by_period(self, selected_period, ptol=0.1, whichrho='det'):
+        """
+        penetration depth of every station at the period nearest to
+        selected_period, NaN for stations where the nearest period is beyond
+        selected_period * ptol
+
+        :return: tuple of (stations, periods, penetrationdepth, lat-lons-pairs)
+        """
+        _logger.info("Getting nearest period to {} for all stations".format(selected_period))
+        depth = self.get_depth(whichrho)
+
+        freq_diff = np.abs(self.freq - 1.0 / selected_period)
+        freq_diff[np.isnan(freq_diff)] = np.inf
+        per_index = np.argmin(freq_diff, axis=1)
+        station_index = np.arange(len(self.mt_obj_list))
+        periods = self.period[station_index, per_index]
+        pen_depth = depth[station_index, per_index]
+
+        beyond = np.abs(selected_period - periods) > selected_period * ptol
+        for ii in np.where(beyond)[0]:
+            _logger.warning("Nearest period {} on station {} was beyond tolerance of {} ".format(
+                periods[ii], self.station_list[ii], ptol))
+        periods[beyond] = selected_period
+        pen_depth[beyond] = np.nan
+
+        return (list(self.station_list), periods.tolist(), pen_depth.tolist(),
+                list(self.latlons))
 
 
 class ZComponentError(ParameterError):
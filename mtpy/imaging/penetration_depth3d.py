@@ -20,7 +20,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 import mtpy.core.mt as mt
-from mtpy.imaging.penetration import get_index, load_edi_files, Depth3D
+from mtpy.imaging.penetration import get_index, load_edi_files, Depth3D, PenetrationDepthCube
 from mtpy.utils.mtpy_decorator import deprecated
 from mtpy.utils.mtpylog import MtPyLog
 import logging
@@ -343,13 +343,19 @@ def create_penetration_depth_csv(edi_dir, outputcsv, zcomponent='det'):
 
     _logger.debug(edi_files)
 
+    # compute the depths of all stations and periods in one go
+    depth_cube = PenetrationDepthCube(edi_files)
+    depth_array = depth_cube.get_depth(zcomponent)
+
     # the first period list as a reference for checking other stations period
     periods_list0 = None
     latlon_dep = []  # CSV to be returned
-    for afile in edi_files:
+    for ii, afile in enumerate(edi_files):
         # for efile in edi_files[:2]:
         _logger.debug("processing %s", afile)
-        lat, lon, periods, depths = get_penetration_depths_from_edi_file(afile)
+        lat, lon = depth_cube.latlons[ii]
+        periods = depth_cube.period[ii, :depth_cube.num_freq[ii]]
+        depths = depth_array[ii, :depth_cube.num_freq[ii]]
         if periods_list0 is None:
             periods_list0 = periods  # initial value assignment
             #depth_string = ','.join(['%.2f' % num for num in depths])
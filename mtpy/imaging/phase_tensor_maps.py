@@ -18,6 +18,7 @@ from matplotlib.ticker import FormatStrFormatter
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.patches as patches
+from matplotlib.collections import EllipseCollection, PolyCollection
 import matplotlib.colorbar as mcb
 import matplotlib.tri as tri
 
@@ -25,12 +26,108 @@ import mtpy.utils.gis_tools as gis_tools
 import mtpy.imaging.mtcolors as mtcl
 import mtpy.imaging.mtplottools as mtpl
 import mtpy.analysis.pt as MTpt
+import mtpy.core.z as MTz
 from mtpy.utils.mtpylog import MtPyLog
 from mtpy.utils.plot_geotiff_imshow import plot_geotiff_on_axes
 
 _logger = MtPyLog.get_mtpy_logger(__name__)
 
 
+# ==============================================================================
+def get_ellipse_geometry(phimin, phimax, azimuth, ellipse_size):
+    """
+    get the width, height and angle of phase tensor ellipses for arrays of
+    phimin, phimax and azimuth, the ellipses are scaled so that phimax is
+    ellipse_size.  Ellipses that are not physically correct are made a dot.
+
+    :returns: widths, heights and angles (deg counter clockwise from x) to
+              use with matplotlib.patches.Ellipse or
+              matplotlib.collections.EllipseCollection
+    """
+    es = float(ellipse_size)
+    phimin = np.nan_to_num(np.asarray(phimin, dtype=float))
+    phimax = np.nan_to_num(np.asarray(phimax, dtype=float))
+    azimuth = np.nan_to_num(np.asarray(azimuth, dtype=float))
+
+    dot = (phimax == 0) | (phimax > 100) | (phimin == 0) | (phimin > 100)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scaling = np.where(dot, 0, es / phimax)
+    widths = np.where(dot, .0000001 * es, phimax * scaling)
+    heights = np.where(dot, .0000001 * es, phimin * scaling)
+
+    return widths, heights, 90 - azimuth
+
+
+def set_ellipse_sizes(collection, widths, heights, angles):
+    """
+    change the widths, heights and angles of an EllipseCollection in place
+    """
+    if hasattr(collection, 'set_widths'):
+        collection.set_widths(widths)
+        collection.set_heights(heights)
+        collection.set_angles(angles)
+    else:
+        # older versions of matplotlib keep the half axes and radians
+        collection._widths = .5 * np.asarray(widths).ravel()
+        collection._heights = .5 * np.asarray(heights).ravel()
+        collection._angles = np.deg2rad(angles).ravel()
+        collection.stale = True
+
+
+def get_arrow_verts(x, y, dx, dy, width, head_width=None, head_length=None):
+    """
+    get the polygons of arrows from (x, y) to (x + dx, y + dy) with the head
+    added to the length, for arrays of arrows.  The polygons are the same as
+    matplotlib.axes.Axes.arrow draws, so they can be drawn all at once with
+    a matplotlib.collections.PolyCollection.
+
+    :returns: np.ndarray(num_arrows, 8, 2) vertices of each arrow
+    """
+    if head_width is None:
+        head_width = 3 * width
+    if head_length is None:
+        head_length = 1.5 * head_width
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = np.asarray(dx, dtype=float)
+    dy = np.asarray(dy, dtype=float)
+    distance = np.hypot(dx, dy)
+    length = distance + head_length
+
+    # horizontal arrow with the tip at (0, 0) shifted by the head length
+    ax = np.zeros((x.size, 8)) + np.array([0, -head_length, -head_length, 0,
+                                           0, -head_length, -head_length, 0])
+    ax[:, 3] = -length
+    ax[:, 4] = -length
+    ax += head_length
+    ay = np.array([0, -head_width / 2., -width / 2., -width / 2.,
+                   width / 2., width / 2., head_width / 2., 0])
+
+    # rotate into the direction of the arrow
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cx = np.where(distance != 0, dx / distance, 0)[:, np.newaxis]
+        sx = np.where(distance != 0, dy / distance, 1)[:, np.newaxis]
+    verts = np.zeros((x.size, 8, 2))
+    verts[:, :, 0] = ax * cx - ay * sx + (x + dx)[:, np.newaxis]
+    verts[:, :, 1] = ax * sx + ay * cx + (y + dy)[:, np.newaxis]
+
+    # nothing is drawn for an arrow without length
+    return verts[length != 0]
+
+
+def _make_collection(collection_class, ax, *args, **kwargs):
+    """
+    make a collection with offsets in the data coordinates of ax
+    """
+    try:
+        return collection_class(*args, offset_transform=ax.transData,
+                                **kwargs)
+    except (TypeError, AttributeError):
+        # matplotlib < 3.6
+        return collection_class(*args, transOffset=ax.transData, **kwargs)
+
+
 # ==============================================================================
 
 class PlotPhaseTensorMaps(mtpl.PlotSettings):
@@ -302,6 +399,9 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         -arrow_size               scaling factor to make arrows visible
         -arrow_threshold          threshold for plotting arrows anything above
                                   this number will not be plotted
+        -arrow_collections        dictionary of
+                                  matplotlib.collections.PolyCollection of
+                                  the 'real' and 'imag' arrows
 
         -ax                   matplotlib.axes instance for the main plot
         -ax2                  matplotlib.axes instance for the color bar
@@ -312,6 +412,8 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         -dpi                  dots-per-inch resolution
 
         -ellipse_cmap         ellipse color map, see above for options
+        -ellipse_collection   matplotlib.collections.EllipseCollection of all
+                              the ellipses
         -ellipse_colorby      parameter to color ellipse by
         -ellipse_range        (min, max, step) values to color ellipses
         -ellipse_size         scaling factor to make ellipses visible
@@ -357,6 +459,8 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         -redraw_plot          on call redraws the plot from scratch
         -save_figure          saves figure to a file of given format
         -update_plot          updates the plot while still active
+        -update_plot_freq     changes the frequency of the plot, reusing the
+                              ellipse and arrow collections
         -export_params_to_file  writes parameters of the phase tensor and tipper to text files.
 
     """
@@ -602,6 +706,7 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         # end if
 
         lpax = lpfig.add_subplot(1, 1, 1, aspect='equal')
+        self.ax = lpax
 
         # plt.locator_params(axis='x', nbins=3)  # control number of ticks in axis (nbins ticks)
         plt.xticks(rotation='vertical')  # FZ: control tick rotation=30 not that good
@@ -695,258 +800,45 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         elif self.mapscale == 'm' or self.mapscale == 'km':
             self.tickstrfmt = '%.0f'
 
-        # make some empty arrays
-        elliplist = []
-        latlist = np.zeros(len(self.mt_list))
-        lonlist = np.zeros(len(self.mt_list))
-        self.plot_xarr = np.zeros(len(self.mt_list))
-        self.plot_yarr = np.zeros(len(self.mt_list))
-
-        for ii, mt in enumerate(self.mt_list):
-
-            newZ = None
-            newTipper = None
-            fidx = 0
-            if(self.interpolate):
-                newZ, newTipper = mt.interpolate([self.plot_freq], bounds_error=False)
-            else:
-                fidx = np.argmin(np.fabs(mt.Z.freq - self.plot_freq))
-
-            if((not self.interpolate and np.fabs(mt.Z.freq[fidx] - self.plot_freq) < self.ftol) or
-                    (self.interpolate)):
-
-                self.jj = fidx
-                jj = fidx
-
-                # get phase tensor
-                if(not self.interpolate):
-                    pt = mt.pt
-                else:
-                    newZ.compute_resistivity_phase()
-                    pt = MTpt.PhaseTensor(z_object=newZ)
-
-                # if map scale is lat lon set parameters
-                if self.mapscale == 'deg':
-                    latlist[ii] = mt.lat
-                    lonlist[ii] = mt.lon
-                    plotx = mt.lon - refpoint[0]
-                    ploty = mt.lat - refpoint[1]
-
-                # if map scale is in meters easting and northing
-                elif self.mapscale == 'm':
-                    east, north, zone = gis_tools.project_point_ll2utm(mt.lat,
-                                                                       mt.lon)
-
-                    # set the first point read in as a refernce other points
-                    if ii == 0:
-                        zone1 = zone
-                        plotx = east - refpoint[0]
-                        ploty = north - refpoint[1]
-
-                    # read in all the other point
-                    else:
-                        # check to make sure the zone is the same this needs
-                        # to be more rigorously done
-                        if zone1 != zone:
-                            print('Zone change at station ' + mt.station)
-                            if zone1[0:2] == zone[0:2]:
-                                pass
-                            elif int(zone1[0:2]) < int(zone[0:2]):
-                                east += 500000
-                            else:
-                                east -= -500000
-                            latlist[ii] = north - refpoint[1]
-                            lonlist[ii] = east - refpoint[0]
-                            plotx = east - refpoint[0]
-                            ploty = north - refpoint[1]
-                        else:
-                            latlist[ii] = north - refpoint[1]
-                            lonlist[ii] = east - refpoint[0]
-                            plotx = east - refpoint[0]
-                            ploty = north - refpoint[1]
-
-                # if mapscale is in km easting and northing
-                elif self.mapscale == 'km':
-                    east, north, zone = gis_tools.project_point_ll2utm(mt.lat,
-                                                                       mt.lon)
-                    if ii == 0:
-                        zone1 = zone
-                        plotx = (east - refpoint[0]) / 1000.
-                        ploty = (north - refpoint[1]) / 1000.
-
-                    else:
-                        if zone1 != zone:
-                            print('Zone change at station ' + mt.station)
-                            if zone1[0:2] == zone[0:2]:
-                                pass
-                            elif int(zone1[0:2]) < int(zone[0:2]):
-                                east += 500000
-                            else:
-                                east -= 500000
-                            latlist[ii] = (north - refpoint[1]) / 1000.
-                            lonlist[ii] = (east - refpoint[0]) / 1000.
-                            plotx = (east - refpoint[0]) / 1000.
-                            ploty = (north - refpoint[1]) / 1000.
-                        else:
-                            latlist[ii] = (north - refpoint[1]) / 1000.
-                            lonlist[ii] = (east - refpoint[0]) / 1000.
-                            plotx = (east - refpoint[0]) / 1000.
-                            ploty = (north - refpoint[1]) / 1000.
-                else:
-                    raise NameError('mapscale not recognized')
-
-                # put the location of each ellipse into an array in x and y
-                self.plot_xarr[ii] = plotx
-                self.plot_yarr[ii] = ploty
-
-                # --> set local variables
-                phimin = np.nan_to_num(pt.phimin[jj])
-                phimax = np.nan_to_num(pt.phimax[jj])
-                eangle = np.nan_to_num(pt.azimuth[jj])
-
-                # output to csv file:
-                # print('OUTCSV', mt.station, plotx, ploty, phimin, phimax, eangle)
-
-                if cmap == 'mt_seg_bl2wh2rd':
-                    bounds = np.arange(ckmin, ckmax + ckstep, ckstep)
-                    nseg = float((ckmax - ckmin) / (2 * ckstep))
-
-                # get the properties to color the ellipses by
-                if self.ellipse_colorby == 'phiminang' or \
-                        self.ellipse_colorby == 'phimin':
-                    colorarray = pt.phimin[jj]
-
-                elif self.ellipse_colorby == 'phimax':
-                    colorarray = pt.phimax[jj]
-
-                elif self.ellipse_colorby == 'phidet':
-                    colorarray = np.sqrt(abs(pt.det[jj])) * (180 / np.pi)
-
-                elif self.ellipse_colorby == 'skew' or \
-                        self.ellipse_colorby == 'skew_seg':
-                    colorarray = pt.beta[jj]
-
-                elif self.ellipse_colorby == 'normalized_skew' or \
-                        self.ellipse_colorby == 'normalized_skew_seg':
-                    colorarray = 2 * pt.beta[jj]
-
-                elif self.ellipse_colorby == 'ellipticity':
-                    colorarray = pt.ellipticity[jj]
-
-                else:
-                    raise NameError(self.ellipse_colorby + ' is not supported')
-
-                # --> get ellipse properties
-                # if the ellipse size is not physically correct make it a dot
-                if phimax == 0 or phimax > 100 or phimin == 0 or phimin > 100:
-                    eheight = .0000001 * es
-                    ewidth = .0000001 * es
-                else:
-                    scaling = es / phimax
-                    eheight = phimin * scaling
-                    ewidth = phimax * scaling
-
-                # make an ellipse
-                ellipd = patches.Ellipse((plotx, ploty),
-                                         width=ewidth,
-                                         height=eheight,
-                                         angle=90 - eangle,
-                                         lw=self.lw,
-                                         **self.kwargs)
-
-                # get ellipse color
-                if cmap.find('seg') > 0:
-                    ellipd.set_facecolor(mtcl.get_plot_color(colorarray,
-                                                             self.ellipse_colorby,
-                                                             cmap,
-                                                             ckmin,
-                                                             ckmax,
-                                                             bounds=bounds))
-                else:
-                    ellipd.set_facecolor(mtcl.get_plot_color(colorarray,
-                                                             self.ellipse_colorby,
-                                                             cmap,
-                                                             ckmin,
-                                                             ckmax))
-
-                # ==> add ellipse to the plot
-                elliplist.append(ellipd)
-                lpax.add_artist(ellipd)
-
-                # -----------Plot Induction Arrows---------------------------
-                if self.plot_tipper.find('y') == 0:
-
-                    # get tipper
-
-                    if mt.Tipper.tipper is None:
-                        mt.Tipper.tipper = np.zeros((len(mt.period), 1, 2),
-                                                    dtype='complex')
-
-                    # make some local parameters for easier typing
-                    ascale = self.arrow_size
-                    adir = self.arrow_direction * np.pi
-
-                    # plot real tipper
-                    ti = None
-                    if(not self.interpolate):
-                        ti = mt.Tipper
-                    else:
-                        ti = newTipper
-                    # end if
-
-                    if self.plot_tipper == 'yri' or self.plot_tipper == 'yr':
-                        if ti.mag_real[jj] <= self.arrow_threshold:
-                            txr = ti.mag_real[jj] * ascale * \
-                                np.sin((ti.angle_real[jj]) * np.pi / 180 + adir)
-                            tyr = ti.mag_real[jj] * ascale * \
-                                np.cos((ti.angle_real[jj]) * np.pi / 180 + adir)
-
-                            lpax.arrow(plotx,
-                                       ploty,
-                                       txr,
-                                       tyr,
-                                       width=self.arrow_lw,
-                                       facecolor=self.arrow_color_real,
-                                       edgecolor=self.arrow_color_real,
-                                       length_includes_head=False,
-                                       head_width=self.arrow_head_width,
-                                       head_length=self.arrow_head_length)
-                        else:
-                            pass
-
-                    # plot imaginary tipper
-                    if self.plot_tipper == 'yri' or self.plot_tipper == 'yi':
-                        if ti.mag_imag[jj] <= self.arrow_threshold:
-                            txi = ti.mag_imag[jj] * ascale * \
-                                np.sin((ti.angle_imag[jj]) * np.pi / 180 + adir)
-                            tyi = ti.mag_imag[jj] * ascale * \
-                                np.cos((ti.angle_imag[jj]) * np.pi / 180 + adir)
-
-                            lpax.arrow(plotx,
-                                       ploty,
-                                       txi,
-                                       tyi,
-                                       width=self.arrow_lw,
-                                       facecolor=self.arrow_color_imag,
-                                       edgecolor=self.arrow_color_imag,
-                                       length_includes_head=False,
-                                       head_width=self.arrow_head_width,
-                                       head_length=self.arrow_head_length)
-
-                # ------------Plot station name------------------------------
-                try:
-                    lpax.text(plotx,
-                              ploty + self.station_pad,
-                              mt.station[self.station_id[0]:self.station_id[1]],
-                              horizontalalignment='center',
-                              verticalalignment='baseline',
-                              fontdict=self.station_font_dict)
-                except AttributeError:
-                    pass
-
-            # ==> print a message if couldn't find the freq
-            else:
-                _logger.warn('Did not find {0:.5g} Hz for station {1}'.format(self.plot_freq, mt.station))
+        # get the location, phase tensor and tipper of all stations
+        plot_arrays = self._get_plot_arrays()
+        self.plot_xarr = np.where(plot_arrays['found'], plot_arrays['x'], 0.)
+        self.plot_yarr = np.where(plot_arrays['found'], plot_arrays['y'], 0.)
+
+        # ==> add all ellipses to the plot as one collection
+        self.ellipse_collection = _make_collection(EllipseCollection, lpax,
+                                                   np.zeros(len(self.mt_list)),
+                                                   np.zeros(len(self.mt_list)),
+                                                   np.zeros(len(self.mt_list)),
+                                                   units='xy',
+                                                   offsets=np.zeros((len(self.mt_list), 2)),
+                                                   linewidths=self.lw,
+                                                   **self.kwargs)
+        self._set_ellipses(plot_arrays)
+        lpax.add_collection(self.ellipse_collection, autolim=False)
+
+        # -----------Plot Induction Arrows---------------------------
+        self.arrow_collections = {}
+        if self.plot_tipper.find('y') == 0:
+            for key in ['real', 'imag']:
+                self.arrow_collections[key] = \
+                    PolyCollection([],
+                                   facecolors=getattr(self, 'arrow_color_' + key),
+                                   edgecolors=getattr(self, 'arrow_color_' + key))
+                lpax.add_collection(self.arrow_collections[key], autolim=False)
+            self._set_arrows(plot_arrays)
+
+        # ------------Plot station name------------------------------
+        for ii in np.where(plot_arrays['found'])[0]:
+            try:
+                lpax.text(plot_arrays['x'][ii],
+                          plot_arrays['y'][ii] + self.station_pad,
+                          self.mt_list[ii].station[self.station_id[0]:self.station_id[1]],
+                          horizontalalignment='center',
+                          verticalalignment='baseline',
+                          fontdict=self.station_font_dict)
+            except AttributeError:
+                pass
 
         # --> set axes properties depending on map scale------------------------
         if self.mapscale == 'deg':
@@ -995,17 +887,8 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
         plt.setp(lpax.get_xticklabels(), rotation=45)
 
         # --> set title in period or freq
-        if self.tscale == 'period':
-            titlefreq = '{0:.5g} (s)'.format(1. / self.plot_freq)
-        else:
-            titlefreq = '{0:.5g} (Hz)'.format(self.plot_freq)
-
-        if not self.plot_title:
-            lpax.set_title('Phase Tensor Map for ' + titlefreq,
-                           fontsize=self.font_size + 2, fontweight='bold')
-        else:
-            lpax.set_title(self.plot_title + titlefreq,
-                           fontsize=self.font_size + 2, fontweight='bold')
+        lpax.set_title(self._get_title(),
+                       fontsize=self.font_size + 2, fontweight='bold')
 
         # --> plot induction arrow scale bar -----------------------------------
         if self.plot_tipper.find('y') == 0:
@@ -1193,6 +1076,241 @@ class PlotPhaseTensorMaps(mtpl.PlotSettings):
 
         return figfile
 
+    def _get_title(self):
+        """
+        title of the map with the plot frequency in period or freq
+        """
+        if self.tscale == 'period':
+            titlefreq = '{0:.5g} (s)'.format(1. / self.plot_freq)
+        else:
+            titlefreq = '{0:.5g} (Hz)'.format(self.plot_freq)
+
+        if not self.plot_title:
+            return 'Phase Tensor Map for ' + titlefreq
+        return self.plot_title + titlefreq
+
+    def _get_plot_arrays(self):
+        """
+        get the map location, phase tensor and tipper of every station at
+        self.plot_freq.
+
+        :returns: dictionary of arrays with one value per station, stations
+                  without data at the plot frequency have found=False
+        """
+        refpoint = self.plot_reference_point
+        ns = len(self.mt_list)
+        plot_arrays = dict([(key, np.zeros(ns) * np.nan) for key in
+                            ['x', 'y', 'phimin', 'phimax', 'azimuth', 'color',
+                             'mag_real', 'angle_real', 'mag_imag',
+                             'angle_imag']])
+        plot_arrays['found'] = np.zeros(ns, dtype=bool)
+
+        for ii, mt in enumerate(self.mt_list):
+            # if map scale is lat lon set parameters
+            if self.mapscale == 'deg':
+                plotx = mt.lon - refpoint[0]
+                ploty = mt.lat - refpoint[1]
+
+            # if map scale is in meters or km easting and northing
+            elif self.mapscale == 'm' or self.mapscale == 'km':
+                east, north, zone = gis_tools.project_point_ll2utm(mt.lat,
+                                                                   mt.lon)
+
+                # set the first point read in as a refernce other points
+                if ii == 0:
+                    zone1 = zone
+
+                # check to make sure the zone is the same this needs
+                # to be more rigorously done
+                elif zone1 != zone:
+                    print('Zone change at station ' + mt.station)
+                    if zone1[0:2] == zone[0:2]:
+                        pass
+                    elif int(zone1[0:2]) < int(zone[0:2]):
+                        east += 500000
+                    elif self.mapscale == 'm':
+                        east -= -500000
+                    else:
+                        east -= 500000
+
+                plotx = east - refpoint[0]
+                ploty = north - refpoint[1]
+                if self.mapscale == 'km':
+                    plotx /= 1000.
+                    ploty /= 1000.
+            else:
+                raise NameError('mapscale not recognized')
+
+            plot_arrays['x'][ii] = plotx
+            plot_arrays['y'][ii] = ploty
+
+            newZ = None
+            newTipper = None
+            fidx = 0
+            if(self.interpolate):
+                newZ, newTipper = mt.interpolate([self.plot_freq], bounds_error=False)
+            else:
+                fidx = np.argmin(np.fabs(mt.Z.freq - self.plot_freq))
+
+            if(not self.interpolate and
+                    not np.fabs(mt.Z.freq[fidx] - self.plot_freq) < self.ftol):
+                # ==> print a message if couldn't find the freq
+                _logger.warn('Did not find {0:.5g} Hz for station {1}'.format(self.plot_freq, mt.station))
+                continue
+
+            self.jj = fidx
+            jj = fidx
+            plot_arrays['found'][ii] = True
+
+            # get phase tensor, only at the plot frequency
+            if(not self.interpolate):
+                z_err = mt.Z.z_err
+                if z_err is not None:
+                    z_err = z_err[jj:jj + 1]
+                newZ = MTz.Z(z_array=mt.Z.z[jj:jj + 1], z_err_array=z_err,
+                             freq=mt.Z.freq[jj:jj + 1])
+            else:
+                newZ.compute_resistivity_phase()
+            pt = MTpt.PhaseTensor(z_object=newZ)
+
+            plot_arrays['phimin'][ii] = pt.phimin[0]
+            plot_arrays['phimax'][ii] = pt.phimax[0]
+            plot_arrays['azimuth'][ii] = pt.azimuth[0]
+
+            # get the properties to color the ellipses by
+            if self.ellipse_colorby == 'phiminang' or \
+                    self.ellipse_colorby == 'phimin':
+                plot_arrays['color'][ii] = pt.phimin[0]
+
+            elif self.ellipse_colorby == 'phimax':
+                plot_arrays['color'][ii] = pt.phimax[0]
+
+            elif self.ellipse_colorby == 'phidet':
+                plot_arrays['color'][ii] = np.sqrt(abs(pt.det[0])) * (180 / np.pi)
+
+            elif self.ellipse_colorby == 'skew' or \
+                    self.ellipse_colorby == 'skew_seg':
+                plot_arrays['color'][ii] = pt.beta[0]
+
+            elif self.ellipse_colorby == 'normalized_skew' or \
+                    self.ellipse_colorby == 'normalized_skew_seg':
+                plot_arrays['color'][ii] = 2 * pt.beta[0]
+
+            elif self.ellipse_colorby == 'ellipticity':
+                plot_arrays['color'][ii] = pt.ellipticity[0]
+
+            else:
+                raise NameError(self.ellipse_colorby + ' is not supported')
+
+            # get tipper
+            if self.plot_tipper.find('y') == 0:
+                if mt.Tipper.tipper is None:
+                    mt.Tipper.tipper = np.zeros((len(mt.period), 1, 2),
+                                                dtype='complex')
+                if(not self.interpolate):
+                    ti = mt.Tipper
+                else:
+                    ti = newTipper
+
+                plot_arrays['mag_real'][ii] = ti.mag_real[jj]
+                plot_arrays['angle_real'][ii] = ti.angle_real[jj]
+                plot_arrays['mag_imag'][ii] = ti.mag_imag[jj]
+                plot_arrays['angle_imag'][ii] = ti.angle_imag[jj]
+
+        return plot_arrays
+
+    def _set_ellipses(self, plot_arrays):
+        """
+        set the size, angle, location and color of every ellipse in
+        self.ellipse_collection, stations that were not found are not shown
+        """
+        found = plot_arrays['found']
+        widths, heights, angles = get_ellipse_geometry(plot_arrays['phimin'],
+                                                       plot_arrays['phimax'],
+                                                       plot_arrays['azimuth'],
+                                                       self.ellipse_size)
+        widths[~found] = 0
+        heights[~found] = 0
+
+        ckmin = float(self.ellipse_range[0])
+        ckmax = float(self.ellipse_range[1])
+        # get ellipse color
+        if self.ellipse_cmap.find('seg') > 0:
+            ckstep = float(self.ellipse_range[2])
+            bounds = np.arange(ckmin, ckmax + ckstep, ckstep)
+            facecolors = mtcl.get_plot_color(plot_arrays['color'],
+                                             self.ellipse_colorby,
+                                             self.ellipse_cmap,
+                                             ckmin,
+                                             ckmax,
+                                             bounds=bounds)
+        else:
+            facecolors = mtcl.get_plot_color(plot_arrays['color'],
+                                             self.ellipse_colorby,
+                                             self.ellipse_cmap,
+                                             ckmin,
+                                             ckmax)
+        facecolors = np.array(facecolors)
+        facecolors[~found] = 0
+
+        set_ellipse_sizes(self.ellipse_collection, widths, heights, angles)
+        self.ellipse_collection.set_offsets(np.column_stack((plot_arrays['x'],
+                                                             plot_arrays['y'])))
+        self.ellipse_collection.set_facecolor(facecolors)
+
+    def _set_arrows(self, plot_arrays):
+        """
+        set the real and imaginary induction arrows in
+        self.arrow_collections, arrows larger than self.arrow_threshold are
+        not shown
+        """
+        adir = self.arrow_direction * np.pi
+        for key in ['real', 'imag']:
+            if self.plot_tipper not in ['yri', 'y' + key[0]]:
+                continue
+            mag = plot_arrays['mag_' + key]
+            with np.errstate(invalid='ignore'):
+                plot = plot_arrays['found'] & (mag <= self.arrow_threshold)
+            angle = plot_arrays['angle_' + key][plot] * np.pi / 180 + adir
+            verts = get_arrow_verts(plot_arrays['x'][plot],
+                                    plot_arrays['y'][plot],
+                                    mag[plot] * self.arrow_size * np.sin(angle),
+                                    mag[plot] * self.arrow_size * np.cos(angle),
+                                    self.arrow_lw,
+                                    head_width=self.arrow_head_width,
+                                    head_length=self.arrow_head_length)
+            self.arrow_collections[key].set_verts(verts)
+
+    def update_plot_freq(self, plot_freq):
+        """
+        change the frequency of a plotted map.  The ellipses and arrows are
+        kept and only their sizes, directions and colors are updated, which
+        is much faster than calling plot for every frequency of a map
+        series.  Stations that were not found at the first frequency are not
+        labeled.
+
+        Arguments:
+        -----------
+            **plot_freq** : float
+                            frequency to plot in Hz
+
+        :Example: ::
+
+            >>> ptmap = PlotPhaseTensorMaps(fn_list=edi_list, plot_yn='n')
+            >>> ptmap.plot(show=False)
+            >>> for freq in [1, 10, 100]:
+            >>>     ptmap.update_plot_freq(freq)
+            >>>     ptmap.fig.savefig('ptmap_{0:.5g}Hz.png'.format(freq))
+        """
+        self.plot_freq = plot_freq
+        plot_arrays = self._get_plot_arrays()
+        self._set_ellipses(plot_arrays)
+        if self.arrow_collections:
+            self._set_arrows(plot_arrays)
+        self.ax.set_title(self._get_title(),
+                          fontsize=self.font_size + 2, fontweight='bold')
+        self.fig.canvas.draw_idle()
+
     def save_figure(self, save_fn, file_format='pdf',
                     orientation='portrait', fig_dpi=None, close_plot='y'):
         """
@@ -179,6 +179,9 @@ class PlotStrike2D(object):
                                        tipper_object_list=tipper_object_list,
                                        mt_object_list=mt_object_list)
 
+        # geometry of all stations, computed once and reused between plots
+        self._survey_geometry = None
+
         self._rot_z = kwargs.pop('rot_z', 0)
         if isinstance(self._rot_z, float) or isinstance(self._rot_z, int):
             self._rot_z = np.array([self._rot_z] * len(self.mt_list))
@@ -263,6 +266,9 @@ class PlotStrike2D(object):
         for ii, mt in enumerate(self.mt_list):
             mt.rotation_angle = self._rot_z[ii]
 
+        # rotation changes the impedances, need to recompute geometry
+        self._survey_geometry = None
+
     def _get_rot_z(self):
         return self._rot_z
 
@@ -291,6 +297,12 @@ class PlotStrike2D(object):
         nt = 0
         kk = 0
 
+        # estimate dimensionality for all stations at once
+        if self._survey_geometry is None:
+            self._survey_geometry = MTgy.SurveyGeometry(mt_obj_list=self.mt_list)
+        dim_array = self._survey_geometry.dimensionality(
+            skew_threshold=self.skew_threshold)
+
         for dd, mt in enumerate(self.mt_list):
 
             #--> set the period
@@ -301,8 +313,7 @@ class PlotStrike2D(object):
                 nt = len(period)
 
             # estimate where only the 2D sections are
-            dim_2d = MTgy.dimensionality(z_object=mt._Z,
-                                         skew_threshold=self.skew_threshold)
+            dim_2d = dim_array[dd, self._survey_geometry.freq_index[dd]]
             index_2d = np.where(dim_2d == 2)[0]
             #------------get strike from phase tensor strike angle-------------
             pt = mt.pt
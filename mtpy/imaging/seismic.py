@@ -17,16 +17,134 @@ Revision History:
 import os
 import logging, traceback
 
-from collections import defaultdict
 from scipy.interpolate import interp1d
-from scipy.integrate import quad
 from scipy.spatial import cKDTree
 import numpy
 
 try:
     from obspy.io.segy import segy
 except ImportError:
-    print("Could not find Obspy, check installation")
+    segy = None
+    print("Could not find Obspy, only SEG-Y files with fixed-length traces can be read")
+
+# SEG-Y rev 1 file layout: a 3200 byte textual header, a 400 byte binary header,
+# optional 3200 byte extended textual headers and then the traces, each with a
+# 240 byte header. Only the fields used here are parsed; names follow obspy.
+_TEXTUAL_HEADER_SIZE = 3200
+_BINARY_HEADER_SIZE = 400
+_TRACE_HEADER_SIZE = 240
+_BINARY_HEADER_FIELDS = [('sample_interval_in_microseconds', 'u2', 16),
+                         ('number_of_samples_per_data_trace', 'u2', 20),
+                         ('data_sample_format_code', 'i2', 24),
+                         ('number_of_3200_byte_ext_file_header_records_following', 'i2', 304)]
+_TRACE_HEADER_FIELDS = [('trace_sequence_number_within_line', 'i4', 0),
+                        ('ensemble_number', 'i4', 20),
+                        ('scalar_to_be_applied_to_all_coordinates', 'i2', 70),
+                        ('source_coordinate_x', 'i4', 72),
+                        ('source_coordinate_y', 'i4', 76),
+                        ('number_of_samples_in_this_trace', 'u2', 114),
+                        ('sample_interval_in_ms_for_this_trace', 'u2', 116)]
+# data sample format code --> sample type; 1 is 4 byte IBM floating point,
+# which is converted when traces are read
+_SAMPLE_FORMATS = {1: 'u4', 2: 'i4', 3: 'i2', 5: 'f4', 8: 'i1'}
+
+def _header_dtype(fields, itemsize, endian='>'):
+    '''
+    Structured dtype of the given header fields, which are (name, type, offset)
+    '''
+    return numpy.dtype({'names': [name for name, _, _ in fields],
+                        'formats': [endian + fmt for _, fmt, _ in fields],
+                        'offsets': [offset for _, _, offset in fields],
+                        'itemsize': itemsize})
+# end func
+
+def _ibm2ieee(ibm):
+    '''
+    Converts 4 byte IBM floating point numbers, given as unsigned integers,
+    to IEEE single precision floats
+
+    :param ibm: numpy array of unsigned 4 byte integers
+    :return: numpy array of float32
+    '''
+    ibm = numpy.asarray(ibm, dtype=numpy.uint32)
+    sign = numpy.where(ibm >> 31, -1.0, 1.0)
+    exponent = ((ibm >> 24) & 0x7f).astype(numpy.int32) - 64
+    mantissa = (ibm & 0x00ffffff) / float(0x01000000)
+    return (sign * numpy.ldexp(mantissa, 4 * exponent)).astype(numpy.float32)
+# end func
+
+def _readSegyHeaders(segy_fn):
+    '''
+    Reads the binary header of a SEG-Y file and returns the layout of the
+    traces, if all traces have the same length
+
+    :param segy_fn: segy file name
+    :return: (endian, binary header, byte offset of first trace, trace dtype), or
+             None if the traces cannot be memory-mapped
+    '''
+    with open(segy_fn, 'rb') as f:
+        f.seek(_TEXTUAL_HEADER_SIZE)
+        buf = f.read(_BINARY_HEADER_SIZE)
+    if (len(buf) < _BINARY_HEADER_SIZE): return None
+
+    # files are big-endian by standard; check the format code for byte-swapped files
+    for endian in ['>', '<']:
+        bh = numpy.frombuffer(buf, dtype=_header_dtype(_BINARY_HEADER_FIELDS,
+                                                       _BINARY_HEADER_SIZE,
+                                                       endian))[0]
+        if (bh['data_sample_format_code'] in _SAMPLE_FORMATS): break
+    else:
+        return None
+    # end for
+
+    n_ext = bh['number_of_3200_byte_ext_file_header_records_following']
+    ns = bh['number_of_samples_per_data_trace']
+    if (n_ext < 0 or ns == 0): return None
+
+    trace_dtype = numpy.dtype([('header', _header_dtype(_TRACE_HEADER_FIELDS,
+                                                         _TRACE_HEADER_SIZE,
+                                                         endian)),
+                               ('data', endian + _SAMPLE_FORMATS[bh['data_sample_format_code']],
+                                (ns,))])
+    offset = _TEXTUAL_HEADER_SIZE * (1 + n_ext) + _BINARY_HEADER_SIZE
+    if ((os.path.getsize(segy_fn) - offset) % trace_dtype.itemsize != 0): return None
+
+    return endian, bh, offset, trace_dtype
+# end func
+
+def _interpolateRows(xs, ys, x_new, fill_value=numpy.nan):
+    '''
+    Linear interpolation of each row of ys, sampled at the increasing values in
+    the corresponding row of xs, at the increasing values x_new shared by all rows.
+
+    :param xs: numpy array of shape (n, m), or (1, m) if shared by all rows
+    :param ys: numpy array of shape (n, m)
+    :param x_new: numpy array of shape (k)
+    :param fill_value: value of x_new outside of the range of a row
+    :return: numpy array of shape (n, k)
+    '''
+    xs = numpy.broadcast_to(xs, ys.shape)
+    n, m = ys.shape
+    k = len(x_new)
+
+    # number of values of each row that are less than each value of x_new, from a
+    # histogram of where the row values fall between the values of x_new
+    pos = numpy.searchsorted(x_new, xs, side='right')
+    counts = numpy.bincount((numpy.arange(n)[:, None] * (k + 1) + pos).ravel(),
+                            minlength=n * (k + 1)).reshape(n, k + 1)
+    hi = numpy.clip(numpy.cumsum(counts, axis=1)[:, :k], 1, m - 1)
+    lo = hi - 1
+
+    x_lo = numpy.take_along_axis(xs, lo, axis=1)
+    x_hi = numpy.take_along_axis(xs, hi, axis=1)
+    y_lo = numpy.take_along_axis(ys, lo, axis=1)
+    y_hi = numpy.take_along_axis(ys, hi, axis=1)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        vals = (y_hi - y_lo) / (x_hi - x_lo) * (x_new - x_lo) + y_lo
+
+    vals[(x_new < xs[:, :1]) | (x_new > xs[:, -1:])] = fill_value
+    return vals
+# end func
 
 class Segy:
     def __init__(self, segy_fn, pick_every=1):
@@ -34,51 +152,107 @@ class Segy:
         Class for reading 2D segy files. This class assumes that the traces are
         CDP-ordered.
 
+        Trace headers are read once into a structured array and trace samples are
+        memory-mapped, so only the traces that are used are read from disk. Files
+        with traces of different lengths are read through obspy.
+
         :param segy_fn: segy file name
         :param pick_every: by default, every trace is read from the segy file, but
                            pick_every>1 allows skipping traces.
         '''
         self._sfn = segy_fn
-        self._sf = segy._read_segy(self._sfn)
         self._pick_every = pick_every
 
-        # Read traces
-        self._mtraces = []  # trace samples
-        self._xs = []  # x coordinates
-        self._ys = []  # y coordinates
-        self._ns = []  # num samples
-        self._cdps = []  # ensemble number (cdps)
-        self._si = []  # sample interval
-        count = 0
-        for itr, tr in enumerate(self._sf.traces):
-            if (itr % self._pick_every == 0):
-                self._mtraces.append(tr.data)
-                self._xs.append(tr.header.source_coordinate_x)
-                self._ys.append(tr.header.source_coordinate_y)
-                self._ns.append(tr.header.number_of_samples_in_this_trace)
-                self._si.append(tr.header.sample_interval_in_ms_for_this_trace/1e6) # convert from micro seconds to s
-                self._cdps.append(tr.header.ensemble_number)
-                count += 1
-        # end for
+        layout = _readSegyHeaders(self._sfn)
+        if (layout is not None):
+            endian, bh, offset, trace_dtype = layout
+            traces = numpy.memmap(self._sfn, dtype=trace_dtype, mode='r', offset=offset)
+            headers = numpy.array(traces['header'][::self._pick_every])
+            ns = headers['number_of_samples_in_this_trace']
+            if (numpy.any((ns != 0) & (ns != bh['number_of_samples_per_data_trace']))):
+                layout = None
+        # end if
 
-        self._ntraces = len(self._sf.traces)
+        if (layout is not None):
+            self._ntraces = len(traces)
+            self._ibm = (bh['data_sample_format_code'] == 1)
+            self._mtraces = traces['data'][::self._pick_every]  # trace samples
+
+            # zero values in trace headers default to values in the binary header
+            ns[ns == 0] = bh['number_of_samples_per_data_trace']
+            si = headers['sample_interval_in_ms_for_this_trace']
+            si[si == 0] = bh['sample_interval_in_microseconds']
+
+            self._xs = numpy.int_(headers['source_coordinate_x'])  # x coordinates
+            self._ys = numpy.int_(headers['source_coordinate_y'])  # y coordinates
+            self._ns = numpy.int_(ns)  # num samples
+            self._cdps = numpy.int_(headers['ensemble_number'])  # ensemble number (cdps)
+            self._si = si / 1e6  # sample interval, convert from micro seconds to s
+        else:
+            self._readObspy()
+        # end if
 
-        self._ns = numpy.array(self._ns)
-        self._si = numpy.array(self._si)
-        self._xs = numpy.array(self._xs)
-        self._ys = numpy.array(self._ys)
-        self._cdps = numpy.array(self._cdps)
         self._station_space = numpy.sqrt((self._xs[:-1] - self._xs[1:])**2 + (self._ys[:-1] - self._ys[1:])**2)
-        self._dist = numpy.array([numpy.sum(self._station_space[:i]) for i in range(len(self._station_space))]) # compute euclidean distance along profile
+        # compute euclidean distance along profile
+        self._dist = numpy.concatenate(([0.], numpy.cumsum(self._station_space)))
         self._ts = numpy.linspace(0, (numpy.max(self._ns)-1)*numpy.max(self._si),
                                   numpy.max(self._ns))
-        self._mtraces = numpy.array(self._mtraces)
-        self._mt, self._md = numpy.meshgrid(self._ts, self._dist)  # mesh grid of distance and time
-        self._mt, self._mc = numpy.meshgrid(self._ts, self._cdps)  # mesh grid of cdp and time
 
         self._dist -= numpy.min(self._dist)  # distance along profile starts from 0
     # end func
 
+    def _readObspy(self):
+        '''
+        Reads traces through obspy, for files that cannot be memory-mapped
+        '''
+        if (segy is None):
+            raise RuntimeError('Obspy is required to read %s, which has traces '
+                               'of different lengths' % self._sfn)
+
+        self._sf = segy._read_segy(self._sfn)
+        traces = self._sf.traces[::self._pick_every]
+
+        self._ntraces = len(self._sf.traces)
+        self._ibm = False
+        self._mtraces = numpy.array([tr.data for tr in traces])  # trace samples
+        self._xs = numpy.array([tr.header.source_coordinate_x for tr in traces])
+        self._ys = numpy.array([tr.header.source_coordinate_y for tr in traces])
+        self._ns = numpy.array([tr.header.number_of_samples_in_this_trace for tr in traces])
+        self._cdps = numpy.array([tr.header.ensemble_number for tr in traces])
+        # convert from micro seconds to s
+        self._si = numpy.array([tr.header.sample_interval_in_ms_for_this_trace for tr in traces])/1e6
+    # end func
+
+    def _getTraces(self, idx):
+        '''
+        Trace samples as floats
+
+        :param idx: trace index or array of trace indices
+        :return: numpy array of trace samples
+        '''
+        samples = self._mtraces[idx]
+        if (self._ibm): return _ibm2ieee(samples)
+        else: return numpy.asarray(samples, dtype=numpy.float32)
+    # end func
+
+    def _getTraceIndices(self, dists):
+        '''
+        Indices of the closest traces to distances along the profile; of equally
+        close traces the first one is used
+
+        :param dists: numpy array of distances along profile
+        :return: numpy array of trace indices
+        '''
+        dists = numpy.asarray(dists, dtype=float)
+        hi = numpy.clip(numpy.searchsorted(self._dist, dists), 1, len(self._dist) - 1)
+        lo = hi - 1
+        idx = numpy.where(numpy.fabs(self._dist[hi] - dists) < numpy.fabs(dists - self._dist[lo]),
+                          hi, lo)
+
+        # first of repeated distances
+        return numpy.searchsorted(self._dist, self._dist[idx])
+    # end func
+
     def getDistances(self):
         '''
         Distance of each trace from the start of the 2D line
@@ -108,9 +282,9 @@ class Segy:
         if(key not in ['trace', 'x', 'y', 'cdp', 'ts']):
             assert 0, "Invalid key; should be one of ['trace', 'x', 'y', 'cdp', 'ts']"
         if (dist <= numpy.max(self._dist)):
-            idx = numpy.argmin(numpy.fabs(self._dist - dist))
+            idx = self._getTraceIndices(dist)
 
-            if (key == 'trace'): return self._mtraces[idx, :]
+            if (key == 'trace'): return self._getTraces(idx)
             elif (key == 'x'): return self._xs[idx]
             elif (key == 'y'): return self._ys[idx]
             elif (key == 'cdp'): return self._cdps[idx]
@@ -171,49 +345,34 @@ class Segy:
         gdistance = numpy.linspace(0, numpy.max(self._dist), ntraces)
 
         mdepths, mdistances = numpy.meshgrid(gdepth, gdistance)
-        mvals = numpy.zeros(mdepths.shape)
 
-        shiftIdx = None
+        shiftIdx = 0
+        ts = self._ts
         if(time_shift>0):
             time_shift /= 1e3  # convert to seconds
             if (time_shift >= self._ts[-1]):
                 raise RuntimeError
             shiftIdx = numpy.ceil(time_shift / numpy.max(self._si))
             shiftIdx = numpy.int_(shiftIdx)
+            ts = self._ts[shiftIdx:] - time_shift
         # end if
 
-        gx = []
-        gy = []
-        for idist, dist in enumerate(gdistance):
-
-            gx.append(self.getAttribute('x', dist))
-            gy.append(self.getAttribute('y', dist))
-
-            cdp = None
-            if(nn != -1): cdp = self.getAttribute('cdp', dist)
+        # closest trace for each distance
+        idx = self._getTraceIndices(gdistance)
+        amps = self._getTraces(idx)[:, shiftIdx:]
 
-            ts = None
-            amps = None
-            if (time_shift == 0):
-                ts = self._ts
-                amps = self.getAttribute('trace', dist)
-            else:
-                ts = self._ts[shiftIdx:] - time_shift
-                amps = self.getAttribute('trace', dist)[shiftIdx:]
-            # end if
-
-            if(constant_veolocity_model):
-                ds = ts*velocity_model
-            else:
-                ds = velocity_model.getDepth(cdp, ts, nn)
-            # end if
+        # depths of time samples, either shared by all traces or for each trace
+        if(constant_veolocity_model):
+            ds = numpy.atleast_2d(ts*velocity_model)
+        elif(nn == -1):
+            ds = numpy.atleast_2d(velocity_model.getDepth(None, ts))
+        else:
+            ds = velocity_model.getDepths(self._cdps[idx], ts, nn)
+        # end if
 
-            io = interp1d(ds, amps,
-                          bounds_error=False, fill_value=-9999)
-            mvals[idist, :] = io(gdepth)
-        # end for
+        mvals = _interpolateRows(ds, amps, gdepth, fill_value=-9999)
 
-        xy_list = numpy.array([[x, y] for x, y in zip(gx, gy)])
+        xy_list = numpy.column_stack((self._xs[idx], self._ys[idx]))
 
         return mdepths, mdistances, mvals, xy_list
     # end func
@@ -290,73 +449,65 @@ class VelocityModel:
         self._generateDepthModel()
     # end func
 
-    def _getIntervalVelocity(self, cdp, t):
+    def _getIntervalVelocities(self, ts):
         '''
-        function to retrieve velocity within correct inverval
+        function to retrieve velocities within correct intervals for all cdps
 
-        :param cdp: cdp number
-        :param t: time sample
-        :return: returns corresponding interval velocity
+        :param ts: array of time samples
+        :return: interval velocities of shape (ncdp, len(ts)); within each
+                 interval [start, end] of a cdp the velocity of the first
+                 interval that contains a time sample is used, time samples
+                 outside all intervals get the velocity of the first interval
         '''
 
-        idx = numpy.argmax(numpy.logical_and(t >= self._intStarts[cdp], t <= self._intEnds[cdp]))
-        return self._intVels[cdp][idx]
+        ts = numpy.atleast_1d(ts)
+
+        # the number of interval ends that are before each time sample is the
+        # index of the first interval containing that time sample
+        idx = numpy.sum(self._intEnds[:, None, :] < ts[None, :, None], axis=2)
+        idx[idx >= self._nIntervals[:, None]] = 0
+        return numpy.take_along_axis(self._intVels, idx, axis=1)
     # end func
 
     def _generateDepthModel(self):
-        # Generate interval velocities using Dix' formula
-        self._intVels = defaultdict(list)
-        self._intStarts = defaultdict(list)
-        self._intEnds = defaultdict(list)
-
-        for icdp, cdp in enumerate(self._cdps):
-            for i in range(len(self._times[icdp]) - 1):
-                self._intVels[cdp].append(((self._times[icdp][i + 1] * self._vels[icdp][i + 1] ** 2 -
-                                            self._times[icdp][i] * self._vels[icdp][i] ** 2) /
-                                           (self._times[icdp][i + 1] - self._times[icdp][i])) ** 0.5)
-                self._intStarts[cdp].append(self._times[icdp][i])
-                self._intEnds[cdp].append(self._times[icdp][i + 1])
-            # end for
-            self._intVels[cdp] = numpy.array(self._intVels[cdp])
-            self._intStarts[cdp] = numpy.array(self._intStarts[cdp])
-            self._intEnds[cdp] = numpy.array(self._intEnds[cdp])
+        # Pad the stacking velocity profiles into (ncdp, nmax) arrays; padded
+        # entries are nan and never used
+        self._nIntervals = numpy.array([len(ts) - 1 for ts in self._times])
+        nmax = numpy.max(self._nIntervals) + 1
+        times = numpy.full((len(self._cdps), nmax), numpy.nan)
+        vels = numpy.full((len(self._cdps), nmax), numpy.nan)
+        for icdp in range(len(self._cdps)):
+            times[icdp, :len(self._times[icdp])] = self._times[icdp]
+            vels[icdp, :len(self._vels[icdp])] = self._vels[icdp]
         # end for
 
+        # Generate interval velocities using Dix' formula
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            self._intVels = ((times[:, 1:] * vels[:, 1:] ** 2 -
+                              times[:, :-1] * vels[:, :-1] ** 2) /
+                             (times[:, 1:] - times[:, :-1])) ** 0.5
+        self._intStarts = times[:, :-1]
+        self._intEnds = times[:, 1:]
+
         # Generate uniformly spaced time intervals up to the latest time value in the stacking-velocities
         # file; finally add the entry that extends the time-range to 1e6, as done in __init__.
         self._ts = numpy.linspace(self._times[0][0], self._times[0][-2], self._ni-1)
         self._ts = numpy.append(self._ts, self._times[0][-1])
 
-        # Integrate each velocity profile to compute depth profile
-        self._depth_ios = []
-        self._cdp_mean_interval_velocity = []
-        depths = numpy.zeros(self._ts.shape)
-        for icdp, cdp in enumerate(self._cdps):
-            vs = numpy.array([self._getIntervalVelocity(cdp, t) for t in self._ts])
-            self._cdp_mean_interval_velocity.append(numpy.mean(vs))
-
-            io = interp1d(self._ts, vs)
-            for it, t in enumerate(self._ts):
-                # progressively build up the depth-profile
-                if (it == 0):
-                    depths[it] = quad(io, 0, t)[0]
-                else:
-                    depths[it] = depths[it - 1] + quad(io, self._ts[it - 1], t)[0]
-            # end for
-            depths /= 2.0 # two-way-traveltime
-            self._depth_ios.append(interp1d(self._ts, depths))
-        # end for
-        self._cdp_mean_interval_velocity = numpy.array(self._cdp_mean_interval_velocity)
+        # Integrate each velocity profile to compute depth profiles, of shape
+        # (ncdp, nt), with a cumulative trapezoid, which is exact for the
+        # piecewise linear velocity profiles. Velocities are constant above
+        # the first time sample.
+        vs = self._getIntervalVelocities(self._ts)
+        self._cdp_mean_interval_velocity = numpy.mean(vs, axis=1)
 
-        # Compute mean depth profile
-        self._mean_depth_profile = numpy.zeros(self._ts.shape)
-        for icdp, cdp in enumerate(self._cdps):
-            io = self._depth_ios[icdp]
+        depths = numpy.zeros(vs.shape)
+        depths[:, 0] = self._ts[0] * vs[:, 0]
+        depths[:, 1:] = 0.5 * (vs[:, 1:] + vs[:, :-1]) * numpy.diff(self._ts)
+        self._depths = numpy.cumsum(depths, axis=1) / 2.0  # two-way-traveltime
 
-            for it, t in enumerate(self._ts):
-                self._mean_depth_profile[it] += io(t)
-        # end for
-        self._mean_depth_profile /= float(len(self._cdps))
+        # Compute mean depth profile
+        self._mean_depth_profile = numpy.mean(self._depths, axis=0)
         self._mean_depth_profile_io = interp1d(self._ts,
                                                self._mean_depth_profile)
     # end func
@@ -370,19 +521,44 @@ class VelocityModel:
             values; must be >= 1
 
         '''
-        if (cdp == None):
+        if (cdp is None):
             return self._mean_depth_profile_io(ts)
         else:
-            _, idx = self._cdp_tree.query([cdp], nn)
-            ds = numpy.zeros(ts.shape)
-
-            if (type(idx) == int): idx = [idx]
-            for inn in range(nn):
-                io = self._depth_ios[idx[inn]]
-                ds += io(ts)
-            return ds / float(nn)
+            return self.getDepths([cdp], ts, nn)[0]
         # end if
     # end func
+
+    def getDepths(self, cdps, ts, nn=1):
+        '''
+        Depths for many cdp/time pairs in one vectorized interpolation.
+
+        cdps: array of cdp numbers of shape (n)
+        ts: time samples in seconds, either of shape (nt), used for all cdps,
+            or of shape (n, nt)
+        nn: number of closest cdp depth-profiles to be used for calculating depth
+            values; must be >= 1
+        :return: depths of shape (n, nt)
+        '''
+        cdps = numpy.atleast_1d(cdps)
+        ts = numpy.broadcast_to(numpy.asarray(ts, dtype=float),
+                                (len(cdps),) + numpy.shape(ts)[-1:])
+
+        if (numpy.any(ts < self._ts[0]) or numpy.any(ts > self._ts[-1])):
+            raise ValueError('Time samples must be within [%f, %f] s' %
+                             (self._ts[0], self._ts[-1]))
+
+        # mean depth-profile of the nn closest cdps
+        _, idx = self._cdp_tree.query(numpy.expand_dims(cdps, 1), nn)
+        idx = numpy.reshape(idx, (len(cdps), nn))
+        profiles = numpy.mean(self._depths[idx], axis=1)
+
+        # linear interpolation on the time samples shared by all profiles
+        it = numpy.clip(numpy.searchsorted(self._ts, ts) - 1, 0, len(self._ts) - 2)
+        w = (ts - self._ts[it]) / (self._ts[it + 1] - self._ts[it])
+        d0 = numpy.take_along_axis(profiles, it, axis=1)
+        d1 = numpy.take_along_axis(profiles, it + 1, axis=1)
+        return d0 + w * (d1 - d0)
+    # end func
 # end class
 
 def main():
@@ -2,12 +2,12 @@ from .exception import ModEMError, DataError
 from .station import Stations
 from .data import Data
 from .model import Model
-from .residual import Residual
+from .residual import Residual, ResidualIterations
 from .control_inv import ControlInv
 from .control_fwd import ControlFwd
 from .convariance import Covariance
 from .config import ModEMConfig
-from .model_manipulator import ModelManipulator
+from .model_manipulator import ModelManipulator, ModelEditHistory
 from .plot_response import PlotResponse
 # from .plot_pt_maps import PlotPTMaps
 # from .plot_depth_slice import PlotDepthSlice
@@ -19,7 +19,9 @@ from .phase_tensor_maps import PlotPTMaps
 
 __all__ = [
             'ModEMError', 'DataError', 'Stations', 'Data', 'Model', 'Residual',
+           'ResidualIterations',
            'ControlInv', 'ControlFwd', 'Covariance', 'ModEMConfig', 'ModelManipulator',
+           'ModelEditHistory',
            'PlotResponse',  'PlotSlices', 'PlotRMSMaps'
            # ,'PlotPTMaps', 'PlotDepthSlice'
            ]
@@ -23,7 +23,62 @@ except ImportError:
     print ('If you want to write a vtk file for 3d viewing, you need download '
            'and install evtk from https://bitbucket.org/pauloh/pyevtk')
 
-__all__ = ['Covariance']
+__all__ = ['Covariance', 'encode_mask_rle', 'decode_mask_rle']
+
+
+def encode_mask_rle(mask_arr):
+    """
+    run length encode a mask array, the array is flattened in C order.
+
+    Masks are mostly long runs of the same value (air, ocean, earth) so this
+    is a compact way to keep or compare many of them.
+
+    :param mask_arr: mask array of any shape
+    :return: (values, run_lengths) arrays
+    """
+    flat = np.asarray(mask_arr).ravel()
+    if flat.size == 0:
+        return flat.copy(), np.zeros(0, dtype=int)
+
+    starts = np.append(0, np.nonzero(flat[1:] != flat[:-1])[0] + 1)
+    run_lengths = np.diff(np.append(starts, flat.size))
+
+    return flat[starts], run_lengths
+
+
+def decode_mask_rle(values, run_lengths, shape):
+    """
+    expand a run length encoded mask back into an array of the given shape.
+
+    :param values: value of each run
+    :param run_lengths: length of each run
+    :param shape: shape of the decoded array
+    :return: mask array
+    """
+    return np.repeat(values, run_lengths).reshape(shape)
+
+
+def _format_mask_rows(mask_arr):
+    """
+    format a (rows, columns) block of mask values as lines of '{0:^3.0f}'
+    fields.
+
+    Each distinct value is formatted once and the rows are assembled from
+    that lookup table, which gives the same text as formatting every cell.
+    """
+    unique_values, inverse = np.unique(mask_arr, return_inverse=True)
+    cells = ['{0:^3.0f}'.format(value) for value in unique_values]
+    n_rows, n_columns = mask_arr.shape
+
+    if len(set(len(cell) for cell in cells)) == 1:
+        width = len(cells[0]) * n_columns
+        table = np.array(cells, dtype='U')
+        rows = table[inverse].reshape(n_rows, n_columns)
+        return [row + '\n' for row in
+                np.ascontiguousarray(rows).view('U{0}'.format(width)).ravel()]
+
+    cells = np.array(cells, dtype=object)[inverse].reshape(n_rows, n_columns)
+    return [''.join(row) + '\n' for row in cells]
 
 
 class Covariance(object):
@@ -157,14 +212,10 @@ class Covariance(object):
                                      self.grid_dimensions[2]))
 
         # need to flip north and south.
-        write_mask_arr = self.mask_arr[::-1, :, :].copy()
+        write_mask_arr = self.mask_arr[::-1, :, :]
         for zz in range(self.mask_arr.shape[2]):
             clines.append(' {0:<8.0f}{0:<8.0f}\n'.format(zz + 1))
-            for nn in range(self.mask_arr.shape[0]):
-                cline = ''
-                for ee in range(self.mask_arr.shape[1]):
-                    cline += '{0:^3.0f}'.format(write_mask_arr[nn, ee, zz])
-                clines.append(cline + '\n')
+            clines.extend(_format_mask_rows(write_mask_arr[:, :, zz]))
 
         with open(self.cov_fn, 'w') as cfid:
             cfid.writelines(clines)
@@ -190,9 +241,8 @@ class Covariance(object):
         num_find = False
         east_find = False
         north_find = False
-        count = 0
 
-        for line in lines:
+        for ll, line in enumerate(lines):
             if line.find('+') >= 0 or line.find('|') >= 0:
                 continue
             else:
@@ -213,21 +263,56 @@ class Covariance(object):
                     self.smoothing_east = np.zeros(ny)
                     self.smoothing_north = np.zeros(nx)
                 elif len(line_list) == 2:
-                    # starts at 1 but python starts at 0
-                    index_00, index_01 = [int(ii) - 1 for ii in line_list]
-                    count = 0
+                    # the rest of the file is blocks of masks
+                    break
                 elif line_list[0].find('.') >= 0 and north_find == False:
                     self.smoothing_north = np.array(line_list, dtype=np.float)
                     north_find = True
                 elif line_list[0].find('.') >= 0 and north_find == True:
                     self.smoothing_east = np.array(line_list, dtype=np.float)
                     east_find = True
-                elif north_find and east_find:
-                    line_list = np.array(line_list, dtype=np.int)
-                    line_list = line_list.reshape((ny, 1))
+        else:
+            return
+
+        # each block is a line of layer indices followed by nx rows of ny
+        # masks, which is read in one go straight into the mask array.
+        # the file is written south to north so flip it back.
+        mask_lines = [line for line in lines[ll:] if line.strip()]
+        block_len = nx + 1
+        for bb in range(0, len(mask_lines) - nx, block_len):
+            # starts at 1 but python starts at 0
+            index_00, index_01 = [int(ii) - 1 for ii in mask_lines[bb].split()]
+            block = np.fromstring(''.join(mask_lines[bb + 1:bb + block_len]),
+                                  dtype=np.int, sep=' ')
+            self.mask_arr[::-1, :, index_00:index_01 + 1] = \
+                block.reshape((nx, ny, 1))
+
+    def get_mask_rle(self):
+        """
+        get the mask array run length encoded, see encode_mask_rle
+
+        :return: (values, run_lengths)
+        """
+        if self.mask_arr is None:
+            raise CovarianceError('mask_arr is None, nothing to encode')
+
+        return encode_mask_rle(self.mask_arr)
+
+    def set_mask_rle(self, values, run_lengths, grid_dimensions=None):
+        """
+        set the mask array from a run length encoding, see decode_mask_rle
+
+        :param values: value of each run
+        :param run_lengths: length of each run
+        :param grid_dimensions: (Nx, Ny, Nz), *default* is grid_dimensions
+        """
+        if grid_dimensions is not None:
+            self.grid_dimensions = tuple(grid_dimensions)
+        if self.grid_dimensions is None:
+            raise CovarianceError('Grid dimensions are None, input as (Nx, Ny, Nz)')
 
-                    self.mask_arr[count, :, index_00:index_01 + 1] = line_list
-                    count += 1
+        self.mask_arr = decode_mask_rle(values, run_lengths,
+                                        self.grid_dimensions)
 
     def get_parameters(self):
 
@@ -18,6 +18,7 @@ import numpy as np
 from logging import INFO as My_Log_Level  # this module's log level
 
 import mtpy.analysis.pt as pt
+from mtpy.core import edi as mtedi
 from mtpy.core import mt as mt
 from mtpy.core import z as mtz
 from mtpy.modeling import ws3dinv as ws
@@ -28,6 +29,7 @@ from mtpy.utils.mtpylog import MtPyLog
 from mtpy.modeling.modem.exception import ModEMError, DataError
 from mtpy.modeling.modem.station import Stations
 from mtpy.modeling.modem.model import Model
+from mtpy.modeling.survey_cube import SurveyCube
 
 try:
     from pyevtk.hl import pointsToVTK
@@ -96,6 +98,8 @@ class Data(object):
                                        (num_freq, 1, 2)
                                * tipperr --> Tipper array with shape
                                        (num_freq, 1, 2)
+    data_cube              mtpy.modeling.survey_cube.SurveyCube of mt_dict,
+                           reused by fill_data_array
     data_fn                full path to data file
     data_period_list       period list from all the data
     edi_list               list of full paths to edi files
@@ -309,6 +313,7 @@ class Data(object):
 
         self.data_array = None
         self.mt_dict = None
+        self.data_cube = None
         self.model_utm_zone = None
         self.model_epsg = None
 
@@ -559,7 +564,9 @@ class Data(object):
             mt_obj.Z.rotate(angle_to_rotate)
             mt_obj.Tipper.rotate(angle_to_rotate)
 
-
+        # the interpolated data are out of date
+        if self.data_cube is not None:
+            self.data_cube.reset_cache()
 
         self._logger.info('Data rotated to align with {0:.1f} deg clockwise from N'.format(
             self._rotation_angle))
@@ -702,69 +709,52 @@ class Data(object):
                                       "- not yet implemented")
                     pass
 
-            # interpolate each station onto the period list
-            # check bounds of period list
-            interp_periods = self.period_list[np.where(
-                (self.period_list >= 1. / mt_obj.Z.freq.max()) &
-                (self.period_list <= 1. / mt_obj.Z.freq.min()))]
-
-            # if specified, apply a buffer so that interpolation doesn't
-            # stretch too far over periods
-            if type(self.period_buffer) in [float, int]:
-                interp_periods_new = []
-                dperiods = 1. / mt_obj.Z.freq
-                for iperiod in interp_periods:
-                    # find nearest data period
-                    difference = np.abs(iperiod - dperiods)
-                    nearestdperiod = dperiods[difference == np.amin(difference)][0]
-                    if max(nearestdperiod / iperiod, iperiod / nearestdperiod) < self.period_buffer:
-                        interp_periods_new.append(iperiod)
-
-                interp_periods = np.array(interp_periods_new)
-
-            # FZ: sort in order
-            interp_periods = np.sort(interp_periods)
-            self._logger.debug("station_name and its original period: %s %s %s",
-                               mt_obj.station, len(mt_obj.Z.freq), 1.0 / mt_obj.Z.freq)
-            self._logger.debug("station_name and interpolation period: %s %s %s",
-                               mt_obj.station, len(interp_periods), interp_periods)
-
-            # default: use_original_freq = True, each MT station edi file will use it's own frequency-filtered.
-            # no new freq in the output modem.dat file. select those freq of mt_obj according to interp_periods
-            if use_original_freq:
-                interp_periods = self.filter_periods(mt_obj, interp_periods)
-                self._logger.debug("station_name and selected/filtered periods: %s, %s, %s", mt_obj.station,
-                                   len(interp_periods), interp_periods)
-                # in this case the below interpolate_impedance_tensor function will degenerate into a same-freq set.
-                
-            if len(interp_periods) > 0:  # not empty
-                interp_z, interp_t = mt_obj.interpolate(1. / interp_periods, period_buffer=self.period_buffer ,bounds_error=False)  #)
+        # interpolate all stations onto the period list in one go
+        mt_obj_list = [self.mt_dict[s_key] for s_key in sorted(self.mt_dict.keys())]
+        if self.data_cube is None or \
+                len(self.data_cube.mt_obj_list) != len(mt_obj_list) or \
+                any([c_obj is not mt_obj for c_obj, mt_obj in
+                     zip(self.data_cube.mt_obj_list, mt_obj_list)]):
+            self.data_cube = SurveyCube(mt_obj_list)
+
+        period_buffer = None
+        if type(self.period_buffer) in [float, int]:
+            period_buffer = self.period_buffer
+        interp_mask = self._get_interp_mask(mt_obj_list, use_original_freq)
+        z, z_err, tip, tip_err = self.data_cube.interpolate(
+            1. / self.period_list, period_buffer=period_buffer,
+            freq_mask=interp_mask)
+        self.data_array['z'] = z
+        self.data_array['z_err'] = z_err
+        self.data_array['tip'] = tip
+        self.data_array['tip_err'] = tip_err
+
+        # FZ: try to output a new edi files. Compare with original edi?
+        if new_edi_dir is not None and os.path.isdir(new_edi_dir):
+            edi_obj_list = []
+            edi_fn_list = []
+            for ii, mt_obj in enumerate(mt_obj_list):
+                p_index = np.where(interp_mask[ii])[0]
+                if len(p_index) == 0:
+                    continue
+                p_index = p_index[np.argsort(self.period_list[p_index])]
+                interp_z = mtz.Z(z_array=z[ii, p_index],
+                                 z_err_array=z_err[ii, p_index],
+                                 freq=1. / self.period_list[p_index])
+                interp_t = mtz.Tipper(tipper_array=tip[ii, p_index],
+                                      tipper_err_array=tip_err[ii, p_index],
+                                      freq=1. / self.period_list[p_index])
                 # set rotation angle
-                interp_z.rotation_angle = self.rotation_angle*np.ones(len(interp_z.z))
-                interp_t.rotation_angle = self.rotation_angle*np.ones(len(interp_t.tipper))
-                #                interp_z, interp_t = mt_obj.interpolate(1./interp_periods)
-                for kk, ff in enumerate(interp_periods):
-                    jj = np.where(self.period_list == ff)[0][0]
-                    self.data_array[ii]['z'][jj] = interp_z.z[kk, :, :]
-                    self.data_array[ii]['z_err'][jj] = interp_z.z_err[kk, :, :]
-
-                    if mt_obj.Tipper.tipper is not None:
-                        self.data_array[ii]['tip'][jj] = interp_t.tipper[kk, :, :]
-                        self.data_array[ii]['tip_err'][jj] = \
-                            interp_t.tipper_err[kk, :, :]
-
-                # FZ: try to output a new edi files. Compare with original edi?
-                if new_edi_dir is not None and os.path.isdir(new_edi_dir):
-                    # new_edifile = os.path.join(new_edi_dir, mt_obj.station + '.edi')
-                    mt_obj.write_mt_file(
-                        save_dir=new_edi_dir,
-                        fn_basename=mt_obj.station,
-                        file_type='edi',
-                        new_Z_obj=interp_z,
-                        new_Tipper_obj=interp_t,
-                        longitude_format=longitude_format)
-            else:
-                pass
+                interp_z.rotation_angle = self.rotation_angle * np.ones(len(p_index))
+                interp_t.rotation_angle = self.rotation_angle * np.ones(len(p_index))
+                edi_obj_list.append(mt_obj._make_edi_object(
+                    new_Z=interp_z, new_Tipper=interp_t))
+                edi_fn_list.append(os.path.join(
+                    new_edi_dir, '{0}.edi'.format(mt_obj.station)))
+
+            # write all the stations at once
+            mtedi.write_edi_files(edi_obj_list, edi_fn_list,
+                                  longitude_format=longitude_format)
 
         # BM: If we can't get relative locations from MT object, 
         #  then get them from Station object
@@ -773,6 +763,42 @@ class Data(object):
 
         return
 
+    def _get_interp_mask(self, mt_obj_list, use_original_freq=False):
+        """
+        find which periods of the period list can be interpolated for each
+        station
+
+        :returns: boolean array (num_stations, num_periods)
+        """
+        interp_mask = np.zeros((len(mt_obj_list), len(self.period_list)),
+                               dtype=bool)
+        for ii, mt_obj in enumerate(mt_obj_list):
+            dperiods = 1. / mt_obj.Z.freq
+            # check bounds of period list
+            mask = (self.period_list >= dperiods.min()) & \
+                   (self.period_list <= dperiods.max())
+
+            # if specified, apply a buffer so that interpolation doesn't
+            # stretch too far over periods
+            if type(self.period_buffer) in [float, int]:
+                difference = np.abs(self.period_list[:, np.newaxis] - dperiods)
+                nearestdperiod = dperiods[np.argmin(difference, axis=1)]
+                mask &= np.maximum(nearestdperiod / self.period_list,
+                                   self.period_list / nearestdperiod) < \
+                    self.period_buffer
+
+            # each station keeps its own frequencies, no new freq in the
+            # output modem.dat file
+            if use_original_freq:
+                mask &= np.isclose(dperiods, self.period_list[:, np.newaxis],
+                                   1.e-8).any(axis=1)
+
+            self._logger.debug("station_name and interpolation period: %s %s %s",
+                               mt_obj.station, mask.sum(), self.period_list[mask])
+            interp_mask[ii] = mask
+
+        return interp_mask
+
     @staticmethod
     def filter_periods(mt_obj, per_array):
         """Select the periods of the mt_obj that are in per_array.
@@ -1472,7 +1472,8 @@ class Model(object):
         return parameter_dict
 
 
-    def write_gocad_sgrid_file(self, fn=None, origin=[0, 0, 0], clip=0, no_data_value=-99999):
+    def write_gocad_sgrid_file(self, fn=None, origin=[0, 0, 0], clip=0, no_data_value=-99999,
+                               binary=False):
         """
         write a model to gocad sgrid
 
@@ -1484,6 +1485,8 @@ class Model(object):
         clip = how much padding to clip off the edge of the model for export,
                provide one integer value or list of 3 integers for x,y,z directions
         no_data_value = no data value to put in sgrid
+        binary = if True write big-endian binary points and property files
+                 rather than an ascii data file
 
         """
         if not np.iterable(clip):
@@ -1541,7 +1544,8 @@ class Model(object):
                   clip[0]:nxin - clip[0] - 1, :nzin - clip[2] - 1]
 
         sgObj = mtgocad.Sgrid(resistivity=resvals, grid_xyz=gridedges,
-                              fn=sg_basename, workdir=self.save_path)
+                              fn=sg_basename, workdir=self.save_path,
+                              binary=binary)
         sgObj.write_sgrid_file()
 
 
@@ -19,7 +19,81 @@ from mtpy.imaging import mtplottools as mtplottools
 from .data import Data
 from .model import Model
 
-__all__ = ['ModelManipulator']
+__all__ = ['ModelManipulator', 'ModelEditHistory']
+
+
+class ModelEditHistory(object):
+    """
+    Bounded undo stack for edits of a resistivity model.
+
+    Each edit only keeps the index of the block that was changed and the
+    values that block had before, so undoing a rectangle or a copied layer
+    does not need a copy of the whole model.  The oldest edits are dropped
+    once there are more than max_edits or the saved values take more than
+    max_bytes, the last edit is always kept.
+
+    :Example: ::
+
+        >>> history = ModelEditHistory()
+        >>> index = np.ix_([4, 5], [10, 11, 12], [3])
+        >>> history.set(res_model, index, 100.)
+        >>> history.undo(res_model)
+
+    """
+
+    def __init__(self, max_edits=100, max_bytes=2 ** 28):
+        self.max_edits = max_edits
+        self.max_bytes = max_bytes
+
+        self._edits = []
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self._edits)
+
+    def save(self, res_model, index):
+        """
+        save the values of res_model[index] before they are changed in
+        place
+        """
+        old_values = np.array(res_model[index], copy=True)
+        self._edits.append((index, old_values))
+        self._nbytes += old_values.nbytes
+
+        while len(self._edits) > 1 and \
+                (len(self._edits) > self.max_edits or
+                 self._nbytes > self.max_bytes):
+            self._nbytes -= self._edits.pop(0)[1].nbytes
+
+    def set(self, res_model, index, values):
+        """
+        set res_model[index] = values and save the old values
+        """
+        self.save(res_model, index)
+        res_model[index] = values
+
+    def undo(self, res_model):
+        """
+        put back the values of the last edit
+
+        :returns: index of the block that was reset, None if there is
+                  nothing to undo
+        """
+        if len(self._edits) == 0:
+            return None
+
+        index, old_values = self._edits.pop()
+        self._nbytes -= old_values.nbytes
+        res_model[index] = old_values
+
+        return index
+
+    def clear(self):
+        """
+        remove all saved edits
+        """
+        self._edits = []
+        self._nbytes = 0
 
 
 class ModelManipulator(Model):
@@ -88,7 +162,8 @@ class ModelManipulator(Model):
     radio_res           matplotlib.widget.radio instance for change resistivity
     rect_selector       matplotlib.widget.rect_selector
     res                 np.ndarray(nx, ny, nz) for model in linear resistivity
-    res_copy            copy of res for undo
+    res_copy            copy of res as read in
+    res_history         ModelEditHistory of the edits for undo
     res_dict            dictionary of segmented resistivity values
     res_list            list of resistivity values for model linear scale
     res_model           np.ndarray(nx, ny, nz) of resistivity values from
@@ -160,6 +235,7 @@ class ModelManipulator(Model):
         # set initial resistivity value
         self.res_value = self.res_list[0]
         self.cov_arr = None
+        self.res_history = ModelEditHistory()
 
         # --> set map limits
         self.xlimits = kwargs.pop('xlimits', None)
@@ -230,6 +306,7 @@ class ModelManipulator(Model):
 
         # make a copy of original in case there are unwanted changes
         self.res_copy = self.res_model.copy()
+        self.res_history.clear()
 
     # ---plot model-------------------------------------------------------------
     def plot(self):
@@ -457,6 +534,21 @@ class ModelManipulator(Model):
         # be sure to redraw the canvas
         self.fig.canvas.draw()
 
+    def update_plot(self):
+        """
+        put the current depth slice into the existing mesh, this is much
+        faster than redraw_plot for large models
+        """
+        plot_res = np.log10(self.res_model[:, :, self.depth_index].T)
+        self.mesh_plot.set_array(plot_res.ravel())
+
+        depth_title = self.grid_z[self.depth_index] / self.dscale
+        self.ax1.set_title('Depth = {:.3f} '.format(depth_title) + \
+                           '(' + self.map_scale + ')',
+                           fontdict=self.fdict)
+
+        self.fig.canvas.draw_idle()
+
     #    def set_res_value(self, label):
     #        self.res_value = float(label)
     #        print 'set resistivity to ', label
@@ -484,7 +576,7 @@ class ModelManipulator(Model):
             print('Plotting Depth {0:.3f}'.format(self.grid_z[self.depth_index] / \
                                                   self.dscale) + '(' + self.map_scale + ')')
 
-            self.redraw_plot()
+            self.update_plot()
         # go up a layer on push of - key
         elif self.event_change_depth.key == '-':
             self.depth_index -= 1
@@ -495,7 +587,7 @@ class ModelManipulator(Model):
             print('Plotting Depth {0:.3f} '.format(self.grid_z[self.depth_index] / \
                                                    self.dscale) + '(' + self.map_scale + ')')
 
-            self.redraw_plot()
+            self.update_plot()
 
         # exit plot on press of q
         elif self.event_change_depth.key == 'q':
@@ -509,49 +601,45 @@ class ModelManipulator(Model):
                 if self.depth_index == 0:
                     print('No layers above')
                 else:
-                    self.res_model[:, :, self.depth_index] = \
-                        self.res_model[:, :, self.depth_index - 1]
+                    self.res_history.set(self.res_model,
+                                         (slice(None), slice(None),
+                                          self.depth_index),
+                                         self.res_model[:, :, self.depth_index - 1])
             except IndexError:
                 print('No layers above')
 
-            self.redraw_plot()
+            self.update_plot()
 
         # copy the layer below
         elif self.event_change_depth.key == 'b':
-            try:
-                self.res_model[:, :, self.depth_index] = \
-                    self.res_model[:, :, self.depth_index + 1]
-            except IndexError:
+            if self.depth_index + 1 < self.res_model.shape[2]:
+                self.res_history.set(self.res_model,
+                                     (slice(None), slice(None),
+                                      self.depth_index),
+                                     self.res_model[:, :, self.depth_index + 1])
+            else:
                 print('No more layers below')
 
-            self.redraw_plot()
+            self.update_plot()
 
-            # undo
+            # undo the last edit
         elif self.event_change_depth.key == 'u':
-            if type(self.xchange) is int and type(self.ychange) is int:
-                self.res_model[self.ychange, self.xchange, self.depth_index] = \
-                    self.res_copy[self.ychange, self.xchange, self.depth_index]
-            else:
-                for xx in self.xchange:
-                    for yy in self.ychange:
-                        self.res_model[yy, xx, self.depth_index] = \
-                            self.res_copy[yy, xx, self.depth_index]
+            if self.res_history.undo(self.res_model) is None:
+                print('Nothing to undo')
 
-            self.redraw_plot()
+            self.update_plot()
 
     def change_model_res(self, xchange, ychange):
         """
         change resistivity values of resistivity model
 
         """
-        if type(xchange) is int and type(ychange) is int:
-            self.res_model[ychange, xchange, self.depth_index] = self.res_value
-        else:
-            for xx in xchange:
-                for yy in ychange:
-                    self.res_model[yy, xx, self.depth_index] = self.res_value
+        index = np.ix_(np.atleast_1d(ychange),
+                       np.atleast_1d(xchange),
+                       [self.depth_index])
+        self.res_history.set(self.res_model, index, self.res_value)
 
-        self.redraw_plot()
+        self.update_plot()
 
     def rect_onselect(self, eclick, erelease):
         """
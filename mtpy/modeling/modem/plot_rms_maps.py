@@ -242,7 +242,8 @@ class PlotRMSMaps(object):
         jj = plot_dict['index'][1]
 
         rms = np.zeros(self.residual.residual_array.shape[0])
-        self.residual.get_rms()
+        if self.residual.rms_array is None or self.residual.rms is None:
+            self.residual.get_rms()
 
         if plot_dict['label'].startswith('$Z'):
             if self.period_index == 'all':
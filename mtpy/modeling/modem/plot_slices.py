@@ -22,7 +22,7 @@ from mtpy.modeling.modem.data import Model
 from mtpy.utils import exceptions as mtex,basemap_tools
 from mtpy.utils.gis_tools import get_epsg,epsg_project
 from mtpy.utils.calculator import nearest_index
-from mtpy.utils.mesh_tools import rotate_mesh
+from mtpy.utils.mesh_tools import rotate_mesh, order_profile_points
 
 from mtpy.imaging.seismic import Segy, VelocityModel
 
@@ -315,36 +315,6 @@ class PlotSlices(object):
                     gv : list of interpolated values of shape (np)
         """
 
-        def distance(P1, P2):
-            """
-            Compute Euclidean distance
-            """
-
-            return ((P1[0] - P2[0])**2 + (P1[1] - P2[1])**2) ** 0.5
-        # end func
-
-        def optimized_path(coords, start=None):
-            """
-            This function was adopted verbatim from the following link:
-
-            https://stackoverflow.com/questions/45829155/sort-points-in-order-to-have-a-continuous-curve-using-python
-
-            Order coordinates such that a continuous line can be formed.
-            coords: a list containing coordnates = [ [x1, y1], [x2, y2] , ...]
-
-            """
-            if start is None:
-                start = coords[0]
-            pass_by = coords
-            path = [start]
-            pass_by.remove(start)
-            while pass_by:
-                nearest = min(pass_by, key=lambda x: distance(path[-1], x))
-                path.append(nearest)
-                pass_by.remove(nearest)
-            return path
-        # end func
-
         assert option in ['STA', 'XY', 'XYZ'], 'Invalid option; Aborting..'
         if(option == 'STA'):
             if(self.md_data is None):
@@ -382,10 +352,10 @@ class PlotSlices(object):
                 if(nsteps==-1): nsteps = len(x)
             # end if
 
-            xy = [[a, b] for a, b in zip(x,y)]
-            ordered_xy = np.array(optimized_path(xy))
-            xx = ordered_xy[:, 0]
-            yy = ordered_xy[:, 1]
+            # order points along the profile, starting at the first point
+            order = order_profile_points(x, y, start=0)
+            xx = x[order]
+            yy = y[order]
 
             dx = xx[:-1] - xx[1:]
             dy = yy[:-1] - yy[1:]
@@ -9,14 +9,18 @@ revised by JP 2017
 revised by AK 2017 to bring across functionality from ak branch
 
 """
+import glob
+import multiprocessing
 import os.path as op
+import re
 
 import numpy as np
 from numpy.lib import recfunctions
 
 from .data import Data
+from .exception import DataError
 
-__all__ = ['Residual']
+__all__ = ['Residual', 'ResidualIterations']
 
 
 class Residual(object):
@@ -236,106 +240,82 @@ class Residual(object):
         if self.residual_array is None:
             return
 
-        rms_z_comp = np.zeros((len(self.rms_array), 2, 2))
-        rms_tip_comp = np.zeros((len(self.rms_array), 2))
-        rms_value_list_all = np.zeros(0)
-        rms_value_list_z = np.zeros(0)
-        rms_value_list_tip = np.zeros(0)
-
-
-        for station_name in self.rms_array['station']:
-            rms_value_list = []
-            rms_value_list_ztip = np.zeros((self.residual_array['z'].shape[1],
-                                            6))
-            sta_ind = np.where(self.rms_array['station'] == station_name)[0][0]
-            sta_indd = np.where(self.residual_array['station'] == station_name)[0][0]
-            res_vals = self.residual_array[sta_indd]
-            z_norm, tip_norm = None, None
-            if np.amax(np.abs(res_vals['z'])) > 0:
-                # sum over absolute value of z
-                # need to divide by sqrt(2) to normalise (ModEM data file has one error for real and imag components)
-                z_norm = np.abs(res_vals['z']) / (np.real(res_vals['z_err']) * 2. ** 0.5)
-                rms_value_list_ztip[:,:4] = z_norm.reshape(z_norm.shape[0],4)
-
-                # count number of values for tipper, all
-                count_z = np.count_nonzero(np.nan_to_num(z_norm.reshape(z_norm.shape[0],4)),axis=1).astype(float)
-#                count_z = count_z.reshape(count_z.shape[0],1)
-                
-                # normalized error split by period
-                self.rms_array['rms_z_period'][sta_ind] = (np.sum(z_norm.reshape(z_norm.shape[0],4)**2,axis=1)/count_z)**0.5
-
-                z_norm_nz = z_norm[np.all(np.isfinite(z_norm), axis=(1, 2))]
-
-                # append individual normalised errors to a master list for all stations
-                rms_value_list_all = np.append(rms_value_list_all, z_norm_nz.flatten())
-                rms_value_list_z = np.append(rms_value_list_z, z_norm_nz.flatten())
-
-                # normalised error for separate components
-                rms_z_comp[sta_ind] = (((z_norm_nz ** 2.).sum(axis=0)) / (z_norm_nz.shape[0])) ** 0.5
-                rms_value_list.append(rms_z_comp[sta_ind])
-
-            if np.amax(np.abs(res_vals['tip'])) > 0:
-                # sum over absolute value of tipper
-                # need to divide by sqrt(2) to normalise (code applies same error to real and imag components)
-                tip_norm = np.abs(res_vals['tip']) / (np.real(res_vals['tip_err']) * 2. ** 0.5)
-                rms_value_list_ztip[:,4:] = tip_norm.reshape(tip_norm.shape[0],2)
-
-                # count number of values for tipper, all
-                count_tip = np.count_nonzero(np.nan_to_num(tip_norm.reshape(tip_norm.shape[0],2)),axis=1).astype(float)
-                
-
-                # normalized error split by period
-                self.rms_array['rms_tip_period'][sta_ind] = (np.nansum(tip_norm.reshape(tip_norm.shape[0],2)**2,axis=1)/count_tip)**0.5
-                
-                
-                
-                tip_norm_nz = tip_norm[np.all(np.isfinite(tip_norm), axis=(1, 2))]
-
-                # append individual normalised errors to a master list for all stations
-                rms_value_list_all = np.append(rms_value_list_all, tip_norm_nz.flatten())
-                rms_value_list_tip = np.append(rms_value_list_tip, tip_norm_nz.flatten())
-
-                # normalised error for separate components
-                rms_tip_comp[sta_ind] = (((tip_norm_nz ** 2.).sum(axis=0)) / len(tip_norm_nz)) ** 0.5
-                rms_value_list.append(rms_tip_comp[sta_ind])
-
-
-            # compute overall rms by period
-            count_ztip = np.count_nonzero(np.nan_to_num(rms_value_list_ztip),axis=1).astype(float)
-            self.rms_array['rms_period'][sta_ind] = (np.nansum(rms_value_list_ztip**2,axis=1)/count_ztip)**0.5
-
-            rms_value_list = np.vstack(rms_value_list).flatten()
-
-            rms_value = ((rms_value_list ** 2.).sum() / rms_value_list.size) ** 0.5
-
-            self.rms_array[sta_ind]['rms'] = rms_value
-
-            if z_norm is not None:
-                self.rms_array[sta_ind]['rms_z'] = ((rms_z_comp[sta_ind] ** 2.).sum() / rms_z_comp[sta_ind].size) ** 0.5
-            if tip_norm is not None:
-                self.rms_array[sta_ind]['rms_tip'] = ((rms_tip_comp[sta_ind] ** 2.).sum() / rms_z_comp[
-                    sta_ind].size) ** 0.5
-
-        self.rms = np.mean(rms_value_list_all ** 2.) ** 0.5
-        self.rms_z = np.mean(rms_value_list_z ** 2.) ** 0.5
-        self.rms_tip = np.mean(rms_value_list_tip ** 2.) ** 0.5
-        
-        # by component
-        for cpt in ['z','tip']:
-            # normalised residuals
-            res_vals_cpt = np.abs(self.residual_array[cpt])/\
-                (np.real(self.residual_array[cpt+'_err']) * 2.**0.5)
-            ijvals = res_vals_cpt.shape[2:]
-            for i in range(ijvals[0]):
-                for j in range(ijvals[1]):
-                    self.rms_array['rms_{}_component'.format(cpt)][:,i,j] = \
-                        (np.nansum(res_vals_cpt[:,:,i,j]**2.,axis=1)/\
-                         np.nansum(np.isfinite(res_vals_cpt[:,:,i,j]),axis=1))**0.5
-                    self.rms_array['rms_{}_component_period'.format(cpt)][:,:, i,j] = \
-                        (res_vals_cpt[:,:,i,j]**2/\
-                         np.isfinite(res_vals_cpt[:,:,i,j]))**0.5
-        
-
+        ns, nf = self.residual_array['z'].shape[:2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # normalise by the error, need to divide by sqrt(2) to normalise
+            # (ModEM data file has one error for real and imag components)
+            z_norm = np.abs(self.residual_array['z']) / \
+                (np.real(self.residual_array['z_err']) * 2. ** 0.5)
+            tip_norm = np.abs(self.residual_array['tip']) / \
+                (np.real(self.residual_array['tip_err']) * 2. ** 0.5)
+        z_flat = z_norm.reshape(ns, nf, 4)
+        tip_flat = tip_norm.reshape(ns, nf, 2)
+
+        # stations that have any impedance or tipper residuals
+        has_z = np.abs(self.residual_array['z']).reshape(ns, -1).max(axis=1,
+                                                                     initial=0) > 0
+        has_tip = np.abs(self.residual_array['tip']).reshape(ns, -1).max(axis=1,
+                                                                         initial=0) > 0
+
+        # periods where all components are finite
+        z_finite = np.all(np.isfinite(z_flat), axis=2) & has_z[:, np.newaxis]
+        tip_finite = np.all(np.isfinite(tip_flat), axis=2) & has_tip[:, np.newaxis]
+        z_sq = np.where(z_finite[:, :, np.newaxis, np.newaxis], z_norm, 0.) ** 2
+        tip_sq = np.where(tip_finite[:, :, np.newaxis, np.newaxis], tip_norm, 0.) ** 2
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # normalized error split by period
+            rms_z_period = (np.sum(z_flat ** 2, axis=2) /
+                            np.count_nonzero(np.nan_to_num(z_flat), axis=2)) ** 0.5
+            self.rms_array['rms_z_period'] = np.where(has_z[:, np.newaxis],
+                                                      rms_z_period, 0.)
+            rms_tip_period = (np.nansum(tip_flat ** 2, axis=2) /
+                              np.count_nonzero(np.nan_to_num(tip_flat), axis=2)) ** 0.5
+            self.rms_array['rms_tip_period'] = np.where(has_tip[:, np.newaxis],
+                                                        rms_tip_period, 0.)
+
+            # overall rms by period
+            ztip = np.concatenate(
+                [np.where(has_z[:, np.newaxis, np.newaxis], z_flat, 0.),
+                 np.where(has_tip[:, np.newaxis, np.newaxis], tip_flat, 0.)],
+                axis=2)
+            self.rms_array['rms_period'] = (np.nansum(ztip ** 2, axis=2) /
+                                            np.count_nonzero(np.nan_to_num(ztip),
+                                                             axis=2)) ** 0.5
+
+            # normalised error for separate components
+            rms_z_comp = (z_sq.sum(axis=1) /
+                          z_finite.sum(axis=1)[:, np.newaxis, np.newaxis]) ** 0.5
+            rms_z_comp[~has_z] = 0.
+            rms_tip_comp = (tip_sq.sum(axis=1) /
+                            tip_finite.sum(axis=1)[:, np.newaxis, np.newaxis]) ** 0.5
+            rms_tip_comp[~has_tip] = 0.
+
+            # rms for each station
+            z_comp_sq = (rms_z_comp ** 2.).sum(axis=(1, 2))
+            tip_comp_sq = (rms_tip_comp ** 2.).sum(axis=(1, 2))
+            self.rms_array['rms'] = ((z_comp_sq + tip_comp_sq) /
+                                     (4 * has_z + 2 * has_tip)) ** 0.5
+            self.rms_array['rms_z'] = np.where(has_z, (z_comp_sq / 4.) ** 0.5, 0.)
+            # the tipper rms is normalised by the number of impedance
+            # components as well
+            self.rms_array['rms_tip'] = np.where(has_tip,
+                                                 (tip_comp_sq / 4.) ** 0.5, 0.)
+
+            # rms of all stations
+            n_z = 4. * z_finite.sum()
+            n_tip = 2. * tip_finite.sum()
+            self.rms = ((z_sq.sum() + tip_sq.sum()) / (n_z + n_tip)) ** 0.5
+            self.rms_z = (z_sq.sum() / n_z) ** 0.5
+            self.rms_tip = (tip_sq.sum() / n_tip) ** 0.5
+
+            # by component
+            for cpt, norm in [('z', z_norm), ('tip', tip_norm)]:
+                self.rms_array['rms_{}_component'.format(cpt)] = \
+                    (np.nansum(norm ** 2., axis=1) /
+                     np.sum(np.isfinite(norm), axis=1)) ** 0.5
+                self.rms_array['rms_{}_component_period'.format(cpt)] = \
+                    (norm ** 2 / np.isfinite(norm)) ** 0.5
 
     def write_rms_to_file(self):
         """
@@ -363,3 +343,149 @@ class Residual(object):
         header = ' '.join(header_list)
 
         np.savetxt(fn, save_list, header=header, fmt=['%s', '%.6f', '%.6f', '%.1f', '%.1f', '%.3f', '%.3f', '%.3f'])
+
+
+def _read_response_array(resp_fn):
+    """
+    read the data array of a response file, used by the worker processes
+    of ResidualIterations
+    """
+    resp_obj = Data()
+    resp_obj.read_data_file(resp_fn)
+    return resp_obj.data_array
+
+
+class ResidualIterations(object):
+    """
+    rms values for every iteration of an inversion, computed from the data
+    file and the response file written at each iteration.
+
+    The response files are read in parallel and the rms of each iteration
+    is cached, so calling get_rms again only reads response files that are
+    new or have changed, for instance while the inversion is running.
+
+    ====================== ====================================================
+    Attributes/Key Words   Description
+    ====================== ====================================================
+    data_fn                full path to data file
+    work_dir               directory with the response files
+                           *default* is the directory of data_fn
+    resp_fn_list           list of response files, *default* is all files
+                           matching resp_fn_pattern in work_dir
+    resp_fn_pattern        glob pattern of the response files
+                           *default* is '*_NLCG_*.dat'
+    n_processes            number of processes used to read the response
+                           files, *default* is the number of cpus
+    residual_list          list of Residual objects, one per iteration
+    rms                    np.ndarray(num_iterations) of overall rms
+    rms_z                  np.ndarray(num_iterations) of impedance rms
+    rms_tip                np.ndarray(num_iterations) of tipper rms
+    rms_array              np.ndarray(num_iterations, num_stations) with the
+                           dtype of Residual.rms_array, rms by station,
+                           period and component for every iteration
+    ====================== ====================================================
+
+    :Example: ::
+
+        >>> from mtpy.modeling.modem import ResidualIterations
+        >>> rms_iter = ResidualIterations(r"/home/modem/Inv1/ModEM_Data.dat")
+        >>> rms_iter.get_rms()
+        >>> rms_iter.rms
+    """
+
+    def __init__(self, data_fn, **kwargs):
+        self.data_fn = data_fn
+        self.work_dir = kwargs.pop('work_dir', op.dirname(op.abspath(data_fn)))
+        self.resp_fn_list = kwargs.pop('resp_fn_list', None)
+        self.resp_fn_pattern = kwargs.pop('resp_fn_pattern', '*_NLCG_*.dat')
+        self.n_processes = kwargs.pop('n_processes', None)
+        self.model_epsg = kwargs.pop('model_epsg', None)
+
+        self.residual_list = None
+        self.rms = None
+        self.rms_z = None
+        self.rms_tip = None
+        self.rms_array = None
+
+        self._data_array = None
+        self._data_key = None
+        self._cache = {}
+
+    def get_resp_fn_list(self):
+        """
+        find the response files in work_dir, sorted by iteration number
+        """
+        def alphanum_key(key):
+            return [int(text) if text.isdigit() else text
+                    for text in re.split('([0-9]+)', key)]
+
+        data_fn = op.abspath(self.data_fn)
+        resp_fn_list = [fn for fn in
+                        glob.glob(op.join(self.work_dir, self.resp_fn_pattern))
+                        if op.abspath(fn) != data_fn]
+        return sorted(resp_fn_list, key=alphanum_key)
+
+    def _get_data_array(self):
+        data_key = (op.abspath(self.data_fn), op.getmtime(self.data_fn))
+        if data_key != self._data_key:
+            data_obj = Data(model_epsg=self.model_epsg)
+            data_obj.read_data_file(self.data_fn)
+            self._data_array = data_obj.data_array
+            self._data_key = data_key
+            self._cache = {}
+        return self._data_array
+
+    def _get_residual(self, data_array, resp_array, resp_fn):
+        if resp_array.shape != data_array.shape or \
+                np.any(resp_array['station'] != data_array['station']) or \
+                resp_array['z'].shape != data_array['z'].shape:
+            raise DataError('Stations or periods of {0} do not match {1}'.format(
+                            resp_fn, self.data_fn))
+
+        residual = Residual(work_dir=self.work_dir, model_epsg=self.model_epsg)
+        residual._make_blank_residual_array(data_array)
+        for comp in ['z', 'tip']:
+            residual.residual_array[comp] = data_array[comp] - resp_array[comp]
+        residual._make_blank_rms_array(data_array)
+        residual.get_rms()
+        return residual
+
+    def get_rms(self):
+        """
+        compute the rms of each iteration, response files that did not
+        change since the last call are taken from the cache
+        """
+        data_array = self._get_data_array()
+        if self.resp_fn_list is None:
+            resp_fn_list = self.get_resp_fn_list()
+        else:
+            resp_fn_list = self.resp_fn_list
+
+        key_list = [(op.abspath(fn), op.getmtime(fn)) for fn in resp_fn_list]
+        new_fn_list = [fn for fn, key in zip(resp_fn_list, key_list)
+                       if key not in self._cache]
+
+        # reading the response files is the slow part, do that in parallel
+        if len(new_fn_list) > 1 and self.n_processes != 1:
+            pool = multiprocessing.Pool(self.n_processes)
+            try:
+                resp_array_list = pool.map(_read_response_array, new_fn_list)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            resp_array_list = [_read_response_array(fn) for fn in new_fn_list]
+
+        for fn, resp_array in zip(new_fn_list, resp_array_list):
+            self._cache[(op.abspath(fn), op.getmtime(fn))] = \
+                self._get_residual(data_array, resp_array, fn)
+
+        self.residual_list = [self._cache[key] for key in key_list]
+        self.rms = np.array([res.rms for res in self.residual_list])
+        self.rms_z = np.array([res.rms_z for res in self.residual_list])
+        self.rms_tip = np.array([res.rms_tip for res in self.residual_list])
+        if len(self.residual_list) > 0:
+            self.rms_array = np.array([res.rms_array
+                                       for res in self.residual_list])
+        else:
+            self.rms_array = None
@@ -45,6 +45,7 @@ from matplotlib import cm
 import scipy.interpolate as spi
 import mtpy.core.mt as mt
 import mtpy.modeling.winglink as MTwl
+import mtpy.modeling.survey_cube as survey_cube
 import mtpy.analysis.geometry as MTgy
 from mtpy.imaging.mtplottools import plot_errorbar
 import mtpy.utils.calculator as mtcc
@@ -700,35 +701,20 @@ class Mesh():
         mesh_lines.append("   {0}  {1}  {2}  {0}  {0}  {3}\n".format(0, nx + 1,
                                                                      nz + 1, 2))
 
-        # --> write horizontal nodes
-        node_str = ''
-        for ii, xnode in enumerate(self.x_nodes):
-            node_str += '{0:>9.1f} '.format(xnode)
-            if np.remainder(ii + 1, 8) == 0:
-                node_str += '\n'
-                mesh_lines.append(node_str)
-                node_str = ''
-
-        node_str += '\n'
-        mesh_lines.append(node_str)
-
-        # --> write vertical nodes
-        node_str = ''
-        for ii, znode in enumerate(self.z_nodes):
-            node_str += '{0:>9.1f} '.format(znode)
-            if np.remainder(ii + 1, 8) == 0:
-                node_str += '\n'
-                mesh_lines.append(node_str)
-                node_str = ''
-        node_str += '\n'
-        mesh_lines.append(node_str)
+        # --> write horizontal and vertical nodes 8 to a line, the last line
+        #     is always written even if it is empty
+        for nodes in [self.x_nodes, self.z_nodes]:
+            node_str = np.char.mod('%9.1f ', nodes)
+            mesh_lines.extend([''.join(node_str[ii:ii + 8]) + '\n'
+                               for ii in range(0, nodes.shape[0] + 1, 8)])
 
         # --> need a 0 after the nodes
         mesh_lines.append('    0\n')
-        # --> write triangular mesh block values as ?
-        for zz in range(self.z_nodes.shape[0]):
-            for tt in range(4):
-                mesh_lines.append(''.join(self.mesh_values[:, zz, tt]) + '\n')
+        # --> write triangular mesh block values as ?, one line for each
+        #     triangle of each layer
+        mesh_values = np.transpose(self.mesh_values[:, :nz], (1, 2, 0))
+        mesh_lines.extend([''.join(mline) + '\n' for mline in
+                           mesh_values.reshape(-1, mesh_values.shape[2]).tolist()])
 
         with open(self.mesh_fn, 'w') as mfid:
             mfid.writelines(mesh_lines)
@@ -757,11 +743,8 @@ class Mesh():
             **z_nodes** : array of vertical nodes 
                           (row locations(m))
                                       
-            **mesh_values** : np.array of free parameters
-            
-        To do:
-        ------
-            incorporate fixed values
+            **mesh_values** : np.array(x_nodes, z_nodes, 4) of the letter
+                              value of each triangular mesh element
             
         :Example: ::
             
@@ -778,83 +761,63 @@ class Mesh():
         nh = int(mlines[1].strip().split()[1])
         nv = int(mlines[1].strip().split()[2])
 
-        self.x_nodes = np.zeros(nh)
-        self.z_nodes = np.zeros(nv)
-        self.mesh_values = np.zeros((nh, nv, 4), dtype=str)
-
-        # get horizontal nodes
-        h_index = 0
-        v_index = 0
-        m_index = 0
+        # --> read horizontal and vertical nodes, the number of nodes is 1
+        #     less than listed at the top of the file.  Sometimes it seems
+        #     that the number of nodes is not the same as the header would
+        #     suggest, in that case the nodes end with a short line.
         line_count = 2
+        node_list = []
+        for num_nodes in [nh - 1, nv - 1]:
+            # skip the empty line after a full last line of nodes
+            while not mlines[line_count].strip():
+                line_count += 1
+            line_len = len(mlines[line_count].split())
+            nodes = []
+            while len(nodes) < num_nodes and line_count < len(mlines):
+                mline = mlines[line_count].strip().split()
+                nodes.extend(mline)
+                line_count += 1
+                if len(mline) < line_len:
+                    break
+            if len(nodes) != num_nodes:
+                print('The header number {0} should read {1}'.format(
+                    num_nodes + 1, len(nodes) + 1))
+            node_list.append(np.array(nodes, dtype=float))
+        self.x_nodes, self.z_nodes = node_list
+        nx = self.x_nodes.shape[0]
+        nz = self.z_nodes.shape[0]
 
-        # --> fill horizontal nodes
-        for mline in mlines[line_count:]:
-            mline = mline.strip().split()
-#            print mline
-            for m_value in mline:
-                self.x_nodes[h_index] = float(m_value)
-                h_index += 1
-            line_count += 1
-            # needs to be >= nh - 2 as python count starts from 0 and number of
-            # horizontal columns is 1 less than listed at the top of the file
-            if h_index >= nh - 2:
-                break
-            
-
-
-        # --> fill vertical nodes
-        for mline in mlines[line_count:]:
-            mline = mline.strip().split()
-            for m_value in mline:
-                self.z_nodes[v_index] = float(m_value)
-                v_index += 1
+        # --> skip the 0 after the nodes
+        while not mlines[line_count].strip():
             line_count += 1
-            if v_index >= nv - 2:
-                break
+        line_count += 1
 
-        # --> fill model values
-        for ll, mline in enumerate(mlines[line_count + 1:], line_count):
+        # --> fill model values, there is one line for each triangle of each
+        #     layer with one letter for each cell
+        value_lines = []
+        for ll, mline in enumerate(mlines[line_count:line_count + 4 * nz],
+                                   line_count):
             mline = mline.strip()
-            if m_index == nv or mline.lower().find('exception') > 0:
+            if mline.lower().find('exception') > 0:
                 break
-            else:
-                mlist = list(mline)
-                if len(mlist) != nh - 1:
-                    print('--- Line {0} in {1}'.format(ll, self.mesh_fn))
-                    print('Check mesh file too many columns')
-                    print('Should be {0}, has {1}'.format(nh, len(mlist)))
-                    mlist = mlist[0:nh]
-                for kk in range(4):
-                    for jj, mvalue in enumerate(list(mlist)):
-                        self.mesh_values[jj, m_index, kk] = mline[jj]
-                m_index += 1
-
-        # sometimes it seems that the number of nodes is not the same as the
-        # header would suggest so need to remove the zeros
-        self.x_nodes = self.x_nodes[np.nonzero(self.x_nodes)]
-        if self.x_nodes.shape[0] != nh:
-            new_nh = self.x_nodes.shape[0]
-            print('The header number {0} should read {1}'.format(nh, new_nh))
-            self.mesh_values = np.resize(self.mesh_values, (new_nh, nv, 4))
-        else:
-            new_nh = nh
-
-        self.z_nodes = self.z_nodes[np.nonzero(self.z_nodes)]
-        if self.z_nodes.shape[0] != nv:
-            new_nv = self.z_nodes.shape[0]
-            print('The header number {0} should read {1}'.format(nv, new_nv))
-            self.mesh_values = np.resize(self.mesh_values, (new_nh, nv, 4))
+            if len(mline) != nx:
+                print('--- Line {0} in {1}'.format(ll, self.mesh_fn))
+                print('Check mesh file number of columns')
+                print('Should be {0}, has {1}'.format(nx, len(mline)))
+            value_lines.append(mline)
+
+        mesh_values = np.zeros((4 * nz, nx), dtype=str)
+        if len(value_lines) > 0:
+            mesh_values[:len(value_lines)] = np.array(
+                value_lines, dtype='U{0}'.format(nx)).view('U1').reshape(
+                len(value_lines), nx)
+        self.mesh_values = np.ascontiguousarray(
+            np.transpose(mesh_values.reshape(nz, 4, nx), (2, 0, 1)))
 
         # make x_grid and z_grid
-        self.x_grid = self.x_nodes.copy()
-        self.x_grid = np.append(self.x_grid, self.x_grid[-1])
-        self.x_grid = np.array([self.x_grid[:ii].sum()
-                                for ii in range(self.x_grid.shape[0])])
+        self.x_grid = np.append(0, np.cumsum(self.x_nodes))
         self.x_grid -= self.x_grid.mean()
-        self.z_grid = np.array([self.z_nodes[:ii].sum()
-                                for ii in range(self.z_nodes.shape[0])])
-
+        self.z_grid = np.append(0, np.cumsum(self.z_nodes)[:-1])
 
 class Profile():
     """
@@ -969,14 +932,8 @@ class Profile():
     @staticmethod
     def _optimized_path(eastings, northings, start=None):
         """
-        TODO: should be refactored to somewhere else, is also used in
-        modem.plot_slices.
-
-        This function was adopted verbatim from the following link:
-
-        https://stackoverflow.com/questions/45829155/sort-points-in-order-to-have-a-continuous-curve-using-python
-
-        Order coordinates such that a continuous line can be formed.
+        Order coordinates such that a continuous line can be formed, see
+        mtpy.utils.mesh_tools.order_profile_points.
 
         Parameters
         ----------
@@ -984,6 +941,9 @@ class Profile():
             1D array of float, easting coordinates for profile line
         northings : np.ndarray
             1D array of float, northing coordinates for profile line
+        start : list, optional
+            [easting, northing] of the first station, default is the
+            station with the minimum easting
 
         Returns
         -------
@@ -991,23 +951,18 @@ class Profile():
             Index list for sorting E/N coords optimally (and by 
             extension, a list of EDI objects).
         """
-        def distance(P1, P2):
-            return ((P1[0] - P2[0])**2 + (P1[1] - P2[1])**2) ** 0.5
-
-        coords = np.column_stack((eastings, northings))
-        coords_list = coords.tolist()
-        # Assume start of profile is minimum easting
-        if start is None:
-            start = min(coords_list, key=lambda x: x[0])
-        pass_by = coords_list
-        path = [start]
-        pass_by.remove(start)
-        while pass_by:
-            nearest = min(pass_by, key=lambda x: distance(path[-1], x))
-            path.append(nearest)
-            pass_by.remove(nearest)
-        inds = [np.where(coords == p)[0][0] for p in path]
-        return inds
+        if start is not None:
+            coords = np.column_stack((eastings, northings))
+            start = np.flatnonzero(np.all(coords == np.asarray(start),
+                                          axis=1))[0]
+        return mtmesh.order_profile_points(eastings, northings,
+                                           start=start).tolist()
+
+    def _get_mt_obj(self, edi_fn):
+        """
+        read an .edi file into a mtpy.core.mt.MT object
+        """
+        return mt.MT(edi_fn)
 
     def _get_edi_list(self):
         """
@@ -1034,11 +989,11 @@ class Profile():
             for station in self.station_list:
                 for edi in os.listdir(self.edi_path):
                     if edi.find(station) == 0 and edi[-3:] == 'edi':
-                        self.edi_list.append(mt.MT(os.path.join(self.edi_path,
-                                                                edi)))
+                        self.edi_list.append(self._get_mt_obj(
+                            os.path.join(self.edi_path, edi)))
                         break
         elif self.optimize_line:
-            edis = [mt.MT(os.path.join(self.edi_path, edi)) for
+            edis = [self._get_mt_obj(os.path.join(self.edi_path, edi)) for
                     edi in os.listdir(self.edi_path) if edi.endswith('.edi')]
             eastings = np.array([edi.east for edi in edis])
             northings = np.array([edi.north for edi in edis])
@@ -1047,8 +1002,8 @@ class Profile():
             self.station_list = [os.path.splitext(os.path.basename(edi.fn))[0]
                                  for edi in self.edi_list]
         else:
-            self.edi_list = [mt.MT(os.path.join(self.edi_path, edi)) for
-                             edi in os.listdir(self.edi_path) if edi.endswith('.edi')]
+            self.edi_list = [self._get_mt_obj(os.path.join(self.edi_path, edi))
+                             for edi in os.listdir(self.edi_path) if edi.endswith('.edi')]
             self.station_list = [os.path.splitext(os.path.basename(edi.fn))[0]
                                  for edi in self.edi_list]
         for edi in self.edi_list:
@@ -1593,36 +1548,19 @@ class Regularization(Mesh):
 
         self.num_param = 0
         # --> now need to calulate model blocks to the bottom of the model
-        columns = list(model_cols)
-        widths = list(model_widths)
+        columns = np.array(model_cols)
+        widths = np.array(model_widths)
         for zz, thickness in enumerate(model_thickness):
-            # index for model column blocks from first_row, start at 1 because
-            # 0 is for padding cells            
-            block_index = 1
             num_rows = 1
             if zz == 0:
                 num_rows += 1
             if zz == len(model_thickness) - 1:
                 num_rows = self.num_z_pad_cells
-            while block_index + 1 < num_cols - 1:
-                # check to see if horizontally merged mesh cells are not larger
-                # than the thickness times trigger
-                if thickness < self.trigger * (widths[block_index] + \
-                                                       widths[block_index + 1]):
-                    block_index += 1
-                    continue
-                # merge 2 neighboring cells to avoid vertical exaggerations
-                else:
-                    widths[block_index] += widths[block_index + 1]
-                    columns[block_index] += columns[block_index + 1]
-                    # remove one of the merged cells
-                    widths.pop(block_index + 1)
-                    columns.pop(block_index + 1)
-
-                    num_cols -= 1
+            columns, widths = self._merge_blocks(columns, widths, thickness)
+            num_cols = columns.shape[0]
             self.num_param += num_cols
 
-            self.model_columns.append(list(columns))
+            self.model_columns.append(columns.tolist())
             self.model_rows.append([num_rows, num_cols])
 
         # calculate the distance from the right side of the furthest left
@@ -1642,6 +1580,41 @@ class Regularization(Mesh):
         print('   number of free param = {0}'.format(self.num_free_param))
         print('=' * 55)
 
+    def _merge_blocks(self, columns, widths, thickness):
+        """
+        merge neighbouring model blocks of a layer, from left to right, as 
+        long as the merged block is not wider than thickness / trigger to 
+        avoid vertical exaggerations.  The padding blocks on either side are
+        never merged.
+        
+        Returns the number of mesh columns and the width of each merged block.
+        """
+        station_cols = columns[1:-1]
+        station_widths = widths[1:-1]
+        merge = thickness >= self.trigger * (station_widths[:-1] +
+                                             station_widths[1:])
+        if not merge.any():
+            return columns, widths
+
+        block_starts = []
+        block_widths = []
+        ii = 0
+        while ii < station_widths.shape[0]:
+            # cumulative width of the block merged with its right neighbours,
+            # summed in the same order as merging one neighbour at a time
+            merged_widths = np.cumsum(station_widths[ii:])
+            num_merged = np.searchsorted(self.trigger * merged_widths[1:],
+                                         thickness, side='right')
+            block_starts.append(ii)
+            block_widths.append(merged_widths[num_merged])
+            ii += num_merged + 1
+
+        columns = np.hstack([columns[:1],
+                             np.add.reduceat(station_cols, block_starts),
+                             columns[-1:]])
+        widths = np.hstack([widths[:1], block_widths, widths[-1:]])
+        return columns, widths
+
     def get_num_free_params(self):
         """
         estimate the number of free parameters in model mesh.
@@ -1653,31 +1626,29 @@ class Regularization(Mesh):
         **DOES NOT WORK YET**
         """
 
-        self.num_free_param = 0
-
-        row_count = 0
-        # loop over columns and rows of regularization grid
-        for col, row in zip(self.model_columns, self.model_rows):
-            rr = row[0]
-            col_count = 0
-            for ii, cc in enumerate(col):
-                # make a model block from the index values of the regularization
-                # grid
-                model_block = self.mesh_values[row_count:row_count + rr,
-                              col_count:col_count + cc, :]
-
-                # find all the free triangular blocks within that model block
-                find_free = np.where(model_block == '?')
-                try:
-                    # test to see if the number of free parameters is equal
-                    # to the number of triangular elements with in the model
-                    # block, if there is the model block is assumed to be free.
-                    if find_free[0].size == model_block.size:
-                        self.num_free_param += 1
-                except IndexError:
-                    pass
-                col_count += cc
-            row_count += rr
+        # count the triangular blocks that are not free in each model block
+        # from a summed area table of the mesh
+        fixed = np.any(self.mesh_values != '?', axis=2).astype(int)
+        fixed_sum = np.zeros((fixed.shape[0] + 1, fixed.shape[1] + 1), dtype=int)
+        fixed_sum[1:, 1:] = fixed.cumsum(axis=0).cumsum(axis=1)
+
+        # index values of each model block of the regularization grid
+        num_rows = np.array([row[0] for row in self.model_rows])
+        num_cols = [len(col) for col in self.model_columns]
+        row_end = np.repeat(np.cumsum(num_rows), num_cols)
+        row_start = row_end - np.repeat(num_rows, num_cols)
+        col_end = np.hstack([np.cumsum(col) for col in self.model_columns])
+        col_start = col_end - np.hstack(self.model_columns)
+        row_start, row_end = [np.clip(rr, 0, fixed.shape[0]) for rr in
+                              [row_start, row_end]]
+        col_start, col_end = [np.clip(cc, 0, fixed.shape[1]) for cc in
+                              [col_start, col_end]]
+
+        # the model block is assumed to be free if all the triangular
+        # elements within the model block are free
+        num_fixed = fixed_sum[row_end, col_end] - fixed_sum[row_start, col_end] - \
+                    fixed_sum[row_end, col_start] + fixed_sum[row_start, col_start]
+        self.num_free_param = int(np.count_nonzero(num_fixed == 0))
 
     def write_regularization_file(self, reg_fn=None, reg_basename=None,
                                   statics_fn='none', prejudice_fn='none',
@@ -2093,6 +2064,9 @@ class Data(Profile):
     data                  list of dictionaries of data for each station.
                           see above
     data_fn               full path to data file
+    data_cube             mtpy.modeling.survey_cube.SurveyCube of the
+                          stations, if given the .edi files it holds are not
+                          read again and its interpolated data are reused
     data_list             list of lines to write to data file
     edi_list              list of mtpy.core.mt instances for each .edi file
                           read
@@ -2171,6 +2145,7 @@ class Data(Profile):
         self.freq = kwargs.pop('freq', None)
         self.model_mode = kwargs.pop('model_mode', '1')
         self.data = kwargs.pop('data', None)
+        self.data_cube = kwargs.pop('data_cube', None)
         self.data_list = None
         self.model_epsg = kwargs.pop('model_epsg',None)
 
@@ -2231,6 +2206,45 @@ class Data(Profile):
         self._data_header = '{0:<6}{1:<6}{2:<6} {3:<8} {4:<8}\n'.format(
             'SITE', 'FREQ', 'TYPE', 'DATUM', 'ERROR')
 
+    def _get_mt_obj(self, edi_fn):
+        """
+        get the MT object of an .edi file from data_cube, the file is only
+        read if it is not in data_cube
+        """
+        if self.data_cube is not None:
+            edi_fn = os.path.normpath(os.path.abspath(edi_fn))
+            for mt_obj in self.data_cube.mt_obj_list:
+                if mt_obj.fn == edi_fn:
+                    return mt_obj
+        return mt.MT(edi_fn)
+
+    def _get_data_cube(self):
+        """
+        get a SurveyCube holding the stations of edi_list, data_cube is reused
+        if it has all of them, otherwise a new one is made.
+
+        :returns: data_cube and the index of each station of edi_list in
+                  data_cube.mt_obj_list
+        """
+        if self.data_cube is not None:
+            cube_index = dict([(id(mt_obj), ii) for ii, mt_obj in
+                               enumerate(self.data_cube.mt_obj_list)])
+            if all([id(edi) in cube_index for edi in self.edi_list]):
+                return self.data_cube, np.array([cube_index[id(edi)] for edi
+                                                 in self.edi_list], dtype=int)
+
+        self.data_cube = survey_cube.SurveyCube(self.edi_list)
+        return self.data_cube, np.arange(len(self.edi_list))
+
+    @staticmethod
+    def _get_rotation_angles(mt_obj_list):
+        """
+        rotation angles of Z and Tipper of each MT object
+        """
+        return [np.hstack((mt_obj.Z.rotation_angle,
+                           mt_obj.Tipper.rotation_angle))
+                for mt_obj in mt_obj_list]
+
     def read_data_file(self, data_fn=None):
         """
         Read in an existing data file and populate appropriate attributes
@@ -2442,9 +2456,18 @@ class Data(Profile):
 
         # create a profile line, this sorts the stations by offset and rotates
         # data.
+        if self.data_cube is not None:
+            rotation = self._get_rotation_angles(self.data_cube.mt_obj_list)
         self.generate_profile()
         self.plot_profile()
 
+        # the interpolated data are out of date if the stations were rotated
+        if self.data_cube is not None:
+            if not all([r_1.shape == r_2.shape and np.allclose(r_1, r_2)
+                        for r_1, r_2 in zip(rotation, self._get_rotation_angles(
+                            self.data_cube.mt_obj_list))]):
+                self.data_cube.reset_cache()
+
         # --> get frequencies to invert for
         self._get_frequencies()
 
@@ -2463,171 +2486,134 @@ class Data(Profile):
                      for station, offset in zip(self.station_list,
                                                 self.station_locations)]
 
-        # loop over mt object in edi_list and use a counter starting at 1
-        # because that is what occam starts at.
-        for s_index, edi in enumerate(self.edi_list):
-            station_freq = edi.Z.freq
-            interp_freq = self.freq[np.where((self.freq >= station_freq.min()) &
-                                             (self.freq <= station_freq.max()))] 
-            if self.freq_tol is None:
-               
-
-                # interpolate data onto given frequency list
-                z_interp, t_interp = edi.interpolate(interp_freq)
-                #                z_interp._compute_res_phase()
-                z_interp.compute_resistivity_phase()
-
-                rho = z_interp.resistivity
-                phi = z_interp.phase
-                rho_err = z_interp.resistivity_err
-                if t_interp is not None:
-                    tipper = t_interp.tipper
-                    tipper_err = t_interp.tipper_err
-                else:
-                    tipper = None
-                    tipper_err = None
-            else:
-                rho = edi.Z.resistivity
-                rho_err = edi.Z.resistivity_err
-                phi = edi.Z.phase
-                tipper = edi.Tipper.tipper
-                tipper_err = edi.Tipper.tipper_err
+        ns = len(self.edi_list)
+        nf = self.freq.shape[0]
+        if self.freq_tol is None:
+            # skip frequencies that are not available for the station
+            valid = np.array([(self.freq >= edi.Z.freq.min()) &
+                              (self.freq <= edi.Z.freq.max())
+                              for edi in self.edi_list]).reshape(ns, nf)
+
+            # interpolate all stations onto given frequency list at once
+            data_cube, cube_index = self._get_data_cube()
+            cube_valid = np.zeros((len(data_cube.mt_obj_list), nf), dtype=bool)
+            cube_valid[cube_index] = valid
+            z, z_err, tipper, tipper_err = [
+                arr[cube_index] for arr in
+                data_cube.interpolate(self.freq, freq_mask=cube_valid)]
+            rho, phi, rho_err = data_cube.get_res_phase(z, z_err, self.freq)
+            has_tipper = np.ones(ns, dtype=bool)
+        else:
+            rho = np.zeros((ns, nf, 2, 2))
+            rho_err = np.zeros((ns, nf, 2, 2))
+            phi = np.zeros((ns, nf, 2, 2))
+            tipper = np.zeros((ns, nf, 1, 2), dtype=complex)
+            tipper_err = np.zeros((ns, nf, 1, 2))
+            valid = np.zeros((ns, nf), dtype=bool)
+            has_tipper = np.zeros(ns, dtype=bool)
+            for s_index, edi in enumerate(self.edi_list):
+                station_freq = edi.Z.freq
+                # indices within tolerance
+                within = ((station_freq >= self.freq[:, np.newaxis] * (1 - self.freq_tol)) &
+                          (station_freq <= self.freq[:, np.newaxis] * (1 + self.freq_tol)))
+                # closest frequency
+                diff = np.where(within,
+                                np.abs(station_freq - self.freq[:, np.newaxis]),
+                                np.inf)
+                f_index = np.argmin(diff, axis=1)
+                valid[s_index] = within.any(axis=1)
+
+                rho[s_index] = edi.Z.resistivity[f_index]
+                rho_err[s_index] = edi.Z.resistivity_err[f_index]
+                phi[s_index] = edi.Z.phase[f_index]
+                if edi.Tipper.tipper is not None:
+                    has_tipper[s_index] = True
+                    tipper[s_index] = edi.Tipper.tipper[f_index]
+                    tipper_err[s_index] = edi.Tipper.tipper_err[f_index]
+
+        # --> get te and tm resistivity and compute error
+        te_res = rho[:, :, 0, 1]
+        te_res_err = self._get_res_error(te_res, rho_err[:, :, 0, 1],
+                                         self.res_te_err)
+        tm_res = rho[:, :, 1, 0]
+        tm_res_err = self._get_res_error(tm_res, rho_err[:, :, 1, 0],
+                                         self.res_tm_err)
+
+        # --> get te phase and be sure it is in the first quadrant
+        te_phase = phi[:, :, 0, 1]
+        te_phase = np.where(te_phase > 180, te_phase - 180, te_phase)
+        # remove any remaining phase values that are out of the first
+        # quadrant
+        te_phase = np.where((te_phase > 90) | (te_phase < 0), 0., te_phase)
+        te_phase_err = self._get_phase_error(te_res, te_res_err,
+                                             self.phase_te_err)
+
+        # --> get tm phase and be sure its in the first quadrant
+        tm_phase = phi[:, :, 1, 0] % 180
+        tm_phase = np.where((tm_phase > 90) | (tm_phase < 0), 0., tm_phase)
+        tm_phase_err = self._get_phase_error(tm_res, tm_res_err,
+                                             self.phase_tm_err)
+
+        # --> get Tipper
+        tip_valid = valid & has_tipper[:, np.newaxis]
+        re_tip = tipper[:, :, 0, 1].real
+        im_tip = tipper[:, :, 0, 1].imag
+        if self.tipper_err is not None:
+            re_tip_err = np.zeros_like(re_tip) + self.tipper_err / 100.
+            im_tip_err = np.zeros_like(im_tip) + self.tipper_err / 100.
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                re_tip_err = re_tip / tipper_err[:, :, 0, 1]
+                im_tip_err = im_tip / tipper_err[:, :, 0, 1]
 
+        for s_index, edi in enumerate(self.edi_list):
             self.data[s_index]['station'] = edi.station
             self.data[s_index]['offset'] = edi.offset
 
-            for freq_num, frequency in enumerate(self.freq):
-                if self.freq_tol is not None:
-                    try:
-                        # list of indices within tolerance
-                        f_index_list = np.where((station_freq >= frequency * (1 - self.freq_tol)) &
-                                                (station_freq <= frequency * (1 + self.freq_tol)))[0]
-                        # closest frequency
-                        diff = np.abs(station_freq[f_index_list] - frequency)
-                        f_index = f_index_list[np.where(diff==np.amin(diff))]
-
-                    except ValueError:
-                        f_index = None
-                else:
-                    # skip, if the listed frequency is not available for the station
-                    if (frequency in interp_freq):
-                        # find the respective frequency index for the station
-                        f_index = np.abs(interp_freq - frequency).argmin()
-                    else:
-                        f_index = None
-
-                if f_index == None:
-                    continue
+            for key, value, error, v_mask in [
+                    ('te_res', te_res, te_res_err, valid),
+                    ('tm_res', tm_res, tm_res_err, valid),
+                    ('te_phase', te_phase, te_phase_err, valid),
+                    ('tm_phase', tm_phase, tm_phase_err, valid),
+                    ('re_tip', re_tip, re_tip_err, tip_valid),
+                    ('im_tip', im_tip, im_tip_err, tip_valid)]:
+                self.data[s_index][key][0] = np.where(v_mask[s_index],
+                                                      value[s_index], 0.)
+                self.data[s_index][key][1] = np.where(v_mask[s_index],
+                                                      error[s_index], 0.)
+
+    def _get_res_error(self, res, res_err, res_err_value):
+        """
+        resistivity error from the data or the error floor, 0 where there
+        is no resistivity
+        """
+        # --> get error from data
+        if res_err_value is None:
+            error = np.abs(res_err)
+        # --> set generic error floor
+        elif self.error_type == 'floor':
+            error = res * res_err_value / 100.
+            error = np.where(res_err > error, res_err, error)
+        else:
+            error = res * res_err_value / 100.
 
-                # --> get te resistivity
-                self.data[s_index]['te_res'][0, freq_num] = rho[f_index, 0, 1]
-                # compute error
-                if rho[f_index, 0, 1] != 0.0:
-                    # --> get error from data
-                    if self.res_te_err is None:
-                        self.data[s_index]['te_res'][1, freq_num] = \
-                            np.abs(rho_err[f_index, 0, 1])
-                    # --> set generic error floor
-                    elif self.error_type == 'floor':
-                        self.data[s_index]['te_res'][1, freq_num] = \
-                            max(rho[f_index, 0, 1]*self.res_te_err/100.,
-                                rho_err[f_index, 0, 1])
-                    else:
-                        self.data[s_index]['te_res'][1, freq_num] = \
-                        rho[f_index, 0, 1]*self.res_te_err/100.
-
-                # --> get tm resistivity
-                self.data[s_index]['tm_res'][0, freq_num] = rho[f_index, 1, 0]
-                # compute error
-                if rho[f_index, 1, 0] != 0.0:
-                    # --> get error from data
-                    if self.res_tm_err is None:
-                        self.data[s_index]['tm_res'][1, freq_num] = \
-                            np.abs(rho_err[f_index, 1, 0])
-                    # --> set generic error floor
-                    elif self.error_type == 'floor':
-                        self.data[s_index]['tm_res'][1, freq_num] = \
-                            max(rho[f_index, 1, 0]*self.res_tm_err / 100.,
-                                rho_err[f_index, 1, 0])
-                    else:
-                        self.data[s_index]['tm_res'][1, freq_num] = \
-                        rho[f_index, 1, 0]*self.res_tm_err / 100.
-
-                # --> get te phase
-                phase_te = phi[f_index, 0, 1]
-                # be sure the phase is in the first quadrant
-                if phase_te > 180:
-                    phase_te -= 180
-                # remove any remaining phase values that are out of the first
-                # quadrant
-                if ((phase_te > 90) or (phase_te < 0)):
-                    phase_te = 0.
-
-                self.data[s_index]['te_phase'][0, freq_num] = phase_te
-                # compute error
-                # if phi[f_index, 0, 1] != 0.0:
-                # --> get error from data
-                phase_te_errorval = \
-                np.degrees(np.arcsin(.5 *
-                                     self.data[s_index]['te_res'][1, freq_num]/\
-                                     self.data[s_index]['te_res'][0, freq_num]))
-                if self.phase_te_err is None:
-                    self.data[s_index]['te_phase'][1, freq_num] =\
-                    phase_te_errorval
-                # --> set generic error floor
-                elif self.error_type == 'floor':
-                    self.data[s_index]['te_phase'][1, freq_num] = \
-                        max((self.phase_te_err / 100.) * 57. / 2.,
-                            phase_te_errorval)
-                else:
-                    self.data[s_index]['te_phase'][1, freq_num] = \
-                    (self.phase_te_err / 100.) * 57. / 2.
-                # --> get tm phase and be sure its in the first quadrant
-                phase_tm = phi[f_index, 1, 0] % 180            
-
-                # remove any remaining phase values that are out of the first
-                # quadrant
-                if ((phase_tm > 90) or (phase_tm < 0)):
-                    phase_tm = 0.
-                
+        return np.where(res != 0.0, error, 0.)
 
-                self.data[s_index]['tm_phase'][0, freq_num] = phase_tm
-                # compute error
-                # if phi[f_index, 1, 0] != 0.0:
-                # --> get error from data
-                phase_tm_errorval = \
-                np.degrees(np.arcsin(.5 *
-                                     self.data[s_index]['tm_res'][1, freq_num]/\
-                                     self.data[s_index]['tm_res'][0, freq_num]))
-                if self.phase_tm_err is None:
-                    self.data[s_index]['tm_phase'][1, freq_num] = \
-                        phase_tm_errorval
-                # --> set generic error floor
-                elif self.error_type == 'floor':
-                    self.data[s_index]['tm_phase'][1, freq_num] = \
-                        max((self.phase_tm_err / 100.) * 57. / 2.,
-                            phase_tm_errorval)
-                else:
-                    self.data[s_index]['tm_phase'][1, freq_num] = \
-                    (self.phase_tm_err / 100.) * 57. / 2.
-                # --> get Tipper
-                if tipper is not None:
-                    self.data[s_index]['re_tip'][0, freq_num] = \
-                        tipper[f_index, 0, 1].real
-                    self.data[s_index]['im_tip'][0, freq_num] = \
-                        tipper[f_index, 0, 1].imag
-
-                    # get error
-                    if self.tipper_err is not None:
-                        self.data[s_index]['re_tip'][1, freq_num] = \
-                            self.tipper_err / 100.
-                        self.data[s_index]['im_tip'][1, freq_num] = \
-                            self.tipper_err / 100.
-                    else:
-                        self.data[s_index]['re_tip'][1, freq_num] = \
-                            tipper[f_index, 0, 1].real / tipper_err[f_index, 0, 1]
-                        self.data[s_index]['im_tip'][1, freq_num] = \
-                            tipper[f_index, 0, 1].imag / tipper_err[f_index, 0, 1]
+    def _get_phase_error(self, res, res_err, phase_err_value):
+        """
+        phase error from the resistivity error or the error floor
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error = np.degrees(np.arcsin(.5 * res_err / res))
+
+        # --> set generic error floor
+        if phase_err_value is None:
+            return error
+        elif self.error_type == 'floor':
+            floor = (phase_err_value / 100.) * 57. / 2.
+            return np.where(error > floor, error, floor)
+        else:
+            return np.zeros_like(error) + (phase_err_value / 100.) * 57. / 2.
 
     def _get_data_list(self):
         """
@@ -3220,16 +3206,18 @@ class Model(Startup):
         value = int(iline[1].strip())
         setattr(self, key, value)
 
-        self.model_values = np.zeros(self.param_count)
-        kk = int(ii + 1)
-
-        jj = 0
-        mv_index = 0
-        while jj < len(ilines) - kk:
-            iline = np.array(ilines[jj + kk].strip().split(), dtype='float')
-            self.model_values[mv_index:mv_index + iline.shape[0]] = iline
-            jj += 1
-            mv_index += iline.shape[0]
+        # fromstring stops at the first value it can not read
+        model_str = ''.join(ilines[ii + 1:])
+        model_values = np.fromstring(model_str, sep=' ')
+        if model_values.shape[0] != len(model_str.split()):
+            raise OccamInputError('Could not read model value {0} in '
+                                  '{1}'.format(model_values.shape[0] + 1,
+                                               self.iter_fn))
+        if model_values.shape[0] != self.param_count:
+            raise OccamInputError('Number of model values {0} is not equal '
+                                  'to the param count {1}'.format(
+                                   model_values.shape[0], self.param_count))
+        self.model_values = model_values
 
         # make sure data file is full path
         if os.path.isfile(self.data_fn) == False:
@@ -3275,38 +3263,42 @@ class Model(Startup):
         # make sure that the number of rows and number of columns are the same
         assert len(r1.model_rows) == len(r1.model_columns)
 
-        # initiate the resistivity model to the shape of the FE mesh
-        self.res_model = np.zeros((r1.z_nodes.shape[0], r1.x_nodes.shape[0]))
-
         # read in the model and set the regularization block values to map onto
         # the FE mesh so that the model can be plotted as an image or regular
-        # mesh.
-        mm = 0
-        for ii in range(len(r1.model_rows)):
-            # get the number of layers to combine
-            # this index will be the first index in the vertical direction
-            ny1 = r1.model_rows[:ii, 0].sum()
-            # the second index  in the vertical direction
-            ny2 = ny1 + r1.model_rows[ii][0]
-            # make the list of amalgamated columns an array for ease
-            lc = np.array(r1.model_columns[ii])
-            # loop over the number of amalgamated blocks
-            for jj in range(len(r1.model_columns[ii])):
-                # get first in index in the horizontal direction
-                nx1 = lc[:jj].sum()
-                # get second index in horizontal direction
-                nx2 = nx1 + lc[jj]
-                # put the apporpriate resistivity value into all the amalgamated
-                # model blocks of the regularization grid into the forward model
-                # grid
-                self.res_model[ny1:ny2, nx1:nx2] = self.model_values[mm]
-                mm += 1
+        # mesh.  Each block value is repeated over the mesh columns of the 
+        # amalgamated block, then each layer over the mesh rows it combines.
+        nx = r1.x_nodes.shape[0]
+        nz = r1.z_nodes.shape[0]
+        num_blocks = np.array([len(cols) for cols in r1.model_columns])
+        block_cols = np.hstack(r1.model_columns).astype(int)
+        if self.model_values.shape[0] < block_cols.shape[0]:
+            raise OccamInputError('Number of model values {0} is less than '
+                                  'the number of model blocks {1}'.format(
+                                   self.model_values.shape[0],
+                                   block_cols.shape[0]))
+        block_layer = np.repeat(np.arange(num_blocks.shape[0]), num_blocks)
+        layer_cols = np.bincount(block_layer, weights=block_cols,
+                                 minlength=num_blocks.shape[0]).astype(int)
+
+        cell_values = np.repeat(self.model_values[:block_cols.shape[0]],
+                                block_cols)
+        cell_layer = np.repeat(block_layer, block_cols)
+        cell_col = np.arange(cell_layer.shape[0]) - \
+                   np.repeat(np.cumsum(layer_cols) - layer_cols, layer_cols)
+        in_mesh = cell_col < nx
+        layer_model = np.zeros((num_blocks.shape[0], nx))
+        layer_model[cell_layer[in_mesh], cell_col[in_mesh]] = \
+            cell_values[in_mesh]
+
+        # initiate the resistivity model to the shape of the FE mesh
+        self.res_model = np.zeros((nz, nx))
+        row_layer = np.repeat(np.arange(num_blocks.shape[0]),
+                              r1.model_rows[:, 0])[:nz]
+        self.res_model[:row_layer.shape[0]] = layer_model[row_layer]
 
         # make some arrays for plotting the model
-        self.plot_x = np.array([r1.x_nodes[:ii + 1].sum()
-                                for ii in range(len(r1.x_nodes))])
-        self.plot_z = np.array([r1.z_nodes[:ii + 1].sum()
-                                for ii in range(len(r1.z_nodes))])
+        self.plot_x = np.cumsum(r1.x_nodes)
+        self.plot_z = np.cumsum(r1.z_nodes)
 
         # center the grid onto the station coordinates
         x0 = bndgoff - self.plot_x[r1.model_columns[0][0]]
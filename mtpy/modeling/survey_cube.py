@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+==================
+Survey Cube
+==================
+
+Put the impedance and tipper of all stations of a survey onto the frequency
+grid of an inversion in one batch.
+
+The interpolation follows mtpy.core.mt.MT.interpolate (linear interpolation
+of the real part, imaginary part and error of each non-zero component, only
+inside the frequency range of that component, optional period buffer), but
+all stations and components are interpolated together as one set of arrays.
+
+Interpolated cubes are cached on the object, so the Occam2D, WS3DINV and
+ModEM data builders can be fed from the same SurveyCube when trying different
+inversion parameters.
+
+Created on Mon Oct 19 2020
+
+"""
+import numpy as np
+
+import mtpy.core.mt as mt
+import mtpy.utils.calculator as mtcc
+
+
+# ==============================================================================
+class SurveyCube(object):
+    """
+    Impedance and tipper of a list of stations, interpolated onto a common
+    frequency grid.
+
+    Arguments
+    ------------
+        **mt_obj_list** : list of mtpy.core.mt.MT objects or file names
+                          stations to put on the grid, file names are read
+                          once when the cube is made
+
+    ====================== ====================================================
+    Attributes             Description
+    ====================== ====================================================
+    mt_obj_list            list of mtpy.core.mt.MT objects
+    station_list           list of station names
+    ====================== ====================================================
+
+    ====================== ====================================================
+    Methods                Description
+    ====================== ====================================================
+    interpolate            interpolate all stations onto a frequency array,
+                           returns arrays of shape (num_stations, num_freq, ..)
+    get_res_phase          resistivity, phase and resistivity error of an
+                           interpolated impedance cube
+    reset_cache            clear interpolated cubes
+    ====================== ====================================================
+
+    :Example: ::
+
+        >>> import mtpy.modeling.survey_cube as survey_cube
+        >>> cube = survey_cube.SurveyCube(edi_list)
+        >>> z, z_err, t, t_err = cube.interpolate(np.logspace(-3, 3, 30))
+
+    """
+
+    def __init__(self, mt_obj_list):
+        self.mt_obj_list = [mt_obj if isinstance(mt_obj, mt.MT) else
+                            mt.MT(mt_obj) for mt_obj in mt_obj_list]
+        self.station_list = [mt_obj.station for mt_obj in self.mt_obj_list]
+
+        self._cache = {}
+        self._z_rows = None
+        self._t_rows = None
+
+    def reset_cache(self):
+        """
+        clear interpolated cubes, call this if the data of the MT objects
+        changed, for instance after rotation.
+        """
+        self._cache = {}
+        self._z_rows = None
+        self._t_rows = None
+
+    def _get_rows(self):
+        """
+        arrange every non-zero component of every station as a row of
+        (freq, value, error), padded with NaN
+        """
+        ns = len(self.mt_obj_list)
+        nf = max([mt_obj.Z.freq.size for mt_obj in self.mt_obj_list])
+
+        z_freq = np.zeros((ns, 2, 2, nf))
+        z_freq[:] = np.nan
+        z_value = np.zeros((ns, 2, 2, nf), dtype=complex)
+        z_error = np.zeros((ns, 2, 2, nf))
+        t_freq = np.zeros((ns, 1, 2, nf))
+        t_freq[:] = np.nan
+        t_value = np.zeros((ns, 1, 2, nf), dtype=complex)
+        t_error = np.zeros((ns, 1, 2, nf))
+
+        for ii, mt_obj in enumerate(self.mt_obj_list):
+            f_count = mt_obj.Z.freq.size
+            z = np.moveaxis(mt_obj.Z.z, 0, -1)
+            z_freq[ii, :, :, :f_count] = np.where(z != 0, mt_obj.Z.freq, np.nan)
+            z_value[ii, :, :, :f_count] = z
+            if mt_obj.Z.z_err is not None:
+                z_error[ii, :, :, :f_count] = np.moveaxis(mt_obj.Z.z_err, 0, -1)
+
+            if mt_obj.Tipper.tipper is None:
+                continue
+            f_count = mt_obj.Tipper.freq.size
+            t = np.moveaxis(mt_obj.Tipper.tipper, 0, -1)
+            t_freq[ii, :, :, :f_count] = np.where(t != 0, mt_obj.Tipper.freq,
+                                                  np.nan)
+            t_value[ii, :, :, :f_count] = t
+            if mt_obj.Tipper.tipper_err is not None:
+                t_error[ii, :, :, :f_count] = \
+                    np.moveaxis(mt_obj.Tipper.tipper_err, 0, -1)
+
+        self._z_rows = (z_freq.reshape(-1, nf), z_value.reshape(-1, nf),
+                        z_error.reshape(-1, nf))
+        self._t_rows = (t_freq.reshape(-1, nf), t_value.reshape(-1, nf),
+                        t_error.reshape(-1, nf))
+
+    def interpolate(self, freq, period_buffer=None, freq_mask=None):
+        """
+        Interpolate all stations onto freq.
+
+        Arguments
+        -------------
+            **freq** : np.ndarray(num_freq)
+                       frequencies to interpolate onto
+
+            **period_buffer** : float
+                                maximum ratio between an interpolated period
+                                and the closest data period for the impedance,
+                                see mtpy.core.mt.MT.interpolate
+                                *default* is None
+
+            **freq_mask** : np.ndarray(num_stations, num_freq, dtype=bool)
+                            only fill entries where the mask is True
+                            *default* is None, fill everything possible
+
+        Returns
+        -------------
+            **z** : np.ndarray(num_stations, num_freq, 2, 2, dtype=complex)
+
+            **z_err** : np.ndarray(num_stations, num_freq, 2, 2)
+
+            **tipper** : np.ndarray(num_stations, num_freq, 1, 2, dtype=complex)
+
+            **tipper_err** : np.ndarray(num_stations, num_freq, 1, 2)
+
+            entries that could not be interpolated are 0, the same as
+            mtpy.core.mt.MT.interpolate.  The arrays are cached, do not
+            change them in place.
+
+        """
+        freq = np.asarray(freq, dtype=float)
+        if period_buffer is not None:
+            if 0. < period_buffer < 1.:
+                period_buffer += 1.
+
+        key = (freq.tobytes(), period_buffer,
+               None if freq_mask is None else np.asarray(freq_mask).tobytes())
+        if key in self._cache:
+            return self._cache[key]
+
+        if self._z_rows is None:
+            self._get_rows()
+
+        ns = len(self.mt_obj_list)
+        nf = freq.size
+        if freq_mask is None:
+            freq_mask = np.ones((ns, nf), dtype=bool)
+        freq_mask = np.asarray(freq_mask, dtype=bool)
+
+        z_mask = np.repeat(freq_mask, 4, axis=0)
+        z, z_err = _interpolate_rows(self._z_rows[0], self._z_rows[1],
+                                     self._z_rows[2], freq, z_mask,
+                                     period_buffer=period_buffer)
+        t_mask = np.repeat(freq_mask, 2, axis=0)
+        t, t_err = _interpolate_rows(self._t_rows[0], self._t_rows[1],
+                                     self._t_rows[2], freq, t_mask)
+
+        z = np.moveaxis(z.reshape(ns, 2, 2, nf), -1, 1)
+        z_err = np.moveaxis(z_err.reshape(ns, 2, 2, nf), -1, 1)
+        t = np.moveaxis(t.reshape(ns, 1, 2, nf), -1, 1)
+        t_err = np.moveaxis(t_err.reshape(ns, 1, 2, nf), -1, 1)
+
+        self._cache[key] = (z, z_err, t, t_err)
+        return self._cache[key]
+
+    @staticmethod
+    def get_res_phase(z, z_err, freq):
+        """
+        apparent resistivity, phase and resistivity error of an impedance
+        cube, same as mtpy.core.z.Z.compute_resistivity_phase
+
+        :returns: resistivity, phase (deg), resistivity error with the shape
+                  of z
+        """
+        freq = np.asarray(freq, dtype=float)[:, np.newaxis, np.newaxis]
+        res = np.abs(z) ** 2 / freq * 0.2
+        phase = np.rad2deg(np.angle(z))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            res_rel_err = mtcc.z_error2r_phi_error(z.real, z.imag, z_err)[0]
+        return res, phase, res * res_rel_err
+
+
+def _interpolate_rows(x, y, y_err, x_new, mask, period_buffer=None):
+    """
+    Linear interpolation of many rows at once onto the same new points.
+
+    Each row of x holds the frequencies of one component, NaN for missing
+    values, the rows do not need to be sorted.  The rows are laid end to end
+    on a log-frequency axis so that one searchsorted finds the bracketing
+    values of every new point in every row, the weights are then computed
+    on the linear frequency, which gives the same result as a slinear
+    interpolation of each row.
+
+    :returns: interpolated values and errors (num_rows, num_new), 0 where
+              a new point is outside the range of its row or masked.
+    """
+    n_rows, n_cols = x.shape
+    n_new = x_new.size
+    y_new = np.zeros((n_rows, n_new), dtype=y.dtype)
+    y_err_new = np.zeros((n_rows, n_new), dtype=y_err.dtype)
+    if n_rows == 0 or n_new == 0:
+        return y_new, y_err_new
+
+    valid = np.isfinite(x)
+    count = valid.sum(axis=1)
+
+    # sort each row, missing values go to the end
+    order = np.argsort(np.where(valid, x, np.inf), axis=1)
+    x = np.take_along_axis(x, order, axis=1)
+    y = np.take_along_axis(y, order, axis=1)
+    y_err = np.take_along_axis(y_err, order, axis=1)
+
+    x_min = x[:, 0]
+    x_max = np.take_along_axis(x, np.maximum(count - 1, 0)[:, np.newaxis],
+                               axis=1)[:, 0]
+    in_range = (mask & (count[:, np.newaxis] > 0) &
+                (x_new >= x_min[:, np.newaxis]) &
+                (x_new <= x_max[:, np.newaxis]))
+
+    # lay the rows end to end on a log axis so one search does every row
+    log_x = np.log10(x)
+    log_x_new = np.log10(x_new)
+    log_min = min(np.nanmin(log_x) if valid.any() else 0, log_x_new.min())
+    log_max = max(np.nanmax(log_x) if valid.any() else 0, log_x_new.max())
+    span = log_max - log_min + 2.
+    row_offset = np.arange(n_rows)[:, np.newaxis] * span
+    flat_x = np.where(valid, log_x - log_min, span - 1.) + row_offset
+    flat_new = (log_x_new - log_min) + row_offset
+
+    index = np.searchsorted(flat_x.ravel(), flat_new.ravel(), side='right')
+    index = index.reshape(n_rows, n_new) - 1 - np.arange(n_rows)[:, np.newaxis] * n_cols
+    index = np.clip(index, 0, np.maximum(count - 2, 0)[:, np.newaxis])
+    index_1 = np.minimum(index + 1, np.maximum(count - 1, 0)[:, np.newaxis])
+
+    x_0 = np.take_along_axis(x, index, axis=1)
+    x_1 = np.take_along_axis(x, index_1, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(x_1 != x_0, (x_new - x_0) / (x_1 - x_0), 0.)
+
+    if period_buffer is not None:
+        # nearest data point on a log scale is one of the bracketing values
+        nearest = np.minimum(np.abs(log_x_new - np.log10(x_0)),
+                             np.abs(np.log10(x_1) - log_x_new))
+        in_range &= nearest < np.log10(period_buffer)
+
+    for values, new_values in [(y, y_new), (y_err, y_err_new)]:
+        v_0 = np.take_along_axis(values, index, axis=1)
+        v_1 = np.take_along_axis(values, index_1, axis=1)
+        interp = v_0 + weight * (v_1 - v_0)
+        new_values[in_range] = interp[in_range]
+
+    return y_new, y_err_new
@@ -83,6 +83,7 @@ import matplotlib.widgets as widgets
 import matplotlib.colors as colors
 import matplotlib.cm as cm
 import mtpy.modeling.winglink as wl
+import mtpy.modeling.survey_cube as survey_cube
 import mtpy.utils.exceptions as mtex
 import mtpy.analysis.pt as mtpt
 import mtpy.imaging.mtcolors as mtcl
@@ -99,6 +100,105 @@ except ImportError:
            '    python setup.py build -compiler=cygwin')
 
 #==============================================================================
+# block formatting and parsing of ws3dinv files
+#==============================================================================
+def _format_block(values, value_fmt, n_columns):
+    """
+    format values into lines of n_columns values each, the last line holds
+    the remaining values.  value_fmt is the format of a single value,
+    eg. '{:+.4e} '.
+    """
+    values = np.asarray(values).ravel().tolist()
+    n_lines, n_rest = divmod(len(values), n_columns)
+    block = (value_fmt*n_columns+'\n')*n_lines
+    if n_rest > 0:
+        block += value_fmt*n_rest+'\n'
+
+    return block.format(*values)
+
+def _read_node_block(lines, line_index, n_nodes):
+    """
+    read n_nodes node values that start on line line_index, returns the
+    nodes and the index of the line after the block.
+    """
+    count = 0
+    start_index = line_index
+    while count < n_nodes:
+        count += len(lines[line_index].split())
+        line_index += 1
+
+    nodes = np.fromstring(' '.join(lines[start_index:line_index]), sep=' ')
+    if nodes.size != n_nodes:
+        raise WSInputError('Expected {0} nodes on lines {1} to {2}, '
+                           'found {3}'.format(n_nodes, start_index+1,
+                                              line_index, nodes.size))
+    return nodes, line_index
+
+def _find_data_sections(lines):
+    """
+    find the line numbers of the N-S locations, E-W locations and first
+    period of data in a data or response file.
+    """
+    findlist = []
+    for ii, dline in enumerate(lines[1:], 1):
+        if dline.find('Station_Location: N-S') == 0:
+            findlist.append(ii)
+        elif dline.find('Station_Location: E-W') == 0:
+            findlist.append(ii)
+        elif dline.find('DATA_Period:') == 0:
+            findlist.append(ii)
+            break
+
+    if len(findlist) != 3:
+        raise WSInputError('Could not find station locations and data in '
+                           'file')
+    return findlist
+
+def _read_location_block(lines, n_stations):
+    """
+    read n_stations station locations from lines.
+    """
+    locations = np.fromstring(' '.join(lines), sep=' ')
+    if locations.size < n_stations:
+        raise WSInputError('Expected {0} station locations, found {1}'.format(
+                           n_stations, locations.size))
+    return locations[:n_stations]
+
+def _read_period_blocks(lines, n_stations):
+    """
+    read blocks of a data or response file that each start with a
+    '..._Period: period' line followed by a line for each station.
+
+    Returns the header lines and an array of the values with shape
+    (n_blocks, n_stations, n_values_per_line).
+    """
+    header_list = []
+    value_lines = []
+    for line in lines:
+        if line.lower().find('period') > 0:
+            header_list.append(line)
+        elif line.strip() != '':
+            value_lines.append(line)
+
+    values = np.fromstring(' '.join(value_lines), sep=' ')
+    n_values = len(value_lines[0].split()) if value_lines else 0
+    if values.size != len(header_list)*n_stations*n_values:
+        raise WSInputError('Expected {0} blocks of {1} stations with {2} '
+                           'values, found {3} values'.format(len(header_list),
+                                                             n_stations,
+                                                             n_values,
+                                                             values.size))
+
+    return header_list, values.reshape(len(header_list), n_stations,
+                                       n_values)
+
+def _values_to_z(values):
+    """
+    convert lines of re(zxx) im(zxx) ... re(zyy) im(zyy) values to impedance
+    tensors, the sign of the imaginary part is flipped as in the files.
+    """
+    return (values[..., 0:8:2]-1j*values[..., 1:8:2]).reshape(
+                                                    values.shape[:-1]+(2, 2))
 
 #==============================================================================
 # Data class
@@ -137,6 +237,9 @@ class WSData(object):
                                * *z_data_err--> impedance tensor error without
                                                 error map applied
                                * *z_err_map --> error map from data file
+    data_cube              mtpy.modeling.survey_cube.SurveyCube of edi_list,
+                           reused by build_data if it holds the same .edi
+                           files, otherwise made by build_data
     data_fn                full path to data file
     edi_list               list of edi files used to make data file
     n_z                    [ 4 | 8 ] number of impedance tensor elements
@@ -212,6 +315,7 @@ class WSData(object):
         self.n_z = kwargs.pop('n_z', 8)
         self.period_list = kwargs.pop('period_list', None)
         self.edi_list = kwargs.pop('edi_list', None)
+        self.data_cube = kwargs.pop('data_cube', None)
         self.station_locations = kwargs.pop('station_locations', None)
         self.rotation_angle = kwargs.pop('roatation_angle', None)
 
@@ -319,30 +423,50 @@ class WSData(object):
                 self.data['north']= self.station_locations[:, 1]
 
         #--------find frequencies----------------------------------------------
-        for ss, edi in enumerate(self.edi_list):
+        edi_fn_list = []
+        for edi in self.edi_list:
             if not os.path.isfile(edi):
                 raise IOError('Could not find '+edi)
-
-            mt_obj = mt.MT(edi)
-            if self.rotation_angle is not None:
-                mt_obj.rotation_angle = self.rotation_angle
+            edi_fn_list.append(os.path.normpath(os.path.abspath(edi)))
+
+        # only read the .edi files if data_cube does not hold them already
+        if self.data_cube is None or \
+                [mt_obj.fn for mt_obj in self.data_cube.mt_obj_list] != \
+                edi_fn_list:
+            self.data_cube = survey_cube.SurveyCube(edi_fn_list)
+        data_cube = self.data_cube
+        mt_obj_list = data_cube.mt_obj_list
+
+        if self.rotation_angle is not None:
+            rotated = False
+            for mt_obj in mt_obj_list:
+                # check if data already rotated
+                angle_to_rotate = self.rotation_angle - mt_obj.Z.rotation_angle
+                if np.any(angle_to_rotate != 0):
+                    mt_obj.Z.rotate(angle_to_rotate)
+                    mt_obj.Tipper.rotate(angle_to_rotate)
+                    rotated = True
+            # the interpolated data are out of date
+            if rotated:
+                data_cube.reset_cache()
+
+        # get only those periods that are within the station data
+        interp_mask = np.array([(self.period_list >= 1./mt_obj.Z.freq.max()) &
+                                (self.period_list <= 1./mt_obj.Z.freq.min())
+                                for mt_obj in mt_obj_list])
+
+        #interpolate all stations over those periods at once
+        interp_z, interp_z_err, interp_t, interp_t_err = \
+                            data_cube.interpolate(1./self.period_list,
+                                                  freq_mask=interp_mask)
+        self.data['z_data'] = interp_z*zconv
+        self.data['z_data_err'] = interp_z_err*zconv
+
+        for mt_obj, p_mask in zip(mt_obj_list, interp_mask):
             print('{0}{1}{0}'.format('-'*20, mt_obj.station))
-
-            # get only those periods that are within the station data
-            interp_periods = self.period_list[np.where(
-                                (self.period_list >= 1./mt_obj.Z.freq.max()) &
-                                (self.period_list <= 1./mt_obj.Z.freq.min()))]
-
-            #interpolate over those periods
-            interp_z, interp_t = mt_obj.interpolate(1./interp_periods)
-
-            for kk, ff in enumerate(interp_periods):
-                jj = np.where(self.period_list == ff)[0][0]
+            for ff in self.period_list[p_mask]:
                 print('    {0:.6g} (s)'.format(ff))
 
-                self.data[ss]['z_data'][jj, :] = interp_z.z[kk, :, :]*zconv
-                self.data[ss]['z_data_err'][jj, :] = interp_z.z_err[kk, :, :]*zconv
-
 
     def compute_errors(self):
         """
@@ -409,63 +533,46 @@ class WSData(object):
         #-----Write data file--------------------------------------------------
         n_stations = len(self.data)
         n_periods = self.data[0]['z_data'].shape[0]
-
-        ofid = file(self.data_fn, 'w')
-        ofid.write('{0:d} {1:d} {2:d}\n'.format(n_stations, n_periods,
-                                                self.n_z))
-
-        #write N-S locations
-        ofid.write('Station_Location: N-S \n')
-        for ii in range(n_stations/self.n_z+1):
-            for ll in range(self.n_z):
-                index = ii*self.n_z+ll
-                try:
-                    ofid.write('{0:+.4e} '.format(self.data['north'][index]))
-                except IndexError:
-                    pass
-            ofid.write('\n')
-
-        #write E-W locations
-        ofid.write('Station_Location: E-W \n')
-        for ii in range(n_stations/self.n_z+1):
-            for ll in range(self.n_z):
-                index = ii*self.n_z+ll
-                try:
-                    ofid.write('{0:+.4e} '.format(self.data['east'][index]))
-                except IndexError:
-                    pass
-            ofid.write('\n')
-
-        #write impedance tensor components
-        for ii, p1 in enumerate(self.period_list):
-            ofid.write('DATA_Period: {0:3.6f}\n'.format(p1))
-            for ss in range(n_stations):
-                zline = self.data[ss]['z_data'][ii].reshape(4,)
-                for jj in range(self.n_z/2):
-                    ofid.write('{0:+.4e} '.format(zline[jj].real))
-                    ofid.write('{0:+.4e} '.format(-zline[jj].imag))
-                ofid.write('\n')
-
-        #write error as a percentage of Z
-        for ii, p1 in enumerate(self.period_list):
-            ofid.write('ERROR_Period: {0:3.6f}\n'.format(p1))
-            for ss in range(n_stations):
-                zline = self.data[ss]['z_data_err'][ii].reshape(4,)
-                for jj in range(self.n_z/2):
-                    ofid.write('{0:+.4e} '.format(zline[jj].real))
-                    ofid.write('{0:+.4e} '.format(zline[jj].imag))
-                ofid.write('\n')
-
-        #write error maps
-        for ii, p1 in enumerate(self.period_list):
-            ofid.write('ERMAP_Period: {0:3.6f}\n'.format(p1))
-            for ss in range(n_stations):
-                zline = self.data[ss]['z_err_map'][ii].reshape(4,)
-                for jj in range(self.n_z/2):
-                    ofid.write('{0:.5e} '.format(self.z_err_map[jj]))
-                    ofid.write('{0:.5e} '.format(self.z_err_map[jj]))
-                ofid.write('\n')
-        ofid.close()
+        n_comp = self.n_z//2
+
+        #impedance components as (n_periods, n_stations, n_comp)
+        z_data = np.swapaxes(self.data['z_data'], 0, 1).reshape(
+                                n_periods, n_stations, 4)[:, :, :n_comp]
+        z_err = np.swapaxes(self.data['z_data_err'], 0, 1).reshape(
+                                n_periods, n_stations, 4)[:, :, :n_comp]
+        z_data = np.stack((z_data.real, -z_data.imag), axis=-1)
+        z_err = np.stack((z_err.real, z_err.imag), axis=-1)
+
+        #the error map is the same for each station
+        ermap_line = ''.join(['{0:.5e} {0:.5e} '.format(self.z_err_map[jj])
+                              for jj in range(n_comp)])+'\n'
+
+        with open(self.data_fn, 'w') as ofid:
+            ofid.write('{0:d} {1:d} {2:d}\n'.format(n_stations, n_periods,
+                                                    self.n_z))
+
+            #write station locations, n_z to a line
+            for key, name in [('north', 'N-S'), ('east', 'E-W')]:
+                ofid.write('Station_Location: {0} \n'.format(name))
+                ofid.write(_format_block(self.data[key], '{:+.4e} ',
+                                         self.n_z))
+                if n_stations % self.n_z == 0:
+                    ofid.write('\n')
+
+            #write impedance tensor components
+            for ii, p1 in enumerate(self.period_list):
+                ofid.write('DATA_Period: {0:3.6f}\n'.format(p1))
+                ofid.write(_format_block(z_data[ii], '{:+.4e} ', self.n_z))
+
+            #write error as a percentage of Z
+            for ii, p1 in enumerate(self.period_list):
+                ofid.write('ERROR_Period: {0:3.6f}\n'.format(p1))
+                ofid.write(_format_block(z_err[ii], '{:+.4e} ', self.n_z))
+
+            #write error maps
+            for ii, p1 in enumerate(self.period_list):
+                ofid.write('ERMAP_Period: {0:3.6f}\n'.format(p1))
+                ofid.write(ermap_line*n_stations)
         print('Wrote file to: {0}'.format(self.data_fn))
 
         self.station_east = self.data['east']
@@ -517,14 +624,13 @@ class WSData(object):
 
         self.save_path = os.path.dirname(self.data_fn)
 
-        dfid = file(self.data_fn, 'r')
-        dlines = dfid.readlines()
+        with open(self.data_fn, 'r') as dfid:
+            dlines = dfid.readlines()
 
         #get size number of stations, number of frequencies,
         # number of Z components
         n_stations, n_periods, nz = np.array(dlines[0].strip().split(),
                                              dtype='int')
-        nsstart = 2
 
         self.n_z = nz
         #make a structured array to keep things in for convenience
@@ -537,16 +643,7 @@ class WSData(object):
                       ('z_err_map', (np.complex, z_shape))]
         self.data = np.zeros(n_stations, dtype=data_dtype)
 
-        findlist = []
-        for ii, dline in enumerate(dlines[1:50], 1):
-            if dline.find('Station_Location: N-S') == 0:
-                findlist.append(ii)
-            elif dline.find('Station_Location: E-W') == 0:
-                findlist.append(ii)
-            elif dline.find('DATA_Period:') == 0:
-                findlist.append(ii)
-
-        ncol = len(dlines[nsstart].strip().split())
+        findlist = _find_data_sections(dlines)
 
         #get site names if entered a sites file
         if wl_sites_fn != None:
@@ -562,73 +659,31 @@ class WSData(object):
         else:
             self.data['station'] = np.arange(n_stations)
 
+        #get N-S and E-W locations
+        self.data['north'] = _read_location_block(
+                            dlines[findlist[0]+1:findlist[1]], n_stations)
+        self.data['east'] = _read_location_block(
+                            dlines[findlist[1]+1:findlist[2]], n_stations)
 
-        #get N-S locations
-        for ii, dline in enumerate(dlines[findlist[0]+1:findlist[1]],0):
-            dline = dline.strip().split()
-            for jj in range(ncol):
-                try:
-                    self.data['north'][ii*ncol+jj] = float(dline[jj])
-                except IndexError:
-                    pass
-                except ValueError:
-                    break
-
-        #get E-W locations
-        for ii, dline in enumerate(dlines[findlist[1]+1:findlist[2]],0):
-            dline = dline.strip().split()
-            for jj in range(self.n_z):
-                try:
-                    self.data['east'][ii*ncol+jj] = float(dline[jj])
-                except IndexError:
-                    pass
-                except ValueError:
-                    break
-        #make some empty array to put stuff into
+        #get data, each block is a period of data, error or error map
+        header_list, values = _read_period_blocks(dlines[findlist[2]:],
+                                                  n_stations)
         self.period_list = np.zeros(n_periods)
-
-        #get data
-        per = 0
-        error_find = False
-        errmap_find = False
-        for ii, dl in enumerate(dlines[findlist[2]:]):
-            if dl.lower().find('period') > 0:
-                st = 0
-
-                if dl.lower().find('data') == 0:
-                    dkey = 'z_data'
-                    self.period_list[per] = float(dl.strip().split()[1])
-
-                elif dl.lower().find('error') == 0:
-                    dkey = 'z_data_err'
-                    if not error_find:
-                        error_find = True
-                        per = 0
-
-                elif dl.lower().find('ermap') == 0:
-                    dkey = 'z_err_map'
-                    if not errmap_find:
-                        errmap_find = True
-                        per = 0
-
-                #print '-'*20+dkey+'-'*20
-                per += 1
-
+        per_dict = {'z_data':0, 'z_data_err':0, 'z_err_map':0}
+        for header, block in zip(header_list, values):
+            if header.lower().find('data') == 0:
+                dkey = 'z_data'
+                self.period_list[per_dict[dkey]] = float(header.strip().split()[1])
+            elif header.lower().find('error') == 0:
+                dkey = 'z_data_err'
+            elif header.lower().find('ermap') == 0:
+                dkey = 'z_err_map'
+
+            if dkey == 'z_err_map':
+                self.data[dkey][:, per_dict[dkey]] = _values_to_z(block)
             else:
-                if dkey == 'z_err_map':
-                    zline = np.array(dl.strip().split(), dtype=np.float)
-                    self.data[st][dkey][per-1,:] = np.array([[zline[0]-1j*zline[1],
-                                                        zline[2]-1j*zline[3]],
-                                                        [zline[4]-1j*zline[5],
-                                                        zline[6]-1j*zline[7]]])
-                else:
-                    zline = np.array(dl.strip().split(), dtype=np.float)*zconv
-                    self.data[st][dkey][per-1,:] = np.array([[zline[0]-1j*zline[1],
-                                                        zline[2]-1j*zline[3]],
-                                                        [zline[4]-1j*zline[5],
-                                                        zline[6]-1j*zline[7]]])
-                st += 1
-
+                self.data[dkey][:, per_dict[dkey]] = _values_to_z(block*zconv)
+            per_dict[dkey] += 1
 
         self.station_east = self.data['east']
         self.station_north = self.data['north']
@@ -1524,80 +1579,49 @@ class WSMesh(object):
             nr = len(self.res_list)
 
         #--> write file
-        ifid = file(self.initial_fn, 'w')
-        ifid.write('# {0}\n'.format(self.title.upper()))
-        ifid.write('{0} {1} {2} {3}\n'.format(self.nodes_north.shape[0],
-                                              self.nodes_east.shape[0],
-                                              self.nodes_z.shape[0],
-                                              nr))
-
-        #write S --> N node block
-        for ii, nnode in enumerate(self.nodes_north):
-            ifid.write('{0:>12.1f}'.format(abs(nnode)))
-            if ii != 0 and np.remainder(ii+1, 5) == 0:
-                ifid.write('\n')
-            elif ii == self.nodes_north.shape[0]-1:
-                ifid.write('\n')
-
-        #write W --> E node block
-        for jj, enode in enumerate(self.nodes_east):
-            ifid.write('{0:>12.1f}'.format(abs(enode)))
-            if jj != 0 and np.remainder(jj+1, 5) == 0:
-                ifid.write('\n')
-            elif jj == self.nodes_east.shape[0]-1:
-                ifid.write('\n')
-
-        #write top --> bottom node block
-        for kk, zz in enumerate(self.nodes_z):
-            ifid.write('{0:>12.1f}'.format(abs(zz)))
-            if kk != 0 and np.remainder(kk+1, 5) == 0:
-                ifid.write('\n')
-            elif kk == self.nodes_z.shape[0]-1:
-                ifid.write('\n')
-
-        #write the resistivity list
-        if nr > 0:
-            for ff in self.res_list:
-                ifid.write('{0:.1f} '.format(ff))
-            ifid.write('\n')
-        else:
-            pass
-
-        if self.res_model == None:
-            ifid.close()
-        else:
+        with open(self.initial_fn, 'w') as ifid:
+            ifid.write('# {0}\n'.format(self.title.upper()))
+            ifid.write('{0} {1} {2} {3}\n'.format(self.nodes_north.shape[0],
+                                                  self.nodes_east.shape[0],
+                                                  self.nodes_z.shape[0],
+                                                  nr))
+
+            #write S --> N, W --> E and top --> bottom node blocks
+            for nodes in [self.nodes_north, self.nodes_east, self.nodes_z]:
+                ifid.write(_format_block(np.abs(nodes), '{:>12.1f}', 5))
+
+            #write the resistivity list
             if nr > 0:
-                if self.res_model_int is None:
-                    self.convert_model_to_int()
-                #need to flip the array such that the 1st index written is the
-                #northern most value
-                write_res_model = self.res_model_int[::-1, :, :]
-                #get similar layers
-            else:
-                write_res_model = self.res_model[::-1, :, :]
-            l1 = 0
-            layers = []
-            for zz in range(self.nodes_z.shape[0]-1):
-                if (write_res_model[:, :, zz] ==
-                    write_res_model[:, :, zz+1]).all() == False:
-                    layers.append((l1, zz))
-                    l1 = zz+1
-            #need to add on the bottom layers
-            layers.append((l1, self.nodes_z.shape[0]-1))
-
-            #write out the layers from resmodel
-            for ll in layers:
-                ifid.write('{0} {1}\n'.format(ll[0]+1, ll[1]+1))
-                for nn in range(self.nodes_north.shape[0]):
-                    for ee in range(self.nodes_east.shape[0]):
-                        if nr > 0:
-                            ifid.write('{0:>3.0f}'.format(
-                                          write_res_model[nn, ee, ll[0]]))
-                        else:
-                            ifid.write('{0:>8.1f}'.format(
-                                          write_res_model[nn, ee, ll[0]]))
-                    ifid.write('\n')
-            ifid.close()
+                ifid.write(''.join(['{0:.1f} '.format(ff)
+                                    for ff in self.res_list])+'\n')
+
+            if self.res_model is not None:
+                if nr > 0:
+                    if self.res_model_int is None:
+                        self.convert_model_to_int()
+                    #need to flip the array such that the 1st index written
+                    #is the northern most value
+                    write_res_model = self.res_model_int[::-1, :, :]
+                    value_fmt = '{:>3.0f}'
+                else:
+                    write_res_model = self.res_model[::-1, :, :]
+                    value_fmt = '{:>8.1f}'
+
+                #get similar layers, a layer starts where it differs from
+                #the layer above
+                n_z = self.nodes_z.shape[0]
+                layer_change = np.any(write_res_model[:, :, 1:n_z] !=
+                                      write_res_model[:, :, 0:n_z-1],
+                                      axis=(0, 1))
+                layer_top = np.append(0, np.nonzero(layer_change)[0]+1)
+                layer_bottom = np.append(layer_top[1:]-1, n_z-1)
+
+                #write out the layers from resmodel
+                for l1, l2 in zip(layer_top, layer_bottom):
+                    ifid.write('{0} {1}\n'.format(l1+1, l2+1))
+                    ifid.write(_format_block(write_res_model[:, :, l1],
+                                             value_fmt,
+                                             self.nodes_east.shape[0]))
 
         print('Wrote file to: {0}'.format(self.initial_fn))
 
@@ -1635,9 +1659,8 @@ class WSMesh(object):
 
         """
         self.initial_fn = initial_fn
-        ifid = file(self.initial_fn, 'r')
-        ilines = ifid.readlines()
-        ifid.close()
+        with open(self.initial_fn, 'r') as ifid:
+            ilines = ifid.readlines()
 
         self.title = ilines[0].strip()
 
@@ -1648,37 +1671,16 @@ class WSMesh(object):
         n_z = int(nsize[2])
 
         #initialize empy arrays to put things into
-        self.nodes_north = np.zeros(n_north)
-        self.nodes_east = np.zeros(n_east)
-        self.nodes_z = np.zeros(n_z)
         self.res_model_int = np.zeros((n_north, n_east, n_z))
         self.res_model = np.zeros((n_north, n_east, n_z))
 
         #get the grid line locations
         line_index = 2       #line number in file
-        count_n = 0  #number of north nodes found
-        while count_n < n_north:
-            iline = ilines[line_index].strip().split()
-            for north_node in iline:
-                self.nodes_north[count_n] = float(north_node)
-                count_n += 1
-            line_index += 1
-
-        count_e = 0  #number of east nodes found
-        while count_e < n_east:
-            iline = ilines[line_index].strip().split()
-            for east_node in iline:
-                self.nodes_east[count_e] = float(east_node)
-                count_e += 1
-            line_index += 1
-
-        count_z = 0  #number of vertical nodes
-        while count_z < n_z:
-            iline = ilines[line_index].strip().split()
-            for z_node in iline:
-                self.nodes_z[count_z] = float(z_node)
-                count_z += 1
-            line_index += 1
+        self.nodes_north, line_index = _read_node_block(ilines, line_index,
+                                                        n_north)
+        self.nodes_east, line_index = _read_node_block(ilines, line_index,
+                                                       n_east)
+        self.nodes_z, line_index = _read_node_block(ilines, line_index, n_z)
 
         #put the grids into coordinates relative to the center of the grid
         self.grid_north = self.nodes_north.copy()
@@ -1719,29 +1721,30 @@ class WSMesh(object):
             self.res_model_int[:, :, :] = 1
             return
         else:
+            res_array = np.array(self.res_list)
             while line_index < len(ilines):
                 iline = ilines[line_index].strip().split()
-                if len(iline) == 2:
-                    l1 = int(iline[0])-1
-                    l2 = int(iline[1])
-                    if l1 == l2:
-                        l2 += 1
-                    line_index += 1
-                    count_n = 0
-                elif len(iline) == 0:
+                if len(iline) == 0:
                     break
-                else:
-                    count_e = 0
-                    while count_e < n_east:
-                        #be sure the indes of res list starts at 0 not 1 as
-                        #in ws3dinv
-                        self.res_model[count_n, count_e, l1:l2] =\
-                                        self.res_list[int(iline[count_e])-1]
-                        self.res_model_int[count_n, count_e, l1:l2] =\
-                                            int(iline[count_e])
-                        count_e += 1
-                    count_n += 1
-                    line_index += 1
+                l1 = int(iline[0])-1
+                l2 = int(iline[1])
+                if l1 == l2:
+                    l2 += 1
+                line_index += 1
+
+                #each layer block is a line of n_east values for each row
+                #be sure the index of res list starts at 0 not 1 as in ws3dinv
+                layer = np.fromstring(
+                            ' '.join(ilines[line_index:line_index+n_north]),
+                            sep=' ').astype(np.int)
+                if layer.size != n_north*n_east:
+                    raise WSInputError('Expected {0} x {1} values for layers '
+                                       '{2} to {3}, found {4}'.format(
+                                       n_north, n_east, l1+1, l2, layer.size))
+                layer = layer.reshape(n_north, n_east, 1)
+                self.res_model[:, :, l1:l2] = res_array[layer-1]
+                self.res_model_int[:, :, l1:l2] = layer
+                line_index += n_north
             # Need to be sure that the resistivity array matches
             # with the grids, such that the first index is the
             # furthest south, even though ws3dinv outputs as first
@@ -1812,9 +1815,8 @@ class WSModel(object):
         read in a model file as x-north, y-east, z-positive down
         """
 
-        mfid = file(self.model_fn, 'r')
-        mlines = mfid.readlines()
-        mfid.close()
+        with open(self.model_fn, 'r') as mfid:
+            mlines = mfid.readlines()
 
         #get info at the beggining of file
         info = mlines[0].strip().split()
@@ -1829,37 +1831,13 @@ class WSModel(object):
         n_north, n_east, n_z, n_res = np.array(mlines[1].strip().split(),
                                                dtype=np.int)
 
-        #make empty arrays to put stuff into
-        self.nodes_north = np.zeros(n_north)
-        self.nodes_east = np.zeros(n_east)
-        self.nodes_z = np.zeros(n_z)
-        self.res_model = np.zeros((n_north, n_east, n_z))
-
         #get the grid line locations
         line_index = 2       #line number in file
-        count_n = 0  #number of north nodes found
-        while count_n < n_north:
-            mline = mlines[line_index].strip().split()
-            for north_node in mline:
-                self.nodes_north[count_n] = float(north_node)
-                count_n += 1
-            line_index += 1
-
-        count_e = 0  #number of east nodes found
-        while count_e < n_east:
-            mline = mlines[line_index].strip().split()
-            for east_node in mline:
-                self.nodes_east[count_e] = float(east_node)
-                count_e += 1
-            line_index += 1
-
-        count_z = 0  #number of vertical nodes
-        while count_z < n_z:
-            mline = mlines[line_index].strip().split()
-            for z_node in mline:
-                self.nodes_z[count_z] = float(z_node)
-                count_z += 1
-            line_index += 1
+        self.nodes_north, line_index = _read_node_block(mlines, line_index,
+                                                        n_north)
+        self.nodes_east, line_index = _read_node_block(mlines, line_index,
+                                                       n_east)
+        self.nodes_z, line_index = _read_node_block(mlines, line_index, n_z)
 
         #put the grids into coordinates relative to the center of the grid
         self.grid_north = self.nodes_north.copy()
@@ -1882,15 +1860,18 @@ class WSModel(object):
 
         self.grid_z = np.array([self.nodes_z[:ii+1].sum() for ii in range(n_z)])
 
-        #--> get resistivity values
-        #need to read in the north backwards so that the first index is
-        #southern most point
-        for kk in range(n_z):
-            for jj in range(n_east):
-                for ii in range(n_north):
-                    self.res_model[(n_north-1)-ii, jj, kk] = \
-                                             float(mlines[line_index].strip())
-                    line_index += 1
+        #--> get resistivity values, one to a line with north changing
+        #fastest, need to read in the north backwards so that the first index
+        #is southern most point
+        n_cells = n_north*n_east*n_z
+        res_values = np.fromstring(
+                        ' '.join(mlines[line_index:line_index+n_cells]),
+                        sep=' ')
+        if res_values.size != n_cells:
+            raise WSInputError('Expected {0} resistivity values, found '
+                               '{1}'.format(n_cells, res_values.size))
+        self.res_model = np.ascontiguousarray(
+                res_values.reshape(n_z, n_east, n_north).transpose(2, 1, 0)[::-1])
 
     def write_vtk_file(self, save_fn):
         """
@@ -2749,14 +2730,13 @@ class WSResponse(object):
         if not os.path.isfile(self.resp_fn):
             raise WSInputError('Cannot find {0}, check path'.format(self.resp_fn))
 
-        dfid = file(self.resp_fn, 'r')
-        dlines = dfid.readlines()
+        with open(self.resp_fn, 'r') as dfid:
+            dlines = dfid.readlines()
 
         #get size number of stations, number of frequencies,
         # number of Z components
         n_stations, n_periods, nz = np.array(dlines[0].strip().split(),
                                              dtype='int')
-        nsstart = 2
 
         self.n_z = nz
         #make a structured array to keep things in for convenience
@@ -2768,16 +2748,7 @@ class WSResponse(object):
                       ('z_resp_err', (np.complex, z_shape))]
         self.resp = np.zeros(n_stations, dtype=resp_dtype)
 
-        findlist = []
-        for ii, dline in enumerate(dlines[1:50], 1):
-            if dline.find('Station_Location: N-S') == 0:
-                findlist.append(ii)
-            elif dline.find('Station_Location: E-W') == 0:
-                findlist.append(ii)
-            elif dline.find('DATA_Period:') == 0:
-                findlist.append(ii)
-
-        ncol = len(dlines[nsstart].strip().split())
+        findlist = _find_data_sections(dlines)
 
         #get site names if entered a sites file
         if self.wl_sites_fn != None:
@@ -2791,50 +2762,26 @@ class WSResponse(object):
         else:
             self.resp['station'] = np.arange(n_stations)
 
+        #get N-S and E-W locations
+        self.resp['north'] = _read_location_block(
+                            dlines[findlist[0]+1:findlist[1]], n_stations)
+        self.resp['east'] = _read_location_block(
+                            dlines[findlist[1]+1:findlist[2]], n_stations)
+
+        #get resp, which ends at the iteration information
+        resp_lines = dlines[findlist[2]:]
+        for ii, dl in enumerate(resp_lines):
+            if dl.lower().find('#iteration') >= 0:
+                resp_lines = resp_lines[:ii]
+                break
+        header_list, values = _read_period_blocks(resp_lines, n_stations)
 
-        #get N-S locations
-        for ii, dline in enumerate(dlines[findlist[0]+1:findlist[1]],0):
-            dline = dline.strip().split()
-            for jj in range(ncol):
-                try:
-                    self.resp['north'][ii*ncol+jj] = float(dline[jj])
-                except IndexError:
-                    pass
-                except ValueError:
-                    break
-
-        #get E-W locations
-        for ii, dline in enumerate(dlines[findlist[1]+1:findlist[2]],0):
-            dline = dline.strip().split()
-            for jj in range(self.n_z):
-                try:
-                    self.resp['east'][ii*ncol+jj] = float(dline[jj])
-                except IndexError:
-                    pass
-                except ValueError:
-                    break
-        #make some empty array to put stuff into
         self.period_list = np.zeros(n_periods)
-
-        #get resp
-        per = 0
-        for ii, dl in enumerate(dlines[findlist[2]:]):
-            if dl.lower().find('period') > 0:
-                st = 0
-                if dl.lower().find('data') == 0:
-                    dkey = 'z_resp'
-                    self.period_list[per] = float(dl.strip().split()[1])
-                per += 1
-
-            elif dl.lower().find('#iteration') >= 0:
-                break
-            else:
-                zline = np.array(dl.strip().split(),dtype=np.float)*self._zconv
-                self.resp[st][dkey][per-1,:] = np.array([[zline[0]-1j*zline[1],
-                                                         zline[2]-1j*zline[3]],
-                                                         [zline[4]-1j*zline[5],
-                                                         zline[6]-1j*zline[7]]])
-                st += 1
+        for per, header in enumerate(header_list):
+            if header.lower().find('data') == 0:
+                self.period_list[per] = float(header.strip().split()[1])
+        self.resp['z_resp'][:, :len(header_list)] = np.swapaxes(
+                                    _values_to_z(values*self._zconv), 0, 1)
 
         self.station_east = self.resp['east']
         self.station_north = self.resp['north']
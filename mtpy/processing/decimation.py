@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Decimate MTpy time series (TS) files.
+
+The data are low pass filtered with a polyphase FIR anti-alias filter and
+only every factor'th filtered sample is computed.  The filter state is
+carried from one block of data to the next, so a file is streamed through
+in blocks and the result is the same as filtering the whole record at once.
+The filter delay is removed, so decimated samples line up with the original
+ones and the start time of the file does not change.
+
+Directories of files are decimated in a pool of processes.
+
+:Example: ::
+
+    >>> import mtpy.processing.decimation as decimation
+    >>> decimation.decimate_ts_file(r"/home/mt/ts/mt01_ex.ts",
+    ...                             r"/home/mt/ts_10/mt01_ex.ts", 10)
+    >>> results = decimation.decimate_directory(r"/home/mt/ts",
+    ...                                         r"/home/mt/ts_10", 10)
+    >>> failed = [res for res in results if res.status == 'failed']
+
+"""
+
+# ==============================================================================
+import os
+import shutil
+from collections import namedtuple
+
+import numpy as np
+import scipy.signal as sps
+
+import mtpy.processing.tasks as MTtasks
+import mtpy.utils.exceptions as MTex
+import mtpy.utils.filehandling as MTfh
+from mtpy.utils.mtpylog import MtPyLog
+
+_logger = MtPyLog.get_mtpy_logger(__name__)
+
+DecimateResult = namedtuple('DecimateResult', ['fn', 'out_fn', 'status',
+                                               'error'])
+DecimateResult.__doc__ = """
+result of decimating one file, status is 'decimated' or 'failed', error holds
+the traceback of a failed file
+"""
+
+
+# ==============================================================================
+class PolyphaseDecimator(object):
+    """
+    decimate a time series that comes in blocks with an FIR anti-alias filter.
+
+    The filter is a windowed sinc with n_half zero crossings on each side,
+    the same as scipy.signal.decimate with ftype='fir'.  Decimated sample k
+    is centred on sample k*factor of the input, samples before the start and
+    after the end of the data are the first and last sample (pad='edge') or
+    zeros (pad='zeros').
+
+    :Example: ::
+
+        >>> decimator = PolyphaseDecimator(10)
+        >>> new_data = [decimator.decimate(block) for block in blocks]
+        >>> new_data.append(decimator.flush())
+        >>> new_data = np.concatenate(new_data)
+    """
+
+    def __init__(self, factor, n_half=10, window='hamming', pad='edge'):
+        if int(factor) != factor or factor < 1:
+            raise MTex.MTpyError_inputarguments('Decimation factor must be '
+                                                'an integer >= 1, not '
+                                                '{0}'.format(factor))
+        if pad not in ['edge', 'zeros']:
+            raise MTex.MTpyError_inputarguments("pad must be 'edge' or "
+                                                "'zeros', not {0}".format(pad))
+        self.factor = int(factor)
+        self.pad = pad
+
+        if self.factor == 1:
+            self.fir = np.array([1.])
+        else:
+            self.fir = sps.firwin(2 * n_half * self.factor + 1,
+                                  1. / self.factor, window=window)
+        self.delay = (self.fir.size - 1) // 2
+
+        self.reset()
+
+    def reset(self):
+        """
+        start a new time series
+        """
+        self.n_in = 0
+        self.n_out = 0
+        self._history = None
+        self._last = 0.
+
+    def decimate(self, data):
+        """
+        decimate the next block of the time series, returns the decimated
+        samples that can be computed from the data so far
+        """
+        data = np.asarray(data, dtype=np.float64).ravel()
+        if data.size == 0:
+            return np.zeros(0)
+
+        if self._history is None:
+            fill = data[0] if self.pad == 'edge' else 0.
+            self._history = np.full(self.fir.size - 1, fill)
+
+        x = np.concatenate((self._history, data))
+        self.n_in += data.size
+        self._history = x[x.size - (self.fir.size - 1):]
+        self._last = data[-1]
+
+        return self._filter(x, self.n_in)
+
+    def flush(self):
+        """
+        decimated samples at the end of the time series, which need samples
+        past the end of the data.  The decimator is reset after.
+        """
+        if self._history is None:
+            return np.zeros(0)
+
+        n_total = -(-self.n_in // self.factor)
+        fill = self._last if self.pad == 'edge' else 0.
+        x = np.concatenate((self._history,
+                            np.full(self.delay + self.factor, fill)))
+        y = self._filter(x, self.n_in + self.delay + self.factor)
+        y = y[:y.size - (self.n_out - n_total)]
+
+        self.reset()
+        return y
+
+    def _filter(self, x, n_end):
+        """
+        decimated samples not computed yet that only need samples in x, x
+        ends with input sample n_end - 1
+        """
+        q = self.factor
+        n_new = (n_end - 1 - self.delay) // q + 1 - self.n_out
+        if n_new <= 0:
+            return np.zeros(0)
+
+        # start x at the first sample needed for the next output, so that
+        # output aligns with the polyphase output of upfirdn
+        start = self.n_out * q + self.delay - (self.fir.size - 1) - \
+            (n_end - x.size)
+        m0 = (self.fir.size - 1) // q
+        y = sps.upfirdn(self.fir, x[start:], 1, q)[m0:m0 + n_new]
+
+        self.n_out += n_new
+        return y
+
+
+def decimate(data, factor, **kwargs):
+    """
+    decimate a whole time series, keyword arguments are passed to
+    PolyphaseDecimator
+
+    :returns: decimated time series of length ceil(len(data)/factor)
+    :rtype: np.ndarray
+    """
+    decimator = PolyphaseDecimator(factor, **kwargs)
+    return np.concatenate((decimator.decimate(data), decimator.flush()))
+
+
+# ==============================================================================
+def decimate_ts_file(fn, out_fn, factor, block_len=2**20, fmt='%.8g'):
+    """
+    decimate an MTpy TS file block by block, so files of any length are
+    decimated in the same memory.  The sampling rate and number of samples
+    in the header are updated, files without a header are written without
+    one.
+
+    :param fn: full path to TS file
+    :param out_fn: full path to save decimated file to
+    :param factor: integer decimation factor
+    :param block_len: number of samples to read at a time
+    :param fmt: format of the decimated samples
+
+    :returns: out_fn
+    """
+    try:
+        header = MTfh.read_ts_header(fn)
+    except MTex.MTpyError_ts_data:
+        header = None
+
+    decimator = PolyphaseDecimator(factor)
+
+    # the number of samples is only known at the end, so the samples are
+    # written first and the header put in front after
+    body_fn = out_fn if header is None else out_fn + '.body'
+    with open(body_fn, 'w') as fid:
+        for block in MTfh.iter_ts_data(fn, block_len=block_len):
+            MTfh.write_ts_data(fid, decimator.decimate(block), fmt=fmt)
+        n_in = decimator.n_in
+        MTfh.write_ts_data(fid, decimator.flush(), fmt=fmt)
+
+    if n_in == 0:
+        os.remove(body_fn)
+        raise MTex.MTpyError_ts_data('No data found in {0}'.format(fn))
+    if n_in % factor != 0:
+        _logger.warning('{0} samples in {1} is not a multiple of '
+                        '{2}'.format(n_in, fn, factor))
+
+    if header is not None:
+        header['nsamples'] = -(-n_in // factor)
+        if 'samplingrate' in header:
+            header['samplingrate'] = header['samplingrate'] / float(factor)
+
+        with open(out_fn, 'w') as fid:
+            fid.write(MTfh.get_ts_header_string(header))
+            with open(body_fn, 'r') as body_fid:
+                shutil.copyfileobj(body_fid, fid)
+        os.remove(body_fn)
+
+    return out_fn
+
+
+def _decimate_result(task, out_fn, status, error):
+    """
+    result of decimating the file of a task
+    """
+    return DecimateResult(task[0], task[1] if out_fn is None else out_fn,
+                          status, error)
+
+
+def decimate_directory(in_dir, out_dir, factor, block_len=2**20, fmt='%.8g',
+                       n_processes=None):
+    """
+    decimate all the files in a directory, the files are decimated in a pool
+    of processes and saved with the same names in out_dir.  Errors do not
+    stop the decimation, they are returned in the results.
+
+    :param in_dir: directory of TS files
+    :param out_dir: directory to save decimated files to, must not be in_dir
+    :param factor: integer decimation factor
+    :param block_len: number of samples to read at a time
+    :param fmt: format of the decimated samples
+    :param n_processes: number of processes, *default* is None, which uses
+                        the number of cpus
+
+    :returns: one result for each file, in order of file name
+    :rtype: list of DecimateResult
+    """
+    if os.path.abspath(in_dir) == os.path.abspath(out_dir):
+        raise MTex.MTpyError_inputarguments('Output directory cannot be the '
+                                            'same as the input directory')
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    task_list = [(os.path.join(in_dir, fn), os.path.join(out_dir, fn), factor,
+                  block_len, fmt)
+                 for fn in sorted(os.listdir(in_dir))
+                 if os.path.isfile(os.path.join(in_dir, fn))]
+
+    return MTtasks.run_tasks(decimate_ts_file, task_list, _decimate_result,
+                             'decimated', n_processes=n_processes,
+                             task_name='files')
@@ -0,0 +1,633 @@
+# -*- coding: utf-8 -*-
+"""
+Remove the instrument response from MTpy time series (TS) files.
+
+The response is given as a table of frequency, real and imaginary part, the
+same as the instrument response files in mtpy/uofa.  It is interpolated onto
+the frequencies of an FFT once and the inverse is kept for every FFT length
+and sampling rate asked for.  Frequencies outside of the table are removed.
+
+Long time series are deconvolved by overlap-add: the data are cut into
+Hann tapered windows that overlap by half, each window is zero padded on
+both sides and divided by the response in the frequency domain, and the
+deconvolved windows are added up again.  Apart from the padding this is the
+same as dividing the whole time series by the response at once.  The state
+is carried from one block of data to the next, so continuous data spread over
+many files are streamed through in the same memory.
+
+Continuous time axes of a directory of files are corrected in a pool of
+processes.
+
+:Example: ::
+
+    >>> import mtpy.processing.instrument as instrument
+    >>> results = instrument.remove_response_directory(
+    ...     r"/home/mt/ts", r"/home/mt/lemi_coils_response.txt",
+    ...     out_dir=r"/home/mt/ts_true", channels=['BX', 'BY'])
+    >>> failed = [res for res in results if res.status == 'failed']
+
+"""
+
+# ==============================================================================
+import os
+from collections import namedtuple
+
+import numpy as np
+import scipy.signal as sps
+
+import mtpy.processing.tasks as MTtasks
+import mtpy.utils.exceptions as MTex
+import mtpy.utils.filehandling as MTfh
+
+CorrectionResult = namedtuple('CorrectionResult', ['fn_list', 'out_fn_list',
+                                                   'status', 'error'])
+CorrectionResult.__doc__ = """
+result of correcting one continuous time axis, status is 'corrected' or
+'failed', error holds the traceback of a failed time axis
+"""
+
+
+# ==============================================================================
+class InstrumentResponse(object):
+    """
+    instrument response from a table of frequency, real and imaginary part.
+
+    The response is interpolated linearly in log frequency, separately for
+    the real and imaginary part.  The inverse response on an FFT grid is
+    computed once for each FFT length and sampling rate and cached.
+
+    :param response_data: array of shape (n, 3) or name of a file with
+                          3 columns: frequency, real, imaginary
+
+    :Example: ::
+
+        >>> response = InstrumentResponse(r"/home/mt/lemi_response.txt")
+        >>> inverse = response.get_inverse(2**16, 500.)
+    """
+
+    def __init__(self, response_data):
+        if isinstance(response_data, str):
+            response_fn = response_data
+            try:
+                response_data = np.loadtxt(response_fn)
+            except (IOError, OSError, ValueError):
+                raise MTex.MTpyError_inputarguments(
+                    'Could not read response file {0}'.format(response_fn))
+
+        response_data = np.atleast_2d(np.asarray(response_data, dtype=float))
+        if response_data.ndim != 2 or response_data.shape[1] != 3 or \
+                response_data.shape[0] < 2:
+            raise MTex.MTpyError_inputarguments(
+                'Response must be at least 2 rows of 3 columns: freq, real, '
+                'imag')
+        if np.any(response_data[:, 0] <= 0):
+            raise MTex.MTpyError_inputarguments(
+                'Response frequencies must be positive')
+
+        response_data = response_data[response_data[:, 0].argsort()]
+        self.freq = response_data[:, 0]
+        self.response = response_data[:, 1] + 1j * response_data[:, 2]
+
+        self._cache = {}
+
+    @property
+    def freq_min(self):
+        return self.freq[0]
+
+    @property
+    def freq_max(self):
+        return self.freq[-1]
+
+    @property
+    def longest_period(self):
+        return 1. / self.freq_min
+
+    def interpolate(self, freq):
+        """
+        complex response at frequencies freq, nan outside of the table
+        """
+        freq = np.asarray(freq, dtype=float)
+        response = np.full(freq.shape, np.nan, dtype=complex)
+
+        in_band = (freq >= self.freq_min) & (freq <= self.freq_max)
+        log_freq = np.log(freq[in_band])
+        response[in_band] = \
+            np.interp(log_freq, np.log(self.freq), self.response.real) + \
+            1j * np.interp(log_freq, np.log(self.freq), self.response.imag)
+
+        return response
+
+    def get_band_taper(self, freq):
+        """
+        cosine taper over the lowest and highest octave of the table, so
+        the inverse response does not ring for long at the band edges
+        """
+        freq = np.asarray(freq, dtype=float)
+        taper = np.zeros(freq.shape)
+        in_band = (freq >= self.freq_min) & (freq <= self.freq_max)
+        log_freq = np.log2(freq[in_band])
+
+        # octaves from the nearest band edge, tapers of narrow tables are
+        # narrower so they do not meet
+        width = min(1., np.log2(self.freq_max / self.freq_min) / 4.)
+        edge = np.minimum(log_freq - np.log2(self.freq_min),
+                          np.log2(self.freq_max) - log_freq)
+        taper[in_band] = 0.5 - 0.5 * np.cos(np.pi *
+                                            np.clip(edge / width, 0, 1))
+
+        return taper
+
+    def get_inverse(self, n_fft, samplingrate):
+        """
+        inverse response at the frequencies of a real FFT of length n_fft,
+        tapered to zero at the ends of the table
+
+        :returns: array of length n_fft // 2 + 1
+        """
+        key = (int(n_fft), float(samplingrate))
+        if key not in self._cache:
+            response = self.interpolate(np.fft.rfftfreq(key[0], 1. / key[1]))
+            inverse = np.zeros(response.size, dtype=complex)
+            in_band = np.isfinite(response) & (response != 0)
+            inverse[in_band] = 1. / response[in_band]
+            inverse *= self.get_band_taper(
+                np.fft.rfftfreq(key[0], 1. / key[1]))
+            self._cache[key] = inverse
+
+        return self._cache[key]
+
+
+def _get_response(response):
+    """
+    response as an InstrumentResponse
+    """
+    if isinstance(response, InstrumentResponse):
+        return response
+    return InstrumentResponse(response)
+
+
+def correct_for_instrument_response(data, samplingrate, responsedata):
+    """
+    remove the instrument response from a whole time series with one FFT.
+
+    The data are zero padded to avoid wrap around, frequencies outside of the
+    response table are removed.
+
+    :param data: 1D time series, should be detrended
+    :param samplingrate: sampling rate in Hz
+    :param responsedata: InstrumentResponse, array of freq, real, imag or
+                         name of a response file
+
+    :returns: corrected time series
+    :rtype: np.ndarray
+    """
+    data = np.asarray(data, dtype=float).ravel()
+    if data.size == 0:
+        return np.zeros(0)
+
+    response = _get_response(responsedata)
+    n_fft = 2**int(np.ceil(np.log2(2 * data.size)))
+    spectrum = np.fft.rfft(data, n_fft) * \
+        response.get_inverse(n_fft, samplingrate)
+
+    return np.fft.irfft(spectrum, n_fft)[:data.size]
+
+
+# ==============================================================================
+class ResponseDeconvolver(object):
+    """
+    remove the instrument response from a time series that comes in blocks.
+
+    The data are cut into Hann windows of window_len samples that overlap by
+    half.  Each window is zero padded by n_pad samples on both sides before
+    it is deconvolved, so that the deconvolved window can spread n_pad
+    samples before and after it without wrapping around.  The mean of the
+    first half window is taken off all of the data, which does not change
+    the result as the mean is outside of the response, but keeps a large
+    offset from ringing in the padding.  A linear trend, if given, is taken
+    off the data as they come in.
+
+    :param response: InstrumentResponse, array of freq, real, imag or name of
+                     a response file
+    :param samplingrate: sampling rate in Hz
+    :param window_len: samples in a window, *default* is None, which uses the
+                       longest period of the response
+    :param n_pad: samples of zeros on each side of a window, *default* is
+                  None, which uses at least window_len, as much as fits in
+                  the FFT length
+    :param trend: (intercept, slope) of a linear trend in the data, with the
+                  slope per sample, see get_trend
+
+    :Example: ::
+
+        >>> deconvolver = ResponseDeconvolver(response, 500.)
+        >>> new_data = [deconvolver.correct(block) for block in blocks]
+        >>> new_data.append(deconvolver.flush())
+        >>> new_data = np.concatenate(new_data)
+    """
+
+    def __init__(self, response, samplingrate, window_len=None, n_pad=None,
+                 trend=None):
+        self.response = _get_response(response)
+        self.samplingrate = float(samplingrate)
+        self.trend = trend
+
+        if window_len is None:
+            window_len = self.response.longest_period * self.samplingrate
+        self.hop = max(int(np.ceil(window_len / 2.)), 1)
+        self.window_len = 2 * self.hop
+        if n_pad is None:
+            # at least window_len, and all of the power of 2 FFT that is left
+            self.n_fft = 2**int(np.ceil(np.log2(3 * self.window_len)))
+            self.n_pad = (self.n_fft - self.window_len) // 2
+        else:
+            self.n_pad = int(n_pad)
+            self.n_fft = 2**int(np.ceil(np.log2(self.window_len +
+                                                2 * self.n_pad)))
+
+        # periodic Hann windows overlapping by half add up to 1
+        self.taper = sps.get_window('hann', self.window_len)
+        self.inverse = self.response.get_inverse(self.n_fft, self.samplingrate)
+
+        self.reset()
+
+    def reset(self):
+        """
+        start a new time series
+        """
+        self.n_in = 0
+        self.n_out = 0
+        # input samples not used up yet, starting at sample _data_start
+        self._data = np.zeros(0)
+        self._data_start = 0
+        # first sample of the next window
+        self._window_start = -self.hop
+        # sum of the deconvolved windows, starting at sample _sum_start
+        self._sum = np.zeros(0)
+        self._sum_start = -self.hop - self.n_pad
+        self._offset = None
+
+    def correct(self, data):
+        """
+        correct the next block of the time series, returns the corrected
+        samples that can be computed from the data so far
+        """
+        data = np.asarray(data, dtype=float).ravel()
+        if data.size == 0:
+            return np.zeros(0)
+
+        if self.trend is not None:
+            data = data - self.trend[0] - self.trend[1] * \
+                np.arange(self.n_in, self.n_in + data.size)
+
+        self._data = np.concatenate((self._data, data))
+        self.n_in += data.size
+
+        return self._process(False)
+
+    def flush(self):
+        """
+        corrected samples at the end of the time series, the deconvolver is
+        reset after
+        """
+        data = self._process(True)
+        self.reset()
+        return data
+
+    def _process(self, final):
+        """
+        deconvolve all the windows that have their data, or all the windows
+        that are left if final, and return the samples that are finished
+        """
+        while self._window_start < self.n_in:
+            if not final and self._window_start + self.window_len > self.n_in:
+                break
+            self._add(self._window_start - self.n_pad,
+                      self._deconvolve(self._window_start))
+            self._window_start += self.hop
+
+        n_drop = self._window_start - self._data_start
+        if n_drop > 0:
+            self._data = self._data[n_drop:]
+            self._data_start = self._window_start
+
+        # later windows only add to samples after their start - n_pad
+        if final:
+            return self._emit(self.n_in)
+        return self._emit(min(self._window_start - self.n_pad, self.n_in))
+
+    def _deconvolve(self, start):
+        """
+        deconvolve the window of samples start to start + window_len, samples
+        outside of the data are zero
+        """
+        n_start = max(start, 0)
+        n_end = min(start + self.window_len, self.n_in)
+
+        if self._offset is None:
+            self._offset = self._data[:self.hop].mean()
+
+        window = np.zeros(self.window_len)
+        window[n_start - start:n_end - start] = \
+            self._data[n_start - self._data_start:
+                       n_end - self._data_start] - self._offset
+
+        padded = np.zeros(self.n_fft)
+        padded[self.n_pad:self.n_pad + self.window_len] = window * self.taper
+
+        return np.fft.irfft(np.fft.rfft(padded) * self.inverse, self.n_fft)
+
+    def _add(self, start, data):
+        """
+        add deconvolved data that start at sample start to the sum
+        """
+        n_sum = start + data.size - self._sum_start
+        if n_sum > self._sum.size:
+            self._sum = np.concatenate((self._sum,
+                                        np.zeros(n_sum - self._sum.size)))
+        index = start - self._sum_start
+        self._sum[index:index + data.size] += data
+
+    def _emit(self, end):
+        """
+        return the finished samples up to sample end, samples before the
+        start of the data are dropped
+        """
+        n_emit = end - self._sum_start
+        if n_emit <= 0:
+            return np.zeros(0)
+
+        data = self._sum[:n_emit]
+        if data.size < n_emit:
+            data = np.concatenate((data, np.zeros(n_emit - data.size)))
+        data = data[max(self.n_out - self._sum_start, 0):]
+
+        self._sum = self._sum[n_emit:]
+        self._sum_start = end
+        self.n_out = max(self.n_out, end)
+
+        return data
+
+
+def get_trend(blocks):
+    """
+    least squares linear trend of a time series that comes in blocks
+
+    :returns: (intercept, slope) with the slope per sample
+    """
+    n_samples = 0
+    data_sum = 0.
+    index_data_sum = 0.
+    for block in blocks:
+        block = np.asarray(block, dtype=float).ravel()
+        data_sum += block.sum()
+        index_data_sum += np.dot(np.arange(n_samples,
+                                           n_samples + block.size), block)
+        n_samples += block.size
+
+    if n_samples == 0:
+        return 0., 0.
+    index_mean = (n_samples - 1) / 2.
+    if n_samples == 1:
+        slope = 0.
+    else:
+        slope = (index_data_sum - index_mean * data_sum) / \
+            (n_samples * (n_samples**2 - 1) / 12.)
+
+    return data_sum / n_samples - slope * index_mean, slope
+
+
+def remove_instrument_response(data, samplingrate, response, **kwargs):
+    """
+    remove the instrument response from a whole time series by overlap-add,
+    the data are detrended first.  Keyword arguments are passed to
+    ResponseDeconvolver.
+
+    :returns: corrected time series
+    :rtype: np.ndarray
+    """
+    kwargs.setdefault('trend', get_trend([data]))
+    deconvolver = ResponseDeconvolver(response, samplingrate, **kwargs)
+    return np.concatenate((deconvolver.correct(data), deconvolver.flush()))
+
+
+# ==============================================================================
+def get_time_axes(fn_list):
+    """
+    sort TS files of one channel by starting time and split them into
+    continuous time axes.  Files that start more than 2 samples after the end
+    of the file before start a new time axis, samples that overlap the file
+    before are skipped.
+
+    :param fn_list: list of TS files with headers, all of the same channel
+                    and sampling rate
+
+    :returns: list of time axes, each a list of (fn, header, n_skip, start),
+              where start is the index of the first sample of the file in
+              the time axis
+    """
+    header_list = [MTfh.read_ts_header(fn) for fn in fn_list]
+    order = np.argsort([float(header['t_min']) for header in header_list],
+                       kind='mergesort')
+
+    time_axes = []
+    for index in order:
+        fn, header = fn_list[index], header_list[index]
+        samplingrate = float(header['samplingrate'])
+        t_min = float(header['t_min'])
+        n_samples = int(float(header['nsamples']))
+
+        if len(time_axes) == 0 or \
+                t_min - (axis_t_min + n_axis / samplingrate) > \
+                1. / samplingrate:
+            time_axes.append([])
+            axis_t_min = t_min
+            n_axis = 0
+            n_skip = 0
+        else:
+            n_skip = int(round((axis_t_min - t_min) * samplingrate)) + n_axis
+            n_skip = min(max(n_skip, 0), n_samples)
+
+        time_axes[-1].append((fn, header, n_skip, n_axis - n_skip))
+        n_axis += n_samples - n_skip
+
+    return time_axes
+
+
+def iter_time_axis(time_axis, block_len=2**20):
+    """
+    iterate over the data of a time axis from get_time_axes in blocks, the
+    samples that overlap the file before are skipped
+    """
+    for fn, header, n_skip, start in time_axis:
+        n_samples = int(float(header['nsamples']))
+        n_read = 0
+        for block in MTfh.iter_ts_data(fn, block_len=block_len):
+            # files with a time column have the data in the last column
+            if block.ndim > 1:
+                block = block[:, -1]
+            block_start = n_read
+            n_read += block.size
+            block = block[max(n_skip - block_start, 0):
+                          max(n_samples - block_start, 0)]
+            if block.size > 0:
+                yield block
+
+
+def get_corrected_fn(fn, out_dir):
+    """
+    name of the corrected file, the input name with '_true' appended
+    """
+    fn_base, fn_ext = os.path.splitext(os.path.basename(fn))
+    return os.path.join(out_dir, '{0}_true{1}'.format(fn_base, fn_ext))
+
+
+def correct_time_axis(time_axis, response, out_dir, window_len=None,
+                      block_len=2**20, fmt='%.8e'):
+    """
+    remove the instrument response from a continuous time axis of TS files.
+
+    The files are read block by block, once to find the linear trend and
+    once to stream them through a ResponseDeconvolver.  The corrected data
+    are written to files of the same length and header as the input files,
+    with '(true)' appended to the unit.
+
+    :param time_axis: time axis from get_time_axes
+    :param response: InstrumentResponse, array of freq, real, imag or name of
+                     a response file
+    :param out_dir: directory to save corrected files to
+    :param window_len: samples in a deconvolution window, *default* is None,
+                       which uses the longest period of the response, or the
+                       length of the time axis if shorter
+    :param block_len: number of samples to read at a time
+    :param fmt: format of the corrected samples
+
+    :returns: list of corrected files
+    """
+    response = _get_response(response)
+    samplingrate = float(time_axis[0][1]['samplingrate'])
+
+    out_list = []
+    for fn, header, n_skip, start in time_axis:
+        header = dict(header)
+        unit = str(header.get('unit', ''))
+        if unit[-6:].lower() != '(true)':
+            header['unit'] = unit + '(true)'
+        n_samples = int(float(header['nsamples']))
+        out_list.append({'fn': get_corrected_fn(fn, out_dir),
+                         'header': MTfh.get_ts_header_string(header),
+                         'start': start, 'end': start + n_samples,
+                         'fid': None})
+
+    if window_len is None:
+        window_len = min(response.longest_period * samplingrate,
+                         max([out['end'] for out in out_list]))
+    # the data are detrended like the whole time axis at once, which needs a
+    # pass through the data first
+    trend = get_trend(iter_time_axis(time_axis, block_len=block_len))
+    deconvolver = ResponseDeconvolver(response, samplingrate,
+                                      window_len=window_len, trend=trend)
+
+    def write(data, start):
+        for out in out_list:
+            n_start = max(out['start'], start)
+            n_end = min(out['end'], start + data.size)
+            if n_end <= n_start:
+                continue
+            if out['fid'] is None:
+                out['fid'] = open(out['fn'], 'w')
+                out['fid'].write(out['header'])
+            MTfh.write_ts_data(out['fid'], data[n_start - start:n_end - start],
+                               fmt=fmt)
+            if n_end == out['end']:
+                out['fid'].close()
+
+    n_written = 0
+    try:
+        for block in iter_time_axis(time_axis, block_len=block_len):
+            corrected = deconvolver.correct(block)
+            write(corrected, n_written)
+            n_written += corrected.size
+        write(deconvolver.flush(), n_written)
+    finally:
+        for out in out_list:
+            if out['fid'] is not None and not out['fid'].closed:
+                out['fid'].close()
+
+    return [out['fn'] for out in out_list]
+
+
+def _correction_result(task, out_fn_list, status, error):
+    """
+    result of correcting the time axis of a task
+    """
+    return CorrectionResult([entry[0] for entry in task[0]], out_fn_list,
+                            status, error)
+
+
+def remove_response_directory(in_dir, response, out_dir=None, channels=None,
+                              window_len=None, block_len=2**20, fmt='%.8e',
+                              n_processes=None):
+    """
+    remove the instrument response from all the TS files of a directory.
+
+    Files are sorted by channel and starting time into continuous time axes,
+    which are corrected in a pool of processes.  Files without a header or of
+    other channels are left out.  Errors do not stop the correction, they are
+    returned in the results.
+
+    :param in_dir: directory of TS files
+    :param response: InstrumentResponse, array of freq, real, imag or name of
+                     a response file
+    :param out_dir: directory to save corrected files to, *default* is None,
+                    which uses in_dir/instr_resp_corrected
+    :param channels: channels to correct, *default* is None, which uses
+                     BX, BY, BZ, HX, HY, HZ
+    :param window_len: samples in a deconvolution window, see
+                       correct_time_axis
+    :param block_len: number of samples to read at a time
+    :param fmt: format of the corrected samples
+    :param n_processes: number of processes, *default* is None, which uses
+                        the number of cpus
+
+    :returns: one result for each time axis
+    :rtype: list of CorrectionResult
+    """
+    response = _get_response(response)
+    if out_dir is None:
+        out_dir = os.path.join(in_dir, 'instr_resp_corrected')
+    if os.path.abspath(in_dir) == os.path.abspath(out_dir):
+        raise MTex.MTpyError_inputarguments('Output directory cannot be the '
+                                            'same as the input directory')
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    if channels is None:
+        channels = ['BX', 'BY', 'BZ', 'HX', 'HY', 'HZ']
+    channels = [ch.upper() for ch in channels]
+
+    channel_dict = dict([(ch, []) for ch in channels])
+    for fn in sorted(os.listdir(in_dir)):
+        fn = os.path.join(in_dir, fn)
+        if not os.path.isfile(fn):
+            continue
+        try:
+            header = MTfh.read_ts_header(fn)
+        except MTex.MTpyError_ts_data:
+            continue
+        channel = str(header.get('channel', '')).upper()
+        if channel in channel_dict:
+            channel_dict[channel].append(fn)
+
+    if sum([len(fn_list) for fn_list in channel_dict.values()]) == 0:
+        raise MTex.MTpyError_inputarguments(
+            'No files for channels {0} found in directory {1} - check header '
+            'lines'.format(channels, in_dir))
+
+    task_list = [(time_axis, response, out_dir, window_len, block_len, fmt)
+                 for ch in channels if len(channel_dict[ch]) > 0
+                 for time_axis in get_time_axes(channel_dict[ch])]
+
+    return MTtasks.run_tasks(correct_time_axis, task_list,
+                             _correction_result, 'corrected',
+                             n_processes=n_processes, task_name='time axes')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Run the processing of many files in a pool of processes.
+
+Each task is run on its own and an error in one task does not stop the
+others, the traceback is returned in the result of the failed task instead.
+Results are namedtuples made by the caller, with a status field that is
+'failed' for a task that raised an error.
+
+:Example: ::
+
+    >>> import mtpy.processing.tasks as tasks
+    >>> Result = namedtuple('Result', ['fn', 'out_fn', 'status', 'error'])
+    >>> def make_result(task, out_fn, status, error):
+    ...     return Result(task[0], out_fn, status, error)
+    >>> results = tasks.run_tasks(convert_file, [(fn, out_fn)],
+    ...                           make_result, 'converted')
+    >>> failed = [res for res in results if res.status == 'failed']
+
+"""
+
+# ==============================================================================
+import multiprocessing
+import traceback
+
+from mtpy.utils.mtpylog import MtPyLog
+
+_logger = MtPyLog.get_mtpy_logger(__name__)
+
+
+# ==============================================================================
+def _run_task(args):
+    """
+    run one task in the process pool, any error is returned in the result
+    """
+    func, make_result, status, task = args
+    try:
+        return make_result(task, func(*task), status, None)
+    except Exception:
+        return make_result(task, None, 'failed', traceback.format_exc())
+
+
+def run_tasks(func, task_list, make_result, status, n_processes=None,
+              task_name='tasks'):
+    """
+    call func(*task) for every task of task_list in a pool of processes.
+    Tasks are run in this process if there are less than 2 of them or
+    n_processes is 1.  func and make_result have to be module level
+    functions, so they can be sent to the processes.
+
+    :param func: function that processes one task
+    :param task_list: list of argument tuples for func
+    :param make_result: make_result(task, output, status, error) returns the
+                        result of a task, output is what func returned or
+                        None if it failed
+    :param status: status of a task that did not fail
+    :param n_processes: number of processes, *default* is None, which uses
+                        the number of cpus
+    :param task_name: name of the tasks in the log message
+
+    :returns: one result for each task, in the order of task_list
+    :rtype: list
+    """
+    arg_list = [(func, make_result, status, task) for task in task_list]
+
+    if len(arg_list) < 2 or n_processes == 1:
+        results = [_run_task(args) for args in arg_list]
+    else:
+        if n_processes is None:
+            n_processes = multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(min(n_processes, len(arg_list)))
+        try:
+            results = pool.map(_run_task, arg_list, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    for res_status in [status, 'failed']:
+        _logger.info('{0} {1} {2}'.format(
+            res_status, len([res for res in results
+                             if res.status == res_status]), task_name))
+
+    return results
@@ -15,6 +15,9 @@ JP, 2013
 import numpy as np
 import scipy.signal as sps
 
+# maximum number of array elements computed at once when windows are
+# processed in blocks, keeps the memory bounded for long time series
+BLOCK_SIZE = 2 ** 20
 
 # =================================================================
 
@@ -306,6 +309,131 @@ def wvd_analytic_signal(fx):
     return fxa
 
 
+def _strided_windows(fa, nh, tstep, n_windows):
+    """
+    make a read-only view of fa that holds the n_windows windows of length nh
+    starting every tstep samples, no data are copied.
+
+    Arguments:
+    ----------
+        **fa** : np.ndarray
+                 time series
+
+        **nh** : int
+                 window length
+
+        **tstep** : int
+                    number of samples between windows
+
+        **n_windows** : int
+                        number of windows
+
+    Returns:
+    --------
+        **windows** : np.ndarray(n_windows, nh)
+                      windows of fa, window ii is fa[ii*tstep:ii*tstep+nh]
+    """
+    fa = np.ascontiguousarray(fa)
+    return np.lib.stride_tricks.as_strided(fa,
+                                           shape=(n_windows, nh),
+                                           strides=(int(tstep) * fa.strides[0],
+                                                    fa.strides[0]),
+                                           writeable=False)
+
+
+def _block_slices(n_windows, window_size):
+    """
+    split n_windows windows into blocks so that a block of windows of
+    window_size elements each has at most BLOCK_SIZE elements, this keeps the
+    memory bounded for long time series.
+
+    Returns:
+    --------
+        **slices** : list of slice objects
+    """
+    n_block = int(max(1, BLOCK_SIZE // max(int(window_size), 1)))
+    return [slice(ii, min(ii + n_block, n_windows))
+            for ii in range(0, n_windows, n_block)]
+
+
+def _lag_products(fa, fb, tlst, tau, fn=None):
+    """
+    compute the lag products conj(fa[nn - lag]) * fb[nn + lag] for each time
+    instance nn in tlst and lags -tau_min..tau_min, where tau_min is the
+    largest lag that stays inside the time series and is at most tau.
+
+    Arguments:
+    ----------
+        **fa**, **fb** : np.ndarray
+                         analytic signals
+
+        **tlst** : np.ndarray
+                   time instances
+
+        **tau** : int
+                  maximum lag
+
+        **fn** : int
+                 length of the time series used to limit the lags
+                 *default* is None, the length of fa
+
+    Returns:
+    --------
+        **rnn** : np.ndarray(len(tlst), 2*tau+1)
+                  lag products, row ii holds the 2*tau_min+1 products of
+                  tlst[ii] starting at lag -tau_min and is padded with zeros
+
+        **lags** : np.ndarray(len(tlst), 2*tau+1)
+                   lag of each product, 0 where padded
+
+        **valid** : np.ndarray(len(tlst), 2*tau+1, dtype=bool)
+                    False where padded
+    """
+    if fn is None:
+        fn = len(fa)
+    tlst = np.asarray(tlst, dtype='int')
+    tau_min = np.minimum(np.minimum(tlst, tau), fn - tlst - 1)
+
+    jj = np.arange(2 * tau + 1)
+    valid = jj[np.newaxis, :] <= 2 * tau_min[:, np.newaxis]
+    lags = np.where(valid, jj[np.newaxis, :] - tau_min[:, np.newaxis], 0)
+
+    rnn = np.conjugate(fa[tlst[:, np.newaxis] - lags]) * \
+        fb[tlst[:, np.newaxis] + lags]
+    rnn[~valid] = 0
+
+    return rnn, lags, valid
+
+
+def _shifted_sum(x, window, shifts, index):
+    """
+    compute sum_k window[k] * x[index + shifts[k]] * conj(x[index - shifts[k]])
+    over the first axis of x, which is the inner sum of the S-method.  index
+    has to be a contiguous range, negative rows wrap around as in normal
+    indexing.  The rows are done a few at a time so the shifted rows stay in
+    cache.
+
+    Returns:
+    --------
+        **xsum** : np.ndarray(len(index), x.shape[1])
+    """
+    xsum = np.zeros((len(index), x.shape[1]), dtype=x.dtype)
+    if len(index) == 0:
+        return xsum
+    # pad the start so negative rows can be sliced
+    npad = max(0, -(index[0] - max(shifts)), -(index[0] + min(shifts)))
+    xpad = np.concatenate((x[x.shape[0] - npad:], x), axis=0)
+    nrows = max(2 ** 15 // max(x.shape[1], 1), 1)
+    for rr in range(0, len(index), nrows):
+        row = index[0] + npad + rr
+        nn = min(nrows, len(index) - rr)
+        for wk, shift in zip(window, shifts):
+            xsum[rr:rr + nn] += wk * xpad[row + shift:row + shift + nn] * \
+                xpad[row - shift:row - shift + nn].conj()
+
+    return xsum
+
+
 def stft(fx, nh=2 ** 8, tstep=2 ** 7, ng=1, df=1.0, nfbins=2 ** 10):
     """
     calculate the spectrogam of the given function by calculating the fft of
@@ -395,22 +523,24 @@ def stft(fx, nh=2 ** 8, tstep=2 ** 7, ng=1, df=1.0, nfbins=2 ** 10):
     # positive ones
     fa = sps.hilbert(dctrend(fx))
 
-    # compute the fft at each window instance
-    for place, ii in enumerate(tlst):
-        fxwin = fa[ii:ii + nh] * h
-
+    # compute the fft of all windows at once, in blocks to bound memory
+    windows = _strided_windows(fa, nh, tstep, len(tlst))
+    for block in _block_slices(len(tlst), nfbins):
         # get only positive frequencies
-        FXwin = np.fft.fft(padzeros(fxwin, npad=nfbins))[:int(nfbins / 2)]
+        FXwin = np.fft.fft(windows[block] * h, n=nfbins,
+                           axis=1)[:, :int(nfbins / 2)]
 
-        # smooth in frequency plane
+        # smooth in frequency plane, same as a valid convolution of each
+        # window padded with ng-1 zeros
         if ng != 1:
-            FXwin = np.convolve(padzeros(FXwin, npad=len(FXwin) + ng - 1), g,
-                                'valid')
-        else:
-            pass
+            nf = FXwin.shape[1]
+            FXpad = np.pad(FXwin, ((0, 0), (0, ng - 1)), mode='constant')
+            FXwin = np.zeros_like(FXwin)
+            for kk in range(ng):
+                FXwin += g[kk] * FXpad[:, ng - 1 - kk:ng - 1 - kk + nf]
 
         # pull out only positive quadrant, flip array for plotting
-        tfarray[:, place] = FXwin[::-1]
+        tfarray[:, block] = FXwin[:, ::-1].T
 
     return tfarray, tlst, flst
 
@@ -612,14 +742,12 @@ def wvd(fx, nh=2 ** 8 - 1, tstep=2 ** 5, nfbins=2 ** 10, df=1.0):
         fm = 1
 
     if fm > 1:
-        fn = fn[0]
         print('computing cross spectra')
         # compute the analytic signal of function f and dctrend
         fa = wvd_analytic_signal(fx[0])
         fb = wvd_analytic_signal(fx[1])
     else:
         # compute the analytic signal of function f and dctrend
-        fa = wvd_analytic_signal(fx)
         fa = sps.hilbert(dctrend(fx))
         fb = fa.copy()
 
@@ -628,7 +756,7 @@ def wvd(fx, nh=2 ** 8 - 1, tstep=2 ** 5, nfbins=2 ** 10, df=1.0):
     df = float(df)
     dt = 1. / df
     # time shift
-    tau = (nh - 1) / 2
+    tau = int((nh - 1) / 2)
 
     # create a time array such that the first point is centered on time window
     tlst = np.arange(start=0, stop=fn - 1, step=tstep, dtype='int')
@@ -637,24 +765,21 @@ def wvd(fx, nh=2 ** 8 - 1, tstep=2 ** 5, nfbins=2 ** 10, df=1.0):
     tfarray = np.zeros((nfbins, len(tlst)), dtype='complex')
 
     # create a frequency array with just positive frequencies
-    flst = np.fft.fftfreq(nfbins, dt)[0:nfbins / 2]
-
-    # calculate pseudo WV
-    for point, nn in enumerate(tlst):
-        # calculate the smallest timeshift possible
-        tau_min = min(nn, tau, fn - nn - 1)
-        # make a timeshift array
-        tau_lst = np.arange(start=-tau_min, stop=tau_min + 1, step=1,
-                            dtype='int')
+    flst = np.fft.fftfreq(nfbins, dt)[0:int(nfbins / 2)]
+
+    # calculate pseudo WV for blocks of time instances
+    for block in _block_slices(len(tlst), nfbins):
         # calculate rectangular windowed correlation function of analytic
-        # signal
-        Rnn = 4 * np.conjugate(fa[nn - tau_lst]) * fb[nn + tau_lst]
-        # calculate fft of windowed correlation function
-        # put into tfarray
-        tfarray[:, point] = padzeros(Rnn, npad=nfbins)[::-1]
+        # signal for the smallest timeshift possible at each time
+        Rnn = 4 * _lag_products(fa, fb, tlst[block], tau)[0]
+        # put into tfarray, each column is the zero padded correlation
+        # function flipped
+        tfblock = np.zeros((Rnn.shape[0], nfbins), dtype='complex')
+        tfblock[:, nfbins - Rnn.shape[1]:] = Rnn[:, ::-1]
+
+        # compute Fourier Transform of array along the time axis
+        tfarray[:, block] = np.fft.fft(tfblock, axis=1).T
 
-    # compute Fourier Transform of array along the time axis
-    tfarray = np.fft.fft(tfarray, axis=0)
     # normalize
     tfarray = tfarray / nh
 
@@ -731,7 +856,6 @@ def spwvd(fx, tstep=2 ** 5, nfbins=2 ** 10, df=1.0, nh=None, ng=None, sigmat=Non
 
     else:
         # compute the analytic signal of function f and dctrend
-        fa = wvd_analytic_signal(fx)
         fa = sps.hilbert(dctrend(fx))
         fb = fa.copy()
         print('Computed Analytic signal')
@@ -772,8 +896,8 @@ def spwvd(fx, tstep=2 ** 5, nfbins=2 ** 10, df=1.0, nh=None, ng=None, sigmat=Non
     g = sps.gaussian(ng, sigmag)
     g /= sum(g)
 
-    Lh = (nh - 1) / 2  # midpoint index of window h
-    Lg = (ng - 1) / 2  # midpoint index of window g
+    Lh = int((nh - 1) / 2)  # midpoint index of window h
+    Lg = int((ng - 1) / 2)  # midpoint index of window g
 
     # create a time array such that the first point is centered on time window
     tlst = np.arange(start=0, stop=fn + 1, step=tstep, dtype='int')
@@ -783,34 +907,66 @@ def spwvd(fx, tstep=2 ** 5, nfbins=2 ** 10, df=1.0, nh=None, ng=None, sigmat=Non
     tfarray = np.zeros((nfbins, len(tlst)), dtype='complex')
 
     # create a frequency array with just positive frequencies
-    flst = np.fft.fftfreq(nfbins, dt)[0:nfbins / 2]
+    flst = np.fft.fftfreq(nfbins, dt)[0:int(nfbins / 2)]
 
-    # calculate pseudo WV
-    for point, t in enumerate(tlst):
-        # find the smallest possible time shift
-        tau_max = min(t + Lg - 1, fn - t + Lg, round(nfbins / 2), Lh)
-        # create time lag list
-        taulst = np.arange(start=-min(Lg, fn - t), stop=min(Lg, t - 1) + 1, step=1,
-                           dtype='int')
+    # calculate pseudo WV for a block of time points at once, the sums over
+    # the time lags are done one lag at a time for all points and shifts
+    mlst = np.arange(min(round(nfbins / 2), Lh))
+    for block in _block_slices(len(tlst), max(len(mlst), 1)):
+        tt = tlst[block, np.newaxis]
         # calculate windowed correlation function of analytic function for
         # zero frequency
-        tfarray[0, point] = sum(2 * (g[Lg + taulst] / sum(g[Lg + taulst])) *
-                                fa[t - taulst - 1] * np.conjugate(fb[t - taulst - 1]))
+        lo = -np.minimum(Lg, fn - tt[:, 0])
+        hi = np.minimum(Lg, tt[:, 0] - 1)
+        r0 = np.zeros(tt.shape[0], dtype='complex')
+        gsum = np.zeros(tt.shape[0])
+        for tau in range(-Lg, Lg + 1):
+            valid = (lo <= tau) & (tau <= hi)
+            index = np.where(valid, tt[:, 0] - tau - 1, 0)
+            r0 += np.where(valid, g[Lg + tau] * fa[index] *
+                           np.conjugate(fb[index]), 0)
+            gsum += np.where(valid, g[Lg + tau], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tfarray[0, block] = np.where(gsum > 0, 2 * r0 / gsum, 0)
+
+        # find the smallest possible time shift
+        tau_max = np.minimum(np.minimum(tt + Lg - 1, fn - tt + Lg),
+                             min(round(nfbins / 2), Lh))
         # calculate tfd by calculating convolution of window and correlation
-        # function as sum of correlation function over the lag period times the
-        # window at that point. Calculate symmetrical segments for FFT later
-        for mm in range(tau_max):
-            taulst = np.arange(start=-min(Lg, fn - t - mm - 1), stop=min(Lg, t - mm - 1) + 1,
-                               step=1, dtype='int')
-            # compute positive half
-            gm = 2 * (g[Lg + taulst] / sum(g[Lg + taulst]))
-            Rmm = sum(gm * fa[t + mm - taulst - 1] *
-                      np.conjugate(fb[t - mm - taulst]))
-            tfarray[mm, point] = h[Lh + mm - 1] * Rmm
-            # compute negative half
-            Rmm = sum(gm * fa[t - mm - taulst] *
-                      np.conjugate(fb[t + mm - taulst - 1]))
-            tfarray[nfbins - mm - 1, point] = h[Lh - mm] * Rmm
+        # function as sum of correlation function over the lag period times
+        # the window at that point. Calculate symmetrical segments for FFT
+        # later
+        mm = mlst[np.newaxis, :]
+        compute = mm < tau_max
+        lo = -np.minimum(Lg, fn - tt - mm - 1)
+        hi = np.minimum(Lg, tt - mm - 1)
+        rpos = np.zeros(compute.shape, dtype='complex')
+        rneg = np.zeros(compute.shape, dtype='complex')
+        gsum = np.zeros(compute.shape)
+        for tau in range(-Lg, Lg + 1):
+            valid = compute & (lo <= tau) & (tau <= hi)
+            ia = np.where(valid, tt + mm - tau - 1, 0)
+            ib = np.where(valid, tt - mm - tau, 0)
+            rpos += np.where(valid, g[Lg + tau] * fa[ia] * np.conjugate(fb[ib]),
+                             0)
+            rneg += np.where(valid, g[Lg + tau] * fa[ib] * np.conjugate(fb[ia]),
+                             0)
+            gsum += np.where(valid, g[Lg + tau], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rpos = np.where(gsum > 0, 2 * rpos / gsum, 0)
+            rneg = np.where(gsum > 0, 2 * rneg / gsum, 0)
+
+        tfblock = tfarray[:, block]
+        # compute positive half
+        tfblock[mlst] = np.where(compute.T, h[Lh + mlst - 1, np.newaxis] * rpos.T,
+                                 tfblock[mlst])
+        # compute negative half
+        tfblock[nfbins - mlst - 1] = np.where(compute.T,
+                                              h[Lh - mlst, np.newaxis] * rneg.T,
+                                              tfblock[nfbins - mlst - 1])
+        tfarray[:, block] = tfblock
+
+    for point, t in enumerate(tlst):
         mm = round(nfbins / 2)
 
         if t <= fn - mm and t >= mm and mm <= Lh:
@@ -900,7 +1056,6 @@ def robust_wvd(fx, nh=2 ** 7 - 1, ng=2 ** 4 - 1, tstep=2 ** 4, nfbins=2 ** 8, df
 
     else:
         # compute the analytic signal of function f and dctrend
-        fa = wvd_analytic_signal(fx)
         fa = sps.hilbert(dctrend(fx))
         fb = fa.copy()
         print('Computed Analytic signal')
@@ -939,27 +1094,36 @@ def robust_wvd(fx, nh=2 ** 7 - 1, ng=2 ** 4 - 1, tstep=2 ** 4, nfbins=2 ** 8, df
     g /= sum(g)
 
     mlst = np.arange(start=-nh / 2 + 1, stop=nh / 2 + 1, step=1, dtype='int')
-    tlst = np.arange(start=nh / 2, stop=nfx - nh / 2, step=tstep)
+    tlst = np.arange(start=int(nh / 2), stop=nfx - int(nh / 2), step=tstep)
     # make a frequency list for plotting exporting only positive frequencies
     # get only positive frequencies
-    flst = np.fft.fftfreq(nfbins, dt)[nfbins / 2:]
+    flst = np.fft.fftfreq(nfbins, dt)[int(nfbins / 2):]
     flst[-1] = 0
-    flstp = np.fft.fftfreq(nfbins, 2 * dt)[0:nfbins / 2]
+    flstp = np.fft.fftfreq(nfbins, 2 * dt)[0:int(nfbins / 2)]
 
     # create an empty array to put the tf in
-    tfarray = np.zeros((nfbins / 2, len(tlst)), dtype='complex')
+    tfarray = np.zeros((int(nfbins / 2), len(tlst)), dtype='complex')
+
+    # phase shift of each time shift at each frequency
+    fshift = np.exp(1j * 4 * np.pi * np.outer(flst, mlst) * dt)
+    # only the real part is used and g is real, so smooth the real part only
+    # as the centred part of a full convolution with g
+    nm = len(mlst)
+    gstart = int((ng - 1) / 2) + ng - 1
 
-    for tpoint, nn in enumerate(tlst):
+    for block in _block_slices(len(tlst), fshift.shape[0] * (nm + 2 * ng)):
         # calculate windowed correlation function of analytic function
+        nn = tlst[block, np.newaxis]
         fxwin = h * fa[nn + mlst] * fb[nn - mlst].conj()
-        for fpoint, mm in enumerate(flst):
-            fxmed = np.convolve(g, fxwin * np.exp(1j * 4 * np.pi * mlst * mm * dt),
-                                mode='same') / (nh * ng)
-            fxmedpoint = np.median(fxmed.real)
-            if fxmedpoint == 0.0:
-                tfarray[fpoint, tpoint] = 1E-10
-            else:
-                tfarray[fpoint, tpoint] = fxmedpoint
+        fxreal = np.real(fxwin[:, np.newaxis, :] * fshift)
+        fxreal = np.pad(fxreal, ((0, 0), (0, 0), (ng - 1, ng - 1)),
+                        mode='constant')
+        fxmed = np.zeros((fxreal.shape[0], fxreal.shape[1], nm))
+        for kk in range(ng):
+            fxmed += g[kk] * fxreal[:, :, gstart - kk:gstart - kk + nm]
+        fxmedpoint = np.median(fxmed / (nh * ng), axis=2)
+        fxmedpoint[fxmedpoint == 0.0] = 1E-10
+        tfarray[:, block] = fxmedpoint.T
 
     tfarray = (4. * nh / dt) * tfarray
 
@@ -1083,14 +1247,12 @@ def modifiedb(fx, tstep=2 ** 5, nfbins=2 ** 10,
         fm = 1
 
     if fm > 1:
-        fn = fn[0]
         print('computing cross spectra')
         # compute the analytic signal of function f and dctrend
         fa = wvd_analytic_signal(fx[0])
         fb = wvd_analytic_signal(fx[1])
     else:
         # compute the analytic signal of function f and dctrend
-        fa = wvd_analytic_signal(fx)
         fa = sps.hilbert(dctrend(fx))
         fb = fa.copy()
 
@@ -1098,7 +1260,7 @@ def modifiedb(fx, tstep=2 ** 5, nfbins=2 ** 10,
     df = float(df)
     dt = 1. / df
 
-    tau = (nh - 1) / 2  # midpoint index of window h
+    tau = int((nh - 1) / 2)  # midpoint index of window h
 
     # create a time array such that the first point is centered on time window
     tlst = np.arange(start=0, stop=fn - 1, step=tstep, dtype='int')
@@ -1107,25 +1269,21 @@ def modifiedb(fx, tstep=2 ** 5, nfbins=2 ** 10,
     tfarray = np.zeros((nfbins, len(tlst)), dtype='complex')
 
     # create a frequency array with just positive frequencies
-    flst = np.fft.fftfreq(nfbins, dt)[0:nfbins / 2]
-
-    # calculate pseudo WV
-    for point, nn in enumerate(tlst):
-        # calculate the smallest timeshift possible
-        tau_min = min(nn, tau, fn - nn - 1)
-        # make a timeshift array
-        taulst = np.arange(start=-tau_min, stop=tau_min +
-                           1, step=1, dtype='int')
+    flst = np.fft.fftfreq(nfbins, dt)[0:int(nfbins / 2)]
+
+    # calculate pseudo WV for blocks of time instances
+    for block in _block_slices(len(tlst), nfbins):
+        # calculate windowed correlation function of analytic function for
+        # the smallest timeshift possible at each time
+        Rnn, taulst, valid = _lag_products(fa, fb, tlst[block], tau, fn=fn)
         # create modified b window
-        mbwin = np.cosh(taulst) ** (-2 * beta)
-        mbwin = mbwin / sum(mbwin)
-        MBwin = np.fft.fft(padzeros(mbwin, npad=nfbins))
-        # calculate windowed correlation function of analytic function
-        Rnn = np.conjugate(fa[nn - taulst]) * fb[nn + taulst]
+        mbwin = np.where(valid, np.cosh(taulst) ** (-2 * beta), 0)
+        mbwin /= mbwin.sum(axis=1)[:, np.newaxis]
+        MBwin = np.fft.fft(mbwin, n=nfbins, axis=1)
         # calculate fft of windowed correlation function
-        FTRnn = MBwin * np.fft.fft(padzeros(Rnn, npad=nfbins))
+        FTRnn = MBwin * np.fft.fft(Rnn, n=nfbins, axis=1)
         # put into tfarray
-        tfarray[:, point] = FTRnn[::-1]
+        tfarray[:, block] = FTRnn[:, ::-1].T
 
     # need to cut the time frequency array in half due to the WVD assuming
     # time series sampled at twice nyquist.
@@ -1181,10 +1339,10 @@ def robust_stft_median(fx, nh=2 ** 8, tstep=2 ** 5, df=1.0, nfbins=2 ** 10):
 
     # make a frequency list for plotting exporting only positive frequencies
     flst = np.fft.fftfreq(nfbins, 1 / df)
-    flstc = flst[nfbins / 2:]
+    flstc = flst[int(nfbins / 2):]
     # Note: these are actually the negative frequencies but works better for
     # calculations
-    flstp = flst[0:nfbins / 2]
+    flstp = flst[0:int(nfbins / 2)]
 
     # make time window and normalize
     sigmanh = nh / (6 * np.sqrt(2 * np.log(2)))
@@ -1192,28 +1350,25 @@ def robust_stft_median(fx, nh=2 ** 8, tstep=2 ** 5, df=1.0, nfbins=2 ** 10):
     h = h / sum(h)
 
     # create an empty array to put the tf in and initialize a complex value
-    tfarray = np.zeros((nfbins / 2, len(tlst)), dtype='complex')
+    tfarray = np.zeros((int(nfbins / 2), len(tlst)), dtype='complex')
 
     # take the hilbert transform of the signal to make complex and remove
     # negative frequencies
     fa = sps.hilbert(dctrend(fx))
     fa = fa / fa.std()
 
-    # make a frequency list for plotting exporting only positive frequencies
-    # get only positive frequencies
-    flst = np.fft.fftfreq(nfbins, 1 / df)[nfbins / 2:]
-
-    for tpoint, nn in enumerate(tlst):
-        # calculate windowed correlation function of analytic function
-        fxwin = h * fa[nn:nn + nh]
-        for fpoint, mm in enumerate(flstc):
-            fxmed = fxwin * np.exp(1j * 2 * np.pi * mlst * mm / df)
-            fxmedreal = np.median(fxmed.real)
-            fxmedimag = np.median(fxmed.imag)
-            if fxmedreal + 1j * fxmedimag == 0.0:
-                tfarray[fpoint, tpoint] = 1E-10
-            else:
-                tfarray[fpoint, tpoint] = fxmedreal + 1j * fxmedimag
+    # phase shift of each time shift at each frequency
+    fshift = np.exp(1j * 2 * np.pi * np.outer(flstc, mlst) / df)
+
+    # calculate windowed correlation function of analytic function for
+    # blocks of windows and all frequencies at once
+    windows = _strided_windows(fa, nh, tstep, len(tlst))
+    for block in _block_slices(len(tlst), fshift.size):
+        fxmed = (windows[block] * h)[:, np.newaxis, :] * fshift
+        tfblock = np.median(fxmed.real, axis=2) + \
+            1j * np.median(fxmed.imag, axis=2)
+        tfblock[tfblock == 0.0] = 1E-10
+        tfarray[:, block] = tfblock.T
     # normalize tfarray
     tfarray = (4. * nh * df) * tfarray
 
@@ -1275,10 +1430,10 @@ def robust_stft_L(fx, alpha=.325, nh=2 ** 8, tstep=2 **
 
     # make a frequency list for plotting exporting only positive frequencies
     flst = np.fft.fftfreq(nfbins, 1 / df)
-    flstc = flst[nfbins / 2:]
+    flstc = flst[int(nfbins / 2):]
     # Note: these are actually the negative frequencies but works better for
     # calculations
-    flstp = flst[0:nfbins / 2]
+    flstp = flst[0:int(nfbins / 2)]
 
     # make time window and normalize
     sigmanh = nh / (6 * np.sqrt(2 * np.log(2)))
@@ -1286,34 +1441,31 @@ def robust_stft_L(fx, alpha=.325, nh=2 ** 8, tstep=2 **
     h /= sum(h)
 
     # create an empty array to put the tf in and initialize a complex value
-    tfarray = np.zeros((nfbins / 2, len(tlst)), dtype='complex')
+    tfarray = np.zeros((int(nfbins / 2), len(tlst)), dtype='complex')
 
     # take the hilbert transform of the signal to make complex and remove
     # negative frequencies
     fa = sps.hilbert(dctrend(fx))
     fa /= fa.std()
 
-    # make a frequency list for plotting exporting only positive frequencies
-    # get only positive frequencies
-    flst = np.fft.fftfreq(nfbins, 1 / df)[nfbins / 2:]
-
     # create list of coefficients
     a = np.zeros(nh)
-    a[(nh - 2) * alpha:alpha * (2 - nh) + nh - 1] = 1. / \
+    a[int((nh - 2) * alpha):int(alpha * (2 - nh) + nh - 1)] = 1. / \
         (nh * (1 - 2 * alpha) + 4 * alpha)
 
-    for tpoint, nn in enumerate(tlst):
-        # calculate windowed correlation function of analytic function
-        fxwin = h * fa[nn:nn + nh]
-        for fpoint, mm in enumerate(flstc):
-            fxelement = fxwin * np.exp(1j * 2 * np.pi * mlst * mm / df)
-            fxreal = np.sort(fxelement.real)[::-1]
-            fximag = np.sort(fxelement.imag)[::-1]
-            tfpoint = sum(a * (fxreal + 1j * fximag))
-            if tfpoint == 0.0:
-                tfarray[fpoint, tpoint] = 1E-10
-            else:
-                tfarray[fpoint, tpoint] = tfpoint
+    # phase shift of each time shift at each frequency
+    fshift = np.exp(1j * 2 * np.pi * np.outer(flstc, mlst) / df)
+
+    # calculate windowed correlation function of analytic function for
+    # blocks of windows and all frequencies at once
+    windows = _strided_windows(fa, nh, tstep, len(tlst))
+    for block in _block_slices(len(tlst), fshift.size):
+        fxelement = (windows[block] * h)[:, np.newaxis, :] * fshift
+        fxreal = np.sort(fxelement.real, axis=2)[:, :, ::-1]
+        fximag = np.sort(fxelement.imag, axis=2)[:, :, ::-1]
+        tfblock = np.sum(a * (fxreal + 1j * fximag), axis=2)
+        tfblock[tfblock == 0.0] = 1E-10
+        tfarray[:, block] = tfblock.T
     # normalize tfarray
     tfarray = (4. * nh * df) * tfarray
 
@@ -1417,15 +1569,11 @@ def smethod(fx, L=11, nh=2 ** 8, tstep=2 ** 7, ng=1, df=1.0, nfbins=2 ** 10,
     if sigmaL is None:
         sigmaL = L / (1 * np.sqrt(2 * np.log(2)))
     p = sps.gaussian(L, sigmaL)
-    # make a matrix of windows
-    pm = np.zeros((L, nt))
-    for kk in range(nt):
-        pm[:, kk] = p
-
-    # loop over frequency and calculate the s-method
-    for ff in range(int(L / 2), nf - int(L / 2) - 1):
-        tfarray[ff, :] = tfarray[ff, :] + 2 * np.real(np.sum(pm * pxx[ff + Llst, :] *
-                                                             pxx[ff - Llst, :].conj(), axis=0))
+
+    # calculate the s-method for all frequencies at once
+    ff = np.arange(int(L / 2), nf - int(L / 2) - 1)
+    tfarray[ff, :] = tfarray[ff, :] + \
+        2 * np.real(_shifted_sum(pxx, p, Llst, ff))
     # normalize
     tfarray[int(L / 2):int(-L / 2)] /= L
 
@@ -1525,24 +1673,19 @@ def robust_smethod(fx, L=5, nh=2 ** 7, tstep=2 ** 5, nfbins=2 ** 10, df=1.0,
             raise NameError('robusttype {0} undefined'.format(robusttype))
 
     # compute frequency shift list
-    Llst = np.arange(start=-L / 2 + 1, stop=L / 2 + 1, step=1, dtype='int')
+    Llst = np.arange(start=(-L) // 2 + 1, stop=L // 2 + 1, step=1, dtype='int')
 
     # compute the frequency window of length L
     if sigmaL is None:
         sigmaL = L / 3 * (np.sqrt(2 * np.log(2)))
     lwin = gausswin(L, sigmaL)
     lwin /= sum(lwin)
-    pm = np.zeros((L, len(tlst)))
-    for kk in range(len(tlst)):
-        pm[:, kk] = lwin
 
     smarray = pxx.copy()
-    # compute S-method
-    for ff in range(L / 2, nfbins / 2 - L / 2):
-        smarray[ff, :] = smarray[ff, :] + 2 * np.real(np.sum(pm * pxx[ff + Llst, :] *
-                                                             pxx[ff - Llst,
-                                                                 :].conj(),
-                                                             axis=0))
+    # compute S-method for all frequencies at once
+    ff = np.arange(int(L / 2), int(nfbins / 2) - int(L / 2))
+    smarray[ff, :] = smarray[ff, :] + \
+        2 * np.real(_shifted_sum(pxx, lwin, Llst, ff))
     # normalize
     smarray = (2. / (L * nh)) * smarray
 
@@ -13,8 +13,8 @@ import time
 from collections import Counter
 
 import numpy as np
-import scipy.signal as sps
 
+import mtpy.processing.decimation as decimation
 import mtpy.usgs.zen as zen
 import mtpy.utils.filehandling as mtfh
 #==============================================================================
@@ -100,8 +100,12 @@ class Cache_Metadata(object):
         get station name from metadata from all versions of .cac files
         """
         
-        try: 
-            self.station_number = str(int(self.rx_stn))
+        try:
+            # merged files have the station for each channel
+            if isinstance(self.rx_stn, list):
+                self.station_number = str(int(self.rx_stn[0]))
+            else:
+                self.station_number = str(int(self.rx_stn))
         except AttributeError:
             try:
                 self.station_number = self.rx_xyz0.split(':')[0]
@@ -153,6 +157,11 @@ class Board_Calibration(object):
 class Cache(object):
     """
     deal with Zonge .cac files
+
+    The blocks of a cache file are located from their length stamps without
+    reading the data in between.  The time series block is memory mapped,
+    so time_series is an np.memmap of shape (ts_npnt, number of channels)
+    with a column for each channel in the order of metadata.ch_cmp.
     """
     def __init__(self, fn=None, **kwargs):
         self.fn = fn
@@ -182,15 +191,36 @@ class Cache(object):
         """
         read a cache block
         """
-        file_pointer = np.fromstring(file_id.read(self._flag_len),
-                                     dtype=self._flag_dtype)
-        f_str = file_id.read(file_pointer['length']-2)
-        end_len = np.fromstring(file_id.read(self._len_bytes),
+        file_pointer, f_tell = self._locate_file_block(file_id)
+        if file_pointer is None:
+            return None, None
+        
+        file_id.seek(f_tell)
+        f_str = file_id.read(int(file_pointer['length'])-2)
+        file_id.seek(self._f_tell)
+        return file_pointer, f_str
+        
+    def _locate_file_block(self, file_id):
+        """
+        find the next cache block from its length stamp, the data are 
+        skipped over and not read.
+        
+        returns the block stamp and the location of the block data in the
+        file, or None, None at the end of the file
+        """
+        stamp_str = file_id.read(self._flag_len)
+        if len(stamp_str) < self._flag_len:
+            return None, None
+        
+        file_pointer = np.frombuffer(stamp_str, dtype=self._flag_dtype)[0]
+        f_tell = file_id.tell()
+        file_id.seek(int(file_pointer['length'])-2, 1)
+        end_len = np.frombuffer(file_id.read(self._len_bytes), 
                                 dtype=np.int32)
         
         if self._validate_block_len(file_pointer, end_len) is True:
             self._f_tell = file_id.tell()
-            return file_pointer, f_str
+            return file_pointer, f_tell
         
     def _validate_block_len(self, file_pointer, end_length):
         """
@@ -199,7 +229,8 @@ class Cache(object):
         """
         
         try:
-            assert file_pointer['length'] == end_length
+            assert end_length.size == 1
+            assert file_pointer['length'] == end_length[0]
             return True
         except AssertionError:
             raise ValueError('File pointer length {0} != end length {1}'.format(
@@ -212,16 +243,17 @@ class Cache(object):
         if fn is not None:
             self.fn = fn
         
-        f_pointer = True
         with open(self.fn, 'rb') as fid:
-            while f_pointer:            
+            while True:            
                 # read in first pointer            
                 f_pointer, f_str = self._read_file_block(fid)
+                if f_pointer is None:
+                    return
                 
                 # if the data type is the meta data
                 if int(f_pointer['type']) == 514:
                     meta_obj = Cache_Metadata()
-                    meta_obj.read_meta_string(f_str)
+                    meta_obj.read_meta_string(f_str.decode())
 
                     key = self._type_dict[int(f_pointer['type'])]        
                     setattr(self, key, meta_obj)
@@ -231,67 +263,217 @@ class Cache(object):
         
     def read_cache_file(self, fn=None):
         """
-        read .cac file
+        read .cac file, the time series is memory mapped and not read in
         """
         if fn is not None:
             self.fn = fn
         
-        f_pointer = True
         with open(self.fn, 'rb') as fid:
-            while f_pointer:            
-                # read in first pointer            
-                f_pointer, f_str = self._read_file_block(fid)
+            while True:            
+                # find the next block
+                f_pointer, f_tell = self._locate_file_block(fid)
+                if f_pointer is None:
+                    return
+                
+                f_type = int(f_pointer['type'])
+                f_len = int(f_pointer['length'])-2
+                
+                # if the data type is time series map it without reading
+                if f_type == 16:
+                    n_chn = len(self.metadata.ch_cmp)
+                    ts = np.memmap(self.fn, dtype=np.int32, mode='r', 
+                                   offset=f_tell, 
+                                   shape=(int(self.metadata.ts_npnt), n_chn))
+                    key = self._type_dict[f_type]        
+                    setattr(self, key, ts)
+                    print('Read in time series,  # points = {0}'.format(
+                                                        self.metadata.ts_npnt))
+                    continue
+                
+                # the other blocks are small so read them in
+                fid.seek(f_tell)
+                f_str = fid.read(f_len)
+                fid.seek(self._f_tell)
                 
                 # if the data type is the meta data
-                if int(f_pointer['type']) == 514:
+                if f_type == 514:
                     meta_obj = Cache_Metadata()
-                    meta_obj.read_meta_string(f_str)
+                    meta_obj.read_meta_string(f_str.decode())
 
-                    key = self._type_dict[int(f_pointer['type'])]        
+                    key = self._type_dict[f_type]        
                     setattr(self, key, meta_obj)
                     print('Read in metadata')
                     continue
                 
                 # if the data type is calibration
-                elif int(f_pointer['type']) == 768:
-                    cal_obj = Board_Calibration(f_str)
+                elif f_type == 768:
+                    cal_obj = Board_Calibration(f_str.decode())
                     cal_obj.read_board_cal_str()
                     
-                    key = self._type_dict[int(f_pointer['type'])]        
+                    key = self._type_dict[f_type]        
                     setattr(self, key, cal_obj)
                     print('Read in calibration')
                     continue
                     
-                # if the data type is time series
-                elif int(f_pointer['type']) == 16:
-                    ts_arr = np.fromstring(f_str, dtype=np.int32)
-                    ts_arr = np.resize(ts_arr, (int(self.metadata.ts_npnt), 
-                                                len(self.metadata.ch_cmp)))
-                    
-                    
-                    ts = np.zeros(1, 
-                                  dtype=[(cc.lower(), np.int32, 
-                                          (int(self.metadata.ts_npnt),)) for 
-                                          cc in self.metadata.ch_cmp])
-                    
-                    for ii, cc in enumerate(self.metadata.ch_cmp):
-                        ts[cc.lower()][:] = ts_arr[:, ii]
-                    key = self._type_dict[int(f_pointer['type'])]        
-                    setattr(self, key, ts)
-                    print('Read in time series,  # points = {0}'.format(
-                                                        self.metadata.ts_npnt))
-                    return
-                # if the data type is time series
-                elif int(f_pointer['type']) == 15:
-                    ts = np.fromstring(f_str, dtype=np.int32)
-                    
-
+                # if the data type is other
+                elif f_type == 15:
+                    ts = np.frombuffer(f_str, dtype=np.int32)
                 
-                    key = self._type_dict[int(f_pointer['type'])]        
+                    key = self._type_dict[f_type]        
                     setattr(self, key, ts)
                     print('Read in other')
                     continue
                 
+#==============================================================================
+# stream Z3D files
+#==============================================================================
+class Z3DStream(object):
+    """
+    stream the time series of a Z3D file in counts without reading in the 
+    whole file.
+    
+    The data after the metadata are memory mapped as int32 and the gps 
+    stamps are found a chunk at a time, samples are then read by index 
+    skipping over the stamps.  As in Zen3D.read_z3d the time series starts 
+    at the gps stamp num_sec_to_skip.
+    
+    ================== ========================================================
+     Attributes         Description
+    ================== ========================================================
+    fn                  full path to Z3D file
+    gps_index           index of each gps stamp in the data
+    gps_seconds         time of each gps stamp in seconds of the gps week
+    n_samples           number of samples in the time series
+    ts_index            index in the time series of the first sample after
+                        each gps stamp, with n_samples at the end
+    zt                  Zen3D object with the header, schedule and metadata
+    ================== ========================================================
+    
+    :Example: ::
+    
+        >>> import mtpy.usgs.zonge_cache as zc
+        >>> zs = zc.Z3DStream(r"/home/mt/mt01_20150522_080000_256_EX.Z3D")
+        >>> zs.read_info()
+        >>> first_minute = zs.read(0, 60*256)
+        
+    """
+    
+    def __init__(self, fn=None, chunk_size=2**22):
+        self.fn = fn
+        self.zt = None
+        
+        self.gps_index = None
+        self.gps_seconds = None
+        self.ts_index = None
+        self.n_samples = 0
+        self.log_lines = []
+        
+        self._data = None
+        self._seg_start = None
+        self._chunk_size = chunk_size
+        
+    @property
+    def df(self):
+        """
+        sampling rate
+        """
+        return self.zt.df
+    
+    @property
+    def component(self):
+        """
+        channel component
+        """
+        return self.zt.component
+    
+    def read_info(self, fn=None):
+        """
+        read the header, schedule and metadata of the Z3D file, memory map 
+        the data and find the gps stamps
+        """
+        if fn is not None:
+            self.fn = fn
+            
+        self.zt = zen.Zen3D(fn=self.fn)
+        self.zt.read_all_info()
+        if self.zt.header.old_version is True:
+            self.zt._get_gps_stamp_type(True)
+            
+        gps_bytes = int(self.zt._gps_bytes)
+        n_words = (os.path.getsize(self.fn)-self.zt.metadata.m_tell)//4
+        self._data = np.memmap(self.fn, dtype=np.int32, mode='r', 
+                               offset=self.zt.metadata.m_tell,
+                               shape=(n_words,))
+        
+        # find the gps stamps a chunk at a time, the next word is needed
+        # to check the second flag
+        gps_list = []
+        for ii in range(0, n_words, self._chunk_size):
+            block = self._data[ii:ii+self._chunk_size+1]
+            gps_find = np.flatnonzero(block[:self._chunk_size] == 
+                                      self.zt._gps_flag_0)
+            if self.zt.header.old_version is False:
+                gps_find = gps_find[gps_find+1 < block.size]
+                gps_find = gps_find[block[gps_find+1] == self.zt._gps_flag_1]
+            gps_list.append(gps_find+ii)
+        gps_index = np.concatenate(gps_list)
+        
+        # skip the first stamps like Zen3D.read_z3d
+        gps_index = gps_index[self.zt.num_sec_to_skip:]
+        gps_index = gps_index[gps_index+gps_bytes <= n_words]
+        if len(gps_index) == 0:
+            raise ZenGPSError('Data is bad, cannot open file {0}'.format(
+                              self.fn))
+        self.gps_index = gps_index
+        
+        # convert the gps time to seconds relative to the gps week
+        time_word = self.zt._gps_dtype.fields['time'][1]//4
+        time_conv = self._data[gps_index+time_word]/1024.
+        self.gps_seconds = np.floor(time_conv)+\
+                           (time_conv-np.floor(time_conv))*1.024
+        
+        # the samples between one stamp and the next
+        self._seg_start = gps_index+gps_bytes
+        seg_end = np.append(gps_index[1:], n_words)
+        self.ts_index = np.append(0, np.cumsum(seg_end-self._seg_start))
+        self.n_samples = int(self.ts_index[-1])
+        
+        self.log_lines.append(' '*4+'{0}: found {1} GPS time stamps and '
+                              '{2} data points\n'.format(self.fn, 
+                                                         len(gps_index),
+                                                         self.n_samples))
+        
+    def get_date_time(self, gps_seconds):
+        """
+        UTC date and time of gps_seconds as a datetime object
+        """
+        return self.zt.get_UTC_date_time(self.zt.header.gpsweek, gps_seconds)
+        
+    def read(self, start, stop):
+        """
+        read samples start to stop of the time series in counts, only the 
+        part of the file with those samples is read
+        
+        :returns: np.ndarray(stop-start, dtype=np.int32), shorter if the 
+                  time series ends before stop
+        """
+        stop = min(stop, self.n_samples)
+        if stop <= start:
+            return np.zeros(0, dtype=np.int32)
+        
+        # segments between stamps that hold the samples
+        s0 = np.searchsorted(self.ts_index, start, side='right')-1
+        s1 = np.searchsorted(self.ts_index, stop, side='left')
+        
+        ts_list = []
+        for ss in range(s0, s1):
+            ii = self._seg_start[ss]+max(start-self.ts_index[ss], 0)
+            jj = self._seg_start[ss]+min(stop, self.ts_index[ss+1])-\
+                 self.ts_index[ss]
+            ts_list.append(self._data[ii:jj])
+            
+        return np.concatenate(ts_list)
+    
 #==============================================================================
 # 
 #==============================================================================
@@ -313,9 +495,9 @@ class ZenCache(object):
     meta_data           dictionary of meta data key words and values
     nav_data            list of navigation data, as is from file
     save_fn             file to save merged file to
-    ts                  np.ndarray(len(ts), num_channels) of time series
+    ts                  np.memmap(len(ts), num_channels) of time series
     verbose             [ True | False ] True prints information to console
-    zt_list              list of class: Zen3D objects
+    zt_list              list of class: Z3DStream objects
     _ch_factor          scaling factor for the channels, got this from Zonge
     _ch_gain            gain on channel, not sure of the format
     _ch_lowpass_dict    dictionary of values for lowpass filter, not sure how
@@ -335,9 +517,11 @@ class ZenCache(object):
         * *check_time_series* : makes sure all time series start at the same
                                 time and have the same length.
                                 
-        * *write_cache_file* : writes a cache file for given filenames.
+        * *write_cache_file* : writes a cache file for given filenames, 
+                               streaming the time series from the Z3D files.
         
-        * *read_cache* : reads in a cache file.
+        * *read_cache* : reads in a cache file, memory mapping the time 
+                         series.
         
     :Example: ::
     
@@ -475,90 +659,160 @@ class ZenCache(object):
         """
         check to make sure timeseries line up with eachother.
         
-        """
+        The merged time series starts at the latest first gps stamp of all
+        the channels and is as long as the shortest channel from there.  
+        Channels that do not have a gps stamp at the start time are removed
+        from zt_list.
         
-        n_fn = len(zt_list)
+        Arguments:
+        -----------
+            **zt_list** : list of Z3DStream instances
+            
+            **decimate** : decimation factor
+            
+        Outputs:
+        --------
+            **start_list** : index of the first sample of each channel
+            
+            **ts_len** : number of points in the merged time series after
+                         decimation
+        """
         
         #test start time
-        #st_list = np.array([int(zt.date_time[0][-2:]) for zt in zt_list])
-        st_list = np.array([int(zt.gps_time[0]) for zt in zt_list])
-        time_max = max(st_list)
-        #time_max = np.where(st_list==st_list.max())[0]
-        
-        #get the number of seconds each time series is off by
-        skip_dict = {}
-        for ii, zt in enumerate(list(zt_list)):
-            try:
-                skip_dict[ii] = np.where(zt.gps_time==time_max)[0][0]
-            except IndexError:
-                zt_list.remove(zt_list[ii])
-                print('***SKIPPING {0} '.format(zt.fn))
+        time_max = max([zs.gps_seconds[0] for zs in zt_list])
+        
+        #get the number of points each time series is off by
+        start_list = []
+        for zs in list(zt_list):
+            time_find = np.where(abs(zs.gps_seconds-time_max) < .5)[0]
+            if len(time_find) == 0:
+                zt_list.remove(zs)
+                print('***SKIPPING {0} '.format(zs.fn))
                 print('   because it does not contain correct gps time')
                 print('   {0} --> {1}'.format(time_max, 
-                                             zt.get_date_time(zt.gps_week, 
-                                                             time_max)))    
-        
-        #change data by amount needed        
-        for ii, zt in zip(list(skip_dict.keys()), zt_list):
-            if skip_dict[ii] != 0:
-                skip_points = skip_dict[ii]*zt.df
-                print('Skipping {0} points for {1}'.format(skip_points,
-                                                            zt.ch_cmp))
-                zt.time_series = zt.time_series[skip_points:]
-                zt.gps_diff = zt.gps_diff[skip_dict[ii]:]
-                zt.gps_list = zt.gps_list[skip_dict[ii]:]
-                zt.date_time = zt.date_time[skip_dict[ii]:]
-                zt.gps_time = zt.gps_time[skip_dict[ii]:]
+                                             zs.get_date_time(time_max)))
+                continue
             
-        #test length of time series
-        ts_len_list = np.array([len(zt.time_series) for zt in zt_list])
-        
-        #get the smallest number of points in the time series
-        ts_min = ts_len_list.min()
-        
-        #make a time series array for easy access
-        ts_min /= decimate
+            start = int(zs.ts_index[time_find[0]])
+            if start != 0:
+                print('Skipping {0} points for {1}'.format(start,
+                                                            zs.component))
+            start_list.append(start)
             
-        ts_array = np.zeros((ts_min, n_fn))
+        #get the smallest number of points in the time series
+        ts_len = min([zs.n_samples-start 
+                      for zs, start in zip(zt_list, start_list)])//decimate
         
-        #trim the time series if needed
-        for ii, zt in enumerate(zt_list):
-            if decimate > 1:
-                zt.time_series = sps.resample(zt.time_series, 
-                                              zt.time_series.shape[0]/decimate,
-                                              window='hanning')
-            if len(zt.time_series) != ts_min:
-                ts_trim = zt.time_series[:ts_min]
-            else:
-                ts_trim = zt.time_series
-            zt.time_series = ts_trim
-            
-            ts_array[:, ii] = ts_trim
-            
+        for zs in zt_list:
+            t0 = zs.get_date_time(time_max).strftime(zen.datetime_fmt)
             if self.verbose:
-                print('TS length for channel {0} '.format(zt.ch_number)+\
-                      '({0}) '.format(zt.ch_cmp)+\
-                      '= {0}'.format(len(ts_trim)))
-                print('    T0 = {0}\n'.format(zt.date_time[0]))
+                print('TS length for channel {0} '.format(zs.zt.header.channel)+\
+                      '({0}) '.format(zs.component)+\
+                      '= {0}'.format(ts_len))
+                print('    T0 = {0}\n'.format(t0))
             self.log_lines.append(' '*4+\
-                                  'TS length for channel {0} '.format(zt.ch_number)+\
-                                  '({0}) '.format(zt.ch_cmp)+\
-                                  '= {0}'.format(len(ts_trim)))
-            self.log_lines.append(', T0 = {0}\n'.format(zt.date_time[0]))
-            
-        if decimate is not 1:
-            ts_array = sps.resample(ts_array, ts_min/decimate, 
-                                    window='hanning')
-            ts_min = ts_array.shape[0]
-            
+                                  'TS length for channel {0} '.format(zs.zt.header.channel)+\
+                                  '({0}) '.format(zs.component)+\
+                                  '= {0}'.format(ts_len))
+            self.log_lines.append(', T0 = {0}\n'.format(t0))
         
-        return ts_array, ts_min
+        return start_list, ts_len
     
+    #==================================================
+    def _iter_time_series(self, zt_list, start_list, ts_len, decimate=1,
+                          chunk_size=2**20):
+        """
+        iterate over the merged time series in chunks of chunk_size points,
+        each chunk is an np.ndarray(chunk_size, num_channels) of counts.
+        
+        To decimate, each channel is streamed through a 
+        mtpy.processing.decimation.PolyphaseDecimator, so the chunks are the
+        same as for the whole time series.
+        """
+        if decimate > 1:
+            decimator_list = [decimation.PolyphaseDecimator(decimate, 
+                                                            pad='zeros')
+                              for zs in zt_list]
+            
+        ts_max = 2.14e9
+        for ii in range(0, ts_len, chunk_size):
+            jj = min(ii+chunk_size, ts_len)
+            ts_chunk = np.zeros((jj-ii, len(zt_list)), dtype=np.int32)
+            for kk, (zs, start) in enumerate(zip(zt_list, start_list)):
+                if decimate == 1:
+                    ts_chunk[:, kk] = zs.read(start+ii, start+jj)
+                    continue
+                
+                # read all the points the decimated points of this chunk need
+                decimator = decimator_list[kk]
+                ts_read = zs.read(start+decimator.n_in, 
+                                  start+jj*decimate+decimator.delay)
+                ts_arr = decimator.decimate(ts_read)
+                if ts_arr.size < jj-ii:
+                    # the time series ends within the filter length
+                    ts_arr = np.concatenate((ts_arr, decimator.flush()))
+                ts_arr = ts_arr[:jj-ii]
+                ts_chunk[:, kk] = np.clip(np.round(ts_arr), -ts_max, ts_max)
+                
+            #--> make sure none of the data is above the allowed level
+            ts_chunk[np.where(ts_chunk > ts_max)] = ts_max
+            ts_chunk[np.where(ts_chunk < -ts_max)] = -ts_max
+            yield ts_chunk
+    
+    #==================================================
+    def _write_block(self, cfid, block_type, block_str):
+        """
+        write a cache block stamped with its length at the beginning and end
+        """
+        block_len = len(block_str)+2
+        cfid.write(struct.pack('<iih', block_len, self._flag, 
+                               self._type_dict[block_type]))
+        cfid.write(block_str)
+        cfid.write(struct.pack('<i', block_len))
+        
+    #==================================================
+    def _write_cache_blocks(self, cfid, meta_str, n_fn, n_cal):
+        """
+        write the navigation, meta data and calibration blocks
+        """
+        #--> write navigation records first
+        self._write_block(cfid, 'nav', b'\x00'*(self._nav_len-2))
+        
+        #--> write meta data
+        self._write_block(cfid, 'meta', meta_str.encode())
+        
+        #--> write calibrations
+        cal_data1 = 'HEADER.TYPE,Calibrate\nCAL.VER,019\nCAL.SYS,0000,'+\
+                   ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*n_cal)
+        cal_data2 = '\nCAL.SYS,0000,'+\
+                    ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*n_cal)
+                    
+        cal_data = cal_data1+(cal_data2*(n_fn-1))
+        self._write_block(cfid, 'cal', (cal_data[:-1]+'\n').encode())
+        
+    #==================================================
+    def _write_ts_block(self, cfid, ts_iter, ts_len, n_fn):
+        """
+        write the time series block a chunk at a time from ts_iter, the 
+        channels are interleaved as signed integers
+        """
+        ts_block_len = int(ts_len)*n_fn*4+2
+        
+        cfid.write(struct.pack('<iih', ts_block_len, self._flag, 
+                               self._type_dict['ts']))
+        for ts_chunk in ts_iter:
+            cfid.write(ts_chunk.astype('<i4').tobytes())
+        cfid.write(struct.pack('<i', ts_block_len))
+        
     #==================================================    
-    def write_cache_file(self, fn_list, save_fn, station='ZEN', decimate=1):
+    def write_cache_file(self, fn_list, save_fn, station='ZEN', decimate=1,
+                         chunk_size=2**20):
         """
         write a cache file from given filenames
         
+        The Z3D files are memory mapped and the time series are written 
+        chunk_size points at a time, so the files are never read in whole.
+        
         """
         #sort the files so they are in order
         fn_sort_list = []
@@ -570,41 +824,42 @@ class ZenCache(object):
         fn_list = fn_sort_list
         print(fn_list)
             
-        n_fn = len(fn_list)
         self.zt_list = []
         for fn in fn_list:
-            zt1 = zen.Zen3D(fn=fn)
-            zt1.verbose = self.verbose
-            try:
-                zt1.read_3d()
-            except ZenGPSError:
-                zt1._seconds_diff = 59
-                zt1.read_3d()
-            self.zt_list.append(zt1)
-        
-            #fill in meta data from the time series file
-            self.meta_data['DATA.DATE0'] = ','+zt1.date_time[0].split(',')[0]
-            self.meta_data['DATA.TIME0'] = ','+zt1.date_time[0].split(',')[1]
-            self.meta_data['TS.ADFREQ'] = ',{0}'.format(int(zt1.df))
+            zs = Z3DStream(fn=fn)
+            zs.read_info()
+            self.zt_list.append(zs)
+            
+        #make sure all files have the same sampling rate
+        self.check_sampling_rate(self.zt_list)
+        
+        #make sure the length of time series is the same for all channels
+        start_list, ts_len = self.check_time_series(self.zt_list,
+                                                    decimate=decimate)
+        n_fn = len(self.zt_list)
+        
+        #fill in meta data from the time series files
+        for zs, start in zip(self.zt_list, start_list):
+            zt1 = zs.zt
+            t0 = zs.get_date_time(zs.gps_seconds[np.searchsorted(zs.ts_index,
+                                                                 start)])
+            self.meta_data['DATA.DATE0'] = ','+t0.strftime('%Y-%m-%d')
+            self.meta_data['DATA.TIME0'] = ','+t0.strftime('%H:%M:%S')
+            self.meta_data['TS.ADFREQ'] = ',{0}'.format(int(zt1.df/decimate))
             self.meta_data['CH.FACTOR'] += ','+self._ch_factor 
             self.meta_data['CH.GAIN'] += ','+self._ch_gain
-            self.meta_data['CH.CMP'] += ','+zt1.ch_cmp.upper()
-            self.meta_data['CH.LENGTH'] += ','+zt1.ch_length
+            self.meta_data['CH.CMP'] += ','+zs.component.upper()
+            self.meta_data['CH.LENGTH'] += ',{0}'.format(zt1.dipole_len)
             self.meta_data['CH.EXTGAIN'] += ',1'
             self.meta_data['CH.NOTCH'] += ',NONE'
             self.meta_data['CH.HIGHPASS'] += ',NONE'
             self.meta_data['CH.LOWPASS'] += ','+\
                                        self._ch_lowpass_dict[str(int(zt1.df))]
-            self.meta_data['CH.ADCARDSN'] += ','+zt1.ch_adcard_sn
-            self.meta_data['CH.NUMBER'] += ',{0}'.format(zt1.ch_number)
-            self.meta_data['RX.STN'] += ','+zt1.rx_stn
-            
-        #make sure all files have the same sampling rate
-        self.check_sampling_rate(self.zt_list)
-        
-        #make sure the length of time series is the same for all channels
-        self.ts, ts_len = self.check_time_series(self.zt_list,
-                                                 decimate=decimate)
+            self.meta_data['CH.ADCARDSN'] += ',{0}'.format(
+                                                    zt1.header.channelserial)
+            self.meta_data['CH.NUMBER'] += ',{0}'.format(
+                                                    zt1.metadata.ch_number)
+            self.meta_data['RX.STN'] += ',{0}'.format(zt1.station)
         
         self.meta_data['TS.NPNT'] = ',{0}'.format(ts_len)
         
@@ -625,70 +880,18 @@ class ZenCache(object):
                 if not os.path.exists(save_fn):
                     os.mkdir(save_fn)
             self.save_fn = os.path.join(save_fn, general_fn)
-                
-                
             
-        cfid = file(self.save_fn, 'wb+')
-        #--> write navigation records first        
-        cfid.write(struct.pack('<i', self._nav_len))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['nav']))
-        for nd in range(self._nav_len-2):
-            cfid.write(struct.pack('<b', 0))
-        cfid.write(struct.pack('<i', self._nav_len))
-        
-        #--> write meta data
         meta_str = ''.join([key+self.meta_data[key]+'\n' 
                              for key in np.sort(list(self.meta_data.keys()))])
         
-        meta_len = len(meta_str)
-        
-        cfid.write(struct.pack('<i', meta_len+2))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['meta']))
-        cfid.write(meta_str)
-        cfid.write(struct.pack('<i', meta_len+2))
-        
-        #--> write calibrations
-        cal_data1 = 'HEADER.TYPE,Calibrate\nCAL.VER,019\nCAL.SYS,0000,'+\
-                   ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*27)
-        cal_data2 = '\nCAL.SYS,0000,'+\
-                    ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*27)
-                    
-        cal_data = cal_data1+(cal_data2*(n_fn-1))
-        cal_len = len(cal_data)
-        
-        cfid.write(struct.pack('<i', cal_len+2))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['cal']))
-        cfid.write(cal_data[:-1]+'\n')
-        cfid.write(struct.pack('<i', cal_len+2))
-        
-        #--> write data
-        
-        ts_block_len = int(ts_len)*n_fn*4+2
-        
-        #--> Need to scale the time series into counts cause that is apparently
-        #    what MTFT24 expects
-        self.ts = self.ts.astype(np.int32)
-        
-        #--> make sure none of the data is above the allowed level
-        self.ts[np.where(self.ts>2.14e9)] = 2.14e9
-        self.ts[np.where(self.ts<-2.14e9)] = -2.14e9
-        
-        #--> write time series block
-        cfid.write(struct.pack('<i', ts_block_len))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['ts']))
-        
-        #--> need to pack the data as signed integers
-        for zz in range(ts_len):
-            cfid.write(struct.pack('<'+'i'*n_fn, *self.ts[zz]))
-                                
-        cfid.write(struct.pack('<i', ts_block_len))
-         
-        
-        cfid.close()
+        with open(self.save_fn, 'wb') as cfid:
+            self._write_cache_blocks(cfid, meta_str, n_fn, 27)
+            
+            #--> stream the time series into the file
+            ts_iter = self._iter_time_series(self.zt_list, start_list, ts_len,
+                                             decimate=decimate,
+                                             chunk_size=chunk_size)
+            self._write_ts_block(cfid, ts_iter, ts_len, n_fn)
         
         if self.verbose:
             print('Saved File to: ', self.save_fn)
@@ -698,7 +901,7 @@ class ZenCache(object):
         self.log_lines.append('='*72+'\n')
     
     #==================================================    
-    def rewrite_cache_file(self):
+    def rewrite_cache_file(self, chunk_size=2**20):
         """
         rewrite a cache file if parameters changed
         
@@ -707,67 +910,59 @@ class ZenCache(object):
         """
         self.save_fn_rw = mtfh.make_unique_filename(self.save_fn)
         
-        cfid = file(self.save_fn_rw, 'wb+')
-        
         n_fn = self.ts.shape[1]
         
-        #--> write navigation records first        
-        cfid.write(struct.pack('<i', self._nav_len))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['nav']))
-        for nd in range(self._nav_len-2):
-            cfid.write(struct.pack('<b', 0))
-        cfid.write(struct.pack('<i', self._nav_len))
-        
-        #--> write meta data
         meta_str = ''.join([key+','+','.join(self.meta_data[key])+'\n' 
                              for key in np.sort(list(self.meta_data.keys()))
                              if key != ''])
         
-        meta_len = len(meta_str)
-        
-        cfid.write(struct.pack('<i', meta_len+2))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['meta']))
-        cfid.write(meta_str)
-        cfid.write(struct.pack('<i', meta_len+2))
-        
-        #--> write calibrations
-        cal_data1 = 'HEADER.TYPE,Calibrate\nCAL.VER,019\nCAL.SYS,0000,'+\
-                   ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*1)
-        cal_data2 = '\nCAL.SYS,0000,'+\
-                    ''.join([' 0.000000: '+'0.000000      0.000000,'*3]*1)
-                    
-        cal_data = cal_data1+(cal_data2*(self.ts.shape[1]-1))
-        cal_len = len(cal_data)
-        
-        cfid.write(struct.pack('<i', cal_len+2))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['cal']))
-        cfid.write(cal_data[:-1]+'\n')
-        cfid.write(struct.pack('<i', cal_len+2))
-        
-        #--> write data
-        ts_block_len = self.ts.shape[0]*n_fn*4+2
-        
         #--> make sure none of the data is above the allowed level
-        self.ts[np.where(self.ts>2.14e9)] = 2.14e9
-        self.ts[np.where(self.ts<-2.14e9)] = -2.14e9
+        def clip_ts():
+            for ii in range(0, self.ts.shape[0], chunk_size):
+                ts_chunk = np.clip(self.ts[ii:ii+chunk_size], -2.14e9, 2.14e9)
+                yield ts_chunk.astype(np.int32)
         
-        #--> write time series block
-        cfid.write(struct.pack('<i', ts_block_len))
-        cfid.write(struct.pack('<i', self._flag))
-        cfid.write(struct.pack('<h', self._type_dict['ts']))
-        for zz in range(self.ts.shape[0]):
-            cfid.write(struct.pack('<'+'i'*n_fn, *self.ts[zz]))
-                                
-        cfid.write(struct.pack('<i', ts_block_len))
-                 
-        cfid.close()
+        with open(self.save_fn_rw, 'wb') as cfid:
+            self._write_cache_blocks(cfid, meta_str, n_fn, 1)
+            self._write_ts_block(cfid, clip_ts(), self.ts.shape[0], n_fn)
         
         print('Rewrote {0}\n to {1}'.format(self.save_fn, self.save_fn_rw))        
     
-    #==================================================    
+    #==================================================
+    def _read_block(self, cfid, block_name, block_error):
+        """
+        read the stamp of the next block and skip over the block data, 
+        checking the length at the end of the block is the same as the 
+        length in the stamp
+        
+        :returns: the block stamp and the location of the block data in
+                  the file
+        """
+        block = np.frombuffer(cfid.read(self._stamp_len), 
+                              dtype=self._data_type)[0]
+        f_tell = cfid.tell()
+        cfid.seek(int(block['len'])-2, 1)
+        len_check = np.frombuffer(cfid.read(4), dtype=np.int32)
+        if len_check.size != 1 or len_check[0] != block['len']:
+            if self.verbose:
+                print('Index for second {0} length is {1}'.format(
+                      block_name, f_tell+int(block['len'])-2))
+            raise block_error('{0} length in data blocks are not '
+                              'equal: {1} != {2}'.format(
+                              block_name, block['len'], len_check))
+        return block, f_tell
+    
+    #==================================================
+    def _read_block_str(self, cfid, block, f_tell):
+        """
+        read the data of a block located with _read_block
+        """
+        cfid.seek(f_tell)
+        block_str = cfid.read(int(block['len'])-2)
+        cfid.seek(4, 1)
+        return block_str
+    
+    #==================================================
     def read_cache_metadata(self, cache_fn):
         """
         read only the meta data from the cache file
@@ -775,160 +970,65 @@ class ZenCache(object):
         
         self.save_fn = cache_fn
         #open cache file to read in as a binary file
-        cfid = file(cache_fn, 'rb')
-        
-        #read into a long string
-        cdata = cfid.read(1050)
-        
-        #--> read navigation data
-        nav_block = np.fromstring(cdata[0:self._stamp_len], 
-                                  dtype=self._data_type)
-        
-        #get starting and ending indices for navigation block
-        ii = int(self._stamp_len)
-        jj = self._stamp_len+nav_block['len']-2
-        self.nav_data = np.fromstring(cdata[ii:jj], dtype=np.int8)
-        
-        #get indicies for length of block
-        ii = int(jj)
-        jj = ii+4
-        nav_len_check = np.fromstring(cdata[ii:jj], np.int32)
-        if nav_len_check != nav_block['len']:
-            if self.verbose:
-                print('Index for second navigation length is {0}'.format(ii))
-            raise CacheNavigationError('Navigation length in data block are'
-                                       'not equal: {0} != {1}'.format(
-                                       nav_block['len'], nav_len_check))
-        
-        #--> read meta data
-        ii = int(jj)
-        jj = ii+self._stamp_len
-        
-        meta_block = np.fromstring(cdata[ii:jj], dtype=self._data_type)
-        ii = int(jj)
-        jj = ii+meta_block['len']-2
+        with open(cache_fn, 'rb') as cfid:
+            #--> read navigation data
+            self._read_block(cfid, 'Navigation', CacheNavigationError)
+            
+            #--> read meta data
+            meta_block, f_tell = self._read_block(cfid, 'Meta',
+                                                  CacheMetaDataError)
+            meta_str = self._read_block_str(cfid, meta_block, f_tell)
+            
         self.meta_data = {}
-        meta_list = cdata[ii:jj].split('\n')
-        for mm in meta_list:
+        for mm in meta_str.decode().split('\n'):
             mfind = mm.find(',')
             self.meta_data[mm[0:mfind]] = [ms.strip() for ms in 
                                             mm[mfind+1:].split(',')]
         
-        #get index for second length test
-        ii = int(jj)
-        jj = ii+4
-        meta_len_check = np.fromstring(cdata[ii:jj], dtype=np.int32)
-        if meta_len_check != meta_block['len']:
-            if self.verbose:
-                print('Index for second meta length is {0}'.format(ii))
-            raise CacheMetaDataError('Meta length in data blocks are not '
-                                     'equal: {0} != {1}'.format(
-                                     meta_block['len'], meta_len_check))
-        cfid.close()
-        
     #==================================================
     def read_cache(self, cache_fn):
         """
-        read a cache file
+        read a cache file, the time series is memory mapped into ts as an 
+        np.memmap(num_points, num_channels) and not read in
         
         """
         
         self.save_fn = cache_fn
         #open cache file to read in as a binary file
-        cfid = file(cache_fn, 'rb')
-        
-        #read into a long string
-        cdata = cfid.read()
-        
-        #--> read navigation data
-        nav_block = np.fromstring(cdata[0:self._stamp_len], 
-                                  dtype=self._data_type)
-        
-        #get starting and ending indices for navigation block
-        ii = int(self._stamp_len)
-        jj = self._stamp_len+nav_block['len']-2
-        self.nav_data = np.fromstring(cdata[ii:jj], dtype=np.int8)
-        
-        #get indicies for length of block
-        ii = int(jj)
-        jj = ii+4
-        nav_len_check = np.fromstring(cdata[ii:jj], np.int32)
-        if nav_len_check != nav_block['len']:
-            if self.verbose:
-                print('Index for second navigation length is {0}'.format(ii))
-            raise CacheNavigationError('Navigation length in data block are'
-                                       'not equal: {0} != {1}'.format(
-                                       nav_block['len'], nav_len_check))
-        
-        #--> read meta data
-        ii = int(jj)
-        jj = ii+self._stamp_len
-        
-        meta_block = np.fromstring(cdata[ii:jj], dtype=self._data_type)
-        ii = int(jj)
-        jj = ii+meta_block['len']-2
-        self.meta_data = {}
-        meta_list = cdata[ii:jj].split('\n')
-        for mm in meta_list:
-            mfind = mm.find(',')
-            self.meta_data[mm[0:mfind]] = mm[mfind+1:].split(',')
-        
-        #get index for second length test
-        ii = int(jj)
-        jj = ii+4
-        meta_len_check = np.fromstring(cdata[ii:jj], dtype=np.int32)
-        if meta_len_check != meta_block['len']:
-            if self.verbose:
-                print('Index for second meta length is {0}'.format(ii))
-            raise CacheMetaDataError('Meta length in data blocks are not'
-                                     'equal: {0} != {1}'.format(
-                                     meta_block['len'], meta_len_check))
-        
-        #--> read calibrations
-        ii = int(jj)
-        jj = ii+self._stamp_len
-        cal_block = np.fromstring(cdata[ii:jj], dtype=self._data_type)
-        
-        ii = int(jj)
-        jj = ii+cal_block['len']-2
-        self.cal_data = cdata[ii:jj]
-                
-        
-        ii = int(jj)
-        jj = ii+4
-        cal_len_check = np.fromstring(cdata[ii:jj], dtype=np.int32)
-        if cal_len_check != cal_block['len']:
-            if self.verbose:
-                print('Index for second cal length is {0}'.format(ii))
-            raise CacheCalibrationError('Cal length in data blocks are not'
-                                        'equal: {0} != {1}'.format(
-                                        cal_block['len'], cal_len_check))
-        
-        #--> read data
-        ii = int(jj)
-        jj = ii+self._stamp_len
-        
-        ts_block = np.fromstring(cdata[ii:jj], dtype=self._data_type)
-        
-        #get time series data
-        ii = int(jj)
-        jj = ii+ts_block['len']-2
-        self.ts = np.fromstring(cdata[ii:jj], dtype=self._ts_dtype)
+        with open(cache_fn, 'rb') as cfid:
+            #--> read navigation data
+            nav_block, f_tell = self._read_block(cfid, 'Navigation', 
+                                                 CacheNavigationError)
+            self.nav_data = np.frombuffer(self._read_block_str(cfid, nav_block,
+                                                               f_tell),
+                                          dtype=np.int8)
+        
+            #--> read meta data
+            meta_block, f_tell = self._read_block(cfid, 'Meta',
+                                                  CacheMetaDataError)
+            meta_str = self._read_block_str(cfid, meta_block, f_tell)
+            self.meta_data = {}
+            for mm in meta_str.decode().split('\n'):
+                mfind = mm.find(',')
+                self.meta_data[mm[0:mfind]] = mm[mfind+1:].split(',')
+        
+            #--> read calibrations
+            cal_block, f_tell = self._read_block(cfid, 'Cal', 
+                                                 CacheCalibrationError)
+            self.cal_data = self._read_block_str(cfid, cal_block, 
+                                                 f_tell).decode()
+        
+            #--> read data
+            ts_block, f_tell = self._read_block(cfid, 'ts', 
+                                                CacheTimeSeriesError)
+            
         #resize time series to be length of each channel
         num_chn = len(self.meta_data['ch.cmp'.upper()])
-        if self.ts.shape[0]%num_chn != 0:
-            print('Trimming TS by {0} points'.format(self.ts.shape[0]%num_chn))
-        self.ts = np.resize(self.ts, (int(self.ts.shape[0]/num_chn), num_chn))
-        
-        ii = int(jj)
-        jj = ii+4
-        ts_len_check = np.fromstring(cdata[ii:jj], dtype=np.int32)
-        if ts_len_check != ts_block['len']:
-            if self.verbose:
-                print('Index for second ts length is {0}'.format(ii))
-            raise CacheTimeSeriesError('ts length in data blocks are not'
-                                       'equal: {0} != {1}'.format(
-                                       ts_block['len'], ts_len_check))
+        num_ts = (int(ts_block['len'])-2)//np.dtype(self._ts_dtype).itemsize
+        if num_ts%num_chn != 0:
+            print('Trimming TS by {0} points'.format(num_ts%num_chn))
+        self.ts = np.memmap(cache_fn, dtype=self._ts_dtype, mode='r',
+                            offset=f_tell, shape=(num_ts//num_chn, num_chn))
 
     
 #==============================================================================
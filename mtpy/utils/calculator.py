@@ -234,41 +234,186 @@ def rhophi2z(rho, phi, freq):
     return z 
 
 
-def compute_determinant_error(z_array, z_err_array, method = 'theoretical', repeats=1000):
+def monte_carlo_error(func, z_array, z_err_array, repeats=1000, seed=None,
+                      chunk_size=2**20):
     """
-    compute the error of the determinant of z using a stochastic method
-    seed random z arrays with a normal distribution around the input array
-
+    estimate the error of a quantity computed from z using a stochastic 
+    method.  Random z arrays are seeded with a normal distribution around 
+    the input array, the real and imaginary parts are drawn independently
+    with the same error.  The realizations are drawn in chunks, so the 
+    memory used does not grow with the number of repeats.
+
+    :param func: function computing the quantity from an array of 
+                 realizations of z, shape (n_realizations,) + z_array.shape,
+                 returning an array with first dimension n_realizations
     :param z_array: z (impedance) array containing real and imaginary values
+                    of any shape, e.g. (nf, 2, 2) or (n_stations, nf, 2, 2)
     :param z_err_array: impedance error array containing real values,
                         in MT we assume the real and imag errors are the same
-    :param method: method to use, theoretical calculation or stochastic
+    :param repeats: number of realizations
+    :param seed: seed for the random number generator or a random number
+                 generator such as np.random.RandomState, same seed gives
+                 the same error whatever the chunk_size
+    :param chunk_size: maximum number of impedance values drawn at once
+    
+    :return: error: array of real values, the standard deviation of the
+                    quantity over all realizations
+    """
+    z_array = np.asarray(z_array)
+    try:
+        z_err_array = np.broadcast_to(np.asarray(z_err_array, dtype=float),
+                                      z_array.shape)
+    except ValueError:
+        raise MTex.MTpyError_inputarguments('ERROR - z_err_array of shape {0} '
+                                            'does not match z_array of shape '
+                                            '{1}'.format(np.shape(z_err_array),
+                                                         z_array.shape))
+    if repeats < 1:
+        raise MTex.MTpyError_inputarguments('ERROR - repeats must be at '
+                                            'least 1')
+
+    if hasattr(seed, 'standard_normal'):
+        random_state = seed
+    else:
+        random_state = np.random.RandomState(seed)
+
+    n_chunk = int(min(repeats, max(1, chunk_size // max(z_array.size, 1))))
+
+    # combine mean and sum of squared deviations of each chunk
+    count = 0
+    mean = 0
+    m2 = 0
+    while count < repeats:
+        n_draw = min(n_chunk, repeats - count)
+        # real and imaginary parts are drawn interleaved so that the random
+        # values do not depend on the chunk size
+        errmag = random_state.standard_normal((n_draw,) + z_array.shape +
+                                              (2,)).view(complex)[..., 0]
+        values = np.asarray(func(z_array + errmag * z_err_array))
+
+        chunk_mean = values.mean(axis=0)
+        chunk_m2 = (np.abs(values - chunk_mean)**2).sum(axis=0)
+        delta = chunk_mean - mean
+        mean = mean + delta * n_draw / (count + n_draw)
+        m2 = m2 + chunk_m2 + np.abs(delta)**2 * count * n_draw / (count + n_draw)
+        count += n_draw
+
+    return np.sqrt(m2 / repeats)
+
+
+def compute_determinant_error(z_array, z_err_array, method = 'theoretical',
+                              repeats=1000, seed=None, chunk_size=2**20):
+    """
+    compute the error of the determinant of z, either from a theoretical 
+    calculation or using a stochastic method, see monte_carlo_error
+
+    :param z_array: z (impedance) array containing real and imaginary values,
+                    shape (nf, 2, 2) or (n_stations, nf, 2, 2)
+    :param z_err_array: impedance error array containing real values,
+                        in MT we assume the real and imag errors are the same
+    :param method: method to use, 'theoretical' calculation or 'stochastic'
+    :param repeats: number of realizations for the stochastic method
+    :param seed: seed for the random number generator
+    :param chunk_size: maximum number of impedance values drawn at once
     
     :return: error: array of real values with same shape as z_err_array 
-                    representing the error in the determinant of Z
-    :return: error_sqrt: array of real values with same shape as z_err_array 
-                    representing the error in the (determinant of Z)**0.5
+                    without the last 2 dimensions representing the error 
+                    in the determinant of Z
     
     """
-    if method == 'stochatic':
-        arraylist = []
-        
-        for r in range(repeats):
-            errmag = np.random.normal(loc=0,scale=z_err_array,size=z_array.shape)
-            arraylist = np.append(arraylist,z_array + errmag*(1. + 1j))
-            
-        arraylist = arraylist.reshape(repeats,z_array.shape[0],2,2)
-        detlist = np.linalg.det(arraylist)
-        
-        error = np.std(detlist,axis=0)
+    # keep the old misspelled method name working
+    if method in ['stochastic', 'stochatic']:
+        error = monte_carlo_error(_determinant, z_array, z_err_array,
+                                  repeats=repeats, seed=seed,
+                                  chunk_size=chunk_size)
     
     else:
-        error = np.abs(z_err_array[:,0,0]*np.abs(z_array[:,1,1]) + z_err_array[:,1,1]*np.abs(z_array[:,0,0]) \
-             - z_err_array[:,0,1]*np.abs(z_array[:,1,0]) - z_err_array[:,1,0]*np.abs(z_array[:,0,1]))
+        error = np.abs(z_err_array[..., 0, 0]*np.abs(z_array[..., 1, 1]) + z_err_array[..., 1, 1]*np.abs(z_array[..., 0, 0]) \
+             - z_err_array[..., 0, 1]*np.abs(z_array[..., 1, 0]) - z_err_array[..., 1, 0]*np.abs(z_array[..., 0, 1]))
     
     return error
 
 
+def _determinant(z_array):
+    """
+    determinant of an array of 2x2 matrices, much faster than np.linalg.det
+    """
+    return z_array[..., 0, 0] * z_array[..., 1, 1] - \
+           z_array[..., 0, 1] * z_array[..., 1, 0]
+
+
+def compute_resistivity_phase_error(z_array, z_err_array, freq, repeats=1000,
+                                    seed=None, chunk_size=2**20):
+    """
+    compute the error of apparent resistivity and phase using a stochastic
+    method, see monte_carlo_error.  The phase error is computed from the 
+    phase difference to z_array, so phases close to +/-180 are not wrapped.
+
+    :param z_array: z (impedance) array containing real and imaginary values,
+                    shape (nf, 2, 2) or (n_stations, nf, 2, 2)
+    :param z_err_array: impedance error array containing real values,
+                        in MT we assume the real and imag errors are the same
+    :param freq: array of frequencies (nf) in Hz
+    :param repeats: number of realizations
+    :param seed: seed for the random number generator
+    :param chunk_size: maximum number of impedance values drawn at once
+    
+    :return: res_error: array of real values with same shape as z_array
+                        representing the error in resistivity in Ohm m
+    :return: phase_error: array of real values with same shape as z_array
+                          representing the error in phase in degrees
+    """
+    z_array = np.asarray(z_array)
+    freq = np.asarray(freq, dtype=float)[:, np.newaxis, np.newaxis]
+
+    def res_phase(z):
+        return np.stack([0.2 * np.abs(z)**2 / freq,
+                         np.degrees(np.angle(z * np.conj(z_array)))], axis=1)
+
+    res_error, phase_error = monte_carlo_error(res_phase, z_array,
+                                               z_err_array, repeats=repeats,
+                                               seed=seed, chunk_size=chunk_size)
+
+    return res_error, phase_error
+
+
+def compute_phase_tensor_error(z_array, z_err_array, repeats=1000, seed=None,
+                               chunk_size=2**20):
+    """
+    compute the error of the phase tensor Phi = X^-1 Y, where Z = X + iY, 
+    using a stochastic method, see monte_carlo_error
+
+    :param z_array: z (impedance) array containing real and imaginary values,
+                    shape (nf, 2, 2) or (n_stations, nf, 2, 2)
+    :param z_err_array: impedance error array containing real values,
+                        in MT we assume the real and imag errors are the same
+    :param repeats: number of realizations
+    :param seed: seed for the random number generator
+    :param chunk_size: maximum number of impedance values drawn at once
+    
+    :return: pt_error: array of real values with same shape as z_array
+                       representing the error in the phase tensor
+    """
+    return monte_carlo_error(compute_phase_tensor, z_array, z_err_array,
+                             repeats=repeats, seed=seed, chunk_size=chunk_size)
+
+
+def compute_phase_tensor(z_array):
+    """
+    compute the phase tensor Phi = X^-1 Y, where Z = X + iY, for an array of
+    impedance tensors of shape (..., 2, 2)
+    """
+    x = np.real(z_array)
+    y = np.imag(z_array)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        det_x = x[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * x[..., 1, 0]
+        x_inv = np.stack([np.stack([x[..., 1, 1], -x[..., 0, 1]], axis=-1),
+                          np.stack([-x[..., 1, 0], x[..., 0, 0]], axis=-1)],
+                         axis=-2) / det_x[..., np.newaxis, np.newaxis]
+
+    return np.matmul(x_inv, y)
+
+
 
 
 def propagate_error_polar2rect(r,r_error,phi, phi_error):
@@ -322,6 +322,133 @@ def get_sampling_interval_fromdatafile(filename, length = 3600):
     return sampling_interval
 
 
+def _EDL_sort_files(lo_allfiles, comp):
+    """
+        Return the files of one component and their starting times, sorted 
+        by starting time. Files without a starting time in the name are 
+        left out.
+    """
+    lo_files = [f for f in lo_allfiles if f.lower()[-2:] == comp]
+    lo_sorted = sorted([(EDL_get_starttime_fromfilename(f), f) 
+                        for f in lo_files], 
+                       key=lambda t_f: (t_f[0] is None, t_f[0], t_f[1]))
+    lo_sorted = [t_f for t_f in lo_sorted if t_f[0] is not None]
+
+    return [t_f[1] for t_f in lo_sorted], [t_f[0] for t_f in lo_sorted]
+
+
+def _EDL_plan_merge(lo_files, lo_starttimes, sampling, get_block):
+    """
+        Plan how consecutive files are merged, without reading the data.
+
+        Files are merged as long as they are continuous and start in the 
+        same block, get_block(starttime) gives the block of a starting time.
+        A file that overlaps the data before it replaces the overlapping 
+        samples, a file that ends before the data before it is skipped.
+
+        Returns a list of output files, each a tuple 
+        (starttime, list of [filename, number of samples to take], index), 
+        where the index counts output files in the same block split by gaps.
+    """
+    lo_outfiles = []
+    lo_pieces = None
+    fileindex = 0
+
+    for f, file_start_time in zip(lo_files, lo_starttimes):
+        try:
+            print('Reading file %s' %(f))
+            no_samples = count_ts_samples(f)
+        except (IOError, OSError):
+            print('WARNING - could not read file - skipping...')
+            continue
+        if no_samples == 0:
+            print('WARNING - no data in file - skipping...')
+            continue
+
+        file_end_time = file_start_time + no_samples*sampling
+
+        if lo_pieces is not None:
+            #start a new output file in a new block or after a gap
+            if get_block(file_start_time) != block:
+                lo_outfiles.append((outfile_starttime, lo_pieces, fileindex))
+                lo_pieces = None
+                fileindex = 0
+            elif file_start_time - outfile_endtime > epsilon:
+                lo_outfiles.append((outfile_starttime, lo_pieces, fileindex))
+                lo_pieces = None
+                fileindex += 1
+
+        if lo_pieces is None:
+            outfile_starttime = file_start_time
+            block = get_block(file_start_time)
+            lo_pieces = [[f, no_samples]]
+            n_out = no_samples
+
+        else:
+            #check, if the new file ends earlier than data in buffer.
+            #if yes, just skip this file:
+            if file_end_time < outfile_endtime:
+                continue 
+
+            #if current file starts earlier than the endtime of data in 
+            #buffer, remove the overlapping samples from the end
+            elif (outfile_endtime - file_start_time) > epsilon:
+                n_cut = int((outfile_endtime - file_start_time)/sampling)
+                while n_cut > 0 and len(lo_pieces) > 0:
+                    if lo_pieces[-1][1] <= n_cut:
+                        n_cut -= lo_pieces.pop()[1]
+                    else:
+                        lo_pieces[-1][1] -= n_cut
+                        n_cut = 0
+                n_out = sum([piece[1] for piece in lo_pieces])
+                if len(lo_pieces) == 0:
+                    outfile_starttime = file_start_time
+
+            lo_pieces.append([f, no_samples])
+            n_out += no_samples
+
+        #current end time of the output file
+        outfile_endtime = outfile_starttime + n_out*sampling
+
+    if lo_pieces is not None:
+        lo_outfiles.append((outfile_starttime, lo_pieces, fileindex))
+
+    return lo_outfiles
+
+
+def _EDL_write_merged(new_file, stationname, comp, sampling, 
+                      outfile_starttime, lo_pieces):
+    """
+        Write an output file of merged data, the input files are read and 
+        written one at a time.
+    """
+    n_samples = sum([piece[1] for piece in lo_pieces])
+
+    #define header info
+    if outfile_starttime%1==0:
+        outfile_starttime = int(outfile_starttime)
+
+        headerline = '# {0} {1} {2:.1f} {3} {4} \n'.format(
+                        stationname, comp.lower(), 1./sampling, 
+                        outfile_starttime, n_samples)
+    else:
+        headerline = '# {0} {1} {2:.1f} {3:f} {4} \n'.format(
+                        stationname, comp.lower(), 1./sampling, 
+                        outfile_starttime, n_samples)
+
+    with open(new_file,'w') as F:
+        F.write(headerline)
+        for f, n_take in lo_pieces:
+            data_in = read_ts_data(f, stop=n_take)
+            #if it's not a single column of data, assuming that the first 
+            #column is time, so just take the second one
+            if data_in.ndim > 1:
+                data_in = data_in[:,1]
+            write_ts_data(F, data_in.astype(int), fmt='%d')
+
+    print('\t wrote file %s'%(new_file))
+
+
 def EDL_make_Nhour_files(n_hours,inputdir, sampling , stationname = None, outputdir = None):
 
     """
@@ -335,11 +462,7 @@ def EDL_make_Nhour_files(n_hours,inputdir, sampling , stationname = None, output
     1.   24%%N = 0
     2.   input data files start on the hour marks
 
-    Not working yet!!
-
     """
-    #print '\n\tnot working yet - code under development !!\n'
-    #return
 
     try:
         if 24%n_hours != 0:
@@ -350,31 +473,15 @@ def EDL_make_Nhour_files(n_hours,inputdir, sampling , stationname = None, output
     n_hours = int(n_hours)
     #list of starting hours for the data blocks:
     lo_hours = [int(i) for i in np.arange(int(24/n_hours))*n_hours ]
-    no_blocks = len(lo_hours)
-    
-    #build a list that contains the respective groups of starting hours belonging
-    # to the same block
-    lo_blockhours = []
-    counter = 0 
-    dummylist = []
-    for i in range(24):
-        dummylist.append(i)
-        counter += 1
-        if counter == n_hours:
-            lo_blockhours.append(dummylist)
-            dummylist = []
-            counter = 0 
 
     # most of the following code is redundant/taken from the 
     # 'EDL_make_dayfiles' function
     # This can be cleaned up later
 
-    try:
-        if type(inputdir)==str:
-            raise Exception("problem!!!")
-        lo_foldernames = [i for i in inputdir]
-    except TypeError:
+    if isinstance(inputdir, str):
         lo_foldernames = [inputdir]
+    else:
+        lo_foldernames = [i for i in inputdir]
 
     #typical suffixes for EDL output file names
     components = ['ex', 'ey', 'bx', 'by', 'bz']
@@ -434,272 +541,41 @@ def EDL_make_Nhour_files(n_hours,inputdir, sampling , stationname = None, output
     #outer loop over all components
     for comp in components:
 
-        #make list of files for the current component
-        lo_files = np.array([op.join(wd,i) for i in lo_allfiles 
-                            if (i.lower()[-2:] == comp)])
-
-        #make list of starting times for the respective files
-        lo_starttimes = np.array([EDL_get_starttime_fromfilename(f) 
-                                    for f in lo_files])
-        
-        #sort the files by their starting times
-        idx_chronologic = np.argsort(lo_starttimes)
-        
         #obtain sorted lists of files and starting times
-        lo_sorted_files = list(lo_files[idx_chronologic])
-        lo_sorted_starttimes = list(lo_starttimes[idx_chronologic])
-        idx = 0
-        while idx < len(lo_sorted_starttimes):
-            try:
-                val = lo_sorted_starttimes[idx]
-            except:
-                break
-            if val is None:
-                dummy = lo_sorted_files.pop(idx)
-                dummy = lo_sorted_starttimes.pop(idx)
-            else:
-                idx += 1
-
+        lo_sorted_files, lo_sorted_starttimes = _EDL_sort_files(lo_allfiles,
+                                                                comp)
+        if len(lo_sorted_files) == 0:
+            continue
 
         #set stationname, either from arguments or from filename
         if stationname is None:
             stationname = EDL_get_stationname_fromfilename(lo_sorted_files[0]).upper()
 
-        #set counting variables - needed for handling of consecutive files
-
-        #flags, checking, if data has to written to file
-        sameday = True
-        sameblock = True
-        fileopen = False
-        complete = False
-        #numerical index of files for same combination of date and hour
-        fileindex = 0
-        #current file's daily block number 
-        blockindex = 0 
-
-        #allocate a data array to fill
-        # this is more memory efficient than extending lists!!
-        #cater for potential rounding errors:
-        if sampling < 1:
-            max_n_data = 3600*int(n_hours) * (int(1./sampling)+1)
-        else:
-            max_n_data = int(3600.*int(n_hours)/sampling) + 1
-
-        block_data = np.zeros(max_n_data,'int')
+        #blocks of n_hours, counted from midnight each day
+        def get_block(starttime):
+            file_start = time.gmtime(starttime)
+            return file_start[:3], file_start[3]//n_hours
 
+        lo_outfiles = _EDL_plan_merge(lo_sorted_files, lo_sorted_starttimes,
+                                      sampling, get_block)
 
-        #loop over all (sorted) files for the current component
-        for idx_f,f in enumerate(lo_sorted_files):
-
-            try:
-
-                print('Reading file %s' %(f))
-                #starting time of current file
-                file_start_time = lo_sorted_starttimes[idx_f]
+        for outfile_starttime, lo_pieces, fileindex in lo_outfiles:
+            file_start = time.gmtime(outfile_starttime)
 
-                #get tuple with the starting time of the current file
-                file_start = time.gmtime(file_start_time)
-            
-                #read in raw data
-                data_in = []
-                Fin = open(f)
-                for line in Fin:#.readlines():
-                #    try:
-                    data_in.append(int(float(line.strip())))
-                 #   except:
-                  #      pass
-                data_in = np.array(data_in)
-                Fin.close()
-                #data_in = np.loadtxt(f)
-            except:
-                print('WARNING - could not read file - skipping...')
-                continue
-            no_samples = len(data_in)
-
-            #time axis of the file read in :
-            tmp_file_time_axis = np.arange(no_samples)*sampling+file_start_time
-
-            #end: time of the last sample + 1x sampling-interval
-            file_end_time =  tmp_file_time_axis[-1] + sampling
-         
-            #set the current file's starting time as starting time for output file, 
-            #if no output file is open already
-
-            
-            if fileopen is False:
-                #starttime of output file
-                outfile_starttime =  file_start_time
-                #output data sample index:                
-                arrayindex = 0
-
-                #if it's a single column of data
-                if np.size(data_in.shape) == 1:
-                    block_data[:len(data_in)] = data_in                    
-                    
-                #otherwise assuming that the first column is time, so just take the second one
-                else:
-                    block_data[:len(data_in)] = data_in[:,1]
-                
-                #jump with index to current point on time axis 
-                arrayindex += len(data_in)
-
-                #current (virtual) end time of open file
-                outfile_endtime = file_end_time
-
-                #find the date code of the outputfile
-                file_date = '{0}{1:02}{2:02}'.format(file_start[0],
+            #find the date code of the outputfile
+            file_date = '{0}{1:02}{2:02}'.format(file_start[0],
                                                  file_start[1], file_start[2])
-                
-                #...aaaand the hour code as well
-                data_hour = file_start[3]
-
-                #determine, which of the daily data blocks we are currently 
-                #processing/writing
-                blockindex = no_blocks-1
-                
-                file_hour = lo_hours[-1]
-                for t in range(len(lo_hours)-1):
-                    if lo_hours[t+1]>data_hour:
-                        blockindex = t
-                        file_hour = lo_hours[blockindex]
-                        break
-
-
-                #define output filename
-                new_fn = '{0}_{5}hours_{1}_{2:02d}_{3}.{4}'.format(stationname,
-                                                 file_date, file_hour,fileindex, comp,n_hours)
-                #absolute filename:
-                new_file = op.abspath(op.join(outpath,new_fn))
-                
-                #open output file 
-                F = open(new_file,'w')
-                
-                #set flag for further loop steps
-                fileopen = True
-
-            
-            else:
-                #check, if the new file ends earlier than data in buffer.
-                #if yes, just skip this file:
-                if file_end_time < outfile_endtime:
-                    continue 
-
-                #if current file starts earlier than the endtime of data in buffer, but extends the time span
-                #then delete ambiguous  parts of the buffer:
-                elif (outfile_endtime - file_start_time) > epsilon:
-
-                    #find point on the outfile time axis for the beginning of current file:
-                    overlap_idx = arrayindex - int((outfile_endtime - file_start_time)/sampling)
-
-                    #set the array index back to the appropriate value corresponding to the 
-                    #start of the new file
-                    arrayindex = overlap_idx
-                   
-  
-                #append current data                  
-                #if it's a single column of data
-                if np.size(data_in.shape) == 1:
-                    block_data[arrayindex:arrayindex+len(data_in)] = data_in                    
-                    #outfile_data.extend(data_in.tolist())
-                #otherwise assuming that the first column is time, so just take the second one
-                else:
-                    block_data[arrayindex:arrayindex+len(data_in)] = data_in[:,1]                    
-                    #outfile_data.extend(data_in[:,1].tolist())
-
-                #update position in time
-                arrayindex += len(data_in)
-
-                #update (virtual) end of outfile data
-                outfile_endtime = (arrayindex+1)*sampling + outfile_starttime
-
-
-            #-----------
-            # current file has been read in, data in buffer have been updated
-            # now check, if it has to be written to file....
-
-            #check, if there is a next file at all:
-            try:
-                next_file_start_time = lo_sorted_starttimes[idx_f + 1]
-            except:
-                complete = True
+            file_hour = lo_hours[file_start[3]//n_hours]
 
-            #if there is a next file, 
-            # - check, if it's the same day
-            # - check, if it' the same block
-            # - check, if it continues at the end of the current one:
+            #define output filename
+            new_fn = '{0}_{5}hours_{1}_{2:02d}_{3}.{4}'.format(stationname,
+                                             file_date, file_hour,fileindex, comp,n_hours)
+            #absolute filename:
+            new_file = op.abspath(op.join(outpath,new_fn))
 
-            if complete is False:
-                next_file_start_time = lo_sorted_starttimes[idx_f + 1]
-                next_file_start = time.gmtime(next_file_start_time)
-                
-                nextfile_hour = next_file_start[3]
-
-                nextfile_blockindex  = no_blocks-1
-                for t in range(len(lo_hours)-1):
-                    if lo_hours[t+1]>nextfile_hour:
-                        nextfile_blockindex = t
-                        break
-
-
-                nextfile_day = '{0}{1:02}{2:02}'.format(next_file_start[0],
-                                                 next_file_start[1], next_file_start[2])
-                if  nextfile_day != file_date: 
-                    complete = True
-                    sameday = False                    
-                if  nextfile_blockindex != blockindex:
-                    complete = True
-                    sameblock = False
-
-            if complete is False:
-                if next_file_start_time - file_end_time > epsilon: 
-                    complete = True
-                    sameblock = True
-                    sameday = True
-
-         
-            #ipdb.set_trace()
-
-            #check, if the file has to be closed and written now
-            if complete is True :
-
-                #define header info
-                if outfile_starttime%1==0:
-                    outfile_starttime = int(outfile_starttime)
-
-                    headerline = '# {0} {1} {2:.1f} {3} {4} \n'.format(
-                                    stationname, comp.lower(), 1./sampling, 
-                                    outfile_starttime, arrayindex)
-                else:
-                    headerline = '# {0} {1} {2:.1f} {3:f} {4} \n'.format(
-                                    stationname, comp.lower(), 1./sampling, 
-                                    outfile_starttime, arrayindex)
-
-                F.write(headerline)
-
-                #outfile_array = np.zeros((len(outfile_timeaxis),2))
-                #outfile_array[:,0] = outfile_timeaxis
-                #outfile_array[:,1] = outfile_data
-                for i in range(arrayindex):
-                    F.write('{0}\n'.format(int(block_data[i])))
-                #outstring = '\n'.join(['{0:d}'.format(i) for i in day_data[:arrayindex]])
-                #F.write(outstring)
-                #np.savetxt(F,day_data[:arrayindex],fmt='%d')
-                #np.savetxt(F, np.array(outfile_data))
-                arrayindex = 0
-                
-                F.close()
-                print('\t wrote file %s'%(new_file))
+            _EDL_write_merged(new_file, stationname, comp, sampling,
+                              outfile_starttime, lo_pieces)
 
-                fileopen = False
-                complete = False
-                #blockindex = (blockindex+1)%no_blocks
-    
-                if sameday is True and sameblock is True : 
-                    fileindex +=1        
-                else:
-                    fileindex = 0
-
- 
 
 
 def EDL_make_dayfiles(inputdir, sampling , stationname = None, outputdir = None):
@@ -729,12 +605,10 @@ def EDL_make_dayfiles(inputdir, sampling , stationname = None, outputdir = None)
     checked for a new day!!
 
     """
-    try:
-        if type(inputdir)==str:
-            raise Exception("problem!!!")
-        lo_foldernames = [i for i in inputdir]
-    except TypeError:
+    if isinstance(inputdir, str):
         lo_foldernames = [inputdir]
+    else:
+        lo_foldernames = [i for i in inputdir]
 
     #typical suffixes for EDL output file names
     components = ['ex', 'ey', 'bx', 'by', 'bz']
@@ -794,259 +668,36 @@ def EDL_make_dayfiles(inputdir, sampling , stationname = None, outputdir = None)
     #outer loop over all components
     for comp in components:
 
-        #make list of files for the current component
-        lo_files = np.array([op.join(wd,i) for i in lo_allfiles 
-                            if (i.lower()[-2:] == comp)])
-
-        #make list of starting times for the respective files
-        lo_starttimes = np.array([EDL_get_starttime_fromfilename(f) 
-                                    for f in lo_files])
-        
-        #sort the files by their starting times
-        idx_chronologic = np.argsort(lo_starttimes)
-        
         #obtain sorted lists of files and starting times
-        lo_sorted_files = list(lo_files[idx_chronologic])
-        lo_sorted_starttimes = list(lo_starttimes[idx_chronologic])
-        idx = 0
-        while idx < len(lo_sorted_starttimes):
-            try:
-                val = lo_sorted_starttimes[idx]
-            except:
-                break
-            if val is None:
-                dummy = lo_sorted_files.pop(idx)
-                dummy = lo_sorted_starttimes.pop(idx)
-            else:
-                idx += 1
-
+        lo_sorted_files, lo_sorted_starttimes = _EDL_sort_files(lo_allfiles,
+                                                                comp)
+        if len(lo_sorted_files) == 0:
+            continue
 
         #set stationname, either from arguments or from filename
         if stationname is None:
             stationname = EDL_get_stationname_fromfilename(lo_sorted_files[0]).upper()
 
-        #set counting variables - needed for handling of consecutive files
+        #blocks of calendar days
+        def get_block(starttime):
+            return time.gmtime(starttime)[:3]
 
-        sameday = 0
-        fileopen = 0
-        incomplete = 0
-        fileindex = 0
+        lo_outfiles = _EDL_plan_merge(lo_sorted_files, lo_sorted_starttimes,
+                                      sampling, get_block)
 
-        #allocate a data array to fill
-        # this is more memory efficient than extending lists!!
-        #cater for potential rounding errors:
-        if sampling < 1:
-            max_n_data = 86400 * (int(1./sampling)+1)
-        else:
-            max_n_data = int(86400./sampling) + 1
-
-        day_data = np.zeros(max_n_data,'int')
+        for outfile_starttime, lo_pieces, fileindex in lo_outfiles:
+            file_start = time.gmtime(outfile_starttime)
+            file_date = '{0}{1:02}{2:02}'.format(file_start[0],
+                                             file_start[1], file_start[2]) 
 
+            #define output filename
+            new_fn = '{0}_1day_{1}_{2}.{3}'.format(stationname,
+                                             file_date, fileindex, comp)
 
+            new_file = op.abspath(op.join(outpath,new_fn))
 
-        #loop over all (sorted) files for the current component
-        for idx_f,f in enumerate(lo_sorted_files):
-
-            try:
-
-                print('Reading file %s' %(f))
-                #starting time of current file
-                file_start_time = lo_sorted_starttimes[idx_f]
-
-
-                #get tuple with the starting time of the current file
-                file_start = time.gmtime(file_start_time)
-            
-                #read in raw data
-                data_in = []
-                Fin = open(f)
-                for line in Fin:#.readlines():
-                #    try:
-                    data_in.append(int(float(line.strip())))
-                 #   except:
-                  #      pass
-                data_in = np.array(data_in)
-                Fin.close()
-                #data_in = np.loadtxt(f)
-            except:
-                print('WARNING - could not read file - skipping...')
-                continue
-            no_samples = len(data_in)
-
-            tmp_file_time_axis = np.arange(no_samples)*sampling+file_start_time
-            #file_time_axis = (np.arange(no_samples)*sampling +
-            #                 file_start_time).tolist()
-
-
-            #time of the last sample + 1x sampling-interval
-            #file_end_time =  file_time_axis[-1] + sampling
-            file_end_time =  tmp_file_time_axis[-1] + sampling
-         
-
-
-
-            #set the time as starting time for output file, if no output file is open already
-            if fileopen == 0:
-                outfile_starttime =  file_start_time
-
-                #outfile_timeaxis = file_time_axis
-                old_time_axis = tmp_file_time_axis[:]
-                
-
-                arrayindex = 0
-
-                #if it's a single column of data
-                if np.size(data_in.shape) == 1:
-                    day_data[arrayindex:arrayindex+len(data_in)] = data_in                    
-                    #outfile_data = data_in.tolist()
-                #otherwise assuming that the first column is time, so just take the second one
-                else:
-                    day_data[arrayindex:arrayindex+len(data_in)] = data_in[:,1]
-                    #outfile_data = data_in[:,1].tolist()
-                
-                #jump with index to current point on time axis 
-                arrayindex += len(data_in)
-                outfile_endtime = file_end_time
-
-
-                file_date = '{0}{1:02}{2:02}'.format(file_start[0],
-                                                 file_start[1], file_start[2]) 
-
-
-                #define output filename
-                new_fn = '{0}_1day_{1}_{2}.{3}'.format(stationname,
-                                                 file_date, fileindex, comp)
-                
-                new_file = op.abspath(op.join(outpath,new_fn))
-                
-                #open output file 
-                F = open(new_file,'w')
-                
-                fileopen = 1
-
-
-            
-            else:
-                #check, if the new file ends earlier than data in buffer.
-                #if yes, just skip this file:
-                if file_end_time < outfile_endtime:
-                    continue 
-
-                #if current file starts earlier than the endtime of data in buffer then delete ambiguous  parts of the buffer:
-                #elif (outfile_timeaxis[-1] - file_start_time) > epsilon:
-                elif (outfile_endtime - file_start_time) > epsilon:
-
-                    #find point on the outfile time axis for the beginning of current file:
-                    overlap_idx = arrayindex - int((outfile_endtime - file_start_time)/sampling)
-
-                    #set the array index back
-                    arrayindex = overlap_idx
-                   
-                    #re-define outfile time axis and data
-                    # outfile_timeaxis = np.delete(outfile_timeaxis,
-                    #                              np.arange(len(outfile_timeaxis) - 
-                    #                              overlap_idx) + 
-                    #                              overlap_idx).tolist()
-
-
-                    # outfile_data = np.delete(outfile_data, 
-                    #                             np.arange(len(outfile_data) - 
-                    #                             overlap_idx) + 
-                    #                             overlap_idx).tolist()
-                
-
-                #old_time_axis = tmp_file_time_axis[:]
-                #append current file's time axis
-                #outfile_timeaxis.extend(file_time_axis)
-                    
-                #append current data                  
-                #if it's a single column of data
-                if np.size(data_in.shape) == 1:
-                    day_data[arrayindex:arrayindex+len(data_in)] = data_in                    
-                    #outfile_data.extend(data_in.tolist())
-                #otherwise assuming that the first column is time, so just take the second one
-                else:
-                    day_data[arrayindex:arrayindex+len(data_in)] = data_in[:,1]                    
-                    #outfile_data.extend(data_in[:,1].tolist())
-
-                arrayindex += len(data_in)
-                print(len(data_in),arrayindex)
-
-                arrayindex += len(data_in)
-                outfile_endtime = (arrayindex+1)*sampling + outfile_starttime
-
-
-
-            #-----------
-
-            #check, if there is a next file:
-            try:
-                next_file_start_time = lo_sorted_starttimes[idx_f + 1]
-            except:
-                incomplete = 1
-
-            #if there is a next file, 
-            # - check, if it's the same day
-            # - check, if it continues at the end of the current one:
-            if incomplete == 0:
-                next_file_start_time = lo_sorted_starttimes[idx_f + 1]
-                next_file_start = time.gmtime(next_file_start_time)
-                
-                if next_file_start[2] == file_start[2] :
-                    #print 'sameday',file_start[:]
-                    sameday = 1
-                else:
-                    incomplete = 1
-                    sameday = 0
-                    fileindex = 0
-                    #print '\t NOT sameday', fileindex
-
-
-                if next_file_start_time - file_end_time > epsilon: 
-                    incomplete = 1
-
-            if incomplete == 1 and sameday == 1 : 
-                fileindex +=1        
-
-           
-
-            #check, if the file has to be closed and written now
-            if incomplete == 1 :
-
-                #define header info
-                if outfile_starttime%1==0:
-                    outfile_starttime = int(outfile_starttime)
-
-                    headerline = '# {0} {1} {2:.1f} {3} {4} \n'.format(
-                                    stationname, comp.lower(), 1./sampling, 
-                                    outfile_starttime, arrayindex)
-                else:
-                    headerline = '# {0} {1} {2:.1f} {3:f} {4} \n'.format(
-                                    stationname, comp.lower(), 1./sampling, 
-                                    outfile_starttime, arrayindex)
-
-
-                F.write(headerline)
-
-                #outfile_array = np.zeros((len(outfile_timeaxis),2))
-                #outfile_array[:,0] = outfile_timeaxis
-                #outfile_array[:,1] = outfile_data
-                for i in range(arrayindex):
-                    F.write('{0}\n'.format(int(day_data[i])))
-                #outstring = '\n'.join(['{0:d}'.format(i) for i in day_data[:arrayindex]])
-                #F.write(outstring)
-                #np.savetxt(F,day_data[:arrayindex],fmt='%d')
-                #np.savetxt(F, np.array(outfile_data))
-                arrayindex = 0
-                
-
-                F.close()
-                print('\t wrote file %s'%(new_file))
-
-                fileopen = 0
-                incomplete = 0
-    
-
+            _EDL_write_merged(new_file, stationname, comp, sampling,
+                              outfile_starttime, lo_pieces)
 
 
 
@@ -1232,7 +883,7 @@ def validate_ts_file(tsfile):
         t0 = float(header['t_min'])
         ns = int(float(header['nsamples']))
         
-        data = np.loadtxt(tsfile)
+        data = read_ts_data(tsfile)
         
         if len(data) != ns:
             #print 'data length'
@@ -1328,6 +979,201 @@ def get_ts_header_string(header_dictionary):
 
 
 
+def _skip_ts_header(F):
+    """
+        Move the binary file object F to the first data line, past the 
+        header and any other comment or empty lines.
+    """
+    F.seek(0)
+    while True:
+        pos = F.tell()
+        line = F.readline()
+        if len(line) == 0:
+            break
+        line = line.strip()
+        if len(line) > 0 and not line.startswith(b'#'):
+            break
+    F.seek(pos)
+
+
+def _skip_ts_lines(F, n_lines, chunk_size=2**24):
+    """
+        Move the binary file object F forward by n_lines lines. Line ends 
+        are counted in chunks, the data are not parsed.
+    """
+    while n_lines > 0:
+        pos = F.tell()
+        chunk = F.read(chunk_size)
+        if len(chunk) == 0:
+            break
+        n_ends = chunk.count(b'\n')
+        if n_ends < n_lines:
+            n_lines -= n_ends
+            continue
+        ends = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+        F.seek(pos + ends[n_lines-1] + 1)
+        n_lines = 0
+
+
+def _read_ts_lines(F, n_lines=None, chunk_size=2**24):
+    """
+        Read n_lines lines from the binary file object F, or all of the rest
+        of the file if n_lines is None.
+    """
+    if n_lines is None:
+        return F.read()
+
+    lo_chunks = []
+    while n_lines > 0:
+        chunk = F.read(chunk_size)
+        if len(chunk) == 0:
+            break
+        n_ends = chunk.count(b'\n')
+        if n_ends >= n_lines:
+            ends = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+            chunk = chunk[:ends[n_lines-1] + 1]
+        lo_chunks.append(chunk)
+        n_lines -= n_ends
+
+    return b''.join(lo_chunks)
+
+
+def _count_ts_data_lines(lines):
+    """
+        Count the lines in a list of lines that hold data, that is lines 
+        that are not empty and are not comments starting with '#'.
+    """
+    return len([line for line in lines 
+                if len(line.strip()) > 0 and 
+                not line.lstrip().startswith(b'#' if isinstance(line, bytes) 
+                                             else '#')])
+
+
+def _parse_ts_lines(text):
+    """
+        Parse the data lines of a TS file in one go. Comment lines are 
+        skipped. Returns a 1D array for a single column of data, otherwise 
+        a 2D array with a column for each column in the file.
+
+        Raises MTpyError_ts_data if not every data line could be parsed 
+        into the same number of columns.
+    """
+    if isinstance(text, bytes):
+        text = text.decode('latin-1')
+    if '#' in text:
+        text = '\n'.join([line for line in text.split('\n') 
+                          if not line.lstrip().startswith('#')])
+    text = text.strip()
+    if len(text) == 0:
+        return np.zeros(0)
+
+    n_columns = len(text[:text.find('\n')].split()) if '\n' in text \
+                    else len(text.split())
+    data = np.fromstring(text, sep=' ')
+
+    # fromstring stops at the first value it can not read, so check that 
+    # all the lines were read, blank lines are only counted if needed
+    n_lines = text.count('\n') + 1
+    if data.size != n_lines*n_columns:
+        n_lines = _count_ts_data_lines(text.split('\n'))
+        if data.size != n_lines*n_columns:
+            raise MTex.MTpyError_ts_data('Could not read {0} lines of {1} '
+                                         'columns of data, only read {2} '
+                                         'values'.format(n_lines, n_columns,
+                                                         data.size))
+    if n_columns > 1:
+        data = data.reshape(-1, n_columns)
+
+    return data
+
+
+def count_ts_samples(tsfile):
+    """
+        Return the number of samples in a TS data file, one sample per line
+        after the header. Empty lines and comment lines are not counted, 
+        the data are not parsed.
+    """
+    with open(tsfile, 'rb') as F:
+        _skip_ts_header(F)
+        n_samples = 0
+        remainder = b''
+        while True:
+            chunk = F.read(2**24)
+            if len(chunk) == 0:
+                break
+            #keep a broken line for the next chunk
+            lines = (remainder + chunk).split(b'\n')
+            remainder = lines.pop()
+            n_samples += _count_ts_data_lines(lines)
+        n_samples += _count_ts_data_lines([remainder])
+
+    return n_samples
+
+
+def read_ts_data(tsfile, start=0, stop=None):
+    """
+        Read the data of a TS data file, or just the samples from index 
+        start up to stop. The lines before start are skipped without 
+        parsing and the data are parsed in one go.
+
+        Returns the data as an array like np.loadtxt, a single column of 
+        data gives a 1D array.
+    """
+    if stop is not None and stop <= start:
+        return np.zeros(0)
+
+    with open(tsfile, 'rb') as F:
+        _skip_ts_header(F)
+        _skip_ts_lines(F, start)
+        text = _read_ts_lines(F, None if stop is None else stop - start)
+
+    return _parse_ts_lines(text)
+
+
+def iter_ts_data(tsfile, block_len=2**20):
+    """
+        Iterate over the data of a TS data file in blocks of about 
+        block_len samples, header and comment lines are skipped.
+    """
+    remainder = b''
+    with open(tsfile, 'rb') as F:
+        _skip_ts_header(F)
+        while True:
+            text = F.read(16*block_len)
+            if len(text) == 0:
+                break
+
+            #keep a broken line for the next block
+            text = remainder + text
+            cut = text.rfind(b'\n') + 1
+            text, remainder = text[:cut], text[cut:]
+
+            data = _parse_ts_lines(text)
+            if data.size > 0:
+                yield data
+
+    data = _parse_ts_lines(remainder)
+    if data.size > 0:
+        yield data
+
+
+def write_ts_data(F, data, fmt='%.8e', block_len=2**16):
+    """
+        Write data to the open file object F, one sample per line and the 
+        columns of 2D data separated by spaces. Each block of block_len 
+        samples is formatted with one call.
+    """
+    data = np.asarray(data)
+    if data.ndim > 1:
+        line_fmt = ' '.join([fmt]*data.shape[1]) + '\n'
+    else:
+        line_fmt = fmt + '\n'
+
+    for i in range(0, len(data), block_len):
+        block = data[i:i+block_len]
+        F.write((line_fmt*len(block)) % tuple(block.ravel().tolist()))
+
+
 def write_ts_file_from_tuple(outfile,ts_tuple, fmt='%.8e'):
     """
         Write an MTpy TS data file, where the content is provided as tuple:
@@ -1352,24 +1198,26 @@ def write_ts_file_from_tuple(outfile,ts_tuple, fmt='%.8e'):
 
 
     try:
-        outF = open(outfilename,'w')
-        outF.write(header_string)
-        np.savetxt(outF, data, fmt=fmt)
-        outF.close()
-    except ValueError:
+        with open(outfilename,'w') as outF:
+            outF.write(header_string)
+            write_ts_data(outF, data, fmt=fmt)
+    except (TypeError, ValueError):
         raise MTex.MTpyError_inputarguments('ERROR - could not write content'
                             ' of TS tuple to file : {0}'.format(outfilename))
 
     return outfilename
 
 
-def read_ts_file(mtdatafile):
+def read_ts_file(mtdatafile, start=0, stop=None):
     """
         Read an MTpy TS data file and provide the content as tuple:
 
         (station, channel,samplingrate,t_min,nsamples,unit,lat,lon,elev, data)
         If header information is incomplete, the tuple is filled up with 'None'
 
+        Only the samples from index start up to stop are read, if given. 
+        Then t_min and nsamples are those of the samples read.
+
     """
 
     infile = op.abspath(mtdatafile)
@@ -1382,8 +1230,13 @@ def read_ts_file(mtdatafile):
         raise MTex.MTpyError_inputarguments('ERROR - Data file not valid - '
                                         'header is missing : {0}'.format(infile))
 
-    data = np.loadtxt(infile)
-    if len(data) != int(float(header['nsamples'])):
+    data = read_ts_data(infile, start=start, stop=stop)
+    if start != 0 or stop is not None:
+        header['nsamples'] = len(data)
+        if 't_min' in header and 'samplingrate' in header:
+            header['t_min'] = header['t_min'] + \
+                                start/float(header['samplingrate'])
+    elif len(data) != int(float(header['nsamples'])):
         raise MTex.MTpyError_inputarguments('ERROR - Data file not valid '
                                     '- wrong number of samples in data ({1} '
                                     'instead of {2}): {0}'.format(
@@ -23,6 +23,16 @@ class Sgrid():
     grid_xyz = tuple containing x,y,z locations of edges of cells for each
                resistivity value. Each item in tuple has shape (ny+1,nx+1,nz+1)
 
+    optional:
+    binary = if True write raw big-endian binary points and property files
+             instead of one ascii data file, default False
+    double_precision = if True binary files are written as 8 byte floats,
+                       otherwise 4 byte floats, default False
+
+    Binary files are read and written through memory mapped arrays, so the
+    grid_xyz and resistivity arrays of a read binary sgrid are views of the
+    files (copy on write).
+
     """
 
     def __init__(self, **kwargs):
@@ -40,6 +50,11 @@ class Sgrid():
                     self.workdir = '.'
         self.ascii_data_file = self.fn.replace('.sg','') + '__ascii@@'
         self.property_name = 'Resistivity'
+        self.points_file = self.fn.replace('.sg','') + '__points@@'
+        self.prop_file = self.fn.replace('.sg','') + '__{}@@'.format(
+            self.property_name)
+        self.binary = kwargs.pop('binary', False)
+        self.double_precision = kwargs.pop('double_precision', False)
         self.grid_xyz = kwargs.pop('grid_xyz', None)
         if self.grid_xyz is not None:
             self.ncells = self.grid_xyz[0].shape
@@ -61,12 +76,26 @@ class Sgrid():
             print("Cannot read, no header file name provided")
             return
 
+        # data file names come from the header, binary files are only used
+        # if the header has a POINTS_FILE
+        self.ascii_data_file = None
+        self.points_file = None
+        self.prop_file = None
+        self.double_precision = False
+        self.prop_esize = 4
+
         with open(op.join(self.workdir, self.fn)) as header:
             for line in header.readlines():
                 if line.startswith('AXIS_N '):
                     self.ncells = [int(val)
                                    for val in line.strip().split()[1:]]
-                for param in ['ASCII_DATA_FILE']:
+                elif line.startswith('double_precision_binary:'):
+                    self.double_precision = line.strip().endswith('on')
+                elif line.startswith('PROP_FILE 1 '):
+                    self.prop_file = line.strip().split()[2]
+                elif line.startswith('PROP_ESIZE 1 '):
+                    self.prop_esize = int(line.strip().split()[2])
+                for param in ['ASCII_DATA_FILE', 'POINTS_FILE']:
                     if line.startswith(param):
                         setattr(
                             self,
@@ -98,20 +127,64 @@ class Sgrid():
         self.resistivity = asciidata[:, 3].reshape(
             *self.ncells[::-1]).transpose(2, 1, 0)[:-1, :-1, :-1]
 
+    def _read_binary_data(self):
+        """
+        memory map the big-endian binary points and property files
+        """
+        if self.points_file is None:
+            self._read_header()
+
+        n0, n1, n2 = self.ncells
+        points = np.memmap(op.join(self.workdir, self.points_file),
+                           dtype='>f{}'.format(8 if self.double_precision else 4),
+                           mode='c', shape=(n2, n1, n0, 3))
+        self.grid_xyz = [points[:, :, :, i].transpose(2, 1, 0)
+                         for i in range(3)]
+
+        # property is aligned with cells so there is one less in each axis
+        resistivity = np.memmap(op.join(self.workdir, self.prop_file),
+                                dtype='>f{}'.format(self.prop_esize),
+                                mode='c', shape=(n2 - 1, n1 - 1, n0 - 1))
+        self.resistivity = resistivity.transpose(2, 1, 0)
+
     def read_sgrid_file(self, headerfn=None):
         self._read_header(headerfn=headerfn)
-        self._read_ascii_data()
+        if self.points_file is not None:
+            self.binary = True
+            self._read_binary_data()
+        else:
+            self.binary = False
+            self._read_ascii_data()
 
     def _write_header(self):
 
         ny, nx, nz = np.array(self.resistivity.shape) + 1
 
+        if self.binary:
+            esize = 8 if self.double_precision else 4
+            data_lines = ['POINTS_OFFSET 0',
+                          'POINTS_FILE {}'.format(
+                              op.basename(self.points_file))]
+            prop_file_lines = ['PROP_ESIZE 1 {}'.format(esize),
+                               'PROP_ETYPE 1 IEEE',
+                               'PROP_FORMAT 1 RAW',
+                               'PROP_OFFSET 1 0',
+                               'PROP_FILE 1 {}'.format(
+                                   op.basename(self.prop_file))]
+        else:
+            data_lines = ['ASCII_DATA_FILE {}'.format(
+                op.basename(self.ascii_data_file))]
+            prop_file_lines = ['PROP_ESIZE 1 4']
+
         headerlines = [r'' + item + '\n' for item in ['GOCAD SGrid 1 ',
                                                       'HEADER {',
                                                       'name:{}'.format(
                                                           op.basename(self.fn)),
-                                                      'ascii:on',
-                                                      'double_precision_binary:off',
+                                                      'ascii:{}'.format(
+                                                          'off' if self.binary else 'on'),
+                                                      'double_precision_binary:{}'.format(
+                                                          'on' if self.binary and
+                                                          self.double_precision else 'off'),
                                                       '}',
                                                       'GOCAD_ORIGINAL_COORDINATE_SYSTEM',
                                                       'NAME Default',
@@ -121,10 +194,9 @@ class Sgrid():
                                                       'END_ORIGINAL_COORDINATE_SYSTEM',
                                                       'AXIS_N {} {} {} '.format(
                                                           ny, nx, nz),
-                                                      'PROP_ALIGNMENT CELLS',
-                                                      'ASCII_DATA_FILE {}'.format(
-                                                          op.basename(self.ascii_data_file)),
-                                                      '',
+                                                      'PROP_ALIGNMENT CELLS'] +
+                                                     data_lines +
+                                                     ['',
                                                       '',
                                                       'PROPERTY 1 "{}"'.format(
                                                           self.property_name),
@@ -145,9 +217,9 @@ class Sgrid():
                                                       'PROP_ORIGINAL_UNIT 1 ohm*m',
                                                       'PROP_UNIT 1 ohm*m',
                                                       'PROP_NO_DATA_VALUE 1 {}'.format(
-                                                          self.no_data_value),
-                                                      'PROP_ESIZE 1 4',
-                                                      'END']]
+                                                          self.no_data_value)] +
+                                                     prop_file_lines +
+                                                     ['END']]
 
         hdrfn = os.path.join(self.workdir,self.fn)
         if not hdrfn.endswith('.sg'):
@@ -186,6 +258,35 @@ class Sgrid():
             ['%10i'] *
             3)
 
-    def write_sgrid_file(self):
+    def _write_binary_data(self):
+        """
+        write points and resistivity as raw big-endian binary files through
+        memory maps, the first axis of the grid varies fastest
+        """
+        dtype = '>f{}'.format(8 if self.double_precision else 4)
+
+        ny, nx, nz = self.grid_xyz[0].shape
+        points = np.memmap(os.path.join(self.workdir, self.points_file),
+                           dtype=dtype, mode='w+', shape=(nz, nx, ny, 3))
+        for i in range(3):
+            points[:, :, :, i] = self.grid_xyz[i].transpose(2, 1, 0)
+        points.flush()
+        del points
+
+        # property is aligned with cells so no need to pad with no data
+        resistivity = np.memmap(os.path.join(self.workdir, self.prop_file),
+                                dtype=dtype, mode='w+',
+                                shape=self.resistivity.shape[::-1])
+        resistivity[:] = self.resistivity.transpose(2, 1, 0)
+        resistivity.flush()
+        del resistivity
+
+    def write_sgrid_file(self, binary=None):
+        if binary is not None:
+            self.binary = binary
+
         self._write_header()
-        self._write_data()
+        if self.binary:
+            self._write_binary_data()
+        else:
+            self._write_data()
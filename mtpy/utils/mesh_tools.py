@@ -12,6 +12,7 @@ import numpy as np
 import mtpy.utils.filehandling as mtfh
 from mtpy.utils import gis_tools
 import scipy.interpolate as spi
+from scipy.spatial import cKDTree
 
 
 
@@ -320,5 +321,204 @@ def get_station_buffer(grid_east,grid_north,station_east,station_north,buf=10e3)
             where = np.any([where,station_distance < buf],axis=0)
             
     return where
-    
-    
+
+
+def order_profile_points(eastings, northings, start=None, two_opt=False,
+                         max_passes=20, n_neighbours=8):
+    """
+    order points along a profile so that a continuous line can be formed.
+
+    The line is walked from the start point to the nearest point not yet
+    visited, with nearest neighbours found in a KD-tree.  Points at the same
+    distance are taken in the order given.  Optionally the line is shortened
+    after by 2-opt moves, reversing pieces of the line where that makes it
+    shorter, with the moves limited to the n_neighbours nearest points.  The
+    line keeps its start point.
+
+    :param eastings: 1D array of easting coordinates
+    :param northings: 1D array of northing coordinates
+    :param start: index of the first point, *default* is None, which starts
+                  at the minimum easting
+    :param two_opt: [ True | False ] shorten the line by 2-opt moves
+    :param max_passes: maximum number of 2-opt passes over the line
+    :param n_neighbours: number of nearest points to try 2-opt moves with
+
+    :returns: indices that order the points along the line
+    :rtype: np.ndarray(dtype=int)
+
+    :Example: ::
+
+        >>> import mtpy.utils.mesh_tools as mtmesh
+        >>> order = mtmesh.order_profile_points(east, north, two_opt=True)
+        >>> east, north = east[order], north[order]
+    """
+    coords = np.column_stack((np.ravel(eastings),
+                              np.ravel(northings))).astype(float)
+    n_points = coords.shape[0]
+    if n_points == 0:
+        return np.zeros(0, dtype=int)
+    if start is None:
+        start = int(np.argmin(coords[:, 0]))
+
+    order = _greedy_path(coords, int(start))
+    if two_opt and n_points > 3:
+        order = _two_opt_path(coords, order, max_passes=max_passes,
+                              n_neighbours=n_neighbours)
+
+    return order
+
+
+def _greedy_path(coords, start, n_neighbours=16):
+    """
+    walk from start to the nearest point not visited yet.  The nearest
+    neighbours of all the points are found at once, only when those are all
+    visited the points left are searched, in a KD-tree that is rebuilt when
+    a quarter of its points are visited.
+    """
+    n_points = coords.shape[0]
+    n_neighbours = min(n_neighbours + 1, n_points)
+    dist, index = cKDTree(coords).query(coords, k=n_neighbours)
+    dist = np.atleast_2d(dist.T).T
+    index = np.atleast_2d(index.T).T
+    # sort neighbours at the same distance by index
+    sort = np.lexsort((index, dist), axis=1)
+    dist = np.take_along_axis(dist, sort, axis=1)
+    index = np.take_along_axis(index, sort, axis=1)
+    # the neighbours are only complete up to the last distance
+    dist_last = dist[:, -1].tolist()
+    complete = n_neighbours == n_points
+    dist = dist.tolist()
+    index = index.tolist()
+
+    # visited as a list for the walk and an array for the tree search
+    visited = [False] * n_points
+    visited_array = np.zeros(n_points, dtype=bool)
+    order = [start]
+    visited[start] = True
+    visited_array[start] = True
+
+    tree = None
+    for ii in range(1, n_points):
+        current = order[-1]
+        nearest = None
+        for dd, jj in zip(dist[current], index[current]):
+            if not visited[jj]:
+                if complete or dd < dist_last[current]:
+                    nearest = jj
+                break
+
+        if nearest is None:
+            if tree is None or 4 * tree_visited > tree_index.size:
+                tree_index = np.flatnonzero(~visited_array)
+                tree = cKDTree(coords[tree_index])
+                tree_visited = 0
+            nearest = _nearest_left(coords[current], tree, tree_index,
+                                    visited_array)
+
+        order.append(nearest)
+        visited[nearest] = True
+        visited_array[nearest] = True
+        if tree is not None:
+            tree_visited += 1
+
+    return np.array(order, dtype=int)
+
+
+def _nearest_left(point, tree, tree_index, visited):
+    """
+    nearest point in the tree that is not visited, the lowest index of
+    points at the same distance
+    """
+    k = 8
+    while True:
+        n_query = min(k, tree_index.size)
+        dist, index = tree.query(point, k=n_query)
+        dist = np.atleast_1d(dist)
+        index = tree_index[np.atleast_1d(index)]
+        left = ~visited[index]
+        # all the points at the nearest distance have to be in the query
+        if left.any() and (dist[left].min() < dist[-1] or
+                           n_query == tree_index.size):
+            dist_min = dist[left].min()
+            return int(index[left & (dist == dist_min)].min())
+        k *= 4
+
+
+def _two_opt_path(coords, order, max_passes=20, n_neighbours=8):
+    """
+    shorten an open line by reversing pieces of it.  A move cuts the edge
+    from a point to the point before or after it and joins the point to one
+    of its near neighbours, which only can make the line shorter if the
+    neighbour is nearer than the cut edge is long.  Points are tried again
+    when the line around them has changed.
+    """
+    n_points = coords.shape[0]
+    n_neighbours = min(n_neighbours + 1, n_points)
+    neighbour_dist, neighbours = cKDTree(coords).query(coords,
+                                                       k=n_neighbours)
+    neighbour_dist = neighbour_dist[:, 1:].tolist()
+    neighbours = neighbours[:, 1:].tolist()
+
+    x_list = coords[:, 0].tolist()
+    y_list = coords[:, 1].tolist()
+    path = [int(point) for point in order]
+    position = np.zeros(n_points, dtype=int)
+    position[order] = np.arange(n_points)
+
+    def dist(p1, p2):
+        return ((x_list[p1] - x_list[p2])**2 +
+                (y_list[p1] - y_list[p2])**2)**0.5
+
+    def gain(a, b):
+        # reverse path[a + 1:b + 1], b = n_points - 1 is the end of the line,
+        # which has no edge to cut
+        old = dist(path[a], path[a + 1])
+        new = dist(path[a], path[b])
+        if b < n_points - 1:
+            old += dist(path[b], path[b + 1])
+            new += dist(path[a + 1], path[b + 1])
+        return old - new
+
+    def find_move(point):
+        ii = position[point]
+        # cut the edge after the point, then the edge before it
+        for step in (1, -1):
+            if not 0 <= ii + step < n_points:
+                continue
+            cut_len = dist(point, path[ii + step])
+            for neighbour_len, neighbour in zip(neighbour_dist[point],
+                                                neighbours[point]):
+                if neighbour_len >= cut_len:
+                    break
+                jj = position[neighbour]
+                a, b = min(ii, jj), max(ii, jj)
+                if step == -1:
+                    a, b = a - 1, b - 1
+                # the start of the line stays in place
+                if a >= 0 and b > a + 1 and gain(a, b) > tolerance:
+                    return a, b
+        return None
+
+    # gains smaller than this are rounding errors
+    tolerance = 1e-12 * max(np.abs(coords).max(), 1.)
+
+    # points to try, a pass is done when all the points have been tried
+    active = [True] * n_points
+    for n_pass in range(max_passes):
+        queue = [point for point in range(n_points) if active[point]]
+        if len(queue) == 0:
+            break
+        for point in queue:
+            active[point] = False
+            move = find_move(point)
+            if move is None:
+                continue
+
+            a, b = move
+            for kk in (a, a + 1, b, b + 1):
+                if 0 <= kk < n_points:
+                    active[path[kk]] = True
+            path[a + 1:b + 1] = path[a + 1:b + 1][::-1]
+            position[path[a + 1:b + 1]] = np.arange(a + 1, b + 1)
+
+    return np.array(path, dtype=int)
@@ -7,22 +7,213 @@ Created on Sun Apr 13 12:32:16 2014
 
 @author: jrpeacock
 """
-import mtpy.modeling.modem
 from mtpy.utils.gis_tools import project_point_ll2utm, get_utm_zone
 
+# the polygon and WKB helpers only need numpy, everything that writes
+# files needs GDAL
 try:
     from osgeo import ogr, gdal, osr
+    ogr.UseExceptions()
 except ImportError:
-    raise ImportError('Did not find GDAL, be sure it is installed correctly and '
-          'all the paths are correct')
+    ogr = gdal = osr = None
 import numpy as np
 import os
 import mtpy.core.mt as mt
-import mtpy.modeling.modem as modem
 import mtpy.analysis.pt as mtpt
 import click
 
-ogr.UseExceptions()
+
+def _check_gdal():
+    """
+    raise an ImportError if GDAL is not installed
+    """
+    if ogr is None:
+        raise ImportError('Did not find GDAL, be sure it is installed '
+                          'correctly and all the paths are correct')
+
+
+def get_ellipse_polygons(east, north, phimin, phimax, azimuth, ellipse_size,
+                         theta):
+    """
+    compute the outline of many phase tensor ellipses in one go.
+
+    :param east: easting (or longitude) of ellipse centres, shape (n, )
+    :param north: northing (or latitude) of ellipse centres, shape (n, )
+    :param phimin: minimum phase, normalised so the largest ellipse is 1
+    :param phimax: maximum phase, normalised so the largest ellipse is 1
+    :param azimuth: azimuth of the ellipses in degrees clockwise from north
+    :param ellipse_size: size of a normalised ellipse in map units
+    :param theta: parametric angles of the ellipse outline, shape (m, )
+
+    :return: closed rings rounded to 6 decimals, shape (n, m + 1, 2)
+    """
+    azimuth = -np.deg2rad(np.asarray(azimuth, dtype=float))[:, None]
+    width = ellipse_size * np.asarray(phimax, dtype=float)[:, None]
+    height = ellipse_size * np.asarray(phimin, dtype=float)[:, None]
+    theta = np.append(theta, theta[0])
+
+    polygons = np.empty((azimuth.shape[0], theta.size, 2))
+    polygons[:, :, 0] = (np.asarray(east, dtype=float)[:, None] +
+                         height * np.cos(theta) * np.cos(azimuth) -
+                         width * np.sin(theta) * np.sin(azimuth))
+    polygons[:, :, 1] = (np.asarray(north, dtype=float)[:, None] +
+                         height * np.cos(theta) * np.sin(azimuth) +
+                         width * np.sin(theta) * np.cos(azimuth))
+
+    return np.round(polygons, 6)
+
+
+def get_arrow_polygons(east, north, magnitude, angle, arrow_size, arrow_lw,
+                       arrow_head_width, arrow_head_height):
+    """
+    compute the outline of many induction arrows in one go.
+
+    The arrow is drawn pointing north from the origin and then rotated
+    clockwise by angle and shifted onto the station.
+
+    :param east: easting (or longitude) of arrow tails, shape (n, )
+    :param north: northing (or latitude) of arrow tails, shape (n, )
+    :param magnitude: induction vector magnitude, shape (n, )
+    :param angle: induction vector angle in degrees clockwise from north
+    :param arrow_size: length of a unit arrow in map units
+    :param arrow_lw: half width of the arrow shaft in map units
+    :param arrow_head_width: width of the arrow head beyond the shaft
+    :param arrow_head_height: length of the arrow head in map units
+
+    :return: closed rings rounded to 6 decimals, shape (n, 9, 2)
+    """
+    tyr = arrow_size * np.asarray(magnitude, dtype=float)
+    n_arrows = tyr.size
+    y_head = tyr - arrow_head_height
+    zeros = np.zeros(n_arrows)
+
+    x = np.array([0, arrow_lw, arrow_lw, arrow_lw + arrow_head_width, 0,
+                  -arrow_lw - arrow_head_width, -arrow_lw, -arrow_lw, 0],
+                 dtype=float)
+    y = np.stack([zeros, zeros, y_head, y_head, tyr, y_head, y_head, zeros,
+                  zeros], axis=1)
+
+    # rotate the arrows to be properly oriented, then shift onto the stations
+    t = -np.deg2rad(np.asarray(angle, dtype=float))[:, None]
+    cos_t = np.cos(t)
+    sin_t = np.sin(t)
+
+    polygons = np.empty((n_arrows, x.size, 2))
+    polygons[:, :, 0] = (np.asarray(east, dtype=float)[:, None] +
+                         cos_t * x - sin_t * y)
+    polygons[:, :, 1] = (np.asarray(north, dtype=float)[:, None] +
+                         sin_t * x + cos_t * y)
+
+    return np.round(polygons, 6)
+
+
+def polygons_to_wkb(polygons):
+    """
+    encode single ring polygons as well known binary.
+
+    All rings share the same number of points, so the whole block is packed
+    into one structured array instead of building every ring with ogr.
+
+    :param polygons: closed rings, shape (n, m, 2)
+    :return: list of n WKB strings, one per polygon
+    """
+    polygons = np.asarray(polygons, dtype=float)
+    n_poly, n_points = polygons.shape[0:2]
+    wkb = np.zeros(n_poly, dtype=[('byte_order', 'u1'),
+                                  ('geom_type', '<u4'),
+                                  ('n_rings', '<u4'),
+                                  ('n_points', '<u4'),
+                                  ('xy', '<f8', (n_points, 2))])
+    wkb['byte_order'] = 1  # little endian
+    wkb['geom_type'] = 3  # wkbPolygon
+    wkb['n_rings'] = 1
+    wkb['n_points'] = n_points
+    wkb['xy'] = polygons
+
+    buf = wkb.tobytes()
+    size = wkb.dtype.itemsize
+    return [buf[ii * size:(ii + 1) * size] for ii in range(n_poly)]
+
+
+def create_data_source(fn, driver_name='ESRI Shapefile'):
+    """
+    create a new ogr data source, removing any existing file first as ogr has
+    trouble over writing.
+    """
+    _check_gdal()
+    driver = ogr.GetDriverByName(driver_name)
+    if os.path.isfile(fn):
+        driver.DeleteDataSource(fn)
+
+    return driver.CreateDataSource(fn)
+
+
+def write_polygon_layer(data_source, layer_name, spatial_ref, polygons,
+                        fields):
+    """
+    write a layer of polygons and their attributes in a single transaction.
+
+    :param data_source: ogr data source to add the layer to
+    :param layer_name: name of the layer
+    :param spatial_ref: osr.SpatialReference of the coordinates
+    :param polygons: closed rings, shape (n, m, 2)
+    :param fields: list of (field name, values) with n values each, string
+                   or bytes values are written as OFTString otherwise OFTReal
+
+    :return: the new layer
+    """
+    layer = data_source.CreateLayer(layer_name, spatial_ref, ogr.wkbPolygon)
+
+    field_values = []
+    for name, values in fields:
+        values = np.asarray(values)
+        if values.dtype.kind == 'S':
+            values = np.char.decode(values, 'UTF-8')
+        if values.dtype.kind == 'U':
+            layer.CreateField(ogr.FieldDefn(name, ogr.OFTString))
+        else:
+            layer.CreateField(ogr.FieldDefn(name, ogr.OFTReal))
+            values = values.astype(float)
+        field_values.append(values.tolist())
+
+    # shape files have no transactions, GeoPackages commit the layer at once
+    use_transaction = data_source.TestCapability(ogr.ODsCTransactions)
+    if use_transaction:
+        data_source.StartTransaction()
+
+    feature_def = layer.GetLayerDefn()
+    for ii, wkb in enumerate(polygons_to_wkb(polygons)):
+        new_feature = ogr.Feature(feature_def)
+        new_feature.SetGeometryDirectly(ogr.CreateGeometryFromWkb(wkb))
+        for jj, values in enumerate(field_values):
+            new_feature.SetField(jj, values[ii])
+        layer.CreateFeature(new_feature)
+
+    if use_transaction:
+        data_source.CommitTransaction()
+
+    return layer
+
+
+def write_prj_file(shape_fn, spatial_ref):
+    """
+    write the projection file that goes along with a shape file
+    """
+    esri_ref = spatial_ref.Clone()
+    esri_ref.MorphToESRI()
+    with open('{0}prj'.format(shape_fn[:-3]), 'w') as prj_file:
+        prj_file.write(esri_ref.ExportToWkt())
+
+
+def _split_by_period(arr_dict, periods):
+    """
+    stack the structured arrays of the given periods, return the stacked
+    array and the bounds of each period in it.
+    """
+    arr_list = [arr_dict[plot_per] for plot_per in periods]
+    bounds = np.cumsum([0] + [arr.size for arr in arr_list])
+    return np.concatenate(arr_list), bounds
+
 
 class PTShapeFile(object):
     """
@@ -58,7 +249,10 @@ class PTShapeFile(object):
                              input files
     _get_pt_array            get phase tensors from input files and put the
                              information into a structured array
-    write_shape_files        write shape files based on attributes of class
+    get_ellipse_polygons     compute the ellipse outlines of all stations and
+                             periods in one pass
+    write_shape_files        write shape files based on attributes of class,
+                             or all periods into one GeoPackage
     ======================== ==================================================
 
     * This will project the data into UTM WSG84
@@ -76,10 +270,15 @@ class PTShapeFile(object):
         >>> pts.projection = 'NAD27'
         >>> pts.write_shape_files()
 
+    * To write every period as a layer of a single GeoPackage
+    :Example: ::
+        >>> pts.write_shape_files(geopackage_fn=r"/home/gis/pt.gpkg")
+
 
     """
 
     def __init__(self, edi_list=None, proj='WGS84', esize=0.03, **kwargs):
+        _check_gdal()
         self.edi_list = edi_list
         self.projection = proj
         #self.projection = None
@@ -181,221 +380,177 @@ class PTShapeFile(object):
 
         if periods is None:
             periods=self.plot_period
+        periods = np.atleast_1d(np.asarray(periods, dtype=float))
+
+        # compute the phase tensor and location of each station once, then
+        # pick out every requested period with one lookup per station
+        n_sta = len(self.mt_obj_list)
+        n_per = periods.size
+        pt_table = np.zeros((n_sta, n_per), dtype=[('phimin', np.float),
+                                                   ('phimax', np.float),
+                                                   ('azimuth', np.float),
+                                                   ('skew', np.float),
+                                                   ('n_skew', np.float),
+                                                   ('ellipticity', np.float)])
+        has_period = np.zeros((n_sta, n_per), dtype=bool)
+        sta_info = np.zeros(n_sta, dtype=[('station', '|S15'),
+                                          ('east', np.float),
+                                          ('north', np.float)])
+
+        for ss, mt_obj in enumerate(self.mt_obj_list):
+            data_periods = 1. / mt_obj.Z.freq
+            in_tol = ((data_periods[None, :] > periods[:, None] * (1 - self.ptol)) &
+                      (data_periods[None, :] < periods[:, None] * (1 + self.ptol)))
+            has_period[ss] = in_tol.any(axis=1)
+            if not has_period[ss].any():
+                continue
+            p_index = in_tol.argmax(axis=1)[has_period[ss]]
+
+            if self.projection is None:  # geographic-coord lat lon
+                east, north, elev = (mt_obj.lon, mt_obj.lat, 0)
+                self.utm_cs = osr.SpatialReference()
+                # Set geographic coordinate system to handle lat/lon
+                # self.utm_cs.SetWellKnownGeogCS(self.projection)
+                self.utm_cs.ImportFromEPSG(4326)
+                # create the spatial reference, WGS84=4326
+                # GDA94 = EPSG:4283 See  http://epsg.io/4283
+            elif self.projection == 'WGS84':  # UTM zones coordinate system
+                edi_proj = 'WGS84'
+                east, north, _ = project_point_ll2utm(mt_obj.lat, mt_obj.lon, edi_proj)
+                zone_number, is_northern, _ = get_utm_zone(mt_obj.lat, mt_obj.lon)
+                self.utm_cs = osr.SpatialReference()
+                self.utm_cs.SetUTM(zone_number, is_northern)
+                utm_cs_list.append(self.utm_cs.GetAttrValue('projcs'))
+            else:
+                raise Exception(
+                    "%s is NOT supported" %
+                    self.projection)
+
+            sta_info[ss] = (mt_obj.station, east, north)
+
+            pt = mt_obj.pt
+            sta_pt = pt_table[ss, has_period[ss]]
+            sta_pt['phimin'] = pt.phimin[p_index]
+            sta_pt['phimax'] = pt.phimax[p_index]
+            sta_pt['azimuth'] = pt.azimuth[p_index]
+            sta_pt['skew'] = pt.beta[p_index]
+            sta_pt['n_skew'] = 2 * pt.beta[p_index]
+            sta_pt['ellipticity'] = pt.ellipticity[p_index]  # FZ: get ellipticity begin here
+            pt_table[ss, has_period[ss]] = sta_pt
+
+        for pp, plot_per in enumerate(periods):
+            found = has_period[:, pp]
+            if not found.all():
+                print(("The period %s is NOT found for stations %s" %
+                       (plot_per, [mt_obj.station for mt_obj, ff in
+                                   zip(self.mt_obj_list, found) if not ff])))
+
+            pt_arr = np.zeros(found.sum(), dtype=[('station', '|S15'),
+                                                  ('east', np.float),
+                                                  ('north', np.float),
+                                                  ('phimin', np.float),
+                                                  ('phimax', np.float),
+                                                  ('azimuth', np.float),
+                                                  ('skew', np.float),
+                                                  ('n_skew', np.float),
+                                                  ('ellipticity', np.float)])
+            for name in sta_info.dtype.names:
+                pt_arr[name] = sta_info[name][found]
+            for name in pt_table.dtype.names:
+                pt_arr[name] = pt_table[name][found, pp]
+            self.pt_dict[plot_per] = pt_arr
 
-        for plot_per in periods:
-            self.pt_dict[plot_per] = []
-
-            for mt_obj in self.mt_obj_list:
-                p_index = [ff for ff, f2 in enumerate(1. / mt_obj.Z.freq)
-                           if (f2 > plot_per * (1 - self.ptol)) and
-                           (f2 < plot_per * (1 + self.ptol))]
-
-                if len(p_index) >= 1:
-                    p_index = p_index[0]
-
-                    if self.projection is None:  # geographic-coord lat lon
-                        east, north, elev = (mt_obj.lon, mt_obj.lat, 0)
-                        self.utm_cs = osr.SpatialReference()
-                        # Set geographic coordinate system to handle lat/lon
-                        # self.utm_cs.SetWellKnownGeogCS(self.projection)
-                        self.utm_cs.ImportFromEPSG(4326)
-                        # create the spatial reference, WGS84=4326
-                        # GDA94 = EPSG:4283 See  http://epsg.io/4283
-                    elif self.projection == 'WGS84':  # UTM zones coordinate system
-                        edi_proj = 'WGS84'
-                        east, north, _ = project_point_ll2utm(mt_obj.lat, mt_obj.lon, edi_proj)
-                        zone_number, is_northern, _ = get_utm_zone(mt_obj.lat, mt_obj.lon)
-                        self.utm_cs = osr.SpatialReference()
-                        self.utm_cs.SetUTM(zone_number, is_northern)
-                        utm_cs_list.append(self.utm_cs.GetAttrValue('projcs'))
-                    else:
-                        raise Exception(
-                            "%s is NOT supported" %
-                            self.projection)
-
-                    pt_tuple = (mt_obj.station, east, north,
-                                mt_obj.pt.phimin[p_index],
-                                mt_obj.pt.phimax[p_index],
-                                mt_obj.pt.azimuth[p_index],
-                                mt_obj.pt.beta[p_index],
-                                2 * mt_obj.pt.beta[p_index],
-                                mt_obj.pt.ellipticity[p_index])  # FZ: get ellipticity begin here
-
-                    self.pt_dict[plot_per].append(pt_tuple)
-                else:
-                    print(("The period %s is NOT found for this station %s" %(plot_per, mt_obj.station)))
-
-            self.pt_dict[plot_per] = np.array(self.pt_dict[plot_per],
-                                              dtype=[('station', '|S15'),
-                                                     ('east', np.float),
-                                                     ('north', np.float),
-                                                     ('phimin', np.float),
-                                                     ('phimax', np.float),
-                                                     ('azimuth', np.float),
-                                                     ('skew', np.float),
-                                                     ('n_skew', np.float),
-                                                     ('ellipticity', np.float)])
         unique_utm_cs = sorted(list(set(utm_cs_list)))
         if len(unique_utm_cs) >1:
             print(("Warning: Multi-UTM-Zones found in the EDI files", unique_utm_cs))
 
-
-    def write_shape_files(self, periods=None):
-        """
-        write shape file from given attributes
-        https://pcjericks.github.io/py-gdalogr-cookbook/vector_layers.html
-        #create-a-new-shapefile-and-add-data
+    def get_ellipse_polygons(self, periods=None):
         """
+        compute the ellipse outlines for every station and period in one pass.
 
-        # Why call again:
-        # self._get_pt_array() # already called in __init__?
+        Ellipses are normalised by the largest phimax of each period.
 
+        :param periods: list of periods, *default* is plot_period
+        :return: dictionary with keys of period and values of closed rings,
+                 shape (n_stations, n_theta + 1, 2)
+        """
         if periods is None:
             periods = self.plot_period
 
-        #for plot_per in self.plot_period:
-        for plot_per in periods:
-            # shape file path
-            shape_fn = os.path.join(self.save_path,
-                                    'PT_{0:.5g}s_{1}.shp'.format(plot_per,
-                                                                 self.projection))
-
-            # remove the shape file if it already exists, has trouble over
-            # writing
-            if os.path.isfile(shape_fn) == True:
-                os.remove(shape_fn)
-
-            # need to tell ogr which driver to use
-            driver = ogr.GetDriverByName('ESRI Shapefile')
-
-            if os.path.isfile(shape_fn) == True:
-                driver.DeleteDataSource(shape_fn)
-
-            # create shape file
-            data_source = driver.CreateDataSource(shape_fn)
-
-            #            ##if you read from a raster get the georeference point otherwise create one
-            #            spatial_ref = osr.SpatialReference()
-            #            #this puts it in the wsg84 reference frame.
-            #            spatial_ref.ImportFromEPSG(self._proj_dict[self.projection])
-
-            # create a layer to put the ellipses onto
-            layer = data_source.CreateLayer('PT', self.utm_cs, ogr.wkbPolygon)
+        pt_arr, bounds = _split_by_period(self.pt_dict, periods)
+        phi_max_val = np.repeat([pt_arr['phimax'][b0:b1].max() if b1 > b0 else 1.
+                                 for b0, b1 in zip(bounds[:-1], bounds[1:])],
+                                np.diff(bounds))
 
-            # make field names
-            field_name = ogr.FieldDefn("Name", ogr.OFTString)
-            layer.CreateField(field_name)
-
-            field_phimin = ogr.FieldDefn('phi_min', ogr.OFTReal)
-            layer.CreateField(field_phimin)
+        polygons = get_ellipse_polygons(pt_arr['east'], pt_arr['north'],
+                                        pt_arr['phimin'] / phi_max_val,
+                                        pt_arr['phimax'] / phi_max_val,
+                                        pt_arr['azimuth'],
+                                        self.ellipse_size, self._theta)
 
-            field_phimax = ogr.FieldDefn('phi_max', ogr.OFTReal)
-            layer.CreateField(field_phimax)
-
-            field_skew = ogr.FieldDefn('skew', ogr.OFTReal)
-            layer.CreateField(field_skew)
-
-            field_normalized_skew = ogr.FieldDefn('n_skew', ogr.OFTReal)
-            layer.CreateField(field_normalized_skew)
-
-            # FZ added azimuth
-            field_azimuth = ogr.FieldDefn('azimuth', ogr.OFTReal)
-            layer.CreateField(field_azimuth)
-
-            field_ellipticity = ogr.FieldDefn('ellipt', ogr.OFTReal)
-            # FZ: note osgeo gdal does not like name 'ellipticity'
-            layer.CreateField(field_ellipticity)
-
-            poly_list = []
-
-#            print("period=", plot_per)
-#            print(self.pt_dict.keys()) # (self.pt_dict[plot_per])['phimax'].size)
-            phi_max_val = self.pt_dict[plot_per]['phimax'].max()
-
-
-            for isite, pt_array in enumerate(self.pt_dict[plot_per]):
-
-                # need to make an ellipse first using the parametric
-                # equation
-                azimuth = -np.deg2rad(pt_array['azimuth'])
-                width = self.ellipse_size * (pt_array['phimax'] / phi_max_val)
-                height = self.ellipse_size * (pt_array['phimin'] / phi_max_val)
-
-                x0 = pt_array['east']
-                y0 = pt_array['north']
-
-
-                # apply formula to generate ellipses
-                x = x0 + height * np.cos(self._theta) * np.cos(azimuth) - \
-                    width * np.sin(self._theta) * np.sin(azimuth)
-                y = y0 + height * np.cos(self._theta) * np.sin(azimuth) + \
-                    width * np.sin(self._theta) * np.cos(azimuth)
+        return dict([(plot_per, polygons[b0:b1]) for plot_per, b0, b1 in
+                     zip(periods, bounds[:-1], bounds[1:])])
 
-                # 1) make a geometry shape of the ellipse
-                ellipse = ogr.Geometry(ogr.wkbLinearRing)
-
-                for ii, jj in zip(x, y):
-                    ellipse.AddPoint(np.round(ii, 6), np.round(jj, 6))
-
-                ellipse.CloseRings()
-
-                # 2) make a polygon
-                poly = ogr.Geometry(ogr.wkbPolygon)
-                poly.AddGeometry(ellipse)
-
-                poly_list.append(poly)
+    def write_shape_files(self, periods=None, geopackage_fn=None):
+        """
+        write shape file from given attributes
+        https://pcjericks.github.io/py-gdalogr-cookbook/vector_layers.html
+        #create-a-new-shapefile-and-add-data
 
-                # 4) this part is confusing but we need to create a feature that has the
-                # same definition as the layer that we created.
-                # get the layer definition
-                feature_def = layer.GetLayerDefn()
+        :param periods: list of periods to write, *default* is plot_period
+        :param geopackage_fn: if given all periods are written as layers
+                              named PT_{period}s of a single GeoPackage,
+                              otherwise one shape file is written per period
+        """
 
-                # create a new feature
-                new_feature = ogr.Feature(feature_def)
-                # set the geometry of that feature to be the ellipse
-                new_feature.SetGeometry(poly)
-                # create the feature in the layer.
-                layer.CreateFeature(new_feature)
+        if periods is None:
+            periods = self.plot_period
 
-                #
-                # 5) create a field to color by
-                val_sta = pt_array['station']
-                print(" the type of pt_array['station'] = ", type(val_sta))
-                # decode the string cal_sta (numpy_bytes_ )  back into ASCII
-                new_feature.SetField("Name", pt_array['station'].decode('UTF-8'))
-                new_feature.SetField("phi_min", pt_array['phimin'])
-                new_feature.SetField("phi_max", pt_array['phimax'])
-                new_feature.SetField("skew", pt_array['skew'])
-                new_feature.SetField("n_skew", pt_array['n_skew'])
+        # compute all the ellipses before touching the disk
+        polygon_dict = self.get_ellipse_polygons(periods)
 
-                new_feature.SetField(
-                    "azimuth", pt_array['azimuth'])  # FZ added
-                new_feature.SetField(
-                    "ellipt", pt_array['ellipticity'])  # FZ added
-                # new_feature.SetField("ellipticity", pt_array['azimuth'])
-                # # FZ added
+        if geopackage_fn is not None:
+            data_source = create_data_source(geopackage_fn, 'GPKG')
 
-                # add the new feature to the layer.
-                layer.SetFeature(new_feature)
+        for plot_per in periods:
+            pt_arr = self.pt_dict[plot_per]
+            fields = [('Name', pt_arr['station']),
+                      ('phi_min', pt_arr['phimin']),
+                      ('phi_max', pt_arr['phimax']),
+                      ('skew', pt_arr['skew']),
+                      ('n_skew', pt_arr['n_skew']),
+                      ('azimuth', pt_arr['azimuth']),  # FZ added
+                      # FZ: note osgeo gdal does not like name 'ellipticity'
+                      ('ellipt', pt_arr['ellipticity'])]
+
+            if geopackage_fn is not None:
+                write_polygon_layer(data_source,
+                                    'PT_{0:.5g}s'.format(plot_per),
+                                    self.utm_cs, polygon_dict[plot_per],
+                                    fields)
+                continue
 
-                # apparently need to destroy the feature
-                new_feature.Destroy()
+            # shape file path
+            shape_fn = os.path.join(self.save_path,
+                                    'PT_{0:.5g}s_{1}.shp'.format(plot_per,
+                                                                 self.projection))
 
+            data_source = create_data_source(shape_fn)
+            write_polygon_layer(data_source, 'PT', self.utm_cs,
+                                polygon_dict[plot_per], fields)
 
             # Need to be sure that all the new info is saved to
             data_source.SyncToDisk()
+            write_prj_file(shape_fn, self.utm_cs)
+            data_source.Destroy()
 
-            # write a projection file
-            #            spatial_ref.MorphToESRI()
-            self.utm_cs.MorphToESRI()
-            prj_file = open('{0}prj'.format(shape_fn[:-3]), 'w')
-            #            prj_file.write(spatial_ref.ExportToWkt())
-            prj_file.write(self.utm_cs.ExportToWkt())
-            prj_file.close()
+            print('Wrote shape file to {0}'.format(shape_fn))
 
+        if geopackage_fn is not None:
+            data_source.SyncToDisk()
             data_source.Destroy()
 
-            print('Wrote shape file to {0}'.format(shape_fn))
+            print('Wrote {0} layers to {1}'.format(len(periods), geopackage_fn))
 
 # ===========================
     def write_data_pt_shape_files_modem(self, modem_data_fn,
@@ -404,6 +559,8 @@ class PTShapeFile(object):
         write pt files from a modem data file.
 
         """
+        # ModEM needs GDAL, so it is only imported when used
+        import mtpy.modeling.modem
 
         modem_obj = mtpy.modeling.modem.Data()
         modem_obj.read_data_file(modem_data_fn)
@@ -424,6 +581,8 @@ class PTShapeFile(object):
         by the data file.
 
         """
+        # ModEM needs GDAL, so it is only imported when used
+        import mtpy.modeling.modem
 
         # first get the data and response and place them in array for later use
         modem_data_obj = mtpy.modeling.modem.Data()
@@ -611,6 +770,8 @@ class PTShapeFile(object):
                    * 'all' to normalize each period by the largest phimax
 
         """
+        # ModEM needs GDAL, so it is only imported when used
+        import mtpy.modeling.modem
 
         # first get the data and response and place them in array for later use
         modem_data_obj = mtpy.modeling.modem.Data()
@@ -857,6 +1018,10 @@ class TipperShapeFile(object):
     _get_plot_period         get a list of all possible frequencies from data
     _get_tip_array           get Tipper information from data and put into
                              a structured array for easy manipulation
+    get_arrow_polygons       compute the arrow outlines of all stations and
+                             periods in one pass
+    write_shape_files        write real and imaginary induction arrow shape
+                             files, or all of them into one GeoPackage
     write_real_shape_files   write real induction arrow shape files
     write_imag_shape_files   write imaginary induction arrow shape files
     ======================== ==================================================
@@ -875,6 +1040,7 @@ class TipperShapeFile(object):
     """
 
     def __init__(self, edi_list=None, **kwargs):
+        _check_gdal()
         self.edi_list = edi_list
         self.projection = 'WGS84'
         self.plot_period = None
@@ -953,352 +1119,183 @@ class TipperShapeFile(object):
         """
         utm_cs_list=[]
 
+        periods = np.atleast_1d(np.asarray(self.plot_period, dtype=float))
+        n_sta = len(self.mt_obj_list)
+        n_per = periods.size
+
+        # collect the induction vectors of each station once, then pick out
+        # every period with one lookup per station
+        tip_table = np.zeros((n_sta, n_per), dtype=[('mag_real', np.float),
+                                                    ('mag_imag', np.float),
+                                                    ('ang_real', np.float),
+                                                    ('ang_imag', np.float)])
+        has_period = np.zeros((n_sta, n_per), dtype=bool)
+        sta_info = np.zeros(n_sta, dtype=[('station', '|S15'),
+                                          ('east', np.float),
+                                          ('north', np.float)])
+
+        for ss, mt_obj in enumerate(self.mt_obj_list):
+            if mt_obj.Tipper.tipper is None:
+                continue
+
+            data_periods = 1. / mt_obj.Z.freq
+            in_tol = ((data_periods[None, :] > periods[:, None] * (1 - self.ptol)) &
+                      (data_periods[None, :] < periods[:, None] * (1 + self.ptol)))
+            has_period[ss] = in_tol.any(axis=1)
+            if not has_period[ss].any():
+                continue
+            p_index = in_tol.argmax(axis=1)[has_period[ss]]
+
+            if self.projection is None:
+                east, north, elev = (mt_obj.lon, mt_obj.lat, 0)
+                self.utm_cs = osr.SpatialReference()
+                # Set geographic coordinate system to handle lat/lon
+                self.utm_cs.ImportFromEPSG(4326)
+            else:
+                east, north, _ = project_point_ll2utm(mt_obj.lat, mt_obj.lon,
+                                                      self.projection)
+                zone_number, is_northern, _ = get_utm_zone(mt_obj.lat, mt_obj.lon)
+                self.utm_cs = osr.SpatialReference()
+                self.utm_cs.SetWellKnownGeogCS(self.projection)
+                self.utm_cs.SetUTM(zone_number, is_northern)
+
+                utm_cs_list.append(self.utm_cs.GetAttrValue('projcs'))
+
+            sta_info[ss] = (mt_obj.station, east, north)
+
+            mt_obj.Tipper.compute_mag_direction()
+            # stations with a zero tipper component get a zero arrow
+            nonzero = np.all(mt_obj.Tipper.tipper[p_index] != 0,
+                             axis=(1, 2))
+            sta_tip = tip_table[ss, has_period[ss]]
+            sta_tip['mag_real'] = np.where(nonzero, mt_obj.Tipper.mag_real[p_index], 0)
+            sta_tip['mag_imag'] = np.where(nonzero, mt_obj.Tipper.mag_imag[p_index], 0)
+            sta_tip['ang_real'] = np.where(nonzero, mt_obj.Tipper.angle_real[p_index], 0)
+            sta_tip['ang_imag'] = np.where(nonzero, mt_obj.Tipper.angle_imag[p_index], 0)
+            tip_table[ss, has_period[ss]] = sta_tip
+
         self.tip_dict = {}
-        for plot_per in self.plot_period:
-            self.tip_dict[plot_per] = []
-            for mt_obj in self.mt_obj_list:
-                mt_obj.Tipper.compute_mag_direction()
-                try:
-                    p_index = [ff for ff, f2 in enumerate(1. / mt_obj.Z.freq)
-                               if (f2 > plot_per * (1 - self.ptol)) and
-                               (f2 < plot_per * (1 + self.ptol))][0]
-                    if self.projection is None:
-                        east, north, elev = (mt_obj.lon, mt_obj.lat, 0)
-                        self.utm_cs = osr.SpatialReference()
-                        # Set geographic coordinate system to handle lat/lon
-                        self.utm_cs.SetWellKnownGeogCS(self.projection)
-                    else:
-                        self.utm_cs, utm_point = project_point_ll2utm(mt_obj.lon,
-                                                                     mt_obj.lat,
-                                                                     self.projection)
-                        east, north, elev = utm_point
-
-                        utm_cs_list.append(self.utm_cs.GetAttrValue('projcs'))
-
-                    if mt_obj.Tipper.tipper is not None:
-
-                        if mt_obj.Tipper.tipper[p_index].all() != 0.0:
-                            tp_tuple = (mt_obj.station,
-                                        east,
-                                        north,
-                                        mt_obj.Tipper.mag_real[p_index],
-                                        mt_obj.Tipper.mag_imag[p_index],
-                                        mt_obj.Tipper.angle_real[p_index],
-                                        mt_obj.Tipper.angle_imag[p_index])
-                            self.tip_dict[plot_per].append(tp_tuple)
-                        else:
-                            tp_tuple = (mt_obj.station,
-                                        east,
-                                        north,
-                                        0,
-                                        0,
-                                        0,
-                                        0)
-                            self.tip_dict[plot_per].append(tp_tuple)
-
-                except IndexError:
-                    pass
-
-            self.tip_dict[plot_per] = np.array(self.tip_dict[plot_per],
-                                               dtype=[('station', '|S15'),
-                                                      ('east', np.float),
-                                                      ('north', np.float),
-                                                      ('mag_real', np.float),
-                                                      ('mag_imag', np.float),
-                                                      ('ang_real', np.float),
-                                                      ('ang_imag', np.float)])
+        for pp, plot_per in enumerate(self.plot_period):
+            found = has_period[:, pp]
+            tip_arr = np.zeros(found.sum(), dtype=[('station', '|S15'),
+                                                   ('east', np.float),
+                                                   ('north', np.float),
+                                                   ('mag_real', np.float),
+                                                   ('mag_imag', np.float),
+                                                   ('ang_real', np.float),
+                                                   ('ang_imag', np.float)])
+            for name in sta_info.dtype.names:
+                tip_arr[name] = sta_info[name][found]
+            for name in tip_table.dtype.names:
+                tip_arr[name] = tip_table[name][found, pp]
+            self.tip_dict[plot_per] = tip_arr
 
         unique_utm_cs = sorted(list(set(utm_cs_list)))
         if len(unique_utm_cs) >1:
             print(("Warning: Multi-UTM-Zones found in the EDI files", unique_utm_cs))
 
-    def write_real_shape_files(self):
+    def get_arrow_polygons(self, component='real', periods=None):
         """
-        write shape file from given attributes
-        """
-
-        self._get_tip_array()
-
-        for plot_per in self.plot_period:
-            # shape file path
-            shape_fn = os.path.join(self.save_path,
-                                    'Tip_{0:.5g}s_{1}_real.shp'.format(plot_per,
-                                                                       self.projection))
-
-            # remove the shape file if it already exists, has trouble over
-            # writing
-            if os.path.isfile(shape_fn) == True:
-                os.remove(shape_fn)
-
-            # need to tell ogr which driver to use
-            driver = ogr.GetDriverByName('ESRI Shapefile')
-
-            if os.path.isfile(shape_fn) == True:
-                driver.DeleteDataSource(shape_fn)
-
-            # create shape file
-            data_source = driver.CreateDataSource(shape_fn)
+        compute the induction arrow outlines for every station and period in
+        one pass.
 
-            # if you read from a raster get the georeference point otherwise create one
-            # spatial_ref = osr.SpatialReference()
-            # this puts it in the wsg84 reference frame.
-            # spatial_ref.ImportFromEPSG(self._proj_dict[self.projection])
-
-            # create a layer to put the ellipses onto
-            layer = data_source.CreateLayer('TIPPER', self.utm_cs,
-                                            ogr.wkbPolygon)
-
-            # make field names
-            field_name = ogr.FieldDefn("Name", ogr.OFTString)
-            layer.CreateField(field_name)
-
-            field_mag_real = ogr.FieldDefn('mag_real', ogr.OFTReal)
-            layer.CreateField(field_mag_real)
-
-            field_ang_real = ogr.FieldDefn('ang_real', ogr.OFTReal)
-            layer.CreateField(field_ang_real)
-
-            for tp_arr in self.tip_dict[plot_per]:
-                cos_t = np.cos(-np.deg2rad(tp_arr['ang_real']))
-                sin_t = np.sin(-np.deg2rad(tp_arr['ang_real']))
-                # calculate the points to make the line
-                txr = 0
-                tyr = tp_arr['mag_real'] * self.arrow_size
-
-                # make an arrow by drawing an outline.  have the arrow point
-                # north to start and then rotate later with the rotation
-                # matrix to properly orient it.
-                x0 = 0
-                y0 = 0
-
-                x1 = x0 + self.arrow_lw
-                y1 = y0
-
-                x2 = x0 + self.arrow_lw
-                y2 = y0 + tyr - self.arrow_head_height
-
-                x3 = x0 + self.arrow_lw + self.arrow_head_width
-                y3 = y2
-
-                x4 = x0 + txr
-                y4 = y0 + tyr
-
-                x7 = x0 - self.arrow_lw
-                y7 = y0
+        :param component: [ 'real' | 'imag' ]
+        :param periods: list of periods, *default* is plot_period
+        :return: dictionary with keys of period and values of closed rings,
+                 shape (n_stations, 9, 2)
+        """
+        if periods is None:
+            periods = self.plot_period
 
-                x6 = x0 - self.arrow_lw
-                y6 = y0 + tyr - self.arrow_head_height
+        tip_arr, bounds = _split_by_period(self.tip_dict, periods)
+        polygons = get_arrow_polygons(tip_arr['east'], tip_arr['north'],
+                                      tip_arr['mag_{0}'.format(component)],
+                                      tip_arr['ang_{0}'.format(component)],
+                                      self.arrow_size, self.arrow_lw,
+                                      self.arrow_head_width,
+                                      self.arrow_head_height)
 
-                x5 = x0 - self.arrow_lw - self.arrow_head_width
-                y5 = y6
+        return dict([(plot_per, polygons[b0:b1]) for plot_per, b0, b1 in
+                     zip(periods, bounds[:-1], bounds[1:])])
 
-                x = np.array([x0, x1, x2, x3, x4, x5, x6, x7])
-                y = np.array([y0, y1, y2, y3, y4, y5, y6, y7])
+    def write_shape_files(self, components=('real', 'imag'),
+                          geopackage_fn=None):
+        """
+        write shape files of the induction arrows
 
-                rot_matrix = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
+        :param components: components to write, any of 'real' and 'imag'
+        :param geopackage_fn: if given all periods and components are written
+                              as layers named Tip_{period}s_{component} of a
+                              single GeoPackage, otherwise one shape file is
+                              written per period and component
+        """
 
-                # rotate the arrow to be properly oriented
-                xy = np.array([x, y])
-                rot_xy = np.dot(rot_matrix, xy)
+        self._get_tip_array()
 
-                # shift the arrow to be centered on the station.
-                x = tp_arr['east'] + rot_xy[0]
-                y = tp_arr['north'] + rot_xy[1]
+        if geopackage_fn is not None:
+            data_source = create_data_source(geopackage_fn, 'GPKG')
 
-                # 1) make a geometry shape line
-                arrow = ogr.Geometry(ogr.wkbLinearRing)
-                for ii, jj in zip(x, y):
-                    arrow.AddPoint(np.round(ii, 6), np.round(jj, 6))
+        for comp in components:
+            # compute all the arrows before touching the disk
+            polygon_dict = self.get_arrow_polygons(comp)
 
-                arrow.CloseRings()
+            for plot_per in self.plot_period:
+                tp_arr = self.tip_dict[plot_per]
+                fields = [('Name', tp_arr['station']),
+                          ('mag_{0}'.format(comp), tp_arr['mag_{0}'.format(comp)]),
+                          ('ang_{0}'.format(comp), tp_arr['ang_{0}'.format(comp)])]
 
-                poly = ogr.Geometry(ogr.wkbPolygon)
-                poly.AddGeometry(arrow)
-                # 4) this part is confusing but we need to create a
-                # feature that has the
-                # same definition as the layer that we created.
-                #    get the layer definition
-                feature_def = layer.GetLayerDefn()
+                if geopackage_fn is not None:
+                    write_polygon_layer(data_source,
+                                        'Tip_{0:.5g}s_{1}'.format(plot_per, comp),
+                                        self.utm_cs, polygon_dict[plot_per],
+                                        fields)
+                    continue
 
-                # create a new feature
-                new_feature = ogr.Feature(feature_def)
-                # set the geometry of that feature to be the ellipse
-                new_feature.SetGeometry(poly)
-                # create the feature in the layer.
-                layer.CreateFeature(new_feature)
+                # shape file path
+                shape_fn = os.path.join(self.save_path,
+                                        'Tip_{0:.5g}s_{1}_{2}.shp'.format(plot_per,
+                                                                          self.projection,
+                                                                          comp))
 
-                #
-                # 5) create a field to color by
-                new_feature.SetField("Name", tp_arr['station'])
-                new_feature.SetField("mag_real", tp_arr['mag_real'])
-                new_feature.SetField("ang_real", tp_arr['ang_real'])
+                data_source = create_data_source(shape_fn)
+                write_polygon_layer(data_source, 'TIPPER', self.utm_cs,
+                                    polygon_dict[plot_per], fields)
 
-                # add the new feature to the layer.
-                layer.SetFeature(new_feature)
+                # Need to be sure that all the new info is saved to
+                data_source.SyncToDisk()
+                write_prj_file(shape_fn, self.utm_cs)
+                data_source.Destroy()
 
-                # apparently need to destroy the feature
-                new_feature.Destroy()
+                print('Wrote shape file to {0}'.format(shape_fn))
 
-            # Need to be sure that all the new info is saved to
+        if geopackage_fn is not None:
             data_source.SyncToDisk()
-
-            # write a projection file
-            # spatial_ref.MorphFromESRI()
-            self.utm_cs.MorphFromESRI()
-            prj_file = open('{0}prj'.format(shape_fn[:-3]), 'w')
-            prj_file.write(self.utm_cs.ExportToWkt())
-            prj_file.close()
-
             data_source.Destroy()
 
-            print('Wrote shape file to {0}'.format(shape_fn))
+            print('Wrote tipper layers to {0}'.format(geopackage_fn))
 
-    def write_imag_shape_files(self):
+    def write_real_shape_files(self):
         """
         write shape file from given attributes
         """
 
-        self._get_tip_array()
-
-        for plot_per in self.plot_period:
-            # shape file path
-            shape_fn = os.path.join(self.save_path,
-                                    'Tip_{0:.5g}s_{1}_imag.shp'.format(plot_per,
-                                                                       self.projection))
-
-            # remove the shape file if it already exists, has trouble over
-            # writing
-            if os.path.isfile(shape_fn) == True:
-                os.remove(shape_fn)
-
-            # need to tell ogr which driver to use
-            driver = ogr.GetDriverByName('ESRI Shapefile')
-
-            if os.path.isfile(shape_fn) == True:
-                driver.DeleteDataSource(shape_fn)
-
-            # create shape file
-            data_source = driver.CreateDataSource(shape_fn)
-
-            # if you read from a raster get the georeference point otherwise create one
-            # spatial_ref = osr.SpatialReference()
-            # this puts it in the wsg84 reference frame.
-            # spatial_ref.ImportFromEPSG(self._proj_dict[self.projection])
-
-            # create a layer to put the ellipses onto
-            layer = data_source.CreateLayer('TIPPER', self.utm_cs,
-                                            ogr.wkbPolygon)
-
-            # make field names
-            field_name = ogr.FieldDefn("Name", ogr.OFTString)
-            layer.CreateField(field_name)
-
-            field_mag_imag = ogr.FieldDefn('mag_imag', ogr.OFTReal)
-            layer.CreateField(field_mag_imag)
-
-            field_ang_imag = ogr.FieldDefn('ang_imag', ogr.OFTReal)
-            layer.CreateField(field_ang_imag)
-
-            for tp_arr in self.tip_dict[plot_per]:
-                cos_t = np.cos(-np.deg2rad(tp_arr['ang_imag']))
-                sin_t = np.sin(-np.deg2rad(tp_arr['ang_imag']))
-                # calculate the points to make the line
-                txr = 0
-                tyr = tp_arr['mag_imag'] * self.arrow_size
-
-                # make an arrow by drawing an outline.  have the arrow point
-                # north to start and then rotate later with the rotation
-                # matrix to properly orient it.
-                x0 = 0
-                y0 = 0
-
-                x1 = x0 + self.arrow_lw
-                y1 = y0
-
-                x2 = x0 + self.arrow_lw
-                y2 = y0 + tyr - self.arrow_head_height
-
-                x3 = x0 + self.arrow_lw + self.arrow_head_width
-                y3 = y2
-
-                x4 = x0 + txr
-                y4 = y0 + tyr
-
-                x7 = x0 - self.arrow_lw
-                y7 = y0
-
-                x6 = x0 - self.arrow_lw
-                y6 = y0 + tyr - self.arrow_head_height
-
-                x5 = x0 - self.arrow_lw - self.arrow_head_width
-                y5 = y6
+        self.write_shape_files(components=['real'])
 
-                x = np.array([x0, x1, x2, x3, x4, x5, x6, x7])
-                y = np.array([y0, y1, y2, y3, y4, y5, y6, y7])
-
-                rot_matrix = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
-
-                # rotate the arrow to be properly oriented
-                xy = np.array([x, y])
-                rot_xy = np.dot(rot_matrix, xy)
-
-                # shift the arrow to be centered on the station
-                x = tp_arr['east'] + rot_xy[0]
-                y = tp_arr['north'] + rot_xy[1]
-
-                # 1) make a geometry shape line
-                arrow = ogr.Geometry(ogr.wkbLinearRing)
-                for ii, jj in zip(x, y):
-                    arrow.AddPoint(np.round(ii, 6), np.round(jj, 6))
-
-                arrow.CloseRings()
-
-                poly = ogr.Geometry(ogr.wkbPolygon)
-                poly.AddGeometry(arrow)
-                # 4) this part is confusing but we need to create a
-                # feature that has the
-                # same definition as the layer that we created.
-                #    get the layer definition
-                feature_def = layer.GetLayerDefn()
-
-                # create a new feature
-                new_feature = ogr.Feature(feature_def)
-                # set the geometry of that feature to be the ellipse
-                new_feature.SetGeometry(poly)
-                # create the feature in the layer.
-                layer.CreateFeature(new_feature)
-
-                #
-                # 5) create a field to color by
-                new_feature.SetField("Name", tp_arr['station'])
-                new_feature.SetField("mag_imag", tp_arr['mag_imag'])
-                new_feature.SetField("ang_imag", tp_arr['ang_imag'])
-
-                # add the new feature to the layer.
-                layer.SetFeature(new_feature)
-
-                # apparently need to destroy the feature
-                new_feature.Destroy()
-
-            # Need to be sure that all the new info is saved to
-            data_source.SyncToDisk()
-
-            # write a projection file
-            # spatial_ref.MorphFromESRI()
-            self.utm_cs.MorphFromESRI()
-            prj_file = open('{0}prj'.format(shape_fn[:-3]), 'w')
-            prj_file.write(self.utm_cs.ExportToWkt())
-            prj_file.close()
-
-            data_source.Destroy()
+    def write_imag_shape_files(self):
+        """
+        write shape file from given attributes
+        """
 
-            print('Wrote shape file to {0}'.format(shape_fn))
+        self.write_shape_files(components=['imag'])
 
     def write_tip_shape_files_modem(self, modem_data_fn, rotation_angle=0.0):
         """
         write tip files from a modem data file.
 
         """
+        # ModEM needs GDAL, so it is only imported when used
+        import mtpy.modeling.modem
 
         modem_obj = mtpy.modeling.modem.Data()
         modem_obj.read_data_file(modem_data_fn)
@@ -1319,6 +1316,9 @@ class TipperShapeFile(object):
         write residual tipper files for modem
 
         """
+        # ModEM needs GDAL, so it is only imported when used
+        import mtpy.modeling.modem
+
         modem_data_obj = mtpy.modeling.modem.Data()
         modem_data_obj.read_data_file(modem_data_fn)
 
@@ -1352,6 +1352,7 @@ def reproject_layer(in_shape_file, out_shape_file=None, out_proj='WGS84'):
 
     """
 
+    _check_gdal()
     driver = ogr.GetDriverByName('ESRI Shapefile')
 
     # input SpatialReference
@@ -1418,6 +1419,7 @@ def reproject_layer(in_shape_file, out_shape_file=None, out_proj='WGS84'):
 # ==============================================================================
 
 def array2raster(newRasterfn, rasterOrigin, pixelWidth, pixelHeight, array):
+    _check_gdal()
     cols = array.shape[1]
     rows = array.shape[0]
     originX = rasterOrigin[0]
@@ -112,3 +112,37 @@ class Test_Geometry(TestCase):
                 strike_angle_pb42c[np.isfinite(strike_angle_pb42c)],
                 1e-8)
         )
+
+    def test_survey_geometry_matches_single_station(self):
+        edi_list = [os.path.normpath(os.path.join(TEST_MTPY_ROOT, "examples/data/edi_files", fn))
+                    for fn in ["pb42c.edi", "pb23c.edi", "pb35c.edi"]]
+        mt_list = [MT(fn) for fn in edi_list]
+        survey = mtg.SurveyGeometry(mt_obj_list=mt_list)
+
+        dims = survey.dimensionality(skew_threshold=3)
+        strikes = survey.strike_angle(skew_threshold=3)
+        ecc, ecc_err = survey.eccentricity()
+        self.assertEqual(dims.shape, (len(mt_list), survey.freq.size))
+        # cached results are returned on repeated calls
+        self.assertIs(dims, survey.dimensionality(skew_threshold=3))
+
+        for ii, mt_obj in enumerate(mt_list):
+            f_index = survey.freq_index[ii]
+            self.assertTrue(np.array_equal(
+                dims[ii, f_index],
+                mtg.dimensionality(z_object=mt_obj.Z, skew_threshold=3)))
+            self.assertTrue(np.allclose(
+                strikes[ii, f_index],
+                mtg.strike_angle(z_object=mt_obj.Z, skew_threshold=3),
+                equal_nan=True))
+            ecc_station = mtg.eccentricity(z_object=mt_obj.Z)
+            self.assertTrue(np.allclose(ecc[ii, f_index], ecc_station[0]))
+            self.assertTrue(np.allclose(ecc_err[ii, f_index], ecc_station[1]))
+
+    def test_resolve_strike_ambiguity(self):
+        strikes = np.array([[38.4, -51.6], [-5.5, 84.5], [np.nan, np.nan]])
+        strike = mtg.resolve_strike_ambiguity(strikes, strike_approx=80)
+        self.assertTrue(np.allclose(strike, [38.4, 84.5, np.nan], equal_nan=True))
+        # angles are compared modulo 180 degrees
+        strike = mtg.resolve_strike_ambiguity(strikes, strike_approx=-60)
+        self.assertTrue(np.allclose(strike, [-51.6, 84.5, np.nan], equal_nan=True))
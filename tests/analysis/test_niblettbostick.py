@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+TEST mtpy.analysis.niblettbostick
+
+"""
+import copy
+import glob
+import os
+from unittest import TestCase
+
+import numpy as np
+
+import mtpy.analysis.niblettbostick as mtnb
+from mtpy.core.mt import MT
+from mtpy.imaging.penetration import PenetrationDepthCube
+from tests import EDI_DATA_DIR
+
+
+class Test_NiblettBostick(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mt_list = [MT(fn) for fn in
+                       sorted(glob.glob(os.path.join(EDI_DATA_DIR, "*.edi")))[:5]]
+
+    def test_depth_nb_array_matches_single_station(self):
+        for mt_obj in self.mt_list:
+            depth_array = mtnb.calculate_depth_nb(z_object=copy.deepcopy(mt_obj.Z))
+            depth_stack = mtnb.calculate_depth_nb_array(mt_obj.Z.z,
+                                                        1. / mt_obj.Z.freq)
+            for key in depth_array.dtype.names:
+                self.assertTrue(np.allclose(depth_array[key], depth_stack[key]))
+
+    def test_depth_cube(self):
+        depth_cube = PenetrationDepthCube(self.mt_list)
+        nb_depth = depth_cube.nb_depth
+        self.assertEqual(nb_depth.shape, depth_cube.freq.shape)
+        # nb depths are cached
+        self.assertIs(nb_depth, depth_cube.nb_depth)
+
+        for ii, mt_obj in enumerate(self.mt_list):
+            nf = depth_cube.num_freq[ii]
+            depth_array = mtnb.calculate_depth_nb(z_object=copy.deepcopy(mt_obj.Z))
+            self.assertTrue(np.allclose(nb_depth['depth_max'][ii, :nf],
+                                        depth_array['depth_max']))
+            self.assertTrue(np.all(np.isnan(nb_depth['depth_max'][ii, nf:])))
+
+            period = 1. / mt_obj.Z.freq
+            depth_xy = depth_cube.scale_param * np.sqrt(
+                mt_obj.Z.resistivity[:, 0, 1] * period)
+            self.assertTrue(np.allclose(depth_cube.get_depth('zxy')[ii, :nf],
+                                        depth_xy))
@@ -0,0 +1,69 @@
+from unittest import TestCase
+import glob
+import os
+import shutil
+import time
+
+from tests import TEST_MTPY_ROOT, make_temp_dir
+from mtpy.core import batch_convert
+
+
+class TestBatchConvert(TestCase):
+    def setUp(self):
+        self._temp_dir = make_temp_dir(self.__class__.__name__)
+        self.in_dir = os.path.join(self._temp_dir, 'in')
+        self.out_dir = os.path.join(self._temp_dir, 'out')
+        os.mkdir(self.in_dir)
+        for fn in glob.glob(os.path.join(
+                TEST_MTPY_ROOT, 'examples/birrp_processing/birrp_wd/BP0[2-4].j')):
+            shutil.copy(fn, self.in_dir)
+        with open(os.path.join(self.in_dir, 'bad.j'), 'w') as fid:
+            fid.write('not a j file\n')
+
+    def test_get_file_type(self):
+        self.assertEqual(batch_convert.get_file_type('mt01.EDI'), 'edi')
+        self.assertEqual(batch_convert.get_file_type('mt01.zrr'), 'zmm')
+
+        edi_fn = os.path.join(TEST_MTPY_ROOT, 'examples/data/edi_files/pb23c.edi')
+        unknown_fn = os.path.join(self._temp_dir, 'pb23c.txt')
+        shutil.copy(edi_fn, unknown_fn)
+        self.assertEqual(batch_convert.get_file_type(unknown_fn), 'edi')
+
+    def test_batch_convert(self):
+        results = batch_convert.batch_convert(self.in_dir, save_dir=self.out_dir,
+                                              n_processes=2)
+        status = dict([(os.path.basename(res.fn), res.status)
+                       for res in results])
+        self.assertEqual(status, {'BP02.j': 'converted', 'BP03.j': 'converted',
+                                  'BP04.j': 'converted', 'bad.j': 'failed'})
+        self.assertIsNotNone([res.error for res in results
+                              if res.status == 'failed'][0])
+        self.assertEqual(sorted(os.listdir(self.out_dir)),
+                         ['BP02.edi', 'BP03.edi', 'BP04.edi'])
+
+        # outputs are newer than the inputs except for a touched input
+        new_time = time.time() + 10
+        os.utime(os.path.join(self.in_dir, 'BP03.j'), (new_time, new_time))
+        results = batch_convert.batch_convert(
+            os.path.join(self.in_dir, 'BP*.j'), save_dir=self.out_dir,
+            n_processes=1)
+        self.assertEqual([res.status for res in results],
+                         ['skipped', 'converted', 'skipped'])
+        self.assertEqual(sorted(os.listdir(self.out_dir)),
+                         ['BP02.edi', 'BP03.edi', 'BP04.edi'])
+
+    def test_convert_xml(self):
+        edi_fn = os.path.join(TEST_MTPY_ROOT, 'examples/data/edi_files/pb23c.edi')
+        out_fn = os.path.join(self.out_dir, 'pb23c.xml')
+        os.mkdir(self.out_dir)
+        result = batch_convert.convert_file(edi_fn, out_fn, output_type='xml')
+        self.assertEqual(result.status, 'converted', result.error)
+        self.assertEqual(result.out_fn, out_fn)
+        self.assertTrue(os.path.isfile(out_fn))
+
+        results = batch_convert.batch_convert(self.in_dir, save_dir=self.out_dir,
+                                              output_type='xml', n_processes=1)
+        self.assertEqual([res.status for res in results],
+                         ['converted'] * 3 + ['failed'])
+        self.assertEqual(sorted(os.listdir(self.out_dir)),
+                         ['BP02.xml', 'BP03.xml', 'BP04.xml', 'pb23c.xml'])
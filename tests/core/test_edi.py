@@ -1,7 +1,10 @@
+import glob
 import os
 
-from mtpy.core.edi import Edi
-from tests import TEST_MTPY_ROOT, make_temp_dir
+import numpy as np
+
+from mtpy.core.edi import Edi, write_edi_files
+from tests import EDI_DATA_DIR, TEST_MTPY_ROOT, make_temp_dir
 
 
 def test_read_write():
@@ -22,5 +25,54 @@ def test_read_write():
     print(ret_edi)
 
 
+def _write_data_block_by_value(edi_obj, data_comp_arr, data_key):
+    """reference writer, one value at a time"""
+    lines = []
+    for d_index, d_comp in enumerate(data_comp_arr, 1):
+        if d_comp == 0.0 and data_key.lower() not in ['zrot', 'trot']:
+            d_comp = float(edi_obj.Header.empty)
+        num_str = '{0:{1}}'.format(d_comp, edi_obj._num_format)
+        if d_index % edi_obj._block_len == 0:
+            num_str += '\n'
+        if d_index == data_comp_arr.size:
+            num_str += '\n'
+        lines.append(num_str)
+    return ''.join(lines)
+
+
+def test_write_data_block():
+    edi_obj = Edi(edi_fn=sorted(glob.glob(os.path.join(EDI_DATA_DIR, '*.edi')))[0])
+    z = edi_obj.Z.z.copy()
+    z[::5] = 0
+    for data_arr, data_key in [(edi_obj.Z.freq, 'freq'),
+                               (edi_obj.Z.freq[:6], 'freq'),
+                               (edi_obj.Z.freq[:0], 'freq'),
+                               (np.zeros(7), 'zrot'),
+                               (z[:, 0, 1].real, 'zxyr'),
+                               (z[:, 1, 0].imag, 'zyxi')]:
+        block = edi_obj._write_data_block(data_arr, data_key)
+        assert ''.join(block[1:]) == \
+            _write_data_block_by_value(edi_obj, data_arr, data_key)
+
+
+def test_write_edi_files():
+    output_dir = make_temp_dir(__name__ + '_write_edi_files')
+    edi_fn_list = sorted(glob.glob(os.path.join(EDI_DATA_DIR, '*.edi')))[:4]
+
+    seq_fn_list = [Edi(edi_fn=fn).write_edi_file(
+                   new_edi_fn=os.path.join(output_dir, 'seq_' + os.path.basename(fn)))
+                   for fn in edi_fn_list]
+    new_fn_list = write_edi_files([Edi(edi_fn=fn) for fn in edi_fn_list],
+                                  [os.path.join(output_dir, os.path.basename(fn))
+                                   for fn in edi_fn_list], n_threads=2)
+
+    for seq_fn, new_fn in zip(seq_fn_list, new_fn_list):
+        with open(seq_fn) as fid:
+            seq_lines = [line for line in fid if 'FILEDATE' not in line]
+        with open(new_fn) as fid:
+            new_lines = [line for line in fid if 'FILEDATE' not in line]
+        assert seq_lines == new_lines
+
+
 if __name__ == "__main__":
     test_read_write()
@@ -0,0 +1,90 @@
+from unittest import TestCase
+import os
+
+import numpy as np
+
+from tests import TEST_MTPY_ROOT, make_temp_dir
+from mtpy.core.jfile import JFile
+
+
+class TestJFile(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+        cls.j_fn = os.path.join(TEST_MTPY_ROOT,
+                                'examples/birrp_processing/birrp_wd/BP02.j')
+
+    def _read_block(self, j_fn, comp):
+        """read a component block line by line"""
+        with open(j_fn, 'r', errors='replace') as fid:
+            lines = fid.readlines()
+        start = [ii for ii, line in enumerate(lines)
+                 if line.startswith(comp.upper())][0]
+        num_per = int(lines[start + 1])
+        values = np.array([line.split()[0:4] for line in
+                           lines[start + 2:start + 2 + num_per]], dtype=float)
+        values[values == -999] = 0
+        return values[values[:, 0] != 0]
+
+    def test_read_j_file(self):
+        j_obj = JFile(self.j_fn)
+        for comp, (kk, ll) in [('zxy', (0, 1)), ('zyx', (1, 0))]:
+            values = self._read_block(self.j_fn, comp)
+            p_index = np.argmin(abs(1. / j_obj.Z.freq[None, :] -
+                                    values[:, 0:1]), axis=1)
+            self.assertTrue(np.allclose(1. / j_obj.Z.freq[p_index],
+                                        values[:, 0]))
+            self.assertTrue(np.array_equal(j_obj.Z.z[p_index, kk, ll],
+                                           values[:, 1] + 1j * values[:, 2]))
+            self.assertTrue(np.array_equal(j_obj.Z.z_err[p_index, kk, ll],
+                                           values[:, 3]))
+
+    def test_read_j_file_unreadable_number(self):
+        # a value that can not be read is set to 0 and the rest is kept
+        with open(self.j_fn, 'r', errors='replace') as fid:
+            lines = fid.readlines()
+        start = [ii for ii, line in enumerate(lines)
+                 if line.startswith('ZXY')][0]
+        line_list = lines[start + 2].split()
+        lines[start + 2] = ' '.join(line_list[0:1] + ['*********'] +
+                                    line_list[2:]) + '\n'
+        bad_fn = os.path.join(self._temp_dir, 'BP02_bad.j')
+        with open(bad_fn, 'w') as fid:
+            fid.writelines(lines)
+
+        j_obj = JFile(self.j_fn)
+        j_bad = JFile(bad_fn)
+        p_index = np.argmin(abs(1. / j_bad.Z.freq - float(line_list[0])))
+        self.assertEqual(j_bad.Z.z[p_index, 0, 1],
+                         1j * float(line_list[2]))
+        j_bad.Z.z[p_index, 0, 1] = j_obj.Z.z[p_index, 0, 1]
+        self.assertTrue(np.array_equal(j_bad.Z.z, j_obj.Z.z))
+
+    def test_read_j_file_empty_block(self):
+        # empty ZYY and TZY blocks, the periods are all missing for them
+        with open(self.j_fn, 'r', errors='replace') as fid:
+            lines = fid.readlines()
+        zxy = [ii for ii, line in enumerate(lines)
+               if line.startswith('ZXY')][0]
+        zyy = [ii for ii, line in enumerate(lines)
+               if line.startswith('ZYY')][0]
+        num_per = int(lines[zyy + 1])
+        tipper_lines = ['TZX\n'] + lines[zxy + 1:zxy + 2 + num_per] + \
+            ['TZY\n', '0\n']
+        lines = lines[:zyy] + ['ZYY S.I.\n', '0\n'] + tipper_lines + \
+            lines[zyy + 2 + num_per:]
+        empty_fn = os.path.join(self._temp_dir, 'BP02_empty.j')
+        with open(empty_fn, 'w') as fid:
+            fid.writelines(lines)
+
+        j_obj = JFile(self.j_fn)
+        j_empty = JFile(empty_fn)
+        self.assertTrue(np.array_equal(j_empty.Z.freq, j_obj.Z.freq))
+        self.assertTrue(np.all(j_empty.Z.z[:, 1, 1] == 0))
+        self.assertTrue(np.array_equal(j_empty.Z.z[:, :, 0],
+                                       j_obj.Z.z[:, :, 0]))
+        self.assertTrue(np.array_equal(j_empty.Z.z[:, 0, 1],
+                                       j_obj.Z.z[:, 0, 1]))
+        self.assertTrue(np.array_equal(j_empty.Tipper.tipper[:, 0, 0],
+                                       j_obj.Z.z[:, 0, 1]))
+        self.assertTrue(np.all(j_empty.Tipper.tipper[:, 0, 1] == 0))
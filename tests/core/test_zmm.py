@@ -0,0 +1,82 @@
+from unittest import TestCase
+import os
+
+import numpy as np
+
+from tests import make_temp_dir
+from mtpy.core.zmm import ZMM
+
+
+class TestZMM(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        self.num_freq = 3
+        self.channels = [('Hx', 0.), ('Hy', 90.), ('Hz', 0.), ('Ex', 0.),
+                         ('Ey', 90.)]
+        n_out = len(self.channels) - 2
+        values = np.arange(1, 1 + self.num_freq * 2 *
+                           (2 * n_out + 3 + n_out * (n_out + 1) // 2))
+        self.values = (values * .25).reshape(self.num_freq, -1)
+        self.z_fn = os.path.join(self._temp_dir, 'test.zmm')
+        self._write_zmm()
+
+    def _write_zmm(self):
+        n_out = len(self.channels) - 2
+        lines = ['**** IMPEDANCE IN MEASUREMENT COORDINATES ****',
+                 '********** WITH FULL ERROR COVARINCE*********',
+                 'Robust Remote Reference',
+                 'station :300',
+                 'coordinate   32.000  -116.000  declination   13.00',
+                 'number of channels   {0}   number of frequencies   {1}'.format(
+                     len(self.channels), self.num_freq),
+                 ' orientations and tilts of each channel ']
+        for ii, (comp, azm) in enumerate(self.channels, 1):
+            lines.append('    {0}    {1:5.2f}     0.00 300  {2}'.format(ii, azm, comp))
+        lines.append('')
+
+        # complex values per line of transfer functions, signal power and
+        # residual covariance
+        line_len = [2] * n_out + [1, 2] + list(range(1, n_out + 1))
+        for ff in range(self.num_freq):
+            lines += ['period :      {0:.5f}    decimation level   1    '
+                      'freq. band from   46 to   80'.format(.01 * (ff + 1)),
+                      'number of data point  951173 sampling freq.   0.004 Hz']
+            values = list(self.values[ff])
+            for ll, num in enumerate(line_len):
+                if ll == 0:
+                    lines.append('  Transfer Functions')
+                elif ll == n_out:
+                    lines.append('    Inverse Coherent Signal Power Matrix')
+                elif ll == n_out + 2:
+                    lines.append('  Residual Covaraince')
+                lines.append(''.join([' {0:11.4E}'.format(values.pop(0))
+                                      for ii in range(2 * num)]))
+        with open(self.z_fn, 'w') as fid:
+            fid.write('\n'.join(lines) + '\n')
+
+    def test_read_zmm_file(self):
+        zmm_obj = ZMM(self.z_fn)
+        zmm_obj.read_zmm_file()
+
+        self.assertTrue(np.allclose(zmm_obj.period,
+                                    .01 * np.arange(1, self.num_freq + 1)))
+        tf = self.values[:, 0:12:2] + 1j * self.values[:, 1:12:2]
+        self.assertTrue(np.array_equal(zmm_obj.transfer_functions,
+                                       tf.reshape(self.num_freq, 3, 2)))
+
+        sig = self.values[:, 12:18:2] + 1j * self.values[:, 13:18:2]
+        self.assertTrue(np.array_equal(zmm_obj.sigma_s[:, 1, 0], sig[:, 1]))
+        self.assertTrue(np.array_equal(zmm_obj.sigma_s[:, 0, 1], sig[:, 1]))
+        self.assertTrue(np.array_equal(zmm_obj.sigma_s[:, 1, 1], sig[:, 2]))
+
+        res = self.values[:, 18::2] + 1j * self.values[:, 19::2]
+        self.assertTrue(np.array_equal(zmm_obj.sigma_e[:, 2, 1], res[:, 4]))
+        self.assertTrue(np.array_equal(zmm_obj.sigma_e[:, 1, 2],
+                                       res[:, 4].conjugate()))
+        self.assertTrue(np.array_equal(zmm_obj.sigma_e[:, 2, 2], res[:, 5]))
+
+        self.assertEqual(zmm_obj.Z.z.shape, (self.num_freq, 2, 2))
+        self.assertEqual(zmm_obj.Tipper.tipper.shape, (self.num_freq, 1, 2))
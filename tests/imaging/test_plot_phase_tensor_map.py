@@ -14,6 +14,9 @@ phase_tensor_map object then set the properties then run redraw_plot.
 import os
 import os.path as op
 
+import numpy as np
+from matplotlib.patches import FancyArrow
+
 #import legacy.plotptmaps as pptmaps
 import mtpy.imaging.phase_tensor_maps as pptmaps
 from mtpy.core.mt import MT
@@ -142,3 +145,48 @@ class test_plotPhaseTensorMaps(ImageTestCase):
         if save:
             phase_tensor_map.save_figure(savepath, close_plot='n')
             assert (os.path.exists(savepath))
+
+    def test_update_plot_freq(self):
+        """
+        changing the frequency of a plotted map gives the same collections
+        as plotting that frequency
+        """
+        elst = [op.join(EDI_DATA_DIR, f) for f in os.listdir(EDI_DATA_DIR) if f.endswith('.edi')]
+        mtlist = [MT(ff) for ff in elst]
+        kwargs = dict(mt_object_list=mtlist, interpolate=False, plot_tipper='yri',
+                      ellipse_size=.02, ellipse_colorby='skew_seg',
+                      ellipse_range=(-9, 9, 3), ellipse_cmap='mt_seg_bl2wh2rd',
+                      arrow_size=.05, arrow_lw=.002, arrow_head_width=.006,
+                      arrow_head_length=.006, plot_yn='n')
+
+        phase_tensor_map = pptmaps.PlotPhaseTensorMaps(plot_freq=11.71875, **kwargs)
+        phase_tensor_map.plot(show=False)
+        phase_tensor_map.update_plot_freq(1.953125)
+
+        expected = pptmaps.PlotPhaseTensorMaps(plot_freq=1.953125, fig_num=2, **kwargs)
+        expected.plot(show=False)
+
+        self.assertEqual(phase_tensor_map.ax.get_title(), expected.ax.get_title())
+        for new, old in [(phase_tensor_map.ellipse_collection, expected.ellipse_collection),
+                         (phase_tensor_map.arrow_collections['real'], expected.arrow_collections['real']),
+                         (phase_tensor_map.arrow_collections['imag'], expected.arrow_collections['imag'])]:
+            self.assertTrue(np.allclose(new.get_facecolor(), old.get_facecolor()))
+            self.assertTrue(np.allclose(new.get_offsets(), old.get_offsets()))
+            self.assertEqual(len(new.get_paths()), len(old.get_paths()))
+            for new_path, old_path in zip(new.get_paths(), old.get_paths()):
+                self.assertTrue(np.allclose(new_path.vertices, old_path.vertices))
+        for name in ['_widths', '_heights', '_angles']:
+            self.assertTrue(np.allclose(getattr(phase_tensor_map.ellipse_collection, name),
+                                        getattr(expected.ellipse_collection, name)))
+
+    def test_arrow_verts(self):
+        """
+        arrow polygons are the same as drawn by matplotlib
+        """
+        x, y, dx, dy = np.random.RandomState(0).randn(4, 20)
+        verts = pptmaps.get_arrow_verts(x, y, dx, dy, .1, head_width=.3,
+                                        head_length=.2)
+        for ii in range(x.size):
+            arrow = FancyArrow(x[ii], y[ii], dx[ii], dy[ii], width=.1,
+                               head_width=.3, head_length=.2)
+            self.assertTrue(np.allclose(verts[ii], arrow.get_xy()[:8]))
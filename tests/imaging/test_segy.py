@@ -0,0 +1,119 @@
+#!/bin/env python
+"""
+Description:
+    Tests Segy class
+"""
+
+import os
+from unittest import TestCase
+from mtpy.imaging.seismic import Segy, VelocityModel, _ibm2ieee
+from scipy.interpolate import interp1d
+from tests import make_temp_dir
+import numpy
+
+class Test_Segy(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+        utils = os.path.dirname(__file__)
+        mtpy = os.path.dirname(utils)
+        base = os.path.dirname(mtpy)
+        examples = os.path.join(base, 'examples')
+        data = os.path.join(examples, 'data')
+        ModEM_files = os.path.join(data, 'seismic')
+        cls._s_fn = os.path.join(ModEM_files, 'seismic.sgy')
+        cls._v_fn = os.path.join(ModEM_files, 'stacking_velocities.txt')
+    # end func
+
+    def _write_segy(self, fn, traces, xs, cdps, endian='>', format_code=5):
+        '''
+        write a minimal segy file with IEEE float samples
+        '''
+        ntr, ns = traces.shape
+        bh = numpy.zeros(400, dtype=numpy.uint8)
+        bh[16:18] = numpy.frombuffer(numpy.array(2000, dtype=endian + 'u2').tobytes(), numpy.uint8)
+        bh[20:22] = numpy.frombuffer(numpy.array(ns, dtype=endian + 'u2').tobytes(), numpy.uint8)
+        bh[24:26] = numpy.frombuffer(numpy.array(format_code, dtype=endian + 'i2').tobytes(), numpy.uint8)
+
+        with open(fn, 'wb') as f:
+            f.write(b' ' * 3200)
+            f.write(bh.tobytes())
+            for itr in range(ntr):
+                th = numpy.zeros(240, dtype=numpy.uint8)
+                th[20:24] = numpy.frombuffer(numpy.array(cdps[itr], dtype=endian + 'i4').tobytes(), numpy.uint8)
+                th[72:76] = numpy.frombuffer(numpy.array(xs[itr], dtype=endian + 'i4').tobytes(), numpy.uint8)
+                f.write(th.tobytes())
+                f.write(traces[itr].astype(endian + 'f4').tobytes())
+        # end with
+    # end func
+
+    def test_ibm2ieee(self):
+        ibm = numpy.array([0x42640000, 0xC276A000, 0x00000000, 0x3F100000], dtype=numpy.uint32)
+        self.assertTrue(numpy.array_equal(_ibm2ieee(ibm), [100., -118.625, 0., 2**-8]))
+    # end func
+
+    def test_read_example(self):
+        s = Segy(segy_fn=self._s_fn)
+        self.assertEqual(s._mtraces.shape, (173, 5001))
+        self.assertEqual(len(s.getDistances()), 173)
+        self.assertTrue(numpy.all(numpy.diff(s.getDistances()) > 0))
+        self.assertTrue(numpy.allclose(s._ts[-1], 20.))
+        self.assertTrue(numpy.all(numpy.isfinite(s.getAttribute('trace', 1e4))))
+
+        s10 = Segy(segy_fn=self._s_fn, pick_every=10)
+        self.assertEqual(s10._mtraces.shape, (18, 5001))
+        self.assertTrue(numpy.array_equal(s10._cdps, s._cdps[::10]))
+        self.assertTrue(numpy.array_equal(s10.getAttribute('trace', 0), s.getAttribute('trace', 0)))
+    # end func
+
+    def test_read_ieee(self):
+        ntr, ns = 7, 11
+        traces = numpy.arange(ntr * ns, dtype=numpy.float32).reshape(ntr, ns) - 20.5
+        xs = numpy.array([0, 10, 20, 20, 35, 40, 50])
+        cdps = numpy.arange(ntr) + 100
+        for endian in ['>', '<']:
+            fn = os.path.join(self._temp_dir, 'synthetic%s.sgy' % ('be' if endian == '>' else 'le'))
+            self._write_segy(fn, traces, xs, cdps, endian=endian)
+
+            s = Segy(segy_fn=fn)
+            self.assertTrue(numpy.array_equal(s._getTraces(numpy.arange(ntr)), traces))
+            self.assertTrue(numpy.array_equal(s.getDistances(), xs))
+            self.assertTrue(numpy.array_equal(s._cdps, cdps))
+            self.assertTrue(numpy.allclose(s._ts, numpy.arange(ns) * 2e-3))
+            # closest trace, the first of traces at the same distance
+            for dist, idx in [(0, 0), (4, 0), (5, 0), (6, 1), (20, 2), (27, 2), (28, 4), (50, 6)]:
+                self.assertEqual(s.getAttribute('cdp', dist), cdps[idx])
+                self.assertTrue(numpy.array_equal(s.getAttribute('trace', dist), traces[idx]))
+            # end for
+        # end for
+    # end func
+
+    def test_migrated_profile(self):
+        s = Segy(segy_fn=self._s_fn)
+        v = VelocityModel(self._v_fn, ni=20)
+
+        ts = s.getAttribute('ts', 0)
+        for velocity_model, nn in [(6000, 1), (v, 5), (v, -1)]:
+            mdepths, mdistances, mvals, xy_list = s.getMigratedProfile(velocity_model, ntraces=50,
+                                                                     ndepths=200, nn=nn)
+            self.assertEqual(mvals.shape, (50, 200))
+            self.assertEqual(xy_list.shape, (50, 2))
+
+            # compare with interpolating trace by trace
+            for idist in [0, 17, 49]:
+                dist = mdistances[idist, 0]
+                amps = s.getAttribute('trace', dist)
+                if (nn == 1):
+                    ds = ts * velocity_model
+                else:
+                    cdp = None if nn == -1 else s.getAttribute('cdp', dist)
+                    ds = v.getDepth(cdp, ts, nn)
+                # end if
+                io = interp1d(ds, amps, bounds_error=False, fill_value=-9999)
+                self.assertTrue(numpy.allclose(mvals[idist], io(mdepths[idist])))
+                self.assertEqual(xy_list[idist, 0], s.getAttribute('x', dist))
+            # end for
+        # end for
+    # end func
+# end class
@@ -93,4 +93,36 @@ class Test_VelocityModel(TestCase):
         print('Mean interval velocity for all cdps: %f; std: %f'%(mean, std))
         self.assertLessEqual(mean, 6e3, 'Mean velocity exceeds 6000 m/s')
     # end func
+
+    def test_batch_depths(self):
+        utils = os.path.dirname(__file__)
+        mtpy = os.path.dirname(utils)
+        base = os.path.dirname(mtpy)
+        examples = os.path.join(base, 'examples')
+        data = os.path.join(examples, 'data')
+        ModEM_files = os.path.join(data, 'seismic')
+        v_fn = os.path.join(ModEM_files, 'stacking_velocities.txt')
+
+        v = VelocityModel(v_fn, ni=50)
+
+        print('\n Testing batched depth lookups\n')
+        ts = numpy.linspace(0, 20, 100) # up to 20 s
+        for nn in [1, 5]:
+            depths = v.getDepths(v._cdps, ts, nn=nn)
+            self.assertEqual(depths.shape, (len(v._cdps), len(ts)))
+            for icdp, cdp in enumerate(v._cdps):
+                self.assertTrue(numpy.allclose(depths[icdp], v.getDepth(cdp, ts, nn)))
+        # end for
+
+        # different time samples for each cdp
+        mts = numpy.outer(numpy.linspace(0.5, 1, len(v._cdps)), ts)
+        depths = v.getDepths(v._cdps, mts)
+        for icdp, cdp in enumerate(v._cdps):
+            self.assertTrue(numpy.allclose(depths[icdp], v.getDepth(cdp, mts[icdp])))
+        # end for
+
+        # depths increase with time, starting from the surface
+        self.assertTrue(numpy.all(numpy.diff(depths, axis=1) > 0))
+        self.assertTrue(numpy.all(depths[:, 0] == 0))
+    # end func
 # end class
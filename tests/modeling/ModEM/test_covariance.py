@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Test reading and writing ModEM covariance files
+"""
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.modeling.modem import Covariance
+from mtpy.modeling.modem.convariance import encode_mask_rle, decode_mask_rle
+from tests import make_temp_dir
+
+
+class TestCovariance(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        self.mask_arr = np.ones((7, 5, 4), dtype=int)
+        self.mask_arr[:, :, 0] = 0
+        self.mask_arr[0:3, 1:4, 1] = 9
+        self.mask_arr[6, 4, 3] = 2
+
+    def test_write_read(self):
+        cov_fn = os.path.join(self._temp_dir, 'covariance.cov')
+        cov = Covariance(grid_dimensions=self.mask_arr.shape)
+        cov.mask_arr = self.mask_arr.copy()
+        cov.write_covariance_file(cov_fn=cov_fn)
+
+        # masks are written south to north, one formatted value per cell
+        with open(cov_fn) as fid:
+            lines = fid.readlines()
+        block_start = lines.index(' {0:<8.0f}{0:<8.0f}\n'.format(2))
+        for nn in range(self.mask_arr.shape[0]):
+            self.assertEqual(lines[block_start + 1 + nn],
+                             ''.join(['{0:^3.0f}'.format(value) for value in
+                                      self.mask_arr[-1 - nn, :, 1]]) + '\n')
+
+        cov_read = Covariance()
+        cov_read.read_cov_file(cov_fn)
+        self.assertEqual(cov_read.grid_dimensions, self.mask_arr.shape)
+        self.assertTrue(np.array_equal(cov_read.mask_arr, self.mask_arr))
+
+    def test_mask_rle(self):
+        values, run_lengths = encode_mask_rle(self.mask_arr)
+        self.assertEqual(run_lengths.sum(), self.mask_arr.size)
+        self.assertTrue(np.all(values[1:] != values[:-1]))
+        self.assertTrue(np.array_equal(
+            decode_mask_rle(values, run_lengths, self.mask_arr.shape),
+            self.mask_arr))
+
+        cov = Covariance()
+        cov.set_mask_rle(values, run_lengths, self.mask_arr.shape)
+        self.assertTrue(np.array_equal(cov.mask_arr, self.mask_arr))
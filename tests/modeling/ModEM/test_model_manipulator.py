@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Test the undo stack used to edit ModEM resistivity models
+"""
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.modeling.modem import ModelEditHistory
+
+
+class TestModelEditHistory(TestCase):
+    def setUp(self):
+        self.res_model = np.arange(4 * 5 * 6, dtype=float).reshape(4, 5, 6)
+        self.original = self.res_model.copy()
+
+    def test_undo_in_order(self):
+        history = ModelEditHistory()
+        history.set(self.res_model, np.ix_([1, 2], [0, 3, 4], [2]), 100.)
+        first_edit = self.res_model.copy()
+        history.set(self.res_model, np.s_[:, :, 3:5], self.res_model[:, :, 2:3])
+
+        self.assertEqual(len(history), 2)
+        self.assertTrue(np.all(self.res_model[1:3, [0, 3, 4], 3:5] == 100.))
+
+        history.undo(self.res_model)
+        self.assertTrue(np.array_equal(self.res_model, first_edit))
+        history.undo(self.res_model)
+        self.assertTrue(np.array_equal(self.res_model, self.original))
+        self.assertIsNone(history.undo(self.res_model))
+
+    def test_bounded(self):
+        # each edit of a whole layer keeps 20 floats
+        history = ModelEditHistory(max_edits=10, max_bytes=3 * 20 * 8)
+        for zz in range(6):
+            history.set(self.res_model, np.s_[:, :, zz], -1.)
+
+        self.assertEqual(len(history), 3)
+        while history.undo(self.res_model) is not None:
+            pass
+        self.assertTrue(np.all(self.res_model[:, :, 0:3] == -1.))
+        self.assertTrue(np.array_equal(self.res_model[:, :, 3:],
+                                       self.original[:, :, 3:]))
@@ -8,7 +8,7 @@ import glob
 import os
 from unittest import TestCase
 import numpy as np
-from mtpy.modeling.modem import Residual
+from mtpy.modeling.modem import Residual, ResidualIterations
 from tests import make_temp_dir, SAMPLE_DIR
 
 
@@ -185,4 +185,27 @@ class TestResidual(TestCase):
         assert(np.all(np.abs(self.residual_object.rms_array['rms_tip_period'][self.sidx] - \
                              expected_rms_by_period_tip) < 1e-6))
         assert(np.all(np.abs(self.residual_object.rms_array['rms_period'][self.sidx] - \
-                             expected_rms_by_period) < 1e-6))
\ No newline at end of file
+                             expected_rms_by_period) < 1e-6))
+
+    def test_residual_iterations(self):
+        data_fn = os.path.join(self._model_dir, 'ModEM_Data.dat')
+        resp_fn = os.path.join(self._model_dir, 'Modular_MPI_NLCG_004.dat')
+
+        rms_iterations = ResidualIterations(data_fn, n_processes=1)
+        self.assertEqual(rms_iterations.get_resp_fn_list(), [resp_fn])
+        rms_iterations.get_rms()
+
+        residual = Residual()
+        residual.calculate_residual_from_data(data_fn=data_fn, resp_fn=resp_fn,
+                                              save=False)
+        self.assertTrue(np.isclose(rms_iterations.rms[0], residual.rms))
+        self.assertTrue(np.isclose(rms_iterations.rms_z[0], residual.rms_z))
+        self.assertTrue(np.isclose(rms_iterations.rms_tip[0], residual.rms_tip))
+        self.assertTrue(np.allclose(rms_iterations.rms_array[0]['rms_period'],
+                                    residual.rms_array['rms_period'],
+                                    equal_nan=True))
+
+        # unchanged response files are not read again
+        residual_list = rms_iterations.residual_list
+        rms_iterations.get_rms()
+        self.assertIs(residual_list[0], rms_iterations.residual_list[0])
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Test the Occam2D mesh files, regularization grid and model blocks against
+building them one block at a time
+"""
+import contextlib
+import io
+import os
+from unittest import TestCase
+
+import numpy as np
+
+import mtpy.modeling.occam2d as occam2d
+from tests import SAMPLE_DIR, make_temp_dir
+
+
+def _merge_columns(columns, widths, thickness, trigger):
+    """
+    merge neighbouring model blocks one at a time
+    """
+    columns = list(columns)
+    widths = list(widths)
+    block_index = 1
+    while block_index + 1 < len(columns) - 1:
+        if thickness < trigger * (widths[block_index] +
+                                  widths[block_index + 1]):
+            block_index += 1
+        else:
+            widths[block_index] += widths.pop(block_index + 1)
+            columns[block_index] += columns.pop(block_index + 1)
+    return columns, widths
+
+
+class TestOccam2DRegularization(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def _build(self, station_locations, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            reg = occam2d.Regularization(station_locations, **kwargs)
+            reg.build_mesh()
+            reg.build_regularization()
+        return reg
+
+    def test_merge_blocks(self):
+        rng = np.random.RandomState(0)
+        columns = np.array([7] + [2] * 200 + [7])
+        widths = np.hstack([1e5, rng.uniform(10, 500, 200), 1e5])
+        for thickness in [10., 100., 1000., 1e4, 1e6]:
+            merged_columns, merged_widths = _merge_columns(columns, widths,
+                                                           thickness, 0.75)
+            reg = occam2d.Regularization(trigger=0.75)
+            new_columns, new_widths = reg._merge_blocks(columns, widths,
+                                                        thickness)
+            self.assertEqual(new_columns.tolist(), merged_columns)
+            self.assertTrue(np.array_equal(new_widths, merged_widths))
+
+    def test_build_regularization(self):
+        reg = self._build(np.linspace(0, 20000, 37), n_layers=57,
+                          cell_width=150)
+        model_thickness = np.hstack([[reg.z_nodes[:2].sum()],
+                                     reg.z_nodes[2:-reg.num_z_pad_cells],
+                                     [reg.z_nodes[-reg.num_z_pad_cells:].sum()]])
+        columns = reg.model_columns[0]
+        widths = None
+        self.assertEqual(len(reg.model_columns), model_thickness.shape[0])
+        for zz, thickness in enumerate(model_thickness):
+            if widths is None:
+                widths = [reg.x_nodes[:reg.num_x_pad_cells].sum()] + \
+                    [reg.x_nodes[ii:ii + 2].sum() for ii in
+                     range(reg.num_x_pad_cells,
+                           reg.x_nodes.shape[0] - reg.num_x_pad_cells, 2)] + \
+                    [reg.x_nodes[-reg.num_x_pad_cells:].sum()]
+                columns = [reg.num_x_pad_cells] + [2] * (len(widths) - 2) + \
+                    [reg.num_x_pad_cells]
+            columns, widths = _merge_columns(columns, widths, thickness,
+                                             reg.trigger)
+            self.assertEqual(reg.model_columns[zz], columns)
+            self.assertEqual(reg.model_rows[zz][1], len(columns))
+            self.assertEqual(sum(reg.model_columns[zz]), reg.x_nodes.shape[0])
+        self.assertEqual(sum([row[0] for row in reg.model_rows]),
+                         reg.z_nodes.shape[0])
+        self.assertEqual(reg.num_param,
+                         sum([len(col) for col in reg.model_columns]))
+        self.assertEqual(reg.num_free_param, reg.num_param)
+
+    def test_num_free_params(self):
+        station_locations = np.linspace(0, 5000, 11)
+        elevation = np.array([station_locations,
+                              50 * np.sin(station_locations / 1000.) + 100])
+        reg = self._build(station_locations, n_layers=40, cell_width=200,
+                          elevation_profile=elevation)
+        self.assertTrue((reg.mesh_values == reg.air_key).any())
+
+        num_free_param = 0
+        row_count = 0
+        for col, row in zip(reg.model_columns, reg.model_rows):
+            col_count = 0
+            for cc in col:
+                model_block = reg.mesh_values[row_count:row_count + row[0],
+                                              col_count:col_count + cc, :]
+                if (model_block == '?').all():
+                    num_free_param += 1
+                col_count += cc
+            row_count += row[0]
+        self.assertEqual(reg.num_free_param, num_free_param)
+        self.assertLess(reg.num_free_param, reg.num_param)
+
+    def test_mesh_file(self):
+        # 49 vertical nodes leave a single node on the last line, 64
+        # horizontal and 40 vertical nodes fill the last line
+        for ii, (num_stations, n_layers) in enumerate([(24, 49), (17, 40)]):
+            reg = self._build(np.linspace(0, 10000, num_stations),
+                              n_layers=n_layers, cell_width=200)
+            reg.mesh_values[3:5, 1, 2] = '0'
+            with contextlib.redirect_stdout(io.StringIO()):
+                reg.write_mesh_file(save_path=self._temp_dir,
+                                    basename='mesh_{0}'.format(ii))
+                mesh = occam2d.Mesh()
+                mesh.read_mesh_file(reg.mesh_fn)
+            self.assertTrue(np.array_equal(mesh.x_nodes,
+                                           np.round(reg.x_nodes, 1)))
+            self.assertTrue(np.array_equal(mesh.z_nodes,
+                                           np.round(reg.z_nodes, 1)))
+            self.assertTrue(np.array_equal(mesh.mesh_values, reg.mesh_values))
+
+        mesh_fn = os.path.join(SAMPLE_DIR, 'Occam2d', 'Occam2DMesh')
+        with contextlib.redirect_stdout(io.StringIO()):
+            mesh.read_mesh_file(mesh_fn)
+            mesh.write_mesh_file(save_path=self._temp_dir)
+        with open(mesh_fn) as fid_expected, open(mesh.mesh_fn) as fid:
+            self.assertEqual(fid.read(), fid_expected.read())
+
+    def test_build_model(self):
+        iter_fn = os.path.join(SAMPLE_DIR, 'Occam2d', 'ITER12.iter')
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = occam2d.Model(iter_fn)
+            model.build_model()
+            reg = occam2d.Regularization()
+            reg.read_regularization_file(model.model_fn)
+            reg.read_mesh_file(reg.mesh_fn)
+
+        self.assertEqual(model.model_values.shape[0], model.param_count)
+        res_model = np.zeros((reg.z_nodes.shape[0], reg.x_nodes.shape[0]))
+        mm = 0
+        ny1 = 0
+        for row, col in zip(reg.model_rows, reg.model_columns):
+            nx1 = 0
+            for cc in col:
+                res_model[ny1:ny1 + row[0], nx1:nx1 + cc] = \
+                    model.model_values[mm]
+                nx1 += cc
+                mm += 1
+            ny1 += row[0]
+        self.assertEqual(mm, model.param_count)
+        self.assertTrue(np.array_equal(model.res_model, res_model[::-1]))
+        self.assertTrue(np.allclose(model.plot_z,
+                                    np.cumsum(reg.z_nodes)[::-1] -
+                                    reg.z_nodes[0]))
+
+    def test_read_iter_file_bad_values(self):
+        iter_fn = os.path.join(SAMPLE_DIR, 'Occam2d', 'ITER12.iter')
+        with open(iter_fn) as fid:
+            lines = fid.readlines()
+        p_index = [ii for ii, line in enumerate(lines)
+                   if line.lower().startswith('param')][0]
+
+        bad_lines = list(lines)
+        bad_lines[p_index + 3] = bad_lines[p_index + 3].replace(
+            bad_lines[p_index + 3].split()[1], '*******', 1)
+        short_lines = lines[:-1]
+        for name, i_lines in [('bad', bad_lines), ('short', short_lines)]:
+            bad_fn = os.path.join(self._temp_dir,
+                                  'ITER12_{0}.iter'.format(name))
+            with open(bad_fn, 'w') as fid:
+                fid.writelines(i_lines)
+            model = occam2d.Model(bad_fn)
+            self.assertRaises(occam2d.OccamInputError, model.read_iter_file)
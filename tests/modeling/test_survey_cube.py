@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+TEST mtpy.modeling.survey_cube
+
+"""
+import glob
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.core.mt import MT
+import mtpy.modeling.occam2d as occam2d
+from mtpy.modeling.survey_cube import SurveyCube
+from tests import EDI_DATA_DIR, EDI_DATA_DIR2
+
+
+class Test_SurveyCube(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mt_list = [MT(fn) for fn in
+                       sorted(glob.glob(os.path.join(EDI_DATA_DIR2, "*.edi")))[:6]]
+        cls.freq = np.logspace(-3, 2, 25)
+
+    def _check_station(self, cube_arrays, period_buffer=None):
+        z, z_err, tip, tip_err = cube_arrays
+        for ii, mt_obj in enumerate(self.mt_list):
+            f_index = np.where((self.freq >= mt_obj.Z.freq.min()) &
+                               (self.freq <= mt_obj.Z.freq.max()))[0]
+            new_z, new_t = mt_obj.interpolate(self.freq[f_index],
+                                              period_buffer=period_buffer)
+            self.assertTrue(np.allclose(z[ii, f_index], new_z.z))
+            self.assertTrue(np.allclose(z_err[ii, f_index], new_z.z_err))
+            self.assertTrue(np.allclose(tip[ii, f_index], new_t.tipper))
+            self.assertTrue(np.allclose(tip_err[ii, f_index], new_t.tipper_err))
+
+    def test_interpolate_matches_mt(self):
+        cube = SurveyCube(self.mt_list)
+        mask = np.array([(self.freq >= mt_obj.Z.freq.min()) &
+                         (self.freq <= mt_obj.Z.freq.max())
+                         for mt_obj in self.mt_list])
+        self._check_station(cube.interpolate(self.freq, freq_mask=mask))
+        self._check_station(cube.interpolate(self.freq, period_buffer=1.5,
+                                             freq_mask=mask),
+                            period_buffer=1.5)
+
+    def test_interpolate_cache(self):
+        cube = SurveyCube(self.mt_list)
+        z_1 = cube.interpolate(self.freq)[0]
+        self.assertIs(z_1, cube.interpolate(self.freq)[0])
+        cube.reset_cache()
+        self.assertIsNot(z_1, cube.interpolate(self.freq)[0])
+
+    def test_res_phase(self):
+        cube = SurveyCube(self.mt_list)
+        z, z_err = cube.interpolate(self.freq)[:2]
+        res, phase, res_err = cube.get_res_phase(z, z_err, self.freq)
+        mt_obj = self.mt_list[0]
+        f_index = np.where((self.freq >= mt_obj.Z.freq.min()) &
+                           (self.freq <= mt_obj.Z.freq.max()))[0]
+        new_z = mt_obj.interpolate(self.freq[f_index])[0]
+        self.assertTrue(np.allclose(res[0, f_index], new_z.resistivity))
+        self.assertTrue(np.allclose(phase[0, f_index], new_z.phase))
+        self.assertTrue(np.allclose(res_err[0, f_index], new_z.resistivity_err))
+
+
+class Test_SurveyCubeReuse(TestCase):
+    def test_occam2d_data_cube(self):
+        edi_list = sorted(glob.glob(os.path.join(EDI_DATA_DIR, "*.edi")))[:5]
+        data_cube = SurveyCube(edi_list)
+        ocd = occam2d.Data(edi_path=EDI_DATA_DIR, data_cube=data_cube)
+
+        # stations in profile order are taken from the cube
+        ocd.edi_list = [ocd._get_mt_obj(edi) for edi in edi_list[::-1]]
+        for edi, mt_obj in zip(ocd.edi_list, data_cube.mt_obj_list[::-1]):
+            self.assertIs(edi, mt_obj)
+        cube, cube_index = ocd._get_data_cube()
+        self.assertIs(cube, data_cube)
+        self.assertEqual(cube_index.tolist(), [4, 3, 2, 1, 0])
+
+        # a station that is not in the cube gets a new cube
+        ocd.edi_list.append(MT(sorted(glob.glob(os.path.join(EDI_DATA_DIR,
+                                                             "*.edi")))[5]))
+        cube, cube_index = ocd._get_data_cube()
+        self.assertIsNot(cube, data_cube)
+        self.assertIs(ocd.data_cube, cube)
+        self.assertEqual(cube_index.tolist(), list(range(6)))
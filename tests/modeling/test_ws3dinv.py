@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Test reading and writing ws3dinv data, initial and model files
+"""
+import contextlib
+import glob
+import io
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.modeling.ws3dinv import WSData, WSMesh, WSModel, WSResponse
+from tests import EDI_DATA_DIR, make_temp_dir
+
+
+class TestWSFiles(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+
+    def _make_data(self, n_stations, n_periods):
+        z_shape = (n_periods, 2, 2)
+        wsdata = WSData(units='ohm', z_err=0.05, z_err_map=[10, 1, 1, 10])
+        wsdata.period_list = np.logspace(-2, 3, n_periods)
+        wsdata.data = np.zeros(n_stations,
+                               dtype=[('station', '|S10'),
+                                      ('east', np.float),
+                                      ('north', np.float),
+                                      ('z_data', (np.complex, z_shape)),
+                                      ('z_data_err', (np.complex, z_shape)),
+                                      ('z_err_map', (np.complex, z_shape))])
+        wsdata.data['east'] = self.rng.uniform(-5e4, 5e4, n_stations)
+        wsdata.data['north'] = self.rng.uniform(-5e4, 5e4, n_stations)
+        wsdata.data['z_data'] = self.rng.normal(size=(n_stations,) + z_shape) + \
+            1j * self.rng.normal(size=(n_stations,) + z_shape)
+        return wsdata
+
+    def test_data_round_trip(self):
+        data_fn = os.path.join(self._temp_dir, 'WSDataFile.dat')
+        wsdata = self._make_data(23, 7)
+        wsdata.write_data_file(data_fn=data_fn, save_path=data_fn)
+
+        wsdata_read = WSData(units='ohm')
+        wsdata_read.read_data_file(data_fn)
+        self.assertEqual(wsdata_read.n_z, 8)
+        self.assertTrue(np.allclose(wsdata_read.period_list,
+                                    wsdata.period_list, rtol=0, atol=1e-6))
+        for key in ['east', 'north', 'z_data']:
+            self.assertTrue(np.allclose(wsdata_read.data[key],
+                                        wsdata.data[key], rtol=1e-4), key)
+        # the imaginary part of the errors is not flipped when written
+        self.assertTrue(np.allclose(wsdata_read.data['z_data_err'],
+                                    wsdata.data['z_data_err'].conj(),
+                                    rtol=1e-4))
+        self.assertTrue(np.all(wsdata_read.data['z_err_map'][:, :, 0, 0] ==
+                               10 - 10j))
+
+    def test_response_read(self):
+        data_fn = os.path.join(self._temp_dir, 'WSDataFile_resp.dat')
+        wsdata = self._make_data(10, 5)
+        wsdata.write_data_file(data_fn=data_fn, save_path=data_fn)
+
+        # a response file only has the data blocks and iteration information
+        resp_fn = os.path.join(self._temp_dir, 'WSResponse.resp')
+        with open(data_fn) as fid:
+            lines = fid.readlines()
+        n_lines = [ii for ii, line in enumerate(lines)
+                   if line.startswith('ERROR_Period')][0]
+        with open(resp_fn, 'w') as fid:
+            fid.write(''.join(lines[:n_lines]) + '#Iteration No.  3\n')
+
+        wsresp = WSResponse(resp_fn)
+        self.assertEqual(wsresp.z_resp.shape, (10, 5, 2, 2))
+        self.assertTrue(np.allclose(wsresp.z_resp / 796.,
+                                    wsdata.data['z_data'], rtol=1e-4))
+        self.assertTrue(np.allclose(wsresp.station_east,
+                                    wsdata.data['east'], rtol=1e-4))
+
+    def test_initial_round_trip(self):
+        # 10^6 cells
+        n_north, n_east, n_z = 125, 100, 80
+        wsmesh = WSMesh()
+        wsmesh.title = 'test initial model'
+        wsmesh.nodes_north = self.rng.uniform(100, 5000, n_north).round(1)
+        wsmesh.nodes_east = self.rng.uniform(100, 5000, n_east).round(1)
+        wsmesh.nodes_z = self.rng.uniform(10, 2000, n_z).round(1)
+        wsmesh.res_list = [0.3, 3., 30., 300., 3000.]
+        res_model_int = self.rng.randint(1, 6, (n_north, n_east, n_z))
+        # some repeated layers are written as one block
+        res_model_int[:, :, 10:20] = res_model_int[:, :, 10:11]
+        res_model_int[:, :, -5:] = 5
+        wsmesh.res_model = np.array(wsmesh.res_list)[res_model_int - 1]
+        wsmesh.res_model_int = res_model_int
+
+        initial_fn = os.path.join(self._temp_dir, 'WSInitialModel')
+        wsmesh.write_initial_file(initial_fn=initial_fn)
+
+        wsmesh_read = WSMesh()
+        wsmesh_read.read_initial_file(initial_fn)
+        self.assertEqual(wsmesh_read.title, '# TEST INITIAL MODEL')
+        self.assertEqual(wsmesh_read.res_list, wsmesh.res_list)
+        for key in ['nodes_north', 'nodes_east', 'nodes_z', 'res_model',
+                    'res_model_int']:
+            self.assertTrue(np.array_equal(getattr(wsmesh_read, key),
+                                           getattr(wsmesh, key)), key)
+
+    def test_model_read(self):
+        # 10^6 cells
+        n_north, n_east, n_z = 100, 125, 80
+        nodes = [self.rng.uniform(10, 5000, nn).round(1)
+                 for nn in (n_north, n_east, n_z)]
+        res_model = 10 ** self.rng.uniform(-1, 4, (n_north, n_east, n_z))
+
+        # values are written one to a line from the north with north changing
+        # fastest
+        model_fn = os.path.join(self._temp_dir, 'test_model.01')
+        with open(model_fn, 'w') as fid:
+            fid.write('#Iteration No.  1 RMS =  2.3456 Lagrange =  10.0\n')
+            fid.write('{0} {1} {2} 0\n'.format(n_north, n_east, n_z))
+            for node_arr in nodes:
+                for ii in range(0, node_arr.size, 5):
+                    fid.write(''.join(['{0:>12.1f}'.format(nn) for nn in
+                                       node_arr[ii:ii + 5]]) + '\n')
+            fid.write('\n'.join([repr(rr) for rr in
+                                 res_model[::-1].transpose(2, 1, 0).ravel()]))
+            fid.write('\n')
+
+        wsmodel = WSModel(model_fn)
+        self.assertEqual(wsmodel.iteration_number, 1)
+        self.assertEqual(wsmodel.rms, 2.3456)
+        self.assertEqual(wsmodel.lagrange, 10.0)
+        for read_nodes, key in zip(nodes, ['nodes_north', 'nodes_east',
+                                           'nodes_z']):
+            self.assertTrue(np.array_equal(getattr(wsmodel, key), read_nodes))
+        self.assertTrue(np.array_equal(wsmodel.res_model, res_model))
+
+    def test_build_data_cube(self):
+        edi_list = sorted(glob.glob(os.path.join(EDI_DATA_DIR, "*.edi")))[:5]
+        period_list = np.logspace(-3, 1, 12)
+        wsdata = WSData(edi_list=edi_list, period_list=period_list)
+        with contextlib.redirect_stdout(io.StringIO()):
+            wsdata.build_data()
+        data_cube = wsdata.data_cube
+
+        wsdata_cube = WSData(edi_list=edi_list, period_list=period_list,
+                             data_cube=data_cube)
+        with contextlib.redirect_stdout(io.StringIO()):
+            wsdata_cube.build_data()
+            wsdata_cube.build_data()
+        self.assertIs(wsdata_cube.data_cube, data_cube)
+        self.assertTrue(np.allclose(wsdata_cube.data['z_data'],
+                                    wsdata.data['z_data']))
+
+        # a different list of files gets a new cube
+        wsdata_cube.edi_list = edi_list[1:]
+        with contextlib.redirect_stdout(io.StringIO()):
+            wsdata_cube.build_data()
+        self.assertIsNot(wsdata_cube.data_cube, data_cube)
+        self.assertTrue(np.allclose(wsdata_cube.data['z_data'],
+                                    wsdata.data['z_data'][1:]))
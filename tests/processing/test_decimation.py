@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Test streaming decimation against decimating whole time series
+"""
+import os
+from unittest import TestCase
+
+import numpy as np
+import scipy.signal as sps
+
+from mtpy.processing import decimation
+from mtpy.utils import filehandling as MTfh
+from tests import make_temp_dir
+
+
+class TestDecimation(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        self.data = np.random.RandomState(0).normal(size=10007)
+
+    def test_decimate(self):
+        for factor in [1, 2, 3, 10]:
+            data_dec = decimation.decimate(self.data, factor, pad='zeros')
+            if factor > 1:
+                scipy_dec = sps.decimate(self.data, factor, ftype='fir',
+                                         n=20 * factor)
+            else:
+                scipy_dec = self.data
+            self.assertTrue(np.allclose(data_dec, scipy_dec), factor)
+
+        # edge padding keeps a constant signal constant
+        self.assertTrue(np.allclose(decimation.decimate(np.full(95, 5.), 4),
+                                    5.))
+
+    def test_blocks(self):
+        data_dec = decimation.decimate(self.data, 7)
+        decimator = decimation.PolyphaseDecimator(7)
+        for block_len in [1, 13, 1000, 20000]:
+            block_list = [decimator.decimate(self.data[ii:ii + block_len])
+                          for ii in range(0, self.data.size, block_len)]
+            block_list.append(decimator.flush())
+            self.assertTrue(np.allclose(np.concatenate(block_list),
+                                        data_dec), block_len)
+
+    def test_decimate_directory(self):
+        in_dir = os.path.join(self._temp_dir, 'ts')
+        out_dir = os.path.join(self._temp_dir, 'ts_decimated')
+        if not os.path.isdir(in_dir):
+            os.mkdir(in_dir)
+
+        header = {'station': 'mt01', 'channel': 'ex', 'samplingrate': 100.,
+                  't_min': 1234567890., 'nsamples': self.data.size,
+                  'unit': 'mV', 'lat': -30.5, 'lon': 140.25, 'elev': 10.}
+        for ii in range(3):
+            with open(os.path.join(in_dir, 'mt01_{0}.ts'.format(ii)),
+                      'w') as fid:
+                fid.write(MTfh.get_ts_header_string(header))
+                np.savetxt(fid, self.data * (ii + 1), fmt='%.10g')
+        with open(os.path.join(in_dir, 'notes.txt'), 'w') as fid:
+            fid.write('no data here\n')
+
+        results = decimation.decimate_directory(in_dir, out_dir, 10,
+                                                block_len=1000,
+                                                n_processes=2)
+        self.assertEqual([res.status for res in results],
+                         ['decimated'] * 3 + ['failed'])
+
+        data_dec = decimation.decimate(self.data, 10)
+        for ii, res in enumerate(results[:3]):
+            header_dec = MTfh.read_ts_header(res.out_fn)
+            self.assertEqual(header_dec['samplingrate'], 10)
+            self.assertEqual(header_dec['nsamples'], data_dec.size)
+            self.assertEqual(header_dec['t_min'], header['t_min'])
+            self.assertTrue(np.allclose(np.loadtxt(res.out_fn),
+                                        data_dec * (ii + 1), rtol=1e-6))
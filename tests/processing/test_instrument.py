@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Test removing the instrument response by overlap-add against one FFT
+"""
+import os
+from unittest import TestCase
+
+import numpy as np
+import scipy.signal as sps
+
+from mtpy.processing import instrument
+from mtpy.utils import filehandling as MTfh
+from tests import make_temp_dir
+
+
+class TestInstrument(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        # coil like response, flat above 0.5 Hz
+        freq = np.logspace(-3, np.log10(50), 60)
+        response = 400 * (1j * freq / 0.5) / (1 + 1j * freq / 0.5)
+        self.response_data = np.column_stack((freq, response.real,
+                                              response.imag))
+        self.samplingrate = 100.
+
+        rng = np.random.RandomState(0)
+        self.data = 1e4 + 1e-4 * np.arange(400000) + rng.normal(size=400000)
+
+    def test_response(self):
+        response = instrument.InstrumentResponse(self.response_data[::-1])
+        self.assertTrue(np.allclose(
+            response.interpolate(self.response_data[:, 0]),
+            self.response_data[:, 1] + 1j * self.response_data[:, 2]))
+        self.assertTrue(np.all(np.isnan(response.interpolate([1e-4, 60.]))))
+
+        inverse = response.get_inverse(2**12, self.samplingrate)
+        self.assertIs(response.get_inverse(2**12, self.samplingrate), inverse)
+        self.assertEqual(inverse.size, 2**11 + 1)
+        self.assertEqual(inverse[0], 0)
+
+        freq = np.fft.rfftfreq(2**12, 1. / self.samplingrate)
+        middle = (freq > 0.002) & (freq < 25)
+        self.assertTrue(np.allclose(inverse[middle],
+                                    1. / response.interpolate(freq[middle])))
+
+        self.assertRaises(instrument.MTex.MTpyError_inputarguments,
+                          instrument.InstrumentResponse,
+                          self.response_data[:, :2])
+
+    def test_overlap_add(self):
+        corrected = instrument.remove_instrument_response(
+            self.data, self.samplingrate, self.response_data)
+        corrected_fft = instrument.correct_for_instrument_response(
+            sps.detrend(self.data), self.samplingrate, self.response_data)
+
+        self.assertEqual(corrected.size, self.data.size)
+        middle = slice(100000, 300000)
+        self.assertLess(np.std(corrected[middle] - corrected_fft[middle]),
+                        0.01 * np.std(corrected_fft[middle]))
+
+    def test_blocks(self):
+        trend = instrument.get_trend([self.data])
+        self.assertTrue(np.allclose(trend, np.polyfit(
+            np.arange(self.data.size), self.data, 1)[::-1]))
+
+        corrected = instrument.remove_instrument_response(
+            self.data, self.samplingrate, self.response_data,
+            window_len=20000)
+        deconvolver = instrument.ResponseDeconvolver(
+            self.response_data, self.samplingrate, window_len=20000,
+            trend=trend)
+        for block_len in [999, 20000, 123457]:
+            block_list = [deconvolver.correct(self.data[ii:ii + block_len])
+                          for ii in range(0, self.data.size, block_len)]
+            block_list.append(deconvolver.flush())
+            self.assertTrue(np.allclose(np.concatenate(block_list),
+                                        corrected), block_len)
+
+    def test_remove_response_directory(self):
+        in_dir = os.path.join(self._temp_dir, 'ts')
+        out_dir = os.path.join(self._temp_dir, 'ts_true')
+        if not os.path.isdir(in_dir):
+            os.mkdir(in_dir)
+
+        # the second file overlaps the first by 100 samples, the third
+        # starts after a gap
+        data = self.data[:150000]
+        pieces = [(0, 60000), (59900, 120000), (125000, 150000)]
+        header = {'station': 'mt01', 'channel': 'bx',
+                  'samplingrate': self.samplingrate, 'unit': 'mV',
+                  'lat': -30.5, 'lon': 140.25, 'elev': 10.}
+        for ii, (n_start, n_end) in enumerate(pieces):
+            header['t_min'] = 1234567890. + n_start / self.samplingrate
+            header['nsamples'] = n_end - n_start
+            with open(os.path.join(in_dir, 'mt01_{0}.bx'.format(ii)),
+                      'w') as fid:
+                fid.write(MTfh.get_ts_header_string(header))
+                np.savetxt(fid, data[n_start:n_end], fmt='%.10g')
+        header['channel'] = 'ex'
+        with open(os.path.join(in_dir, 'mt01_0.ex'), 'w') as fid:
+            fid.write(MTfh.get_ts_header_string(header))
+            np.savetxt(fid, data[:1000], fmt='%.10g')
+
+        results = instrument.remove_response_directory(
+            in_dir, self.response_data, out_dir=out_dir, window_len=20000,
+            block_len=7000, n_processes=2)
+        self.assertEqual([res.status for res in results], ['corrected'] * 2)
+        self.assertEqual(sorted(os.listdir(out_dir)),
+                         ['mt01_0_true.bx', 'mt01_1_true.bx',
+                          'mt01_2_true.bx'])
+
+        expected = [instrument.remove_instrument_response(
+            data[n_start:n_end], self.samplingrate, self.response_data,
+            window_len=20000) for n_start, n_end in [(0, 120000),
+                                                     (125000, 150000)]]
+        expected = [expected[0][:60000], expected[0][59900:], expected[1]]
+        for ii, corrected in enumerate(expected):
+            fn = os.path.join(out_dir, 'mt01_{0}_true.bx'.format(ii))
+            header_true = MTfh.read_ts_header(fn)
+            self.assertEqual(header_true['unit'], 'mV(true)')
+            self.assertEqual(header_true['nsamples'], corrected.size)
+            self.assertTrue(np.allclose(MTfh.read_ts_data(fn), corrected,
+                                        rtol=1e-6, atol=1e-6))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Test running tasks in a pool of processes
+"""
+from collections import namedtuple
+from unittest import TestCase
+
+from mtpy.processing import tasks
+
+Result = namedtuple('Result', ['task', 'output', 'status', 'error'])
+
+
+def _make_result(task, output, status, error):
+    return Result(task, output, status, error)
+
+
+def _divide(a, b):
+    return a / b
+
+
+class TestTasks(TestCase):
+    def test_run_tasks(self):
+        task_list = [(1., 2.), (3., 0.), (4., 8.)]
+        for n_processes in [1, 2]:
+            results = tasks.run_tasks(_divide, task_list, _make_result,
+                                      'divided', n_processes=n_processes)
+            self.assertEqual([res.task for res in results], task_list)
+            self.assertEqual([res.status for res in results],
+                             ['divided', 'failed', 'divided'])
+            self.assertEqual([res.output for res in results], [.5, None, .5])
+            self.assertIsNone(results[0].error)
+            self.assertIn('ZeroDivisionError', results[1].error)
+
+    def test_run_no_tasks(self):
+        self.assertEqual(tasks.run_tasks(_divide, [], _make_result,
+                                         'divided'), [])
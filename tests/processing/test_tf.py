@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Test the time-frequency distributions against direct computations
+"""
+from unittest import TestCase
+
+import numpy as np
+import scipy.signal as sps
+
+from mtpy.processing import tf
+
+
+class TestTF(TestCase):
+    def setUp(self):
+        t = np.arange(4096) / 100.
+        self.fx = np.sin(2 * np.pi * (2. + .5 * t) * t) + \
+            .1 * np.random.RandomState(0).randn(t.size)
+
+    def test_stft(self):
+        nh, tstep, nfbins = 128, 61, 256
+        tfarray, tlst, flst = tf.stft(self.fx, nh=nh, tstep=tstep, df=100.,
+                                      nfbins=nfbins)
+        self.assertEqual(tfarray.shape, (nfbins // 2, len(tlst)))
+
+        h = tf.normalize_L2(np.hanning(nh))
+        fa = sps.hilbert(tf.dctrend(self.fx))
+        for point, nn in enumerate(tlst):
+            fxwin = np.fft.fft(fa[nn:nn + nh] * h, n=nfbins)[:nfbins // 2]
+            self.assertTrue(np.allclose(tfarray[:, point], fxwin[::-1]))
+
+    def test_smethod(self):
+        L, nfbins = 5, 256
+        tfarray, tlst, flst, pxx = tf.smethod(self.fx, L=L, nh=128, tstep=61,
+                                              nfbins=nfbins)
+        Llst = np.arange(start=-L / 2 + 1, stop=L / 2 + 1, step=1, dtype='int')
+        p = sps.gaussian(L, L / np.sqrt(2 * np.log(2)))
+        for ff in [L // 2, 40, nfbins // 2 - L // 2 - 2]:
+            sm = abs(pxx[ff]) ** 2 + 2 * np.real(
+                np.sum(p[:, np.newaxis] * pxx[ff + Llst] *
+                       pxx[ff - Llst].conj(), axis=0))
+            self.assertTrue(np.allclose(tfarray[ff], sm / L))
+
+    def test_wvd_blocks(self):
+        # the result does not depend on how many windows are done at once
+        tfarray = tf.wvd(self.fx, nh=63, tstep=17, nfbins=128)[0]
+        block_size = tf.BLOCK_SIZE
+        try:
+            tf.BLOCK_SIZE = 128 * 3
+            tfblocks = tf.wvd(self.fx, nh=63, tstep=17, nfbins=128)[0]
+        finally:
+            tf.BLOCK_SIZE = block_size
+        self.assertTrue(np.allclose(tfarray, tfblocks))
@@ -0,0 +1,10008 @@
+# mt01 ex 100.0 1234567890.0 10007 mV -30.5 140.25 10.0 
+1.764052346
+0.4001572084
+0.9787379841
+2.240893199
+1.86755799
+-0.9772778799
+0.9500884175
+-0.1513572083
+-0.1032188518
+0.4105985019
+0.1440435712
+1.454273507
+0.7610377251
+0.1216750165
+0.4438632327
+0.3336743274
+1.494079073
+-0.2051582638
+0.3130677017
+-0.8540957393
+-2.552989816
+0.6536185954
+0.8644361989
+-0.7421650204
+2.269754624
+-1.454365675
+0.0457585173
+-0.18718385
+1.532779214
+1.46935877
+0.1549474257
+0.3781625196
+-0.8877857476
+-1.980796468
+-0.3479121493
+0.1563489691
+1.230290681
+1.202379849
+-0.3873268174
+-0.3023027506
+-1.048552965
+-1.420017937
+-1.706270191
+1.950775395
+-0.5096521818
+-0.4380743016
+-1.25279536
+0.7774903558
+-1.613897848
+-0.2127402802
+-0.8954665612
+0.3869024979
+-0.5108051376
+-1.180632184
+-0.02818222834
+0.4283318705
+0.06651722238
+0.3024718977
+-0.6343220937
+-0.362741166
+-0.6724604478
+-0.3595531615
+-0.813146282
+-1.726282602
+0.1774261423
+-0.4017809362
+-1.630198347
+0.4627822555
+-0.9072983644
+0.0519453958
+0.7290905622
+0.1289829108
+1.139400685
+-1.23482582
+0.4023416412
+-0.6848100909
+-0.8707971492
+-0.5788496648
+-0.3115525321
+0.05616534223
+-1.165149841
+0.900826487
+0.4656624397
+-1.536243686
+1.488252194
+1.895889176
+1.178779571
+-0.1799248358
+-1.070752622
+1.054451727
+-0.403176947
+1.22244507
+0.2082749781
+0.9766390365
+0.3563663972
+0.7065731682
+0.01050002072
+1.785870494
+0.1269120927
+0.4019893634
+1.883150697
+-1.347759061
+-1.270484998
+0.9693967082
+-1.173123405
+1.943621186
+-0.4136189808
+-0.7474548114
+1.922942026
+1.480514791
+1.86755896
+0.9060446583
+-0.8612256851
+1.910064953
+-0.268003371
+0.8024563958
+0.9472519678
+-0.1550100931
+0.6140793703
+0.9222066716
+0.3764255312
+-1.099400791
+0.2982381742
+1.326385897
+-0.6945678597
+-0.1496345403
+-0.4351535517
+1.849263728
+0.672294757
+0.4074618362
+-0.7699160744
+0.5392491913
+-0.6743326607
+0.03183055827
+-0.6358460784
+0.6764332949
+0.5765908166
+-0.2082987556
+0.3960067127
+-1.093061509
+-1.491257593
+0.4393917013
+0.1666734954
+0.6350314369
+2.383144775
+0.944479487
+-0.9128222254
+1.117016288
+-1.315907411
+-0.4615846048
+-0.06824160532
+1.713342722
+-0.744754822
+-0.8264385387
+-0.09845252443
+-0.6634782864
+1.126635922
+-1.079931508
+-1.147468652
+-0.4378200447
+-0.4980324507
+1.929532054
+0.9494208069
+0.08755124139
+-1.225435519
+0.8443629764
+-1.000215347
+-1.544771097
+1.188029792
+0.3169426119
+0.9208588238
+0.3187276529
+0.8568306119
+-0.6510255933
+-1.034242842
+0.6815945183
+-0.8034096642
+-0.6895497778
+-0.4555325035
+0.01747915903
+-0.3539939113
+-1.374951293
+-0.6436184028
+-2.223403152
+0.625231451
+-1.602057656
+-1.104383339
+0.05216507926
+-0.7395629964
+1.543014595
+-1.29285691
+0.2670508693
+-0.03928281823
+-1.168093498
+0.5232766605
+-0.1715463312
+0.7717905512
+0.823504154
+2.163235949
+1.336527949
+-0.3691818379
+-0.2393791776
+1.099659596
+0.6552637307
+0.6401315261
+-1.616956044
+-0.0243261244
+-0.7380309092
+0.279924599
+-0.09815038964
+0.9101789081
+0.3172182152
+0.7863279621
+-0.4664190967
+-0.9444462559
+-0.4100496932
+-0.01702041386
+0.3791517356
+2.259308951
+-0.04225715166
+-0.9559450005
+-0.3459817757
+-0.4635959746
+0.4814814738
+-1.540797014
+0.0632619942
+0.156506538
+0.2321810362
+-0.597316069
+-0.2379217297
+-1.424060909
+-0.4933198834
+-0.542861476
+0.4160500463
+-1.156182432
+0.7811981017
+1.494484544
+-2.069985025
+0.4262587308
+0.676908035
+-0.6374370256
+-0.3972718143
+-0.1328805776
+-0.2977908794
+-0.309012969
+-1.676003806
+1.152331565
+1.079618592
+-0.8133642592
+-1.466424328
+0.5210648765
+-0.5757879698
+0.1419531633
+-0.3193284171
+0.6915387511
+0.6947491437
+-0.7255973785
+-1.383363955
+-1.582938397
+0.6103793791
+-1.188859258
+-0.5068163543
+-0.5963140385
+-0.05256729627
+-1.936279806
+0.1887785968
+0.5238910238
+0.08842208704
+-0.3108861717
+0.09740016627
+0.3990463456
+-2.772592756
+1.955912308
+0.3900933227
+-0.6524085824
+-0.3909533752
+0.4937417773
+-0.116103939
+-2.030684468
+2.064492861
+-0.1105406572
+1.020172712
+-0.6920498478
+1.536377054
+0.2863436889
+0.6088438345
+-1.045253366
+1.21114529
+0.6898181645
+1.30184623
+-0.6280875596
+-0.4810271185
+2.303916698
+-1.060015823
+-0.1359497007
+1.136891363
+0.09772496771
+0.5829536798
+-0.3994490293
+0.3700558878
+-1.306526852
+1.65813068
+-0.1181640451
+-0.680178204
+0.666383082
+-0.4607197874
+-1.334258471
+-1.346717506
+0.6937731527
+-0.1595734381
+-0.1337015597
+1.077743806
+-1.126825809
+-0.7306777529
+-0.3848798092
+0.09435158932
+-0.04217145129
+-0.2868871924
+-0.0616264021
+-0.1073052763
+-0.7196043886
+-0.8129929886
+0.2745163577
+-0.890915083
+-1.157355259
+-0.3122922511
+-0.1576670162
+2.256723497
+-0.7047002759
+0.943260725
+0.7471883342
+-1.188944955
+0.7732529774
+-1.18388064
+-2.659172238
+0.6063195244
+-1.755890583
+0.4509344618
+-0.6840108977
+1.659550796
+1.068509399
+-0.4533858039
+-0.687837611
+-1.214077403
+-0.4409226323
+-0.2803554952
+-0.3646935444
+0.1567038553
+0.5785214977
+0.349654457
+-0.7641439239
+-1.437791474
+1.364531848
+-0.6894491845
+-0.6522935999
+-0.5211893123
+-1.84306955
+-0.477974004
+-0.479655814
+0.6203582983
+0.6984571491
+0.003770889086
+0.9318483741
+0.3399649838
+-0.0156821116
+0.1609281683
+-0.1906534936
+-0.394849514
+-0.2677335369
+-1.128011331
+0.2804417053
+-0.9931236109
+0.8416312641
+-0.2494585802
+0.04949498165
+0.4938367763
+0.6433144651
+-1.570623409
+-0.2069036762
+0.8801789121
+-1.698105819
+0.3872804754
+-2.255564229
+-1.022506844
+0.03863055184
+-1.656715102
+-0.9855107377
+-1.471835007
+1.648134932
+0.1642277555
+0.5672902779
+-0.2226751005
+-0.3534317488
+-1.616474189
+-0.2918373627
+-0.7614922118
+0.8579239243
+1.141101867
+1.466578716
+0.8525519395
+-0.5986539369
+-1.115896986
+0.7666631816
+0.3562928175
+-1.768538451
+0.3554817927
+0.8145198225
+0.05892558918
+-0.185053671
+-0.8076484876
+-1.4465347
+0.8002979493
+-0.3091144448
+-0.2334666615
+1.732721187
+0.6845011069
+0.3708250013
+0.1420618052
+1.519994861
+1.719589307
+0.9295051115
+0.5822245914
+-2.094603071
+0.1237219142
+-0.1301069542
+0.09395322939
+0.9430460873
+-2.739677167
+-0.5693120535
+0.2699043549
+-0.4668455461
+-1.416906113
+0.8689634869
+0.2768719058
+-0.9711045704
+0.3148172045
+0.821585712
+0.005292646299
+0.8005648034
+0.07826017516
+-0.3952289827
+-1.159420516
+-0.08593076697
+0.194292938
+0.8758327616
+-0.1151074685
+0.4574156062
+-0.9646120137
+-0.7826291558
+-0.110389299
+-1.054628464
+0.8202478373
+0.4631303293
+0.2790957644
+0.3389041252
+2.021043561
+-0.468864188
+-2.201441286
+0.1993001969
+-0.05060354096
+-0.5175190425
+-0.9788298594
+-0.4391895218
+0.1813384292
+-0.5028167006
+2.41245368
+-0.9605043816
+-0.7931173627
+-2.28862004
+0.251484415
+-2.016406628
+-0.5394546334
+-0.2756705346
+-0.7097279658
+1.738872677
+0.9943943913
+1.319136876
+-0.8824188185
+1.128594065
+0.4960009463
+0.7714059487
+1.029438829
+-0.908763246
+-0.424317621
+0.8625960113
+-2.655619093
+1.513328083
+0.5531320642
+-0.04570396066
+0.2205076558
+-1.029935283
+-0.3499433646
+1.100284338
+1.298021972
+2.696224053
+-0.07392466628
+-0.6585529668
+-0.5142339659
+-1.018041875
+-0.07785475594
+0.38273243
+-0.03424228053
+1.096346846
+-0.2342158013
+-0.3474506525
+-0.5812684769
+-1.632634526
+-1.567767724
+-1.179157931
+1.301428072
+0.8952602729
+1.374964066
+-1.332211655
+-1.96862469
+-0.6600563201
+0.1758189533
+0.4986902749
+1.047972156
+0.2842796708
+1.742668781
+-0.2226056809
+-0.913079218
+-1.681218215
+-0.8889713581
+0.242117961
+-0.8887202574
+0.9367424635
+1.412327706
+-2.369586905
+0.8640523005
+-2.239604059
+0.4014990551
+1.224870564
+0.06485610634
+-1.279689173
+-0.5854312043
+-0.2616454457
+-0.1822447838
+-0.2028968408
+-0.1098827793
+0.2134800489
+-1.208573654
+-0.2420198299
+1.51826117
+-0.3846454231
+-0.4438360932
+1.078197304
+-2.559184666
+1.181378601
+-0.631903758
+0.1639285725
+0.09632135592
+0.9424681192
+-0.2675947462
+-0.6780257816
+1.297845791
+-2.364173817
+0.02033418171
+-1.347925423
+-0.7615733883
+2.011256681
+-0.04459542646
+0.1950696972
+-1.781562856
+-0.7290446588
+0.1965574007
+0.3547576931
+0.6168865544
+0.008627898918
+0.5270042085
+0.4537819126
+-1.829740411
+0.03700572191
+0.7679024077
+0.5898798207
+-0.36385881
+-0.8056265075
+-1.118311924
+-0.1310540115
+1.13307988
+-1.951804101
+-0.6598917297
+-1.139802455
+0.7849575212
+-0.5543096266
+-0.4706376582
+-0.2169495699
+0.4453932509
+-0.3923889981
+-3.046143055
+0.5433118914
+0.4390429577
+-0.2195410283
+-1.084036621
+0.3517801107
+0.3792355335
+-0.4700328827
+-0.2167314706
+-0.9301565025
+-0.1785890921
+-1.550429345
+0.417318821
+-0.9443684908
+0.2381031478
+-1.405962916
+-0.5900576459
+-0.1104894051
+-1.660699812
+0.1151478731
+-0.3791475629
+-1.742356198
+-1.303242754
+0.6051200841
+0.8955559856
+-0.1319086398
+0.404761812
+0.2238435633
+0.3296229821
+1.285984007
+-1.506998398
+0.6764607324
+-0.3820089556
+-0.2242589343
+-0.3022497305
+-0.3751471167
+-1.226196192
+0.1833391993
+1.670943033
+-0.05613302045
+-0.001385042735
+-0.6872990372
+-0.1174745464
+0.466166426
+-0.3702424407
+-0.4538040411
+0.4032645402
+-0.9180047698
+0.2524966271
+0.8203217973
+1.359948542
+-0.09038200728
+1.36759724
+1.034409886
+-0.9962126404
+-1.217938512
+-0.3049636379
+1.028935493
+-0.07228700756
+-0.6006575577
+1.55224318
+0.286904488
+-2.320594276
+0.3171606263
+0.5200406146
+0.2256086545
+0.4497121002
+-0.06727560892
+-1.31839587
+-0.3707040032
+-0.9456157956
+-0.9327409108
+-1.263068349
+0.4524890926
+0.09789614541
+-0.4481653627
+-0.6493379277
+-0.02342310502
+1.079194728
+-2.004215715
+0.3768765209
+-0.545711974
+-1.884585845
+-1.945703083
+-0.9127834941
+0.2195095558
+0.393062934
+-0.9389815727
+1.017020991
+1.422983497
+0.396086585
+-0.5914026678
+1.124419185
+0.7553956957
+0.8674074114
+-0.656463675
+-2.834554505
+2.116791021
+-1.610878403
+-0.03576807186
+2.380745351
+0.3305767563
+0.9492464736
+-1.502396569
+-1.777666955
+-0.532702792
+1.090749734
+-0.3462494476
+-0.7946363211
+0.1979672899
+1.081935218
+-1.444940199
+-1.210542994
+-0.7886692545
+1.094638375
+0.2348215259
+2.132153411
+0.9364457258
+-0.03509517687
+1.265077838
+0.2114970127
+-0.7049213525
+0.6799748442
+-0.6963266539
+-0.2903971008
+1.327782696
+-0.1012814862
+-0.8031413873
+-0.4643376914
+1.021790586
+-0.5525406734
+-0.3868708469
+-0.5102927396
+0.1839254943
+-0.3854897604
+-1.601836049
+-0.8871809418
+-0.9327890415
+1.243319384
+0.8126740421
+0.5872593794
+-0.5053583173
+-0.815791542
+-0.5075176017
+-1.051880103
+2.497200392
+-2.245321648
+0.5640085351
+-1.284552298
+-0.1043434915
+-0.9880019425
+-1.177628962
+-1.140196301
+1.754986154
+-0.1329884223
+-0.7657021945
+0.5557869641
+0.01034931457
+0.7200337593
+-1.824256656
+0.3036039045
+0.7726948371
+-1.661598291
+0.4481952844
+1.696181573
+-0.01485770335
+0.821405937
+0.6705704503
+-0.7075056975
+0.03976673459
+-1.566994711
+-0.4513030371
+0.265687975
+0.7231004937
+0.02461212525
+0.7199837301
+-1.102906213
+-0.1016972746
+0.01927938451
+1.849591247
+-0.2141666562
+-0.499016638
+0.02135122384
+-0.9191134449
+0.1927538491
+-0.3650552165
+-1.791327548
+-0.05858655113
+-0.3175430939
+-1.632423302
+-0.06713415461
+1.489355962
+0.5213037483
+0.6119271927
+-1.341496726
+0.4768983689
+0.1484495814
+0.5290452383
+0.4226286217
+-1.359780726
+-0.04140081156
+-0.7578708604
+-0.05008409428
+-0.8974009269
+1.312470367
+-0.8589723884
+-0.8989421565
+0.07458640654
+-1.077099069
+-0.4246633024
+-0.8299645975
+1.411172064
+0.7858038268
+-0.05746951847
+-0.3912170522
+0.9409176146
+0.4052040803
+0.4980524047
+-0.02619223734
+-1.688230028
+-0.1124659826
+-0.5324899192
+0.6450552735
+1.011842433
+-0.6579510448
+0.4683852343
+1.735878998
+-0.6677127206
+1.68192174
+-0.8525858472
+0.02295975561
+-0.01114561184
+0.01149889987
+-0.8376780419
+-0.5911831038
+-0.6677202864
+0.3269625954
+0.3300351145
+2.225944332
+1.370989006
+-0.5098432421
+0.3248696158
+0.9971179808
+0.03060182434
+-0.06964157845
+0.05157494277
+0.8672766288
+-0.8483205228
+-0.3256694688
+0.4704331448
+0.3114470716
+0.2395827599
+-0.3698011663
+0.9725357891
+2.133868247
+0.4064154937
+-0.1931767015
+0.7557402889
+-0.5391326368
+-0.7496903447
+0.03280874761
+-2.582796633
+-1.153950364
+-0.3479618559
+-1.353388858
+-1.032643102
+-0.4367483375
+-1.642965294
+-0.4060717963
+-0.5352701645
+0.02540520839
+1.15418403
+0.1725044165
+0.02106202134
+0.09945445703
+0.2273927751
+-1.016738649
+-0.1147753248
+0.3087512418
+-1.370759983
+0.8656529228
+1.081376034
+-0.6313759884
+-0.2413377915
+-0.8781903428
+0.6993804836
+-1.061222287
+-0.2224770102
+-0.8589199078
+0.05095427701
+-1.794229271
+1.326461642
+-0.9646064242
+0.05989468312
+-0.2125230448
+-0.7621145119
+-0.8877801366
+0.9363985436
+-0.5256405931
+0.2711701846
+-0.8014968854
+-0.6471814318
+0.4722471501
+0.9304084961
+-0.1753164023
+-1.421919872
+1.99795608
+-0.8565493082
+-1.5415874
+2.594424588
+-0.4040322939
+-1.461732688
+-0.6834397668
+0.367544896
+0.1903115576
+-0.8517291973
+1.8227236
+-0.521579678
+-1.18468659
+0.9606933985
+1.329062847
+-0.8174930976
+-1.401347293
+1.030438267
+-2.047323613
+-1.226621659
+0.9674461501
+-0.05535254802
+-0.2639373486
+0.3528166065
+-0.1527744235
+-1.298686722
+1.276075346
+1.325014053
+0.2053325638
+0.04513401543
+2.339624806
+-0.276432845
+-0.2595769818
+0.3644812492
+1.471321956
+1.592770754
+-0.2585726317
+0.308331246
+-1.378083467
+-0.3119761079
+-0.8402903955
+-1.006831752
+1.681576716
+-0.7922866618
+-0.531605908
+0.3658487879
+1.297825267
+0.4811151264
+2.759355114
+-0.07466797825
+0.2587164402
+0.275600674
+1.435049387
+0.5072389511
+-0.1162297004
+-0.9474885949
+0.244443456
+1.401344831
+-0.4103817937
+0.5289436184
+0.2461477887
+0.8635196584
+-0.8047537406
+2.346647031
+-1.279161107
+-0.36555109
+0.9380925409
+0.2967331725
+0.8299861591
+-0.496102334
+-0.07480498268
+0.01223198364
+1.569259615
+0.6904290244
+0.7966721084
+-0.6579260925
+0.9688826386
+0.2255816636
+1.389145316
+2.014060155
+-0.306765776
+-0.4063031304
+-0.8640449911
+-0.1435795117
+-0.382025449
+0.3595043996
+-0.1445668169
+-0.3615992808
+1.064585136
+-0.9378802312
+0.4331079532
+-0.4059417272
+0.7243685049
+1.385261547
+-0.3030982534
+0.4410329073
+0.1787928657
+-0.7994223995
+0.2407875097
+0.2891205053
+0.4128708204
+-0.1983988968
+0.09419230031
+-1.147610945
+-0.3581140755
+0.5559626797
+0.8924738873
+-0.4223148241
+0.1047140294
+0.2280533251
+0.2014799467
+0.5407735853
+-1.81807763
+-0.04932407015
+0.2390336012
+-1.000330349
+1.673985707
+0.1615592672
+1.563404745
+-0.7905230218
+-0.9073001215
+0.224252221
+-1.678688363
+0.2149655906
+0.097219232
+1.015665282
+0.7010413412
+-0.4174773499
+-1.097496655
+1.712305221
+-0.7921150206
+-1.045524557
+-1.084856059
+1.117305316
+-0.5189002044
+-0.7537044662
+0.1376898259
+-0.2069447106
+-0.6780954608
+0.753991467
+1.065315492
+0.9853175089
+0.7669196697
+0.4026255311
+-1.775888
+1.669250806
+0.3019892104
+0.6081564276
+1.114962323
+1.433352503
+0.4183980113
+0.4355461593
+-0.5992242775
+0.03308975114
+-0.8541612608
+-0.7199405321
+-0.8935744023
+-0.156023891
+1.049093188
+3.170974773
+0.1894996375
+-1.348413088
+1.26498333
+-0.3007838765
+-0.660608594
+0.2098494779
+-1.2406246
+0.222463164
+-0.0883755232
+0.09837790682
+0.3814162542
+0.06749225724
+0.01633808411
+0.284314519
+0.4154006262
+-1.03148246
+-1.429991259
+-0.06163805217
+-1.43273549
+0.08753147092
+0.9387468757
+0.6071116719
+-1.048170407
+-0.860262452
+0.328301295
+-0.4012978051
+-0.3166552951
+0.5969064812
+-0.9872866935
+-0.4012347099
+-0.8000824761
+-1.043129498
+-0.8570781887
+0.6774621693
+0.05182038948
+-0.8791606288
+-0.2311016076
+-1.638807307
+-0.7333128076
+2.149574535
+-0.09024384967
+0.731658927
+-0.06548837514
+0.3481692352
+0.6632580897
+-1.104616598
+-0.03093625727
+1.578865194
+-0.7955005501
+-0.5664398537
+-0.3076912774
+0.2690240732
+0.5249178636
+1.267411655
+0.4994982335
+-0.0620531258
+1.25916713
+0.7041110221
+-1.495679516
+2.52636824
+1.769921388
+-0.1682142228
+0.3779101017
+1.32435875
+-0.1722007927
+0.7303517904
+1.104578474
+-1.014825908
+-0.6023318536
+0.9214083978
+0.4608144771
+0.9237965603
+-0.1325680147
+-0.289005211
+-1.998639476
+-1.146000427
+0.04706609466
+0.8245572196
+0.5311783665
+-0.128241974
+-0.2717715665
+0.2171796326
+0.07821118109
+1.404545515
+0.1464407705
+-1.481245962
+-1.272558135
+1.518759337
+-1.171160461
+0.764497453
+-0.2683727352
+-0.1697582939
+-0.1341327828
+1.221384959
+-0.1928418285
+-0.03331928285
+-1.530803497
+0.2066905117
+0.531042507
+0.2391455807
+1.397896261
+0.05517135478
+0.2989774561
+1.64850401
+-1.550014189
+-0.4558253478
+1.426158752
+0.9361291483
+0.6783800988
+0.8326507395
+0.3270662091
+1.631597428
+0.3777591697
+0.2398671059
+0.1589586741
+0.1928639556
+-1.157017281
+0.7706730545
+-0.1304397338
+1.821915098
+-0.07565047059
+0.4209182842
+0.2466021863
+-0.6255570351
+0.9921368285
+1.905063641
+-0.01477721966
+-0.3004787856
+-0.3550287311
+-1.892361893
+-0.1778131437
+0.250998116
+1.054757925
+0.9600477411
+-0.4164990824
+-0.2768229948
+1.123905306
+-0.1734638971
+-0.5100295398
+1.392518449
+1.037585667
+0.01879179177
+-0.5937774478
+-2.011880319
+0.5897036056
+-0.8963697226
+-1.962732009
+1.584820527
+0.647967791
+-1.139008193
+-1.214401383
+0.8709617822
+-0.8779706165
+1.296149868
+0.6164593126
+0.5365965206
+0.4046954556
+0.191450872
+0.8805111992
+-0.4540803625
+0.08595197343
+0.7519465877
+0.5629897186
+-1.194986805
+-0.5004096673
+0.2528035054
+-0.408014709
+1.774658561
+-0.3931531948
+-0.1622184476
+0.7694301782
+0.3305327432
+-0.1452744572
+-0.7564935289
+0.3015140574
+1.03909644
+0.4790952241
+-0.7781835215
+1.736774957
+-1.44657789
+-1.582685642
+0.9605572245
+0.2258404786
+-0.5494985463
+-1.098570728
+2.320799839
+0.1170908722
+0.5342011708
+0.3178850972
+0.4348079577
+0.5400944605
+0.7324240098
+-0.3752224008
+-0.2916419864
+-1.741022808
+-0.7803044065
+0.2711127964
+1.045023376
+0.5990395264
+-0.3406923439
+-1.263172912
+-2.777359145
+1.151733975
+-0.5892289865
+-0.4484650062
+0.1315739679
+-1.405560047
+-0.3497821801
+2.02347195
+0.5053869386
+0.3592491565
+-1.582494478
+2.243601895
+-1.422794909
+1.922324755
+-2.115056015
+1.405365439
+1.618054269
+-0.8244091213
+0.4225803723
+0.5474805721
+-0.8137944832
+-1.449117611
+-1.317717343
+0.54100822
+-0.08511560252
+-0.5643010333
+0.9667680112
+0.5080679094
+-0.7554627264
+-1.201201519
+0.5232617387
+-0.5375833686
+0.09920486253
+1.576298973
+0.5023282401
+-0.8622669998
+0.1606611898
+-0.9526449528
+1.608522156
+-0.5615787496
+0.207270747
+0.3077325747
+0.1592504684
+-1.958548955
+-1.446421064
+-0.4523502756
+0.3194318333
+-0.1377792143
+-0.9571474732
+-1.348424319
+-0.4015575445
+-0.4684760447
+0.5128364576
+-0.3263184622
+0.6027076564
+-0.5946497697
+-0.2559576692
+-0.3480463796
+-0.7823669669
+0.6251186564
+-0.8135959971
+-0.52164151
+-0.07311964595
+-1.297379656
+-0.3249349583
+-0.7113063597
+-0.3881541925
+-0.05992800267
+-0.7999136231
+-0.2200757798
+1.308668752
+-0.02579855825
+1.145262173
+0.346494442
+0.7741606098
+-0.7744589688
+0.1049071651
+0.1339129226
+-0.6126257389
+-0.8228283243
+-1.490265388
+1.496139637
+-0.9724028894
+1.346221073
+-0.4674931737
+-0.8624932997
+0.6225191403
+-0.6311919417
+0.5684589189
+-0.3328117649
+0.4804244961
+-0.9681860639
+0.831351058
+0.4879726827
+-0.9196506901
+2.642935721
+0.5401230264
+2.290467071
+1.600267819
+-0.1888347802
+-0.4122717546
+-0.4034591834
+-1.83002855
+-0.6958351193
+0.246766024
+1.525957561
+-0.772771883
+0.8820565994
+-1.252593342
+-0.5863200252
+-0.4576405943
+0.3718110815
+0.4573096467
+0.9623417448
+0.7708369604
+0.2431682154
+0.3903649435
+1.588530691
+-0.5109261812
+0.7747283191
+-1.808143926
+0.4113342429
+-0.4832495425
+0.002571182432
+1.040086245
+0.1646438095
+0.8851875412
+1.473764815
+0.3890939689
+1.171041065
+-0.3265609777
+-0.00820988227
+-0.5226194164
+1.042977595
+0.4140913538
+-0.5072344619
+0.1546688336
+1.041568389
+-0.03926799104
+-0.9489328108
+0.1319117558
+-1.980565591
+0.7687706444
+-0.4213275873
+-0.4693107363
+0.8756956788
+-1.365162877
+1.947098643
+-0.4802420417
+-0.5232509434
+1.021224743
+0.7086952731
+2.451229719
+-0.2112059836
+-0.1204066387
+-1.47931598
+-0.3321022773
+-0.7214312956
+-0.4487670131
+-1.744187757
+1.66060756
+-1.416603482
+-2.802202798
+-1.188424422
+-0.6038395528
+-1.149554063
+1.098303541
+-0.1378391786
+0.02538560441
+0.6103917643
+0.286012527
+0.9785672974
+-1.109477554
+-0.5475181007
+0.6659671461
+-2.534554462
+-1.375184479
+0.5009922322
+-0.480249035
+0.9361075501
+0.8091802969
+-1.19809288
+0.4066570875
+1.201697856
+0.1474344017
+-0.9774648772
+0.8793899419
+0.6354245266
+0.5426107835
+0.7159388934
+-2.99461286
+0.8809375611
+1.808131811
+0.4366384746
+0.1927289965
+0.6964386734
+0.3382254737
+0.6517812617
+0.001471000245
+-0.7667048545
+-1.004322712
+-0.9981917282
+-1.373042551
+-1.067742011
+1.761266127
+0.7540956637
+-0.6250273907
+-0.390392694
+0.1125575309
+-0.6555450295
+0.06751685717
+0.7776041379
+-0.03574273355
+0.3360157427
+0.8864915394
+-0.272131756
+0.2847905991
+-0.3093775929
+-0.02852886983
+-0.3247302651
+-0.5288698536
+0.173711853
+0.5665453158
+0.146304446
+0.4987269583
+-0.7379317802
+-1.203735192
+0.417043503
+0.6878813912
+0.0498572666
+1.34803578
+0.907698798
+2.680570841
+-0.200808514
+-0.9988487961
+-0.7401367907
+-0.5654978064
+0.4760313834
+-2.158068564
+1.318551018
+-0.2392965911
+-0.2467935578
+-1.079343166
+-0.1142255515
+0.01323976767
+-0.1219449276
+0.3390592559
+-0.589632042
+-0.8958157604
+0.5483281305
+0.09866745382
+0.1971810552
+1.059027254
+-1.022564391
+-0.8552404573
+1.257219651
+-1.482883358
+-1.309412146
+0.8178618312
+0.238200192
+0.1052321371
+-0.0916594081
+0.03126754703
+-0.09211211469
+1.355442703
+-0.3981481288
+-0.1613735363
+1.794448805
+0.02750970203
+2.23201639
+-0.104979701
+1.367414982
+-1.655344038
+0.1536444608
+-1.584473563
+0.8444543066
+-1.212867816
+0.2837695544
+-0.2821958767
+-1.158203185
+-1.619359983
+-0.5110404636
+1.740629446
+-0.2934850549
+0.9172215421
+-0.05704286766
+0.8767267737
+-1.826911378
+-0.4031883068
+0.9494055238
+-0.1632549488
+-0.08645528271
+-0.4304619119
+1.149379383
+0.297514354
+0.04402227618
+0.6430545453
+0.5882249291
+0.2125870464
+1.547031497
+-0.06028753364
+0.278081048
+-0.6429525534
+0.150115227
+1.587761524
+-0.6432576018
+-1.133592826
+0.9967596428
+-0.1487661522
+0.09600420497
+-0.04511330369
+0.07912172393
+0.8505306835
+-0.8391241906
+-1.011774084
+0.08496813704
+-1.606439689
+-1.373053536
+1.866683148
+0.7574683301
+-0.01005647187
+1.238006936
+-1.04059923
+-0.3156031234
+0.6234536094
+0.8906716814
+0.5129168468
+-2.541238808
+-0.9680821177
+0.4770680924
+-0.355951493
+2.540231621
+0.926558301
+0.5580818806
+-1.116949554
+-0.0352967396
+0.2412039642
+1.12778363
+0.8811310971
+1.032989195
+-0.9239120158
+1.412151698
+-1.380430752
+-0.5359145617
+0.4307711349
+-0.1498915917
+-1.006036858
+-0.8215498256
+-1.548254323
+0.531974639
+1.260568845
+-0.1003935034
+-0.400348815
+-1.472322928
+0.9132019243
+2.211304333
+-1.797455804
+-1.063432938
+-0.6795930425
+-0.5643179097
+0.2273459501
+1.614249547
+1.008597287
+0.5275973828
+-0.7239287041
+-1.119628234
+-0.7967753063
+1.548066801
+-0.06174330146
+-0.4468362537
+-0.1837557302
+0.8246182196
+-1.312849675
+1.414874136
+0.1564762569
+-0.2163439783
+0.4428461137
+0.2183970731
+-0.3441964565
+-0.252710672
+-0.8688625469
+0.6563907509
+-0.5319938094
+-0.9562584224
+0.1658635227
+1.329141283
+-0.04834462378
+-0.608101257
+0.4038960208
+1.936712462
+-1.451905529
+0.3822027878
+0.2050866252
+1.161533804
+0.9909091737
+-0.1867091118
+-1.684517255
+0.8065637679
+-0.8351926902
+-0.946740411
+1.148350581
+-0.9108503776
+1.40284474
+0.3358447214
+0.3191184001
+0.3072647805
+-1.638423626
+-1.776388616
+0.2155530538
+0.5680073592
+0.08261103216
+-0.821534517
+0.01892210388
+-0.08203415315
+-0.9571580983
+1.013972154
+-1.730276062
+0.5887424068
+0.3843234052
+1.009711855
+-1.005311872
+0.1014071467
+2.171164949
+0.662074289
+0.1005812087
+0.5391612741
+0.08617684238
+2.190898013
+0.9836361958
+-0.08561495423
+0.2523314314
+-0.3907979961
+1.209850126
+-1.406104771
+-1.60473853
+1.45871475
+2.153119793
+0.4683049077
+0.1127379412
+0.6572676903
+-0.6470535264
+0.1712435452
+0.03890870586
+0.6265642507
+-1.557998528
+-0.5070347698
+0.844995603
+-0.6755938276
+-0.9933613754
+2.04207215
+0.03811800018
+-0.5789181399
+-1.692370437
+0.7293463463
+0.6991361537
+-0.2987596006
+-1.102230191
+-0.02454942364
+-0.8358560675
+-0.9420935889
+-0.1032127515
+-1.051390399
+0.2466489553
+0.6079925094
+-0.8396324472
+-1.368245095
+1.561279599
+-0.940270236
+-0.6599427051
+0.2130171674
+0.5993693725
+-0.2563168937
+0.4607943277
+-0.4009861579
+-0.9711706648
+1.426316861
+2.488441614
+1.695969533
+0.1418066392
+1.833435362
+0.3557035157
+-0.4772862704
+0.4663795744
+-0.09439250641
+-0.9831181837
+-0.8983219714
+0.8020517387
+-1.846531982
+0.6041367404
+-1.629583603
+-2.121176445
+-1.838846604
+1.966763972
+-0.1962339649
+0.08658318017
+1.419255046
+0.9341797485
+-1.391505269
+0.8690063428
+0.1841812647
+-0.3416780976
+0.02429091414
+1.279812021
+-0.885966482
+0.4008856791
+-0.009657236533
+-1.797164615
+-0.8022531717
+0.1932135532
+1.297342089
+1.001331017
+0.5972125044
+-0.8152756611
+1.801213991
+0.2152404676
+-1.006365522
+-0.1829049809
+0.8962484254
+0.007617498318
+0.8868646866
+1.103693957
+0.4005306846
+-0.857702623
+0.1354546632
+0.04516585594
+1.859346334
+-1.626321938
+-0.1348224511
+-0.5840935468
+0.3351056202
+-2.437564359
+1.114924559
+0.01374848734
+-1.844701164
+-0.3611131347
+0.6089623417
+-1.591447875
+0.003222216443
+-1.057473648
+-0.5559850319
+0.02673838267
+0.1834502536
+-0.4707424982
+0.2727963895
+0.8179776073
+-0.2789142751
+1.431567757
+1.462214171
+-0.4287020656
+-0.6378405565
+-1.664172985
+-0.1265693316
+-0.3634377801
+0.7790512201
+-1.509661606
+-0.2773913917
+0.9687443931
+-0.7303570956
+-0.7623615367
+-1.446940335
+2.620573846
+-0.7474731781
+-1.300346832
+-0.803850404
+-0.7742950805
+-0.2693897785
+0.8253722321
+-0.298323169
+-0.922823315
+-1.451338498
+0.02185735822
+0.04253907403
+1.530932351
+0.09244773547
+-0.09900831128
+-1.050653837
+-0.3059525751
+-0.438474458
+-0.3701641645
+-0.9592553926
+0.5383296033
+-0.1424454175
+-0.20035348
+-1.714046116
+0.4936440875
+0.487015326
+-0.8391294028
+0.9901213839
+-1.36475823
+-0.02186990879
+-0.2712073399
+-1.317174789
+0.1897026121
+1.702570152
+0.06763423007
+-0.4630217541
+0.4470241569
+0.1057199955
+0.02776213163
+-0.4255422128
+1.421975559
+0.4563633635
+-0.5286706589
+-0.1080038368
+-0.7408667042
+-0.6082911501
+-0.6407257242
+-1.134311594
+0.7772769638
+-0.2910414633
+0.5541275783
+-0.6701258977
+-0.06036249439
+-0.7110405968
+0.7196681705
+-0.2484193067
+-0.730873586
+-1.641703229
+0.2756665493
+-0.7083850523
+-0.01577921712
+-0.491730108
+0.9541895809
+0.5441447524
+0.4472120875
+-0.6161211233
+0.4662900436
+1.714831609
+-0.8321860342
+0.1723391392
+-1.649216974
+1.398562092
+-0.3979120986
+0.7825788808
+-1.723228251
+1.797539387
+-0.356871528
+0.5456573235
+0.1508182063
+-0.2554707862
+1.685792303
+-1.648046206
+0.29871366
+0.9106456722
+-0.02985612164
+-0.1181707844
+-0.1426877121
+-1.22763642
+0.03812738409
+0.5127175235
+0.06859922748
+-0.2722761011
+-0.4897250224
+-0.2792966693
+1.257744217
+-2.086634979
+0.04007145655
+-0.3277549173
+1.455807952
+0.05549222544
+1.484925599
+-2.123890018
+0.4595849048
+0.28005786
+1.390533967
+-1.641348609
+-0.1550358081
+0.06606026179
+-0.4957954945
+1.216577714
+-0.3386821854
+2.034762544
+1.054177909
+0.950833697
+0.5592989814
+-1.063695591
+-0.4310963375
+0.5727513669
+0.6775570336
+1.307183845
+-0.4674410096
+-0.8601533849
+0.8591041928
+-0.809626576
+0.8733118361
+1.199736176
+0.4561530358
+-0.357579032
+0.04108222614
+0.5934659196
+0.01018551871
+2.198296339
+-0.9906709306
+-1.002668587
+-0.9768953867
+-0.5895799225
+-2.17893152
+-0.6296504269
+-0.6532847019
+0.07851402517
+0.4178005832
+-1.240216336
+0.9000542428
+1.80224223
+-0.2082851031
+1.574371237
+0.1989894944
+1.988731919
+1.117283466
+-1.563904635
+0.01862737066
+1.054324975
+0.03054658104
+-0.03688353085
+1.26976475
+-0.7098541821
+0.01751561328
+0.3236257646
+-0.3337909604
+-0.02012910388
+0.7750232632
+0.4328376215
+-0.808717532
+-1.104123986
+-0.7891021803
+0.001248455788
+-0.1599397878
+-0.8319574932
+-0.5981504525
+-1.520039285
+0.4178537032
+-0.04001872535
+-1.259787343
+0.02862050419
+1.342622011
+-0.739935853
+1.315137666
+-0.3234574725
+0.1978281678
+0.09775080242
+1.401523416
+0.1584338468
+-1.141901419
+-1.31097037
+-1.532921053
+-1.711970164
+0.04613505896
+-0.9583744802
+-0.08081161294
+-0.703859036
+-0.7707843007
+-0.4808453409
+0.7035855546
+0.9291451478
+0.3711725526
+-0.9898225495
+0.6436312755
+0.6888966666
+0.2746472036
+-0.603620436
+0.7088595754
+0.4228185747
+-3.116856592
+0.6444520334
+-1.913742671
+0.6635615766
+-0.1540723984
+1.193611681
+-0.09816121121
+-0.8866142601
+-0.1473536646
+1.059806295
+0.02624661786
+-0.1143351599
+0.7435535155
+0.2103593666
+-0.005927405833
+1.366060068
+1.555114032
+0.6133262263
+-0.2859591515
+1.496910994
+1.183119557
+0.7188971655
+-1.216076581
+0.1406719033
+-0.7436721747
+-0.1590122516
+0.2400569293
+0.1001594081
+-0.4751751058
+1.272953749
+-1.696131267
+0.7301835311
+-1.857483272
+0.3825981367
+-0.8869043263
+0.8783037577
+0.08645252401
+0.2477063785
+-1.018279326
+-0.654570135
+0.2072173934
+0.5835699269
+2.929096242
+0.2228583231
+0.9760375254
+-1.556933933
+-1.329891861
+-0.3554947746
+-1.197427696
+1.486399253
+-0.4102186928
+1.382181888
+1.486782474
+0.04277971988
+0.5017997538
+-0.05609947334
+0.5384370004
+0.4833418518
+-0.1236496259
+0.5049699815
+1.723696276
+0.7130162297
+0.3257996136
+0.124769521
+-1.012673124
+-1.027296877
+0.3233565315
+-1.369391124
+-0.766327599
+1.28151134
+1.914229697
+-1.665956077
+1.626649562
+-0.2114382908
+-0.01500508703
+-0.1134116306
+1.080544127
+-1.607676579
+0.4561636114
+-0.9448701974
+0.5707885294
+1.542796338
+-0.0004173264126
+0.374155086
+0.4095517782
+-0.7995934997
+1.51163935
+1.706468247
+0.7017833721
+0.07328543201
+-0.4618938154
+-0.6264902231
+1.710836583
+1.414415043
+-0.06366148879
+-1.57993053
+-2.83201187
+-1.08342666
+-0.130620396
+1.400689034
+-0.6516562091
+0.5048154563
+1.303180962
+0.1285363169
+-0.1424478688
+-1.308763514
+-1.202475308
+0.4160996344
+-0.2009075332
+0.1225313177
+-0.0472777157
+0.6641440494
+-0.7846874114
+-0.3355806436
+1.896182229
+-0.7997861384
+-0.2815754308
+-0.589386702
+0.4447813624
+1.022392322
+-0.4982116186
+-0.4314143411
+-0.2789816053
+0.5298337835
+-0.7393953025
+-0.375959966
+-2.372193872
+-1.381745009
+-0.112443756
+0.8978641732
+0.2950757833
+-1.098768457
+-1.400256208
+0.1746800929
+-1.652803642
+1.065926819
+0.06389619165
+-1.607320159
+-0.9659538588
+-0.7243113192
+-0.7731925102
+-1.489933008
+-0.874662522
+-0.6844015561
+-0.7112857556
+1.127956625
+0.1048278028
+-0.9932572174
+-0.334621606
+-0.8795570973
+-0.300006659
+0.8755091531
+0.2522707806
+2.285601182
+0.3759274258
+-0.91359451
+0.8097407308
+1.079931217
+1.094166991
+-1.094240953
+-0.1476374145
+1.131811957
+-1.684728959
+-0.499416761
+-1.426937685
+-0.9325702299
+-1.012457153
+1.250569833
+-0.2345380349
+-0.8633555813
+-1.035605731
+0.1416671649
+-0.01113562734
+1.344074375
+0.5000166959
+-1.431797778
+-0.6289807076
+1.070072512
+-0.6210826977
+1.734572175
+-1.098289431
+0.572613353
+-0.8612155534
+-0.5095951329
+1.098581648
+-0.1270671628
+0.8134522451
+0.4732905949
+0.7538656836
+-0.8881882111
+-0.2215743982
+0.4242526181
+-0.8490728727
+1.629500043
+-0.7772280422
+-0.3000035769
+-1.006559065
+-2.143308065
+1.796918523
+-0.2043389369
+-0.4479148384
+-0.1987150617
+1.419863972
+-0.9651066081
+0.6795678658
+-0.4237882485
+-0.5966708555
+0.5670582125
+0.9882405737
+-0.5139029503
+-0.7688491597
+-1.169095747
+1.103503767
+-0.5752559948
+-1.849130727
+1.409952138
+-1.369859502
+0.7794605313
+0.1834286467
+0.2879154322
+-0.5843752753
+0.3655914602
+-1.667779893
+0.5880377487
+1.557010042
+0.8840271974
+-2.019540085
+-0.9842090023
+-0.187794922
+0.4869373049
+-0.1066526737
+-0.4932143871
+0.5953003077
+1.164151766
+-0.2322940072
+0.7289298674
+-2.579050745
+-0.9375093861
+-0.3212589371
+-0.4885662208
+0.3327982174
+1.013750547
+0.506669026
+-0.6222254718
+-1.522768091
+0.5569641206
+-1.83817674
+0.6530372834
+-0.1884490821
+-1.175834988
+0.2872573125
+-0.002876102659
+-0.03659729292
+-0.08422329653
+0.4195241084
+0.924434022
+0.4966151985
+1.01213319
+-0.04413971885
+1.618459324
+0.5711098221
+-0.5436940297
+-1.093895057
+0.2057968037
+-1.306521523
+-0.9733759676
+0.2390870804
+-0.6078874463
+-0.9333162402
+-0.03447504609
+0.0726778991
+-0.2058340252
+-0.3775469191
+0.8546427287
+0.3424273513
+-0.2234261122
+2.464321934
+0.1938317369
+1.132005134
+-0.5609810031
+-1.362940947
+-0.7917565156
+-0.2680097834
+-0.4966082097
+1.336386182
+-0.1200411221
+0.4614688774
+-0.04648115603
+-0.4335543327
+0.03799601345
+1.71405147
+-0.7679485917
+0.7669904506
+-1.026007252
+-0.4596264423
+0.003583205955
+0.3263750897
+1.483128628
+-0.05008264146
+-0.8436156065
+0.6500419731
+-0.3641698089
+0.2386815709
+-0.1162224395
+-1.943456851
+0.5082991856
+0.5833680068
+0.9266047683
+1.800462762
+-1.195103773
+0.5165074443
+0.4092949966
+-0.4190819928
+0.3971062364
+0.4996469551
+-1.21868383
+0.2462227613
+-0.917984306
+-0.6518564999
+-1.774744815
+-0.4733609255
+-0.2035706715
+0.5498568673
+0.0008999266711
+-1.542288151
+0.8621480569
+-0.1185866236
+0.4883705904
+0.9659361185
+1.422604749
+1.961226989
+-0.07223875867
+0.3111244461
+-1.078361091
+1.06160017
+-1.184887445
+-1.805251689
+0.8303860053
+-0.5216965249
+0.7776072813
+0.4080746493
+-1.630002651
+-2.719679364
+-1.096601747
+0.01649148698
+-1.221776335
+-0.6527614493
+-1.458940731
+0.1698779598
+0.09082592704
+-0.481392624
+1.397065301
+1.497715027
+0.5652672025
+-1.799771181
+-1.104690147
+0.4071303311
+-0.6285575802
+-0.4870914317
+0.8989673946
+0.5108748219
+1.314154434
+-0.4292092966
+1.37522542
+-0.5541312471
+1.49949149
+0.1058346436
+-0.8605097471
+-1.631219508
+-0.3014723149
+-0.256232698
+0.8576619101
+-0.1105905028
+-0.4324319786
+1.077037473
+-0.2248265613
+-0.5762418162
+0.5746089173
+-0.4898282188
+0.6588021417
+-0.5969171118
+-0.222959183
+0.1521769756
+-0.3741263203
+-0.01345146936
+0.8154719692
+0.4106017913
+0.48096985
+-0.6354304386
+0.8528297683
+0.6695623405
+1.004419192
+-0.7263658322
+-0.1724585967
+0.6335339025
+-0.6088151174
+-0.2261224698
+1.925805737
+1.951761012
+1.23994055
+0.9385851362
+-1.01925115
+0.5125622314
+-0.3591165951
+-1.058571898
+-0.5090058386
+0.115665074
+-0.5473555743
+-0.5507994257
+0.7920414984
+0.1441064851
+0.2334580797
+0.1118723969
+-0.6757031434
+-1.370571918
+0.3105647104
+-0.5070366321
+-2.010782269
+-0.392567258
+-1.092217941
+0.6986502343
+0.5216252272
+0.4968931448
+-0.6650416182
+0.7315515819
+0.3196497831
+-0.4098545384
+-0.4533374321
+0.8927081529
+-0.473604057
+0.3036564735
+1.033956987
+1.909342626
+1.663873124
+0.9008227642
+-1.505911352
+-0.6890484294
+-0.5480871875
+1.653149833
+-0.699317941
+0.3861663771
+0.1008670633
+-0.9351272094
+0.3818240096
+0.3982960862
+-1.255774882
+1.222877447
+-2.086510029
+-0.5907571529
+0.9719702939
+-1.193257833
+0.3502659196
+-1.296360388
+-0.09302414444
+-2.313773113
+-0.8425717017
+-1.542921447
+-0.4017637421
+-0.4152313958
+-0.6736641713
+0.7979131966
+-0.8868796039
+0.6343866732
+1.62927577
+0.1390641503
+-0.8576702046
+-1.249338515
+-0.7097851001
+0.7046427207
+0.155590735
+0.9367952163
+0.7703308793
+0.1408106519
+0.4734882617
+1.855246209
+1.415656226
+-0.3027460169
+0.9896794419
+0.5858508058
+1.136388078
+0.671616572
+-0.974167435
+-1.619684565
+0.5726270172
+1.902618198
+-0.7756641079
+-0.188089738
+-1.035747726
+1.177829505
+-2.305166855
+-2.263660301
+0.3750199198
+-0.08234364679
+-0.4796230151
+-0.3010947865
+0.5369879145
+-0.413803989
+-1.096924972
+-0.9273629281
+0.888338862
+-0.524741955
+-1.385277584
+0.1021783269
+0.5049947218
+1.328960748
+0.2179033871
+-0.6597112472
+0.4740078673
+0.72717487
+-0.03890530666
+-0.04459939273
+0.2601329049
+-0.06985649826
+0.2501139069
+-1.021913324
+-1.15043777
+-0.8361113795
+0.6422109433
+0.2587975673
+1.040238964
+-0.1866909221
+-1.143641396
+1.144553535
+-0.01876705554
+1.283455036
+0.5979464914
+2.188618679
+-0.2197729857
+0.9007239051
+0.8913641064
+-0.5551263455
+-0.1724823171
+-1.461738342
+-1.548796137
+0.1265688015
+0.7930070707
+0.6380240335
+0.3400245983
+0.8630171532
+-0.5896977957
+-0.2725327485
+0.7375215134
+0.4331187294
+-0.2101888138
+1.320794386
+-1.292001251
+-0.5186786873
+-0.2833977745
+0.8165348798
+0.002385197915
+-1.261491747
+0.5140041798
+1.087546315
+0.7393045331
+0.6191549216
+-1.874313497
+-0.8998864767
+0.4820806087
+-0.05488818475
+0.522557602
+-1.266342677
+-0.06149476428
+-1.389781019
+-1.953678563
+0.2957790885
+0.8425887965
+0.2456164279
+-0.03299648026
+-1.562014342
+1.006107067
+-0.04404489738
+1.959562005
+0.9423143083
+-2.005125427
+0.7550496803
+-1.396535238
+-0.7594954904
+-0.2507566768
+-0.09406245036
+0.3975652156
+-1.022855041
+-1.150692004
+0.6006052017
+-0.01325026793
+0.1743730487
+-2.193683352
+-0.1771373833
+-0.8907291831
+-0.920626373
+0.9219348042
+-1.095671229
+-1.092896606
+-0.3310106034
+0.4502888306
+-0.8840147297
+1.234144036
+1.449847525
+-0.8814470665
+-0.2450817556
+-0.7786754727
+-1.685382105
+0.3030110505
+0.7335948682
+2.011864263
+-0.8974095036
+1.336235091
+1.342353691
+0.1978533096
+0.6021634896
+0.8732730483
+1.974099948
+0.4778085626
+-0.0601378855
+-0.866168799
+0.305320755
+1.024164933
+0.2446103613
+-0.7799232489
+0.0890762025
+-0.1291534825
+0.2647387578
+-1.661848367
+0.5507886141
+0.5954231568
+0.4448534382
+-0.003762817145
+-1.805936263
+-0.01932279197
+1.060714999
+-0.8601288763
+-1.989269466
+-1.540557972
+0.3140256918
+0.3728760089
+0.8862931946
+-0.05525899573
+-1.500328376
+-0.8185041406
+0.8188393726
+0.1404959074
+0.6498296347
+0.4347888055
+-0.2049605517
+-0.1740068375
+1.85710227
+0.4146742666
+-0.1285875503
+0.4554199909
+0.2229058196
+-2.157356373
+0.6500845144
+1.820939274
+-0.7802798684
+1.454035749
+-0.2568696973
+0.2934713976
+1.070360017
+-0.7200014313
+1.242493913
+-1.214217281
+-0.8751547489
+-0.5935203173
+0.6620053665
+-0.3408744106
+-1.51997446
+-0.2165328718
+-0.7842213825
+0.7312936208
+-0.3432350545
+0.0707740759
+-0.4054724571
+0.4339389682
+-0.1835907635
+0.3251987147
+-2.593388565
+0.09725087698
+0.4139136701
+-0.1992800549
+0.6693924714
+0.738607029
+1.304213892
+0.1048116081
+-1.913800705
+-2.285499449
+-1.601840952
+-0.03790706118
+-0.1573052883
+0.276239852
+-0.6252459226
+-0.7364911715
+0.5550479424
+0.6559244114
+-0.2566501355
+-0.03847665824
+0.4043143433
+0.5043435752
+-1.1439807
+-0.7195738559
+-1.230546046
+-0.5069066148
+0.8123335893
+0.5462718669
+-1.09809796
+0.5122667268
+0.08584310534
+-0.4939267071
+-1.406459655
+-0.1748233716
+0.6799440061
+-2.163097648
+-0.3961231978
+2.254283699
+0.6726367186
+0.259832495
+-0.7371851696
+-0.6783298379
+-0.0832883957
+1.602863629
+0.4655891909
+-0.8721583978
+1.176786962
+-0.2925942072
+1.697346481
+-0.5666030246
+-1.003265757
+0.1746295778
+0.9823269838
+1.037444797
+0.1591917667
+-0.988096688
+-0.5053407219
+-2.018281868
+-0.9131215376
+-0.1784568149
+0.3890021407
+-0.3394543215
+-0.05697905498
+-0.3961854447
+0.7510253042
+-0.8991129384
+0.8375479141
+1.960880813
+0.472789656
+-0.5270916102
+-0.5362701441
+1.209837222
+-1.126589426
+-0.9538044203
+-1.164448454
+-1.278513841
+-1.044816319
+0.7899049418
+1.102282565
+-0.6970730724
+0.207334046
+0.7591566751
+0.1005642031
+-0.9549427576
+-1.470401735
+1.010427553
+0.4961794123
+0.5769558934
+-1.107646901
+0.2349771929
+0.6289995875
+0.3140338436
+-0.7450232168
+1.01226051
+-1.527631948
+0.9287419248
+1.081055944
+1.572330318
+-0.3424921903
+-0.9994300166
+0.7938803623
+-0.6992152791
+0.04399551144
+-0.3174622172
+-0.9020719714
+0.3209994662
+-1.392015917
+0.5922056816
+-0.9669310885
+-1.731731346
+-0.05010745879
+0.4316338528
+0.5769345971
+0.8183537308
+-2.3536404
+-1.005144431
+0.1066522945
+1.51900328
+0.7837444937
+1.901340052
+-0.5249394229
+0.2744169953
+-1.099970808
+-0.4043522196
+-0.7352957183
+-0.6339886593
+-0.3934491212
+0.002717539891
+0.02221266452
+0.5434534396
+0.1399884674
+-0.3440456288
+-0.5225785415
+-0.3071317202
+-0.4490371414
+0.4909710552
+0.8655251907
+1.274044538
+-0.7977027599
+0.4693722253
+-1.394679642
+0.3731747183
+1.082672282
+-0.1495895017
+1.072636047
+-1.13856787
+-0.8886452831
+-0.1358098426
+1.022210355
+-0.4174294563
+-0.4535531009
+-0.9916283584
+0.2028810444
+1.246695141
+0.7006801091
+0.6966506543
+-0.2069744749
+-0.5633093593
+0.6772459164
+-0.03191107563
+-0.1736082357
+0.8982406224
+-0.1977874517
+-0.8377762594
+0.9091884953
+0.08071989043
+-1.037029344
+-1.112905895
+0.09541187583
+2.337409661
+-0.3928206035
+-0.3362738591
+1.523771198
+-0.05728119979
+-1.448466863
+-1.572796453
+1.226663974
+0.6663545423
+0.8261257084
+-0.05775655838
+-0.726712026
+-0.2171631157
+0.1360312174
+-0.8383111557
+0.5614499096
+-1.259596169
+-0.3327587646
+-0.2040078725
+-0.6910198132
+-2.205505355
+0.4478696641
+-0.7557507604
+1.325707959
+-0.3419822777
+-0.5413595884
+0.09152194678
+1.053439749
+-0.5634076631
+1.014737695
+1.440303641
+0.9903228107
+1.626431491
+1.292646021
+1.514882294
+1.604326319
+0.2080695296
+-0.4292238996
+-2.262243635
+-1.32273312
+-0.4482827992
+-0.3817350872
+-0.1527944634
+-1.00076049
+-1.595777611
+-0.1302231665
+-0.1894179288
+-0.8075540415
+-0.7421521617
+-0.9401565919
+-0.396523739
+-0.856302827
+1.259875332
+0.240996732
+-0.972317918
+-0.2804477815
+-1.180285606
+1.012168295
+1.384186725
+1.252001983
+-1.144692631
+-0.09126701973
+-0.4015706755
+0.5620131059
+-1.007909803
+-0.675891694
+-0.4132170284
+0.1532884691
+0.6941287081
+-0.3287276927
+0.6639650755
+0.8220763568
+-0.2132152369
+-1.245658133
+-1.171190335
+0.5917269752
+-0.4762244363
+-1.712629323
+0.6129523682
+0.1295545205
+-1.405967081
+1.179419981
+0.8366359872
+0.1387452513
+-1.274319368
+-1.402330533
+-0.3070684868
+-1.71391539
+0.4050802732
+-1.410823313
+0.1649127293
+-0.2881314527
+0.7117852681
+-0.9379475953
+0.2737294495
+-1.394840193
+0.7955495518
+-0.1149617663
+0.495850669
+-1.320525347
+0.4990842757
+0.3062033963
+0.3636978927
+0.312633963
+-0.1934638828
+1.24129922
+-0.1558979858
+-0.7391692004
+-0.05872619337
+-0.9505179454
+-0.4639964233
+-0.1772466162
+-0.3795541206
+0.1993970728
+1.945761391
+0.5709498398
+1.072300647
+-0.5037094374
+-0.5870162885
+-0.3781780469
+0.8528890973
+-2.148118478
+-1.033164775
+0.1023358468
+-0.2240923671
+1.967729682
+0.4476832157
+-0.6621914435
+-1.577607069
+-0.3405600349
+-1.303220083
+0.4667506504
+0.1611063222
+0.3200319321
+2.079176665
+-0.9074659814
+-0.1924042078
+-1.212515744
+-0.08059851615
+1.593273616
+0.5687223991
+-0.1144870456
+0.2516302488
+-1.210855638
+-0.3937337117
+0.08525257457
+0.09942198671
+-1.530616244
+0.3276231792
+0.2791964925
+-0.3770512063
+0.004174999083
+-1.483491553
+-1.479795615
+0.1346872623
+-0.6677231909
+-0.01155552022
+0.8394906723
+-0.1739299303
+-2.810668055
+-0.150653638
+-0.481044022
+-0.2346943543
+0.8997308126
+-1.578530186
+0.2439566239
+1.570303912
+-0.625943115
+0.4723278862
+0.966305779
+0.2102314391
+-0.6850969803
+-0.7095210107
+0.7438001538
+0.5921490908
+-0.7864684151
+-1.176473154
+-1.280806714
+1.661651861
+-0.06794512039
+2.360228586
+0.5555456031
+0.4395223228
+0.3062724883
+0.9991498502
+-0.966063185
+2.160013108
+-0.1003017026
+-0.7034000922
+0.3025610023
+1.092338876
+-1.007554876
+0.5668693724
+-0.7164441576
+-0.5062735332
+-0.4894824188
+0.7635414665
+-1.109072732
+0.19261611
+-0.3434178641
+-0.847210178
+-1.213523603
+-1.202888325
+-1.633796018
+0.8961671937
+-0.2416531626
+0.1586519301
+1.178189364
+-1.220117157
+-0.9415456753
+0.2547155367
+-1.824079552
+-0.578708513
+-0.9248930731
+0.3295224422
+-0.4258158664
+2.008149279
+0.9378913721
+-0.8532384843
+-0.3873134375
+-0.3475845129
+3.306574349
+-1.510199644
+0.2035397004
+-2.084432135
+-0.006937441206
+1.909890562
+-0.4084554317
+1.104554421
+-0.06611522595
+-0.4224987168
+-0.2516563589
+-0.5869026452
+-0.6260582719
+-1.330194412
+1.506800729
+-0.3930763958
+0.2937743108
+-0.8765318514
+1.116990559
+-0.2735557779
+-0.09103266786
+-1.828976635
+0.3959762111
+1.811505705
+-0.869077586
+-0.4582291537
+-1.138323958
+0.1291621742
+0.06402419791
+0.7050811015
+0.5514735468
+-0.8125160462
+0.2249480491
+-0.3283011067
+-1.091032977
+-0.126855873
+3.801660215
+2.315170634
+0.1398265978
+1.738857208
+-0.04538336415
+-0.05313833944
+-1.949571788
+-0.9601055659
+-0.783499264
+0.1075190317
+0.01398453486
+-0.5789423514
+-0.5888131995
+-0.1661531356
+-1.381411651
+-0.6126385604
+-0.3812898698
+-1.248948933
+-0.3302378933
+-0.8348071635
+1.235382392
+-0.2438037971
+-0.1895456683
+0.428028107
+0.5569683168
+-1.736241804
+-0.3767841091
+-0.9090323263
+-0.1451702442
+-0.5363325212
+0.1570694629
+-0.9804592456
+-0.5677672415
+-0.5911596689
+1.08259137
+0.3680036593
+0.3688887076
+-0.2863182808
+-0.3847178521
+0.5610028885
+0.7774339338
+0.01514678563
+1.141647945
+1.274155028
+-1.664698039
+0.4303788848
+-0.04260192849
+0.388288814
+1.115976528
+-0.9205381631
+-1.620274102
+1.106191473
+-0.9984846449
+-0.6862195139
+0.2046208934
+-0.6861018212
+-1.592210628
+0.03418976742
+-0.781484659
+0.5978598779
+-0.5060765561
+-0.6884461387
+-0.2100005391
+1.052153477
+0.9079040816
+-1.093226182
+2.799707649
+-0.3257763246
+-1.152415729
+0.88823199
+-0.3616724574
+2.153719508
+0.8474083555
+-0.1987198463
+1.575306878
+0.8491152115
+-1.228895197
+0.8883941096
+-0.5164874419
+-0.08332628525
+0.1310544492
+-0.8790960123
+-1.333342279
+0.3677840109
+-1.388233499
+-2.575202627
+-0.8361056044
+0.3310924215
+-0.2698811336
+1.267130941
+0.1837534954
+-0.7663096519
+-0.4395835505
+-1.436541359
+1.085797225
+-1.381100086
+-0.9204076321
+-0.1602862204
+0.002353264491
+-1.502650364
+-0.9055357952
+0.2650406022
+1.129723359
+0.3490035621
+-0.02580976159
+-1.562408734
+-0.6173423466
+0.5214942413
+1.08094667
+0.8893759082
+0.1380716444
+1.204600467
+2.881460713
+-0.5938619154
+-0.7631157953
+1.518482926
+0.2354645254
+0.1123076884
+0.3923743277
+-0.6544865052
+-1.034795285
+-0.7771475095
+1.245946257
+-1.436640665
+0.4986546456
+-0.55768746
+-0.3533668887
+0.7429509766
+0.8439889134
+0.3429765379
+-1.873119662
+1.570964709
+1.310196517
+0.09143683319
+0.01025781696
+1.801449209
+0.9472242713
+-0.02929440357
+-0.2923386759
+-0.193537111
+1.177232054
+1.039991785
+-1.613423011
+0.4646423989
+0.8641213314
+-1.506463166
+-0.002964751438
+-1.777043606
+0.1294928359
+-2.083234502
+-0.6817455237
+-0.6110659145
+-0.7088498201
+1.451528017
+0.5355105697
+-0.3995688603
+-0.9330778409
+-0.2387763168
+-1.029112968
+0.9730800041
+1.996766002
+1.053199898
+0.3316903455
+-0.1656287833
+-0.4051062895
+1.745284573
+-0.5759356075
+1.561098557
+-1.131539242
+-0.2962316544
+-1.714056593
+0.1592342012
+-1.263727622
+1.665049407
+0.4122722717
+0.5373967469
+0.2826784492
+-1.092540814
+0.1241182877
+1.837080688
+0.008554926006
+-1.017016202
+-1.852342657
+-0.7133269904
+-1.762228898
+0.830517369
+0.7811672662
+-0.8756818272
+0.6139813085
+-0.576454653
+-0.04561428277
+0.3719555516
+-0.443960009
+0.4182033487
+-1.68572805
+0.117474988
+-0.03495202239
+-2.046393136
+-1.809690193
+-1.859523606
+0.4143068339
+0.1239596269
+0.2739575772
+-1.326378493
+1.138973811
+0.9828412198
+-0.766963035
+1.176060276
+-0.2509223968
+-1.776205024
+-1.632694766
+0.7337234879
+-0.1040488107
+0.8812249465
+-0.08837312473
+0.2676708934
+2.123526423
+1.396849088
+-0.4328272686
+0.3749687247
+0.4944454431
+0.7613911675
+0.07100880519
+-0.4935318505
+-0.003622817237
+-0.4802871095
+1.683367281
+1.240726239
+-0.2036150189
+0.4282922607
+-0.1654592642
+1.193241136
+1.048880516
+0.5686108327
+0.8712642696
+0.660570808
+1.174061854
+0.5311313733
+0.1519005291
+-0.5772256236
+-1.571750737
+-0.02784838051
+-0.7410555334
+0.06000906696
+1.140488424
+0.1728246754
+-0.4150016711
+-0.8531286249
+-1.430135207
+1.332805335
+-1.776691019
+-0.9347830262
+-2.313201934
+-0.3161415757
+-0.3422845598
+-0.4042944206
+-0.06312989998
+-0.8212650744
+-0.9136556405
+1.817826413
+-0.3340629484
+0.9076586249
+-0.8367710427
+1.612728595
+1.514182131
+0.2310186822
+-1.099531593
+0.08700138573
+0.04730450004
+0.2396239141
+-0.9782206162
+-1.523000136
+0.1623630374
+-0.01029131633
+0.002075021919
+1.026800579
+-1.475160483
+1.010693716
+-0.74322754
+-0.3952220659
+-0.8257793633
+0.08961985784
+-1.905817875
+-0.5680857203
+-0.5157565453
+1.263930202
+0.1506981438
+0.6955183115
+0.005938814387
+-1.048900371
+0.9072048682
+-0.8454413421
+-0.5262433408
+0.1820997788
+0.9455387894
+-0.2013845433
+1.510524732
+-0.5714784151
+0.665589287
+0.003616300951
+1.546671838
+0.2144060133
+-1.877312818
+1.08833521
+-0.08154851334
+-0.5530619111
+1.222964762
+-0.331308636
+0.5999867432
+-0.7683833193
+-0.8361301268
+1.810581761
+-0.7870327373
+-0.5847709364
+-1.708320792
+1.629982244
+0.3979983233
+0.2377796335
+0.9751384106
+-1.329336569
+-0.5410467819
+-0.09143773125
+-1.548471051
+1.311427126
+-0.01842905019
+-0.3232886363
+0.2362254896
+-0.7525822843
+0.04511300381
+3.427538547
+0.6046820302
+1.66831106
+-0.3550831225
+-0.7515689901
+0.3097035894
+-1.341704943
+-2.306957765
+0.731592505
+0.641338145
+0.8338512218
+0.02816987319
+1.9783727
+-0.08732818706
+-0.5539647408
+-3.006498715
+-0.04716586765
+0.8318777851
+0.006861198539
+1.124221734
+2.294881166
+-0.1733502084
+1.23125356
+-1.585852575
+1.031319104
+0.06349048039
+-0.2213904983
+-0.16339892
+-0.1563034683
+-0.3088029093
+0.1986729701
+-0.1742921341
+-1.155792479
+0.417053889
+-0.6078679484
+1.047986615
+-0.03382696657
+0.1270239533
+-2.049231913
+-1.256680128
+0.9396143935
+-0.733816726
+-0.532437659
+-0.2779399673
+1.363742593
+0.3741379978
+1.310264603
+-0.2677477975
+0.2131762638
+-1.203243455
+1.178031235
+0.1086482037
+0.0441290988
+0.3383155392
+1.446792074
+-0.2144951065
+1.663038958
+-0.8515225844
+0.422184608
+2.009218561
+-0.4898147313
+0.2452558534
+0.8775050628
+-0.1378996989
+-1.500353276
+-1.055959359
+0.5809325889
+0.89151532
+0.7845553343
+1.146432014
+0.07198519494
+0.2082331707
+-1.518868659
+0.3173289537
+0.6126807854
+-0.5832112948
+0.6440016989
+-1.815888845
+0.7510995978
+0.3002843236
+2.110608534
+1.413085537
+1.506980359
+0.8173970964
+0.6466156139
+-1.181631315
+-0.3350913004
+1.826728471
+-1.456164449
+-0.4502818348
+-1.419234081
+1.450951814
+-0.5657813285
+1.544534366
+-0.4137624937
+-0.5041320802
+1.278529189
+0.9388317264
+-2.716280309
+0.4511407899
+0.6001668783
+0.2098069309
+-0.6576580038
+0.02840844464
+-0.398061481
+0.2113230276
+-0.2023942629
+-0.6219281582
+0.1637704463
+0.8024389102
+0.2890058924
+-0.5536423899
+0.3362540204
+1.069792392
+1.595404169
+1.207552584
+0.5373801934
+-1.009124031
+-1.365552727
+-0.2023812137
+-1.409184782
+-0.7847847291
+-0.1701223048
+-0.4842104217
+-0.3279180563
+-1.328004627
+0.2314667598
+0.9965080511
+-0.5481374678
+0.7257553442
+2.662726714
+-0.09181103013
+0.6512100079
+0.1967700901
+0.9696237292
+-1.718649877
+-1.056956768
+0.1434639281
+0.8869625662
+0.1305240259
+-1.664573251
+-0.8236132765
+-0.7947061176
+0.388991945
+-0.7620389598
+-0.6808071048
+1.084747577
+1.335316277
+-0.4132748053
+0.4249026723
+-1.881483799
+0.1983270594
+1.18997805
+0.5267817053
+0.1010608444
+-0.3886429735
+-0.6467920156
+-0.1790824052
+-1.551441138
+1.610458978
+0.5642106404
+-0.1024370342
+-0.6198047748
+-0.07033962016
+0.7977949423
+1.011447891
+-0.9036909301
+-0.9735287602
+2.078229963
+1.136592858
+0.7085199408
+-0.1386462437
+0.9240203383
+-1.273233176
+1.531768422
+-0.03577222474
+0.7908615022
+0.6462177749
+-0.1315709113
+-0.1753663551
+1.221583141
+1.026497405
+-1.77223112
+-1.692405737
+-0.9462206204
+-0.8935453983
+-1.118525873
+0.2721106433
+-0.4637044471
+1.206124622
+1.452877766
+-0.0286832375
+1.683457949
+0.02421431014
+-0.4347906467
+0.06478573929
+0.944860002
+-1.614460973
+-0.2085993222
+0.2974056603
+0.3630846652
+-0.3684363433
+0.4887857426
+0.292121618
+-0.5919081135
+2.181598629
+0.439550206
+-0.3311833502
+-0.5717190335
+1.029408918
+0.1020597911
+2.548112698
+-0.435924123
+-1.242606938
+-0.02769845883
+0.1750674588
+-2.118450635
+-0.3091685144
+-0.3684154414
+-0.3687635362
+-0.6302257476
+-1.343192543
+0.7580380514
+-0.583840844
+-1.023701452
+-0.7599342678
+-0.4723232397
+0.1086471247
+0.6683389864
+-0.953179498
+-0.4792973976
+-1.345507728
+-3.392299993
+0.1557939307
+1.520003518
+0.5220832534
+-0.5070599561
+0.09647914261
+-1.174820101
+-0.122292358
+-0.4277092531
+-0.8527142321
+0.4056522298
+2.599867164
+1.665449506
+-0.07207302132
+0.8841146547
+0.8627074341
+-0.6475380257
+0.6439040735
+-1.440992099
+-0.8052983919
+0.2387528704
+-0.4147876624
+1.756478643
+0.6480404346
+-0.3820381212
+-0.4705797131
+0.1869706082
+-1.055531289
+0.5956119533
+-1.37530195
+0.623010196
+-0.164594732
+0.4146135181
+-1.012585925
+0.2449852071
+2.412347742
+-0.4572167525
+0.3173998603
+1.50556695
+0.7617041449
+0.4318854841
+-1.013689273
+-1.277588372
+0.05343244068
+-0.4632358553
+-0.01905821378
+0.205656674
+-0.6764278388
+0.494103026
+1.858556189
+-1.009340987
+-0.4695463585
+-0.04961065868
+1.140459674
+-1.186382001
+-1.065148104
+-2.163661013
+-0.4403622132
+0.680145766
+1.065224709
+0.3571536613
+-0.6009569794
+0.7064716137
+0.2043185906
+-1.920705599
+-1.228094833
+1.511865305
+0.322205083
+-1.374794389
+0.8199531081
+1.06143496
+-0.4350340295
+0.6576820964
+-3.740100638
+0.9735767952
+1.175155392
+-1.124702715
+0.2820853995
+-0.338120543
+-0.1025294808
+-0.4248804445
+-1.332295467
+1.890403703
+-0.3103108496
+0.1047550443
+-1.00940058
+-1.036867161
+0.4125984151
+0.5263920802
+0.8779241693
+1.103774002
+-0.2102075405
+-0.444203064
+0.7468138328
+-0.6374392034
+0.8717584959
+0.3745002872
+1.155026435
+0.6703916888
+-1.054445824
+-0.8656336416
+0.732485297
+1.907055842
+-1.322811701
+0.02321160433
+0.2816745575
+-1.525777512
+0.4781249964
+-0.09312279205
+-2.096557481
+1.621727978
+-0.8632082191
+-1.282503414
+0.4201416222
+0.5574867959
+0.7364114037
+-0.3860033622
+-0.01091433789
+-0.7308067632
+-1.310197306
+1.079130649
+-0.102762685
+-0.1823142554
+-1.999267592
+-0.1783711043
+-0.8424944971
+-0.1746136531
+-0.2192441519
+-0.4464647913
+0.9388386429
+0.4470541523
+1.127154514
+-1.32482737
+-0.6489559274
+-0.04028081832
+-0.4066389699
+-0.0792577255
+-1.182103399
+-0.7161780573
+-1.641553955
+-0.8900255518
+0.6941767204
+-0.2142068848
+1.505753239
+-0.5955338743
+0.1190710809
+-1.21325233
+2.60067187
+-0.1786205987
+0.8296298403
+0.4133850209
+-0.5838788148
+-1.330901282
+0.1561431245
+-0.5567897444
+-0.1555043015
+0.6513020588
+0.07824115584
+0.3771162974
+0.1500465761
+-1.467249333
+1.396062196
+1.175852296
+-1.136164854
+0.5053006114
+-0.6620242702
+-0.7469163371
+-0.004841661335
+1.74766823
+1.057957561
+0.6052213583
+-1.150605636
+2.554449419
+0.8737310457
+-2.34883742
+0.3994743352
+-0.4886947159
+0.4099823559
+0.4006403668
+-0.9185190765
+1.825885752
+0.1997846214
+0.9413479065
+1.351423565
+-0.738157598
+-0.9117684848
+1.121907349
+1.392837433
+-1.377018571
+2.011243186
+-0.2355033143
+0.6917845285
+0.5643882091
+-0.9713423198
+-0.8640481389
+-2.083592339
+-1.151150136
+-1.482475961
+0.04019051577
+1.369402153
+-0.02714493067
+0.3388541622
+0.7780035434
+0.679709441
+-0.3858315001
+-1.463345061
+-0.42980551
+0.06295935526
+-0.8716452128
+0.3619607107
+-0.2927120959
+0.6218215275
+-0.8032394762
+-0.9219676593
+1.774056338
+0.02875623771
+0.5529638494
+-1.098422253
+-0.3772644555
+0.6821694828
+1.56561586
+-0.7244850748
+-0.8029174114
+-0.02266894034
+-1.52439515
+-0.03013330648
+-0.06472838462
+0.7247491503
+1.414609743
+0.5698443178
+0.741551051
+0.05227895113
+-0.3597445765
+-1.995976869
+-0.8862208192
+0.2172666847
+-1.645593724
+0.2428898228
+-0.4008347103
+-1.021559853
+-0.4700243167
+0.7287815213
+0.8855011096
+-1.937021407
+-0.1494840121
+0.9138846583
+-0.2578948596
+0.1088152709
+-1.495410875
+-0.4800336568
+1.828775429
+-0.7880680345
+-1.440632343
+0.1494717586
+0.7886293331
+1.193810491
+-0.5177226421
+0.2224755766
+0.5443548783
+0.6492105278
+-0.547202744
+1.712724931
+-0.6872970226
+0.7078721587
+-0.02191123615
+-0.587218564
+-0.642851299
+-0.5863469109
+-0.4468710651
+-1.018885599
+0.6974097032
+-0.7035153156
+-0.6150208487
+0.4886905912
+-0.1079619431
+-1.421903635
+-0.9360094985
+-0.1965572444
+-0.5749878374
+0.7504825373
+-0.764402029
+-0.967127071
+-1.010546209
+0.406657247
+0.4834717261
+-1.672444588
+0.6220751965
+0.8609732705
+-1.690997762
+-0.6904314294
+1.428892424
+1.006101706
+0.02479265925
+0.5012493963
+2.112019624
+0.5027969735
+-1.220808861
+1.364939
+-0.8709388906
+0.9939022358
+0.656270661
+0.889513553
+1.540932975
+-1.465914329
+-0.06958855494
+1.946049503
+0.9763817445
+0.1771583373
+-1.02317313
+0.106720493
+-0.9118812985
+-1.468366956
+0.5764787031
+0.06530560534
+-0.7735128028
+0.394948189
+-0.5038898878
+1.779559084
+-0.03057244437
+1.577088212
+-0.8128021008
+0.6133491654
+1.843699976
+0.2710909822
+1.136447627
+-1.738331868
+0.7071347443
+0.03038613146
+0.7650019774
+0.867665218
+-2.256250118
+-0.4436027396
+-0.6700232806
+0.15216419
+-1.940533397
+-1.090508667
+1.001920704
+0.1768924461
+-1.088014541
+-0.2532173671
+1.098273058
+-1.839566786
+-0.2114286135
+-0.2296632433
+0.1869794145
+0.5037794662
+1.910342502
+0.5537811944
+-0.5874814673
+1.257949943
+-0.8586683981
+0.4361870953
+1.571463051
+1.077314881
+0.8110896767
+-2.231537639
+-0.1010025173
+-0.5873750665
+1.324868271
+0.8406484781
+0.2611061816
+0.7944416483
+-0.6496164865
+0.6342845104
+0.09500266247
+-1.683206807
+0.344046138
+0.7071580306
+1.193414585
+0.5273885276
+1.006703924
+-1.732327332
+-0.3734121629
+-0.1425103971
+-0.3297423648
+-0.0890421195
+-0.5773962487
+0.7361654792
+-0.9912055485
+0.1251746117
+0.07315271317
+0.1439372344
+-0.9477243177
+1.399229925
+-0.2261237264
+-1.438854165
+0.8013010183
+-0.003331445934
+-0.09694155766
+-0.09587145005
+0.3954369639
+-0.05324304213
+-0.7734995825
+-1.419185508
+0.3034519326
+-1.518206705
+1.119707725
+-0.9538609618
+-0.849614022
+-0.981899693
+-1.363077668
+-0.7725985597
+-0.2836254523
+-2.327604043
+-2.445227491
+-0.7158649273
+0.8833968425
+-1.300439857
+-0.07633908408
+1.430556816
+-1.323408583
+-0.4383561662
+-0.7431524812
+0.891967582
+0.4638727652
+0.6176608467
+2.496417063
+1.629475223
+-0.09904470169
+-0.2019919553
+-1.448825889
+-1.714164687
+-0.04964157078
+-1.299395463
+0.6253554294
+-0.7917192877
+-0.5829433945
+-1.552680541
+2.110153524
+0.758829549
+-0.7099302411
+0.1511470321
+1.323091308
+-0.9278250742
+1.906598683
+-1.032174894
+-0.1773614833
+-1.650378396
+-2.538511126
+1.010090781
+0.08570209201
+-1.73386098
+-1.640601205
+1.1453614
+-0.1505951085
+1.431443247
+0.6365867682
+-0.06656284755
+0.03232998077
+-0.5550736472
+0.09778610923
+-0.06098498201
+0.8375166727
+-0.1634184411
+0.8235554919
+0.9206322908
+0.180762607
+-1.312968334
+-0.1604767061
+-1.906074646
+-1.206621621
+0.7304183332
+0.4948927894
+-0.003208878435
+-0.302433157
+-0.7394009462
+-0.5128120829
+0.9652515173
+0.4766792574
+-1.371216494
+0.1988528426
+0.1399628297
+1.648673473
+-1.757551749
+-0.7831295391
+0.9736258362
+-1.110932224
+2.385621632
+-1.178944222
+0.02912214522
+0.559547558
+0.8810371425
+0.7152084848
+-0.4620775363
+0.9132070056
+-0.7546524878
+-0.5349771427
+0.4566424612
+1.509576958
+-0.2281712374
+-0.8903415324
+1.209771907
+-1.264800032
+1.838181489
+-0.9840826885
+0.6409484468
+0.9266912255
+0.7850340545
+0.2270026376
+0.04952955187
+-1.653180501
+-0.7808196377
+0.7246446874
+0.6633691666
+-1.037881306
+0.3469790199
+0.2520309886
+1.750918842
+-0.4184011597
+-0.5198572681
+-0.9234429683
+-0.9992784708
+0.3749483616
+-0.7043411391
+1.074703858
+-0.6272990613
+1.533995675
+0.4177254579
+0.2583836264
+-1.150428563
+0.3291141862
+0.04552197652
+0.6320826034
+-0.5108472983
+-1.453629876
+0.2752215989
+0.1397872467
+0.2438923605
+1.005650162
+-0.9396406328
+-2.381750138
+0.4750270023
+0.4059125202
+-0.4770563058
+0.1705982016
+-1.04778081
+-2.106197212
+-1.692911448
+0.04236113988
+1.382710415
+-0.3895183883
+0.8139379102
+-0.5943319715
+-0.05543902288
+0.7965607239
+0.1331798851
+-0.5416783487
+-0.8653023635
+-0.09252812492
+1.182102093
+-1.570654594
+0.8593307615
+0.2836469928
+-0.9691122669
+-0.01837372912
+-0.2040354467
+-0.9477403649
+-0.5394351099
+-1.256287301
+-2.071523587
+0.1512364377
+1.04448945
+1.633349061
+-1.111378548
+2.147365165
+1.526306733
+1.423475034
+-0.7856663926
+-0.5622516251
+-1.938357418
+0.1911592367
+-0.3936029239
+0.1617906881
+-0.8345180353
+0.6728704681
+0.3431881096
+-1.14412308
+-0.04588794551
+0.284684501
+2.008441556
+0.0957808471
+-0.9404089972
+-0.3162630518
+-0.03122346587
+-0.1335952886
+-1.841471893
+-0.3315768952
+-0.6933088946
+-0.2605129612
+2.120962405
+-0.8322906074
+1.437941004
+1.160618144
+0.683497819
+0.003110418371
+0.6543934209
+-0.4499197782
+-0.5464591314
+-0.7478616721
+0.2739015909
+-0.209770582
+-0.239585066
+1.420228813
+-0.7047485118
+0.7353648953
+-0.5219276171
+-1.592195026
+-1.425950448
+-0.4915523726
+0.6296114897
+0.6417863943
+-0.2406871527
+0.6184217089
+0.07626311008
+-0.2614903192
+0.8547312665
+1.1878939
+1.016027393
+-0.306872961
+0.5677076279
+-2.129245672
+0.1950669227
+0.3610023657
+0.151975199
+-0.22227273
+1.304773186
+-0.09323770074
+-0.1395379355
+-0.2409367465
+1.034105379
+-0.2924596238
+-0.834349368
+-0.1087585416
+1.707713758
+-0.3006861149
+0.6157716342
+-0.2781107388
+-0.2767468147
+-0.5608413838
+-1.216304059
+-0.1097816284
+0.7184557526
+1.576192964
+0.4418694963
+-0.8168610783
+0.7455045999
+0.4540291739
+1.398363191
+2.089610456
+1.214607755
+-0.3927581988
+-0.1592295437
+1.157940529
+-0.5076931359
+-0.1404834644
+0.6343402407
+1.070606055
+0.2229107692
+-2.892519822
+0.3393659647
+-0.3120491953
+-0.9759209971
+0.02413016612
+1.12046415
+-1.129877229
+1.589922991
+0.9787301007
+0.9341636251
+-0.8147085942
+-0.2512424472
+-0.3828348717
+0.0003409579337
+-0.06220480066
+-0.3173488808
+-0.1779273461
+-0.211620317
+0.2674838631
+-1.651817035
+0.4865783488
+1.697271698
+1.072500847
+-0.9458972265
+1.044608024
+2.289627853
+-0.2425562595
+0.7210319213
+2.2993804
+1.030295628
+1.550720601
+-1.095225556
+0.235620858
+0.3919691026
+0.5642871293
+0.7895075464
+0.1561750573
+-1.312394136
+1.066272415
+0.3788603287
+-1.17861663
+0.7589958208
+0.5529800125
+0.5370345477
+-0.2868352082
+1.634405645
+0.571226631
+-0.7899540601
+-1.54275794
+-0.7673321828
+-2.369623293
+-0.260559844
+0.1289570506
+-1.207666435
+-0.5454435908
+1.55328265
+0.1072913357
+1.535343544
+-0.1849514171
+-0.1767827133
+-2.199254045
+0.7292887472
+1.10055824
+-0.3423680439
+-0.3103042253
+0.813036378
+-0.7362970899
+-0.782324319
+0.3170981662
+-0.606251348
+0.6110578841
+-0.9203095152
+1.509508919
+0.6564636843
+0.0658511791
+-0.8736306325
+-1.0577539
+-0.8972370307
+-1.432203299
+1.340430318
+0.3420748391
+1.07062833
+1.739065035
+1.306606023
+0.4496167915
+-0.4110504458
+0.749299555
+0.2111377691
+-0.2606511407
+-0.515198371
+1.079216776
+1.477462787
+-0.2751087238
+-0.4370077128
+0.6981697387
+-0.6351763985
+0.603676687
+1.736929606
+-0.4178344361
+0.0245132322
+1.989693078
+-0.373168313
+0.1410367315
+-0.9418154744
+-0.7028345962
+-1.378836972
+2.925249584
+0.5717519912
+-0.0458755492
+-1.057064291
+-1.824693063
+0.2417382883
+-0.1451518191
+0.5019926639
+0.6923288411
+1.012275043
+-0.04217711272
+0.6220104648
+-0.4075361282
+-0.8514463986
+-0.3381832688
+0.7689677405
+0.6064976685
+-0.01261314233
+0.3224277229
+1.607508343
+-1.802410108
+-1.255067896
+-0.01303375941
+0.7003573372
+-0.2152732345
+0.9030884549
+-3.007437204
+-2.330467258
+-0.5678032877
+2.667322089
+-6.835257172e-05
+-2.241448968
+-0.3600297328
+0.6174938816
+0.9622223812
+0.4705489112
+-0.2358042054
+0.6787892942
+1.153618032
+-0.5547328058
+-0.1236007614
+-0.136097706
+-1.705542406
+-1.257096424
+-2.318624988
+0.08433792518
+-0.2976732523
+-0.3390328757
+-0.0344037492
+0.5192691886
+-0.6725830977
+1.173611226
+-1.592229488
+-0.0136492008
+-0.0983454902
+0.8498770749
+-0.4949857099
+1.068730858
+-0.2338664106
+-0.1018051067
+-0.1490771627
+0.6980962425
+0.8531481645
+-0.6047407961
+-1.408890962
+-0.9811016162
+0.165183068
+-0.01664585551
+0.1409326707
+-0.7251721301
+0.7957408151
+-0.1764385413
+-1.63343453
+0.1553497798
+0.5474259983
+0.1437603112
+0.1302209792
+0.2271719515
+-1.053729128
+1.531753024
+-0.3264935837
+1.46684517
+-0.5541288675
+0.9666753728
+0.2401796487
+0.1003144336
+-0.9387914569
+1.205818556
+0.4189720108
+-0.09025006998
+1.207374987
+0.08858019739
+2.209805589
+1.01667712
+-0.3307090758
+1.358381888
+0.06085638453
+2.00589144
+0.08165836318
+-0.07920936567
+0.09396829976
+0.3995066831
+1.54931126
+0.2928569206
+-0.106714925
+-0.4934600211
+0.7856812958
+-0.5543451306
+-1.168830322
+-0.9422464403
+-0.4649276044
+-0.1244343714
+1.05317207
+-0.5772435517
+1.197128452
+-1.637706287
+2.634602801
+-1.586423925
+0.1980870385
+-0.2175800174
+-0.7853147218
+0.6764086845
+1.057214164
+-0.1721861102
+1.209384912
+0.064057692
+-1.063779967
+-0.07918750581
+-0.5274960663
+0.4602147716
+-0.3991668923
+-0.07418319535
+-1.085357442
+1.069356468
+-0.3556284235
+-1.069477111
+2.631474302
+-1.412974374
+0.5074303058
+-2.163665561
+0.3085227496
+0.18811352
+-0.2523779687
+-1.36354401
+-0.8585309452
+-0.8065607745
+-1.174123629
+-0.9480458445
+1.435125891
+0.3912090122
+1.33082765
+-0.9888421037
+-0.4313032377
+-1.737049554
+-1.190455732
+-0.2911131477
+-0.4206063529
+1.777353776
+0.1080465735
+-0.2650998837
+0.4594625921
+0.02687855274
+-1.085703537
+-0.626887744
+1.398956883
+1.303787701
+0.2572353183
+1.019485232
+1.642809234
+-0.4417257122
+0.1843148398
+0.221090903
+-0.8268135317
+0.4464316281
+-1.143678019
+0.1022599852
+-0.2689138918
+0.4295471169
+-1.354861213
+-0.5210994754
+1.883164147
+-0.1348460509
+0.06814415818
+-0.6695713849
+0.04537092684
+0.3797713865
+-0.4755639822
+-0.2494963004
+-0.1664597267
+0.2957374388
+1.130517335
+-0.6693256987
+0.8059806605
+0.8046057241
+0.2548323453
+1.081651753
+0.09906836308
+0.107816287
+-0.173552449
+-0.2703637915
+-0.210498149
+-1.860821174
+0.6002736548
+-0.322256403
+-1.468865877
+0.9703219872
+-0.9755422379
+0.8594921358
+-0.7415559724
+0.9588875888
+1.898921023
+-1.59506264
+-0.2549622084
+0.9568085536
+0.2796890697
+0.2816965133
+0.9156034382
+-0.7888602568
+-1.283046959
+-0.7138098179
+1.333552162
+-0.7639064506
+-1.5349581
+1.156781001
+-0.5121814114
+-0.4490087586
+-1.393872356
+0.5303887363
+0.5679660232
+-0.5504558559
+-1.193732452
+-1.892100018
+0.5680582929
+2.596495281
+0.4043229112
+0.6083219327
+0.1465612178
+0.3495766044
+-0.2330164574
+0.2941886439
+-0.8010068496
+-1.240693282
+0.1112386578
+0.09816224346
+-1.174422442
+-0.5514314181
+-0.3500730281
+0.7157834832
+0.1586675489
+-0.167610079
+-1.592215885
+0.2704105592
+0.5291992449
+2.198112496
+0.446333436
+0.9241106958
+0.933660544
+-1.812702175
+-0.1246180173
+-0.1696453418
+-0.459969525
+0.8565337952
+1.626720776
+-0.924469624
+-0.1559941953
+0.4249975138
+-0.7795514073
+-2.116536177
+-0.2150630257
+-1.104090709
+-1.938458955
+0.9018970309
+1.63548129
+0.5289262473
+0.4159639271
+0.4340830146
+-0.07760796518
+0.4491689918
+-0.1313019075
+-0.7509349821
+1.277651785
+0.7487615524
+2.657273049
+-0.8186072751
+-1.445151161
+1.341763191
+-0.1051895555
+1.356787245
+2.014014093
+-1.372629648
+-0.8574284009
+-1.68128845
+-0.1505986542
+-0.7210639968
+-1.940882428
+0.09990505959
+1.281836445
+-0.9700794014
+1.245376549
+0.6968713741
+-0.06455201896
+-1.057840325
+-0.4692222763
+2.128395483
+-0.3892407948
+0.5696129373
+-0.2742994634
+-1.098416858
+0.689720862
+1.649248242
+1.065132641
+1.609044976
+0.1430166743
+-0.002557095205
+0.5276804772
+-0.2226212591
+-0.49148502
+-1.593839509
+1.018373096
+0.04968521594
+-1.601848754
+-1.818410707
+1.771656668
+1.075603283
+0.3834028007
+-1.46699746
+-0.2647817628
+-1.032079012
+-0.3644350805
+-0.2168742109
+-0.7252820469
+-1.393769451
+0.7387053178
+0.2493469356
+0.5485517784
+1.134898199
+1.102947403
+1.663230234
+0.9258661961
+0.4591159462
+-0.4123454483
+-1.289731349
+0.5902590079
+-0.292060612
+1.99762629
+-0.5045529733
+0.2800784998
+0.2846641526
+-1.47323388
+-0.765097168
+-1.986660275
+0.2745036203
+0.1866807605
+0.7437629614
+-0.7251887021
+-1.059525574
+-0.3219626749
+0.413255971
+-1.08299413
+0.3818486738
+0.4902530856
+0.8203164981
+-0.3574656687
+0.08713774995
+1.228501896
+-0.6999685201
+-0.03824362281
+2.0060264
+0.3040466665
+0.9432737373
+0.3004783719
+1.006933825
+0.484680288
+-0.2194198158
+-0.2402843829
+-0.2284196163
+0.6577883805
+0.02437209761
+-0.01673828835
+0.08044517529
+0.2744990787
+1.563247622
+-0.9265796978
+1.078571286
+-0.4262203126
+-0.3350518318
+-0.1482925713
+-1.354584619
+-0.6348443273
+-0.1358720669
+-0.596770821
+1.29708162
+-0.8241472688
+-0.1672525696
+-0.6040330856
+1.251292333
+-1.342866619
+0.4152507926
+1.196869744
+1.407703829
+0.1768872615
+1.728331912
+-0.9516835539
+-0.5515766876
+-0.5391194349
+0.2572713595
+-2.113931949
+0.9485329222
+1.231276087
+-0.2881865316
+1.258196937
+0.5737561984
+-0.976874641
+-0.6910295239
+-0.5072914485
+0.3287530761
+0.9405872633
+0.6720070138
+-0.6202755832
+0.1128496333
+-0.6132038126
+1.582270684
+-0.3844380959
+-0.06737499859
+-0.2834100092
+-1.199517948
+-0.07903467741
+0.8218730067
+-0.1707502719
+-1.651030727
+-0.2086256635
+-0.7109470694
+0.05234685382
+0.965359669
+-0.7002084789
+-0.1555075449
+0.04636141669
+-1.427675412
+0.3529338203
+-0.2941586241
+-0.9563119971
+-1.345773267
+-0.04249810979
+0.8205020637
+0.4909951727
+-1.178042323
+-0.3410792095
+0.458680126
+1.192808645
+1.507615527
+0.2159299178
+1.076200324
+-1.399355971
+0.5086227359
+1.592425707
+-0.04144268141
+1.375941579
+1.355604129
+0.6253251786
+1.675501757
+-0.290196131
+-0.2289954151
+1.524646431
+0.3891948407
+-1.242944305
+0.02709897646
+2.979976172
+-2.368803453
+1.322194158
+-0.5086752519
+0.5284387653
+0.8252167223
+-1.348431601
+-1.558124144
+-0.8698654759
+-0.0978383329
+-1.682501149
+0.6562595585
+0.5922316836
+0.2983350853
+0.2247846597
+-1.31887791
+-0.3159044358
+0.04167751489
+0.7735174004
+0.1309817056
+1.667159218
+0.6244473193
+0.0545613847
+0.4523994181
+1.614796379
+-1.126840855
+-0.3600841186
+-0.3496910244
+-0.6707585163
+-0.9565800088
+0.597939206
+-0.4567743938
+0.6110959459
+-0.4604537161
+-1.26201921
+1.198047275
+1.798412082
+0.2246788553
+0.5230853256
+1.736767044
+0.5086534883
+1.165038846
+0.7131203165
+1.319976904
+0.3111094173
+0.2989323795
+0.6086726993
+-1.349546356
+-0.8733163388
+1.361041846
+1.420654761
+0.4303741636
+-0.9519916773
+1.202767861
+0.07992626502
+-1.170261152
+0.6195428243
+0.8924890046
+0.8761147661
+-0.3095809122
+-0.5196042391
+-1.306871643
+1.519598853
+0.2128613872
+1.566497881
+-0.2589054009
+1.711488988
+-1.820816199
+0.1634945168
+-0.8131170228
+-0.6053545796
+-1.327523805
+-0.6441716148
+1.908883435
+-0.5635453097
+1.082472554
+-1.951910828
+2.441216159
+-0.01728508587
+0.9122820276
+1.239658497
+-0.5733674006
+0.4248894869
+-0.2712600152
+-0.6835675449
+-1.53743761
+-0.1013744279
+0.7466657174
+0.9291818102
+0.2294180076
+0.4144058767
+0.3097238249
+-0.7374561939
+-1.536919883
+-0.5622548292
+-1.599511123
+0.8243899303
+2.491486202
+1.011855164
+-0.2812379394
+0.0167065076
+1.153919669
+-0.6009150364
+0.1329372671
+-2.169974427
+-1.116558876
+-0.5693680057
+0.6362667001
+-0.7676492296
+0.6184794833
+0.1831612202
+1.859351273
+-1.075514635
+-2.019219711
+-2.437464458
+-0.1485635099
+1.151151462
+0.1853233834
+0.6584609262
+-0.0495361019
+0.2373988495
+-1.511580323
+1.932370333
+0.482422034
+-1.315783049
+-1.963615063
+0.5330681838
+-0.109323217
+-0.2831834195
+1.433743845
+-0.5686172403
+-0.849846463
+0.7244464968
+0.605898348
+-1.290258481
+0.7894331065
+1.960913744
+-0.3355398089
+-0.6076121853
+-0.727241881
+0.8514086712
+0.8884165802
+-1.111323311
+1.137844365
+1.275549279
+0.2945994118
+-2.185679526
+0.792377453
+-1.625041423
+0.7398307178
+1.014269108
+0.9582081003
+-2.615370926
+-0.7281308278
+0.7424984672
+-0.08214396012
+-1.524901873
+-0.4381790515
+-0.00539165887
+-1.712084862
+1.705586302
+0.8111898628
+0.1493609124
+-0.7354556815
+-0.3129665273
+-0.6534162143
+-0.991225737
+0.1489663807
+1.103323601
+-0.1900487986
+-0.4122638807
+0.1786201988
+0.781681153
+-0.5246404026
+-1.381096698
+0.9454761835
+-1.36169108
+0.5349876315
+-0.09595929741
+-0.8964068836
+1.387181436
+0.9973930615
+0.5764676374
+0.4400008385
+0.4754701045
+-0.9835773358
+-0.5619937118
+-1.641003219
+0.292282737
+1.433104891
+-0.3837113015
+0.2374925923
+-0.5327551666
+-0.4711798428
+-0.3400845292
+-1.463205664
+1.138598256
+-0.005024829728
+0.9715876972
+0.3023412237
+-0.8062357063
+-0.3169119479
+-1.586865203
+0.7886870841
+0.1372247743
+-0.7851805252
+-1.506570211
+-0.5764098366
+-1.107288422
+0.1352825315
+-1.052777616
+2.052293425
+0.9853089194
+-0.3728401179
+-1.486235803
+-0.1116613769
+-1.959615355
+1.060701248
+0.7912979476
+1.448644745
+-0.5566545089
+0.8055643494
+1.384040949
+-0.4356646962
+-0.7338418323
+1.348113189
+0.1454764264
+0.4252978849
+-0.08803982199
+-1.248473474
+1.104597222
+-2.029385923
+0.9979759185
+-0.2792384685
+-0.1876324515
+-0.5325407946
+0.5268504427
+0.4087450189
+1.611498491
+-0.1840722394
+-0.182061111
+-0.3537951808
+0.1039311058
+-0.4489805294
+1.155266385
+1.370400142
+-1.922386113
+-1.288860719
+-1.018783533
+0.6616163308
+-0.8920385309
+0.5518893919
+1.371329968
+0.7708854393
+-1.044818254
+-1.199904463
+-2.668061349
+0.490012075
+-1.255038975
+0.04239436481
+0.2307881867
+-1.309774407
+0.9433927362
+-1.035966666
+-0.594155961
+-1.182275708
+0.04903964579
+-0.6646436723
+2.270058792
+-0.64359406
+0.186373822
+-0.2803147586
+0.8866586019
+0.003909020718
+-1.461771323
+0.1988759325
+0.4399749188
+-1.279135306
+-1.042793746
+-0.6556071073
+0.2571542085
+-0.3568092725
+-2.252246858
+-0.7602755048
+1.135155932
+0.6326811103
+0.653863186
+-0.05606849802
+2.17299592
+-0.06873077694
+-0.2313193001
+-0.4723461811
+-0.3986878506
+0.7822806096
+-2.084000059
+-1.185218147
+1.400777645
+-0.7757635355
+-1.127581614
+-0.1672484122
+-0.7482985611
+0.2928707293
+-1.196331835
+1.499101181
+-1.310930207
+-0.08394658504
+0.05582081612
+0.2463919764
+-0.06060656209
+-0.00577934939
+-0.07000236575
+1.305683518
+-0.1253987556
+0.963553205
+-0.7322648281
+-0.002418791276
+-0.1301703861
+1.00047102
+-0.5866018873
+-0.6917225365
+-0.1560804144
+-0.02120338693
+-2.102350575
+-0.8584807889
+1.110172033
+-0.2545737742
+-0.241625732
+0.5702454148
+0.540535292
+1.739275432
+0.6312438027
+-0.4402845986
+0.05503659168
+0.7741043289
+0.9616688943
+-0.9026238579
+0.669783253
+1.767131582
+-0.1734208624
+0.01131026236
+-0.9254625126
+-1.061874016
+0.01153447608
+0.7880923674
+-0.2987428733
+1.105651176
+0.9078026106
+-0.3661470153
+0.7300938209
+-0.1293408695
+0.09294993604
+1.073858531
+2.438683997
+-1.396215366
+-0.3303312194
+1.160260071
+-0.2442410969
+-0.4293623631
+1.667689179
+-0.06083647244
+0.78729807
+-0.3093359006
+-1.558637629
+-0.511101349
+0.6837660364
+0.1929822709
+-0.7978610991
+2.063871602
+0.1178953845
+-0.9953600155
+1.299512412
+0.9166028721
+-0.5599342934
+0.6541744285
+0.7905471336
+0.4623413147
+0.1298543897
+-1.76807798
+-0.3233806066
+-0.05291453265
+-0.5833628357
+-0.3562459505
+0.7015071289
+-0.4987028796
+-1.696171997
+-0.6258284814
+-0.5355837099
+-0.1618913429
+-1.226760297
+-0.3106381133
+-0.8768604079
+0.7795471787
+-0.1935388323
+0.5475685449
+0.2768119254
+-1.284570662
+-0.04235953088
+1.669884346
+-1.610850419
+0.9478467544
+0.09864636329
+-1.510664175
+0.5734161904
+1.003454398
+-0.06099083141
+0.3071651347
+1.822392511
+-0.605417748
+1.828015342
+1.641788309
+-1.32529328
+0.1235409894
+0.06693232845
+1.293410425
+1.169078967
+1.51015942
+-1.619323338
+1.377155714
+0.5679165017
+-1.838672926
+1.31308259
+-1.107092176
+0.7729588616
+-0.586081885
+-0.2058396307
+0.4436039965
+-0.209698392
+-1.452172742
+0.3058028499
+-1.15251998
+0.5443555599
+-1.252269818
+0.1393335424
+0.3642078995
+2.013717346
+-1.937597409
+0.3161602004
+-1.26033622
+0.4786129106
+-0.1122477647
+0.7691809041
+1.416185686
+-0.3374639981
+-0.01337014051
+0.9041422843
+-0.5291411426
+0.4031643001
+0.8388589408
+-1.076187849
+-1.524972544
+0.1757129135
+0.8767262592
+-1.504966866
+0.4910938093
+-0.3653927066
+-0.1716035431
+1.031659056
+0.1405045335
+-0.8550847629
+-0.01225497533
+-0.233622232
+-0.2811496787
+1.179335274
+-0.6546878805
+-0.7931123829
+0.2504535469
+0.638912586
+-0.1338374418
+-1.23155163
+0.108746429
+2.424254866
+0.5663132943
+-1.662219944
+-0.9516455013
+0.09350069229
+0.5418270427
+-0.6956735567
+2.164172929
+0.537852533
+0.3326438661
+1.256946846
+0.2456189312
+-1.965461002
+-0.394222714
+-0.6392866783
+-0.3373064374
+0.114028629
+0.6925070537
+-0.7737633464
+-0.7652257592
+-0.07763974165
+0.5756703122
+0.5510339915
+0.6002933861
+1.109558263
+-0.3609852555
+1.12012863
+0.3345442465
+0.157896288
+1.801444469
+-0.3187448534
+-0.7662656342
+1.465150887
+-0.04485923404
+1.105298619
+0.398477532
+-1.752418925
+0.2810229619
+0.6246092118
+-0.07254627259
+0.6233510473
+1.192175387
+1.471532221
+0.7919710445
+-0.8447571011
+0.1241444385
+-0.7139037107
+-0.4604227912
+-0.4756816554
+-0.05339895834
+0.221879573
+2.083893314
+0.2475150154
+1.782746045
+-0.01348903793
+0.7679715
+-0.3554917036
+0.03621202909
+-0.7166434139
+0.6927424983
+-0.7791339891
+-0.2974212614
+0.2203360846
+0.4349841693
+0.5249035339
+-0.4737904621
+-1.359320125
+-2.259975675
+-0.893481094
+-0.6567153032
+-0.6929903587
+-0.8416537209
+0.4606203676
+-0.2749021593
+-0.1371530863
+-0.7862843723
+1.631779369
+-0.2760257412
+-2.351152818
+-0.77723356
+-1.328378381
+-1.401197199
+0.4626928764
+2.381686406
+-1.208985823
+-0.4188674451
+-0.7853214188
+-2.164551422
+1.14458119
+-0.9505017963
+0.7641232149
+1.31948977
+-0.1203246746
+-1.054309546
+-2.758927524
+0.6597554178
+2.143405511
+-0.4508769388
+0.4651074652
+-0.3877440161
+-0.606735568
+1.536558888
+0.1711568968
+0.01356321858
+0.1285218279
+0.1237851024
+-1.612686577
+-0.1699062624
+1.718791135
+0.795276066
+-0.5621861897
+0.1939502731
+1.260307602
+0.3326231472
+2.495994562
+0.3348724992
+0.2440851312
+-1.081474542
+-1.671210588
+1.029451505
+-0.3955523002
+-0.7647819716
+0.5640015095
+-0.6139293076
+0.7056366126
+0.2410723264
+-0.6252645479
+0.2575959708
+-1.476499899
+0.4396305183
+-0.5134104624
+-0.03690652138
+1.23406455
+0.03109393184
+-0.6546210378
+0.986429117
+-0.04555740023
+1.203282109
+-0.7458623287
+-0.297845612
+-0.9822353026
+-1.321825235
+0.1633568193
+-0.6249672367
+-0.7417124138
+0.1362227797
+-1.059449427
+-0.08097393918
+-0.524548182
+1.838265848
+-0.836071525
+-1.359157886
+-0.5534931728
+0.1547365699
+-0.8778612752
+-0.5545231382
+-1.275889165
+-0.847275598
+0.3394901405
+0.8867839385
+0.397000811
+0.9629596425
+-0.07972690031
+0.6448427961
+0.4046718508
+-0.02128299286
+-2.43813256
+-0.1657105447
+0.9223550871
+-0.8054891464
+1.81765869
+0.8265794684
+1.518517692
+1.76345327
+-2.100679593
+0.9573124042
+0.2478752677
+1.182571834
+0.9785193398
+-0.5731644277
+-0.9844460664
+-0.9941863535
+0.1693080979
+-0.9317142769
+-0.9543631613
+-0.6126065242
+0.3264756833
+-0.8015694952
+1.048546357
+-0.7815785222
+1.367483459
+-1.021425997
+-0.2009140889
+0.1025521059
+-0.9636093842
+-0.734632632
+0.2468834998
+-0.4661615991
+-0.5672651392
+-0.4167720921
+0.1828022208
+-0.8394173586
+1.663421148
+-1.8836456
+0.03907050718
+-0.148784845
+-0.3561755694
+-1.401371994
+0.6198907214
+-1.671563833
+0.5220121193
+-0.1027402908
+-0.5389942393
+-1.27838583
+-0.7213203242
+-2.351311158
+0.6171728021
+0.1380944122
+0.5125414846
+-1.201119875
+-0.5964149899
+0.5951352832
+0.2339069669
+1.100631415
+0.424735816
+0.3372429466
+0.1389364704
+1.405943713
+-0.4783534197
+-0.6449186383
+0.01315003381
+-0.0374759969
+-0.2436141413
+0.8794044166
+0.3872634759
+-0.5042549732
+2.15770143
+-0.5692856687
+0.5889863832
+-0.8519099644
+-0.5406210072
+-0.3512584465
+1.859205791
+0.1071278475
+0.1881214964
+-1.43877735
+0.2278479061
+-1.03017184
+-0.6761962199
+0.443995577
+-0.471159119
+1.51343987
+1.292071087
+0.1850506545
+0.07243496402
+-0.1809644267
+0.3238141037
+0.47004438
+-0.2543262113
+-1.164221344
+0.2567294397
+0.176871482
+-0.6741221784
+-0.05440258083
+-0.8167593068
+0.6026630287
+0.1571673597
+0.1848359132
+0.7246238245
+2.191634137
+0.03952924227
+0.5885300155
+1.086236517
+-0.09334515443
+0.8974225428
+1.254604909
+0.01241709678
+2.841767345
+-1.747250016
+-0.7727107227
+-1.164875349
+1.148886684
+0.2784065276
+-0.7488279283
+0.798761617
+-0.2916001429
+2.630056824
+-0.5040947031
+1.089087306
+-1.007032034
+0.5389986043
+-0.4499021065
+-1.300629967
+-2.050023879
+-0.2852370343
+0.9818706358
+0.03920587684
+-1.41615874
+1.410621544
+0.4247548702
+0.7822275046
+0.4471131897
+2.536914198
+0.1805239927
+-0.80061539
+1.07981962
+-2.182867358
+0.288310152
+-0.3787364472
+1.282981211
+0.04635227114
+-0.7552426416
+0.1391619729
+-1.308171118
+1.84741402
+-0.229899943
+0.6889461825
+-0.629216851
+0.4396181123
+-0.08364688794
+1.926554635
+-1.471741541
+-0.4133013066
+-0.508966835
+-1.231050023
+-0.1285655962
+0.8536369771
+-0.7277516839
+-0.01262911165
+0.4544115993
+0.5498104051
+-0.5179763784
+-2.4123617
+-0.4469912973
+2.069475392
+-0.9394243186
+-1.052124167
+0.2036963059
+0.007131192095
+-0.687050402
+-0.0155820042
+-0.1647448529
+0.372484387
+0.4417797155
+-1.082960287
+0.6957065866
+-0.2200885284
+-0.6384267063
+1.045045618
+-0.02753424037
+-0.3599655097
+-0.2629359747
+0.5287644176
+0.18291773
+0.6768316241
+-1.826345593
+1.130380221
+-0.08422947892
+0.5546888628
+1.397360647
+1.369847447
+-1.373074553
+1.01511976
+0.2647194541
+1.031522582
+-1.578458624
+-0.9907632507
+0.2567261024
+-0.8996278029
+-0.3867754069
+1.409772728
+2.229973913
+-0.1896184306
+0.9524666264
+0.1702094008
+0.9398848131
+0.5321619048
+-1.238774585
+1.289432042
+-0.8582060039
+-1.300797775
+1.198187094
+-0.3366500813
+0.8419474527
+0.543372249
+-0.9629876004
+-1.600955277
+1.757337302
+0.693595309
+1.465480371
+-0.1797384065
+1.243757959
+1.712569587
+-0.2490044967
+-0.2686403609
+0.0930381453
+-0.03756183525
+-2.660021918
+-0.9509128337
+0.2806393636
+0.2936806912
+0.2567313393
+-0.3014257053
+-2.033287105
+0.123043204
+0.2137270882
+-0.9075357201
+0.3526922732
+0.2563580222
+-0.5407764263
+-0.1236735389
+0.8370244296
+0.293087277
+-0.9313671593
+1.567160737
+1.161550735
+-0.816761298
+-0.718209712
+-0.6333760291
+0.5856393784
+0.6780885679
+0.5890314221
+0.712359334
+-1.284895581
+-0.5609303063
+-1.911416631
+0.8378915183
+1.015717399
+1.09531344
+-0.4000841543
+0.3343574778
+0.3863209839
+1.516668506
+-1.912468733
+0.7424203692
+-0.3382374676
+-0.3509817976
+0.6303770369
+0.4310825761
+-0.8497053825
+0.522137893
+0.4046062089
+1.650255781
+0.2492208338
+0.7841585066
+-1.482420028
+-0.4545456741
+-0.9722738355
+-0.05093478045
+1.707453491
+-1.725418378
+-0.3090016992
+-0.04537920898
+-0.5058188823
+1.387159764
+1.120771474
+1.012427104
+-0.30374029
+-0.1054088205
+0.5237683599
+0.1429743317
+-0.8187479977
+0.7458306672
+-2.110367032
+1.072823535
+1.731284713
+0.3593048255
+0.8765829451
+-0.02823928336
+-1.037402445
+1.34953063
+-0.8798107302
+2.214819474
+-0.3535363795
+0.06348368383
+0.006446871822
+0.4102476438
+-0.5776757573
+-0.3282353027
+1.212363279
+-1.431414262
+-0.6823901546
+-0.8864627248
+-0.1065689325
+0.06733013169
+-0.2074949102
+0.2912158513
+0.9534795601
+0.7978639387
+-0.1701406649
+0.2286783712
+-0.8701025898
+1.32221932
+0.1815055174
+-2.439409244
+-0.3474123079
+-0.9069853784
+0.9881507005
+-0.5943987762
+-0.6776932815
+-0.5054681365
+-1.756020965
+-1.463325445
+0.5323157008
+-0.8000277875
+1.168330783
+-1.04476766
+0.0635707662
+-0.3356823981
+-1.147647705
+0.1429802719
+-0.6482725503
+0.007225832547
+0.4359221872
+-0.8878523966
+2.465396497
+-0.5865577208
+0.7874836307
+-0.07721864165
+0.09066656379
+0.1741325205
+-0.7149444373
+-0.04345221255
+0.02397674245
+0.1674236956
+-0.3820293679
+-0.03261416612
+-1.281649115
+-0.2897256158
+-0.5946949801
+0.04305687415
+0.3749506778
+0.01211824933
+1.763482852
+-1.351047375
+1.188150216
+0.4915170062
+0.0009339975357
+-1.891359147
+0.4536544593
+-0.3723362159
+0.2312607064
+-1.413693397
+-0.5840505476
+-0.1064425321
+1.37620271
+-0.4251186367
+-1.907581855
+0.282737054
+1.49525381
+-0.2975981974
+-0.7461140108
+0.3224438994
+-1.408268593
+0.1460434099
+-0.15487881
+-0.2577507539
+-0.2077642602
+-0.6747340208
+-0.5161724477
+-0.7427643977
+0.2661053746
+0.06955885084
+-0.4860402119
+0.5244890318
+0.473070739
+1.76234312
+0.8991123085
+-0.01843229936
+-1.050405216
+0.2551665492
+-1.187092472
+0.6593571595
+-0.3136428669
+1.217696973
+-1.087465513
+-0.05153894243
+0.2061297994
+-0.6265270449
+1.3921668
+2.825770501
+1.033557277
+-0.8086478393
+-1.090127501
+-0.3106675875
+-0.1632628504
+-0.4603413131
+-1.33414116
+0.5154522115
+-0.4899453246
+0.3032837589
+2.452996396
+-1.873634339
+-0.06810869031
+0.05722701441
+0.004421279633
+-0.06535903409
+0.2338360598
+-1.13919986
+-0.01039986911
+-0.5209393967
+-1.08922121
+-0.3462033363
+-1.845407219
+-2.598922256
+0.1982216615
+-0.4841802539
+0.2070287729
+0.7549870771
+1.359420259
+0.6960720447
+0.6822013885
+-0.01121415822
+1.344760397
+-0.8314923993
+-0.4079718174
+-1.330803886
+0.3525986211
+-0.5378847497
+0.3934444305
+0.2865182705
+2.042536234
+-0.9194611841
+0.1146700292
+-0.1374237037
+1.365526925
+-0.2616383474
+-1.286240911
+-1.65465749
+0.03723273987
+1.270301301
+-0.1432766116
+0.7952552146
+-0.07207247556
+-0.7424240057
+1.225653944
+-2.205388107
+-0.5306376232
+0.1682143775
+-0.9688461423
+0.3096540232
+0.9401078688
+-0.1633903451
+-0.3208823116
+-0.4034307865
+-0.6640667201
+-0.1162874536
+-0.416404486
+-0.2106245546
+2.611800024
+-0.8170961158
+0.2296934544
+0.1352863841
+2.015309468
+-0.9835947913
+-0.03983987995
+-0.7099856027
+0.2519035957
+1.010051054
+-0.7469947409
+-0.2271399647
+0.8424672698
+-0.002845333969
+0.05731926743
+-0.7911547787
+1.511507468
+-0.4292039148
+-0.2814901286
+-0.2986505074
+0.9713628841
+1.165934145
+-0.1845057212
+0.006585184619
+0.5065482855
+0.1957827907
+0.7852159775
+1.099250822
+-0.6381587884
+-0.2258110853
+-0.05189087299
+-0.4910358802
+-2.24599002
+-0.7985108706
+-0.8093937153
+0.2404313374
+0.4376957791
+0.3021634276
+0.2768120252
+-0.9123110483
+-1.463643725
+0.8011099931
+-1.47759691
+1.960286223
+0.291998361
+0.1149028829
+0.3892951878
+-0.4618502407
+0.7220209628
+-0.1333760091
+-0.8379451717
+0.4440839666
+2.723573491
+-1.115825123
+-0.22775445
+1.331712985
+-0.4921458209
+1.359046074
+1.08477266
+0.01561602102
+-0.1734282504
+0.9402840405
+-0.7774642544
+0.7608964924
+1.401752612
+1.231653333
+1.001158121
+-0.9780515721
+0.6779560192
+-0.06946407144
+-1.057361033
+-0.1401209543
+-1.433495224
+-0.1790812162
+-0.1230426356
+0.5381953795
+1.065478093
+-1.401320168
+-1.32760373
+-2.046315888
+0.8385336134
+-0.6869310534
+-0.5620131956
+-0.04428831051
+-0.004736762595
+0.6841859208
+-2.160270879
+-0.1973593146
+-1.232532666
+1.691839638
+0.5312877872
+0.3519688395
+2.172092102
+-0.1462069114
+0.896195
+-1.461201246
+0.2014119871
+2.274656007
+0.4980108385
+-0.7518549995
+-0.9755960391
+-1.573866355
+0.4436374802
+0.8610516617
+0.1271061719
+-0.8113466542
+0.241820535
+-0.6867428107
+1.220734705
+-0.4108690322
+-0.8827690418
+-0.5456284895
+0.3868001418
+-1.230491275
+0.6670293111
+-0.27126113
+0.08182017139
+-0.1299658561
+2.264058838
+-0.1695053674
+0.8452254255
+2.453228994
+0.4257522982
+1.847595858
+0.09745475458
+0.7967066359
+-0.5887080766
+-1.112178928
+-0.9687710406
+-0.02415511195
+0.285738405
+-1.116903127
+-1.37835633
+-1.87672812
+2.126709162
+0.107593216
+-2.145268174
+-0.009091063036
+-0.1592708407
+-1.377173468
+1.159311547
+-0.4573624579
+0.04129325854
+-0.2843123265
+0.04638541309
+1.017532938
+0.605670655
+-0.4518868277
+1.575488158
+1.540193088
+-1.463202599
+-1.114549489
+-0.6111642287
+1.525084223
+-0.1827132008
+-0.5719213321
+-0.03399369951
+-0.2241427677
+-0.1559786557
+-1.06963745
+-0.7931587459
+-0.2671611818
+1.381575761
+1.289161297
+0.9156867139
+0.3633261944
+-2.611875576
+1.780367361
+1.11801218
+-0.36931936
+-0.6483833713
+0.1860720268
+0.04471004768
+-0.6926733848
+1.493980526
+-0.6550534085
+0.2498712091
+-1.204251501
+-0.2552892925
+1.08226616
+0.04256964529
+-0.5869133311
+-1.948176143
+-0.3409913418
+-0.3546536412
+0.7333459271
+1.32221886
+-1.218570939
+0.8016905515
+-0.9687362482
+1.149337833
+-0.4367955424
+0.557279085
+1.548829471
+-1.703670177
+0.1468585804
+1.577394646
+0.7791216393
+2.165941359
+-0.4962480663
+1.085210466
+0.7184401911
+0.05058829085
+-1.012319558
+0.2237323629
+1.933760102
+1.249880811
+0.4884160794
+-0.4939172437
+-1.407512518
+-0.1990298496
+-0.9089871057
+-0.3559097896
+1.102627936
+1.225241058
+1.087177558
+0.5441542267
+-0.5297963539
+0.4389980169
+-1.726708061
+1.104046055
+-1.099342917
+1.334136549
+-0.6335446422
+2.233114224
+-0.2638579715
+-0.115697197
+0.7624002299
+-1.341866119
+0.2185997588
+-1.005283072
+0.676850753
+0.4997563736
+0.2243302032
+1.236182329
+0.1434970336
+-2.194766456
+-0.7532163043
+-0.9595815582
+0.6633858891
+-0.2023599553
+-0.6430290604
+-0.8134525308
+-0.3416174339
+0.4218400633
+0.8895066833
+0.03750630038
+-0.4428788649
+0.0392513821
+-1.211099624
+-0.4579227971
+1.428612958
+1.072204429
+2.236463345
+-0.7332018625
+2.600242685
+-0.506851243
+-0.6531524097
+0.2969976149
+0.4913036474
+0.1942404272
+-0.07757471736
+2.061826371
+-1.197943506
+-1.096549277
+0.2128379332
+-0.09730597476
+0.05091344911
+2.317881524
+1.67167912
+0.6432677271
+-0.7658654798
+0.25510342
+-1.741829017
+-0.8488428411
+0.7497497188
+-0.9394742584
+-0.6140592272
+0.2242153835
+-2.937463744
+0.2126290679
+0.3135212753
+0.567825959
+1.682660201
+-0.5162865458
+-0.2058548224
+-0.7859453365
+-0.6208847932
+-0.7223044013
+-0.7193372044
+-1.960868591
+-1.141708457
+0.7958766571
+-0.3401833594
+-0.4921501821
+-0.4349618933
+0.3137913019
+-1.327164041
+0.9106198851
+-2.079486134
+1.017787356
+0.4266745595
+-2.059079865
+0.08656648826
+0.3999687286
+-1.19417351
+-0.0655964865
+-1.516735186
+0.867876687
+0.7040355049
+-0.01416301235
+-2.551337325
+-0.05910461998
+-0.1782632992
+-0.6721311175
+-1.457736066
+-0.8415273842
+-0.4924280978
+-0.1054591281
+0.6587065389
+0.6277594032
+0.2027057783
+-1.028616462
+0.1998594963
+0.6571788346
+0.690478221
+0.9589516245
+-2.322067213
+-1.443153612
+-0.3931055428
+0.7838269168
+0.84310795
+-0.6274953487
+2.080205334
+-1.862349752
+-0.3251871789
+0.6918599127
+-0.4644671907
+-0.9389165089
+1.212338823
+-0.1305605362
+0.2123090063
+1.201287916
+-0.7994313179
+0.2028683804
+-0.4153151745
+-1.19837839
+1.068134939
+0.5389846443
+0.2846174345
+0.08254857726
+1.406200735
+-2.580359255
+-0.2879975829
+-1.454150994
+0.2424149294
+1.223798336
+-0.8512283233
+1.526587248
+0.3694509882
+0.7817362707
+0.8075862325
+0.3952428112
+-0.9362884948
+-0.7247197064
+-0.03280132932
+-0.4716132545
+0.5637686757
+-2.267927321
+0.3426539881
+-0.09796723995
+-0.2402446136
+-0.09630367116
+-2.19438644
+0.6942761699
+0.02912139914
+2.45303545
+0.7187931794
+0.2133912887
+-1.08745619
+-0.8873418679
+-0.9403047897
+1.922118725
+-0.8266971975
+-1.522363852
+0.9220241191
+0.8729629569
+-0.1005499311
+0.9404553588
+0.2749381563
+-1.273522063
+2.106996676
+-2.21495721
+-0.3422880567
+1.466830455
+1.970290893
+-0.925092527
+-0.006071414989
+-0.988291845
+1.48877026
+0.2804108948
+-0.3489108632
+0.5542525678
+-1.542241236
+-1.257530551
+0.2715023661
+1.290228517
+-0.2465406363
+0.3424791913
+-1.030432829
+1.764942218
+0.8475595246
+1.334678796
+1.674733258
+-0.236880984
+-0.3557014601
+-2.032496638
+-0.4428349542
+0.6714438721
+1.084361281
+0.2764685264
+-0.1155481063
+0.9883730888
+0.4112939887
+-0.6270067384
+-0.1460562568
+0.2729307874
+-1.09894346
+-2.757263834
+0.756135839
+-0.9827683233
+0.9108489258
+0.6604135307
+-0.1289324432
+1.82801237
+0.6759609742
+-0.3519555265
+1.621526149
+-1.088265785
+-2.527136403
+-0.3571330516
+0.9479765637
+0.4368820288
+-0.2717285237
+0.6993663801
+-0.7780221526
+-1.186368728
+-0.558370487
+-0.7359765922
+-1.025190134
+-0.1638904215
+1.251045527
+-0.3172542797
+-0.9209413174
+-0.5378237729
+-0.2243570349
+0.5573434841
+0.7788372765
+1.766565608
+-0.5648117862
+0.5073568871
+-0.187758445
+-1.003090245
+0.002016815746
+-2.209063768
+-0.391971123
+-0.08929348781
+-0.2768075442
+-0.7382921927
+0.4781686896
+-0.527123077
+-0.8565163121
+-0.01148862397
+-0.3409680908
+0.9220369511
+0.4548239243
+1.110510376
+-0.8540458905
+-0.5342380855
+-0.1587235875
+0.3786576418
+1.622563851
+-2.405511876
+-0.9667271511
+0.7057707784
+0.2168771364
+-1.85390669
+-1.312089175
+-1.165320435
+-0.5374455061
+-0.4951444265
+0.6106092724
+1.465069925
+0.2833453531
+0.003410025158
+-0.4601605031
+-0.7077453971
+-0.1619891477
+-0.3710734667
+1.219107066
+1.480641854
+-1.086870776
+-2.064870677
+-0.9124275742
+-1.989286425
+0.8951463233
+0.8109661577
+0.7963710423
+0.7626373014
+0.6699028457
+1.309994176
+0.177927353
+0.3980103278
+-0.2223629981
+0.7420292889
+-2.405760676
+0.7425398543
+0.7739811683
+1.80701017
+-1.384666128
+0.188001462
+-0.1909513427
+-1.517403791
+1.2443371
+0.4424822014
+0.7484818419
+-1.835957378
+-1.096153623
+-0.5201159788
+-0.4773720462
+-2.121389438
+-0.7915535352
+-0.1687713477
+-0.3899119172
+0.2895978943
+-0.3511215278
+-1.348781321
+-0.09302394641
+0.3696572075
+-0.3927856511
+0.1512555829
+2.944984314
+1.628817924
+-0.3464185712
+-1.018766114
+0.1346620233
+-0.1407055505
+-0.2609769758
+0.8170487648
+0.07375385227
+0.5982130074
+0.1496602997
+2.72008521
+-1.613783898
+1.523005486
+-2.38501623
+0.9167109097
+-1.084698648
+0.1835428454
+1.84879949
+0.3989471201
+0.8919633167
+1.231500678
+-0.02341413228
+-0.7482023521
+0.1487952677
+0.4381481567
+0.3836541977
+1.549135564
+-0.7265835129
+0.9751958637
+-1.284787505
+2.1041854
+0.2272570642
+-1.1291663
+-0.2813319668
+-0.7394167003
+-2.584321106
+-1.176647633
+0.9712014395
+-1.240022251
+0.678571174
+0.78060167
+0.931010162
+0.2308028425
+-0.952186809
+-1.056937911
+0.01010448252
+1.290811098
+0.8434351688
+-1.031412871
+-1.381719946
+-0.05707179292
+0.4098027485
+0.7228523799
+-0.1619416236
+-0.1127954876
+-1.360537702
+1.695984563
+-0.101915229
+1.085745687
+-0.1930623408
+0.5130358565
+0.2026667888
+0.7818601561
+-0.5955974933
+0.1939072556
+-0.2461180773
+-0.2952911095
+1.102492149
+0.4419107415
+-1.178516704
+-0.1340370835
+-0.3758517534
+0.1165554909
+-1.13698339
+0.9722950652
+0.1699508767
+-1.149762146
+-0.5577647376
+2.432555795
+2.030063492
+0.317218045
+1.042054964
+1.39700271
+-1.386031736
+0.6756493293
+-0.2088022504
+0.04161232836
+-0.3647925772
+-1.38266225
+0.03271420479
+-1.730044902
+-0.6120365365
+1.165867087
+0.7848782203
+-0.5333843476
+1.370192613
+-0.6063991996
+-0.9086736872
+2.28488533
+0.6883058259
+0.662396734
+0.8888964457
+0.5443738551
+-0.7265207218
+-0.6869467946
+0.3359093635
+0.4884953439
+0.921520643
+-0.1096335
+1.847967085
+-1.325153518
+1.930135976
+1.403290113
+0.3269095362
+0.3069121029
+-0.2451367562
+-0.816981274
+-0.4496933099
+0.4065041857
+2.240693091
+0.8854416073
+-1.440148888
+-0.9977304838
+0.9404314913
+0.02768012773
+-1.029724393
+-0.9591946468
+-1.191047033
+1.755515363
+-0.04579424131
+-0.01537701494
+-0.3424043934
+-0.6024621746
+-1.507610418
+0.3168259665
+1.298970498
+-0.3437852951
+0.3600607712
+1.14742632
+0.8276595697
+-0.7948626175
+-0.3214859181
+0.1499467761
+1.691505953
+1.244288295
+-0.1117230435
+-1.886600045
+-0.06527657869
+-0.8484117649
+0.9157932883
+-0.8810159007
+-0.6766892681
+0.07175400592
+-0.09436621757
+-0.8810151328
+1.513924877
+-1.065279023
+-3.069206828
+-1.723354479
+0.2145391542
+-0.07616856427
+-1.652493326
+-1.85910821
+0.006444660265
+1.443519911
+0.4387893345
+-0.8295137797
+0.4456272773
+-0.8297645256
+-2.284616435
+0.3067142313
+0.2384975775
+0.931344099
+0.7382942823
+-0.02738354686
+0.7648501694
+-0.8317270935
+-1.410857189
+-1.798278799
+-0.6981588214
+0.6069019497
+0.8501870159
+-0.8509014805
+0.4383669835
+0.6248464053
+0.8739450597
+0.3806868391
+-0.9634509902
+-0.1053313482
+-1.050484421
+-1.217318809
+1.471010786
+0.6670583528
+0.02573858845
+-0.9211399862
+-0.5374246146
+-0.03704553655
+0.901600501
+0.6242956552
+-0.005014874165
+0.8383492343
+-0.6565697206
+1.828608337
+0.5789019173
+-2.317783077
+-0.5858536526
+-0.3403774135
+1.721194032
+-0.04036452588
+-0.0005720349164
+0.9837250978
+1.170460501
+-2.055056378
+0.5990749895
+-1.305810484
+-0.1033330091
+-0.3316901819
+0.9040453154
+2.956398767
+-1.584759039
+0.4970963481
+1.265663642
+-0.1820234426
+-0.6379039265
+1.764201777
+-0.3535215515
+-0.3904646778
+0.08192365031
+-0.496045183
+0.6401004743
+-1.153280395
+-0.7206152472
+-0.4024859978
+0.7426590025
+0.6694399532
+1.434784336
+-0.3065627363
+0.3679106354
+1.268154292
+0.0654527102
+0.8345687912
+-1.115651405
+0.8476576688
+0.238571265
+-0.4635876247
+-1.145754409
+-0.0187508411
+0.5387160591
+0.2548679896
+-0.09157715603
+1.068478921
+1.085213472
+-0.8394084061
+-0.1809697272
+-0.3924306814
+0.1450937908
+-0.0587084568
+0.6864700753
+-1.041767905
+0.2963407737
+2.950795686
+-1.925068139
+-0.1433570851
+-1.186373572
+0.1866655749
+0.9594634459
+0.3174482155
+1.453343168
+0.56706381
+1.309548922
+0.1332997229
+-0.9662900679
+0.3597651526
+0.1602782135
+0.2071735678
+0.8496370803
+-0.7209706399
+0.1189359835
+-0.7544926641
+0.8743216886
+-0.6681683924
+0.3383395441
+-1.189131172
+-0.02072408781
+0.360096895
+1.082388344
+0.4390854745
+0.6673156112
+-0.1929547233
+-0.04514190556
+-0.4575970853
+0.2687020766
+0.5414130755
+0.5603662494
+0.4634231334
+1.297806357
+-0.2309095703
+1.712177027
+0.2484276536
+-0.7386830367
+0.3304316669
+-0.05780576167
+-0.03058278892
+0.9412934634
+-0.5984822339
+-0.9803550241
+0.2070207877
+-0.6550219155
+0.1320174806
+0.7900218768
+-1.368903957
+0.9380483983
+0.4847313538
+0.2433396917
+-1.430705197
+-1.0672822
+-0.7570881435
+-0.475010526
+0.08076917009
+1.295681154
+0.5300829312
+-0.4246348189
+-0.6007465675
+1.376987152
+0.4140109584
+1.027761496
+-0.8248613844
+0.2571107472
+-0.7096899935
+-0.1520026599
+-0.6228904341
+-0.1400981362
+-0.1943059718
+-1.368116424
+-1.163992558
+0.4308236985
+0.1339069391
+-0.8116710013
+-0.5282785401
+0.4628006285
+1.313236893
+0.8331752837
+-0.2018923017
+0.09331082128
+-1.009972444
+0.4170527224
+0.4332080944
+-0.2000631473
+-0.481924797
+0.05267559467
+0.590432151
+0.4194876876
+1.438053868
+-0.2091670079
+0.1405492481
+0.8455461448
+-0.1576862374
+0.7914052893
+0.5603117349
+0.6225966144
+-0.6495120928
+1.605773542
+-1.456515575
+-0.1592467114
+0.9452735873
+-1.15093242
+1.186234168
+-0.9232008789
+-1.486823056
+1.288706857
+-0.5039800526
+-0.929357094
+1.411416416
+-1.304802348
+-0.5259607275
+0.1474925695
+-0.6388627075
+-0.4544603296
+1.600681835
+1.898107737
+1.29522272
+-0.6770508702
+-0.03431324755
+0.04244077014
+0.05936653572
+0.1125282892
+0.1721530411
+0.2323742896
+1.007139119
+1.161884391
+2.073810589
+-1.551736851
+0.5792925556
+-1.53013677
+-0.9412553832
+1.547766227
+-0.1588866655
+-0.5141246897
+-0.1607577941
+0.5885755307
+0.7499521456
+-1.081977717
+0.2867581144
+-0.842626186
+-0.4466434935
+-0.7166017955
+1.515189466
+-0.3630546372
+-1.295237859
+0.2233130599
+0.7022958166
+1.299799168
+-0.2185885985
+-0.3559314121
+0.9324097751
+-1.172971572
+0.8698990658
+0.3515312686
+0.5347394636
+0.5843375267
+-0.9044496911
+0.2044183079
+-1.129361174
+1.072630089
+-0.5822884336
+1.2378179
+0.289367769
+-1.004583674
+-1.032532359
+-0.901071793
+-0.5148781639
+0.4178542399
+-2.048832759
+-0.9897443883
+-0.3382941896
+1.503826503
+-0.2582089513
+-0.1545956418
+-1.655827026
+-0.09355458631
+-1.090081008
+0.778008176
+2.168953917
+0.587482147
+-1.101444216
+0.6476220759
+-0.8646058848
+-0.3191540022
+0.1379110117
+1.247325779
+0.105161381
+0.5986577447
+0.06652346505
+0.6185915726
+-0.1027515365
+1.228180292
+-1.433920077
+-0.7613863647
+-1.112908187
+-0.6932907786
+-0.979284844
+0.4943834061
+-0.6510017459
+-0.0364130033
+-0.5350659688
+-0.7569305524
+0.1001948878
+-1.308250974
+-1.089114292
+-1.664018923
+-0.7002798798
+-0.07592740012
+1.159909861
+-0.8365039306
+1.582104413
+-0.1271798307
+0.4336561379
+0.169408491
+0.5724648423
+1.829893228
+1.418651064
+-0.9776277784
+-0.4195668189
+0.4297143378
+-1.063327859
+0.3911823483
+-0.0747859389
+-0.999360768
+0.3444029984
+0.9736811548
+-0.9430867656
+1.602595196
+0.2376157739
+-0.1281956804
+0.3923225554
+-2.592893985
+0.7752914631
+0.264916774
+-0.4567572202
+0.3371549758
+0.4049337788
+-1.06094765
+0.0936939992
+-1.592292541
+1.813806236
+-0.1034576988
+-0.3052410848
+-1.404708003
+-0.3657502328
+-0.09727457054
+0.2751364984
+-1.558889272
+-0.3687875774
+0.7465646519
+0.3279536514
+0.1500969625
+0.6712778984
+-0.3980213471
+-0.8001051312
+-0.5537888582
+0.71331172
+0.890694859
+0.004502263252
+-0.9853961684
+-0.178278921
+0.9238131513
+0.7145440764
+-1.021254008
+0.232298969
+-0.1549165547
+-0.3999933882
+-2.658387132
+-1.003428963
+1.389283785
+-0.07135174845
+0.1388881046
+-0.0967622582
+0.4031153004
+0.6281491958
+0.5679972561
+1.181980787
+0.4587058504
+1.703775486
+1.510627592
+0.01881478733
+-1.213213632
+-1.15953989
+-0.9960440932
+0.1820143095
+-1.258196707
+-0.01090627403
+1.22037557
+0.6200797978
+-0.2033996226
+-0.05977961014
+-1.11216507
+0.3698798679
+0.2429883176
+-1.4556867
+0.2045957665
+0.2362975658
+-0.2086562726
+-0.8186010087
+-0.2720654465
+-0.5458545151
+-1.291390314
+1.241292143
+1.495335815
+-0.221428156
+0.5088971133
+-1.547735978
+-0.7341091189
+-0.06178478432
+-0.9167001562
+1.748294394
+0.6113579541
+0.1244715807
+-1.765469554
+-0.8131557378
+-0.2266721525
+-0.2433164529
+-0.9586618346
+-0.3598257296
+-0.1786702085
+-1.854959586
+0.4828202196
+-0.2374148171
+-0.223484951
+-0.7928117952
+-0.0088003571
+-0.1138385953
+-1.161303357
+0.5579746366
+-1.19641498
+1.276102268
+-0.5428506655
+-0.7676082261
+-2.038021519
+-0.8374180885
+1.807692736
+0.6725515
+-0.4143821899
+0.01905879242
+0.6254170942
+-0.2820325403
+0.874876727
+-0.516302383
+-1.089865507
+0.1275738192
+-0.139526917
+-1.55751233
+0.4249118212
+-0.1607739939
+1.315239208
+-0.7662281684
+-0.1419369543
+-1.144273724
+0.5419403508
+-0.06036523752
+0.01158016783
+-0.4260249929
+-0.8693335335
+0.3321054761
+-0.2232301235
+0.1859180085
+0.07555990703
+0.4812561339
+0.08055409081
+-0.1881784457
+-1.311192475
+-0.08872441331
+1.512770114
+0.5737081736
+-0.5410039762
+0.1011774903
+0.9945519804
+0.01871303132
+0.2556715056
+-0.7111772334
+1.103841926
+0.7498760239
+-0.6901777185
+-0.6161143412
+-0.8754807639
+1.383398859
+-1.464259458
+-1.290574306
+-1.136987829
+-1.81633658
+-2.059307297
+-1.577349515
+-0.180910363
+2.633002456
+-0.8738534866
+0.4626492171
+0.5717197814
+-0.5768549077
+-0.3781278785
+-0.1874432213
+0.1967199248
+0.3621532089
+-1.787854116
+1.123284394
+2.231483978
+-0.2592034309
+0.4197042761
+0.3647200283
+-0.4982883144
+0.853370434
+0.6698650164
+1.457491502
+0.1867191148
+3.006051553
+0.07114271072
+-0.2154966419
+0.02932343338
+-0.08898641026
+0.1243936805
+0.06453273818
+-0.2294944072
+-1.048777185
+0.1695384377
+-0.482387112
+-0.2830505176
+-1.247297636
+0.1283144069
+0.4478857825
+-0.6975439788
+0.1654880571
+-0.3362832779
+-0.1657265366
+-0.6748378398
+-0.6607167498
+-1.28574408
+0.2204590976
+-1.450177399
+-0.03364933072
+0.8193687857
+-0.7773550243
+1.297096156
+-0.5298593281
+-0.2872518032
+-0.08633146778
+0.3339187705
+0.3005096054
+0.937991937
+-0.46721407
+1.948441412
+-0.3087449437
+-2.02725618
+0.2302280807
+0.1488207575
+3.292694322
+-0.5023747121
+0.9368307919
+0.4223787094
+-1.214615293
+-0.3633534973
+-1.016375443
+0.8161545824
+-2.642064831
+-0.999590025
+-0.6842966387
+-1.37862011
+-0.1166622957
+-0.5009271976
+1.30492731
+-1.170060617
+0.4273369797
+-0.4868766087
+-0.9399681384
+0.1936713284
+-0.1304665248
+1.636410786
+-1.247316886
+0.4555480114
+0.7874873203
+1.054878792
+1.402895287
+-0.3403153753
+-0.7662428413
+0.7910608149
+-0.568084152
+-1.686437777
+1.795106658
+-0.5170757872
+1.385357903
+-0.4875607186
+0.9538254437
+-0.4127383972
+1.254566021
+0.981135785
+2.565203882
+0.4855013916
+-1.631962765
+-1.982757641
+0.7196250754
+0.3306773685
+-0.3879871454
+1.614367812
+-1.762890544
+-0.2992368161
+-0.2816053263
+-0.4913335634
+0.1062109934
+0.611043994
+0.4482290618
+0.811050707
+-0.05049253078
+-1.031785519
+0.5823349583
+0.8444985567
+-0.3849413752
+-1.355082944
+0.6306875166
+0.3171112119
+0.009540022013
+0.8568302978
+1.801985774
+-0.9952394258
+3.211847472
+-0.1661012504
+1.776636496
+-0.3340893121
+-0.2285335563
+-0.08109184974
+-1.727156971
+0.443460018
+-0.704759253
+0.5324918454
+0.4588414824
+0.6069088613
+-1.116878573
+-0.4205290266
+-0.4082236558
+0.9159150648
+0.01978267446
+-0.9659548933
+-0.003138665841
+-1.109276353
+1.199396986
+-0.9169333632
+-0.3250979222
+-0.6554596871
+1.040301245
+-0.8468414963
+-0.02011006114
+1.048322828
+1.384784189
+0.2876734428
+0.3542454313
+0.4986133
+-0.2432114454
+-0.1372609788
+0.5234652606
+-1.265604111
+0.480674209
+3.003123295
+-0.1512721305
+-0.7243952483
+0.03878974917
+-0.1198186134
+0.8208486026
+-1.007497187
+-0.6677929171
+0.04830327066
+0.1750379387
+0.208315912
+-1.919059625
+0.9766510791
+1.891318058
+0.4273438516
+-1.32859472
+-0.1469343242
+-1.356272622
+-0.3669628825
+0.1919582691
+1.382992462
+-1.064811416
+-0.270850372
+2.76102634
+0.6004489969
+1.311165602
+0.9766030967
+-0.1186602071
+-0.4448900321
+-1.097869906
+-0.4263503355
+-0.2740243022
+-0.1068669658
+1.088315262
+-2.98137201
+-1.154596024
+-0.03482027361
+0.2651986127
+-0.4033118091
+-0.8410776798
+1.030970085
+0.4036042772
+0.1645698438
+-0.499079179
+0.8270534088
+-3.126201478
+0.27448201
+0.810133077
+0.7581609883
+-0.718127199
+-1.38087086
+-0.5076599954
+0.08387787794
+-0.8853391635
+0.6123282158
+-0.162613792
+0.2677460633
+-1.41265222
+-0.4442410951
+-1.262501616
+1.503295666
+0.6110239048
+-0.4633914818
+-0.2613438324
+1.870757505
+0.6762051767
+-0.3888108413
+-1.040695612
+-2.424537214
+0.4552400013
+-0.4199117127
+2.008749478
+0.6389307233
+-0.3146655894
+-0.0531506911
+-0.1081308628
+-0.8942368538
+-0.2720023342
+1.174416158
+-0.5152111015
+-1.505209108
+-1.39726248
+-0.05116028246
+-0.0412393329
+-0.2354413649
+-1.275676938
+0.1774501902
+-0.1988486604
+0.8698195669
+0.4150623414
+-1.186789416
+-1.266620664
+1.586552208
+0.06109867445
+-0.1770948078
+-0.5854320047
+-0.4385347891
+0.01759620809
+1.331462493
+1.584075496
+-0.3236637612
+2.341121656
+-0.6135570102
+0.9249237208
+-0.2237814598
+0.8911208776
+0.1451560387
+0.2448153042
+0.3776126629
+2.029699029
+0.6324076545
+0.3589432154
+0.4496875743
+-0.3058456382
+1.109408535
+0.4872805264
+-0.3038508143
+-1.457317217
+-0.9205236723
+0.6826651457
+-0.3554729204
+0.3927389099
+-0.3810762626
+-1.706382138
+-0.160255463
+-1.616970624
+0.6162632999
+2.406586589
+0.3152024139
+1.260789582
+0.331003284
+-1.300221032
+0.5527735506
+-0.7645601645
+-1.603076108
+0.2826044421
+0.188425597
+-1.105254611
+-0.02562521106
+-1.46177025
+2.306931175
+0.1014108054
+-0.5887804454
+-0.04822892923
+0.7604926962
+0.71260616
+-1.128883305
+0.3887622975
+-0.2175828454
+1.492403242
+-0.1203889227
+-0.4008507389
+-0.4998865299
+-0.9092680952
+-1.434845273
+-1.246406232
+0.4905832538
+-0.4584877452
+-1.762442226
+-1.284875677
+0.1869234525
+1.66806235
+1.485733541
+-1.309282046
+-0.4001375899
+-0.690261593
+-0.2851842242
+0.561169799
+-0.2224484835
+0.102590328
+-1.363247046
+-0.5505031629
+0.9418570286
+0.4167126512
+1.55880515
+-0.4624279885
+-0.3520548441
+0.6923726434
+-1.34595918
+-1.396778104
+-1.252306932
+1.192994936
+-0.8578463543
+0.2459804091
+1.184893622
+-1.667617137
+0.3219023821
+0.1425884418
+0.8878026553
+1.384391609
+-2.063530635
+0.4181311413
+-1.678002304
+2.865601646
+-0.6755149512
+-1.213974645
+-1.723543558
+-0.01155904088
+-1.283445857
+0.6609151705
+-0.1157040466
+0.3007107131
+-0.9618673901
+0.6788420969
+0.4106647894
+0.7691630827
+-1.860349196
+-0.2602683149
+-0.6554810143
+0.8151290765
+-1.104477356
+-0.02584447832
+-0.684694739
+0.7430288436
+0.09277352641
+-1.810832789
+1.464235468
+2.109736963
+0.5113024933
+0.9214703399
+-0.7961116267
+0.1557842881
+1.626490533
+1.683974664
+-0.1017777257
+-0.02700026721
+-0.5560973939
+-0.3349419797
+0.4305644699
+-0.3148516998
+0.5323332952
+0.4808635841
+0.6366700661
+1.190873146
+1.218377362
+-0.08717708538
+0.1331706263
+0.0532641729
+-1.294479514
+-0.6270957245
+1.033208645
+0.8411585047
+-1.118821126
+0.9106353685
+2.463494044
+1.305476417
+-0.5078491038
+0.6401654568
+-2.094902684
+-1.535900443
+-2.132939569
+-1.221418933
+-0.05109373408
+-0.6269537689
+0.9085376771
+-1.770138829
+0.127112361
+0.2025357811
+0.2193867324
+-0.141952755
+0.4712587234
+-1.121632017
+0.2348901045
+0.2660713422
+0.1221213086
+-0.03395884822
+-0.4119123372
+0.2396079995
+0.4450393556
+0.1456137921
+0.178376573
+-0.8795627254
+0.08291784563
+0.2220709288
+-0.2598603782
+1.297092392
+-1.650745675
+0.6115097018
+-0.3253150703
+0.1117031063
+0.7479269406
+0.4571745953
+0.100761782
+1.438353628
+-1.40018895
+-1.954720392
+-0.7588565542
+0.1194262288
+0.7364101349
+-0.6658715034
+-0.0521111198
+0.142014841
+-1.200823808
+-0.01412879128
+0.1722817782
+1.018502458
+0.3625553041
+-0.2192810943
+0.6853411862
+1.010965781
+0.07203897021
+-0.5317717332
+-0.2604891472
+-0.2174306049
+0.9860923265
+0.31997435
+-0.03932189854
+1.514220949
+-1.873412898
+-0.8563058753
+0.7394200974
+0.9219983872
+-0.8890936944
+-0.5466315208
+0.5607649816
+0.817280635
+-0.234655925
+1.435589171
+-0.5468200773
+0.1247638435
+-0.6282752336
+-0.2512498721
+0.04055946849
+0.49668862
+0.7192644882
+-0.5121807619
+0.2786832316
+2.327715451
+1.732464133
+-0.1355056443
+0.9407029363
+1.778506256
+2.06515093
+1.174988392
+0.06446539364
+0.3345230923
+-0.2759347181
+-0.9038693857
+0.07379354366
+1.714520408
+-0.004946451551
+-0.4580803031
+0.8939317526
+-1.560958921
+1.199760707
+-1.357111674
+0.2147751773
+0.6041503173
+-0.4827028671
+0.4263130661
+0.3580539447
+2.095600702
+-0.2793421817
+-1.621959093
+-0.2702989365
+1.00258809
+0.7011757033
+0.1722511305
+-0.1773850628
+0.7790995019
+0.8636000741
+-1.00490104
+0.6323234494
+-0.7638198268
+0.3079225349
+-0.3288014091
+0.3946300777
+0.8784893797
+-0.1306656669
+3.094979512
+-1.41465771
+0.3331373236
+1.151911556
+-0.128360737
+-0.6941428071
+0.1147115554
+-0.02743923855
+-1.729387499
+2.33127704
+1.654254375
+-1.763229313
+-1.941552438
+-1.190738273
+-0.004849353905
+0.4222419016
+0.03419765952
+1.521315196
+-0.1766054036
+0.224399646
+0.7282629391
+0.1159321994
+-1.41548749
+0.3165683109
+0.8783222366
+-1.15610287
+0.55726489
+1.500416003
+-0.8511629356
+-0.5939493287
+-1.193630151
+0.6819807414
+-0.03133472405
+-0.0286470875
+0.8888990282
+1.001874133
+-0.1425251817
+0.2556823519
+0.7652250097
+0.1631320928
+-0.2498634559
+-1.500852955
+-2.927333725
+0.6607399155
+0.1327477888
+0.5937239242
+0.1125463099
+-1.643753684
+1.534148674
+2.128575081
+-1.079615787
+-0.2879979582
+-2.291471805
+-0.8244517505
+0.4066144968
+0.6147168685
+-0.5193149005
+-0.7325679454
+0.4611653096
+-0.4268031219
+-1.184346232
+-0.1097135634
+-1.166286079
+1.332861991
+-1.492824983
+-0.2382298405
+-1.271141341
+-1.069635328
+0.6976164348
+0.3925410341
+1.243925824
+-0.3567233273
+1.263094476
+0.09822976749
+-0.5787029665
+-1.295653565
+0.8188961552
+0.4646765805
+1.206230321
+-0.07551450174
+0.2233940506
+0.02196762128
+-0.226237591
+0.8005526429
+0.2583341641
+0.01341679059
+-0.9566358077
+0.6107801046
+-0.3282877009
+-0.5326413692
+0.3580334224
+1.671416964
+1.423073011
+-0.5663484615
+-0.725820321
+0.5634755203
+-0.4356320862
+-0.1045525477
+-2.321272833
+-0.2140943657
+0.5434054256
+-0.5374541022
+-0.3802753353
+0.2654729301
+-0.1454317395
+0.3900747551
+-0.1429263741
+-0.01411804737
+-0.5412923293
+0.9153400195
+0.7681113623
+0.1016348006
+0.8094421017
+0.0004556434685
+-0.2267173497
+1.281717326
+-0.07349940324
+1.069634568
+0.7920152242
+0.33970758
+0.6335131637
+-0.3126899042
+0.3656824518
+0.322765973
+-0.1339740266
+0.3025370529
+-1.660661429
+0.1812739493
+-0.3153503256
+-1.007366453
+-0.7484238837
+-1.716682427
+-0.1572054447
+0.8618949755
+-0.9956087389
+-1.158216952
+1.317629527
+-1.623300062
+0.1798952548
+0.6858589013
+0.06029685692
+-0.6038802116
+1.048913761
+-2.257167818
+-0.05843377338
+-0.1138860932
+0.08555507738
+-0.7688744263
+-1.254132727
+-1.490291015
+0.1294953896
+0.09268315941
+-0.5188183727
+-0.7847260248
+-1.00429289
+-0.07074956344
+-1.536997311
+-0.8811527494
+-0.9041975705
+0.7040268479
+1.199060285
+1.837670854
+1.326833582
+-0.1728139244
+-0.125051844
+-1.526191376
+-1.810352169
+0.3975400786
+1.749408843
+1.723878244
+-1.328198272
+0.1908318018
+-0.8550479153
+0.1436198419
+-0.3308296663
+0.1347103214
+-0.5981942488
+-0.9036156259
+0.8448509439
+-0.5984261444
+-0.3971627104
+-0.1978619711
+-1.256541456
+-0.4385174973
+-0.672553314
+-0.5639172847
+0.04603699225
+-1.90700442
+0.4588394321
+-0.4961534486
+0.5328682241
+0.2758805777
+1.066597429
+-0.1897081996
+-1.072583951
+0.9363661269
+1.108472072
+-0.360968359
+-0.6044198272
+0.7308124477
+-0.289566004
+0.9214672326
+1.193670501
+0.1420208404
+0.9903038073
+1.024854636
+0.7819829717
+-1.515585165
+-0.1204732053
+-0.2646034479
+-0.4781559295
+-1.257801748
+-0.8879620315
+0.8834035899
+0.3680997668
+-0.3455524922
+-0.1083529842
+0.8362636067
+-0.8118629371
+-0.8376584279
+1.315287533
+-0.3645234687
+1.993570672
+1.584878452
+-2.104662611
+-2.55311828
+-1.242666282
+0.2019866523
+-0.3053317585
+-1.195586778
+-1.577903175
+0.8499122312
+0.3275901422
+-0.001669588354
+-0.03556342932
+-0.4892515503
+1.930498218
+-0.2626447201
+0.8259323048
+-0.6432670114
+-0.8289810856
+-0.2027345796
+-0.2578664753
+0.07081452068
+0.9978447559
+0.2600807238
+0.9250656155
+1.476075853
+-1.87925228
+-0.7825285421
+-1.40220506
+-1.455285804
+-1.152335412
+0.0965485526
+0.292280245
+0.8867214533
+0.1132206248
+-0.02948164686
+0.2782558335
+0.9704330463
+-1.431262817
+-1.402234775
+-0.1946246935
+-0.5354971454
+0.6042767147
+-1.415711747
+-0.9723172872
+1.031282995
+1.45387448
+0.2337075209
+1.308023983
+0.761768806
+0.5921662027
+-1.236162999
+-0.9084081453
+-0.7632186502
+-0.802038346
+-1.376420976
+-1.550232713
+-0.1663934289
+0.7598895494
+-0.2875463216
+-0.3408353084
+-0.4380675011
+0.1424137529
+-0.2995167746
+-2.100525474
+2.405715463
+0.3382180175
+0.3632414768
+0.3133047285
+0.4243564336
+0.182802669
+0.4043556837
+2.542334601
+-0.3791434201
+-0.1495744301
+-0.8346999972
+-0.7742741278
+1.214964737
+0.7606167185
+0.3171077297
+-0.1672189797
+0.1230465347
+-0.5340056801
+-0.06232818998
+0.4993795246
+-0.6112615291
+0.2279778392
+-1.263295836
+-1.077302105
+0.3607445359
+-0.2576623968
+0.7818472899
+-0.4763546008
+1.305445411
+0.6843120291
+0.4527694997
+-2.447201705
+0.6361515594
+-0.592281095
+-0.1407441045
+-1.118649433
+-0.2712420706
+0.3353216665
+0.9042813721
+-2.189012294
+-0.390239299
+-1.21585737
+-1.468087847
+-0.2748048906
+0.8750464058
+-1.008340616
+-0.4647849692
+-0.1865984628
+-2.088946445
+-0.5600870958
+-1.348681522
+-0.3641702012
+1.179397988
+0.1997187681
+1.686534303
+-1.075230311
+0.5811572085
+0.3023730692
+-0.5949453857
+1.383429851
+0.3260892736
+-1.504525761
+-0.6118640561
+0.1986764948
+1.094609448
+0.9827951147
+-0.06806018956
+-1.045726588
+-1.746984568
+-0.5958772141
+-0.3935099589
+0.7819852772
+0.1315787938
+1.336569505
+1.213744138
+0.4329839934
+0.7754896096
+1.203199816
+-0.4921071393
+3.019669596
+0.6024559312
+0.227730995
+0.5269126002
+-0.1516455322
+-0.2588847677
+-0.5245341335
+0.2717128153
+-0.887486996
+-0.8964640089
+-0.1968666422
+0.09119761776
+-0.8873035706
+-1.868182184
+-0.07609814921
+-0.7805968555
+0.4802442634
+0.03203650347
+-0.7067072055
+-0.4631549753
+-1.173543746
+0.5445239446
+-1.301709974
+0.3699762816
+-0.08500210571
+-0.7237022636
+-0.7464592662
+0.2509557049
+-2.124690525
+1.672370259
+-0.7169878966
+-0.5348271013
+0.3575956124
+-0.2395388535
+1.992325857
+0.1982047758
+-1.46302723
+-0.5053290925
+0.86505187
+-1.30657958
+-0.6528154839
+1.701400286
+0.220198402
+-1.61760356
+-0.5858163044
+0.34617477
+1.792517598
+-0.865865734
+0.01942351112
+-0.2472789625
+-0.9830157615
+-1.246017026
+-1.401188547
+-2.340386385
+-0.7892500509
+-0.187877868
+-0.02410797974
+-1.237436231
+0.4444930701
+1.446495676
+-0.6280738235
+0.06676373386
+0.6859157461
+1.852706969
+1.581691225
+0.09438784207
+-0.6667955311
+0.6660448527
+0.5320387664
+-1.050807799
+-0.5289185446
+-1.978993792
+-0.09365060026
+-0.5537081572
+0.1577619546
+0.3714364503
+0.453640682
+1.136213703
+0.4127557856
+0.07460681556
+1.472926602
+-0.05218945863
+-0.3334014679
+-0.2249729551
+-0.5179290234
+-1.046634804
+0.9848658361
+-0.09944376323
+1.741868879
+1.131347208
+1.563066991
+-1.060207595
+1.666930512
+-1.478979961
+-1.90577049
+0.3552731628
+-0.744724398
+0.130675932
+0.9287368484
+-0.1092540492
+0.3579307202
+0.0620544615
+0.9341294412
+-1.321741246
+-0.1887846943
+0.5450025749
+1.194613335
+0.1155479767
+-0.01566815259
+0.08181869452
+0.3128174229
+-0.5175796964
+-0.9493309022
+-0.5009193133
+0.3581947912
+-0.6916647746
+0.7086075791
+1.211662273
+-0.5839708838
+-0.1023268682
+-0.4031613046
+-0.07756974512
+-0.1116259227
+0.557122751
+0.6536220081
+0.1175153878
+-1.226595482
+0.284588592
+-0.3341941822
+-0.9034728784
+0.3816067501
+-0.05207958233
+1.359029652
+0.2401977683
+-0.5103403718
+1.403988838
+1.009901104
+-0.4682047193
+-0.1903148945
+0.2275711202
+0.3296707955
+1.313934803
+0.3545246958
+1.675681786
+-0.4598955222
+0.09686958685
+0.9012083099
+-0.6129329377
+0.5607587351
+1.757056473
+0.6849796466
+-0.1868782232
+-0.4102973576
+-1.444373955
+-0.05225849725
+2.245019819
+0.1798616384
+0.7548625269
+1.18560462
+0.2843368584
+-0.41074065
+0.436434513
+1.259089795
+-0.306425338
+0.7047862113
+0.4805850528
+-0.1725681231
+-1.056388038
+1.020839821
+0.9267752976
+0.1891755528
+-0.3822020627
+-1.481745963
+1.237953016
+-1.576247733
+-0.882106188
+1.723271613
+-0.5654813003
+-0.06602649877
+-1.168185091
+-0.6628458306
+0.772248583
+0.2607228428
+2.202297975
+-0.7688165374
+0.003373523789
+-0.1173261671
+-0.9136849713
+0.3267530578
+-0.1441042206
+-1.222416341
+0.8834843553
+-0.6588438873
+-0.2248045149
+-0.8135863761
+-1.123721075
+-1.065533788
+0.4619101616
+-0.7503932111
+0.3477369456
+0.2655710068
+0.8278338962
+-1.286981262
+0.3188256615
+-0.8562581722
+0.7813947807
+0.6154557148
+0.6575708451
+0.1797037622
+-2.278379361
+-1.399486284
+0.763721633
+-0.6022380531
+1.057346006
+-1.241712717
+0.8444338452
+0.4190975319
+0.5408490537
+0.1426850796
+-0.9931777213
+-0.3794706957
+0.5953972405
+-0.8911391948
+1.254900846
+1.070940619
+1.368117994
+0.7540420361
+-1.361789828
+0.2148898507
+0.7666696591
+-0.5721466984
+-0.9326042062
+-1.34631888
+-1.058354041
+0.3082196168
+0.1263058937
+1.474654929
+0.01986563836
+-0.1533403368
+0.5427250171
+-0.8982430565
+1.072834173
+0.9212007693
+-1.045982669
+0.2398848128
+-0.2399872367
+0.201526558
+1.095373743
+-0.7641457229
+-1.059081421
+0.9709772276
+-2.724548764
+0.02634287772
+0.03113565229
+-0.17870933
+0.4194993138
+-0.8683885311
+0.4747060902
+-0.4976926254
+-0.6131805647
+-0.8993081546
+-0.6951372596
+0.2548579928
+2.462781616
+1.288022594
+1.366351093
+-2.084140073
+1.054540242
+-0.6584460904
+0.7016707295
+-1.48420989
+0.7018342167
+-0.7367026132
+-1.135368311
+0.8034266125
+1.947138353
+0.2818152092
+0.6163467148
+1.690108978
+-1.759683195
+-0.09402870507
+-1.535623827
+-0.4820639804
+-0.2813972169
+1.912941369
+0.1789698895
+0.2698389147
+-0.4756282987
+-0.05824427881
+0.6104026749
+-0.1537651543
+-0.30715768
+0.00314202534
+-1.182523853
+-1.844622274
+-1.31699159
+0.1479340106
+-0.6539690838
+-0.366084591
+-0.5772585004
+-0.5850701779
+-0.2924167999
+-1.848530335
+-0.1489338181
+-0.751272225
+-0.7153009897
+1.077841575
+0.6231737279
+-1.69683789
+-0.8516990129
+-0.9225254342
+0.9233240966
+-0.3950044305
+0.7099353966
+-0.04293418225
+-0.6496395844
+-0.318537513
+-1.872090867
+0.0721271357
+0.2912057436
+-0.2783483019
+0.6049549759
+0.670609271
+0.7283976577
+1.33592899
+-0.8727503743
+-0.1820479397
+-0.2766488604
+0.5385486887
+-1.242191008
+-0.6489337024
+-0.8941696262
+0.1014679329
+-0.0520993542
+-0.610604138
+-2.979745625
+-0.6892374582
+-2.206918682
+-0.4327895994
+-0.6774798214
+0.1662548185
+-0.1374444188
+-0.7766288665
+0.4023796808
+-1.838461452
+-0.7337769418
+-2.010480007
+-0.8689224968
+-0.04952652896
+-1.34423287
+0.06023387767
+-1.768834596
+-0.8403045002
+-1.011530269
+1.903530398
+-1.284397748
+-0.4898892437
+0.7581721802
+1.147215774
+-1.368854965
+0.6080808642
+-0.5300948099
+-0.6094548801
+1.06241246
+-0.04014981812
+-0.2764210678
+1.577559348
+0.2636820396
+1.267041172
+1.184748103
+0.6004808118
+0.6627605783
+-0.9631213941
+-0.06518356929
+0.3965368873
+1.224729781
+-1.596661745
+-0.9161520817
+2.056893854
+0.1804197142
+-0.06670924898
+-0.02835397979
+0.4848047511
+0.8173012411
+0.895305758
+-0.7625162668
+1.437594358
+1.197436012
+-0.6648783354
+0.491133144
+0.436178726
+2.483625478
+1.250874995
+-0.8652247223
+-1.152382878
+-2.531764673
+0.6768011321
+-0.8235494335
+-0.001654860773
+-0.2926580337
+-1.713335648
+0.2775128689
+-0.4684120723
+-1.021237392
+0.3111077698
+-0.5543713996
+-0.5277050792
+0.09343402299
+0.0553637903
+0.1839600773
+1.074435569
+-0.8088902679
+0.01770895889
+-1.055375424
+0.05372552864
+0.8920047331
+-0.1436830083
+0.5428864839
+2.615180689
+0.908922105
+-0.6701074435
+0.1462989836
+-0.4177500873
+-0.3071745611
+0.2703181747
+0.006145462239
+-0.04141251227
+1.252047839
+-0.5853372336
+0.01836744027
+-0.3882516732
+1.101613704
+1.887422351
+-0.6500365848
+1.451055946
+0.2006217636
+0.1075251535
+0.4110045261
+0.2201270192
+-0.9558433627
+-0.07291075332
+-0.2200553884
+-0.1955879774
+-0.3888328116
+-0.1492266351
+0.2064908465
+-0.490721416
+1.338052432
+1.033348729
+-0.392443474
+0.2761882549
+-0.05000140154
+0.2783436771
+-0.220884525
+0.407609135
+-1.686838286
+-1.132299495
+-0.4491987716
+-1.628559817
+-0.07475137967
+-0.9900172027
+-0.5021103784
+-0.01690035707
+0.6617447885
+0.5219373174
+0.07109198291
+-0.103331836
+-0.1241831942
+0.5050723109
+1.746532397
+-0.9384755421
+-0.2050182065
+-1.440846651
+2.065995793
+-1.217645895
+1.04369114
+-1.636799919
+-0.8311728043
+0.03839310049
+-1.432773111
+1.650221359
+-0.09570671115
+2.222868726
+0.3076825498
+-1.724322222
+-1.695198939
+0.278302674
+0.938301211
+-0.8741029494
+-1.146208157
+-0.6457691669
+-0.820873109
+1.143629263
+1.412579418
+0.2804195799
+-1.682250183
+-0.4242360137
+0.6605323552
+-0.03313861985
+-0.03843749512
+-0.8116567323
+0.1741831142
+1.477837321
+-0.2192885396
+-0.5614511988
+-0.8825250768
+-1.234251199
+1.135391917
+0.8536889821
+0.6619521635
+0.1940427797
+1.251985327
+1.454035382
+-1.487691148
+-0.5286277386
+-0.5613620006
+0.4594193482
+0.4614850467
+-0.8415557971
+-2.404756507
+-1.494455139
+-2.204728542
+-0.7104699363
+-0.6865041337
+0.48718557
+0.9703327005
+0.0191650804
+0.03055743421
+2.126039171
+0.3825403799
+0.1017763361
+1.243769651
+0.08418759329
+0.02602463821
+-0.3963061797
+0.2071161355
+-0.4882599396
+-0.1168544279
+-0.9286617251
+1.106126051
+-0.2454181811
+-0.06354460206
+-1.329065739
+-0.2628045983
+1.48404238
+0.5852843123
+-0.6792443871
+-0.4082862781
+-0.3425306511
+-0.5310598216
+-0.2525795164
+1.23937857
+-0.6161657221
+-0.8743874487
+-1.141881935
+-0.5788628807
+2.353774322
+1.339159807
+0.708635799
+1.013331299
+-0.6402964984
+-0.4752223706
+1.248338292
+-0.0412226967
+-0.3494254707
+1.286947108
+-1.32619077
+1.092625368
+0.38335523
+-0.6908642108
+-0.07214370989
+0.4729478797
+-0.4645186168
+0.8151687111
+-0.7450098272
+0.3585434788
+-1.322500754
+-0.5362467847
+0.05567394238
+-0.5106480723
+-1.420217586
+1.165939976
+0.7442878373
+-0.6453228993
+0.473351557
+-1.03445039
+1.779397433
+-0.7470325588
+1.766742305
+1.027562675
+0.05220430185
+-1.97396705
+-1.111404419
+-0.3246097996
+-0.3506035997
+-0.3710768935
+-1.901758613
+2.059215372
+0.1685639448
+0.04277687453
+-1.354497804
+0.5274385513
+-0.8166235308
+-0.6331622888
+-0.01777487277
+1.537600991
+1.584034916
+-1.507333643
+0.06657628217
+0.3779613549
+0.9021579819
+0.01787532323
+-0.1060614028
+0.949775296
+1.145573613
+1.176221568
+-0.8378641101
+-0.5064931628
+-0.5005347891
+0.074222641
+0.5423977953
+0.6719839302
+0.3955279878
+0.1929187469
+-0.04168238303
+0.5823065639
+0.4075008239
+0.9344403557
+1.61568612
+-0.4030669731
+-0.5414799014
+0.3706814164
+-0.414336882
+1.224502933
+-1.761234084
+0.02208423626
+0.09636616973
+-0.9343460159
+-2.030526772
+-0.6361606804
+-0.4195115695
+0.7116051399
+0.6106400171
+-0.2644272893
+0.4211940284
+-1.110747286
+-0.6500771588
+-0.1556589958
+1.847729903
+-1.457593996
+0.4544500885
+0.5361469231
+-1.832457327
+0.04289998596
+0.5673006601
+-0.3812289987
+0.1586058259
+-0.7432076628
+-2.300358752
+-3.017878321
+-0.4192528693
+0.3673498714
+-0.377953238
+0.3696709845
+0.7667483467
+1.132346913
+0.1713690677
+1.992030951
+1.037112857
+0.7972601891
+-1.534820135
+-0.2240379673
+-0.7211647536
+1.239120026
+-0.5251198513
+0.3672321044
+-0.2873863653
+0.1083054731
+-0.3605248089
+0.07127898036
+0.9799604047
+0.6624241382
+-1.781785958
+-1.084844858
+0.5504264725
+-0.4166675434
+1.612660265
+-0.2049243629
+-1.021109457
+0.3455152089
+-0.5317375503
+-0.7377064723
+-0.4188673441
+0.8521258068
+0.2819546192
+0.8450640553
+-1.028005514
+0.9755204642
+-0.0629693341
+-0.6170272884
+-1.391425022
+1.187410667
+0.1367413516
+0.446019636
+-1.261146687
+0.0386254998
+-0.9642368545
+0.4145136067
+-0.1752218992
+-2.575417644
+-1.654024983
+-0.03492758318
+0.04489590313
+-0.4018982263
+-0.7180095788
+-0.07942714987
+-1.01936903
+0.0466088679
+1.036900766
+-0.4155933199
+-0.622494806
+0.2363770545
+2.034836619
+-1.315507063
+1.4027559
+0.732329804
+1.233494874
+1.365912027
+-0.08084109006
+0.5328992422
+-0.0881688136
+-1.83091849
+-0.5434551161
+0.6239242767
+0.824823138
+-0.5365520908
+-1.241553983
+0.7438273951
+1.125816751
+0.1619975248
+0.2171468379
+-0.0945205845
+-0.7705362404
+-0.2652542438
+0.3964420666
+-1.02448302
+1.487041072
+-0.159517684
+-2.522048413
+0.8388492464
+-1.23172351
+-0.9562405737
+-0.6581323283
+-0.2054009842
+0.08647070183
+-1.546765138
+-0.01671001055
+0.09752081677
+-1.622504745
+-0.65318655
+1.110378997
+0.1780981201
+1.412552033
+0.6659147382
+0.7821814816
+-2.061739218
+0.8627902323
+-0.3878584441
+-0.165276151
+0.01421015554
+0.04756238981
+0.8808799388
+0.09307317455
+1.985357859
+0.207534767
+0.04923528504
+1.805139654
+-0.5307197767
+-1.183699492
+2.32410534
+-0.3693919866
+-0.03561544284
+1.72078869
+-0.0219147715
+-1.082917976
+-1.576700731
+-0.1409223932
+1.347786639
+-0.1534931001
+-1.172858187
+-0.7144800284
+-0.2241252987
+0.3540037984
+-0.1153135264
+-0.9265352406
+0.1685252021
+-0.6477337865
+-0.5638371954
+0.1049879918
+-0.08417209637
+-0.5061149447
+-1.23767225
+-1.230211469
+-0.2418429531
+-0.04756205948
+0.347055458
+-0.7907449677
+0.08297869431
+-0.965246651
+-0.8953530416
+0.7561290176
+0.4937201745
+-0.359664821
+0.9256683237
+1.182803382
+-1.110897041
+0.6139956912
+1.388228818
+-0.2518001866
+-0.7563911152
+-0.9352231525
+0.9392328919
+0.546047484
+0.9603745972
+-0.9488556169
+-0.4981226347
+-0.4026987542
+0.5920458955
+0.009056527247
+-0.8863218243
+0.04909980671
+-0.178147072
+0.2800677506
+-0.9707691429
+1.388776886
+-0.6077256453
+-0.2242699443
+1.932980521
+-0.8913836501
+0.01877783457
+1.301544824
+1.371868278
+0.547800329
+-1.049578892
+-2.170890409
+1.319245138
+-0.9026982705
+-1.401151467
+2.044151087
+-2.023317358
+-0.008067949502
+-1.621756736
+0.4429032764
+0.04733582058
+0.9135802677
+-0.04562749818
+0.02881432488
+-0.5566142061
+-0.1602125719
+0.7894438508
+-2.343587152
+-0.8936960672
+-0.6324608715
+1.487390239
+-0.7355272841
+0.01852554574
+0.2910588643
+1.808832617
+-1.217250136
+-1.475050257
+-0.5276563966
+2.035254415
+0.4579901768
+0.05310673902
+0.1881679023
+-0.8126240876
+-1.081047033
+0.6841163405
+1.417079274
+0.4437287289
+-0.07697270548
+-1.091534359
+-0.4374568102
+1.674010313
+-2.924153142
+1.682530253
+-0.1471130759
+-0.3678592223
+0.1373748843
+-0.2201071432
+-2.501423912
+-0.6038212214
+0.7263562078
+1.206264502
+-1.037852806
+-0.245858487
+-1.389653241
+-0.07863101675
+0.979512763
+-0.2071324048
+-0.4947267638
+-1.672523082
+0.2150016104
+-0.6723101821
+-0.2168543877
+-0.9003168383
+-1.247777035
+-0.1771844694
+-0.6590758089
+1.19779556
+-1.593738227
+-0.7925133373
+-0.6221466799
+-1.65976109
+0.435044728
+-2.573836098
+-0.6248568564
+0.3362247095
+1.073586442
+-1.485271828
+-0.2946455457
+-0.3111856524
+1.279586231
+1.450967059
+-0.9087712893
+-0.8750560796
+-0.6453881979
+-2.56474935
+0.2437494662
+0.5734773367
+1.102734251
+-0.7475714402
+2.095336936
+-1.3439731
+-1.297399598
+1.159611701
+-0.9503767466
+0.001497896469
+0.1826970913
+0.1884649971
+0.3975955143
+-0.6645811147
+-0.1333314084
+-2.841551121
+0.4180964877
+-2.776437253
+0.2658072914
+0.2275587968
+1.401155327
+1.555511096
+0.8428824816
+0.9028973836
+0.3212300139
+-0.5996940281
+-1.024241992
+-0.6158038228
+1.692706743
+0.2687541283
+-0.3995000332
+-0.3005733613
+0.2216373646
+-0.2204890812
+0.6902763146
+-1.416999362
+-0.815186385
+-1.990480182
+0.4423972558
+0.6706801118
+0.7185264877
+-0.2972773996
+1.110876427
+-0.8177000487
+-0.5754866594
+1.197757222
+-2.62814945
+1.586740434
+1.416104285
+0.7671688087
+0.1658380544
+0.8150726085
+-1.627732791
+0.3003188102
+1.333678979
+0.8292962209
+-0.4848930875
+0.1618258777
+-0.5849781792
+-0.6967283908
+-1.147051641
+0.7196304696
+-0.9395693348
+-1.248522912
+0.9772579773
+-0.9749694732
+-0.9194549111
+0.1552649145
+-1.340796164
+1.057030071
+-0.07786913864
+1.70382995
+-0.2739207624
+-0.310247554
+-1.754890475
+0.4191471691
+1.282593112
+-0.5296666378
+1.029458837
+0.1527706771
+-0.8580433445
+0.4660653061
+0.2710532358
+-0.7573393183
+1.708581922
+0.2593532935
+0.2727315221
+0.03050963119
+0.6543181665
+0.7176416018
+-0.2725006007
+1.164631783
+-0.1886187531
+0.6548362215
+0.7484855999
+1.559614387
+-1.260884417
+-0.6304160454
+0.6321177156
+0.291215455
+-0.8312641012
+-0.2090908819
+-0.7051216586
+-1.557159339
+1.740083315
+-1.174703823
+-0.3725011927
+-0.3637978765
+0.4852464436
+-1.667911974
+-0.409245212
+0.4874619915
+-0.06851266674
+-0.2348806145
+0.1828349074
+1.025346109
+-0.3952368758
+-1.076744099
+-0.4530940663
+-0.5046754247
+-0.4909371521
+-0.3833635343
+-1.825499203
+-1.102243024
+0.3569259965
+-0.2243722264
+-1.788518477
+0.9822217211
+-1.402539429
+0.8213407034
+0.3869772312
+-1.186098321
+-1.205282846
+-0.153337588
+1.831475498
+0.8154266063
+-1.072418696
+0.8384286774
+-2.099983393
+0.2436810646
+-0.03491250779
+0.7932613453
+1.111041848
+2.497479812
+-2.838197944
+-1.060512436
+1.058907079
+0.9585606318
+0.8247618102
+-2.523029
+1.567249942
+-0.2026850697
+2.03088066
+-0.06376122616
+0.5324293276
+0.9650161448
+-0.3561647153
+-2.244160774
+0.5721330542
+-0.04206320293
+0.8333802859
+-0.129479903
+0.2182023253
+0.3625458538
+-0.3400902856
+-1.353757131
+-1.295209417
+0.7723783415
+-0.0648406301
+-1.240076932
+1.682794679
+1.140157608
+-1.52589696
+0.8159262636
+-1.195925052
+-1.550591916
+-0.603400438
+-0.6083354008
+-1.071505673
+-0.1194637068
+0.01402606212
+-0.9964612094
+-0.1172712543
+-0.5439452631
+-1.699554953
+-0.0008625089524
+-0.9978842108
+0.3596126922
+-0.7026297128
+-0.5324466667
+-0.7600529133
+-1.323205296
+-0.5340525539
+-2.164428862
+0.4067259525
+-1.640533164
+-0.3487933996
+1.160924552
+0.2904105008
+-0.1469300334
+-1.534703641
+0.2856205289
+0.01342631796
+-2.177194958
+1.004579602
+0.8746539402
+1.115761988
+-0.09074169048
+1.475323218
+0.5067856009
+-0.7191897921
+-0.3575884588
+-0.1088900156
+-0.4578659072
+1.691064771
+-0.3512211622
+-0.3477336914
+-0.001617036236
+1.60113068
+0.8124354022
+0.1603957378
+-0.3600437372
+-0.2487288563
+-0.5773666075
+0.8298076563
+-0.4896481999
+-0.719787778
+-0.06107468153
+-0.3374556024
+-1.563573753
+-0.6105449772
+0.5172725072
+-1.231092855
+0.6385519992
+0.238639992
+1.52649118
+0.5826241093
+-0.6799334389
+-0.5346289907
+-0.2036975213
+-0.7439309054
+0.414746526
+0.007807731195
+-1.043598467
+-1.209730912
+-0.3265855719
+-0.8725820021
+1.761094752
+-0.9714349647
+1.534985303
+0.2814086787
+1.237972236
+0.4718837208
+1.167627973
+-1.280400191
+-1.577651068
+0.4372701495
+-1.10334755
+0.6475730633
+0.4473706921
+-0.1467706281
+0.7794570806
+-0.6803262342
+0.9622517989
+-0.8587225112
+1.217499575
+0.2897004274
+-2.598196618
+-1.541810317
+0.08196965862
+1.587324864
+-0.7349403346
+0.729076063
+0.9269818888
+0.7080750859
+-1.257721114
+1.177021104
+-1.920380658
+0.7047928094
+-1.093695004
+-0.2829663056
+0.68877289
+1.250266214
+0.1848202503
+0.4263669061
+0.01820266657
+-1.579208972
+-0.3927980494
+0.877929208
+-0.4019509431
+0.4690700136
+-1.501607763
+0.3696859834
+-0.9097312746
+0.7302269243
+-0.7808380885
+0.5710436808
+-0.6982168687
+1.868310469
+0.05362891649
+2.734218223
+0.9965337469
+-1.373283508
+0.5279285496
+-1.594653953
+0.5114824603
+-0.009309413782
+-1.91160696
+0.5795865954
+-1.323743679
+-0.9147019646
+-0.5839482918
+-0.1468760111
+0.9125059494
+-0.1213563748
+0.6303017047
+-0.4348902698
+1.043106553
+-0.3461530264
+1.072531566
+0.9376847809
+-0.6338280638
+-1.786289263
+-0.8356691253
+0.4631983225
+-1.374175454
+-0.1512538873
+0.4590940097
+-0.753461942
+-0.804170877
+-0.1798563609
+-0.2793759532
+1.34965103
+0.9117848435
+0.628442598
+-0.1181348399
+0.5227888937
+-0.8071406124
+-1.44277509
+-0.5251013603
+-0.4712083482
+-0.4328814294
+-0.06250803765
+0.2701307135
+-1.239526498
+1.981950459
+0.5889578675
+0.7082516062
+0.1354319913
+-0.4342207529
+0.83505532
+-1.538043252
+2.201507541
+-1.292014054
+1.650375674
+0.4370865174
+-0.6922412518
+-1.832737118
+-0.1175616831
+0.01890468831
+-0.1070931168
+-1.765297755
+0.5713495819
+-0.8332466878
+0.3077534629
+-0.5451762944
+0.5432214624
+0.9431089867
+0.2331315847
+0.4595543706
+0.6053746235
+-0.5241636884
+0.6633955903
+-0.5136868248
+0.3695436725
+2.594961886
+-1.850582849
+1.373677802
+-0.2972381126
+-1.722577391
+0.3269241494
+-0.9890488627
+1.95495212
+0.5292824651
+0.6432071418
+0.2097698013
+-0.3138158131
+0.01103733821
+-0.8368542623
+0.6338981405
+2.17253574
+-1.30960664
+0.5576665474
+-0.8026767144
+-0.00249152856
+0.7201131939
+1.192823025
+0.2271231778
+-0.006230967012
+-2.367669846
+-0.240245331
+-0.5720393358
+0.8346249918
+0.1938629704
+0.6820137167
+-0.113882724
+0.0992246617
+0.6323102836
+-1.843368814
+-0.2471316315
+0.8616644424
+0.6367298353
+0.6539236155
+0.5544044706
+-0.3177534457
+-0.7643328611
+0.5900797632
+0.7913125367
+0.7577337917
+0.7785899874
+-1.044039651
+-0.663366022
+1.501299783
+-0.009162770452
+0.7560211764
+0.8975537732
+-0.9736179536
+-0.2276935037
+0.9973939507
+-0.3334585016
+-0.8088312713
+-0.3517300387
+2.348860833
+0.6854371682
+0.3064183809
+-0.4391704661
+2.629678794
+0.2384973084
+-0.932363023
+-0.1401946126
+-0.8720086902
+0.7077708184
+-0.3136989245
+-0.09326160173
+0.6460273398
+-0.4569581988
+1.722247318
+0.2486721948
+-0.5947818769
+-0.5724456261
+-1.292801151
+0.3518566986
+-0.2768443099
+0.1744876901
+0.7715813541
+-0.3155222523
+-0.6012001296
+-0.07789217604
+0.6547525836
+-1.526880313
+-0.8698882371
+-0.2165810948
+1.148402086
+0.6043649933
+-0.7420395816
+-0.04465737031
+-1.38370075
+0.5973102876
+-1.201723238
+-0.4692559028
+1.099696223
+0.4843816341
+0.3924929609
+0.5177378044
+2.131727945
+1.77975393
+1.802321094
+0.5402734779
+1.649248136
+-1.199828285
+-1.138382397
+-1.354422105
+1.051127741
+-0.3663887334
+-0.06661345003
+-1.712601826
+-0.1563147744
+-1.685129413
+-1.660218803
+-1.335558877
+-0.216477326
+1.35887121
+-0.7749710447
+-0.5971746767
+-1.513431916
+0.6159718513
+-1.02404875
+0.439978755
+-0.2938184734
+1.382400361
+0.9063399077
+1.743977729
+-0.8023254923
+0.7868092628
+0.0004580946337
+0.4446972175
+1.373697069
+-0.3319808661
+1.690384969
+-0.8114499211
+1.707023341
+0.3595496776
+-0.116606761
+0.6463969328
+2.551539916
+-0.9076561921
+-0.1777824034
+-2.195762015
+-1.998163515
+0.4334587625
+-0.7519865216
+-1.01046137
+-0.7528412321
+-0.2588641477
+-1.237197867
+-0.06988916931
+0.2212488349
+0.4128143219
+0.5448367309
+-0.3559420857
+0.1989956106
+-0.7013851925
+-0.6775157396
+-0.4674378187
+1.017581496
+-0.9423191757
+-1.464492549
+1.011921063
+-0.5379062852
+2.379046412
+-0.7766230407
+-0.2486738822
+-1.735268816
+-0.04902555246
+0.3822934037
+0.7362163809
+0.7763320457
+-0.1527946008
+1.248564543
+0.2239975348
+0.6150395402
+0.1295638365
+0.09608310352
+-0.1421104435
+0.6133358443
+0.8356537603
+0.7742197559
+0.1762249805
+0.1703704122
+-0.3257652538
+0.5471190837
+-1.545982211
+-1.510463389
+-0.340469803
+1.101983953
+0.8252863012
+-0.2277153993
+-0.4301207094
+-0.06888776207
+0.8002320116
+1.429223579
+0.4345422875
+-1.442071399
+0.1606875385
+0.3235762162
+0.141138236
+0.1357653513
+-0.422293389
+-1.084738986
+1.802309791
+-1.366707262
+1.577891378
+-0.01318764027
+0.3190685369
+0.8450273632
+1.164196169
+-0.7162372482
+0.3938808959
+-0.3219540827
+-1.723983181
+-1.185039112
+-0.2674075653
+1.180410378
+-0.9732410257
+0.15303477
+-0.5131613392
+0.5818021623
+-0.1796519811
+-0.3842805691
+0.4687068385
+-0.3080356952
+0.6460461071
+-1.988121884
+-1.734178644
+0.0405684935
+-1.255755337
+1.195975214
+-0.2807148849
+-1.105458413
+-0.9994213418
+1.373190676
+0.5248828515
+1.186696476
+-0.8613355953
+-0.2546068807
+-0.4799605494
+-1.896969597
+0.2036823245
+0.02738173738
+-1.916928814
+-0.9908143859
+0.1783454618
+0.4995328878
+-0.3635697889
+-0.04502468898
+1.670172662
+-0.1013248321
+1.043542672
+-0.8696965539
+-1.163208661
+0.1831671089
+0.6457328876
+0.2006639573
+1.576416327
+1.4348359
+0.4867582585
+0.09980353458
+0.2122234835
+-0.06860260546
+-0.2263608654
+0.3516403503
+0.7742586784
+-0.3687585189
+-1.523898501
+-1.508588291
+0.2777234665
+-0.3668000814
+0.1228307164
+-0.8946448596
+-0.5748973094
+-0.05524378929
+0.1306430244
+0.4406910619
+2.417459282
+-0.9714004773
+-0.5191168603
+-0.5188544435
+1.317810078
+0.1041980864
+1.246373958
+-0.07904287289
+0.6186703349
+1.286451352
+-0.8152043881
+0.4917009101
+-1.106779898
+0.09276387874
+-0.181128406
+-0.4697842627
+0.3500574669
+0.3294186117
+0.1947860904
+0.8966708418
+1.93810893
+-0.9195051489
+0.7260957821
+0.8662853784
+-0.514577023
+0.1757200522
+-0.8238931231
+0.1056567125
+-0.137465915
+-1.286182324
+0.584909666
+1.864620374
+-1.682076829
+-0.9834036921
+1.380774516
+-1.243595947
+-1.613089977
+-0.7388973805
+2.22426303
+-0.4154294187
+-1.748073094
+-0.2249363261
+-0.7993203186
+0.6460397699
+0.1766046193
+-1.643723856
+-0.01105509707
+-1.447640303
+-0.2804416941
+1.261732726
+-0.2355776926
+-1.687300106
+0.8121862913
+-1.627229549
+0.7626906483
+0.1414132693
+-0.991077651
+0.8963002826
+1.48958677
+-0.7519250237
+-0.1140206982
+-0.2397381146
+1.831758865
+0.9710619403
+-2.138955601
+-1.138137137
+-0.7534425555
+-1.234997176
+-0.9838739462
+0.7869290288
+0.7393561816
+-0.901081523
+-0.1183883203
+-1.519379566
+1.023406286
+0.4929726802
+-0.5983226541
+-0.8546621748
+-0.992848712
+0.8580879329
+0.8566496151
+0.3198273618
+-0.2430842821
+0.2529213279
+-0.4792161899
+-1.486494995
+1.455532252
+1.330630306
+1.20002396
+-1.255648253
+0.4722168475
+0.738576386
+-0.3788935386
+-0.4737539478
+0.9722071523
+-0.9189504764
+0.6632404961
+-0.1334913996
+-1.566370336
+-1.748651443
+-1.122591937
+0.798550811
+-0.08809313496
+-0.2178262483
+0.3675931737
+-2.163677976
+1.57683721
+0.03329115011
+-0.615115294
+0.7404027771
+0.7260823791
+-0.8314466869
+0.6558555611
+-0.3027761552
+-1.385525579
+0.08396813037
+-0.8914278082
+-1.56802865
+-0.6328111989
+-0.1193251282
+0.2832503254
+0.2091138912
+0.07650402649
+1.070745881
+1.131310865
+0.6235074633
+1.178459423
+-1.436333123
+-0.4905205333
+0.1248268538
+0.3911684305
+0.2099477891
+-1.499089165
+0.5412989246
+-1.171077824
+1.218729669
+0.699115989
+1.268679153
+0.09842575044
+0.1025270326
+1.602376315
+0.3297880814
+-0.9317253978
+-1.277725914
+1.572935721
+0.7261554916
+-2.745665405
+2.269012825
+-0.4050147481
+1.78086881
+1.901687952
+-0.3218570055
+-0.2043680093
+0.1489765618
+-1.459383271
+-1.501740586
+-0.8670357105
+0.212623761
+1.335105853
+1.631275886
+1.630444514
+-0.4380942516
+-1.365091351
+-1.451177095
+1.031603069
+0.8142898964
+-1.609517184
+0.7330581031
+-0.3812020259
+0.5772187129
+-1.042391407
+-1.727321913
+-0.05685553295
+1.225661018
+1.600826894
+0.4206520201
+-0.5724737216
+-0.2653441679
+0.5704436983
+-0.2628526587
+-0.7718463656
+-0.1277451565
+1.182043031
+0.4724800874
+1.46066928
+0.04915029228
+0.4095941194
+-0.5304942031
+1.300716912
+-1.695281249
+-0.3756690426
+0.3484024564
+-1.618500162
+-0.1921009714
+0.07084759652
+2.435728505
+0.9716811976
+-0.932962208
+2.865203541
+-1.792047993
+0.5449343867
+2.449449168
+0.01708347927
+-1.396088083
+0.5912993639
+0.79082339
+-0.2101195259
+1.090836056
+0.9109295775
+0.105351827
+0.927350537
+0.893020521
+0.5378038047
+-0.6903609564
+-1.187853008
+-0.4941872463
+1.177065752
+1.058261781
+0.5110420529
+0.5188018149
+1.361553342
+-0.2138238231
+0.4488541289
+1.464705654
+-0.3835515246
+0.727645982
+1.193956009
+0.2122646532
+-1.012906587
+-0.5653158441
+0.1305658932
+0.273906776
+0.7412998157
+0.06156683207
+-0.4668753084
+2.549112342
+1.099156731
+0.6903137135
+0.6747993177
+-0.4939589163
+-1.800153275
+-0.204302668
+0.003536869842
+-0.00573332007
+1.061263823
+-1.462644263
+0.4315978863
+-0.6228010249
+1.240477055
+0.1704462854
+1.986898258
+0.1113011661
+1.209655033
+-0.4573297684
+0.9231834935
+1.325518815
+-0.9531663653
+-0.6781297963
+0.3340995989
+-0.7549282416
+-0.3883825165
+-0.6265756531
+-1.306421165
+-0.03849585157
+0.1435673874
+-0.7890736495
+-0.09850370081
+-1.452866412
+-0.9478659644
+-0.8695786927
+-0.3055172751
+-0.605147353
+0.2248205377
+-1.038472427
+0.7718191687
+-0.4800092945
+1.834745099
+-0.1087654252
+0.4544749908
+0.09870934946
+-0.4583054457
+-0.8570440276
+-0.7744029476
+0.708787328
+0.01847360203
+-0.1040805773
+-0.234857738
+-0.2509063512
+-0.9627502495
+0.4934051538
+2.133050049
+0.9838882936
+-1.80928169
+0.04235881417
+0.5168721789
+-0.03292069305
+1.298111432
+-0.2021170271
+-0.8332310007
+1.733600247
+0.1906490041
+-0.1778103936
+-1.085025119
+0.9722623328
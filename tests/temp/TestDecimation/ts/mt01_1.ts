@@ -0,0 +1,10008 @@
+# mt01 ex 100.0 1234567890.0 10007 mV -30.5 140.25 10.0 
+3.528104692
+0.8003144167
+1.957475968
+4.481786398
+3.73511598
+-1.95455576
+1.900176835
+-0.3027144166
+-0.2064377036
+0.8211970039
+0.2880871423
+2.908547014
+1.52207545
+0.243350033
+0.8877264655
+0.6673486547
+2.988158146
+-0.4103165275
+0.6261354033
+-1.708191479
+-5.105979632
+1.307237191
+1.728872398
+-1.484330041
+4.539509248
+-2.908731349
+0.0915170346
+-0.3743677001
+3.065558429
+2.93871754
+0.3098948514
+0.7563250392
+-1.775571495
+-3.961592936
+-0.6958242987
+0.3126979382
+2.460581361
+2.404759698
+-0.7746536348
+-0.6046055012
+-2.09710593
+-2.840035874
+-3.412540381
+3.90155079
+-1.019304364
+-0.8761486032
+-2.50559072
+1.554980712
+-3.227795695
+-0.4254805604
+-1.790933122
+0.7738049957
+-1.021610275
+-2.361264368
+-0.05636445668
+0.8566637411
+0.1330344448
+0.6049437955
+-1.268644187
+-0.725482332
+-1.344920896
+-0.7191063231
+-1.626292564
+-3.452565205
+0.3548522845
+-0.8035618724
+-3.260396694
+0.9255645111
+-1.814596729
+0.1038907916
+1.458181124
+0.2579658215
+2.278801369
+-2.469651641
+0.8046832824
+-1.369620182
+-1.741594298
+-1.15769933
+-0.6231050643
+0.1123306845
+-2.330299682
+1.801652974
+0.9313248795
+-3.072487373
+2.976504388
+3.791778352
+2.357559142
+-0.3598496716
+-2.141505243
+2.108903454
+-0.8063538939
+2.444890141
+0.4165499562
+1.953278073
+0.7127327943
+1.413146336
+0.02100004144
+3.571740988
+0.2538241854
+0.8039787269
+3.766301394
+-2.695518122
+-2.540969997
+1.938793416
+-2.34624681
+3.887242371
+-0.8272379615
+-1.494909623
+3.845884053
+2.961029583
+3.735117921
+1.812089317
+-1.72245137
+3.820129906
+-0.5360067419
+1.604912792
+1.894503936
+-0.3100201862
+1.228158741
+1.844413343
+0.7528510623
+-2.198801581
+0.5964763484
+2.652771793
+-1.389135719
+-0.2992690807
+-0.8703071034
+3.698527457
+1.344589514
+0.8149236725
+-1.539832149
+1.078498383
+-1.348665321
+0.06366111655
+-1.271692157
+1.35286659
+1.153181633
+-0.4165975112
+0.7920134253
+-2.186123017
+-2.982515185
+0.8787834025
+0.3333469907
+1.270062874
+4.76628955
+1.888958974
+-1.825644451
+2.234032576
+-2.631814821
+-0.9231692096
+-0.1364832106
+3.426685443
+-1.489509644
+-1.652877077
+-0.1969050489
+-1.326956573
+2.253271844
+-2.159863017
+-2.294937305
+-0.8756400895
+-0.9960649014
+3.859064108
+1.898841614
+0.1751024828
+-2.450871038
+1.688725953
+-2.000430695
+-3.089542194
+2.376059585
+0.6338852238
+1.841717648
+0.6374553059
+1.713661224
+-1.302051187
+-2.068485684
+1.363189037
+-1.606819328
+-1.379099556
+-0.911065007
+0.03495831805
+-0.7079878225
+-2.749902587
+-1.287236806
+-4.446806304
+1.250462902
+-3.204115311
+-2.208766679
+0.1043301585
+-1.479125993
+3.086029191
+-2.585713819
+0.5341017387
+-0.07856563645
+-2.336186995
+1.046553321
+-0.3430926624
+1.543581102
+1.647008308
+4.326471899
+2.673055899
+-0.7383636759
+-0.4787583552
+2.199319192
+1.310527461
+1.280263052
+-3.233912089
+-0.0486522488
+-1.476061818
+0.5598491981
+-0.1963007793
+1.820357816
+0.6344364304
+1.572655924
+-0.9328381935
+-1.888892512
+-0.8200993864
+-0.03404082772
+0.7583034711
+4.518617901
+-0.08451430332
+-1.911890001
+-0.6919635514
+-0.9271919493
+0.9629629475
+-3.081594029
+0.1265239884
+0.3130130759
+0.4643620724
+-1.194632138
+-0.4758434595
+-2.848121818
+-0.9866397667
+-1.085722952
+0.8321000925
+-2.312364864
+1.562396203
+2.988969089
+-4.13997005
+0.8525174616
+1.35381607
+-1.274874051
+-0.7945436287
+-0.2657611552
+-0.5955817588
+-0.6180259381
+-3.352007613
+2.30466313
+2.159237184
+-1.626728518
+-2.932848656
+1.042129753
+-1.15157594
+0.2839063266
+-0.6386568343
+1.383077502
+1.389498287
+-1.451194757
+-2.766727911
+-3.165876795
+1.220758758
+-2.377718516
+-1.013632709
+-1.192628077
+-0.1051345925
+-3.872559612
+0.3775571936
+1.047782048
+0.1768441741
+-0.6217723434
+0.1948003325
+0.7980926913
+-5.545185513
+3.911824617
+0.7801866454
+-1.304817165
+-0.7819067504
+0.9874835547
+-0.2322078781
+-4.061368936
+4.128985723
+-0.2210813145
+2.040345423
+-1.384099696
+3.072754108
+0.5726873778
+1.217687669
+-2.090506732
+2.422290579
+1.379636329
+2.603692459
+-1.256175119
+-0.9620542369
+4.607833395
+-2.120031645
+-0.2718994014
+2.273782725
+0.1954499354
+1.16590736
+-0.7988980585
+0.7401117757
+-2.613053703
+3.316261359
+-0.2363280903
+-1.360356408
+1.332766164
+-0.9214395748
+-2.668516943
+-2.693435012
+1.387546305
+-0.3191468763
+-0.2674031193
+2.155487612
+-2.253651618
+-1.461355506
+-0.7697596184
+0.1887031786
+-0.08434290258
+-0.5737743848
+-0.1232528042
+-0.2146105526
+-1.439208777
+-1.625985977
+0.5490327154
+-1.781830166
+-2.314710518
+-0.6245845023
+-0.3153340323
+4.513446995
+-1.409400552
+1.88652145
+1.494376668
+-2.37788991
+1.546505955
+-2.36776128
+-5.318344476
+1.212639049
+-3.511781167
+0.9018689236
+-1.368021795
+3.319101592
+2.137018799
+-0.9067716077
+-1.375675222
+-2.428154806
+-0.8818452646
+-0.5607109904
+-0.7293870888
+0.3134077105
+1.157042995
+0.699308914
+-1.528287848
+-2.875582948
+2.729063696
+-1.378898369
+-1.3045872
+-1.042378625
+-3.6861391
+-0.9559480081
+-0.959311628
+1.240716597
+1.396914298
+0.007541778173
+1.863696748
+0.6799299676
+-0.03136422321
+0.3218563366
+-0.3813069872
+-0.7896990281
+-0.5354670738
+-2.256022663
+0.5608834106
+-1.986247222
+1.683262528
+-0.4989171603
+0.0989899633
+0.9876735526
+1.28662893
+-3.141246817
+-0.4138073523
+1.760357824
+-3.396211639
+0.7745609508
+-4.511128459
+-2.045013687
+0.07726110368
+-3.313430205
+-1.971021475
+-2.943670015
+3.296269864
+0.328455511
+1.134580556
+-0.445350201
+-0.7068634975
+-3.232948377
+-0.5836747255
+-1.522984424
+1.715847849
+2.282203733
+2.933157431
+1.705103879
+-1.197307874
+-2.231793972
+1.533326363
+0.7125856349
+-3.537076901
+0.7109635855
+1.629039645
+0.1178511784
+-0.370107342
+-1.615296975
+-2.893069399
+1.600595899
+-0.6182288895
+-0.4669333231
+3.465442374
+1.369002214
+0.7416500026
+0.2841236104
+3.039989722
+3.439178615
+1.859010223
+1.164449183
+-4.189206142
+0.2474438285
+-0.2602139084
+0.1879064588
+1.886092175
+-5.479354334
+-1.138624107
+0.5398087099
+-0.9336910921
+-2.833812226
+1.737926974
+0.5537438117
+-1.942209141
+0.629634409
+1.643171424
+0.0105852926
+1.601129607
+0.1565203503
+-0.7904579653
+-2.318841033
+-0.1718615339
+0.3885858761
+1.751665523
+-0.230214937
+0.9148312124
+-1.929224027
+-1.565258312
+-0.2207785981
+-2.109256928
+1.640495675
+0.9262606586
+0.5581915288
+0.6778082504
+4.042087123
+-0.9377283759
+-4.402882571
+0.3986003938
+-0.1012070819
+-1.035038085
+-1.957659719
+-0.8783790436
+0.3626768584
+-1.005633401
+4.824907359
+-1.921008763
+-1.586234725
+-4.57724008
+0.50296883
+-4.032813256
+-1.078909267
+-0.5513410691
+-1.419455932
+3.477745355
+1.988788783
+2.638273753
+-1.764837637
+2.257188129
+0.9920018927
+1.542811897
+2.058877658
+-1.817526492
+-0.848635242
+1.725192023
+-5.311238186
+3.026656165
+1.106264128
+-0.09140792132
+0.4410153115
+-2.059870567
+-0.6998867292
+2.200568676
+2.596043945
+5.392448105
+-0.1478493326
+-1.317105934
+-1.028467932
+-2.036083751
+-0.1557095119
+0.76546486
+-0.06848456106
+2.192693691
+-0.4684316027
+-0.694901305
+-1.162536954
+-3.265269052
+-3.135535449
+-2.358315861
+2.602856143
+1.790520546
+2.749928133
+-2.664423309
+-3.93724938
+-1.32011264
+0.3516379066
+0.9973805498
+2.095944312
+0.5685593416
+3.485337561
+-0.4452113619
+-1.826158436
+-3.362436431
+-1.777942716
+0.484235922
+-1.777440515
+1.873484927
+2.824655412
+-4.73917381
+1.728104601
+-4.479208117
+0.8029981102
+2.449741128
+0.1297122127
+-2.559378346
+-1.170862409
+-0.5232908914
+-0.3644895676
+-0.4057936815
+-0.2197655586
+0.4269600978
+-2.417147307
+-0.4840396597
+3.036522341
+-0.7692908463
+-0.8876721863
+2.156394607
+-5.118369333
+2.362757203
+-1.263807516
+0.3278571449
+0.1926427118
+1.884936238
+-0.5351894925
+-1.356051563
+2.595691581
+-4.728347634
+0.04066836341
+-2.695850845
+-1.523146777
+4.022513363
+-0.08919085291
+0.3901393943
+-3.563125711
+-1.458089318
+0.3931148015
+0.7095153862
+1.233773109
+0.01725579784
+1.054008417
+0.9075638253
+-3.659480822
+0.07401144382
+1.535804815
+1.179759641
+-0.7277176199
+-1.611253015
+-2.236623849
+-0.2621080231
+2.266159759
+-3.903608203
+-1.319783459
+-2.279604911
+1.569915042
+-1.108619253
+-0.9412753163
+-0.4338991399
+0.8907865018
+-0.7847779963
+-6.09228611
+1.086623783
+0.8780859153
+-0.4390820567
+-2.168073241
+0.7035602214
+0.7584710671
+-0.9400657654
+-0.4334629412
+-1.860313005
+-0.3571781842
+-3.10085869
+0.8346376421
+-1.888736982
+0.4762062957
+-2.811925833
+-1.180115292
+-0.2209788101
+-3.321399624
+0.2302957463
+-0.7582951258
+-3.484712396
+-2.606485508
+1.210240168
+1.791111971
+-0.2638172796
+0.8095236241
+0.4476871266
+0.6592459643
+2.571968014
+-3.013996796
+1.352921465
+-0.7640179112
+-0.4485178685
+-0.6044994609
+-0.7502942333
+-2.452392384
+0.3666783985
+3.341886066
+-0.1122660409
+-0.00277008547
+-1.374598074
+-0.2349490928
+0.9323328521
+-0.7404848814
+-0.9076080821
+0.8065290803
+-1.83600954
+0.5049932542
+1.640643595
+2.719897083
+-0.1807640146
+2.73519448
+2.068819773
+-1.992425281
+-2.435877023
+-0.6099272757
+2.057870985
+-0.1445740151
+-1.201315115
+3.10448636
+0.573808976
+-4.641188552
+0.6343212526
+1.040081229
+0.4512173089
+0.8994242005
+-0.1345512178
+-2.636791739
+-0.7414080064
+-1.891231591
+-1.865481822
+-2.526136698
+0.9049781853
+0.1957922908
+-0.8963307254
+-1.298675855
+-0.04684621004
+2.158389456
+-4.008431431
+0.7537530417
+-1.091423948
+-3.76917169
+-3.891406166
+-1.825566988
+0.4390191116
+0.786125868
+-1.877963145
+2.034041983
+2.845966993
+0.7921731699
+-1.182805336
+2.248838369
+1.510791391
+1.734814823
+-1.31292735
+-5.669109011
+4.233582043
+-3.221756807
+-0.07153614372
+4.761490702
+0.6611535125
+1.898492947
+-3.004793139
+-3.555333909
+-1.065405584
+2.181499469
+-0.6924988953
+-1.589272642
+0.3959345799
+2.163870437
+-2.889880398
+-2.421085988
+-1.577338509
+2.189276749
+0.4696430519
+4.264306821
+1.872891452
+-0.07019035374
+2.530155676
+0.4229940255
+-1.409842705
+1.359949688
+-1.392653308
+-0.5807942016
+2.655565392
+-0.2025629724
+-1.606282775
+-0.9286753829
+2.043581171
+-1.105081347
+-0.7737416937
+-1.020585479
+0.3678509887
+-0.7709795208
+-3.203672098
+-1.774361884
+-1.865578083
+2.486638769
+1.625348084
+1.174518759
+-1.010716635
+-1.631583084
+-1.015035203
+-2.103760205
+4.994400783
+-4.490643297
+1.12801707
+-2.569104596
+-0.208686983
+-1.976003885
+-2.355257925
+-2.280392602
+3.509972307
+-0.2659768446
+-1.531404389
+1.111573928
+0.02069862913
+1.440067519
+-3.648513312
+0.6072078089
+1.545389674
+-3.323196582
+0.8963905688
+3.392363146
+-0.02971540671
+1.642811874
+1.341140901
+-1.415011395
+0.07953346917
+-3.133989422
+-0.9026060742
+0.5313759499
+1.446200987
+0.0492242505
+1.43996746
+-2.205812426
+-0.2033945491
+0.03855876903
+3.699182493
+-0.4283333124
+-0.998033276
+0.04270244769
+-1.83822689
+0.3855076981
+-0.7301104331
+-3.582655096
+-0.1171731023
+-0.6350861879
+-3.264846604
+-0.1342683092
+2.978711924
+1.042607497
+1.223854385
+-2.682993451
+0.9537967378
+0.2968991628
+1.058090477
+0.8452572434
+-2.719561451
+-0.08280162312
+-1.515741721
+-0.1001681886
+-1.794801854
+2.624940734
+-1.717944777
+-1.797884313
+0.1491728131
+-2.154198139
+-0.8493266049
+-1.659929195
+2.822344128
+1.571607654
+-0.1149390369
+-0.7824341043
+1.881835229
+0.8104081606
+0.9961048094
+-0.05238447469
+-3.376460056
+-0.2249319651
+-1.064979838
+1.290110547
+2.023684866
+-1.31590209
+0.9367704686
+3.471757995
+-1.335425441
+3.36384348
+-1.705171694
+0.04591951122
+-0.02229122368
+0.02299779974
+-1.675356084
+-1.182366208
+-1.335440573
+0.6539251908
+0.660070229
+4.451888663
+2.741978013
+-1.019686484
+0.6497392316
+1.994235962
+0.06120364868
+-0.1392831569
+0.1031498855
+1.734553258
+-1.696641046
+-0.6513389376
+0.9408662897
+0.6228941431
+0.4791655197
+-0.7396023326
+1.945071578
+4.267736494
+0.8128309874
+-0.3863534031
+1.511480578
+-1.078265274
+-1.499380689
+0.06561749523
+-5.165593266
+-2.307900727
+-0.6959237118
+-2.706777716
+-2.065286204
+-0.8734966749
+-3.285930587
+-0.8121435925
+-1.070540329
+0.05081041677
+2.308368061
+0.345008833
+0.04212404268
+0.1989089141
+0.4547855502
+-2.033477297
+-0.2295506495
+0.6175024837
+-2.741519965
+1.731305846
+2.162752069
+-1.262751977
+-0.4826755829
+-1.756380686
+1.398760967
+-2.122444575
+-0.4449540205
+-1.717839816
+0.101908554
+-3.588458543
+2.652923285
+-1.929212848
+0.1197893662
+-0.4250460895
+-1.524229024
+-1.775560273
+1.872797087
+-1.051281186
+0.5423403693
+-1.602993771
+-1.294362864
+0.9444943002
+1.860816992
+-0.3506328047
+-2.843839743
+3.99591216
+-1.713098616
+-3.083174799
+5.188849176
+-0.8080645877
+-2.923465377
+-1.366879534
+0.735089792
+0.3806231152
+-1.703458395
+3.6454472
+-1.043159356
+-2.369373181
+1.921386797
+2.658125693
+-1.634986195
+-2.802694586
+2.060876535
+-4.094647226
+-2.453243319
+1.9348923
+-0.110705096
+-0.5278746972
+0.705633213
+-0.3055488471
+-2.597373444
+2.552150692
+2.650028106
+0.4106651276
+0.09026803086
+4.679249612
+-0.55286569
+-0.5191539637
+0.7289624985
+2.942643912
+3.185541509
+-0.5171452634
+0.6166624919
+-2.756166934
+-0.6239522158
+-1.680580791
+-2.013663505
+3.363153433
+-1.584573324
+-1.063211816
+0.7316975758
+2.595650534
+0.9622302528
+5.518710228
+-0.1493359565
+0.5174328805
+0.551201348
+2.870098774
+1.014477902
+-0.2324594008
+-1.89497719
+0.4888869119
+2.802689663
+-0.8207635873
+1.057887237
+0.4922955774
+1.727039317
+-1.609507481
+4.693294061
+-2.558322214
+-0.73110218
+1.876185082
+0.593466345
+1.659972318
+-0.992204668
+-0.1496099654
+0.02446396728
+3.138519229
+1.380858049
+1.593344217
+-1.315852185
+1.937765277
+0.4511633271
+2.778290631
+4.02812031
+-0.6135315521
+-0.8126062609
+-1.728089982
+-0.2871590234
+-0.7640508979
+0.7190087991
+-0.2891336339
+-0.7231985616
+2.129170272
+-1.875760462
+0.8662159063
+-0.8118834544
+1.44873701
+2.770523093
+-0.6061965068
+0.8820658145
+0.3575857315
+-1.598844799
+0.4815750195
+0.5782410106
+0.8257416409
+-0.3967977936
+0.1883846006
+-2.29522189
+-0.716228151
+1.111925359
+1.784947775
+-0.8446296483
+0.2094280589
+0.4561066502
+0.4029598934
+1.081547171
+-3.636155261
+-0.0986481403
+0.4780672025
+-2.000660698
+3.347971414
+0.3231185345
+3.12680949
+-1.581046044
+-1.814600243
+0.4485044419
+-3.357376726
+0.4299311813
+0.194438464
+2.031330563
+1.402082682
+-0.8349546998
+-2.19499331
+3.424610443
+-1.584230041
+-2.091049114
+-2.169712119
+2.234610631
+-1.037800409
+-1.507408932
+0.2753796518
+-0.4138894211
+-1.356190922
+1.507982934
+2.130630984
+1.970635018
+1.533839339
+0.8052510623
+-3.551776
+3.338501613
+0.6039784207
+1.216312855
+2.229924646
+2.866705006
+0.8367960226
+0.8710923186
+-1.198448555
+0.06617950228
+-1.708322522
+-1.439881064
+-1.787148805
+-0.312047782
+2.098186376
+6.341949547
+0.3789992751
+-2.696826176
+2.52996666
+-0.601567753
+-1.321217188
+0.4196989558
+-2.481249199
+0.444926328
+-0.1767510464
+0.1967558136
+0.7628325084
+0.1349845145
+0.03267616823
+0.568629038
+0.8308012523
+-2.062964921
+-2.859982517
+-0.1232761043
+-2.86547098
+0.1750629418
+1.877493751
+1.214223344
+-2.096340814
+-1.720524904
+0.65660259
+-0.8025956103
+-0.6333105901
+1.193812962
+-1.974573387
+-0.8024694198
+-1.600164952
+-2.086258996
+-1.714156377
+1.354924339
+0.103640779
+-1.758321258
+-0.4622032152
+-3.277614614
+-1.466625615
+4.29914907
+-0.1804876993
+1.463317854
+-0.1309767503
+0.6963384705
+1.326516179
+-2.209233195
+-0.06187251455
+3.157730389
+-1.5910011
+-1.132879707
+-0.6153825547
+0.5380481464
+1.049835727
+2.53482331
+0.9989964669
+-0.1241062516
+2.518334259
+1.408222044
+-2.991359033
+5.052736481
+3.539842776
+-0.3364284455
+0.7558202035
+2.6487175
+-0.3444015854
+1.460703581
+2.209156947
+-2.029651815
+-1.204663707
+1.842816796
+0.9216289543
+1.847593121
+-0.2651360293
+-0.5780104219
+-3.997278951
+-2.292000853
+0.09413218932
+1.649114439
+1.062356733
+-0.2564839481
+-0.543543133
+0.4343592653
+0.1564223622
+2.80909103
+0.292881541
+-2.962491924
+-2.54511627
+3.037518674
+-2.342320923
+1.528994906
+-0.5367454704
+-0.3395165878
+-0.2682655655
+2.442769919
+-0.3856836571
+-0.06663856569
+-3.061606995
+0.4133810234
+1.062085014
+0.4782911613
+2.795792522
+0.1103427096
+0.5979549122
+3.297008021
+-3.100028379
+-0.9116506956
+2.852317504
+1.872258297
+1.356760198
+1.665301479
+0.6541324182
+3.263194855
+0.7555183395
+0.4797342118
+0.3179173483
+0.3857279111
+-2.314034562
+1.541346109
+-0.2608794676
+3.643830196
+-0.1513009412
+0.8418365684
+0.4932043725
+-1.25111407
+1.984273657
+3.810127281
+-0.02955443932
+-0.6009575712
+-0.7100574621
+-3.784723787
+-0.3556262874
+0.501996232
+2.10951585
+1.920095482
+-0.8329981649
+-0.5536459895
+2.247810611
+-0.3469277941
+-1.02005908
+2.785036899
+2.075171334
+0.03758358355
+-1.187554896
+-4.023760638
+1.179407211
+-1.792739445
+-3.925464018
+3.169641055
+1.295935582
+-2.278016386
+-2.428802766
+1.741923564
+-1.755941233
+2.592299735
+1.232918625
+1.073193041
+0.8093909112
+0.382901744
+1.761022398
+-0.908160725
+0.1719039469
+1.503893175
+1.125979437
+-2.389973611
+-1.000819335
+0.5056070108
+-0.8160294181
+3.549317122
+-0.7863063895
+-0.3244368952
+1.538860356
+0.6610654865
+-0.2905489144
+-1.512987058
+0.6030281148
+2.078192881
+0.9581904482
+-1.556367043
+3.473549914
+-2.89315578
+-3.165371284
+1.921114449
+0.4516809572
+-1.098997093
+-2.197141455
+4.641599679
+0.2341817443
+1.068402342
+0.6357701945
+0.8696159155
+1.080188921
+1.46484802
+-0.7504448015
+-0.5832839727
+-3.482045617
+-1.560608813
+0.5422255929
+2.090046751
+1.198079053
+-0.6813846878
+-2.526345824
+-5.554718291
+2.30346795
+-1.178457973
+-0.8969300124
+0.2631479358
+-2.811120095
+-0.6995643602
+4.0469439
+1.010773877
+0.718498313
+-3.164988956
+4.487203789
+-2.845589817
+3.844649511
+-4.23011203
+2.810730877
+3.236108538
+-1.648818243
+0.8451607445
+1.094961144
+-1.627588966
+-2.898235221
+-2.635434686
+1.08201644
+-0.170231205
+-1.128602067
+1.933536022
+1.016135819
+-1.510925453
+-2.402403038
+1.046523477
+-1.075166737
+0.1984097251
+3.152597945
+1.00465648
+-1.724534
+0.3213223796
+-1.905289906
+3.217044312
+-1.123157499
+0.4145414939
+0.6154651494
+0.3185009367
+-3.91709791
+-2.892842128
+-0.9047005511
+0.6388636667
+-0.2755584286
+-1.914294946
+-2.696848638
+-0.803115089
+-0.9369520894
+1.025672915
+-0.6526369243
+1.205415313
+-1.189299539
+-0.5119153384
+-0.6960927593
+-1.564733934
+1.250237313
+-1.627191994
+-1.04328302
+-0.1462392919
+-2.594759312
+-0.6498699166
+-1.422612719
+-0.776308385
+-0.1198560053
+-1.599827246
+-0.4401515596
+2.617337505
+-0.05159711651
+2.290524346
+0.692988884
+1.54832122
+-1.548917938
+0.2098143302
+0.2678258452
+-1.225251478
+-1.645656649
+-2.980530776
+2.992279274
+-1.944805779
+2.692442146
+-0.9349863473
+-1.724986599
+1.245038281
+-1.262383883
+1.136917838
+-0.6656235297
+0.9608489922
+-1.936372128
+1.662702116
+0.9759453653
+-1.83930138
+5.285871442
+1.080246053
+4.580934141
+3.200535637
+-0.3776695604
+-0.8245435092
+-0.8069183668
+-3.660057101
+-1.391670239
+0.493532048
+3.051915122
+-1.545543766
+1.764113199
+-2.505186683
+-1.17264005
+-0.9152811886
+0.743622163
+0.9146192934
+1.92468349
+1.541673921
+0.4863364308
+0.780729887
+3.177061382
+-1.021852362
+1.549456638
+-3.616287853
+0.8226684858
+-0.966499085
+0.005142364863
+2.08017249
+0.3292876191
+1.770375082
+2.94752963
+0.7781879377
+2.342082129
+-0.6531219554
+-0.01641976454
+-1.045238833
+2.085955189
+0.8281827076
+-1.014468924
+0.3093376673
+2.083136778
+-0.07853598208
+-1.897865622
+0.2638235116
+-3.961131182
+1.537541289
+-0.8426551746
+-0.9386214726
+1.751391358
+-2.730325754
+3.894197286
+-0.9604840835
+-1.046501887
+2.042449486
+1.417390546
+4.902459438
+-0.4224119673
+-0.2408132773
+-2.95863196
+-0.6642045547
+-1.442862591
+-0.8975340262
+-3.488375513
+3.32121512
+-2.833206965
+-5.604405597
+-2.376848843
+-1.207679106
+-2.299108127
+2.196607081
+-0.2756783572
+0.05077120881
+1.220783529
+0.572025054
+1.957134595
+-2.218955107
+-1.095036201
+1.331934292
+-5.069108924
+-2.750368959
+1.001984464
+-0.96049807
+1.8722151
+1.618360594
+-2.39618576
+0.8133141749
+2.403395711
+0.2948688033
+-1.954929754
+1.758779884
+1.270849053
+1.085221567
+1.431877787
+-5.98922572
+1.761875122
+3.616263621
+0.8732769493
+0.385457993
+1.392877347
+0.6764509474
+1.303562523
+0.002942000491
+-1.533409709
+-2.008645424
+-1.996383456
+-2.746085102
+-2.135484022
+3.522532255
+1.508191327
+-1.250054781
+-0.780785388
+0.2251150618
+-1.311090059
+0.1350337143
+1.555208276
+-0.0714854671
+0.6720314853
+1.772983079
+-0.544263512
+0.5695811983
+-0.6187551858
+-0.05705773967
+-0.6494605302
+-1.057739707
+0.347423706
+1.133090632
+0.292608892
+0.9974539166
+-1.47586356
+-2.407470384
+0.8340870059
+1.375762782
+0.0997145332
+2.696071561
+1.815397596
+5.361141682
+-0.401617028
+-1.997697592
+-1.480273581
+-1.130995613
+0.9520627669
+-4.316137128
+2.637102036
+-0.4785931823
+-0.4935871156
+-2.158686332
+-0.2284511029
+0.02647953534
+-0.2438898552
+0.6781185119
+-1.179264084
+-1.791631521
+1.096656261
+0.1973349076
+0.3943621104
+2.118054509
+-2.045128783
+-1.710480915
+2.514439302
+-2.965766715
+-2.618824293
+1.635723662
+0.476400384
+0.2104642741
+-0.1833188162
+0.06253509406
+-0.1842242294
+2.710885405
+-0.7962962575
+-0.3227470726
+3.58889761
+0.05501940406
+4.464032779
+-0.209959402
+2.734829965
+-3.310688077
+0.3072889216
+-3.168947126
+1.688908613
+-2.425735632
+0.5675391088
+-0.5643917534
+-2.31640637
+-3.238719966
+-1.022080927
+3.481258892
+-0.5869701098
+1.834443084
+-0.1140857353
+1.753453547
+-3.653822757
+-0.8063766137
+1.898811048
+-0.3265098977
+-0.1729105654
+-0.8609238238
+2.298758767
+0.5950287079
+0.08804455235
+1.286109091
+1.176449858
+0.4251740929
+3.094062994
+-0.1205750673
+0.5561620959
+-1.285905107
+0.300230454
+3.175523047
+-1.286515204
+-2.267185651
+1.993519286
+-0.2975323045
+0.1920084099
+-0.09022660739
+0.1582434479
+1.701061367
+-1.678248381
+-2.023548168
+0.1699362741
+-3.212879379
+-2.746107072
+3.733366297
+1.51493666
+-0.02011294374
+2.476013872
+-2.08119846
+-0.6312062468
+1.246907219
+1.781343363
+1.025833694
+-5.082477615
+-1.936164235
+0.9541361847
+-0.7119029861
+5.080463242
+1.853116602
+1.116163761
+-2.233899107
+-0.07059347921
+0.4824079284
+2.25556726
+1.762262194
+2.065978389
+-1.847824032
+2.824303397
+-2.760861505
+-1.071829123
+0.8615422699
+-0.2997831835
+-2.012073716
+-1.643099651
+-3.096508646
+1.063949278
+2.52113769
+-0.2007870068
+-0.80069763
+-2.944645857
+1.826403849
+4.422608666
+-3.594911609
+-2.126865876
+-1.359186085
+-1.128635819
+0.4546919003
+3.228499095
+2.017194574
+1.055194766
+-1.447857408
+-2.239256467
+-1.593550613
+3.096133603
+-0.1234866029
+-0.8936725073
+-0.3675114605
+1.649236439
+-2.625699349
+2.829748272
+0.3129525139
+-0.4326879566
+0.8856922275
+0.4367941463
+-0.6883929129
+-0.5054213441
+-1.737725094
+1.312781502
+-1.063987619
+-1.912516845
+0.3317270453
+2.658282565
+-0.09668924756
+-1.216202514
+0.8077920417
+3.873424925
+-2.903811059
+0.7644055756
+0.4101732505
+2.323067607
+1.981818347
+-0.3734182236
+-3.369034511
+1.613127536
+-1.67038538
+-1.893480822
+2.296701161
+-1.821700755
+2.80568948
+0.6716894428
+0.6382368002
+0.614529561
+-3.276847251
+-3.552777233
+0.4311061076
+1.136014718
+0.1652220643
+-1.643069034
+0.03784420776
+-0.1640683063
+-1.914316197
+2.027944308
+-3.460552123
+1.177484814
+0.7686468104
+2.01942371
+-2.010623745
+0.2028142933
+4.342329899
+1.324148578
+0.2011624175
+1.078322548
+0.1723536848
+4.381796026
+1.967272392
+-0.1712299085
+0.5046628628
+-0.7815959922
+2.419700253
+-2.812209543
+-3.20947706
+2.917429499
+4.306239585
+0.9366098154
+0.2254758825
+1.314535381
+-1.294107053
+0.3424870903
+0.07781741171
+1.253128501
+-3.115997056
+-1.01406954
+1.689991206
+-1.351187655
+-1.986722751
+4.0841443
+0.07623600036
+-1.15783628
+-3.384740875
+1.458692693
+1.398272307
+-0.5975192011
+-2.204460382
+-0.04909884728
+-1.671712135
+-1.884187178
+-0.2064255029
+-2.102780797
+0.4932979105
+1.215985019
+-1.679264894
+-2.736490191
+3.122559198
+-1.880540472
+-1.31988541
+0.4260343349
+1.198738745
+-0.5126337874
+0.9215886554
+-0.8019723158
+-1.94234133
+2.852633722
+4.976883229
+3.391939066
+0.2836132783
+3.666870724
+0.7114070314
+-0.9545725408
+0.9327591488
+-0.1887850128
+-1.966236367
+-1.796643943
+1.604103477
+-3.693063963
+1.208273481
+-3.259167205
+-4.24235289
+-3.677693208
+3.933527944
+-0.3924679299
+0.1731663603
+2.838510092
+1.868359497
+-2.783010539
+1.738012686
+0.3683625294
+-0.6833561952
+0.04858182828
+2.559624041
+-1.771932964
+0.8017713582
+-0.01931447307
+-3.594329231
+-1.604506343
+0.3864271065
+2.594684178
+2.002662035
+1.194425009
+-1.630551322
+3.602427982
+0.4304809353
+-2.012731043
+-0.3658099617
+1.792496851
+0.01523499664
+1.773729373
+2.207387915
+0.8010613692
+-1.715405246
+0.2709093264
+0.09033171188
+3.718692668
+-3.252643876
+-0.2696449022
+-1.168187094
+0.6702112404
+-4.875128718
+2.229849119
+0.02749697467
+-3.689402327
+-0.7222262695
+1.217924683
+-3.182895751
+0.006444432886
+-2.114947296
+-1.111970064
+0.05347676535
+0.3669005072
+-0.9414849964
+0.5455927791
+1.635955215
+-0.5578285502
+2.863135515
+2.924428342
+-0.8574041312
+-1.275681113
+-3.32834597
+-0.2531386633
+-0.7268755602
+1.55810244
+-3.019323212
+-0.5547827835
+1.937488786
+-1.460714191
+-1.524723073
+-2.89388067
+5.241147692
+-1.494946356
+-2.600693664
+-1.607700808
+-1.548590161
+-0.5387795569
+1.650744464
+-0.596646338
+-1.84564663
+-2.902676996
+0.04371471644
+0.08507814806
+3.061864702
+0.1848954709
+-0.1980166226
+-2.101307673
+-0.6119051502
+-0.8769489161
+-0.740328329
+-1.918510785
+1.076659207
+-0.284890835
+-0.40070696
+-3.428092232
+0.987288175
+0.974030652
+-1.678258806
+1.980242768
+-2.72951646
+-0.04373981758
+-0.5424146798
+-2.634349578
+0.3794052242
+3.405140304
+0.1352684601
+-0.9260435082
+0.8940483138
+0.2114399909
+0.05552426325
+-0.8510844255
+2.843951119
+0.912726727
+-1.057341318
+-0.2160076736
+-1.481733408
+-1.2165823
+-1.281451448
+-2.268623187
+1.554553928
+-0.5820829265
+1.108255157
+-1.340251795
+-0.1207249888
+-1.422081194
+1.439336341
+-0.4968386134
+-1.461747172
+-3.283406458
+0.5513330987
+-1.416770105
+-0.03155843424
+-0.983460216
+1.908379162
+1.088289505
+0.8944241749
+-1.232242247
+0.9325800871
+3.429663217
+-1.664372068
+0.3446782785
+-3.298433949
+2.797124184
+-0.7958241972
+1.565157762
+-3.446456501
+3.595078774
+-0.7137430561
+1.091314647
+0.3016364127
+-0.5109415724
+3.371584605
+-3.296092413
+0.59742732
+1.821291344
+-0.05971224327
+-0.2363415687
+-0.2853754241
+-2.455272841
+0.07625476819
+1.025435047
+0.137198455
+-0.5445522023
+-0.9794500447
+-0.5585933386
+2.515488435
+-4.173269959
+0.0801429131
+-0.6555098346
+2.911615904
+0.1109844509
+2.969851197
+-4.247780036
+0.9191698097
+0.5601157201
+2.781067934
+-3.282697218
+-0.3100716162
+0.1321205236
+-0.9915909891
+2.433155427
+-0.6773643709
+4.069525088
+2.108355818
+1.901667394
+1.118597963
+-2.127391182
+-0.862192675
+1.145502734
+1.355114067
+2.61436769
+-0.9348820193
+-1.72030677
+1.718208386
+-1.619253152
+1.746623672
+2.399472353
+0.9123060717
+-0.7151580639
+0.08216445229
+1.186931839
+0.02037103742
+4.396592677
+-1.981341861
+-2.005337175
+-1.953790773
+-1.179159845
+-4.35786304
+-1.259300854
+-1.306569404
+0.1570280503
+0.8356011664
+-2.480432673
+1.800108486
+3.60448446
+-0.4165702062
+3.148742475
+0.3979789888
+3.977463837
+2.234566931
+-3.12780927
+0.03725474132
+2.10864995
+0.06109316208
+-0.07376706169
+2.539529501
+-1.419708364
+0.03503122656
+0.6472515292
+-0.6675819207
+-0.04025820776
+1.550046526
+0.865675243
+-1.617435064
+-2.208247972
+-1.578204361
+0.002496911577
+-0.3198795755
+-1.663914986
+-1.196300905
+-3.04007857
+0.8357074064
+-0.0800374507
+-2.519574687
+0.05724100838
+2.685244021
+-1.479871706
+2.630275331
+-0.646914945
+0.3956563357
+0.1955016048
+2.803046832
+0.3168676936
+-2.283802838
+-2.621940741
+-3.065842107
+-3.423940328
+0.09227011791
+-1.91674896
+-0.1616232259
+-1.407718072
+-1.541568601
+-0.9616906817
+1.407171109
+1.858290296
+0.7423451053
+-1.979645099
+1.287262551
+1.377793333
+0.5492944072
+-1.207240872
+1.417719151
+0.8456371494
+-6.233713183
+1.288904067
+-3.827485342
+1.327123153
+-0.3081447968
+2.387223361
+-0.1963224224
+-1.77322852
+-0.2947073292
+2.11961259
+0.05249323572
+-0.2286703197
+1.487107031
+0.4207187333
+-0.01185481167
+2.732120137
+3.110228064
+1.226652453
+-0.571918303
+2.993821987
+2.366239115
+1.437794331
+-2.432153161
+0.2813438066
+-1.487344349
+-0.3180245031
+0.4801138586
+0.2003188162
+-0.9503502117
+2.545907498
+-3.392262534
+1.460367062
+-3.714966543
+0.7651962734
+-1.773808653
+1.756607515
+0.172905048
+0.4954127569
+-2.036558651
+-1.30914027
+0.4144347868
+1.167139854
+5.858192484
+0.4457166462
+1.952075051
+-3.113867865
+-2.659783723
+-0.7109895492
+-2.394855391
+2.972798507
+-0.8204373856
+2.764363777
+2.973564948
+0.08555943977
+1.003599508
+-0.1121989467
+1.076874001
+0.9666837036
+-0.2472992518
+1.009939963
+3.447392551
+1.426032459
+0.6515992273
+0.2495390421
+-2.025346248
+-2.054593754
+0.646713063
+-2.738782248
+-1.532655198
+2.563022681
+3.828459394
+-3.331912154
+3.253299125
+-0.4228765817
+-0.03001017406
+-0.2268232613
+2.161088254
+-3.215353158
+0.9123272227
+-1.889740395
+1.141577059
+3.085592677
+-0.0008346528252
+0.7483101719
+0.8191035565
+-1.599186999
+3.0232787
+3.412936495
+1.403566744
+0.146570864
+-0.9237876307
+-1.252980446
+3.421673165
+2.828830085
+-0.1273229776
+-3.159861059
+-5.66402374
+-2.166853321
+-0.261240792
+2.801378069
+-1.303312418
+1.009630913
+2.606361923
+0.2570726337
+-0.2848957376
+-2.617527028
+-2.404950616
+0.8321992688
+-0.4018150664
+0.2450626353
+-0.09455543139
+1.328288099
+-1.569374823
+-0.6711612872
+3.792364457
+-1.599572277
+-0.5631508616
+-1.178773404
+0.8895627248
+2.044784645
+-0.9964232372
+-0.8628286822
+-0.5579632106
+1.059667567
+-1.478790605
+-0.7519199319
+-4.744387743
+-2.763490019
+-0.224887512
+1.795728346
+0.5901515666
+-2.197536913
+-2.800512416
+0.3493601858
+-3.305607285
+2.131853637
+0.1277923833
+-3.214640318
+-1.931907718
+-1.448622638
+-1.54638502
+-2.979866016
+-1.749325044
+-1.368803112
+-1.422571511
+2.25591325
+0.2096556057
+-1.986514435
+-0.6692432119
+-1.759114195
+-0.600013318
+1.751018306
+0.5045415612
+4.571202363
+0.7518548515
+-1.82718902
+1.619481462
+2.159862434
+2.188333983
+-2.188481906
+-0.295274829
+2.263623914
+-3.369457918
+-0.998833522
+-2.853875371
+-1.86514046
+-2.024914305
+2.501139665
+-0.4690760698
+-1.726711163
+-2.071211463
+0.2833343297
+-0.02227125468
+2.688148749
+1.000033392
+-2.863595556
+-1.257961415
+2.140145024
+-1.242165395
+3.46914435
+-2.196578863
+1.145226706
+-1.722431107
+-1.019190266
+2.197163296
+-0.2541343257
+1.62690449
+0.9465811898
+1.507731367
+-1.776376422
+-0.4431487964
+0.8485052362
+-1.698145745
+3.259000086
+-1.554456084
+-0.6000071539
+-2.01311813
+-4.28661613
+3.593837045
+-0.4086778738
+-0.8958296768
+-0.3974301233
+2.839727944
+-1.930213216
+1.359135732
+-0.8475764971
+-1.193341711
+1.134116425
+1.976481147
+-1.027805901
+-1.537698319
+-2.338191495
+2.207007533
+-1.15051199
+-3.698261455
+2.819904277
+-2.739719004
+1.558921063
+0.3668572933
+0.5758308644
+-1.168750551
+0.7311829204
+-3.335559786
+1.176075497
+3.114020083
+1.768054395
+-4.039080171
+-1.968418005
+-0.3755898439
+0.9738746099
+-0.2133053473
+-0.9864287742
+1.190600615
+2.328303532
+-0.4645880144
+1.457859735
+-5.15810149
+-1.875018772
+-0.6425178741
+-0.9771324415
+0.6655964348
+2.027501095
+1.013338052
+-1.244450944
+-3.045536181
+1.113928241
+-3.676353479
+1.306074567
+-0.3768981643
+-2.351669976
+0.5745146249
+-0.005752205318
+-0.07319458583
+-0.1684465931
+0.8390482169
+1.848868044
+0.993230397
+2.02426638
+-0.0882794377
+3.236918648
+1.142219644
+-1.087388059
+-2.187790113
+0.4115936075
+-2.613043046
+-1.946751935
+0.4781741607
+-1.215774893
+-1.86663248
+-0.06895009218
+0.1453557982
+-0.4116680504
+-0.7550938381
+1.709285457
+0.6848547026
+-0.4468522244
+4.928643867
+0.3876634739
+2.264010267
+-1.121962006
+-2.725881894
+-1.583513031
+-0.5360195668
+-0.9932164195
+2.672772365
+-0.2400822442
+0.9229377549
+-0.09296231207
+-0.8671086655
+0.07599202691
+3.42810294
+-1.535897183
+1.533980901
+-2.052014503
+-0.9192528845
+0.007166411909
+0.6527501795
+2.966257256
+-0.1001652829
+-1.687231213
+1.300083946
+-0.7283396178
+0.4773631419
+-0.2324448791
+-3.886913703
+1.016598371
+1.166736014
+1.853209537
+3.600925525
+-2.390207547
+1.033014889
+0.8185899933
+-0.8381639856
+0.7942124729
+0.9992939102
+-2.43736766
+0.4924455226
+-1.835968612
+-1.303713
+-3.54948963
+-0.946721851
+-0.4071413429
+1.099713735
+0.001799853342
+-3.084576302
+1.724296114
+-0.2371732471
+0.9767411809
+1.931872237
+2.845209498
+3.922453979
+-0.1444775173
+0.6222488922
+-2.156722182
+2.12320034
+-2.369774889
+-3.610503377
+1.660772011
+-1.04339305
+1.555214563
+0.8161492987
+-3.260005302
+-5.439358729
+-2.193203494
+0.03298297396
+-2.443552669
+-1.305522899
+-2.917881461
+0.3397559196
+0.1816518541
+-0.9627852481
+2.794130603
+2.995430055
+1.130534405
+-3.599542363
+-2.209380294
+0.8142606622
+-1.25711516
+-0.9741828634
+1.797934789
+1.021749644
+2.628308868
+-0.8584185933
+2.750450841
+-1.108262494
+2.99898298
+0.2116692872
+-1.721019494
+-3.262439015
+-0.6029446297
+-0.512465396
+1.71532382
+-0.2211810056
+-0.8648639572
+2.154074946
+-0.4496531225
+-1.152483632
+1.149217835
+-0.9796564377
+1.317604283
+-1.193834224
+-0.4459183659
+0.3043539512
+-0.7482526405
+-0.02690293871
+1.630943938
+0.8212035826
+0.9619397001
+-1.270860877
+1.705659537
+1.339124681
+2.008838385
+-1.452731664
+-0.3449171934
+1.267067805
+-1.217630235
+-0.4522449395
+3.851611475
+3.903522025
+2.4798811
+1.877170272
+-2.038502299
+1.025124463
+-0.7182331901
+-2.117143795
+-1.018011677
+0.2313301481
+-1.094711149
+-1.101598851
+1.584082997
+0.2882129702
+0.4669161593
+0.2237447938
+-1.351406287
+-2.741143836
+0.6211294208
+-1.014073264
+-4.021564537
+-0.7851345159
+-2.184435883
+1.397300469
+1.043250454
+0.9937862897
+-1.330083236
+1.463103164
+0.6392995663
+-0.8197090769
+-0.9066748643
+1.785416306
+-0.9472081139
+0.6073129471
+2.067913974
+3.818685251
+3.327746249
+1.801645528
+-3.011822703
+-1.378096859
+-1.096174375
+3.306299665
+-1.398635882
+0.7723327542
+0.2017341265
+-1.870254419
+0.7636480192
+0.7965921724
+-2.511549763
+2.445754894
+-4.173020058
+-1.181514306
+1.943940588
+-2.386515667
+0.7005318391
+-2.592720777
+-0.1860482889
+-4.627546226
+-1.685143403
+-3.085842894
+-0.8035274843
+-0.8304627916
+-1.347328343
+1.595826393
+-1.773759208
+1.268773346
+3.25855154
+0.2781283006
+-1.715340409
+-2.49867703
+-1.4195702
+1.409285441
+0.3111814699
+1.873590433
+1.540661759
+0.2816213038
+0.9469765233
+3.710492419
+2.831312452
+-0.6054920338
+1.979358884
+1.171701612
+2.272776155
+1.343233144
+-1.94833487
+-3.239369131
+1.145254034
+3.805236397
+-1.551328216
+-0.3761794761
+-2.071495452
+2.355659009
+-4.61033371
+-4.527320602
+0.7500398396
+-0.1646872936
+-0.9592460301
+-0.602189573
+1.073975829
+-0.8276079781
+-2.193849943
+-1.854725856
+1.776677724
+-1.04948391
+-2.770555168
+0.2043566539
+1.009989444
+2.657921495
+0.4358067742
+-1.319422494
+0.9480157346
+1.45434974
+-0.07781061333
+-0.08919878545
+0.5202658099
+-0.1397129965
+0.5002278138
+-2.043826649
+-2.30087554
+-1.672222759
+1.284421887
+0.5175951347
+2.080477928
+-0.3733818442
+-2.287282792
+2.289107071
+-0.03753411108
+2.566910073
+1.195892983
+4.377237358
+-0.4395459714
+1.80144781
+1.782728213
+-1.110252691
+-0.3449646342
+-2.923476684
+-3.097592274
+0.2531376031
+1.586014141
+1.276048067
+0.6800491965
+1.726034306
+-1.179395591
+-0.545065497
+1.475043027
+0.8662374589
+-0.4203776276
+2.641588772
+-2.584002502
+-1.037357375
+-0.5667955489
+1.63306976
+0.00477039583
+-2.522983494
+1.02800836
+2.175092631
+1.478609066
+1.238309843
+-3.748626993
+-1.799772953
+0.9641612173
+-0.1097763695
+1.045115204
+-2.532685354
+-0.1229895286
+-2.779562038
+-3.907357125
+0.591558177
+1.685177593
+0.4912328558
+-0.06599296053
+-3.124028684
+2.012214134
+-0.08808979475
+3.91912401
+1.884628617
+-4.010250853
+1.510099361
+-2.793070475
+-1.518990981
+-0.5015133535
+-0.1881249007
+0.7951304312
+-2.045710082
+-2.301384009
+1.201210403
+-0.02650053587
+0.3487460974
+-4.387366703
+-0.3542747666
+-1.781458366
+-1.841252746
+1.843869608
+-2.191342458
+-2.185793213
+-0.6620212068
+0.9005776613
+-1.768029459
+2.468288072
+2.899695051
+-1.762894133
+-0.4901635112
+-1.557350945
+-3.37076421
+0.6060221009
+1.467189736
+4.023728526
+-1.794819007
+2.672470182
+2.684707383
+0.3957066191
+1.204326979
+1.746546097
+3.948199896
+0.9556171252
+-0.120275771
+-1.732337598
+0.61064151
+2.048329866
+0.4892207227
+-1.559846498
+0.178152405
+-0.2583069649
+0.5294775155
+-3.323696734
+1.101577228
+1.190846314
+0.8897068764
+-0.00752563429
+-3.611872525
+-0.03864558394
+2.121429999
+-1.720257753
+-3.978538932
+-3.081115944
+0.6280513836
+0.7457520177
+1.772586389
+-0.1105179915
+-3.000656752
+-1.637008281
+1.637678745
+0.2809918149
+1.299659269
+0.8695776109
+-0.4099211035
+-0.348013675
+3.71420454
+0.8293485332
+-0.2571751006
+0.9108399819
+0.4458116392
+-4.314712747
+1.300169029
+3.641878548
+-1.560559737
+2.908071498
+-0.5137393947
+0.5869427953
+2.140720034
+-1.440002863
+2.484987826
+-2.428434563
+-1.750309498
+-1.187040635
+1.324010733
+-0.6817488211
+-3.039948919
+-0.4330657437
+-1.568442765
+1.462587242
+-0.6864701089
+0.1415481518
+-0.8109449143
+0.8678779365
+-0.3671815269
+0.6503974294
+-5.186777129
+0.194501754
+0.8278273402
+-0.3985601098
+1.338784943
+1.477214058
+2.608427784
+0.2096232161
+-3.827601409
+-4.570998898
+-3.203681904
+-0.07581412237
+-0.3146105766
+0.552479704
+-1.250491845
+-1.472982343
+1.110095885
+1.311848823
+-0.513300271
+-0.07695331648
+0.8086286867
+1.00868715
+-2.287961399
+-1.439147712
+-2.461092091
+-1.01381323
+1.624667179
+1.092543734
+-2.196195921
+1.024533454
+0.1716862107
+-0.9878534142
+-2.81291931
+-0.3496467432
+1.359888012
+-4.326195297
+-0.7922463955
+4.508567398
+1.345273437
+0.51966499
+-1.474370339
+-1.356659676
+-0.1665767914
+3.205727259
+0.9311783818
+-1.744316796
+2.353573925
+-0.5851884143
+3.394692962
+-1.133206049
+-2.006531514
+0.3492591556
+1.964653968
+2.074889593
+0.3183835333
+-1.976193376
+-1.010681444
+-4.036563737
+-1.826243075
+-0.3569136298
+0.7780042813
+-0.6789086429
+-0.11395811
+-0.7923708895
+1.502050608
+-1.798225877
+1.675095828
+3.921761625
+0.945579312
+-1.05418322
+-1.072540288
+2.419674444
+-2.253178852
+-1.907608841
+-2.328896908
+-2.557027681
+-2.089632639
+1.579809884
+2.204565129
+-1.394146145
+0.4146680921
+1.51831335
+0.2011284062
+-1.909885515
+-2.94080347
+2.020855106
+0.9923588246
+1.153911787
+-2.215293802
+0.4699543858
+1.257999175
+0.6280676873
+-1.490046434
+2.02452102
+-3.055263896
+1.85748385
+2.162111888
+3.144660635
+-0.6849843805
+-1.998860033
+1.587760725
+-1.398430558
+0.08799102289
+-0.6349244343
+-1.804143943
+0.6419989324
+-2.784031833
+1.184411363
+-1.933862177
+-3.463462693
+-0.1002149176
+0.8632677056
+1.153869194
+1.636707462
+-4.707280799
+-2.010288862
+0.213304589
+3.03800656
+1.567488987
+3.802680104
+-1.049878846
+0.5488339906
+-2.199941615
+-0.8087044392
+-1.470591437
+-1.267977319
+-0.7868982424
+0.005435079781
+0.04442532903
+1.086906879
+0.2799769348
+-0.6880912577
+-1.045157083
+-0.6142634403
+-0.8980742829
+0.9819421104
+1.731050381
+2.548089076
+-1.59540552
+0.9387444507
+-2.789359283
+0.7463494365
+2.165344564
+-0.2991790033
+2.145272095
+-2.277135741
+-1.777290566
+-0.2716196853
+2.044420709
+-0.8348589127
+-0.9071062018
+-1.983256717
+0.4057620889
+2.493390282
+1.401360218
+1.393301309
+-0.4139489498
+-1.126618719
+1.354491833
+-0.06382215127
+-0.3472164714
+1.796481245
+-0.3955749033
+-1.675552519
+1.818376991
+0.1614397809
+-2.074058688
+-2.22581179
+0.1908237517
+4.674819323
+-0.7856412071
+-0.6725477182
+3.047542395
+-0.1145623996
+-2.896933726
+-3.145592905
+2.453327948
+1.332709085
+1.652251417
+-0.1155131168
+-1.453424052
+-0.4343262314
+0.2720624347
+-1.676622311
+1.122899819
+-2.519192338
+-0.6655175292
+-0.408015745
+-1.382039626
+-4.41101071
+0.8957393282
+-1.511501521
+2.651415919
+-0.6839645554
+-1.082719177
+0.1830438936
+2.106879497
+-1.126815326
+2.02947539
+2.880607282
+1.980645621
+3.252862982
+2.585292042
+3.029764588
+3.208652639
+0.4161390593
+-0.8584477991
+-4.52448727
+-2.645466239
+-0.8965655983
+-0.7634701745
+-0.3055889268
+-2.00152098
+-3.191555223
+-0.2604463329
+-0.3788358576
+-1.615108083
+-1.484304323
+-1.880313184
+-0.793047478
+-1.712605654
+2.519750663
+0.4819934641
+-1.944635836
+-0.5608955629
+-2.360571213
+2.02433659
+2.768373449
+2.504003966
+-2.289385262
+-0.1825340395
+-0.803141351
+1.124026212
+-2.015819607
+-1.351783388
+-0.8264340567
+0.3065769383
+1.388257416
+-0.6574553855
+1.327930151
+1.644152714
+-0.4264304737
+-2.491316266
+-2.342380671
+1.18345395
+-0.9524488726
+-3.425258645
+1.225904736
+0.2591090411
+-2.811934162
+2.358839962
+1.673271974
+0.2774905026
+-2.548638735
+-2.804661066
+-0.6141369737
+-3.427830779
+0.8101605464
+-2.821646627
+0.3298254585
+-0.5762629055
+1.423570536
+-1.875895191
+0.547458899
+-2.789680386
+1.591099104
+-0.2299235326
+0.9917013379
+-2.641050694
+0.9981685513
+0.6124067926
+0.7273957854
+0.625267926
+-0.3869277656
+2.482598441
+-0.3117959715
+-1.478338401
+-0.1174523867
+-1.901035891
+-0.9279928467
+-0.3544932324
+-0.7591082413
+0.3987941456
+3.891522783
+1.14189968
+2.144601295
+-1.007418875
+-1.174032577
+-0.7563560938
+1.705778195
+-4.296236956
+-2.066329551
+0.2046716937
+-0.4481847341
+3.935459364
+0.8953664315
+-1.324382887
+-3.155214137
+-0.6811200699
+-2.606440165
+0.9335013008
+0.3222126445
+0.6400638642
+4.15835333
+-1.814931963
+-0.3848084156
+-2.425031489
+-0.1611970323
+3.186547232
+1.137444798
+-0.2289740912
+0.5032604976
+-2.421711276
+-0.7874674234
+0.1705051491
+0.1988439734
+-3.061232489
+0.6552463585
+0.558392985
+-0.7541024125
+0.008349998165
+-2.966983107
+-2.959591231
+0.2693745247
+-1.335446382
+-0.02311104045
+1.678981345
+-0.3478598606
+-5.62133611
+-0.301307276
+-0.962088044
+-0.4693887086
+1.799461625
+-3.157060372
+0.4879132478
+3.140607824
+-1.25188623
+0.9446557724
+1.932611558
+0.4204628782
+-1.370193961
+-1.419042021
+1.487600308
+1.184298182
+-1.57293683
+-2.352946309
+-2.561613428
+3.323303722
+-0.1358902408
+4.720457171
+1.111091206
+0.8790446457
+0.6125449766
+1.9982997
+-1.93212637
+4.320026217
+-0.2006034052
+-1.406800184
+0.6051220046
+2.184677752
+-2.015109752
+1.133738745
+-1.432888315
+-1.012547066
+-0.9789648375
+1.527082933
+-2.218145464
+0.3852322201
+-0.6868357282
+-1.694420356
+-2.427047206
+-2.405776649
+-3.267592035
+1.792334387
+-0.4833063253
+0.3173038601
+2.356378729
+-2.440234314
+-1.883091351
+0.5094310734
+-3.648159104
+-1.157417026
+-1.849786146
+0.6590448843
+-0.8516317327
+4.016298559
+1.875782744
+-1.706476969
+-0.7746268749
+-0.6951690258
+6.613148698
+-3.020399288
+0.4070794008
+-4.168864271
+-0.01387488241
+3.819781124
+-0.8169108633
+2.209108843
+-0.1322304519
+-0.8449974337
+-0.5033127179
+-1.17380529
+-1.252116544
+-2.660388825
+3.013601458
+-0.7861527916
+0.5875486215
+-1.753063703
+2.233981119
+-0.5471115558
+-0.1820653357
+-3.657953271
+0.7919524223
+3.62301141
+-1.738155172
+-0.9164583074
+-2.276647916
+0.2583243485
+0.1280483958
+1.410162203
+1.102947094
+-1.625032092
+0.4498960981
+-0.6566022134
+-2.182065955
+-0.2537117459
+7.60332043
+4.630341268
+0.2796531955
+3.477714416
+-0.09076672829
+-0.1062766789
+-3.899143575
+-1.920211132
+-1.566998528
+0.2150380633
+0.02796906972
+-1.157884703
+-1.177626399
+-0.3323062712
+-2.762823301
+-1.225277121
+-0.7625797396
+-2.497897866
+-0.6604757865
+-1.669614327
+2.470764784
+-0.4876075943
+-0.3790913365
+0.856056214
+1.113936634
+-3.472483609
+-0.7535682182
+-1.818064653
+-0.2903404884
+-1.072665042
+0.3141389257
+-1.960918491
+-1.135534483
+-1.182319338
+2.165182741
+0.7360073186
+0.7377774152
+-0.5726365616
+-0.7694357042
+1.122005777
+1.554867868
+0.03029357126
+2.283295891
+2.548310055
+-3.329396079
+0.8607577696
+-0.08520385698
+0.7765776279
+2.231953056
+-1.841076326
+-3.240548205
+2.212382946
+-1.99696929
+-1.372439028
+0.4092417868
+-1.372203642
+-3.184421257
+0.06837953483
+-1.562969318
+1.195719756
+-1.012153112
+-1.376892277
+-0.4200010782
+2.104306954
+1.815808163
+-2.186452365
+5.599415298
+-0.6515526492
+-2.304831458
+1.77646398
+-0.7233449147
+4.307439016
+1.694816711
+-0.3974396926
+3.150613755
+1.698230423
+-2.457790394
+1.776788219
+-1.032974884
+-0.1666525705
+0.2621088984
+-1.758192025
+-2.666684558
+0.7355680218
+-2.776466997
+-5.150405254
+-1.672211209
+0.662184843
+-0.5397622671
+2.534261881
+0.3675069909
+-1.532619304
+-0.879167101
+-2.873082719
+2.171594449
+-2.762200172
+-1.840815264
+-0.3205724409
+0.004706528982
+-3.005300727
+-1.81107159
+0.5300812045
+2.259446718
+0.6980071242
+-0.05161952318
+-3.124817468
+-1.234684693
+1.042988483
+2.16189334
+1.778751816
+0.2761432889
+2.409200933
+5.762921426
+-1.187723831
+-1.526231591
+3.036965852
+0.4709290508
+0.2246153769
+0.7847486553
+-1.30897301
+-2.06959057
+-1.554295019
+2.491892514
+-2.873281329
+0.9973092913
+-1.11537492
+-0.7067337774
+1.485901953
+1.687977827
+0.6859530757
+-3.746239325
+3.141929417
+2.620393034
+0.1828736664
+0.02051563392
+3.602898417
+1.894448543
+-0.05858880715
+-0.5846773517
+-0.387074222
+2.354464109
+2.079983569
+-3.226846023
+0.9292847977
+1.728242663
+-3.012926332
+-0.005929502877
+-3.554087213
+0.2589856719
+-4.166469004
+-1.363491047
+-1.222131829
+-1.41769964
+2.903056034
+1.071021139
+-0.7991377206
+-1.866155682
+-0.4775526337
+-2.058225937
+1.946160008
+3.993532003
+2.106399796
+0.6633806911
+-0.3312575666
+-0.8102125789
+3.490569145
+-1.151871215
+3.122197114
+-2.263078484
+-0.5924633088
+-3.428113185
+0.3184684025
+-2.527455244
+3.330098814
+0.8245445433
+1.074793494
+0.5653568983
+-2.185081629
+0.2482365755
+3.674161376
+0.01710985201
+-2.034032403
+-3.704685313
+-1.426653981
+-3.524457795
+1.661034738
+1.562334532
+-1.751363654
+1.227962617
+-1.152909306
+-0.09122856555
+0.7439111031
+-0.8879200181
+0.8364066973
+-3.371456101
+0.234949976
+-0.06990404478
+-4.092786272
+-3.619380385
+-3.719047211
+0.8286136678
+0.2479192537
+0.5479151543
+-2.652756985
+2.277947621
+1.96568244
+-1.53392607
+2.352120553
+-0.5018447936
+-3.552410048
+-3.265389532
+1.467446976
+-0.2080976213
+1.762449893
+-0.1767462495
+0.5353417867
+4.247052846
+2.793698175
+-0.8656545372
+0.7499374494
+0.9888908861
+1.522782335
+0.1420176104
+-0.987063701
+-0.007245634473
+-0.960574219
+3.366734562
+2.481452478
+-0.4072300378
+0.8565845214
+-0.3309185285
+2.386482272
+2.097761033
+1.137221665
+1.742528539
+1.321141616
+2.348123708
+1.062262747
+0.3038010582
+-1.154451247
+-3.143501475
+-0.05569676101
+-1.482111067
+0.1200181339
+2.280976848
+0.3456493509
+-0.8300033422
+-1.70625725
+-2.860270415
+2.665610671
+-3.553382038
+-1.869566052
+-4.626403867
+-0.6322831515
+-0.6845691195
+-0.8085888413
+-0.1262598
+-1.642530149
+-1.827311281
+3.635652827
+-0.6681258967
+1.81531725
+-1.673542085
+3.22545719
+3.028364262
+0.4620373644
+-2.199063186
+0.1740027715
+0.09460900008
+0.4792478282
+-1.956441232
+-3.046000272
+0.3247260748
+-0.02058263267
+0.004150043839
+2.053601158
+-2.950320966
+2.021387432
+-1.48645508
+-0.7904441317
+-1.651558727
+0.1792397157
+-3.81163575
+-1.136171441
+-1.031513091
+2.527860405
+0.3013962876
+1.391036623
+0.01187762877
+-2.097800743
+1.814409736
+-1.690882684
+-1.052486682
+0.3641995576
+1.891077579
+-0.4027690866
+3.021049464
+-1.14295683
+1.331178574
+0.007232601901
+3.093343676
+0.4288120265
+-3.754625636
+2.17667042
+-0.1630970267
+-1.106123822
+2.445929524
+-0.6626172721
+1.199973486
+-1.536766639
+-1.672260254
+3.621163521
+-1.574065475
+-1.169541873
+-3.416641584
+3.259964488
+0.7959966466
+0.4755592669
+1.950276821
+-2.658673139
+-1.082093564
+-0.1828754625
+-3.096942101
+2.622854253
+-0.03685810039
+-0.6465772725
+0.4724509791
+-1.505164569
+0.09022600763
+6.855077094
+1.20936406
+3.336622119
+-0.7101662449
+-1.50313798
+0.6194071787
+-2.683409887
+-4.613915531
+1.46318501
+1.28267629
+1.667702444
+0.05633974638
+3.9567454
+-0.1746563741
+-1.107929482
+-6.01299743
+-0.09433173531
+1.66375557
+0.01372239708
+2.248443469
+4.589762333
+-0.3467004168
+2.462507119
+-3.17170515
+2.062638209
+0.1269809608
+-0.4427809967
+-0.32679784
+-0.3126069367
+-0.6176058187
+0.3973459403
+-0.3485842681
+-2.311584958
+0.834107778
+-1.215735897
+2.09597323
+-0.06765393314
+0.2540479066
+-4.098463826
+-2.513360256
+1.879228787
+-1.467633452
+-1.064875318
+-0.5558799345
+2.727485186
+0.7482759956
+2.620529207
+-0.5354955951
+0.4263525275
+-2.406486911
+2.35606247
+0.2172964074
+0.08825819759
+0.6766310785
+2.893584148
+-0.428990213
+3.326077916
+-1.703045169
+0.8443692159
+4.018437122
+-0.9796294625
+0.4905117069
+1.755010126
+-0.2757993978
+-3.000706552
+-2.111918718
+1.161865178
+1.78303064
+1.569110669
+2.292864028
+0.1439703899
+0.4164663414
+-3.037737318
+0.6346579074
+1.225361571
+-1.16642259
+1.288003398
+-3.631777689
+1.502199196
+0.6005686472
+4.221217067
+2.826171074
+3.013960717
+1.634794193
+1.293231228
+-2.36326263
+-0.6701826007
+3.653456941
+-2.912328897
+-0.9005636696
+-2.838468162
+2.901903628
+-1.131562657
+3.089068732
+-0.8275249874
+-1.00826416
+2.557058378
+1.877663453
+-5.432560618
+0.9022815797
+1.200333757
+0.4196138618
+-1.315316008
+0.05681688928
+-0.7961229619
+0.4226460552
+-0.4047885257
+-1.243856316
+0.3275408926
+1.60487782
+0.5780117848
+-1.10728478
+0.6725080407
+2.139584784
+3.190808337
+2.415105168
+1.074760387
+-2.018248062
+-2.731105454
+-0.4047624274
+-2.818369563
+-1.569569458
+-0.3402446095
+-0.9684208435
+-0.6558361126
+-2.656009255
+0.4629335196
+1.993016102
+-1.096274936
+1.451510688
+5.325453427
+-0.1836220603
+1.302420016
+0.3935401802
+1.939247458
+-3.437299753
+-2.113913536
+0.2869278561
+1.773925132
+0.2610480517
+-3.329146502
+-1.647226553
+-1.589412235
+0.77798389
+-1.52407792
+-1.36161421
+2.169495153
+2.670632554
+-0.8265496107
+0.8498053447
+-3.762967597
+0.3966541187
+2.3799561
+1.053563411
+0.2021216887
+-0.7772859469
+-1.293584031
+-0.3581648104
+-3.102882276
+3.220917957
+1.128421281
+-0.2048740684
+-1.23960955
+-0.1406792403
+1.595589885
+2.022895782
+-1.80738186
+-1.94705752
+4.156459926
+2.273185715
+1.417039882
+-0.2772924874
+1.848040677
+-2.546466352
+3.063536843
+-0.07154444947
+1.581723004
+1.29243555
+-0.2631418225
+-0.3507327102
+2.443166283
+2.052994809
+-3.54446224
+-3.384811474
+-1.892441241
+-1.787090797
+-2.237051745
+0.5442212865
+-0.9274088943
+2.412249244
+2.905755531
+-0.057366475
+3.366915897
+0.04842862028
+-0.8695812935
+0.1295714786
+1.889720004
+-3.228921945
+-0.4171986444
+0.5948113206
+0.7261693305
+-0.7368726866
+0.9775714853
+0.5842432359
+-1.183816227
+4.363197258
+0.8791004121
+-0.6623667003
+-1.143438067
+2.058817836
+0.2041195821
+5.096225396
+-0.8718482459
+-2.485213877
+-0.05539691767
+0.3501349177
+-4.236901269
+-0.6183370288
+-0.7368308828
+-0.7375270724
+-1.260451495
+-2.686385086
+1.516076103
+-1.167681688
+-2.047402905
+-1.519868536
+-0.9446464795
+0.2172942494
+1.336677973
+-1.906358996
+-0.9585947951
+-2.691015456
+-6.784599987
+0.3115878615
+3.040007035
+1.044166507
+-1.014119912
+0.1929582852
+-2.349640202
+-0.2445847161
+-0.8554185061
+-1.705428464
+0.8113044596
+5.199734329
+3.330899013
+-0.1441460426
+1.768229309
+1.725414868
+-1.295076051
+1.287808147
+-2.881984197
+-1.610596784
+0.4775057408
+-0.8295753247
+3.512957286
+1.296080869
+-0.7640762423
+-0.9411594262
+0.3739412164
+-2.111062577
+1.191223907
+-2.7506039
+1.246020392
+-0.329189464
+0.8292270362
+-2.025171851
+0.4899704142
+4.824695483
+-0.9144335049
+0.6347997207
+3.0111339
+1.52340829
+0.8637709683
+-2.027378545
+-2.555176745
+0.1068648814
+-0.9264717106
+-0.03811642755
+0.411313348
+-1.352855678
+0.988206052
+3.717112377
+-2.018681975
+-0.939092717
+-0.09922131736
+2.280919348
+-2.372764001
+-2.130296209
+-4.327322026
+-0.8807244264
+1.360291532
+2.130449418
+0.7143073226
+-1.201913959
+1.412943227
+0.4086371812
+-3.841411198
+-2.456189665
+3.02373061
+0.644410166
+-2.749588777
+1.639906216
+2.12286992
+-0.8700680589
+1.315364193
+-7.480201276
+1.94715359
+2.350310784
+-2.24940543
+0.564170799
+-0.6762410861
+-0.2050589615
+-0.8497608891
+-2.664590934
+3.780807406
+-0.6206216992
+0.2095100885
+-2.018801161
+-2.073734322
+0.8251968302
+1.05278416
+1.755848339
+2.207548005
+-0.420415081
+-0.888406128
+1.493627666
+-1.274878407
+1.743516992
+0.7490005745
+2.310052869
+1.340783378
+-2.108891648
+-1.731267283
+1.464970594
+3.814111685
+-2.645623402
+0.04642320865
+0.563349115
+-3.051555024
+0.9562499927
+-0.1862455841
+-4.193114962
+3.243455956
+-1.726416438
+-2.565006829
+0.8402832444
+1.114973592
+1.472822807
+-0.7720067244
+-0.02182867578
+-1.461613526
+-2.620394611
+2.158261298
+-0.20552537
+-0.3646285108
+-3.998535184
+-0.3567422086
+-1.684988994
+-0.3492273063
+-0.4384883037
+-0.8929295827
+1.877677286
+0.8941083046
+2.254309029
+-2.64965474
+-1.297911855
+-0.08056163664
+-0.8132779398
+-0.158515451
+-2.364206799
+-1.432356115
+-3.28310791
+-1.780051104
+1.388353441
+-0.4284137695
+3.011506478
+-1.191067749
+0.2381421617
+-2.42650466
+5.201343741
+-0.3572411974
+1.659259681
+0.8267700417
+-1.16775763
+-2.661802563
+0.3122862491
+-1.113579489
+-0.311008603
+1.302604118
+0.1564823117
+0.7542325947
+0.3000931521
+-2.934498665
+2.792124391
+2.351704593
+-2.272329709
+1.010601223
+-1.32404854
+-1.493832674
+-0.00968332267
+3.495336461
+2.115915123
+1.210442717
+-2.301211272
+5.108898838
+1.747462091
+-4.69767484
+0.7989486704
+-0.9773894318
+0.8199647119
+0.8012807336
+-1.837038153
+3.651771505
+0.3995692428
+1.882695813
+2.702847129
+-1.476315196
+-1.82353697
+2.243814698
+2.785674866
+-2.754037142
+4.022486372
+-0.4710066287
+1.383569057
+1.128776418
+-1.94268464
+-1.728096278
+-4.167184679
+-2.302300271
+-2.964951921
+0.08038103154
+2.738804305
+-0.05428986133
+0.6777083244
+1.556007087
+1.359418882
+-0.7716630002
+-2.926690122
+-0.8596110201
+0.1259187105
+-1.743290426
+0.7239214214
+-0.5854241919
+1.243643055
+-1.606478952
+-1.843935319
+3.548112675
+0.05751247543
+1.105927699
+-2.196844506
+-0.754528911
+1.364338966
+3.131231719
+-1.44897015
+-1.605834823
+-0.04533788069
+-3.048790299
+-0.06026661296
+-0.1294567692
+1.449498301
+2.829219485
+1.139688636
+1.483102102
+0.1045579023
+-0.719489153
+-3.991953738
+-1.772441638
+0.4345333694
+-3.291187448
+0.4857796456
+-0.8016694205
+-2.043119705
+-0.9400486333
+1.457563043
+1.771002219
+-3.874042815
+-0.2989680243
+1.827769317
+-0.5157897192
+0.2176305418
+-2.990821751
+-0.9600673136
+3.657550859
+-1.576136069
+-2.881264686
+0.2989435171
+1.577258666
+2.387620981
+-1.035445284
+0.4449511533
+1.088709757
+1.298421056
+-1.094405488
+3.425449862
+-1.374594045
+1.415744317
+-0.04382247229
+-1.174437128
+-1.285702598
+-1.172693822
+-0.8937421301
+-2.037771199
+1.394819406
+-1.407030631
+-1.230041697
+0.9773811824
+-0.2159238863
+-2.843807271
+-1.872018997
+-0.3931144888
+-1.149975675
+1.500965075
+-1.528804058
+-1.934254142
+-2.021092418
+0.8133144939
+0.9669434522
+-3.344889175
+1.244150393
+1.721946541
+-3.381995524
+-1.380862859
+2.857784849
+2.012203412
+0.0495853185
+1.002498793
+4.224039247
+1.005593947
+-2.441617723
+2.729877999
+-1.741877781
+1.987804472
+1.312541322
+1.779027106
+3.081865951
+-2.931828657
+-0.1391771099
+3.892099005
+1.952763489
+0.3543166747
+-2.04634626
+0.2134409859
+-1.823762597
+-2.936733913
+1.152957406
+0.1306112107
+-1.547025606
+0.7898963779
+-1.007779776
+3.559118168
+-0.06114488874
+3.154176425
+-1.625604202
+1.226698331
+3.687399953
+0.5421819644
+2.272895254
+-3.476663736
+1.414269489
+0.06077226293
+1.530003955
+1.735330436
+-4.512500236
+-0.8872054792
+-1.340046561
+0.30432838
+-3.881066794
+-2.181017335
+2.003841407
+0.3537848921
+-2.176029083
+-0.5064347341
+2.196546115
+-3.679133572
+-0.4228572271
+-0.4593264866
+0.3739588289
+1.007558932
+3.820685003
+1.107562389
+-1.174962935
+2.515899886
+-1.717336796
+0.8723741907
+3.142926103
+2.154629763
+1.622179353
+-4.463075277
+-0.2020050346
+-1.174750133
+2.649736543
+1.681296956
+0.5222123631
+1.588883297
+-1.299232973
+1.268569021
+0.1900053249
+-3.366413614
+0.688092276
+1.414316061
+2.38682917
+1.054777055
+2.013407848
+-3.464654664
+-0.7468243257
+-0.2850207942
+-0.6594847295
+-0.178084239
+-1.154792497
+1.472330958
+-1.982411097
+0.2503492234
+0.1463054263
+0.2878744688
+-1.895448635
+2.798459849
+-0.4522474527
+-2.87770833
+1.602602037
+-0.006662891867
+-0.1938831153
+-0.1917429001
+0.7908739279
+-0.1064860843
+-1.546999165
+-2.838371016
+0.6069038652
+-3.03641341
+2.23941545
+-1.907721924
+-1.699228044
+-1.963799386
+-2.726155336
+-1.545197119
+-0.5672509045
+-4.655208085
+-4.890454982
+-1.431729855
+1.766793685
+-2.600879713
+-0.1526781682
+2.861113631
+-2.646817166
+-0.8767123323
+-1.486304962
+1.783935164
+0.9277455305
+1.235321693
+4.992834126
+3.258950446
+-0.1980894034
+-0.4039839105
+-2.897651777
+-3.428329375
+-0.09928314156
+-2.598790927
+1.250710859
+-1.583438575
+-1.165886789
+-3.105361082
+4.220307048
+1.517659098
+-1.419860482
+0.3022940643
+2.646182616
+-1.855650148
+3.813197365
+-2.064349789
+-0.3547229665
+-3.300756791
+-5.077022252
+2.020181561
+0.171404184
+-3.467721961
+-3.28120241
+2.290722799
+-0.301190217
+2.862886494
+1.273173536
+-0.1331256951
+0.06465996154
+-1.110147294
+0.1955722185
+-0.121969964
+1.675033345
+-0.3268368822
+1.647110984
+1.841264582
+0.361525214
+-2.625936668
+-0.3209534121
+-3.812149292
+-2.413243243
+1.460836666
+0.9897855789
+-0.00641775687
+-0.604866314
+-1.478801892
+-1.025624166
+1.930503035
+0.9533585147
+-2.742432987
+0.3977056851
+0.2799256594
+3.297346947
+-3.515103499
+-1.566259078
+1.947251672
+-2.221864449
+4.771243265
+-2.357888444
+0.05824429044
+1.119095116
+1.762074285
+1.43041697
+-0.9241550726
+1.826414011
+-1.509304976
+-1.069954285
+0.9132849223
+3.019153916
+-0.4563424748
+-1.780683065
+2.419543815
+-2.529600065
+3.676362978
+-1.968165377
+1.281896894
+1.853382451
+1.570068109
+0.4540052753
+0.09905910374
+-3.306361003
+-1.561639275
+1.449289375
+1.326738333
+-2.075762611
+0.6939580398
+0.5040619772
+3.501837685
+-0.8368023195
+-1.039714536
+-1.846885937
+-1.998556942
+0.7498967231
+-1.408682278
+2.149407716
+-1.254598123
+3.06799135
+0.8354509158
+0.5167672528
+-2.300857126
+0.6582283724
+0.09104395305
+1.264165207
+-1.021694597
+-2.907259753
+0.5504431978
+0.2795744934
+0.4877847211
+2.011300325
+-1.879281266
+-4.763500275
+0.9500540047
+0.8118250404
+-0.9541126116
+0.3411964031
+-2.095561619
+-4.212394424
+-3.385822897
+0.08472227975
+2.76542083
+-0.7790367766
+1.62787582
+-1.188663943
+-0.1108780458
+1.593121448
+0.2663597702
+-1.083356697
+-1.730604727
+-0.1850562498
+2.364204186
+-3.141309187
+1.718661523
+0.5672939856
+-1.938224534
+-0.03674745824
+-0.4080708935
+-1.89548073
+-1.07887022
+-2.512574602
+-4.143047175
+0.3024728753
+2.0889789
+3.266698123
+-2.222757096
+4.29473033
+3.052613466
+2.846950068
+-1.571332785
+-1.12450325
+-3.876714836
+0.3823184735
+-0.7872058478
+0.3235813761
+-1.669036071
+1.345740936
+0.6863762192
+-2.288246159
+-0.09177589102
+0.569369002
+4.016883112
+0.1915616942
+-1.880817994
+-0.6325261035
+-0.06244693174
+-0.2671905773
+-3.682943786
+-0.6631537904
+-1.386617789
+-0.5210259225
+4.241924811
+-1.664581215
+2.875882008
+2.321236289
+1.366995638
+0.006220836743
+1.308786842
+-0.8998395564
+-1.092918263
+-1.495723344
+0.5478031819
+-0.419541164
+-0.479170132
+2.840457625
+-1.409497024
+1.470729791
+-1.043855234
+-3.184390052
+-2.851900896
+-0.9831047453
+1.259222979
+1.283572789
+-0.4813743053
+1.236843418
+0.1525262202
+-0.5229806385
+1.709462533
+2.375787801
+2.032054785
+-0.613745922
+1.135415256
+-4.258491343
+0.3901338455
+0.7220047315
+0.3039503979
+-0.4445454599
+2.609546373
+-0.1864754015
+-0.279075871
+-0.481873493
+2.068210759
+-0.5849192476
+-1.668698736
+-0.2175170832
+3.415427516
+-0.6013722297
+1.231543268
+-0.5562214776
+-0.5534936294
+-1.121682768
+-2.432608119
+-0.2195632568
+1.436911505
+3.152385927
+0.8837389925
+-1.633722157
+1.4910092
+0.9080583477
+2.796726382
+4.179220912
+2.42921551
+-0.7855163975
+-0.3184590874
+2.315881059
+-1.015386272
+-0.2809669289
+1.268680481
+2.141212109
+0.4458215384
+-5.785039644
+0.6787319294
+-0.6240983907
+-1.951841994
+0.04826033224
+2.2409283
+-2.259754459
+3.179845983
+1.957460201
+1.86832725
+-1.629417188
+-0.5024848944
+-0.7656697434
+0.0006819158674
+-0.1244096013
+-0.6346977616
+-0.3558546922
+-0.4232406339
+0.5349677261
+-3.303634071
+0.9731566977
+3.394543397
+2.145001695
+-1.891794453
+2.089216047
+4.579255705
+-0.485112519
+1.442063843
+4.5987608
+2.060591255
+3.101441202
+-2.190451111
+0.4712417159
+0.7839382053
+1.128574259
+1.579015093
+0.3123501145
+-2.624788272
+2.132544829
+0.7577206573
+-2.357233259
+1.517991642
+1.105960025
+1.074069095
+-0.5736704164
+3.26881129
+1.142453262
+-1.57990812
+-3.085515881
+-1.534664366
+-4.739246587
+-0.5211196881
+0.2579141012
+-2.415332869
+-1.090887182
+3.1065653
+0.2145826713
+3.070687088
+-0.3699028341
+-0.3535654267
+-4.398508091
+1.458577494
+2.20111648
+-0.6847360877
+-0.6206084507
+1.626072756
+-1.47259418
+-1.564648638
+0.6341963323
+-1.212502696
+1.222115768
+-1.84061903
+3.019017838
+1.312927369
+0.1317023582
+-1.747261265
+-2.1155078
+-1.794474061
+-2.864406598
+2.680860636
+0.6841496782
+2.141256661
+3.478130071
+2.613212047
+0.899233583
+-0.8221008917
+1.49859911
+0.4222755382
+-0.5213022814
+-1.030396742
+2.158433553
+2.954925573
+-0.5502174476
+-0.8740154257
+1.396339477
+-1.270352797
+1.207353374
+3.473859212
+-0.8356688722
+0.04902646441
+3.979386155
+-0.746336626
+0.2820734631
+-1.883630949
+-1.405669192
+-2.757673944
+5.850499168
+1.143503982
+-0.09175109841
+-2.114128583
+-3.649386126
+0.4834765766
+-0.2903036382
+1.003985328
+1.384657682
+2.024550086
+-0.08435422543
+1.24402093
+-0.8150722564
+-1.702892797
+-0.6763665375
+1.537935481
+1.212995337
+-0.02522628467
+0.6448554457
+3.215016685
+-3.604820217
+-2.510135793
+-0.02606751882
+1.400714674
+-0.4305464691
+1.80617691
+-6.014874409
+-4.660934515
+-1.135606575
+5.334644178
+-0.0001367051434
+-4.482897936
+-0.7200594656
+1.234987763
+1.924444762
+0.9410978224
+-0.4716084108
+1.357578588
+2.307236063
+-1.109465612
+-0.2472015229
+-0.272195412
+-3.411084813
+-2.514192848
+-4.637249976
+0.1686758504
+-0.5953465046
+-0.6780657514
+-0.06880749839
+1.038538377
+-1.345166195
+2.347222452
+-3.184458975
+-0.0272984016
+-0.1966909804
+1.69975415
+-0.9899714198
+2.137461717
+-0.4677328212
+-0.2036102134
+-0.2981543255
+1.396192485
+1.706296329
+-1.209481592
+-2.817781924
+-1.962203232
+0.330366136
+-0.03329171103
+0.2818653414
+-1.45034426
+1.59148163
+-0.3528770825
+-3.26686906
+0.3106995596
+1.094851997
+0.2875206224
+0.2604419584
+0.454343903
+-2.107458256
+3.063506049
+-0.6529871675
+2.933690341
+-1.108257735
+1.933350746
+0.4803592975
+0.2006288673
+-1.877582914
+2.411637113
+0.8379440215
+-0.18050014
+2.414749974
+0.1771603948
+4.419611179
+2.03335424
+-0.6614181516
+2.716763776
+0.1217127691
+4.011782881
+0.1633167264
+-0.1584187313
+0.1879365995
+0.7990133662
+3.098622521
+0.5857138413
+-0.21342985
+-0.9869200421
+1.571362592
+-1.108690261
+-2.337660644
+-1.884492881
+-0.9298552088
+-0.2488687428
+2.10634414
+-1.154487103
+2.394256905
+-3.275412574
+5.269205602
+-3.17284785
+0.396174077
+-0.4351600348
+-1.570629444
+1.352817369
+2.114428328
+-0.3443722204
+2.418769824
+0.128115384
+-2.127559933
+-0.1583750116
+-1.054992133
+0.9204295432
+-0.7983337845
+-0.1483663907
+-2.170714884
+2.138712936
+-0.7112568469
+-2.138954222
+5.262948604
+-2.825948748
+1.014860612
+-4.327331122
+0.6170454993
+0.37622704
+-0.5047559374
+-2.727088021
+-1.71706189
+-1.613121549
+-2.348247258
+-1.896091689
+2.870251783
+0.7824180243
+2.661655301
+-1.977684207
+-0.8626064754
+-3.474099109
+-2.380911465
+-0.5822262954
+-0.8412127057
+3.554707551
+0.2160931469
+-0.5301997675
+0.9189251842
+0.05375710548
+-2.171407073
+-1.253775488
+2.797913765
+2.607575402
+0.5144706367
+2.038970463
+3.285618469
+-0.8834514244
+0.3686296796
+0.4421818059
+-1.653627063
+0.8928632561
+-2.287356038
+0.2045199703
+-0.5378277837
+0.8590942338
+-2.709722427
+-1.042198951
+3.766328293
+-0.2696921018
+0.1362883164
+-1.33914277
+0.09074185367
+0.7595427731
+-0.9511279644
+-0.4989926008
+-0.3329194534
+0.5914748777
+2.26103467
+-1.338651397
+1.611961321
+1.609211448
+0.5096646907
+2.163303505
+0.1981367262
+0.2156325741
+-0.3471048981
+-0.5407275831
+-0.4209962981
+-3.721642348
+1.20054731
+-0.644512806
+-2.937731753
+1.940643974
+-1.951084476
+1.718984272
+-1.483111945
+1.917775178
+3.797842046
+-3.19012528
+-0.5099244168
+1.913617107
+0.5593781394
+0.5633930266
+1.831206876
+-1.577720514
+-2.566093919
+-1.427619636
+2.667104324
+-1.527812901
+-3.069916201
+2.313562003
+-1.024362823
+-0.8980175172
+-2.787744711
+1.060777473
+1.135932046
+-1.100911712
+-2.387464904
+-3.784200036
+1.136116586
+5.192990562
+0.8086458223
+1.216643865
+0.2931224356
+0.6991532088
+-0.4660329147
+0.5883772879
+-1.602013699
+-2.481386565
+0.2224773156
+0.1963244869
+-2.348844884
+-1.102862836
+-0.7001460561
+1.431566966
+0.3173350979
+-0.335220158
+-3.18443177
+0.5408211184
+1.05839849
+4.396224992
+0.892666872
+1.848221392
+1.867321088
+-3.62540435
+-0.2492360345
+-0.3392906837
+-0.91993905
+1.71306759
+3.253441553
+-1.848939248
+-0.3119883906
+0.8499950275
+-1.559102815
+-4.233072353
+-0.4301260514
+-2.208181419
+-3.876917909
+1.803794062
+3.270962581
+1.057852495
+0.8319278542
+0.8681660293
+-0.1552159304
+0.8983379836
+-0.262603815
+-1.501869964
+2.555303571
+1.497523105
+5.314546098
+-1.63721455
+-2.890302322
+2.683526383
+-0.210379111
+2.71357449
+4.028028185
+-2.745259297
+-1.714856802
+-3.362576901
+-0.3011973084
+-1.442127994
+-3.881764856
+0.1998101192
+2.56367289
+-1.940158803
+2.490753099
+1.393742748
+-0.1291040379
+-2.11568065
+-0.9384445526
+4.256790965
+-0.7784815896
+1.139225875
+-0.5485989268
+-2.196833715
+1.379441724
+3.298496484
+2.130265282
+3.218089952
+0.2860333486
+-0.00511419041
+1.055360954
+-0.4452425182
+-0.98297004
+-3.187679017
+2.036746192
+0.09937043187
+-3.203697507
+-3.636821413
+3.543313336
+2.151206566
+0.7668056015
+-2.93399492
+-0.5295635256
+-2.064158024
+-0.7288701611
+-0.4337484219
+-1.450564094
+-2.787538901
+1.477410636
+0.4986938712
+1.097103557
+2.269796399
+2.205894806
+3.326460468
+1.851732392
+0.9182318924
+-0.8246908966
+-2.579462697
+1.180518016
+-0.5841212241
+3.995252581
+-1.009105947
+0.5601569996
+0.5693283053
+-2.946467761
+-1.530194336
+-3.97332055
+0.5490072406
+0.3733615209
+1.487525923
+-1.450377404
+-2.119051148
+-0.6439253498
+0.8265119421
+-2.165988259
+0.7636973476
+0.9805061713
+1.640632996
+-0.7149313374
+0.1742754999
+2.457003792
+-1.39993704
+-0.07648724561
+4.0120528
+0.608093333
+1.886547475
+0.6009567439
+2.01386765
+0.9693605759
+-0.4388396315
+-0.4805687657
+-0.4568392326
+1.315576761
+0.04874419521
+-0.03347657669
+0.1608903506
+0.5489981575
+3.126495244
+-1.853159396
+2.157142572
+-0.8524406253
+-0.6701036636
+-0.2965851426
+-2.709169237
+-1.269688655
+-0.2717441339
+-1.193541642
+2.59416324
+-1.648294538
+-0.3345051392
+-1.208066171
+2.502584666
+-2.685733238
+0.8305015853
+2.393739488
+2.815407658
+0.3537745229
+3.456663824
+-1.903367108
+-1.103153375
+-1.07823887
+0.514542719
+-4.227863897
+1.897065844
+2.462552173
+-0.5763730632
+2.516393874
+1.147512397
+-1.953749282
+-1.382059048
+-1.014582897
+0.6575061523
+1.881174527
+1.344014028
+-1.240551166
+0.2256992666
+-1.226407625
+3.164541367
+-0.7688761919
+-0.1347499972
+-0.5668200183
+-2.399035895
+-0.1580693548
+1.643746013
+-0.3415005438
+-3.302061455
+-0.417251327
+-1.421894139
+0.1046937076
+1.930719338
+-1.400416958
+-0.3110150898
+0.09272283337
+-2.855350824
+0.7058676405
+-0.5883172481
+-1.912623994
+-2.691546534
+-0.08499621959
+1.641004127
+0.9819903454
+-2.356084646
+-0.6821584191
+0.9173602521
+2.38561729
+3.015231053
+0.4318598356
+2.152400647
+-2.798711942
+1.017245472
+3.184851415
+-0.08288536282
+2.751883159
+2.711208257
+1.250650357
+3.351003513
+-0.5803922621
+-0.4579908302
+3.049292862
+0.7783896813
+-2.485888611
+0.05419795292
+5.959952344
+-4.737606905
+2.644388316
+-1.017350504
+1.056877531
+1.650433445
+-2.696863202
+-3.116248287
+-1.739730952
+-0.1956766658
+-3.365002297
+1.312519117
+1.184463367
+0.5966701705
+0.4495693193
+-2.637755819
+-0.6318088717
+0.08335502978
+1.547034801
+0.2619634111
+3.334318437
+1.248894639
+0.1091227694
+0.9047988362
+3.229592758
+-2.253681711
+-0.7201682371
+-0.6993820489
+-1.341517033
+-1.913160018
+1.195878412
+-0.9135487876
+1.222191892
+-0.9209074321
+-2.524038421
+2.396094549
+3.596824164
+0.4493577105
+1.046170651
+3.473534088
+1.017306977
+2.330077693
+1.426240633
+2.639953808
+0.6222188346
+0.5978647591
+1.217345399
+-2.699092712
+-1.746632678
+2.722083692
+2.841309522
+0.8607483272
+-1.903983355
+2.405535721
+0.15985253
+-2.340522304
+1.239085649
+1.784978009
+1.752229532
+-0.6191618244
+-1.039208478
+-2.613743286
+3.039197706
+0.4257227743
+3.132995762
+-0.5178108018
+3.422977976
+-3.641632398
+0.3269890337
+-1.626234046
+-1.210709159
+-2.65504761
+-1.28834323
+3.81776687
+-1.127090619
+2.164945108
+-3.903821657
+4.882432319
+-0.03457017173
+1.824564055
+2.479316995
+-1.146734801
+0.8497789737
+-0.5425200305
+-1.36713509
+-3.07487522
+-0.2027488559
+1.493331435
+1.85836362
+0.4588360153
+0.8288117534
+0.6194476499
+-1.474912388
+-3.073839766
+-1.124509658
+-3.199022247
+1.648779861
+4.982972404
+2.023710327
+-0.5624758789
+0.03341301521
+2.307839338
+-1.201830073
+0.2658745342
+-4.339948855
+-2.233117753
+-1.138736011
+1.2725334
+-1.535298459
+1.236958967
+0.3663224403
+3.718702546
+-2.15102927
+-4.038439422
+-4.874928916
+-0.2971270198
+2.302302923
+0.3706467668
+1.316921852
+-0.09907220379
+0.474797699
+-3.023160646
+3.864740665
+0.964844068
+-2.631566098
+-3.927230125
+1.066136368
+-0.218646434
+-0.5663668389
+2.867487691
+-1.137234481
+-1.699692926
+1.448892994
+1.211796696
+-2.580516962
+1.578866213
+3.921827489
+-0.6710796179
+-1.215224371
+-1.454483762
+1.702817342
+1.77683316
+-2.222646623
+2.27568873
+2.551098559
+0.5891988235
+-4.371359053
+1.584754906
+-3.250082846
+1.479661436
+2.028538215
+1.916416201
+-5.230741852
+-1.456261656
+1.484996934
+-0.1642879202
+-3.049803746
+-0.876358103
+-0.01078331774
+-3.424169724
+3.411172605
+1.622379726
+0.2987218247
+-1.470911363
+-0.6259330547
+-1.306832429
+-1.982451474
+0.2979327614
+2.206647202
+-0.3800975972
+-0.8245277613
+0.3572403977
+1.563362306
+-1.049280805
+-2.762193396
+1.890952367
+-2.72338216
+1.069975263
+-0.1919185948
+-1.792813767
+2.774362872
+1.994786123
+1.152935275
+0.880001677
+0.950940209
+-1.967154672
+-1.123987424
+-3.282006439
+0.5845654741
+2.866209782
+-0.7674226029
+0.4749851846
+-1.065510333
+-0.9423596857
+-0.6801690584
+-2.926411328
+2.277196511
+-0.01004965946
+1.943175394
+0.6046824474
+-1.612471413
+-0.6338238958
+-3.173730405
+1.577374168
+0.2744495485
+-1.57036105
+-3.013140421
+-1.152819673
+-2.214576844
+0.270565063
+-2.105555232
+4.10458685
+1.970617839
+-0.7456802359
+-2.972471605
+-0.2233227539
+-3.91923071
+2.121402497
+1.582595895
+2.897289489
+-1.113309018
+1.611128699
+2.768081899
+-0.8713293925
+-1.467683665
+2.696226378
+0.2909528528
+0.8505957698
+-0.176079644
+-2.496946948
+2.209194444
+-4.058771846
+1.995951837
+-0.558476937
+-0.3752649031
+-1.065081589
+1.053700885
+0.8174900378
+3.222996982
+-0.3681444788
+-0.3641222219
+-0.7075903616
+0.2078622116
+-0.8979610588
+2.310532769
+2.740800284
+-3.844772226
+-2.577721437
+-2.037567067
+1.323232662
+-1.784077062
+1.103778784
+2.742659937
+1.541770879
+-2.089636508
+-2.399808927
+-5.336122697
+0.9800241501
+-2.510077951
+0.08478872962
+0.4615763733
+-2.619548814
+1.886785472
+-2.071933332
+-1.188311922
+-2.364551417
+0.09807929158
+-1.329287345
+4.540117585
+-1.28718812
+0.3727476439
+-0.5606295172
+1.773317204
+0.007818041437
+-2.923542647
+0.3977518651
+0.8799498377
+-2.558270612
+-2.085587492
+-1.311214215
+0.514308417
+-0.7136185451
+-4.504493717
+-1.52055101
+2.270311864
+1.265362221
+1.307726372
+-0.112136996
+4.34599184
+-0.1374615539
+-0.4626386003
+-0.9446923622
+-0.7973757011
+1.564561219
+-4.168000118
+-2.370436295
+2.801555291
+-1.551527071
+-2.255163228
+-0.3344968245
+-1.496597122
+0.5857414585
+-2.39266367
+2.998202361
+-2.621860414
+-0.1678931701
+0.1116416322
+0.4927839527
+-0.1212131242
+-0.01155869878
+-0.1400047315
+2.611367036
+-0.2507975112
+1.92710641
+-1.464529656
+-0.004837582552
+-0.2603407722
+2.000942039
+-1.173203775
+-1.383445073
+-0.3121608287
+-0.04240677387
+-4.204701151
+-1.716961578
+2.220344066
+-0.5091475485
+-0.4832514639
+1.14049083
+1.081070584
+3.478550864
+1.262487605
+-0.8805691972
+0.1100731834
+1.548208658
+1.923337789
+-1.805247716
+1.339566506
+3.534263165
+-0.3468417248
+0.02262052472
+-1.850925025
+-2.123748032
+0.02306895217
+1.576184735
+-0.5974857466
+2.211302353
+1.815605221
+-0.7322940305
+1.460187642
+-0.2586817389
+0.1858998721
+2.147717063
+4.877367993
+-2.792430733
+-0.6606624387
+2.320520142
+-0.4884821937
+-0.8587247262
+3.335378358
+-0.1216729449
+1.57459614
+-0.6186718012
+-3.117275258
+-1.022202698
+1.367532073
+0.3859645419
+-1.595722198
+4.127743204
+0.235790769
+-1.990720031
+2.599024823
+1.833205744
+-1.119868587
+1.308348857
+1.581094267
+0.9246826294
+0.2597087793
+-3.536155961
+-0.6467612132
+-0.1058290653
+-1.166725671
+-0.712491901
+1.403014258
+-0.9974057591
+-3.392343994
+-1.251656963
+-1.07116742
+-0.3237826859
+-2.453520594
+-0.6212762266
+-1.753720816
+1.559094357
+-0.3870776645
+1.09513709
+0.5536238509
+-2.569141323
+-0.08471906176
+3.339768692
+-3.221700839
+1.895693509
+0.1972927266
+-3.02132835
+1.146832381
+2.006908796
+-0.1219816628
+0.6143302693
+3.644785023
+-1.210835496
+3.656030683
+3.283576617
+-2.65058656
+0.2470819788
+0.1338646569
+2.58682085
+2.338157933
+3.02031884
+-3.238646675
+2.754311427
+1.135833003
+-3.677345851
+2.62616518
+-2.214184352
+1.545917723
+-1.17216377
+-0.4116792613
+0.887207993
+-0.419396784
+-2.904345484
+0.6116056999
+-2.305039959
+1.08871112
+-2.504539635
+0.2786670847
+0.728415799
+4.027434693
+-3.875194819
+0.6323204008
+-2.520672439
+0.9572258211
+-0.2244955295
+1.538361808
+2.832371373
+-0.6749279963
+-0.02674028102
+1.808284569
+-1.058282285
+0.8063286002
+1.677717882
+-2.152375699
+-3.049945088
+0.3514258269
+1.753452518
+-3.009933733
+0.9821876186
+-0.7307854131
+-0.3432070862
+2.063318112
+0.2810090671
+-1.710169526
+-0.02450995066
+-0.4672444641
+-0.5622993574
+2.358670548
+-1.309375761
+-1.586224766
+0.5009070938
+1.277825172
+-0.2676748837
+-2.46310326
+0.217492858
+4.848509732
+1.132626589
+-3.324439888
+-1.903291003
+0.1870013846
+1.083654085
+-1.391347113
+4.328345859
+1.075705066
+0.6652877323
+2.513893693
+0.4912378623
+-3.930922004
+-0.788445428
+-1.278573357
+-0.6746128748
+0.228057258
+1.385014107
+-1.547526693
+-1.530451518
+-0.1552794833
+1.151340624
+1.102067983
+1.200586772
+2.219116527
+-0.721970511
+2.240257261
+0.6690884931
+0.315792576
+3.602888937
+-0.6374897069
+-1.532531268
+2.930301774
+-0.08971846807
+2.210597238
+0.796955064
+-3.504837849
+0.5620459237
+1.249218424
+-0.1450925452
+1.246702095
+2.384350774
+2.943064443
+1.583942089
+-1.689514202
+0.2482888771
+-1.427807421
+-0.9208455824
+-0.9513633109
+-0.1067979167
+0.443759146
+4.167786629
+0.4950300308
+3.56549209
+-0.02697807586
+1.535943
+-0.7109834072
+0.07242405818
+-1.433286828
+1.385484997
+-1.558267978
+-0.5948425227
+0.4406721693
+0.8699683385
+1.049807068
+-0.9475809243
+-2.718640249
+-4.519951349
+-1.786962188
+-1.313430606
+-1.385980717
+-1.683307442
+0.9212407352
+-0.5498043186
+-0.2743061725
+-1.572568745
+3.263558738
+-0.5520514824
+-4.702305635
+-1.55446712
+-2.656756761
+-2.802394399
+0.9253857527
+4.763372812
+-2.417971645
+-0.8377348903
+-1.570642838
+-4.329102845
+2.28916238
+-1.901003593
+1.52824643
+2.638979541
+-0.2406493493
+-2.108619092
+-5.517855048
+1.319510836
+4.286811023
+-0.9017538777
+0.9302149304
+-0.7754880322
+-1.213471136
+3.073117776
+0.3423137936
+0.02712643716
+0.2570436558
+0.2475702047
+-3.225373155
+-0.3398125249
+3.437582269
+1.590552132
+-1.124372379
+0.3879005462
+2.520615205
+0.6652462945
+4.991989125
+0.6697449984
+0.4881702623
+-2.162949084
+-3.342421175
+2.058903009
+-0.7911046004
+-1.529563943
+1.128003019
+-1.227858615
+1.411273225
+0.4821446527
+-1.250529096
+0.5151919415
+-2.952999799
+0.8792610367
+-1.026820925
+-0.07381304275
+2.4681291
+0.06218786368
+-1.309242076
+1.972858234
+-0.09111480045
+2.406564219
+-1.491724657
+-0.595691224
+-1.964470605
+-2.643650471
+0.3267136386
+-1.249934473
+-1.483424828
+0.2724455595
+-2.118898854
+-0.1619478784
+-1.049096364
+3.676531697
+-1.67214305
+-2.718315772
+-1.106986346
+0.3094731398
+-1.75572255
+-1.109046276
+-2.551778329
+-1.694551196
+0.6789802811
+1.773567877
+0.7940016219
+1.925919285
+-0.1594538006
+1.289685592
+0.8093437017
+-0.04256598571
+-4.876265119
+-0.3314210894
+1.844710174
+-1.610978293
+3.63531738
+1.653158937
+3.037035385
+3.52690654
+-4.201359187
+1.914624808
+0.4957505353
+2.365143667
+1.95703868
+-1.146328855
+-1.968892133
+-1.988372707
+0.3386161958
+-1.863428554
+-1.908726323
+-1.225213048
+0.6529513666
+-1.60313899
+2.097092714
+-1.563157044
+2.734966919
+-2.042851993
+-0.4018281777
+0.2051042117
+-1.927218768
+-1.469265264
+0.4937669997
+-0.9323231981
+-1.134530278
+-0.8335441842
+0.3656044416
+-1.678834717
+3.326842295
+-3.7672912
+0.07814101437
+-0.2975696899
+-0.7123511389
+-2.802743987
+1.239781443
+-3.343127665
+1.044024239
+-0.2054805817
+-1.077988479
+-2.55677166
+-1.442640648
+-4.702622315
+1.234345604
+0.2761888244
+1.025082969
+-2.40223975
+-1.19282998
+1.190270566
+0.4678139337
+2.201262831
+0.849471632
+0.6744858931
+0.2778729409
+2.811887427
+-0.9567068395
+-1.289837277
+0.02630006762
+-0.07495199379
+-0.4872282826
+1.758808833
+0.7745269519
+-1.008509946
+4.315402859
+-1.138571337
+1.177972766
+-1.703819929
+-1.081242014
+-0.7025168931
+3.718411583
+0.2142556949
+0.3762429928
+-2.877554699
+0.4556958121
+-2.060343681
+-1.35239244
+0.887991154
+-0.942318238
+3.02687974
+2.584142174
+0.370101309
+0.144869928
+-0.3619288534
+0.6476282074
+0.94008876
+-0.5086524225
+-2.328442687
+0.5134588794
+0.3537429639
+-1.348244357
+-0.1088051617
+-1.633518614
+1.205326057
+0.3143347193
+0.3696718265
+1.449247649
+4.383268273
+0.07905848454
+1.177060031
+2.172473035
+-0.1866903089
+1.794845086
+2.509209819
+0.02483419357
+5.683534689
+-3.494500033
+-1.545421445
+-2.329750697
+2.297773367
+0.5568130552
+-1.497655857
+1.597523234
+-0.5832002858
+5.260113648
+-1.008189406
+2.178174612
+-2.014064068
+1.077997209
+-0.899804213
+-2.601259935
+-4.100047757
+-0.5704740686
+1.963741272
+0.07841175368
+-2.83231748
+2.821243088
+0.8495097405
+1.564455009
+0.8942263794
+5.073828396
+0.3610479854
+-1.60123078
+2.15963924
+-4.365734715
+0.5766203039
+-0.7574728944
+2.565962422
+0.09270454228
+-1.510485283
+0.2783239458
+-2.616342236
+3.69482804
+-0.4597998861
+1.377892365
+-1.258433702
+0.8792362246
+-0.1672937759
+3.853109271
+-2.943483082
+-0.8266026133
+-1.01793367
+-2.462100045
+-0.2571311924
+1.707273954
+-1.455503368
+-0.02525822331
+0.9088231986
+1.09962081
+-1.035952757
+-4.824723401
+-0.8939825946
+4.138950783
+-1.878848637
+-2.104248334
+0.4073926118
+0.01426238419
+-1.374100804
+-0.03116400841
+-0.3294897058
+0.744968774
+0.883559431
+-2.165920574
+1.391413173
+-0.4401770569
+-1.276853413
+2.090091236
+-0.05506848074
+-0.7199310193
+-0.5258719495
+1.057528835
+0.3658354599
+1.353663248
+-3.652691185
+2.260760443
+-0.1684589578
+1.109377726
+2.794721293
+2.739694894
+-2.746149106
+2.030239521
+0.5294389081
+2.063045164
+-3.156917247
+-1.981526501
+0.5134522047
+-1.799255606
+-0.7735508138
+2.819545456
+4.459947825
+-0.3792368611
+1.904933253
+0.3404188016
+1.879769626
+1.06432381
+-2.47754917
+2.578864084
+-1.716412008
+-2.601595549
+2.396374188
+-0.6733001626
+1.683894905
+1.086744498
+-1.925975201
+-3.201910554
+3.514674605
+1.387190618
+2.930960741
+-0.3594768131
+2.487515918
+3.425139175
+-0.4980089935
+-0.5372807217
+0.1860762906
+-0.07512367051
+-5.320043835
+-1.901825667
+0.5612787273
+0.5873613824
+0.5134626786
+-0.6028514107
+-4.06657421
+0.246086408
+0.4274541764
+-1.81507144
+0.7053845464
+0.5127160443
+-1.081552853
+-0.2473470778
+1.674048859
+0.5861745541
+-1.862734319
+3.134321475
+2.323101469
+-1.633522596
+-1.436419424
+-1.266752058
+1.171278757
+1.356177136
+1.178062844
+1.424718668
+-2.569791162
+-1.121860613
+-3.822833262
+1.675783037
+2.031434799
+2.19062688
+-0.8001683086
+0.6687149557
+0.7726419678
+3.033337013
+-3.824937467
+1.484840738
+-0.6764749352
+-0.7019635952
+1.260754074
+0.8621651522
+-1.699410765
+1.044275786
+0.8092124178
+3.300511562
+0.4984416676
+1.568317013
+-2.964840055
+-0.9090913482
+-1.944547671
+-0.1018695609
+3.414906981
+-3.450836757
+-0.6180033985
+-0.09075841796
+-1.011637765
+2.774319529
+2.241542947
+2.024854208
+-0.60748058
+-0.210817641
+1.04753672
+0.2859486634
+-1.637495995
+1.491661334
+-4.220734064
+2.145647069
+3.462569426
+0.718609651
+1.75316589
+-0.05647856671
+-2.074804889
+2.69906126
+-1.75962146
+4.429638949
+-0.707072759
+0.1269673677
+0.01289374364
+0.8204952875
+-1.155351515
+-0.6564706053
+2.424726558
+-2.862828525
+-1.364780309
+-1.77292545
+-0.2131378649
+0.1346602634
+-0.4149898205
+0.5824317027
+1.90695912
+1.595727877
+-0.3402813298
+0.4573567424
+-1.74020518
+2.64443864
+0.3630110348
+-4.878818487
+-0.6948246157
+-1.813970757
+1.976301401
+-1.188797552
+-1.355386563
+-1.010936273
+-3.512041929
+-2.926650889
+1.064631402
+-1.600055575
+2.336661566
+-2.089535319
+0.1271415324
+-0.6713647963
+-2.295295411
+0.2859605437
+-1.296545101
+0.01445166509
+0.8718443744
+-1.775704793
+4.930792994
+-1.173115442
+1.574967261
+-0.1544372833
+0.1813331276
+0.348265041
+-1.429888875
+-0.0869044251
+0.0479534849
+0.3348473913
+-0.7640587357
+-0.06522833224
+-2.56329823
+-0.5794512316
+-1.18938996
+0.0861137483
+0.7499013556
+0.02423649866
+3.526965705
+-2.702094751
+2.376300431
+0.9830340125
+0.001867995071
+-3.782718294
+0.9073089186
+-0.7446724318
+0.4625214128
+-2.827386793
+-1.168101095
+-0.2128850641
+2.752405419
+-0.8502372735
+-3.815163709
+0.565474108
+2.990507621
+-0.5951963948
+-1.492228022
+0.6448877988
+-2.816537186
+0.2920868197
+-0.30975762
+-0.5155015079
+-0.4155285205
+-1.349468042
+-1.032344895
+-1.485528795
+0.5322107491
+0.1391177017
+-0.9720804239
+1.048978064
+0.9461414779
+3.524686239
+1.798224617
+-0.03686459872
+-2.100810432
+0.5103330983
+-2.374184944
+1.318714319
+-0.6272857338
+2.435393947
+-2.174931026
+-0.1030778849
+0.4122595987
+-1.25305409
+2.7843336
+5.651541001
+2.067114554
+-1.617295679
+-2.180255001
+-0.6213351749
+-0.3265257009
+-0.9206826262
+-2.668282319
+1.030904423
+-0.9798906491
+0.6065675177
+4.905992792
+-3.747268678
+-0.1362173806
+0.1144540288
+0.008842559267
+-0.1307180682
+0.4676721196
+-2.27839972
+-0.02079973823
+-1.041878793
+-2.17844242
+-0.6924066725
+-3.690814437
+-5.197844512
+0.396443323
+-0.9683605078
+0.4140575458
+1.509974154
+2.718840519
+1.392144089
+1.364402777
+-0.02242831643
+2.689520794
+-1.662984799
+-0.8159436347
+-2.661607773
+0.7051972422
+-1.075769499
+0.786888861
+0.573036541
+4.085072468
+-1.838922368
+0.2293400584
+-0.2748474074
+2.73105385
+-0.5232766948
+-2.572481822
+-3.309314979
+0.07446547974
+2.540602602
+-0.2865532233
+1.590510429
+-0.1441449511
+-1.484848011
+2.451307887
+-4.410776214
+-1.061275246
+0.3364287549
+-1.937692285
+0.6193080465
+1.880215738
+-0.3267806902
+-0.6417646232
+-0.8068615729
+-1.32813344
+-0.2325749071
+-0.8328089721
+-0.4212491091
+5.223600049
+-1.634192232
+0.4593869088
+0.2705727683
+4.030618937
+-1.967189583
+-0.0796797599
+-1.419971205
+0.5038071914
+2.020102108
+-1.493989482
+-0.4542799293
+1.68493454
+-0.005690667938
+0.1146385349
+-1.582309557
+3.023014935
+-0.8584078295
+-0.5629802572
+-0.5973010148
+1.942725768
+2.331868291
+-0.3690114425
+0.01317036924
+1.013096571
+0.3915655813
+1.570431955
+2.198501644
+-1.276317577
+-0.4516221706
+-0.103781746
+-0.9820717604
+-4.49198004
+-1.597021741
+-1.618787431
+0.4808626748
+0.8753915581
+0.6043268553
+0.5536240504
+-1.824622097
+-2.92728745
+1.602219986
+-2.955193821
+3.920572446
+0.583996722
+0.2298057658
+0.7785903757
+-0.9237004813
+1.444041926
+-0.2667520182
+-1.675890343
+0.8881679332
+5.447146982
+-2.231650246
+-0.4555089
+2.663425971
+-0.9842916419
+2.718092148
+2.169545319
+0.03123204204
+-0.3468565008
+1.880568081
+-1.554928509
+1.521792985
+2.803505225
+2.463306666
+2.002316242
+-1.956103144
+1.355912038
+-0.1389281429
+-2.114722066
+-0.2802419086
+-2.866990448
+-0.3581624324
+-0.2460852712
+1.076390759
+2.130956186
+-2.802640336
+-2.655207461
+-4.092631776
+1.677067227
+-1.373862107
+-1.124026391
+-0.08857662101
+-0.009473525189
+1.368371842
+-4.320541758
+-0.3947186292
+-2.465065333
+3.383679275
+1.062575574
+0.703937679
+4.344184203
+-0.2924138229
+1.79239
+-2.922402492
+0.4028239742
+4.549312014
+0.996021677
+-1.503709999
+-1.951192078
+-3.14773271
+0.8872749605
+1.722103323
+0.2542123439
+-1.622693308
+0.4836410701
+-1.373485621
+2.441469409
+-0.8217380644
+-1.765538084
+-1.091256979
+0.7736002836
+-2.460982549
+1.334058622
+-0.5425222601
+0.1636403428
+-0.2599317121
+4.528117677
+-0.3390107347
+1.690450851
+4.906457988
+0.8515045965
+3.695191716
+0.1949095092
+1.593413272
+-1.177416153
+-2.224357855
+-1.937542081
+-0.04831022389
+0.57147681
+-2.233806254
+-2.75671266
+-3.753456241
+4.253418325
+0.2151864319
+-4.290536349
+-0.01818212607
+-0.3185416815
+-2.754346935
+2.318623095
+-0.9147249158
+0.08258651709
+-0.5686246531
+0.09277082618
+2.035065875
+1.21134131
+-0.9037736555
+3.150976316
+3.080386176
+-2.926405198
+-2.229098977
+-1.222328457
+3.050168446
+-0.3654264016
+-1.143842664
+-0.06798739901
+-0.4482855353
+-0.3119573113
+-2.139274901
+-1.586317492
+-0.5343223636
+2.763151521
+2.578322595
+1.831373428
+0.7266523888
+-5.223751152
+3.560734723
+2.236024361
+-0.73863872
+-1.296766743
+0.3721440536
+0.08942009536
+-1.38534677
+2.987961051
+-1.310106817
+0.4997424181
+-2.408503003
+-0.510578585
+2.164532319
+0.08513929057
+-1.173826662
+-3.896352285
+-0.6819826837
+-0.7093072824
+1.466691854
+2.64443772
+-2.437141877
+1.603381103
+-1.937472496
+2.298675666
+-0.8735910849
+1.11455817
+3.097658942
+-3.407340353
+0.2937171607
+3.154789293
+1.558243279
+4.331882717
+-0.9924961325
+2.170420931
+1.436880382
+0.1011765817
+-2.024639116
+0.4474647259
+3.867520204
+2.499761621
+0.9768321588
+-0.9878344874
+-2.815025037
+-0.3980596991
+-1.817974211
+-0.7118195793
+2.205255872
+2.450482116
+2.174355117
+1.088308453
+-1.059592708
+0.8779960337
+-3.453416122
+2.208092111
+-2.198685834
+2.668273098
+-1.267089284
+4.466228449
+-0.5277159429
+-0.2313943941
+1.52480046
+-2.683732238
+0.4371995176
+-2.010566143
+1.353701506
+0.9995127472
+0.4486604064
+2.472364658
+0.2869940673
+-4.389532912
+-1.506432609
+-1.919163116
+1.326771778
+-0.4047199106
+-1.286058121
+-1.626905062
+-0.6832348679
+0.8436801265
+1.779013367
+0.07501260076
+-0.8857577297
+0.0785027642
+-2.422199247
+-0.9158455941
+2.857225915
+2.144408857
+4.47292669
+-1.466403725
+5.20048537
+-1.013702486
+-1.306304819
+0.5939952297
+0.9826072949
+0.3884808544
+-0.1551494347
+4.123652741
+-2.395887012
+-2.193098554
+0.4256758665
+-0.1946119495
+0.1018268982
+4.635763049
+3.34335824
+1.286535454
+-1.53173096
+0.51020684
+-3.483658035
+-1.697685682
+1.499499438
+-1.878948517
+-1.228118454
+0.448430767
+-5.874927489
+0.4252581357
+0.6270425506
+1.135651918
+3.365320402
+-1.032573092
+-0.4117096448
+-1.571890673
+-1.241769586
+-1.444608803
+-1.438674409
+-3.921737182
+-2.283416915
+1.591753314
+-0.6803667188
+-0.9843003641
+-0.8699237866
+0.6275826039
+-2.654328081
+1.82123977
+-4.158972267
+2.035574711
+0.853349119
+-4.11815973
+0.1731329765
+0.7999374572
+-2.38834702
+-0.131192973
+-3.033470371
+1.735753374
+1.40807101
+-0.0283260247
+-5.102674651
+-0.11820924
+-0.3565265983
+-1.344262235
+-2.915472132
+-1.683054768
+-0.9848561957
+-0.2109182563
+1.317413078
+1.255518806
+0.4054115567
+-2.057232923
+0.3997189926
+1.314357669
+1.380956442
+1.917903249
+-4.644134426
+-2.886307223
+-0.7862110856
+1.567653834
+1.6862159
+-1.254990697
+4.160410668
+-3.724699504
+-0.6503743578
+1.383719825
+-0.9289343815
+-1.877833018
+2.424677646
+-0.2611210723
+0.4246180126
+2.402575831
+-1.598862636
+0.4057367608
+-0.8306303491
+-2.396756779
+2.136269879
+1.077969289
+0.5692348691
+0.1650971545
+2.81240147
+-5.16071851
+-0.5759951658
+-2.908301989
+0.4848298589
+2.447596672
+-1.702456647
+3.053174496
+0.7389019763
+1.563472541
+1.615172465
+0.7904856224
+-1.87257699
+-1.449439413
+-0.06560265864
+-0.9432265091
+1.127537351
+-4.535854641
+0.6853079762
+-0.1959344799
+-0.4804892272
+-0.1926073423
+-4.388772881
+1.38855234
+0.05824279828
+4.906070899
+1.437586359
+0.4267825774
+-2.17491238
+-1.774683736
+-1.880609579
+3.84423745
+-1.653394395
+-3.044727705
+1.844048238
+1.745925914
+-0.2010998621
+1.880910718
+0.5498763126
+-2.547044127
+4.213993352
+-4.42991442
+-0.6845761135
+2.933660909
+3.940581786
+-1.850185054
+-0.01214282998
+-1.97658369
+2.977540519
+0.5608217895
+-0.6978217263
+1.108505136
+-3.084482472
+-2.515061103
+0.5430047322
+2.580457033
+-0.4930812726
+0.6849583826
+-2.060865658
+3.529884437
+1.695119049
+2.669357591
+3.349466516
+-0.4737619679
+-0.7114029203
+-4.064993277
+-0.8856699085
+1.342887744
+2.168722561
+0.5529370528
+-0.2310962126
+1.976746178
+0.8225879774
+-1.254013477
+-0.2921125135
+0.5458615749
+-2.19788692
+-5.514527667
+1.512271678
+-1.965536647
+1.821697852
+1.320827061
+-0.2578648865
+3.656024741
+1.351921948
+-0.703911053
+3.243052297
+-2.17653157
+-5.054272807
+-0.7142661031
+1.895953127
+0.8737640577
+-0.5434570474
+1.39873276
+-1.556044305
+-2.372737456
+-1.116740974
+-1.471953184
+-2.050380267
+-0.327780843
+2.502091055
+-0.6345085593
+-1.841882635
+-1.075647546
+-0.4487140699
+1.114686968
+1.557674553
+3.533131215
+-1.129623572
+1.014713774
+-0.37551689
+-2.006180489
+0.004033631491
+-4.418127536
+-0.7839422459
+-0.1785869756
+-0.5536150883
+-1.476584385
+0.9563373792
+-1.054246154
+-1.713032624
+-0.02297724794
+-0.6819361816
+1.844073902
+0.9096478487
+2.221020752
+-1.708091781
+-1.068476171
+-0.3174471749
+0.7573152835
+3.245127702
+-4.811023752
+-1.933454302
+1.411541557
+0.4337542728
+-3.70781338
+-2.62417835
+-2.33064087
+-1.074891012
+-0.990288853
+1.221218545
+2.930139849
+0.5666907062
+0.006820050316
+-0.9203210061
+-1.415490794
+-0.3239782954
+-0.7421469335
+2.438214133
+2.961283709
+-2.173741553
+-4.129741354
+-1.824855148
+-3.978572851
+1.790292647
+1.621932315
+1.592742085
+1.525274603
+1.339805691
+2.619988353
+0.355854706
+0.7960206557
+-0.4447259961
+1.484058578
+-4.811521352
+1.485079709
+1.547962337
+3.61402034
+-2.769332256
+0.3760029239
+-0.3819026853
+-3.034807581
+2.4886742
+0.8849644028
+1.496963684
+-3.671914756
+-2.192307245
+-1.040231958
+-0.9547440923
+-4.242778875
+-1.58310707
+-0.3375426954
+-0.7798238343
+0.5791957887
+-0.7022430555
+-2.697562641
+-0.1860478928
+0.7393144149
+-0.7855713022
+0.3025111659
+5.889968629
+3.257635848
+-0.6928371425
+-2.037532229
+0.2693240467
+-0.2814111011
+-0.5219539515
+1.63409753
+0.1475077045
+1.196426015
+0.2993205995
+5.440170419
+-3.227567796
+3.046010972
+-4.77003246
+1.833421819
+-2.169397296
+0.3670856909
+3.69759898
+0.7978942402
+1.783926633
+2.463001356
+-0.04682826456
+-1.496404704
+0.2975905355
+0.8762963133
+0.7673083954
+3.098271128
+-1.453167026
+1.950391727
+-2.569575011
+4.208370799
+0.4545141284
+-2.258332599
+-0.5626639336
+-1.478833401
+-5.168642212
+-2.353295267
+1.942402879
+-2.480044502
+1.357142348
+1.56120334
+1.862020324
+0.461605685
+-1.904373618
+-2.113875822
+0.02020896504
+2.581622196
+1.686870338
+-2.062825742
+-2.763439891
+-0.1141435858
+0.8196054969
+1.44570476
+-0.3238832472
+-0.2255909752
+-2.721075404
+3.391969125
+-0.203830458
+2.171491375
+-0.3861246815
+1.026071713
+0.4053335775
+1.563720312
+-1.191194987
+0.3878145111
+-0.4922361546
+-0.5905822191
+2.204984297
+0.883821483
+-2.357033408
+-0.268074167
+-0.7517035069
+0.2331109819
+-2.27396678
+1.94459013
+0.3399017535
+-2.299524292
+-1.115529475
+4.86511159
+4.060126984
+0.63443609
+2.084109927
+2.79400542
+-2.772063472
+1.351298659
+-0.4176045008
+0.08322465673
+-0.7295851544
+-2.7653245
+0.06542840959
+-3.460089805
+-1.224073073
+2.331734175
+1.569756441
+-1.066768695
+2.740385225
+-1.212798399
+-1.817347374
+4.569770661
+1.376611652
+1.324793468
+1.777792891
+1.08874771
+-1.453041444
+-1.373893589
+0.671818727
+0.9769906878
+1.843041286
+-0.219267
+3.69593417
+-2.650307036
+3.860271951
+2.806580226
+0.6538190724
+0.6138242059
+-0.4902735123
+-1.633962548
+-0.8993866197
+0.8130083714
+4.481386181
+1.770883215
+-2.880297775
+-1.995460968
+1.880862983
+0.05536025546
+-2.059448787
+-1.918389294
+-2.382094066
+3.511030726
+-0.09158848261
+-0.03075402987
+-0.6848087869
+-1.204924349
+-3.015220836
+0.633651933
+2.597940995
+-0.6875705902
+0.7201215423
+2.29485264
+1.655319139
+-1.589725235
+-0.6429718362
+0.2998935522
+3.383011906
+2.48857659
+-0.2234460869
+-3.77320009
+-0.1305531574
+-1.69682353
+1.831586577
+-1.762031801
+-1.353378536
+0.1435080118
+-0.1887324351
+-1.762030266
+3.027849755
+-2.130558045
+-6.138413655
+-3.446708958
+0.4290783084
+-0.1523371285
+-3.304986652
+-3.71821642
+0.01288932053
+2.887039821
+0.8775786691
+-1.659027559
+0.8912545546
+-1.659529051
+-4.56923287
+0.6134284625
+0.476995155
+1.862688198
+1.476588565
+-0.05476709371
+1.529700339
+-1.663454187
+-2.821714378
+-3.596557598
+-1.396317643
+1.213803899
+1.700374032
+-1.701802961
+0.876733967
+1.249692811
+1.747890119
+0.7613736783
+-1.92690198
+-0.2106626964
+-2.100968842
+-2.434637618
+2.942021573
+1.334116706
+0.0514771769
+-1.842279972
+-1.074849229
+-0.0740910731
+1.803201002
+1.24859131
+-0.01002974833
+1.676698469
+-1.313139441
+3.657216675
+1.157803835
+-4.635566155
+-1.171707305
+-0.6807548271
+3.442388064
+-0.08072905175
+-0.001144069833
+1.967450196
+2.340921002
+-4.110112755
+1.198149979
+-2.611620968
+-0.2066660182
+-0.6633803637
+1.808090631
+5.912797533
+-3.169518079
+0.9941926962
+2.531327284
+-0.3640468852
+-1.275807853
+3.528403554
+-0.707043103
+-0.7809293557
+0.1638473006
+-0.992090366
+1.280200949
+-2.306560789
+-1.441230494
+-0.8049719957
+1.485318005
+1.338879906
+2.869568672
+-0.6131254727
+0.7358212707
+2.536308584
+0.1309054204
+1.669137582
+-2.23130281
+1.695315338
+0.4771425299
+-0.9271752494
+-2.291508818
+-0.0375016822
+1.077432118
+0.5097359792
+-0.1831543121
+2.136957842
+2.170426943
+-1.678816812
+-0.3619394544
+-0.7848613628
+0.2901875816
+-0.1174169136
+1.372940151
+-2.083535809
+0.5926815474
+5.901591373
+-3.850136278
+-0.2867141703
+-2.372747143
+0.3733311498
+1.918926892
+0.6348964309
+2.906686336
+1.13412762
+2.619097844
+0.2665994458
+-1.932580136
+0.7195303051
+0.320556427
+0.4143471356
+1.699274161
+-1.44194128
+0.2378719669
+-1.508985328
+1.748643377
+-1.336336785
+0.6766790881
+-2.378262344
+-0.04144817561
+0.72019379
+2.164776687
+0.8781709489
+1.334631222
+-0.3859094466
+-0.09028381111
+-0.9151941707
+0.5374041531
+1.082826151
+1.120732499
+0.9268462668
+2.595612714
+-0.4618191406
+3.424354054
+0.4968553072
+-1.477366073
+0.6608633338
+-0.1156115233
+-0.06116557785
+1.882586927
+-1.196964468
+-1.960710048
+0.4140415754
+-1.310043831
+0.2640349613
+1.580043754
+-2.737807914
+1.876096797
+0.9694627076
+0.4866793834
+-2.861410395
+-2.1345644
+-1.514176287
+-0.950021052
+0.1615383402
+2.591362309
+1.060165862
+-0.8492696379
+-1.201493135
+2.753974305
+0.8280219167
+2.055522992
+-1.649722769
+0.5142214944
+-1.419379987
+-0.3040053199
+-1.245780868
+-0.2801962724
+-0.3886119437
+-2.736232847
+-2.327985116
+0.861647397
+0.2678138782
+-1.623342003
+-1.05655708
+0.925601257
+2.626473785
+1.666350567
+-0.4037846034
+0.1866216426
+-2.019944888
+0.8341054448
+0.8664161888
+-0.4001262946
+-0.9638495939
+0.1053511893
+1.180864302
+0.8389753752
+2.876107735
+-0.4183340158
+0.2810984962
+1.69109229
+-0.3153724749
+1.582810579
+1.12062347
+1.245193229
+-1.299024186
+3.211547085
+-2.91303115
+-0.3184934227
+1.890547175
+-2.30186484
+2.372468336
+-1.846401758
+-2.973646111
+2.577413714
+-1.007960105
+-1.858714188
+2.822832832
+-2.609604697
+-1.051921455
+0.294985139
+-1.277725415
+-0.9089206591
+3.20136367
+3.796215473
+2.590445439
+-1.35410174
+-0.06862649509
+0.08488154027
+0.1187330714
+0.2250565783
+0.3443060823
+0.4647485792
+2.014278238
+2.323768782
+4.147621179
+-3.103473701
+1.158585111
+-3.06027354
+-1.882510766
+3.095532453
+-0.3177733311
+-1.028249379
+-0.3215155882
+1.177151061
+1.499904291
+-2.163955434
+0.5735162288
+-1.685252372
+-0.893286987
+-1.433203591
+3.030378932
+-0.7261092744
+-2.590475717
+0.4466261199
+1.404591633
+2.599598337
+-0.437177197
+-0.7118628241
+1.86481955
+-2.345943145
+1.739798132
+0.7030625372
+1.069478927
+1.168675053
+-1.808899382
+0.4088366159
+-2.258722347
+2.145260178
+-1.164576867
+2.4756358
+0.578735538
+-2.009167348
+-2.065064719
+-1.802143586
+-1.029756328
+0.8357084798
+-4.097665518
+-1.979488777
+-0.6765883791
+3.007653006
+-0.5164179026
+-0.3091912836
+-3.311654051
+-0.1871091726
+-2.180162015
+1.556016352
+4.337907834
+1.174964294
+-2.202888431
+1.295244152
+-1.72921177
+-0.6383080044
+0.2758220234
+2.494651558
+0.210322762
+1.197315489
+0.1330469301
+1.237183145
+-0.2055030729
+2.456360584
+-2.867840154
+-1.522772729
+-2.225816373
+-1.386581557
+-1.958569688
+0.9887668121
+-1.302003492
+-0.0728260066
+-1.070131938
+-1.513861105
+0.2003897756
+-2.616501949
+-2.178228583
+-3.328037846
+-1.40055976
+-0.1518548002
+2.319819723
+-1.673007861
+3.164208825
+-0.2543596615
+0.8673122759
+0.3388169821
+1.144929685
+3.659786455
+2.837302127
+-1.955255557
+-0.8391336379
+0.8594286756
+-2.126655719
+0.7823646966
+-0.1495718778
+-1.998721536
+0.6888059967
+1.94736231
+-1.886173531
+3.205190391
+0.4752315477
+-0.2563913608
+0.7846451109
+-5.185787971
+1.550582926
+0.5298335481
+-0.9135144405
+0.6743099516
+0.8098675575
+-2.1218953
+0.1873879984
+-3.184585082
+3.627612472
+-0.2069153976
+-0.6104821697
+-2.809416006
+-0.7315004656
+-0.1945491411
+0.5502729967
+-3.117778543
+-0.7375751547
+1.493129304
+0.6559073028
+0.3001939249
+1.342555797
+-0.7960426941
+-1.600210262
+-1.107577716
+1.42662344
+1.781389718
+0.009004526504
+-1.970792337
+-0.3565578419
+1.847626303
+1.429088153
+-2.042508016
+0.4645979381
+-0.3098331094
+-0.7999867764
+-5.316774264
+-2.006857926
+2.778567571
+-0.1427034969
+0.2777762093
+-0.1935245164
+0.8062306008
+1.256298392
+1.135994512
+2.363961574
+0.9174117007
+3.407550972
+3.021255184
+0.03762957466
+-2.426427264
+-2.31907978
+-1.992088186
+0.364028619
+-2.516393413
+-0.02181254806
+2.440751139
+1.240159596
+-0.4067992452
+-0.1195592203
+-2.22433014
+0.7397597358
+0.4859766352
+-2.911373401
+0.4091915329
+0.4725951316
+-0.4173125451
+-1.637202017
+-0.544130893
+-1.09170903
+-2.582780628
+2.482584287
+2.990671631
+-0.4428563121
+1.017794227
+-3.095471956
+-1.468218238
+-0.1235695686
+-1.833400312
+3.496588787
+1.222715908
+0.2489431615
+-3.530939108
+-1.626311476
+-0.453344305
+-0.4866329058
+-1.917323669
+-0.7196514593
+-0.3573404171
+-3.709919172
+0.9656404391
+-0.4748296341
+-0.4469699019
+-1.58562359
+-0.0176007142
+-0.2276771906
+-2.322606715
+1.115949273
+-2.392829961
+2.552204536
+-1.085701331
+-1.535216452
+-4.076043037
+-1.674836177
+3.615385472
+1.345103
+-0.8287643799
+0.03811758484
+1.250834188
+-0.5640650805
+1.749753454
+-1.032604766
+-2.179731013
+0.2551476383
+-0.279053834
+-3.11502466
+0.8498236424
+-0.3215479878
+2.630478417
+-1.532456337
+-0.2838739086
+-2.288547449
+1.083880702
+-0.120730475
+0.02316033566
+-0.8520499858
+-1.738667067
+0.6642109522
+-0.446460247
+0.371836017
+0.1511198141
+0.9625122677
+0.1611081816
+-0.3763568915
+-2.62238495
+-0.1774488266
+3.025540227
+1.147416347
+-1.082007952
+0.2023549805
+1.989103961
+0.03742606263
+0.5113430112
+-1.422354467
+2.207683852
+1.499752048
+-1.380355437
+-1.232228682
+-1.750961528
+2.766797719
+-2.928518917
+-2.581148611
+-2.273975658
+-3.632673161
+-4.118614594
+-3.15469903
+-0.3618207261
+5.266004912
+-1.747706973
+0.9252984343
+1.143439563
+-1.153709815
+-0.756255757
+-0.3748864426
+0.3934398496
+0.7243064178
+-3.575708232
+2.246568789
+4.462967956
+-0.5184068618
+0.8394085521
+0.7294400566
+-0.9965766287
+1.706740868
+1.339730033
+2.914983003
+0.3734382296
+6.012103106
+0.1422854214
+-0.4309932838
+0.05864686675
+-0.1779728205
+0.248787361
+0.1290654764
+-0.4589888145
+-2.09755437
+0.3390768754
+-0.964774224
+-0.5661010351
+-2.494595273
+0.2566288138
+0.895771565
+-1.395087958
+0.3309761141
+-0.6725665559
+-0.3314530732
+-1.34967568
+-1.3214335
+-2.57148816
+0.4409181953
+-2.900354799
+-0.06729866144
+1.638737571
+-1.554710049
+2.594192312
+-1.059718656
+-0.5745036064
+-0.1726629356
+0.667837541
+0.6010192109
+1.875983874
+-0.9344281401
+3.896882824
+-0.6174898875
+-4.05451236
+0.4604561614
+0.297641515
+6.585388643
+-1.004749424
+1.873661584
+0.8447574188
+-2.429230586
+-0.7267069947
+-2.032750887
+1.632309165
+-5.284129663
+-1.99918005
+-1.368593277
+-2.75724022
+-0.2333245913
+-1.001854395
+2.609854619
+-2.340121233
+0.8546739593
+-0.9737532175
+-1.879936277
+0.3873426568
+-0.2609330496
+3.272821571
+-2.494633771
+0.9110960227
+1.574974641
+2.109757584
+2.805790574
+-0.6806307506
+-1.532485683
+1.58212163
+-1.136168304
+-3.372875554
+3.590213317
+-1.034151574
+2.770715807
+-0.9751214372
+1.907650887
+-0.8254767944
+2.509132041
+1.96227157
+5.130407764
+0.9710027832
+-3.26392553
+-3.965515281
+1.439250151
+0.6613547369
+-0.7759742909
+3.228735623
+-3.525781088
+-0.5984736322
+-0.5632106525
+-0.9826671269
+0.2124219868
+1.222087988
+0.8964581237
+1.622101414
+-0.1009850616
+-2.063571037
+1.164669917
+1.688997113
+-0.7698827504
+-2.710165888
+1.261375033
+0.6342224239
+0.01908004403
+1.713660596
+3.603971548
+-1.990478852
+6.423694943
+-0.3322025008
+3.553272991
+-0.6681786242
+-0.4570671126
+-0.1621836995
+-3.454313942
+0.886920036
+-1.409518506
+1.064983691
+0.9176829649
+1.213817723
+-2.233757145
+-0.8410580532
+-0.8164473116
+1.83183013
+0.03956534892
+-1.931909787
+-0.006277331682
+-2.218552706
+2.398793972
+-1.833866726
+-0.6501958445
+-1.310919374
+2.08060249
+-1.693682993
+-0.04022012229
+2.096645656
+2.769568378
+0.5753468855
+0.7084908625
+0.9972266
+-0.4864228907
+-0.2745219576
+1.046930521
+-2.531208223
+0.9613484179
+6.006246591
+-0.3025442611
+-1.448790497
+0.07757949835
+-0.2396372269
+1.641697205
+-2.014994374
+-1.335585834
+0.09660654132
+0.3500758775
+0.416631824
+-3.838119251
+1.953302158
+3.782636115
+0.8546877031
+-2.65718944
+-0.2938686483
+-2.712545245
+-0.7339257649
+0.3839165381
+2.765984924
+-2.129622832
+-0.541700744
+5.52205268
+1.200897994
+2.622331204
+1.953206193
+-0.2373204143
+-0.8897800641
+-2.195739811
+-0.8527006709
+-0.5480486043
+-0.2137339317
+2.176630524
+-5.962744021
+-2.309192049
+-0.06964054723
+0.5303972253
+-0.8066236181
+-1.68215536
+2.061940171
+0.8072085544
+0.3291396875
+-0.998158358
+1.654106818
+-6.252402956
+0.5489640201
+1.620266154
+1.516321977
+-1.436254398
+-2.76174172
+-1.015319991
+0.1677557559
+-1.770678327
+1.224656432
+-0.325227584
+0.5354921265
+-2.825304439
+-0.8884821902
+-2.525003233
+3.006591332
+1.22204781
+-0.9267829636
+-0.5226876649
+3.74151501
+1.352410353
+-0.7776216826
+-2.081391224
+-4.849074427
+0.9104800025
+-0.8398234254
+4.017498955
+1.277861447
+-0.6293311787
+-0.1063013822
+-0.2162617257
+-1.788473708
+-0.5440046683
+2.348832316
+-1.030422203
+-3.010418215
+-2.79452496
+-0.1023205649
+-0.0824786658
+-0.4708827298
+-2.551353876
+0.3549003804
+-0.3976973207
+1.739639134
+0.8301246829
+-2.373578832
+-2.533241327
+3.173104415
+0.1221973489
+-0.3541896157
+-1.170864009
+-0.8770695783
+0.03519241618
+2.662924986
+3.168150992
+-0.6473275224
+4.682243313
+-1.22711402
+1.849847442
+-0.4475629195
+1.782241755
+0.2903120775
+0.4896306083
+0.7552253258
+4.059398059
+1.264815309
+0.7178864307
+0.8993751487
+-0.6116912764
+2.218817071
+0.9745610529
+-0.6077016285
+-2.914634434
+-1.841047345
+1.365330291
+-0.7109458408
+0.7854778198
+-0.7621525252
+-3.412764276
+-0.320510926
+-3.233941248
+1.2325266
+4.813173178
+0.6304048278
+2.521579164
+0.6620065679
+-2.600442065
+1.105547101
+-1.529120329
+-3.206152216
+0.5652088842
+0.3768511941
+-2.210509222
+-0.05125042213
+-2.9235405
+4.613862349
+0.2028216108
+-1.177560891
+-0.09645785846
+1.520985392
+1.42521232
+-2.257766611
+0.7775245949
+-0.4351656907
+2.984806485
+-0.2407778454
+-0.8017014778
+-0.9997730598
+-1.81853619
+-2.869690546
+-2.492812465
+0.9811665077
+-0.9169754903
+-3.524884451
+-2.569751355
+0.3738469051
+3.3361247
+2.971467082
+-2.618564093
+-0.8002751799
+-1.380523186
+-0.5703684484
+1.122339598
+-0.4448969671
+0.2051806561
+-2.726494092
+-1.101006326
+1.883714057
+0.8334253024
+3.117610301
+-0.9248559771
+-0.7041096881
+1.384745287
+-2.69191836
+-2.793556209
+-2.504613865
+2.385989872
+-1.715692709
+0.4919608182
+2.369787243
+-3.335234275
+0.6438047641
+0.2851768835
+1.775605311
+2.768783217
+-4.12706127
+0.8362622827
+-3.356004608
+5.731203293
+-1.351029902
+-2.427949289
+-3.447087116
+-0.02311808175
+-2.566891714
+1.321830341
+-0.2314080932
+0.6014214261
+-1.92373478
+1.357684194
+0.8213295787
+1.538326165
+-3.720698392
+-0.5205366297
+-1.310962029
+1.630258153
+-2.208954713
+-0.05168895664
+-1.369389478
+1.486057687
+0.1855470528
+-3.621665579
+2.928470937
+4.219473927
+1.022604987
+1.84294068
+-1.592223253
+0.3115685762
+3.252981066
+3.367949329
+-0.2035554514
+-0.05400053442
+-1.112194788
+-0.6698839594
+0.8611289398
+-0.6297033997
+1.06466659
+0.9617271682
+1.273340132
+2.381746292
+2.436754723
+-0.1743541708
+0.2663412526
+0.1065283458
+-2.588959028
+-1.254191449
+2.06641729
+1.682317009
+-2.237642251
+1.821270737
+4.926988087
+2.610952835
+-1.015698208
+1.280330914
+-4.189805368
+-3.071800885
+-4.265879138
+-2.442837865
+-0.1021874682
+-1.253907538
+1.817075354
+-3.540277658
+0.254224722
+0.4050715622
+0.4387734648
+-0.28390551
+0.9425174468
+-2.243264033
+0.4697802091
+0.5321426843
+0.2442426172
+-0.06791769643
+-0.8238246745
+0.4792159991
+0.8900787111
+0.2912275842
+0.356753146
+-1.759125451
+0.1658356913
+0.4441418577
+-0.5197207564
+2.594184783
+-3.30149135
+1.223019404
+-0.6506301405
+0.2234062127
+1.495853881
+0.9143491906
+0.2015235639
+2.876707256
+-2.8003779
+-3.909440784
+-1.517713108
+0.2388524577
+1.47282027
+-1.331743007
+-0.1042222396
+0.284029682
+-2.401647616
+-0.02825758257
+0.3445635564
+2.037004916
+0.7251106082
+-0.4385621885
+1.370682372
+2.021931562
+0.1440779404
+-1.063543466
+-0.5209782944
+-0.4348612099
+1.972184653
+0.6399487
+-0.07864379709
+3.028441897
+-3.746825796
+-1.712611751
+1.478840195
+1.843996774
+-1.778187389
+-1.093263042
+1.121529963
+1.63456127
+-0.4693118499
+2.871178341
+-1.093640155
+0.2495276871
+-1.256550467
+-0.5024997442
+0.08111893698
+0.99337724
+1.438528976
+-1.024361524
+0.5573664632
+4.655430902
+3.464928266
+-0.2710112885
+1.881405873
+3.557012511
+4.130301859
+2.349976784
+0.1289307873
+0.6690461846
+-0.5518694362
+-1.807738771
+0.1475870873
+3.429040816
+-0.009892903103
+-0.9161606063
+1.787863505
+-3.121917842
+2.399521414
+-2.714223349
+0.4295503546
+1.208300635
+-0.9654057342
+0.8526261323
+0.7161078893
+4.191201404
+-0.5586843634
+-3.243918187
+-0.5405978731
+2.00517618
+1.402351407
+0.3445022609
+-0.3547701257
+1.558199004
+1.727200148
+-2.009802081
+1.264646899
+-1.527639654
+0.6158450699
+-0.6576028182
+0.7892601554
+1.756978759
+-0.2613313338
+6.189959024
+-2.829315421
+0.6662746471
+2.303823112
+-0.256721474
+-1.388285614
+0.2294231109
+-0.05487847711
+-3.458774997
+4.662554081
+3.308508751
+-3.526458627
+-3.883104876
+-2.381476546
+-0.00969870781
+0.8444838031
+0.06839531904
+3.042630392
+-0.3532108073
+0.448799292
+1.456525878
+0.2318643988
+-2.830974981
+0.6331366219
+1.756644473
+-2.31220574
+1.11452978
+3.000832007
+-1.702325871
+-1.187898657
+-2.387260302
+1.363961483
+-0.06266944809
+-0.057294175
+1.777798056
+2.003748266
+-0.2850503633
+0.5113647037
+1.530450019
+0.3262641857
+-0.4997269119
+-3.001705911
+-5.854667449
+1.321479831
+0.2654955776
+1.187447848
+0.2250926198
+-3.287507369
+3.068297348
+4.257150162
+-2.159231574
+-0.5759959164
+-4.582943611
+-1.648903501
+0.8132289936
+1.229433737
+-1.038629801
+-1.465135891
+0.9223306191
+-0.8536062438
+-2.368692464
+-0.2194271269
+-2.332572158
+2.665723982
+-2.985649966
+-0.4764596809
+-2.542282682
+-2.139270655
+1.39523287
+0.7850820682
+2.487851647
+-0.7134466546
+2.526188952
+0.196459535
+-1.157405933
+-2.591307129
+1.63779231
+0.929353161
+2.412460642
+-0.1510290035
+0.4467881012
+0.04393524256
+-0.452475182
+1.601105286
+0.5166683282
+0.02683358117
+-1.913271615
+1.221560209
+-0.6565754017
+-1.065282738
+0.7160668449
+3.342833927
+2.846146022
+-1.132696923
+-1.451640642
+1.126951041
+-0.8712641725
+-0.2091050954
+-4.642545665
+-0.4281887315
+1.086810851
+-1.074908204
+-0.7605506707
+0.5309458602
+-0.290863479
+0.7801495101
+-0.2858527481
+-0.02823609475
+-1.082584659
+1.830680039
+1.536222725
+0.2032696012
+1.618884203
+0.0009112869369
+-0.4534346995
+2.563434653
+-0.1469988065
+2.139269135
+1.584030448
+0.67941516
+1.267026327
+-0.6253798084
+0.7313649035
+0.645531946
+-0.2679480532
+0.6050741058
+-3.321322857
+0.3625478985
+-0.6307006511
+-2.014732907
+-1.496847767
+-3.433364853
+-0.3144108893
+1.723789951
+-1.991217478
+-2.316433905
+2.635259053
+-3.246600124
+0.3597905097
+1.371717803
+0.1205937138
+-1.207760423
+2.097827523
+-4.514335635
+-0.1168675468
+-0.2277721864
+0.1711101548
+-1.537748853
+-2.508265453
+-2.98058203
+0.2589907792
+0.1853663188
+-1.037636745
+-1.56945205
+-2.00858578
+-0.1414991269
+-3.073994621
+-1.762305499
+-1.808395141
+1.408053696
+2.398120569
+3.675341708
+2.653667164
+-0.3456278487
+-0.2501036881
+-3.052382753
+-3.620704338
+0.7950801571
+3.498817687
+3.447756489
+-2.656396544
+0.3816636036
+-1.710095831
+0.2872396839
+-0.6616593326
+0.2694206428
+-1.196388498
+-1.807231252
+1.689701888
+-1.196852289
+-0.7943254209
+-0.3957239423
+-2.513082912
+-0.8770349945
+-1.345106628
+-1.127834569
+0.09207398449
+-3.814008839
+0.9176788642
+-0.9923068972
+1.065736448
+0.5517611553
+2.133194857
+-0.3794163991
+-2.145167902
+1.872732254
+2.216944144
+-0.721936718
+-1.208839654
+1.461624895
+-0.579132008
+1.842934465
+2.387341002
+0.2840416808
+1.980607615
+2.049709272
+1.563965943
+-3.031170329
+-0.2409464107
+-0.5292068958
+-0.9563118589
+-2.515603496
+-1.775924063
+1.76680718
+0.7361995337
+-0.6911049844
+-0.2167059684
+1.672527213
+-1.623725874
+-1.675316856
+2.630575067
+-0.7290469375
+3.987141344
+3.169756905
+-4.209325222
+-5.10623656
+-2.485332565
+0.4039733045
+-0.6106635169
+-2.391173557
+-3.15580635
+1.699824462
+0.6551802845
+-0.003339176708
+-0.07112685864
+-0.9785031005
+3.860996436
+-0.5252894402
+1.65186461
+-1.286534023
+-1.657962171
+-0.4054691592
+-0.5157329506
+0.1416290414
+1.995689512
+0.5201614476
+1.850131231
+2.952151707
+-3.758504561
+-1.565057084
+-2.80441012
+-2.910571608
+-2.304670824
+0.1930971052
+0.5845604901
+1.773442907
+0.2264412495
+-0.05896329372
+0.556511667
+1.940866093
+-2.862525634
+-2.80446955
+-0.3892493871
+-1.070994291
+1.208553429
+-2.831423494
+-1.944634574
+2.06256599
+2.90774896
+0.4674150418
+2.616047966
+1.523537612
+1.184332405
+-2.472325998
+-1.816816291
+-1.5264373
+-1.604076692
+-2.752841953
+-3.100465425
+-0.3327868577
+1.519779099
+-0.5750926432
+-0.6816706168
+-0.8761350021
+0.2848275057
+-0.5990335492
+-4.201050947
+4.811430926
+0.676436035
+0.7264829535
+0.6266094571
+0.8487128673
+0.3656053379
+0.8087113674
+5.084669202
+-0.7582868403
+-0.2991488602
+-1.669399994
+-1.548548256
+2.429929475
+1.521233437
+0.6342154593
+-0.3344379593
+0.2460930695
+-1.06801136
+-0.12465638
+0.9987590491
+-1.222523058
+0.4559556784
+-2.526591672
+-2.154604211
+0.7214890718
+-0.5153247937
+1.56369458
+-0.9527092016
+2.610890822
+1.368624058
+0.9055389994
+-4.89440341
+1.272303119
+-1.18456219
+-0.2814882091
+-2.237298866
+-0.5424841412
+0.670643333
+1.808562744
+-4.378024587
+-0.780478598
+-2.431714739
+-2.936175695
+-0.5496097812
+1.750092812
+-2.016681232
+-0.9295699385
+-0.3731969256
+-4.17789289
+-1.120174192
+-2.697363044
+-0.7283404024
+2.358795977
+0.3994375363
+3.373068605
+-2.150460623
+1.162314417
+0.6047461383
+-1.189890771
+2.766859702
+0.6521785472
+-3.009051522
+-1.223728112
+0.3973529895
+2.189218896
+1.965590229
+-0.1361203791
+-2.091453175
+-3.493969136
+-1.191754428
+-0.7870199177
+1.563970554
+0.2631575876
+2.673139011
+2.427488275
+0.8659679868
+1.550979219
+2.406399631
+-0.9842142787
+6.039339192
+1.204911862
+0.4554619899
+1.0538252
+-0.3032910643
+-0.5177695353
+-1.049068267
+0.5434256306
+-1.774973992
+-1.792928018
+-0.3937332843
+0.1823952355
+-1.774607141
+-3.736364369
+-0.1521962984
+-1.561193711
+0.9604885268
+0.06407300693
+-1.413414411
+-0.9263099506
+-2.347087492
+1.089047889
+-2.603419948
+0.7399525633
+-0.1700042114
+-1.447404527
+-1.492918532
+0.5019114098
+-4.24938105
+3.344740518
+-1.433975793
+-1.069654203
+0.7151912249
+-0.4790777071
+3.984651714
+0.3964095516
+-2.926054459
+-1.010658185
+1.73010374
+-2.613159161
+-1.305630968
+3.402800571
+0.4403968039
+-3.235207121
+-1.171632609
+0.69234954
+3.585035196
+-1.731731468
+0.03884702224
+-0.4945579251
+-1.966031523
+-2.492034052
+-2.802377093
+-4.68077277
+-1.578500102
+-0.375755736
+-0.04821595948
+-2.474872462
+0.8889861403
+2.892991351
+-1.256147647
+0.1335274677
+1.371831492
+3.705413938
+3.163382451
+0.1887756841
+-1.333591062
+1.332089705
+1.064077533
+-2.101615598
+-1.057837089
+-3.957987583
+-0.1873012005
+-1.107416314
+0.3155239091
+0.7428729005
+0.907281364
+2.272427405
+0.8255115711
+0.1492136311
+2.945853204
+-0.1043789173
+-0.6668029357
+-0.4499459103
+-1.035858047
+-2.093269609
+1.969731672
+-0.1988875265
+3.483737758
+2.262694416
+3.126133983
+-2.120415191
+3.333861024
+-2.957959922
+-3.81154098
+0.7105463256
+-1.489448796
+0.261351864
+1.857473697
+-0.2185080984
+0.7158614403
+0.124108923
+1.868258882
+-2.643482493
+-0.3775693887
+1.09000515
+2.38922667
+0.2310959534
+-0.03133630519
+0.163637389
+0.6256348457
+-1.035159393
+-1.898661804
+-1.001838627
+0.7163895823
+-1.383329549
+1.417215158
+2.423324546
+-1.167941768
+-0.2046537365
+-0.8063226092
+-0.1551394902
+-0.2232518455
+1.114245502
+1.307244016
+0.2350307757
+-2.453190964
+0.5691771841
+-0.6683883643
+-1.806945757
+0.7632135001
+-0.1041591647
+2.718059304
+0.4803955366
+-1.020680744
+2.807977676
+2.019802207
+-0.9364094385
+-0.380629789
+0.4551422404
+0.659341591
+2.627869606
+0.7090493916
+3.351363572
+-0.9197910444
+0.1937391737
+1.80241662
+-1.225865875
+1.12151747
+3.514112946
+1.369959293
+-0.3737564463
+-0.8205947152
+-2.888747911
+-0.1045169945
+4.490039638
+0.3597232768
+1.509725054
+2.37120924
+0.5686737168
+-0.8214813
+0.872869026
+2.51817959
+-0.612850676
+1.409572423
+0.9611701057
+-0.3451362461
+-2.112776076
+2.041679641
+1.853550595
+0.3783511056
+-0.7644041254
+-2.963491926
+2.475906031
+-3.152495467
+-1.764212376
+3.446543227
+-1.130962601
+-0.1320529975
+-2.336370182
+-1.325691661
+1.544497166
+0.5214456855
+4.404595951
+-1.537633075
+0.006747047577
+-0.2346523342
+-1.827369943
+0.6535061156
+-0.2882084412
+-2.444832683
+1.766968711
+-1.317687775
+-0.4496090298
+-1.627172752
+-2.24744215
+-2.131067577
+0.9238203231
+-1.500786422
+0.6954738912
+0.5311420137
+1.655667792
+-2.573962524
+0.6376513229
+-1.712516344
+1.562789561
+1.23091143
+1.31514169
+0.3594075244
+-4.556758722
+-2.798972568
+1.527443266
+-1.204476106
+2.114692013
+-2.483425435
+1.68886769
+0.8381950639
+1.081698107
+0.2853701591
+-1.986355443
+-0.7589413915
+1.190794481
+-1.78227839
+2.509801693
+2.141881238
+2.736235987
+1.508084072
+-2.723579657
+0.4297797015
+1.533339318
+-1.144293397
+-1.865208412
+-2.692637759
+-2.116708081
+0.6164392335
+0.2526117873
+2.949309857
+0.03973127672
+-0.3066806737
+1.085450034
+-1.796486113
+2.145668347
+1.842401539
+-2.091965338
+0.4797696256
+-0.4799744735
+0.403053116
+2.190747486
+-1.528291446
+-2.118162841
+1.941954455
+-5.449097528
+0.05268575544
+0.06227130457
+-0.3574186601
+0.8389986277
+-1.736777062
+0.9494121804
+-0.9953852508
+-1.226361129
+-1.798616309
+-1.390274519
+0.5097159856
+4.925563232
+2.576045187
+2.732702185
+-4.168280146
+2.109080484
+-1.316892181
+1.403341459
+-2.968419779
+1.403668433
+-1.473405226
+-2.270736622
+1.606853225
+3.894276706
+0.5636304184
+1.23269343
+3.380217957
+-3.519366389
+-0.1880574101
+-3.071247655
+-0.9641279608
+-0.5627944338
+3.825882738
+0.357939779
+0.5396778293
+-0.9512565975
+-0.1164885576
+1.22080535
+-0.3075303086
+-0.6143153601
+0.00628405068
+-2.365047705
+-3.689244547
+-2.63398318
+0.2958680213
+-1.307938168
+-0.732169182
+-1.154517001
+-1.170140356
+-0.5848335999
+-3.69706067
+-0.2978676362
+-1.50254445
+-1.430601979
+2.155683149
+1.246347456
+-3.393675781
+-1.703398026
+-1.845050868
+1.846648193
+-0.7900088611
+1.419870793
+-0.0858683645
+-1.299279169
+-0.637075026
+-3.744181734
+0.1442542714
+0.5824114871
+-0.5566966038
+1.209909952
+1.341218542
+1.456795315
+2.67185798
+-1.745500749
+-0.3640958794
+-0.5532977208
+1.077097377
+-2.484382017
+-1.297867405
+-1.788339252
+0.2029358659
+-0.1041987084
+-1.221208276
+-5.959491251
+-1.378474916
+-4.413837364
+-0.8655791988
+-1.354959643
+0.332509637
+-0.2748888376
+-1.553257733
+0.8047593615
+-3.676922904
+-1.467553884
+-4.020960014
+-1.737844994
+-0.09905305792
+-2.688465741
+0.1204677553
+-3.537669193
+-1.680609
+-2.023060538
+3.807060797
+-2.568795495
+-0.9797784873
+1.51634436
+2.294431547
+-2.737709929
+1.216161728
+-1.06018962
+-1.21890976
+2.124824921
+-0.08029963623
+-0.5528421357
+3.155118696
+0.5273640792
+2.534082344
+2.369496207
+1.200961624
+1.325521157
+-1.926242788
+-0.1303671386
+0.7930737747
+2.449459561
+-3.193323489
+-1.832304163
+4.113787707
+0.3608394283
+-0.133418498
+-0.05670795957
+0.9696095022
+1.634602482
+1.790611516
+-1.525032534
+2.875188717
+2.394872024
+-1.329756671
+0.982266288
+0.872357452
+4.967250956
+2.501749989
+-1.730449445
+-2.304765756
+-5.063529345
+1.353602264
+-1.647098867
+-0.003309721546
+-0.5853160674
+-3.426671297
+0.5550257379
+-0.9368241446
+-2.042474784
+0.6222155395
+-1.108742799
+-1.055410158
+0.186868046
+0.1107275806
+0.3679201547
+2.148871137
+-1.617780536
+0.03541791778
+-2.110750848
+0.1074510573
+1.784009466
+-0.2873660165
+1.085772968
+5.230361378
+1.81784421
+-1.340214887
+0.2925979672
+-0.8355001746
+-0.6143491222
+0.5406363495
+0.01229092448
+-0.08282502453
+2.504095679
+-1.170674467
+0.03673488053
+-0.7765033464
+2.203227409
+3.774844702
+-1.30007317
+2.902111892
+0.4012435272
+0.2150503071
+0.8220090521
+0.4402540383
+-1.911686725
+-0.1458215066
+-0.4401107768
+-0.3911759549
+-0.7776656231
+-0.2984532703
+0.412981693
+-0.9814428321
+2.676104864
+2.066697458
+-0.784886948
+0.5523765098
+-0.1000028031
+0.5566873543
+-0.4417690501
+0.81521827
+-3.373676572
+-2.264598991
+-0.8983975433
+-3.257119634
+-0.1495027593
+-1.980034405
+-1.004220757
+-0.03380071414
+1.323489577
+1.043874635
+0.1421839658
+-0.206663672
+-0.2483663885
+1.010144622
+3.493064794
+-1.876951084
+-0.4100364129
+-2.881693303
+4.131991586
+-2.435291791
+2.08738228
+-3.273599838
+-1.662345609
+0.07678620099
+-2.865546223
+3.300442718
+-0.1914134223
+4.445737453
+0.6153650997
+-3.448644445
+-3.390397878
+0.556605348
+1.876602422
+-1.748205899
+-2.292416313
+-1.291538334
+-1.641746218
+2.287258526
+2.825158836
+0.5608391598
+-3.364500367
+-0.8484720275
+1.32106471
+-0.06627723971
+-0.07687499023
+-1.623313465
+0.3483662283
+2.955674642
+-0.4385770793
+-1.122902398
+-1.765050154
+-2.468502397
+2.270783835
+1.707377964
+1.323904327
+0.3880855594
+2.503970653
+2.908070764
+-2.975382296
+-1.057255477
+-1.122724001
+0.9188386965
+0.9229700934
+-1.683111594
+-4.809513015
+-2.988910278
+-4.409457084
+-1.420939873
+-1.373008267
+0.97437114
+1.940665401
+0.03833016081
+0.06111486841
+4.252078341
+0.7650807599
+0.2035526723
+2.487539303
+0.1683751866
+0.05204927643
+-0.7926123594
+0.414232271
+-0.9765198793
+-0.2337088558
+-1.85732345
+2.212252101
+-0.4908363622
+-0.1270892041
+-2.658131479
+-0.5256091966
+2.96808476
+1.170568625
+-1.358488774
+-0.8165725562
+-0.6850613023
+-1.062119643
+-0.5051590327
+2.47875714
+-1.232331444
+-1.748774897
+-2.28376387
+-1.157725761
+4.707548644
+2.678319615
+1.417271598
+2.026662599
+-1.280592997
+-0.9504447413
+2.496676584
+-0.0824453934
+-0.6988509414
+2.573894217
+-2.652381539
+2.185250736
+0.7667104601
+-1.381728422
+-0.1442874198
+0.9458957593
+-0.9290372336
+1.630337422
+-1.490019654
+0.7170869576
+-2.645001508
+-1.072493569
+0.1113478848
+-1.021296145
+-2.840435172
+2.331879951
+1.488575675
+-1.290645799
+0.9467031139
+-2.06890078
+3.558794866
+-1.494065118
+3.533484611
+2.05512535
+0.1044086037
+-3.9479341
+-2.222808839
+-0.6492195993
+-0.7012071994
+-0.742153787
+-3.803517227
+4.118430745
+0.3371278896
+0.08555374906
+-2.708995608
+1.054877103
+-1.633247062
+-1.266324578
+-0.03554974554
+3.075201982
+3.168069831
+-3.014667286
+0.1331525643
+0.7559227098
+1.804315964
+0.03575064646
+-0.2121228055
+1.899550592
+2.291147227
+2.352443136
+-1.67572822
+-1.012986326
+-1.001069578
+0.148445282
+1.084795591
+1.34396786
+0.7910559757
+0.3858374938
+-0.08336476607
+1.164613128
+0.8150016478
+1.868880711
+3.231372239
+-0.8061339462
+-1.082959803
+0.7413628329
+-0.828673764
+2.449005865
+-3.522468169
+0.04416847252
+0.1927323395
+-1.868692032
+-4.061053543
+-1.272321361
+-0.8390231389
+1.42321028
+1.221280034
+-0.5288545786
+0.8423880568
+-2.221494572
+-1.300154318
+-0.3113179917
+3.695459807
+-2.915187993
+0.9089001771
+1.072293846
+-3.664914655
+0.08579997192
+1.13460132
+-0.7624579975
+0.3172116518
+-1.486415326
+-4.600717503
+-6.035756641
+-0.8385057387
+0.7346997429
+-0.755906476
+0.739341969
+1.533496693
+2.264693826
+0.3427381354
+3.984061902
+2.074225714
+1.594520378
+-3.06964027
+-0.4480759345
+-1.442329507
+2.478240051
+-1.050239703
+0.7344642088
+-0.5747727306
+0.2166109463
+-0.7210496177
+0.1425579607
+1.959920809
+1.324848276
+-3.563571916
+-2.169689717
+1.100852945
+-0.8333350868
+3.225320529
+-0.4098487259
+-2.042218913
+0.6910304178
+-1.063475101
+-1.475412945
+-0.8377346882
+1.704251614
+0.5639092384
+1.690128111
+-2.056011027
+1.951040928
+-0.1259386682
+-1.234054577
+-2.782850045
+2.374821334
+0.2734827033
+0.892039272
+-2.522293375
+0.0772509996
+-1.928473709
+0.8290272134
+-0.3504437984
+-5.150835287
+-3.308049966
+-0.06985516637
+0.08979180626
+-0.8037964526
+-1.436019158
+-0.1588542997
+-2.038738061
+0.0932177358
+2.073801532
+-0.8311866397
+-1.244989612
+0.4727541091
+4.069673238
+-2.631014127
+2.805511801
+1.464659608
+2.466989748
+2.731824054
+-0.1616821801
+1.065798484
+-0.1763376272
+-3.661836981
+-1.086910232
+1.247848553
+1.649646276
+-1.073104182
+-2.483107967
+1.48765479
+2.251633502
+0.3239950496
+0.4342936759
+-0.189041169
+-1.541072481
+-0.5305084876
+0.7928841331
+-2.048966039
+2.974082145
+-0.319035368
+-5.044096826
+1.677698493
+-2.463447021
+-1.912481147
+-1.316264657
+-0.4108019684
+0.1729414037
+-3.093530276
+-0.03342002111
+0.1950416335
+-3.24500949
+-1.3063731
+2.220757994
+0.3561962402
+2.825104066
+1.331829476
+1.564362963
+-4.123478436
+1.725580465
+-0.7757168883
+-0.330552302
+0.02842031107
+0.09512477961
+1.761759878
+0.1861463491
+3.970715719
+0.4150695341
+0.09847057007
+3.610279307
+-1.061439553
+-2.367398985
+4.648210679
+-0.7387839732
+-0.07123088568
+3.44157738
+-0.043829543
+-2.165835953
+-3.153401462
+-0.2818447865
+2.695573279
+-0.3069862002
+-2.345716374
+-1.428960057
+-0.4482505974
+0.7080075968
+-0.2306270528
+-1.853070481
+0.3370504042
+-1.295467573
+-1.127674391
+0.2099759836
+-0.1683441927
+-1.012229889
+-2.4753445
+-2.460422938
+-0.4836859063
+-0.09512411895
+0.694110916
+-1.581489935
+0.1659573886
+-1.930493302
+-1.790706083
+1.512258035
+0.987440349
+-0.719329642
+1.851336647
+2.365606764
+-2.221794082
+1.227991382
+2.776457637
+-0.5036003733
+-1.51278223
+-1.870446305
+1.878465784
+1.092094968
+1.920749194
+-1.897711234
+-0.9962452694
+-0.8053975084
+1.184091791
+0.01811305449
+-1.772643649
+0.09819961342
+-0.3562941441
+0.5601355012
+-1.941538286
+2.777553772
+-1.215451291
+-0.4485398885
+3.865961043
+-1.7827673
+0.03755566913
+2.603089647
+2.743736555
+1.095600658
+-2.099157783
+-4.341780819
+2.638490277
+-1.805396541
+-2.802302934
+4.088302173
+-4.046634716
+-0.016135899
+-3.243513473
+0.8858065528
+0.09467164117
+1.827160535
+-0.09125499635
+0.05762864975
+-1.113228412
+-0.3204251438
+1.578887702
+-4.687174305
+-1.787392134
+-1.264921743
+2.974780477
+-1.471054568
+0.03705109148
+0.5821177286
+3.617665233
+-2.434500272
+-2.950100515
+-1.055312793
+4.07050883
+0.9159803536
+0.106213478
+0.3763358047
+-1.625248175
+-2.162094066
+1.368232681
+2.834158548
+0.8874574577
+-0.153945411
+-2.183068717
+-0.8749136204
+3.348020626
+-5.848306284
+3.365060506
+-0.2942261519
+-0.7357184446
+0.2747497686
+-0.4402142865
+-5.002847824
+-1.207642443
+1.452712416
+2.412529003
+-2.075705613
+-0.491716974
+-2.779306482
+-0.1572620335
+1.959025526
+-0.4142648096
+-0.9894535276
+-3.345046165
+0.4300032209
+-1.344620364
+-0.4337087755
+-1.800633677
+-2.495554071
+-0.3543689388
+-1.318151618
+2.39559112
+-3.187476453
+-1.585026675
+-1.24429336
+-3.31952218
+0.870089456
+-5.147672196
+-1.249713713
+0.672449419
+2.147172883
+-2.970543655
+-0.5892910914
+-0.6223713049
+2.559172462
+2.901934118
+-1.817542579
+-1.750112159
+-1.290776396
+-5.1294987
+0.4874989323
+1.146954673
+2.205468503
+-1.49514288
+4.190673872
+-2.687946201
+-2.594799197
+2.319223403
+-1.900753493
+0.002995792938
+0.3653941826
+0.3769299943
+0.7951910287
+-1.329162229
+-0.2666628167
+-5.683102243
+0.8361929754
+-5.552874506
+0.5316145829
+0.4551175936
+2.802310655
+3.111022191
+1.685764963
+1.805794767
+0.6424600278
+-1.199388056
+-2.048483984
+-1.231607646
+3.385413486
+0.5375082566
+-0.7990000663
+-0.6011467227
+0.4432747293
+-0.4409781625
+1.380552629
+-2.833998723
+-1.63037277
+-3.980960364
+0.8847945117
+1.341360224
+1.437052975
+-0.5945547992
+2.221752854
+-1.635400097
+-1.150973319
+2.395514444
+-5.2562989
+3.173480868
+2.83220857
+1.534337617
+0.3316761088
+1.630145217
+-3.255465583
+0.6006376205
+2.667357957
+1.658592442
+-0.9697861749
+0.3236517554
+-1.169956358
+-1.393456782
+-2.294103283
+1.439260939
+-1.87913867
+-2.497045825
+1.954515955
+-1.949938946
+-1.838909822
+0.3105298291
+-2.681592327
+2.114060141
+-0.1557382773
+3.407659899
+-0.5478415249
+-0.620495108
+-3.509780949
+0.8382943382
+2.565186225
+-1.059333276
+2.058917674
+0.3055413541
+-1.716086689
+0.9321306121
+0.5421064717
+-1.514678637
+3.417163845
+0.518706587
+0.5454630442
+0.06101926238
+1.308636333
+1.435283204
+-0.5450012014
+2.329263567
+-0.3772375062
+1.309672443
+1.4969712
+3.119228775
+-2.521768834
+-1.260832091
+1.264235431
+0.5824309101
+-1.662528202
+-0.4181817638
+-1.410243317
+-3.114318678
+3.48016663
+-2.349407645
+-0.7450023853
+-0.7275957529
+0.9704928873
+-3.335823949
+-0.8184904241
+0.974923983
+-0.1370253335
+-0.4697612291
+0.3656698149
+2.050692219
+-0.7904737515
+-2.153488198
+-0.9061881326
+-1.009350849
+-0.9818743043
+-0.7667270686
+-3.650998406
+-2.204486047
+0.7138519931
+-0.4487444527
+-3.577036954
+1.964443442
+-2.805078857
+1.642681407
+0.7739544624
+-2.372196642
+-2.410565692
+-0.3066751761
+3.662950995
+1.630853213
+-2.144837391
+1.676857355
+-4.199966785
+0.4873621292
+-0.06982501559
+1.586522691
+2.222083696
+4.994959623
+-5.676395887
+-2.121024872
+2.117814157
+1.917121264
+1.64952362
+-5.046058
+3.134499884
+-0.4053701395
+4.06176132
+-0.1275224523
+1.064858655
+1.93003229
+-0.7123294306
+-4.488321548
+1.144266108
+-0.08412640585
+1.666760572
+-0.2589598061
+0.4364046507
+0.7250917077
+-0.6801805713
+-2.707514263
+-2.590418834
+1.544756683
+-0.1296812602
+-2.480153863
+3.365589357
+2.280315217
+-3.05179392
+1.631852527
+-2.391850103
+-3.101183833
+-1.206800876
+-1.216670802
+-2.143011346
+-0.2389274136
+0.02805212425
+-1.992922419
+-0.2345425085
+-1.087890526
+-3.399109907
+-0.001725017905
+-1.995768422
+0.7192253845
+-1.405259426
+-1.064893333
+-1.520105827
+-2.646410592
+-1.068105108
+-4.328857723
+0.8134519051
+-3.281066328
+-0.6975867991
+2.321849104
+0.5808210015
+-0.2938600668
+-3.069407283
+0.5712410578
+0.02685263592
+-4.354389916
+2.009159204
+1.74930788
+2.231523977
+-0.181483381
+2.950646436
+1.013571202
+-1.438379584
+-0.7151769175
+-0.2177800313
+-0.9157318144
+3.382129542
+-0.7024423245
+-0.6954673827
+-0.003234072472
+3.20226136
+1.624870804
+0.3207914756
+-0.7200874744
+-0.4974577126
+-1.154733215
+1.659615313
+-0.9792963999
+-1.439575556
+-0.1221493631
+-0.6749112047
+-3.127147506
+-1.221089954
+1.034545014
+-2.462185711
+1.277103998
+0.4772799841
+3.052982361
+1.165248219
+-1.359866878
+-1.069257981
+-0.4073950425
+-1.487861811
+0.8294930519
+0.01561546239
+-2.087196934
+-2.419461824
+-0.6531711438
+-1.745164004
+3.522189504
+-1.942869929
+3.069970606
+0.5628173574
+2.475944472
+0.9437674416
+2.335255945
+-2.560800382
+-3.155302136
+0.874540299
+-2.206695099
+1.295146127
+0.8947413841
+-0.2935412562
+1.558914161
+-1.360652468
+1.924503598
+-1.717445022
+2.43499915
+0.5794008548
+-5.196393236
+-3.083620634
+0.1639393172
+3.174649729
+-1.469880669
+1.458152126
+1.853963778
+1.416150172
+-2.515442229
+2.354042209
+-3.840761316
+1.409585619
+-2.187390008
+-0.5659326111
+1.37754578
+2.500532427
+0.3696405005
+0.8527338122
+0.03640533314
+-3.158417943
+-0.7855960988
+1.755858416
+-0.8039018863
+0.9381400272
+-3.003215526
+0.7393719668
+-1.819462549
+1.460453849
+-1.561676177
+1.142087362
+-1.396433737
+3.736620938
+0.107257833
+5.468436445
+1.993067494
+-2.746567017
+1.055857099
+-3.189307906
+1.022964921
+-0.01861882756
+-3.823213919
+1.159173191
+-2.647487358
+-1.829403929
+-1.167896584
+-0.2937520222
+1.825011899
+-0.2427127495
+1.260603409
+-0.8697805395
+2.086213106
+-0.6923060528
+2.145063133
+1.875369562
+-1.267656128
+-3.572578525
+-1.671338251
+0.9263966449
+-2.748350908
+-0.3025077745
+0.9181880195
+-1.506923884
+-1.608341754
+-0.3597127219
+-0.5587519064
+2.699302061
+1.823569687
+1.256885196
+-0.2362696797
+1.045577787
+-1.614281225
+-2.88555018
+-1.050202721
+-0.9424166965
+-0.8657628587
+-0.1250160753
+0.5402614269
+-2.479052995
+3.963900918
+1.177915735
+1.416503212
+0.2708639826
+-0.8684415058
+1.67011064
+-3.076086505
+4.403015081
+-2.584028109
+3.300751348
+0.8741730347
+-1.384482504
+-3.665474236
+-0.2351233662
+0.03780937662
+-0.2141862337
+-3.530595509
+1.142699164
+-1.666493376
+0.6155069258
+-1.090352589
+1.086442925
+1.886217973
+0.4662631694
+0.9191087412
+1.210749247
+-1.048327377
+1.326791181
+-1.02737365
+0.7390873451
+5.189923773
+-3.701165699
+2.747355604
+-0.5944762251
+-3.445154781
+0.6538482988
+-1.978097725
+3.909904239
+1.05856493
+1.286414284
+0.4195396027
+-0.6276316263
+0.02207467642
+-1.673708525
+1.267796281
+4.345071481
+-2.619213281
+1.115333095
+-1.605353429
+-0.00498305712
+1.440226388
+2.385646051
+0.4542463556
+-0.01246193402
+-4.735339692
+-0.4804906619
+-1.144078672
+1.669249984
+0.3877259407
+1.364027433
+-0.227765448
+0.1984493234
+1.264620567
+-3.686737628
+-0.494263263
+1.723328885
+1.273459671
+1.307847231
+1.108808941
+-0.6355068914
+-1.528665722
+1.180159526
+1.582625073
+1.515467583
+1.557179975
+-2.088079301
+-1.326732044
+3.002599565
+-0.0183255409
+1.512042353
+1.795107546
+-1.947235907
+-0.4553870073
+1.994787901
+-0.6669170032
+-1.617662543
+-0.7034600775
+4.697721666
+1.370874336
+0.6128367617
+-0.8783409322
+5.259357588
+0.4769946169
+-1.864726046
+-0.2803892251
+-1.74401738
+1.415541637
+-0.627397849
+-0.1865232035
+1.29205468
+-0.9139163976
+3.444494635
+0.4973443896
+-1.189563754
+-1.144891252
+-2.585602302
+0.7037133971
+-0.5536886198
+0.3489753802
+1.543162708
+-0.6310445046
+-1.202400259
+-0.1557843521
+1.309505167
+-3.053760625
+-1.739776474
+-0.4331621895
+2.296804172
+1.208729987
+-1.484079163
+-0.08931474063
+-2.7674015
+1.194620575
+-2.403446476
+-0.9385118055
+2.199392446
+0.9687632683
+0.7849859219
+1.035475609
+4.263455891
+3.559507859
+3.604642187
+1.080546956
+3.298496272
+-2.399656569
+-2.276764795
+-2.708844211
+2.102255482
+-0.7327774668
+-0.1332269001
+-3.425203652
+-0.3126295489
+-3.370258826
+-3.320437607
+-2.671117754
+-0.432954652
+2.71774242
+-1.549942089
+-1.194349353
+-3.026863831
+1.231943703
+-2.048097499
+0.8799575101
+-0.5876369467
+2.764800722
+1.812679815
+3.487955458
+-1.604650985
+1.573618526
+0.0009161892673
+0.889394435
+2.747394138
+-0.6639617321
+3.380769938
+-1.622899842
+3.414046681
+0.7190993553
+-0.233213522
+1.292793866
+5.103079832
+-1.815312384
+-0.3555648067
+-4.39152403
+-3.996327031
+0.8669175249
+-1.503973043
+-2.020922739
+-1.505682464
+-0.5177282953
+-2.474395734
+-0.1397783386
+0.4424976697
+0.8256286438
+1.089673462
+-0.7118841713
+0.3979912212
+-1.402770385
+-1.355031479
+-0.9348756374
+2.035162992
+-1.884638351
+-2.928985099
+2.023842127
+-1.07581257
+4.758092824
+-1.553246081
+-0.4973477644
+-3.470537632
+-0.09805110492
+0.7645868074
+1.472432762
+1.552664091
+-0.3055892016
+2.497129085
+0.4479950696
+1.23007908
+0.259127673
+0.192166207
+-0.2842208871
+1.226671689
+1.671307521
+1.548439512
+0.352449961
+0.3407408243
+-0.6515305077
+1.094238167
+-3.091964421
+-3.020926779
+-0.680939606
+2.203967906
+1.650572602
+-0.4554307987
+-0.8602414188
+-0.1377755241
+1.600464023
+2.858447159
+0.869084575
+-2.884142798
+0.3213750769
+0.6471524323
+0.2822764721
+0.2715307026
+-0.8445867781
+-2.169477972
+3.604619583
+-2.733414524
+3.155782757
+-0.02637528054
+0.6381370737
+1.690054726
+2.328392339
+-1.432474496
+0.7877617918
+-0.6439081655
+-3.447966362
+-2.370078223
+-0.5348151305
+2.360820756
+-1.946482051
+0.3060695399
+-1.026322678
+1.163604325
+-0.3593039623
+-0.7685611382
+0.9374136769
+-0.6160713903
+1.292092214
+-3.976243768
+-3.468357288
+0.08113698699
+-2.511510675
+2.391950427
+-0.5614297698
+-2.210916826
+-1.998842684
+2.746381352
+1.049765703
+2.373392953
+-1.722671191
+-0.5092137615
+-0.9599210988
+-3.793939194
+0.407364649
+0.05476347475
+-3.833857628
+-1.981628772
+0.3566909237
+0.9990657756
+-0.7271395778
+-0.09004937796
+3.340345323
+-0.2026496642
+2.087085344
+-1.739393108
+-2.326417322
+0.3663342178
+1.291465775
+0.4013279146
+3.152832654
+2.869671801
+0.973516517
+0.1996070692
+0.4244469671
+-0.1372052109
+-0.4527217307
+0.7032807006
+1.548517357
+-0.7375170378
+-3.047797002
+-3.017176582
+0.555446933
+-0.7336001628
+0.2456614329
+-1.789289719
+-1.149794619
+-0.1104875786
+0.2612860488
+0.8813821239
+4.834918564
+-1.942800955
+-1.038233721
+-1.037708887
+2.635620156
+0.2083961728
+2.492747915
+-0.1580857458
+1.23734067
+2.572902704
+-1.630408776
+0.9834018201
+-2.213559797
+0.1855277575
+-0.3622568121
+-0.9395685255
+0.7001149338
+0.6588372234
+0.3895721808
+1.793341684
+3.87621786
+-1.839010298
+1.452191564
+1.732570757
+-1.029154046
+0.3514401043
+-1.647786246
+0.2113134251
+-0.2749318301
+-2.572364648
+1.169819332
+3.729240748
+-3.364153658
+-1.966807384
+2.761549032
+-2.487191894
+-3.226179953
+-1.477794761
+4.44852606
+-0.8308588374
+-3.496146189
+-0.4498726523
+-1.598640637
+1.29207954
+0.3532092386
+-3.287447713
+-0.02211019413
+-2.895280607
+-0.5608833883
+2.523465451
+-0.4711553852
+-3.374600213
+1.624372583
+-3.254459098
+1.525381297
+0.2828265386
+-1.982155302
+1.792600565
+2.97917354
+-1.503850047
+-0.2280413964
+-0.4794762292
+3.66351773
+1.942123881
+-4.277911203
+-2.276274273
+-1.506885111
+-2.469994352
+-1.967747892
+1.573858058
+1.478712363
+-1.802163046
+-0.2367766406
+-3.038759132
+2.046812571
+0.9859453604
+-1.196645308
+-1.70932435
+-1.985697424
+1.716175866
+1.71329923
+0.6396547236
+-0.4861685641
+0.5058426558
+-0.9584323798
+-2.97298999
+2.911064503
+2.661260613
+2.400047919
+-2.511296506
+0.9444336951
+1.477152772
+-0.7577870772
+-0.9475078956
+1.944414305
+-1.837900953
+1.326480992
+-0.2669827993
+-3.132740673
+-3.497302886
+-2.245183875
+1.597101622
+-0.1761862699
+-0.4356524967
+0.7351863473
+-4.327355952
+3.153674421
+0.06658230021
+-1.230230588
+1.480805554
+1.452164758
+-1.662893374
+1.311711122
+-0.6055523104
+-2.771051157
+0.1679362607
+-1.782855616
+-3.136057299
+-1.265622398
+-0.2386502564
+0.5665006508
+0.4182277824
+0.153008053
+2.141491763
+2.26262173
+1.247014927
+2.356918846
+-2.872666246
+-0.9810410666
+0.2496537077
+0.7823368611
+0.4198955782
+-2.998178329
+1.082597849
+-2.342155649
+2.437459339
+1.398231978
+2.537358306
+0.1968515009
+0.2050540653
+3.204752629
+0.6595761627
+-1.863450796
+-2.555451827
+3.145871441
+1.452310983
+-5.49133081
+4.538025649
+-0.8100294962
+3.56173762
+3.803375904
+-0.643714011
+-0.4087360186
+0.2979531236
+-2.918766542
+-3.003481172
+-1.734071421
+0.425247522
+2.670211705
+3.262551773
+3.260889029
+-0.8761885032
+-2.730182703
+-2.902354189
+2.063206139
+1.628579793
+-3.219034368
+1.466116206
+-0.7624040517
+1.154437426
+-2.084782814
+-3.454643825
+-0.1137110659
+2.451322036
+3.201653787
+0.8413040403
+-1.144947443
+-0.5306883358
+1.140887397
+-0.5257053174
+-1.543692731
+-0.2554903131
+2.364086062
+0.9449601747
+2.92133856
+0.09830058457
+0.8191882389
+-1.060988406
+2.601433824
+-3.390562498
+-0.7513380853
+0.6968049128
+-3.237000324
+-0.3842019428
+0.141695193
+4.87145701
+1.943362395
+-1.865924416
+5.730407081
+-3.584095987
+1.089868773
+4.898898336
+0.03416695854
+-2.792176165
+1.182598728
+1.58164678
+-0.4202390519
+2.181672113
+1.821859155
+0.210703654
+1.854701074
+1.786041042
+1.075607609
+-1.380721913
+-2.375706016
+-0.9883744927
+2.354131503
+2.116523562
+1.022084106
+1.03760363
+2.723106683
+-0.4276476461
+0.8977082577
+2.929411309
+-0.7671030493
+1.455291964
+2.387912017
+0.4245293064
+-2.025813174
+-1.130631688
+0.2611317865
+0.547813552
+1.482599631
+0.1231336641
+-0.9337506167
+5.098224684
+2.198313462
+1.380627427
+1.349598635
+-0.9879178327
+-3.600306549
+-0.408605336
+0.007073739685
+-0.01146664014
+2.122527647
+-2.925288526
+0.8631957727
+-1.24560205
+2.480954111
+0.3408925708
+3.973796516
+0.2226023322
+2.419310067
+-0.9146595369
+1.846366987
+2.65103763
+-1.906332731
+-1.356259593
+0.6681991978
+-1.509856483
+-0.7767650331
+-1.253151306
+-2.612842329
+-0.07699170314
+0.2871347748
+-1.578147299
+-0.1970074016
+-2.905732825
+-1.895731929
+-1.739157385
+-0.6110345502
+-1.210294706
+0.4496410755
+-2.076944854
+1.543638337
+-0.960018589
+3.669490197
+-0.2175308504
+0.9089499816
+0.1974186989
+-0.9166108914
+-1.714088055
+-1.548805895
+1.417574656
+0.03694720406
+-0.2081611545
+-0.4697154761
+-0.5018127025
+-1.925500499
+0.9868103076
+4.266100098
+1.967776587
+-3.61856338
+0.08471762835
+1.033744358
+-0.0658413861
+2.596222864
+-0.4042340543
+-1.666462001
+3.467200495
+0.3812980082
+-0.3556207873
+-2.170050238
+1.944524666
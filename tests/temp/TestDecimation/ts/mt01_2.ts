@@ -0,0 +1,10008 @@
+# mt01 ex 100.0 1234567890.0 10007 mV -30.5 140.25 10.0 
+5.292157038
+1.200471625
+2.936213952
+6.722679598
+5.60267397
+-2.93183364
+2.850265253
+-0.4540716249
+-0.3096565554
+1.231795506
+0.4321307135
+4.362820521
+2.283113175
+0.3650250495
+1.331589698
+1.001022982
+4.482237219
+-0.6154747913
+0.939203105
+-2.562287218
+-7.658969448
+1.960855786
+2.593308597
+-2.226495061
+6.809263872
+-4.363097024
+0.1372755519
+-0.5615515501
+4.598337643
+4.40807631
+0.4648422771
+1.134487559
+-2.663357243
+-5.942389405
+-1.043736448
+0.4690469073
+3.690872042
+3.607139546
+-1.161980452
+-0.9069082517
+-3.145658895
+-4.260053812
+-5.118810572
+5.852326186
+-1.528956545
+-1.314222905
+-3.75838608
+2.332471067
+-4.841693543
+-0.6382208406
+-2.686399684
+1.160707494
+-1.532415413
+-3.541896552
+-0.08454668502
+1.284995612
+0.1995516671
+0.9074156932
+-1.902966281
+-1.088223498
+-2.017381343
+-1.078659485
+-2.439438846
+-5.178847807
+0.5322784268
+-1.205342809
+-4.890595041
+1.388346767
+-2.721895093
+0.1558361874
+2.187271687
+0.3869487323
+3.418202054
+-3.704477461
+1.207024924
+-2.054430273
+-2.612391448
+-1.736548994
+-0.9346575964
+0.1684960267
+-3.495449522
+2.702479461
+1.396987319
+-4.608731059
+4.464756581
+5.687667528
+3.536338713
+-0.5397745074
+-3.212257865
+3.163355181
+-1.209530841
+3.667335211
+0.6248249342
+2.929917109
+1.069099192
+2.119719505
+0.03150006216
+5.357611482
+0.3807362781
+1.20596809
+5.649452091
+-4.043277183
+-3.811454995
+2.908190124
+-3.519370215
+5.830863557
+-1.240856942
+-2.242364434
+5.768826079
+4.441544374
+5.602676881
+2.718133975
+-2.583677055
+5.730194859
+-0.8040101129
+2.407369187
+2.841755903
+-0.4650302793
+1.842238111
+2.766620015
+1.129276593
+-3.298202372
+0.8947145226
+3.97915769
+-2.083703579
+-0.448903621
+-1.305460655
+5.547791185
+2.016884271
+1.222385509
+-2.309748223
+1.617747574
+-2.022997982
+0.09549167482
+-1.907538235
+2.029299885
+1.72977245
+-0.6248962667
+1.188020138
+-3.279184526
+-4.473772778
+1.318175104
+0.5000204861
+1.905094311
+7.149434325
+2.833438461
+-2.738466676
+3.351048864
+-3.947722232
+-1.384753814
+-0.204724816
+5.140028165
+-2.234264466
+-2.479315616
+-0.2953575733
+-1.990434859
+3.379907766
+-3.239794525
+-3.442405957
+-1.313460134
+-1.494097352
+5.788596161
+2.848262421
+0.2626537242
+-3.676306556
+2.533088929
+-3.000646042
+-4.63431329
+3.564089377
+0.9508278358
+2.762576471
+0.9561829588
+2.570491836
+-1.95307678
+-3.102728525
+2.044783555
+-2.410228993
+-2.068649333
+-1.366597511
+0.05243747708
+-1.061981734
+-4.12485388
+-1.930855208
+-6.670209457
+1.875694353
+-4.806172967
+-3.313150018
+0.1564952378
+-2.218688989
+4.629043786
+-3.878570729
+0.801152608
+-0.1178484547
+-3.504280493
+1.569829982
+-0.5146389937
+2.315371654
+2.470512462
+6.489707848
+4.009583848
+-1.107545514
+-0.7181375327
+3.298978788
+1.965791192
+1.920394578
+-4.850868133
+-0.0729783732
+-2.214092728
+0.8397737971
+-0.2944511689
+2.730536724
+0.9516546456
+2.358983886
+-1.39925729
+-2.833338768
+-1.23014908
+-0.05106124158
+1.137455207
+6.777926852
+-0.126771455
+-2.867835001
+-1.037945327
+-1.390787924
+1.444444421
+-4.622391043
+0.1897859826
+0.4695196139
+0.6965431086
+-1.791948207
+-0.7137651892
+-4.272182727
+-1.47995965
+-1.628584428
+1.248150139
+-3.468547295
+2.343594305
+4.483453633
+-6.209955075
+1.278776192
+2.030724105
+-1.912311077
+-1.191815443
+-0.3986417328
+-0.8933726382
+-0.9270389071
+-5.028011419
+3.456994694
+3.238855776
+-2.440092778
+-4.399272983
+1.563194629
+-1.727363909
+0.42585949
+-0.9579852514
+2.074616253
+2.084247431
+-2.176792135
+-4.150091866
+-4.748815192
+1.831138137
+-3.566577773
+-1.520449063
+-1.788942115
+-0.1577018888
+-5.808839418
+0.5663357904
+1.571673072
+0.2652662611
+-0.9326585151
+0.2922004988
+1.197139037
+-8.317778269
+5.867736925
+1.170279968
+-1.957225747
+-1.172860126
+1.481225332
+-0.3483118171
+-6.092053403
+6.193478584
+-0.3316219717
+3.060518135
+-2.076149543
+4.609131163
+0.8590310667
+1.826531503
+-3.135760098
+3.633435869
+2.069454494
+3.905538689
+-1.884262679
+-1.443081355
+6.911750093
+-3.180047468
+-0.407849102
+3.410674088
+0.2931749031
+1.748861039
+-1.198347088
+1.110167664
+-3.919580555
+4.974392039
+-0.3544921354
+-2.040534612
+1.999149246
+-1.382159362
+-4.002775414
+-4.040152517
+2.081319458
+-0.4787203144
+-0.401104679
+3.233231418
+-3.380477426
+-2.192033259
+-1.154639428
+0.283054768
+-0.1265143539
+-0.8606615772
+-0.1848792063
+-0.3219158289
+-2.158813166
+-2.438978966
+0.8235490732
+-2.672745249
+-3.472065778
+-0.9368767534
+-0.4730010485
+6.770170492
+-2.114100828
+2.829782175
+2.241565003
+-3.566834866
+2.319758932
+-3.551641921
+-7.977516714
+1.818958573
+-5.26767175
+1.352803385
+-2.052032693
+4.978652389
+3.205528198
+-1.360157412
+-2.063512833
+-3.642232209
+-1.322767897
+-0.8410664856
+-1.094080633
+0.4701115658
+1.735564493
+1.048963371
+-2.292431772
+-4.313374421
+4.093595544
+-2.068347554
+-1.9568808
+-1.563567937
+-5.52920865
+-1.433922012
+-1.438967442
+1.861074895
+2.095371447
+0.01131266726
+2.795545122
+1.019894951
+-0.04704633481
+0.4827845049
+-0.5719604807
+-1.184548542
+-0.8032006107
+-3.384033994
+0.8413251159
+-2.979370833
+2.524893792
+-0.7483757405
+0.148484945
+1.481510329
+1.929943395
+-4.711870226
+-0.6207110285
+2.640536736
+-5.094317458
+1.161841426
+-6.766692688
+-3.067520531
+0.1158916555
+-4.970145307
+-2.956532213
+-4.415505022
+4.944404797
+0.4926832665
+1.701870834
+-0.6680253015
+-1.060295246
+-4.849422566
+-0.8755120882
+-2.284476635
+2.573771773
+3.4233056
+4.399736147
+2.557655818
+-1.795961811
+-3.347690958
+2.299989545
+1.068878452
+-5.305615352
+1.066445378
+2.443559467
+0.1767767675
+-0.555161013
+-2.422945463
+-4.339604099
+2.400893848
+-0.9273433343
+-0.7003999846
+5.198163561
+2.053503321
+1.112475004
+0.4261854156
+4.559984582
+5.158767922
+2.788515334
+1.746673774
+-6.283809214
+0.3711657427
+-0.3903208626
+0.2818596882
+2.829138262
+-8.219031502
+-1.70793616
+0.8097130648
+-1.400536638
+-4.250718339
+2.606890461
+0.8306157175
+-2.913313711
+0.9444516135
+2.464757136
+0.0158779389
+2.40169441
+0.2347805255
+-1.185686948
+-3.478261549
+-0.2577923009
+0.5828788141
+2.627498285
+-0.3453224055
+1.372246819
+-2.893836041
+-2.347887467
+-0.3311678971
+-3.163885392
+2.460743512
+1.389390988
+0.8372872932
+1.016712376
+6.063130684
+-1.406592564
+-6.604323857
+0.5979005907
+-0.1518106229
+-1.552557128
+-2.936489578
+-1.317568565
+0.5440152877
+-1.508450102
+7.237361039
+-2.881513145
+-2.379352088
+-6.86586012
+0.7544532451
+-6.049219883
+-1.6183639
+-0.8270116037
+-2.129183898
+5.216618032
+2.983183174
+3.957410629
+-2.647256456
+3.385782194
+1.488002839
+2.314217846
+3.088316486
+-2.726289738
+-1.272952863
+2.587788034
+-7.966857279
+4.539984248
+1.659396193
+-0.137111882
+0.6615229673
+-3.08980585
+-1.049830094
+3.300853015
+3.894065917
+8.088672158
+-0.2217739988
+-1.9756589
+-1.542701898
+-3.054125626
+-0.2335642678
+1.14819729
+-0.1027268416
+3.289040537
+-0.702647404
+-1.042351957
+-1.743805431
+-4.897903579
+-4.703303173
+-3.537473792
+3.904284215
+2.685780819
+4.124892199
+-3.996634964
+-5.905874069
+-1.98016896
+0.5274568599
+1.496070825
+3.143916468
+0.8528390124
+5.228006342
+-0.6678170428
+-2.739237654
+-5.043654646
+-2.666914074
+0.726353883
+-2.666160772
+2.810227391
+4.236983118
+-7.108760716
+2.592156901
+-6.718812176
+1.204497165
+3.674611693
+0.194568319
+-3.83906752
+-1.756293613
+-0.7849363371
+-0.5467343514
+-0.6086905223
+-0.3296483379
+0.6404401467
+-3.625720961
+-0.7260594896
+4.554783511
+-1.153936269
+-1.331508279
+3.234591911
+-7.677553999
+3.544135804
+-1.895711274
+0.4917857174
+0.2889640678
+2.827404358
+-0.8027842387
+-2.034077345
+3.893537372
+-7.092521451
+0.06100254512
+-4.043776268
+-2.284720165
+6.033770044
+-0.1337862794
+0.5852090915
+-5.344688567
+-2.187133976
+0.5896722022
+1.064273079
+1.850659663
+0.02588369675
+1.581012625
+1.361345738
+-5.489221233
+0.1110171657
+2.303707223
+1.769639462
+-1.09157643
+-2.416879523
+-3.354935773
+-0.3931620346
+3.399239639
+-5.855412304
+-1.979675189
+-3.419407366
+2.354872564
+-1.66292888
+-1.411912974
+-0.6508487098
+1.336179753
+-1.177166994
+-9.138429164
+1.629935674
+1.317128873
+-0.658623085
+-3.252109862
+1.055340332
+1.137706601
+-1.410098648
+-0.6501944117
+-2.790469508
+-0.5357672763
+-4.651288035
+1.251956463
+-2.833105472
+0.7143094435
+-4.217888749
+-1.770172938
+-0.3314682152
+-4.982099436
+0.3454436194
+-1.137442689
+-5.227068593
+-3.909728262
+1.815360252
+2.686667957
+-0.3957259193
+1.214285436
+0.6715306899
+0.9888689464
+3.857952021
+-4.520995195
+2.029382197
+-1.146026867
+-0.6727768028
+-0.9067491914
+-1.12544135
+-3.678588575
+0.5500175978
+5.012829098
+-0.1683990613
+-0.004155128205
+-2.061897111
+-0.3524236393
+1.398499278
+-1.110727322
+-1.361412123
+1.20979362
+-2.754014309
+0.7574898812
+2.460965392
+4.079845625
+-0.2711460218
+4.102791719
+3.103229659
+-2.988637921
+-3.653815535
+-0.9148909136
+3.086806478
+-0.2168610227
+-1.801972673
+4.65672954
+0.860713464
+-6.961782827
+0.9514818789
+1.560121844
+0.6768259634
+1.349136301
+-0.2018268268
+-3.955187609
+-1.11211201
+-2.836847387
+-2.798222732
+-3.789205047
+1.357467278
+0.2936884362
+-1.344496088
+-1.948013783
+-0.07026931506
+3.237584184
+-6.012647146
+1.130629563
+-1.637135922
+-5.653757535
+-5.837109249
+-2.738350482
+0.6585286674
+1.179188802
+-2.816944718
+3.051062974
+4.26895049
+1.188259755
+-1.774208003
+3.373257554
+2.266187087
+2.602222234
+-1.969391025
+-8.503663516
+6.350373064
+-4.83263521
+-0.1073042156
+7.142236054
+0.9917302688
+2.847739421
+-4.507189708
+-5.333000864
+-1.598108376
+3.272249203
+-1.038748343
+-2.383908963
+0.5939018698
+3.245805655
+-4.334820597
+-3.631628982
+-2.366007764
+3.283915124
+0.7044645778
+6.396460232
+2.809337177
+-0.1052855306
+3.795233514
+0.6344910382
+-2.114764058
+2.039924533
+-2.088979962
+-0.8711913024
+3.983348088
+-0.3038444587
+-2.409424162
+-1.393013074
+3.065371757
+-1.65762202
+-1.160612541
+-1.530878219
+0.551776483
+-1.156469281
+-4.805508147
+-2.661542826
+-2.798367125
+3.729958153
+2.438022126
+1.761778138
+-1.516074952
+-2.447374626
+-1.522552805
+-3.155640308
+7.491601175
+-6.735964945
+1.692025605
+-3.853656894
+-0.3130304745
+-2.964005827
+-3.532886887
+-3.420588903
+5.264958461
+-0.3989652669
+-2.297106583
+1.667360892
+0.0310479437
+2.160101278
+-5.472769968
+0.9108117134
+2.318084511
+-4.984794873
+1.344585853
+5.088544718
+-0.04457311006
+2.464217811
+2.011711351
+-2.122517093
+0.1193002038
+-4.700984133
+-1.353909111
+0.7970639249
+2.169301481
+0.07383637574
+2.15995119
+-3.308718639
+-0.3050918237
+0.05783815354
+5.54877374
+-0.6424999686
+-1.497049914
+0.06405367153
+-2.757340335
+0.5782615472
+-1.09516565
+-5.373982644
+-0.1757596534
+-0.9526292818
+-4.897269906
+-0.2014024638
+4.468067886
+1.563911245
+1.835781578
+-4.024490177
+1.430695107
+0.4453487441
+1.587135715
+1.267885865
+-4.079342177
+-0.1242024347
+-2.273612581
+-0.1502522829
+-2.692202781
+3.937411101
+-2.576917165
+-2.696826469
+0.2237592196
+-3.231297208
+-1.273989907
+-2.489893793
+4.233516192
+2.35741148
+-0.1724085554
+-1.173651157
+2.822752844
+1.215612241
+1.494157214
+-0.07857671203
+-5.064690083
+-0.3373979477
+-1.597469758
+1.93516582
+3.035527299
+-1.973853134
+1.405155703
+5.207636993
+-2.003138162
+5.04576522
+-2.557757542
+0.06887926682
+-0.03343683553
+0.03449669961
+-2.513034126
+-1.773549311
+-2.003160859
+0.9808877862
+0.9901053435
+6.677832995
+4.112967019
+-1.529529726
+0.9746088474
+2.991353942
+0.09180547302
+-0.2089247353
+0.1547248283
+2.601829886
+-2.544961568
+-0.9770084065
+1.411299435
+0.9343412147
+0.7187482796
+-1.109403499
+2.917607367
+6.401604742
+1.219246481
+-0.5795301046
+2.267220867
+-1.61739791
+-2.249071034
+0.09842624284
+-7.748389899
+-3.461851091
+-1.043885568
+-4.060166574
+-3.097929306
+-1.310245012
+-4.928895881
+-1.218215389
+-1.605810494
+0.07621562516
+3.462552091
+0.5175132495
+0.06318606403
+0.2983633711
+0.6821783254
+-3.050215946
+-0.3443259743
+0.9262537255
+-4.112279948
+2.596958768
+3.244128103
+-1.894127965
+-0.7240133744
+-2.634571028
+2.098141451
+-3.183666862
+-0.6674310307
+-2.576759723
+0.152862831
+-5.382687814
+3.979384927
+-2.893819273
+0.1796840493
+-0.6375691343
+-2.286343536
+-2.66334041
+2.809195631
+-1.576921779
+0.8135105539
+-2.404490656
+-1.941544296
+1.41674145
+2.791225488
+-0.525949207
+-4.265759615
+5.993868239
+-2.569647925
+-4.624762199
+7.783273763
+-1.212096882
+-4.385198065
+-2.0503193
+1.102634688
+0.5709346728
+-2.555187592
+5.4681708
+-1.564739034
+-3.554059771
+2.882080195
+3.98718854
+-2.452479293
+-4.204041879
+3.091314802
+-6.141970839
+-3.679864978
+2.90233845
+-0.1660576441
+-0.7918120458
+1.058449819
+-0.4583232706
+-3.896060166
+3.828226038
+3.975042159
+0.6159976913
+0.1354020463
+7.018874418
+-0.829298535
+-0.7787309455
+1.093443748
+4.413965868
+4.778312263
+-0.775717895
+0.9249937379
+-4.134250401
+-0.9359283237
+-2.520871186
+-3.020495257
+5.044730149
+-2.376859985
+-1.594817724
+1.097546364
+3.893475801
+1.443345379
+8.278065342
+-0.2240039348
+0.7761493207
+0.826802022
+4.30514816
+1.521716853
+-0.3486891012
+-2.842465785
+0.7333303679
+4.204034494
+-1.231145381
+1.586830855
+0.7384433661
+2.590558975
+-2.414261222
+7.039941092
+-3.837483321
+-1.09665327
+2.814277623
+0.8901995175
+2.489958477
+-1.488307002
+-0.224414948
+0.03669595092
+4.707778844
+2.071287073
+2.390016325
+-1.973778278
+2.906647916
+0.6767449907
+4.167435947
+6.042180465
+-0.9202973281
+-1.218909391
+-2.592134973
+-0.4307385351
+-1.146076347
+1.078513199
+-0.4337004508
+-1.084797842
+3.193755408
+-2.813640693
+1.299323859
+-1.217825182
+2.173105515
+4.15578464
+-0.9092947603
+1.323098722
+0.5363785972
+-2.398267199
+0.7223625292
+0.8673615158
+1.238612461
+-0.5951966905
+0.2825769009
+-3.442832835
+-1.074342226
+1.667888039
+2.677421662
+-1.266944472
+0.3141420883
+0.6841599754
+0.6044398401
+1.622320756
+-5.454232891
+-0.1479722104
+0.7171008037
+-3.000991047
+5.021957121
+0.4846778017
+4.690214235
+-2.371569065
+-2.721900365
+0.6727566629
+-5.036065088
+0.6448967719
+0.291657696
+3.046995845
+2.103124023
+-1.25243205
+-3.292489964
+5.136915664
+-2.376345062
+-3.136573671
+-3.254568178
+3.351915947
+-1.556700613
+-2.261113399
+0.4130694777
+-0.6208341317
+-2.034286382
+2.261974401
+3.195946476
+2.955952527
+2.300759009
+1.207876593
+-5.327664
+5.007752419
+0.9059676311
+1.824469283
+3.344886969
+4.300057509
+1.255194034
+1.306638478
+-1.797672832
+0.09926925342
+-2.562483782
+-2.159821596
+-2.680723207
+-0.468071673
+3.147279564
+9.51292432
+0.5684989126
+-4.045239263
+3.79494999
+-0.9023516294
+-1.981825782
+0.6295484338
+-3.721873799
+0.667389492
+-0.2651265696
+0.2951337204
+1.144248763
+0.2024767717
+0.04901425234
+0.852943557
+1.246201879
+-3.094447381
+-4.289973776
+-0.1849141565
+-4.29820647
+0.2625944128
+2.816240627
+1.821335016
+-3.14451122
+-2.580787356
+0.984903885
+-1.203893415
+-0.9499658852
+1.790719444
+-2.96186008
+-1.20370413
+-2.400247428
+-3.129388494
+-2.571234566
+2.032386508
+0.1554611684
+-2.637481887
+-0.6933048228
+-4.916421921
+-2.199938423
+6.448723605
+-0.270731549
+2.194976781
+-0.1964651254
+1.044507706
+1.989774269
+-3.313849793
+-0.09280877182
+4.736595583
+-2.38650165
+-1.699319561
+-0.9230738321
+0.8070722195
+1.574753591
+3.802234964
+1.4984947
+-0.1861593774
+3.777501389
+2.112333066
+-4.487038549
+7.579104721
+5.309764165
+-0.5046426683
+1.133730305
+3.97307625
+-0.5166023781
+2.191055371
+3.313735421
+-3.044477723
+-1.806995561
+2.764225193
+1.382443431
+2.771389681
+-0.397704044
+-0.8670156329
+-5.995918427
+-3.43800128
+0.141198284
+2.473671659
+1.5935351
+-0.3847259221
+-0.8153146995
+0.6515388979
+0.2346335433
+4.213636545
+0.4393223114
+-4.443737887
+-3.817674405
+4.556278011
+-3.513481384
+2.293492359
+-0.8051182056
+-0.5092748817
+-0.4023983483
+3.664154878
+-0.5785254856
+-0.09995784854
+-4.592410492
+0.6200715351
+1.593127521
+0.717436742
+4.193688783
+0.1655140643
+0.8969323684
+4.945512031
+-4.650042568
+-1.367476043
+4.278476256
+2.808387445
+2.035140297
+2.497952218
+0.9811986274
+4.894792283
+1.133277509
+0.7196013177
+0.4768760224
+0.5785918667
+-3.471051842
+2.312019163
+-0.3913192013
+5.465745294
+-0.2269514118
+1.262754853
+0.7398065588
+-1.876671105
+2.976410486
+5.715190922
+-0.04433165898
+-0.9014363568
+-1.065086193
+-5.67708568
+-0.5334394311
+0.752994348
+3.164273776
+2.880143223
+-1.249497247
+-0.8304689843
+3.371715917
+-0.5203916912
+-1.530088619
+4.177555348
+3.112757001
+0.05637537532
+-1.781332343
+-6.035640958
+1.769110817
+-2.689109168
+-5.888196027
+4.754461582
+1.943903373
+-3.417024579
+-3.643204149
+2.612885347
+-2.63391185
+3.888449603
+1.849377938
+1.609789562
+1.214086367
+0.5743526161
+2.641533598
+-1.362241088
+0.2578559203
+2.255839763
+1.688969156
+-3.584960416
+-1.501229002
+0.7584105163
+-1.224044127
+5.323975683
+-1.179459584
+-0.4866553427
+2.308290535
+0.9915982297
+-0.4358233716
+-2.269480587
+0.9045421722
+3.117289321
+1.437285672
+-2.334550564
+5.210324871
+-4.33973367
+-4.748056925
+2.881671673
+0.6775214358
+-1.648495639
+-3.295712183
+6.962399518
+0.3512726165
+1.602603513
+0.9536552917
+1.304423873
+1.620283382
+2.197272029
+-1.125667202
+-0.8749259591
+-5.223068425
+-2.34091322
+0.8133383893
+3.135070127
+1.797118579
+-1.022077032
+-3.789518736
+-8.332077436
+3.455201924
+-1.76768696
+-1.345395019
+0.3947219037
+-4.216680142
+-1.04934654
+6.070415849
+1.516160816
+1.07774747
+-4.747483434
+6.730805684
+-4.268384726
+5.766974266
+-6.345168046
+4.216096316
+4.854162807
+-2.473227364
+1.267741117
+1.642441716
+-2.44138345
+-4.347352832
+-3.953152029
+1.62302466
+-0.2553468076
+-1.6929031
+2.900304033
+1.524203728
+-2.266388179
+-3.603604557
+1.569785216
+-1.612750106
+0.2976145876
+4.728896918
+1.50698472
+-2.586800999
+0.4819835695
+-2.857934858
+4.825566468
+-1.684736249
+0.6218122409
+0.923197724
+0.4777514051
+-5.875646865
+-4.339263192
+-1.357050827
+0.9582955
+-0.4133376429
+-2.871442419
+-4.045272957
+-1.204672633
+-1.405428134
+1.538509373
+-0.9789553865
+1.808122969
+-1.783949309
+-0.7678730076
+-1.044139139
+-2.347100901
+1.875355969
+-2.440787991
+-1.56492453
+-0.2193589378
+-3.892138968
+-0.974804875
+-2.133919079
+-1.164462577
+-0.179784008
+-2.399740869
+-0.6602273395
+3.926006257
+-0.07739567476
+3.435786519
+1.039483326
+2.322481829
+-2.323376906
+0.3147214953
+0.4017387678
+-1.837877217
+-2.468484973
+-4.470796164
+4.488418911
+-2.917208668
+4.03866322
+-1.402479521
+-2.587479899
+1.867557421
+-1.893575825
+1.705376757
+-0.9984352946
+1.441273488
+-2.904558192
+2.494053174
+1.463918048
+-2.75895207
+7.928807163
+1.620369079
+6.871401212
+4.800803456
+-0.5665043407
+-1.236815264
+-1.21037755
+-5.490085651
+-2.087505358
+0.7402980719
+4.577872683
+-2.318315649
+2.646169798
+-3.757780025
+-1.758960076
+-1.372921783
+1.115433244
+1.37192894
+2.887025234
+2.312510881
+0.7295046462
+1.171094831
+4.765592073
+-1.532778544
+2.324184957
+-5.424431779
+1.234002729
+-1.449748627
+0.007713547295
+3.120258735
+0.4939314286
+2.655562624
+4.421294445
+1.167281907
+3.513123194
+-0.979682933
+-0.02462964681
+-1.567858249
+3.128932784
+1.242274061
+-1.521703386
+0.4640065009
+3.124705166
+-0.1178039731
+-2.846798433
+0.3957352674
+-5.941696773
+2.306311933
+-1.263982762
+-1.407932209
+2.627087036
+-4.095488632
+5.841295928
+-1.440726125
+-1.56975283
+3.06367423
+2.126085819
+7.353689157
+-0.6336179509
+-0.361219916
+-4.43794794
+-0.996306832
+-2.164293887
+-1.346301039
+-5.23256327
+4.98182268
+-4.249810447
+-8.406608395
+-3.565273265
+-1.811518658
+-3.44866219
+3.294910622
+-0.4135175358
+0.07615681322
+1.831175293
+0.8580375809
+2.935701892
+-3.328432661
+-1.642554302
+1.997901438
+-7.603663386
+-4.125553438
+1.502976697
+-1.440747105
+2.80832265
+2.427540891
+-3.594278641
+1.219971262
+3.605093567
+0.442303205
+-2.932394632
+2.638169826
+1.90627358
+1.62783235
+2.14781668
+-8.983838581
+2.642812683
+5.424395432
+1.309915424
+0.5781869895
+2.08931602
+1.014676421
+1.955343785
+0.004413000736
+-2.300114564
+-3.012968137
+-2.994575185
+-4.119127653
+-3.203226033
+5.283798382
+2.262286991
+-1.875082172
+-1.171178082
+0.3376725927
+-1.966635088
+0.2025505715
+2.332812414
+-0.1072282006
+1.008047228
+2.659474618
+-0.8163952681
+0.8543717974
+-0.9281327787
+-0.0855866095
+-0.9741907952
+-1.586609561
+0.521135559
+1.699635947
+0.438913338
+1.496180875
+-2.213795341
+-3.611205577
+1.251130509
+2.063644174
+0.1495717998
+4.044107341
+2.723096394
+8.041712522
+-0.602425542
+-2.996546388
+-2.220410372
+-1.696493419
+1.42809415
+-6.474205692
+3.955653054
+-0.7178897734
+-0.7403806734
+-3.238029498
+-0.3426766544
+0.039719303
+-0.3658347828
+1.017177768
+-1.768896126
+-2.687447281
+1.644984391
+0.2960023614
+0.5915431656
+3.177081763
+-3.067693174
+-2.565721372
+3.771658952
+-4.448650073
+-3.928236439
+2.453585494
+0.7146005761
+0.3156964112
+-0.2749782243
+0.09380264108
+-0.2763363441
+4.066328108
+-1.194444386
+-0.4841206088
+5.383346416
+0.08252910609
+6.696049169
+-0.3149391031
+4.102244947
+-4.966032115
+0.4609333824
+-4.753420689
+2.53336292
+-3.638603449
+0.8513086632
+-0.8465876301
+-3.474609556
+-4.858079949
+-1.533121391
+5.221888338
+-0.8804551647
+2.751664626
+-0.171128603
+2.630180321
+-5.480734135
+-1.209564921
+2.848216571
+-0.4897648465
+-0.2593658481
+-1.291385736
+3.44813815
+0.8925430619
+0.1320668285
+1.929163636
+1.764674787
+0.6377611393
+4.641094491
+-0.1808626009
+0.8342431439
+-1.92885766
+0.450345681
+4.763284571
+-1.929772805
+-3.400778477
+2.990278928
+-0.4462984567
+0.2880126149
+-0.1353399111
+0.2373651718
+2.551592051
+-2.517372572
+-3.035322252
+0.2549044111
+-4.819319068
+-4.119160608
+5.600049445
+2.27240499
+-0.03016941561
+3.714020808
+-3.12179769
+-0.9468093702
+1.870360828
+2.672015044
+1.53875054
+-7.623716423
+-2.904246353
+1.431204277
+-1.067854479
+7.620694862
+2.779674903
+1.674245642
+-3.350848661
+-0.1058902188
+0.7236118927
+3.38335089
+2.643393291
+3.098967584
+-2.771736047
+4.236455095
+-4.141292257
+-1.607743685
+1.292313405
+-0.4496747752
+-3.018110574
+-2.464649477
+-4.644762969
+1.595923917
+3.781706535
+-0.3011805102
+-1.201046445
+-4.416968785
+2.739605773
+6.633913
+-5.392367413
+-3.190298814
+-2.038779128
+-1.692953729
+0.6820378504
+4.842748642
+3.025791861
+1.582792148
+-2.171786112
+-3.358884701
+-2.390325919
+4.644200404
+-0.1852299044
+-1.340508761
+-0.5512671907
+2.473854659
+-3.938549024
+4.244622408
+0.4694287708
+-0.6490319349
+1.328538341
+0.6551912194
+-1.032589369
+-0.7581320161
+-2.606587641
+1.969172253
+-1.595981428
+-2.868775267
+0.497590568
+3.987423848
+-0.1450338713
+-1.824303771
+1.211688063
+5.810137387
+-4.355716588
+1.146608363
+0.6152598757
+3.484601411
+2.972727521
+-0.5601273354
+-5.053551766
+2.419691304
+-2.505578071
+-2.840221233
+3.445051742
+-2.732551133
+4.20853422
+1.007534164
+0.9573552003
+0.9217943415
+-4.915270877
+-5.329165849
+0.6466591614
+1.704022078
+0.2478330965
+-2.464603551
+0.05676631165
+-0.2461024594
+-2.871474295
+3.041916462
+-5.190828185
+1.76622722
+1.152970216
+3.029135564
+-3.015935617
+0.30422144
+6.513494848
+1.986222867
+0.3017436262
+1.617483822
+0.2585305271
+6.57269404
+2.950908587
+-0.2568448627
+0.7569942942
+-1.172393988
+3.629550379
+-4.218314314
+-4.81421559
+4.376144249
+6.459359378
+1.404914723
+0.3382138237
+1.971803071
+-1.941160579
+0.5137306355
+0.1167261176
+1.879692752
+-4.673995585
+-1.521104309
+2.534986809
+-2.026781483
+-2.980084126
+6.126216449
+0.1143540005
+-1.73675442
+-5.077111312
+2.188039039
+2.097408461
+-0.8962788017
+-3.306690573
+-0.07364827093
+-2.507568202
+-2.826280767
+-0.3096382544
+-3.154171196
+0.7399468658
+1.823977528
+-2.518897342
+-4.104735286
+4.683838797
+-2.820810708
+-1.979828115
+0.6390515023
+1.798108118
+-0.7689506811
+1.382382983
+-1.202958474
+-2.913511994
+4.278950582
+7.465324843
+5.087908599
+0.4254199175
+5.500306085
+1.067110547
+-1.431858811
+1.399138723
+-0.2831775192
+-2.949354551
+-2.694965914
+2.406155216
+-5.539595945
+1.812410221
+-4.888750808
+-6.363529335
+-5.516539811
+5.900291916
+-0.5887018948
+0.2597495405
+4.257765138
+2.802539245
+-4.174515808
+2.607019028
+0.5525437941
+-1.025034293
+0.07287274241
+3.839436062
+-2.657899446
+1.202657037
+-0.0289717096
+-5.391493846
+-2.406759515
+0.5796406597
+3.892026267
+3.003993052
+1.791637513
+-2.445826983
+5.403641972
+0.6457214029
+-3.019096565
+-0.5487149426
+2.688745276
+0.02285249495
+2.66059406
+3.311081872
+1.201592054
+-2.573107869
+0.4063639896
+0.1354975678
+5.578039002
+-4.878965813
+-0.4044673533
+-1.75228064
+1.005316861
+-7.312693078
+3.344773678
+0.04124546201
+-5.534103491
+-1.083339404
+1.826887025
+-4.774343626
+0.009666649329
+-3.172420943
+-1.667955096
+0.08021514802
+0.5503507607
+-1.412227495
+0.8183891686
+2.453932822
+-0.8367428253
+4.294703272
+4.386642512
+-1.286106197
+-1.913521669
+-4.992518955
+-0.3797079949
+-1.09031334
+2.33715366
+-4.528984818
+-0.8321741752
+2.906233179
+-2.191071287
+-2.28708461
+-4.340821004
+7.861721538
+-2.242419534
+-3.901040497
+-2.411551212
+-2.322885241
+-0.8081693354
+2.476116696
+-0.894969507
+-2.768469945
+-4.354015495
+0.06557207466
+0.1276172221
+4.592797053
+0.2773432064
+-0.2970249339
+-3.15196151
+-0.9178577253
+-1.315423374
+-1.110492494
+-2.877766178
+1.61498881
+-0.4273362525
+-0.60106044
+-5.142138348
+1.480932263
+1.461045978
+-2.517388209
+2.970364152
+-4.09427469
+-0.06560972637
+-0.8136220197
+-3.951524366
+0.5691078362
+5.107710457
+0.2029026902
+-1.389065262
+1.341072471
+0.3171599864
+0.08328639488
+-1.276626638
+4.265926678
+1.36909009
+-1.586011977
+-0.3240115103
+-2.222600113
+-1.82487345
+-1.922177173
+-3.402934781
+2.331830891
+-0.8731243898
+1.662382735
+-2.010377693
+-0.1810874832
+-2.13312179
+2.159004512
+-0.7452579201
+-2.192620758
+-4.925109686
+0.826999648
+-2.125155157
+-0.04733765136
+-1.475190324
+2.862568743
+1.632434257
+1.341636262
+-1.84836337
+1.398870131
+5.144494826
+-2.496558102
+0.5170174177
+-4.947650923
+4.195686276
+-1.193736296
+2.347736643
+-5.169684752
+5.392618161
+-1.070614584
+1.63697197
+0.452454619
+-0.7664123586
+5.057376908
+-4.944138619
+0.89614098
+2.731937017
+-0.08956836491
+-0.3545123531
+-0.4280631362
+-3.682909261
+0.1143821523
+1.53815257
+0.2057976824
+-0.8168283034
+-1.469175067
+-0.8378900078
+3.773232652
+-6.259904938
+0.1202143696
+-0.9832647519
+4.367423856
+0.1664766763
+4.454776796
+-6.371670054
+1.378754715
+0.8401735801
+4.171601901
+-4.924045826
+-0.4651074244
+0.1981807854
+-1.487386484
+3.649733141
+-1.016046556
+6.104287632
+3.162533727
+2.852501091
+1.677896944
+-3.191086773
+-1.293289013
+1.718254101
+2.032671101
+3.921551535
+-1.402323029
+-2.580460155
+2.577312578
+-2.428879728
+2.619935508
+3.599208529
+1.368459107
+-1.072737096
+0.1232466784
+1.780397759
+0.03055655614
+6.594889016
+-2.972012792
+-3.008005762
+-2.93068616
+-1.768739768
+-6.536794561
+-1.888951281
+-1.959854106
+0.2355420755
+1.25340175
+-3.720649009
+2.700162728
+5.406726689
+-0.6248553093
+4.723113712
+0.5969684832
+5.966195756
+3.351850397
+-4.691713905
+0.05588211198
+3.162974925
+0.09163974312
+-0.1106505925
+3.809294251
+-2.129562546
+0.05254683983
+0.9708772938
+-1.001372881
+-0.06038731163
+2.32506979
+1.298512864
+-2.426152596
+-3.312371957
+-2.367306541
+0.003745367365
+-0.4798193633
+-2.49587248
+-1.794451358
+-4.560117856
+1.25356111
+-0.1200561761
+-3.77936203
+0.08586151256
+4.027866032
+-2.219807559
+3.945412997
+-0.9703724175
+0.5934845035
+0.2932524073
+4.204570248
+0.4753015404
+-3.425704258
+-3.932911111
+-4.59876316
+-5.135910492
+0.1384051769
+-2.875123441
+-0.2424348388
+-2.111577108
+-2.312352902
+-1.442536023
+2.110756664
+2.787435443
+1.113517658
+-2.969467649
+1.930893826
+2.06669
+0.8239416108
+-1.810861308
+2.126578726
+1.268455724
+-9.350569775
+1.9333561
+-5.741228013
+1.99068473
+-0.4622171953
+3.580835042
+-0.2944836336
+-2.65984278
+-0.4420609937
+3.179418885
+0.07873985358
+-0.3430054796
+2.230660547
+0.6310780999
+-0.0177822175
+4.098180205
+4.665342096
+1.839978679
+-0.8578774545
+4.490732981
+3.549358672
+2.156691497
+-3.648229742
+0.4220157099
+-2.231016524
+-0.4770367547
+0.7201707879
+0.3004782243
+-1.425525317
+3.818861247
+-5.0883938
+2.190550593
+-5.572449815
+1.14779441
+-2.660712979
+2.634911273
+0.259357572
+0.7431191354
+-3.054837977
+-1.963710405
+0.6216521802
+1.750709781
+8.787288725
+0.6685749693
+2.928112576
+-4.670801798
+-3.989675584
+-1.066484324
+-3.592283087
+4.45919776
+-1.230656078
+4.146545665
+4.460347422
+0.1283391597
+1.505399261
+-0.16829842
+1.615311001
+1.450025555
+-0.3709488777
+1.514909944
+5.171088827
+2.139048689
+0.9773988409
+0.3743085631
+-3.038019371
+-3.081890631
+0.9700695944
+-4.108173372
+-2.298982797
+3.844534021
+5.742689091
+-4.99786823
+4.879948687
+-0.6343148725
+-0.04501526109
+-0.3402348919
+3.241632381
+-4.823029737
+1.368490834
+-2.834610592
+1.712365588
+4.628389015
+-0.001251979238
+1.122465258
+1.228655335
+-2.398780499
+4.53491805
+5.119404742
+2.105350116
+0.219856296
+-1.385681446
+-1.879470669
+5.132509748
+4.243245128
+-0.1909844664
+-4.739791589
+-8.49603561
+-3.250279981
+-0.391861188
+4.202067103
+-1.954968627
+1.514446369
+3.909542885
+0.3856089506
+-0.4273436064
+-3.926290543
+-3.607425925
+1.248298903
+-0.6027225996
+0.367593953
+-0.1418331471
+1.992432148
+-2.354062234
+-1.006741931
+5.688546686
+-2.399358415
+-0.8447262924
+-1.768160106
+1.334344087
+3.067176967
+-1.494634856
+-1.294243023
+-0.8369448159
+1.58950135
+-2.218185908
+-1.127879898
+-7.116581615
+-4.145235028
+-0.3373312681
+2.69359252
+0.8852273499
+-3.29630537
+-4.200768624
+0.5240402787
+-4.958410927
+3.197780456
+0.191688575
+-4.821960478
+-2.897861577
+-2.172933958
+-2.319577531
+-4.469799025
+-2.623987566
+-2.053204668
+-2.133857267
+3.383869875
+0.3144834085
+-2.979771652
+-1.003864818
+-2.638671292
+-0.900019977
+2.626527459
+0.7568123418
+6.856803545
+1.127782277
+-2.74078353
+2.429222192
+3.239793651
+3.282500974
+-3.282722859
+-0.4429122435
+3.39543587
+-5.054186877
+-1.498250283
+-4.280813056
+-2.79771069
+-3.037371458
+3.751709498
+-0.7036141047
+-2.590066744
+-3.106817194
+0.4250014946
+-0.03340688202
+4.032223124
+1.500050088
+-4.295393334
+-1.886942123
+3.210217536
+-1.863248093
+5.203716525
+-3.294868294
+1.717840059
+-2.58364666
+-1.528785399
+3.295744945
+-0.3812014885
+2.440356735
+1.419871785
+2.261597051
+-2.664564633
+-0.6647231946
+1.272757854
+-2.547218618
+4.88850013
+-2.331684126
+-0.9000107308
+-3.019677194
+-6.429924196
+5.390755568
+-0.6130168107
+-1.343744515
+-0.596145185
+4.259591917
+-2.895319824
+2.038703597
+-1.271364746
+-1.790012567
+1.701174638
+2.964721721
+-1.541708851
+-2.306547479
+-3.507287242
+3.3105113
+-1.725767984
+-5.547392182
+4.229856415
+-4.109578506
+2.338381594
+0.55028594
+0.8637462966
+-1.753125826
+1.096774381
+-5.003339679
+1.764113246
+4.671030125
+2.652081592
+-6.058620256
+-2.952627007
+-0.5633847659
+1.460811915
+-0.319958021
+-1.479643161
+1.785900923
+3.492455299
+-0.6968820216
+2.186789602
+-7.737152236
+-2.812528158
+-0.9637768112
+-1.465698662
+0.9983946522
+3.041251642
+1.520007078
+-1.866676415
+-4.568304272
+1.670892362
+-5.514530219
+1.95911185
+-0.5653472464
+-3.527504964
+0.8617719374
+-0.008628307977
+-0.1097918787
+-0.2526698896
+1.258572325
+2.773302066
+1.489845595
+3.036399569
+-0.1324191565
+4.855377973
+1.713329466
+-1.631082089
+-3.28168517
+0.6173904112
+-3.919564569
+-2.920127903
+0.7172612411
+-1.823662339
+-2.799948721
+-0.1034251383
+0.2180336973
+-0.6175020757
+-1.132640757
+2.563928186
+1.027282054
+-0.6702783366
+7.392965801
+0.5814952108
+3.396015401
+-1.682943009
+-4.088822842
+-2.375269547
+-0.8040293502
+-1.489824629
+4.009158547
+-0.3601233663
+1.384406632
+-0.1394434681
+-1.300662998
+0.1139880404
+5.142154409
+-2.303845775
+2.300971352
+-3.078021755
+-1.378879327
+0.01074961786
+0.9791252692
+4.449385884
+-0.1502479244
+-2.53084682
+1.950125919
+-1.092509427
+0.7160447128
+-0.3486673186
+-5.830370554
+1.524897557
+1.75010402
+2.779814305
+5.401388287
+-3.58531132
+1.549522333
+1.22788499
+-1.257245978
+1.191318709
+1.498940865
+-3.65605149
+0.7386682838
+-2.753952918
+-1.9555695
+-5.324234446
+-1.420082777
+-0.6107120144
+1.649570602
+0.002699780013
+-4.626864452
+2.586444171
+-0.3557598707
+1.465111771
+2.897808355
+4.267814247
+5.883680968
+-0.216716276
+0.9333733383
+-3.235083272
+3.18480051
+-3.554662334
+-5.415755066
+2.491158016
+-1.565089575
+2.332821844
+1.224223948
+-4.890007953
+-8.159038093
+-3.289805241
+0.04947446094
+-3.665329004
+-1.958284348
+-4.376822192
+0.5096338794
+0.2724777811
+-1.444177872
+4.191195904
+4.493145082
+1.695801608
+-5.399313544
+-3.314070442
+1.221390993
+-1.885672741
+-1.461274295
+2.696902184
+1.532624466
+3.942463301
+-1.28762789
+4.125676261
+-1.662393741
+4.49847447
+0.3175039309
+-2.581529241
+-4.893658523
+-0.9044169446
+-0.768698094
+2.57298573
+-0.3317715084
+-1.297295936
+3.231112419
+-0.6744796838
+-1.728725449
+1.723826752
+-1.469484657
+1.976406425
+-1.790751335
+-0.6688775489
+0.4565309268
+-1.122378961
+-0.04035440807
+2.446415908
+1.231805374
+1.44290955
+-1.906291316
+2.558489305
+2.008687022
+3.013257577
+-2.179097497
+-0.51737579
+1.900601707
+-1.826445352
+-0.6783674093
+5.777417212
+5.855283037
+3.719821649
+2.815755409
+-3.057753449
+1.537686694
+-1.077349785
+-3.175715693
+-1.527017516
+0.3469952221
+-1.642066723
+-1.652398277
+2.376124495
+0.4323194554
+0.700374239
+0.3356171907
+-2.02710943
+-4.111715754
+0.9316941313
+-1.521109896
+-6.032346806
+-1.177701774
+-3.276653824
+2.095950703
+1.564875682
+1.490679435
+-1.995124854
+2.194654746
+0.9589493494
+-1.229563615
+-1.360012296
+2.678124459
+-1.420812171
+0.9109694206
+3.10187096
+5.728027877
+4.991619373
+2.702468293
+-4.517734055
+-2.067145288
+-1.644261562
+4.959449498
+-2.097953823
+1.158499131
+0.3026011898
+-2.805381628
+1.145472029
+1.194888259
+-3.767324645
+3.668632341
+-6.259530087
+-1.772271459
+2.915910882
+-3.5797735
+1.050797759
+-3.889081165
+-0.2790724333
+-6.94131934
+-2.527715105
+-4.628764341
+-1.205291226
+-1.245694187
+-2.020992514
+2.39373959
+-2.660638812
+1.90316002
+4.88782731
+0.4171924509
+-2.573010614
+-3.748015545
+-2.1293553
+2.113928162
+0.4667722049
+2.810385649
+2.310992638
+0.4224319556
+1.420464785
+5.565738628
+4.246968679
+-0.9082380507
+2.969038326
+1.757552417
+3.409164233
+2.014849716
+-2.922502305
+-4.859053696
+1.717881052
+5.707854595
+-2.326992324
+-0.5642692141
+-3.107243179
+3.533488514
+-6.915500565
+-6.790980903
+1.125059759
+-0.2470309404
+-1.438869045
+-0.9032843596
+1.610963743
+-1.241411967
+-3.290774915
+-2.782088784
+2.665016586
+-1.574225865
+-4.155832751
+0.3065349808
+1.514984165
+3.986882243
+0.6537101614
+-1.979133742
+1.422023602
+2.18152461
+-0.11671592
+-0.1337981782
+0.7803987148
+-0.2095694948
+0.7503417206
+-3.065739973
+-3.451313309
+-2.508334139
+1.92663283
+0.776392702
+3.120716893
+-0.5600727663
+-3.430924188
+3.433660606
+-0.05630116662
+3.850365109
+1.793839474
+6.565856036
+-0.6593189571
+2.702171715
+2.674092319
+-1.665379036
+-0.5174469513
+-4.385215027
+-4.646388411
+0.3797064046
+2.379021212
+1.9140721
+1.020073795
+2.589051459
+-1.769093387
+-0.8175982455
+2.21256454
+1.299356188
+-0.6305664414
+3.962383158
+-3.876003753
+-1.556036062
+-0.8501933234
+2.449604639
+0.007155593746
+-3.78447524
+1.542012539
+3.262638946
+2.217913599
+1.857464765
+-5.62294049
+-2.69965943
+1.446241826
+-0.1646645543
+1.567672806
+-3.799028031
+-0.1844842929
+-4.169343057
+-5.861035688
+0.8873372655
+2.527766389
+0.7368492837
+-0.09898944079
+-4.686043025
+3.018321201
+-0.1321346921
+5.878686016
+2.826942925
+-6.01537628
+2.265149041
+-4.189605713
+-2.278486471
+-0.7522700303
+-0.2821873511
+1.192695647
+-3.068565122
+-3.452076013
+1.801815605
+-0.0397508038
+0.5231191461
+-6.581050055
+-0.5314121499
+-2.672187549
+-2.761879119
+2.765804413
+-3.287013687
+-3.278689819
+-0.9930318102
+1.350866492
+-2.652044189
+3.702432107
+4.349542576
+-2.644341199
+-0.7352452667
+-2.336026418
+-5.056146315
+0.9090331514
+2.200784605
+6.035592789
+-2.692228511
+4.008705272
+4.027061074
+0.5935599287
+1.806490469
+2.619819145
+5.922299845
+1.433425688
+-0.1804136565
+-2.598506397
+0.915962265
+3.072494798
+0.733831084
+-2.339769747
+0.2672286075
+-0.3874604474
+0.7942162733
+-4.985545102
+1.652365842
+1.78626947
+1.334560315
+-0.01128845144
+-5.417808788
+-0.05796837591
+3.182144998
+-2.580386629
+-5.967808398
+-4.621673916
+0.9420770755
+1.118628027
+2.658879584
+-0.1657769872
+-4.500985128
+-2.455512422
+2.456518118
+0.4214877223
+1.949488904
+1.304366416
+-0.6148816552
+-0.5220205125
+5.571306809
+1.2440228
+-0.3857626509
+1.366259973
+0.6687174589
+-6.47206912
+1.950253543
+5.462817822
+-2.340839605
+4.362107247
+-0.770609092
+0.8804141929
+3.211080051
+-2.160004294
+3.727481738
+-3.642651844
+-2.625464247
+-1.780560952
+1.986016099
+-1.022623232
+-4.559923379
+-0.6495986155
+-2.352664148
+2.193880863
+-1.029705163
+0.2123222277
+-1.216417371
+1.301816905
+-0.5507722904
+0.9755961441
+-7.780165694
+0.2917526309
+1.24174101
+-0.5978401647
+2.008177414
+2.215821087
+3.912641676
+0.3144348242
+-5.741402114
+-6.856498346
+-4.805522856
+-0.1137211836
+-0.4719158648
+0.8287195561
+-1.875737768
+-2.209473515
+1.665143827
+1.967773234
+-0.7699504064
+-0.1154299747
+1.21294303
+1.513030725
+-3.431942099
+-2.158721568
+-3.691638137
+-1.520719845
+2.437000768
+1.638815601
+-3.294293881
+1.53680018
+0.257529316
+-1.481780121
+-4.219378965
+-0.5244701149
+2.039832018
+-6.489292945
+-1.188369593
+6.762851096
+2.017910156
+0.779497485
+-2.211555509
+-2.034989514
+-0.2498651871
+4.808590888
+1.396767573
+-2.616475193
+3.530360887
+-0.8777826215
+5.092039443
+-1.699809074
+-3.009797271
+0.5238887334
+2.946980951
+3.11233439
+0.4775753
+-2.964290064
+-1.516022166
+-6.054845605
+-2.739364613
+-0.5353704447
+1.167006422
+-1.018362964
+-0.1709371649
+-1.188556334
+2.253075913
+-2.697338815
+2.512643742
+5.882642438
+1.418368968
+-1.581274831
+-1.608810432
+3.629511667
+-3.379768278
+-2.861413261
+-3.493345362
+-3.835541522
+-3.134448958
+2.369714825
+3.306847694
+-2.091219217
+0.6220021381
+2.277470025
+0.3016926093
+-2.864828273
+-4.411205205
+3.031282659
+1.488538237
+1.73086768
+-3.322940703
+0.7049315787
+1.886998762
+0.9421015309
+-2.23506965
+3.03678153
+-4.582895845
+2.786225774
+3.243167832
+4.716990953
+-1.027476571
+-2.99829005
+2.381641087
+-2.097645837
+0.1319865343
+-0.9523866515
+-2.706215914
+0.9629983986
+-4.17604775
+1.776617045
+-2.900793265
+-5.195194039
+-0.1503223764
+1.294901558
+1.730803791
+2.455061192
+-7.060921199
+-3.015433293
+0.3199568835
+4.55700984
+2.351233481
+5.704020156
+-1.574818269
+0.8232509858
+-3.299912423
+-1.213056659
+-2.205887155
+-1.901965978
+-1.180347364
+0.008152619672
+0.06663799355
+1.630360319
+0.4199654022
+-1.032136887
+-1.567735625
+-0.9213951605
+-1.347111424
+1.472913166
+2.596575572
+3.822133614
+-2.39310828
+1.408116676
+-4.184038925
+1.119524155
+3.248016846
+-0.448768505
+3.217908142
+-3.415703611
+-2.665935849
+-0.4074295279
+3.066631064
+-1.252288369
+-1.360659303
+-2.974885075
+0.6086431333
+3.740085423
+2.102040327
+2.089951963
+-0.6209234248
+-1.689928078
+2.031737749
+-0.0957332269
+-0.5208247072
+2.694721867
+-0.593362355
+-2.513328778
+2.727565486
+0.2421596713
+-3.111088032
+-3.338717685
+0.2862356275
+7.012228984
+-1.178461811
+-1.008821577
+4.571313593
+-0.1718435994
+-4.34540059
+-4.718389358
+3.679991921
+1.999063627
+2.478377125
+-0.1732696751
+-2.180136078
+-0.6514893472
+0.4080936521
+-2.514933467
+1.684349729
+-3.778788506
+-0.9982762937
+-0.6120236174
+-2.07305944
+-6.616516065
+1.343608992
+-2.267252281
+3.977123878
+-1.025946833
+-1.624078765
+0.2745658403
+3.160319246
+-1.690222989
+3.044213084
+4.320910923
+2.970968432
+4.879294473
+3.877938063
+4.544646882
+4.812978958
+0.6242085889
+-1.287671699
+-6.786730906
+-3.968199359
+-1.344848397
+-1.145205262
+-0.4583833902
+-3.002281471
+-4.787332834
+-0.3906694994
+-0.5682537864
+-2.422662125
+-2.226456485
+-2.820469776
+-1.189571217
+-2.568908481
+3.779625995
+0.7229901961
+-2.916953754
+-0.8413433444
+-3.540856819
+3.036504886
+4.152560174
+3.756005948
+-3.434077894
+-0.2738010592
+-1.204712027
+1.686039318
+-3.02372941
+-2.027675082
+-1.239651085
+0.4598654074
+2.082386124
+-0.9861830782
+1.991895227
+2.46622907
+-0.6396457106
+-3.736974399
+-3.513571006
+1.775180925
+-1.428673309
+-5.137887968
+1.838857105
+0.3886635616
+-4.217901243
+3.538259944
+2.509907961
+0.4162357539
+-3.822958103
+-4.206991599
+-0.9212054605
+-5.141746169
+1.21524082
+-4.23246994
+0.4947381878
+-0.8643943582
+2.135355804
+-2.813842786
+0.8211883486
+-4.184520579
+2.386648655
+-0.3448852988
+1.487552007
+-3.96157604
+1.497252827
+0.9186101889
+1.091093678
+0.937901889
+-0.5803916484
+3.723897661
+-0.4676939573
+-2.217507601
+-0.1761785801
+-2.851553836
+-1.39198927
+-0.5317398486
+-1.138662362
+0.5981912184
+5.837284174
+1.71284952
+3.216901942
+-1.511128312
+-1.761048866
+-1.134534141
+2.558667292
+-6.444355435
+-3.099494326
+0.3070075405
+-0.6722771012
+5.903189046
+1.343049647
+-1.986574331
+-4.732821206
+-1.021680105
+-3.909660248
+1.400251951
+0.4833189667
+0.9600957963
+6.237529994
+-2.722397944
+-0.5772126234
+-3.637547233
+-0.2417955485
+4.779820848
+1.706167197
+-0.3434611368
+0.7548907465
+-3.632566914
+-1.181201135
+0.2557577237
+0.2982659601
+-4.591848733
+0.9828695377
+0.8375894775
+-1.131153619
+0.01252499725
+-4.45047466
+-4.439386846
+0.404061787
+-2.003169573
+-0.03466656067
+2.518472017
+-0.5217897909
+-8.432004164
+-0.4519609141
+-1.443132066
+-0.704083063
+2.699192438
+-4.735590558
+0.7318698717
+4.710911736
+-1.877829345
+1.416983659
+2.898917337
+0.6306943173
+-2.055290941
+-2.128563032
+2.231400461
+1.776447272
+-2.359405245
+-3.529419463
+-3.842420142
+4.984955584
+-0.2038353612
+7.080685757
+1.666636809
+1.318566969
+0.9188174649
+2.997449551
+-2.898189555
+6.480039325
+-0.3009051078
+-2.110200277
+0.9076830069
+3.277016628
+-3.022664627
+1.700608117
+-2.149332473
+-1.5188206
+-1.468447256
+2.290624399
+-3.327218195
+0.5778483301
+-1.030253592
+-2.541630534
+-3.640570808
+-3.608664974
+-4.901388053
+2.688501581
+-0.7249594879
+0.4759557902
+3.534568093
+-3.660351471
+-2.824637026
+0.7641466101
+-5.472238656
+-1.736125539
+-2.774679219
+0.9885673265
+-1.277447599
+6.024447838
+2.813674116
+-2.559715453
+-1.161940312
+-1.042753539
+9.919723047
+-4.530598932
+0.6106191012
+-6.253296406
+-0.02081232362
+5.729671686
+-1.225366295
+3.313663264
+-0.1983456779
+-1.26749615
+-0.7549690768
+-1.760707936
+-1.878174816
+-3.990583237
+4.520402187
+-1.179229187
+0.8813229323
+-2.629595554
+3.350971678
+-0.8206673337
+-0.2730980036
+-5.486929906
+1.187928633
+5.434517114
+-2.607232758
+-1.374687461
+-3.414971875
+0.3874865227
+0.1920725937
+2.115243304
+1.65442064
+-2.437548139
+0.6748441472
+-0.9849033202
+-3.273098932
+-0.3805676189
+11.40498064
+6.945511902
+0.4194797933
+5.216571624
+-0.1361500924
+-0.1594150183
+-5.848715363
+-2.880316698
+-2.350497792
+0.322557095
+0.04195360458
+-1.736827054
+-1.766439599
+-0.4984594068
+-4.144234952
+-1.837915681
+-1.143869609
+-3.746846799
+-0.9907136798
+-2.504421491
+3.706147176
+-0.7314113914
+-0.5686370048
+1.284084321
+1.670904951
+-5.208725413
+-1.130352327
+-2.727096979
+-0.4355107326
+-1.608997564
+0.4712083886
+-2.941377737
+-1.703301725
+-1.773479007
+3.247774111
+1.104010978
+1.106666123
+-0.8589548424
+-1.154153556
+1.683008665
+2.332301801
+0.04544035689
+3.424943836
+3.822465083
+-4.994094118
+1.291136654
+-0.1278057855
+1.164866442
+3.347929584
+-2.761614489
+-4.860822307
+3.318574419
+-2.995453935
+-2.058658542
+0.6138626803
+-2.058305463
+-4.776631885
+0.1025693022
+-2.344453977
+1.793579634
+-1.518229668
+-2.065338416
+-0.6300016173
+3.156460431
+2.723712245
+-3.279678547
+8.399122947
+-0.9773289738
+-3.457247187
+2.66469597
+-1.085017372
+6.461158524
+2.542225066
+-0.5961595389
+4.725920633
+2.547345634
+-3.686685591
+2.665182329
+-1.549462326
+-0.2499788557
+0.3931633477
+-2.637288037
+-4.000026837
+1.103352033
+-4.164700496
+-7.72560788
+-2.508316813
+0.9932772645
+-0.8096434007
+3.801392822
+0.5512604863
+-2.298928956
+-1.318750651
+-4.309624078
+3.257391674
+-4.143300258
+-2.761222896
+-0.4808586613
+0.007059793472
+-4.507951091
+-2.716607386
+0.7951218067
+3.389170077
+1.047010686
+-0.07742928477
+-4.687226202
+-1.85202704
+1.564482724
+3.24284001
+2.668127724
+0.4142149333
+3.6138014
+8.644382139
+-1.781585746
+-2.289347386
+4.555448777
+0.7063935762
+0.3369230653
+1.177122983
+-1.963459516
+-3.104385854
+-2.331442529
+3.73783877
+-4.309921994
+1.495963937
+-1.67306238
+-1.060100666
+2.22885293
+2.53196674
+1.028929614
+-5.619358987
+4.712894126
+3.930589552
+0.2743104996
+0.03077345088
+5.404347626
+2.841672814
+-0.08788321072
+-0.8770160276
+-0.580611333
+3.531696163
+3.119975354
+-4.840269034
+1.393927197
+2.592363994
+-4.519389498
+-0.008894254315
+-5.331130819
+0.3884785078
+-6.249703506
+-2.045236571
+-1.833197743
+-2.12654946
+4.354584051
+1.606531709
+-1.198706581
+-2.799233523
+-0.7163289505
+-3.087338905
+2.919240012
+5.990298005
+3.159599694
+0.9950710366
+-0.4968863499
+-1.215318868
+5.235853718
+-1.727806823
+4.683295671
+-3.394617726
+-0.8886949632
+-5.142169778
+0.4777026037
+-3.791182866
+4.99514822
+1.236816815
+1.612190241
+0.8480353475
+-3.277622443
+0.3723548632
+5.511242064
+0.02566477802
+-3.051048605
+-5.55702797
+-2.139980971
+-5.286686693
+2.491552107
+2.343501799
+-2.627045482
+1.841943925
+-1.729363959
+-0.1368428483
+1.115866655
+-1.331880027
+1.254610046
+-5.057184151
+0.352424964
+-0.1048560672
+-6.139179409
+-5.429070578
+-5.578570817
+1.242920502
+0.3718788806
+0.8218727315
+-3.979135478
+3.416921432
+2.948523659
+-2.300889105
+3.528180829
+-0.7527671903
+-5.328615072
+-4.898084298
+2.201170464
+-0.312146432
+2.643674839
+-0.2651193742
+0.8030126801
+6.370579269
+4.190547263
+-1.298481806
+1.124906174
+1.483336329
+2.284173502
+0.2130264156
+-1.480595551
+-0.01086845171
+-1.440861328
+5.050101844
+3.722178717
+-0.6108450566
+1.284876782
+-0.4963777927
+3.579723408
+3.146641549
+1.705832498
+2.613792809
+1.981712424
+3.522185561
+1.59339412
+0.4557015873
+-1.731676871
+-4.715252212
+-0.08354514152
+-2.2231666
+0.1800272009
+3.421465273
+0.5184740263
+-1.245005013
+-2.559385875
+-4.290405622
+3.998416006
+-5.330073057
+-2.804349079
+-6.939605801
+-0.9484247272
+-1.026853679
+-1.212883262
+-0.1893896999
+-2.463795223
+-2.740966921
+5.45347924
+-1.002188845
+2.722975875
+-2.510313128
+4.838185784
+4.542546393
+0.6930560467
+-3.298594779
+0.2610041572
+0.1419135001
+0.7188717423
+-2.934661849
+-4.569000409
+0.4870891121
+-0.030873949
+0.006225065758
+3.080401737
+-4.425481449
+3.032081148
+-2.22968262
+-1.185666198
+-2.47733809
+0.2688595735
+-5.717453624
+-1.704257161
+-1.547269636
+3.791790607
+0.4520944314
+2.086554934
+0.01781644316
+-3.146701114
+2.721614605
+-2.536324026
+-1.578730022
+0.5462993364
+2.836616368
+-0.6041536298
+4.531574196
+-1.714435245
+1.996767861
+0.01084890285
+4.640015515
+0.6432180398
+-5.631938454
+3.265005629
+-0.24464554
+-1.659185733
+3.668894286
+-0.9939259081
+1.799960229
+-2.305149958
+-2.50839038
+5.431745282
+-2.361098212
+-1.754312809
+-5.124962376
+4.889946732
+1.19399497
+0.7133389004
+2.925415232
+-3.988009708
+-1.623140346
+-0.2743131937
+-4.645413152
+3.934281379
+-0.05528715058
+-0.9698659088
+0.7086764687
+-2.257746853
+0.1353390114
+10.28261564
+1.814046091
+5.004933179
+-1.065249367
+-2.25470697
+0.9291107681
+-4.02511483
+-6.920873296
+2.194777515
+1.924014435
+2.501553665
+0.08450961957
+5.9351181
+-0.2619845612
+-1.661894222
+-9.019496145
+-0.141497603
+2.495633355
+0.02058359562
+3.372665203
+6.884643499
+-0.5200506251
+3.693760679
+-4.757557726
+3.093957313
+0.1904714412
+-0.664171495
+-0.49019676
+-0.468910405
+-0.926408728
+0.5960189104
+-0.5228764022
+-3.467377437
+1.251161667
+-1.823603845
+3.143959844
+-0.1014808997
+0.38107186
+-6.14769574
+-3.770040385
+2.818843181
+-2.201450178
+-1.597312977
+-0.8338199018
+4.091227778
+1.122413993
+3.93079381
+-0.8032433926
+0.6395287913
+-3.609730366
+3.534093705
+0.3259446111
+0.1323872964
+1.014946618
+4.340376222
+-0.6434853195
+4.989116873
+-2.554567753
+1.266553824
+6.027655684
+-1.469444194
+0.7357675603
+2.632515189
+-0.4136990967
+-4.501059828
+-3.167878077
+1.742797767
+2.67454596
+2.353666003
+3.439296042
+0.2159555848
+0.6246995121
+-4.556605977
+0.9519868611
+1.838042356
+-1.749633884
+1.932005097
+-5.447666534
+2.253298793
+0.9008529709
+6.331825601
+4.239256611
+4.520941076
+2.452191289
+1.939846842
+-3.544893945
+-1.005273901
+5.480185412
+-4.368493346
+-1.350845504
+-4.257702242
+4.352855442
+-1.697343986
+4.633603098
+-1.241287481
+-1.51239624
+3.835587567
+2.816495179
+-8.148840928
+1.35342237
+1.800500635
+0.6294207927
+-1.972974011
+0.08522533392
+-1.194184443
+0.6339690828
+-0.6071827886
+-1.865784475
+0.4913113389
+2.407316731
+0.8670176772
+-1.66092717
+1.008762061
+3.209377176
+4.786212506
+3.622657752
+1.61214058
+-3.027372094
+-4.096658181
+-0.6071436412
+-4.227554345
+-2.354354187
+-0.5103669143
+-1.452631265
+-0.9837541689
+-3.984013882
+0.6944002794
+2.989524153
+-1.644412403
+2.177266033
+7.988180141
+-0.2754330904
+1.953630024
+0.5903102703
+2.908871188
+-5.15594963
+-3.170870304
+0.4303917842
+2.660887698
+0.3915720776
+-4.993719753
+-2.470839829
+-2.384118353
+1.166975835
+-2.28611688
+-2.042421314
+3.25424273
+4.00594883
+-1.239824416
+1.274708017
+-5.644451396
+0.5949811781
+3.569934149
+1.580345116
+0.3031825331
+-1.16592892
+-1.940376047
+-0.5372472156
+-4.654323415
+4.831376935
+1.692631921
+-0.3073111026
+-1.859414324
+-0.2110188605
+2.393384827
+3.034343674
+-2.71107279
+-2.920586281
+6.234689888
+3.409778573
+2.125559822
+-0.4159387312
+2.772061015
+-3.819699527
+4.595305265
+-0.1073166742
+2.372584506
+1.938653325
+-0.3947127338
+-0.5260990653
+3.664749424
+3.079492214
+-5.31669336
+-5.077217211
+-2.838661861
+-2.680636195
+-3.355577618
+0.8163319298
+-1.391113341
+3.618373865
+4.358633297
+-0.08604971249
+5.050373846
+0.07264293042
+-1.30437194
+0.1943572179
+2.834580006
+-4.843382918
+-0.6257979667
+0.892216981
+1.089253996
+-1.10530903
+1.466357228
+0.8763648539
+-1.77572434
+6.544795887
+1.318650618
+-0.9935500505
+-1.7151571
+3.088226755
+0.3061793732
+7.644338093
+-1.307772369
+-3.727820815
+-0.0830953765
+0.5252023765
+-6.355351904
+-0.9275055431
+-1.105246324
+-1.106290609
+-1.890677243
+-4.029577629
+2.274114154
+-1.751522532
+-3.071104357
+-2.279802803
+-1.416969719
+0.3259413741
+2.005016959
+-2.859538494
+-1.437892193
+-4.036523184
+-10.17689998
+0.4673817922
+4.560010553
+1.56624976
+-1.521179868
+0.2894374278
+-3.524460303
+-0.3668770741
+-1.283127759
+-2.558142696
+1.216956689
+7.799601493
+4.996348519
+-0.216219064
+2.652343964
+2.588122302
+-1.942614077
+1.931712221
+-4.322976296
+-2.415895176
+0.7162586112
+-1.244362987
+5.269435929
+1.944121304
+-1.146114363
+-1.411739139
+0.5609118246
+-3.166593866
+1.78683586
+-4.12590585
+1.869030588
+-0.4937841959
+1.243840554
+-3.037757776
+0.7349556213
+7.237043225
+-1.371650257
+0.952199581
+4.516700849
+2.285112435
+1.295656452
+-3.041067818
+-3.832765117
+0.160297322
+-1.389707566
+-0.05717464133
+0.6169700221
+-2.029283517
+1.482309078
+5.575668566
+-3.028022962
+-1.408639076
+-0.148831976
+3.421379022
+-3.559146002
+-3.195444313
+-6.490983038
+-1.32108664
+2.040437298
+3.195674127
+1.071460984
+-1.802870938
+2.119414841
+0.6129557718
+-5.762116797
+-3.684284498
+4.535595916
+0.9666152489
+-4.124383166
+2.459859324
+3.184304879
+-1.305102088
+1.973046289
+-11.22030191
+2.920730386
+3.525466176
+-3.374108144
+0.8462561985
+-1.014361629
+-0.3075884423
+-1.274641334
+-3.996886401
+5.671211109
+-0.9309325487
+0.3142651328
+-3.028201741
+-3.110601483
+1.237795245
+1.57917624
+2.633772508
+3.311322007
+-0.6306226215
+-1.332609192
+2.240441499
+-1.91231761
+2.615275488
+1.123500862
+3.465079304
+2.011175067
+-3.163337472
+-2.596900925
+2.197455891
+5.721167527
+-3.968435102
+0.06963481298
+0.8450236724
+-4.577332536
+1.434374989
+-0.2793683761
+-6.289672444
+4.865183935
+-2.589624657
+-3.847510243
+1.260424867
+1.672460388
+2.209234211
+-1.158010087
+-0.03274301367
+-2.19242029
+-3.930591917
+3.237391947
+-0.3082880551
+-0.5469427663
+-5.997802776
+-0.5351133128
+-2.527483491
+-0.5238409594
+-0.6577324556
+-1.339394374
+2.816515929
+1.341162457
+3.381463543
+-3.97448211
+-1.946867782
+-0.120842455
+-1.21991691
+-0.2377731765
+-3.546310198
+-2.148534172
+-4.924661865
+-2.670076655
+2.082530161
+-0.6426206543
+4.517259716
+-1.786601623
+0.3572132426
+-3.63975699
+7.802015611
+-0.5358617961
+2.488889521
+1.240155063
+-1.751636445
+-3.992703845
+0.4684293736
+-1.670369233
+-0.4665129045
+1.953906176
+0.2347234675
+1.131348892
+0.4501397282
+-4.401747998
+4.188186587
+3.527556889
+-3.408494563
+1.515901834
+-1.98607281
+-2.240749011
+-0.01452498401
+5.243004691
+3.173872684
+1.815664075
+-3.451816907
+7.663348256
+2.621193137
+-7.04651226
+1.198423006
+-1.466084148
+1.229947068
+1.2019211
+-2.755557229
+5.477657257
+0.5993538643
+2.82404372
+4.054270694
+-2.214472794
+-2.735305454
+3.365722047
+4.178512298
+-4.131055712
+6.033729558
+-0.706509943
+2.075353586
+1.693164627
+-2.914026959
+-2.592144417
+-6.250777018
+-3.453450407
+-4.447427882
+0.1205715473
+4.108206458
+-0.081434792
+1.016562487
+2.33401063
+2.039128323
+-1.1574945
+-4.390035183
+-1.28941653
+0.1888780658
+-2.614935638
+1.085882132
+-0.8781362878
+1.865464583
+-2.409718429
+-2.765902978
+5.322169013
+0.08626871314
+1.658891548
+-3.295266759
+-1.131793366
+2.046508448
+4.696847579
+-2.173455224
+-2.408752234
+-0.06800682103
+-4.573185449
+-0.09039991943
+-0.1941851538
+2.174247451
+4.243829228
+1.709532953
+2.224653153
+0.1568368534
+-1.079233729
+-5.987930607
+-2.658662458
+0.6518000541
+-4.936781171
+0.7286694683
+-1.202504131
+-3.064679558
+-1.41007295
+2.186344564
+2.656503329
+-5.811064222
+-0.4484520364
+2.741653975
+-0.7736845788
+0.3264458127
+-4.486232626
+-1.44010097
+5.486326288
+-2.364204104
+-4.32189703
+0.4484152757
+2.365887999
+3.581431472
+-1.553167926
+0.6674267299
+1.633064635
+1.947631584
+-1.641608232
+5.138174793
+-2.061891068
+2.123616476
+-0.06573370844
+-1.761655692
+-1.928553897
+-1.759040733
+-1.340613195
+-3.056656798
+2.09222911
+-2.110545947
+-1.845062546
+1.466071774
+-0.3238858294
+-4.265710906
+-2.808028496
+-0.5896717333
+-1.724963512
+2.251447612
+-2.293206087
+-2.901381213
+-3.031638626
+1.219971741
+1.450415178
+-5.017333763
+1.86622559
+2.582919811
+-5.072993285
+-2.071294288
+4.286677273
+3.018305118
+0.07437797775
+1.503748189
+6.336058871
+1.50839092
+-3.662426584
+4.094816999
+-2.612816672
+2.981706708
+1.968811983
+2.668540659
+4.622798926
+-4.397742986
+-0.2087656648
+5.838148508
+2.929145234
+0.531475012
+-3.06951939
+0.3201614789
+-2.735643896
+-4.405100869
+1.729436109
+0.195916816
+-2.320538408
+1.184844567
+-1.511669663
+5.338677253
+-0.09171733311
+4.731264637
+-2.438406303
+1.840047496
+5.531099929
+0.8132729466
+3.409342881
+-5.214995605
+2.121404233
+0.09115839439
+2.295005932
+2.602995654
+-6.768750353
+-1.330808219
+-2.010069842
+0.45649257
+-5.821600192
+-3.271526002
+3.005762111
+0.5306773382
+-3.264043624
+-0.7596521012
+3.294819173
+-5.518700358
+-0.6342858406
+-0.6889897299
+0.5609382434
+1.511338399
+5.731027505
+1.661343583
+-1.762444402
+3.773849829
+-2.576005194
+1.308561286
+4.714389154
+3.231944644
+2.43326903
+-6.694612916
+-0.3030075519
+-1.7621252
+3.974604814
+2.521945434
+0.7833185447
+2.383324945
+-1.94884946
+1.902853531
+0.2850079874
+-5.049620421
+1.032138414
+2.121474092
+3.580243755
+1.582165583
+3.020111772
+-5.196981996
+-1.120236489
+-0.4275311912
+-0.9892270943
+-0.2671263585
+-1.732188746
+2.208496438
+-2.973616645
+0.3755238351
+0.2194581395
+0.4318117031
+-2.843172953
+4.197689774
+-0.6783711791
+-4.316562495
+2.403903055
+-0.009994337801
+-0.290824673
+-0.2876143502
+1.186310892
+-0.1597291264
+-2.320498747
+-4.257556524
+0.9103557978
+-4.554620116
+3.359123176
+-2.861582885
+-2.548842066
+-2.945699079
+-4.089233004
+-2.317795679
+-0.8508763568
+-6.982812128
+-7.335682472
+-2.147594782
+2.650190527
+-3.90131957
+-0.2290172522
+4.291670447
+-3.97022575
+-1.315068499
+-2.229457444
+2.675902746
+1.391618296
+1.85298254
+7.489251188
+4.888425668
+-0.2971341051
+-0.6059758658
+-4.346477666
+-5.142494062
+-0.1489247123
+-3.89818639
+1.876066288
+-2.375157863
+-1.748830184
+-4.658041623
+6.330460573
+2.276488647
+-2.129790723
+0.4534410964
+3.969273924
+-2.783475223
+5.719796048
+-3.096524683
+-0.5320844498
+-4.951135187
+-7.615533378
+3.030272342
+0.257106276
+-5.201582941
+-4.921803615
+3.436084199
+-0.4517853256
+4.294329741
+1.909760305
+-0.1996885427
+0.0969899423
+-1.665220942
+0.2933583277
+-0.182954946
+2.512550018
+-0.4902553232
+2.470666476
+2.761896872
+0.5422878209
+-3.938905002
+-0.4814301182
+-5.718223938
+-3.619864864
+2.191254999
+1.484678368
+-0.009626635305
+-0.907299471
+-2.218202839
+-1.538436249
+2.895754552
+1.430037772
+-4.113649481
+0.5965585277
+0.4198884891
+4.94602042
+-5.272655248
+-2.349388617
+2.920877509
+-3.332796673
+7.156864897
+-3.536832666
+0.08736643566
+1.678642674
+2.643111428
+2.145625454
+-1.386232609
+2.739621017
+-2.263957463
+-1.604931428
+1.369927384
+4.528730874
+-0.6845137122
+-2.671024597
+3.629315722
+-3.794400097
+5.514544467
+-2.952248065
+1.92284534
+2.780073677
+2.355102163
+0.6810079129
+0.1485886556
+-4.959541504
+-2.342458913
+2.173934062
+1.9901075
+-3.113643917
+1.04093706
+0.7560929658
+5.252756527
+-1.255203479
+-1.559571804
+-2.770328905
+-2.997835412
+1.124845085
+-2.113023417
+3.224111574
+-1.881897184
+4.601987026
+1.253176374
+0.7751508792
+-3.451285689
+0.9873425586
+0.1365659296
+1.89624781
+-1.532541895
+-4.360889629
+0.8256647967
+0.4193617401
+0.7316770816
+3.016950487
+-2.818921898
+-7.145250413
+1.425081007
+1.217737561
+-1.431168917
+0.5117946047
+-3.143342429
+-6.318591636
+-5.078734345
+0.1270834196
+4.148131244
+-1.168555165
+2.441813731
+-1.782995914
+-0.1663170686
+2.389682172
+0.3995396553
+-1.625035046
+-2.595907091
+-0.2775843748
+3.546306278
+-4.711963781
+2.577992285
+0.8509409784
+-2.907336801
+-0.05512118736
+-0.6121063402
+-2.843221095
+-1.61830533
+-3.768861902
+-6.214570762
+0.453709313
+3.13346835
+4.900047184
+-3.334135644
+6.442095495
+4.5789202
+4.270425102
+-2.356999178
+-1.686754875
+-5.815072254
+0.5734777102
+-1.180808772
+0.4853720642
+-2.503554106
+2.018611404
+1.029564329
+-3.432369239
+-0.1376638365
+0.854053503
+6.025324669
+0.2873425413
+-2.821226991
+-0.9487891553
+-0.09367039762
+-0.4007858659
+-5.524415679
+-0.9947306856
+-2.079926684
+-0.7815388837
+6.362887216
+-2.496871822
+4.313823012
+3.481854433
+2.050493457
+0.009331255114
+1.963180263
+-1.349759335
+-1.639377394
+-2.243585016
+0.8217047728
+-0.6293117459
+-0.718755198
+4.260686438
+-2.114245535
+2.206094686
+-1.565782851
+-4.776585077
+-4.277851344
+-1.474657118
+1.888834469
+1.925359183
+-0.722061458
+1.855265127
+0.2287893302
+-0.7844709577
+2.564193799
+3.563681701
+3.048082178
+-0.920618883
+1.703122884
+-6.387737015
+0.5852007682
+1.083007097
+0.4559255969
+-0.6668181899
+3.914319559
+-0.2797131022
+-0.4186138065
+-0.7228102395
+3.102316138
+-0.8773788714
+-2.503048104
+-0.3262756248
+5.123141274
+-0.9020583446
+1.847314903
+-0.8343322164
+-0.8302404441
+-1.682524151
+-3.648912178
+-0.3293448852
+2.155367258
+4.728578891
+1.325608489
+-2.450583235
+2.2365138
+1.362087522
+4.195089573
+6.268831368
+3.643823266
+-1.178274596
+-0.4776886311
+3.473821588
+-1.523079408
+-0.4214503933
+1.903020722
+3.211818164
+0.6687323077
+-8.677559466
+1.018097894
+-0.936147586
+-2.927762991
+0.07239049836
+3.36139245
+-3.389631688
+4.769768974
+2.936190302
+2.802490875
+-2.444125783
+-0.7537273415
+-1.148504615
+0.001022873801
+-0.186614402
+-0.9520466425
+-0.5337820384
+-0.6348609509
+0.8024515892
+-4.955451106
+1.459735046
+5.091815095
+3.217502542
+-2.837691679
+3.133824071
+6.868883558
+-0.7276687785
+2.163095764
+6.8981412
+3.090886883
+4.652161804
+-3.285676667
+0.7068625739
+1.175907308
+1.692861388
+2.368522639
+0.4685251718
+-3.937182408
+3.198817244
+1.136580986
+-3.535849889
+2.276987462
+1.658940037
+1.611103643
+-0.8605056246
+4.903216935
+1.713679893
+-2.36986218
+-4.628273821
+-2.301996548
+-7.10886988
+-0.7816795321
+0.3868711518
+-3.622999304
+-1.636330773
+4.65984795
+0.321874007
+4.606030632
+-0.5548542512
+-0.53034814
+-6.597762136
+2.187866242
+3.30167472
+-1.027104132
+-0.930912676
+2.439109134
+-2.20889127
+-2.346972957
+0.9512944985
+-1.818754044
+1.833173652
+-2.760928546
+4.528526757
+1.969391053
+0.1975535373
+-2.620891898
+-3.1732617
+-2.691711092
+-4.296609897
+4.021290954
+1.026224517
+3.211884991
+5.217195106
+3.91981807
+1.348850374
+-1.233151337
+2.247898665
+0.6334133074
+-0.7819534221
+-1.545595113
+3.237650329
+4.43238836
+-0.8253261714
+-1.311023139
+2.094509216
+-1.905529196
+1.811030061
+5.210788818
+-1.253503308
+0.07353969661
+5.969079233
+-1.119504939
+0.4231101946
+-2.825446423
+-2.108503789
+-4.136510916
+8.775748752
+1.715255974
+-0.1376266476
+-3.171192874
+-5.47407919
+0.7252148649
+-0.4354554573
+1.505977992
+2.076986523
+3.036825128
+-0.1265313381
+1.866031394
+-1.222608385
+-2.554339196
+-1.014549806
+2.306903221
+1.819493006
+-0.037839427
+0.9672831686
+4.822525028
+-5.407230325
+-3.765203689
+-0.03910127823
+2.101072012
+-0.6458197036
+2.709265365
+-9.022311613
+-6.991401773
+-1.703409863
+8.001966267
+-0.0002050577152
+-6.724346903
+-1.080089198
+1.852481645
+2.886667144
+1.411646734
+-0.7074126162
+2.036367883
+3.460854095
+-1.664198417
+-0.3708022843
+-0.408293118
+-5.116627219
+-3.771289273
+-6.955874964
+0.2530137755
+-0.8930197569
+-1.017098627
+-0.1032112476
+1.557807566
+-2.017749293
+3.520833677
+-4.776688463
+-0.0409476024
+-0.2950364706
+2.549631225
+-1.48495713
+3.206192575
+-0.7015992318
+-0.3054153202
+-0.4472314882
+2.094288727
+2.559444493
+-1.814222388
+-4.226672886
+-2.943304849
+0.495549204
+-0.04993756654
+0.4227980121
+-2.17551639
+2.387222445
+-0.5293156238
+-4.900303589
+0.4660493394
+1.642277995
+0.4312809337
+0.3906629376
+0.6815158544
+-3.161187384
+4.595259073
+-0.9794807512
+4.400535511
+-1.662386603
+2.900026119
+0.7205389462
+0.3009433009
+-2.816374371
+3.617455669
+1.256916032
+-0.2707502099
+3.62212496
+0.2657405922
+6.629416768
+3.05003136
+-0.9921272274
+4.075145664
+0.1825691536
+6.017674321
+0.2449750895
+-0.237628097
+0.2819048993
+1.198520049
+4.647933781
+0.8785707619
+-0.320144775
+-1.480380063
+2.357043887
+-1.663035392
+-3.506490966
+-2.826739321
+-1.394782813
+-0.3733031142
+3.15951621
+-1.731730655
+3.591385357
+-4.913118861
+7.903808403
+-4.759271776
+0.5942611155
+-0.6527400522
+-2.355944166
+2.029226054
+3.171642493
+-0.5165583305
+3.628154736
+0.192173076
+-3.1913399
+-0.2375625174
+-1.582488199
+1.380644315
+-1.197500677
+-0.222549586
+-3.256072327
+3.208069404
+-1.06688527
+-3.208431332
+7.894422906
+-4.238923122
+1.522290917
+-6.490996683
+0.9255682489
+0.5643405601
+-0.7571339061
+-4.090632031
+-2.575592835
+-2.419682324
+-3.522370888
+-2.844137533
+4.305377674
+1.173627037
+3.992482951
+-2.966526311
+-1.293909713
+-5.211148663
+-3.571367197
+-0.8733394431
+-1.261819059
+5.332061327
+0.3241397204
+-0.7952996512
+1.378387776
+0.08063565823
+-3.25711061
+-1.880663232
+4.196870648
+3.911363103
+0.771705955
+3.058455695
+4.928427703
+-1.325177137
+0.5529445194
+0.6632727089
+-2.480440595
+1.339294884
+-3.431034057
+0.3067799555
+-0.8067416755
+1.288641351
+-4.06458364
+-1.563298426
+5.64949244
+-0.4045381527
+0.2044324745
+-2.008714155
+0.1361127805
+1.13931416
+-1.426691947
+-0.7484889011
+-0.4993791801
+0.8872123165
+3.391552006
+-2.007977096
+2.417941982
+2.413817172
+0.764497036
+3.244955258
+0.2972050892
+0.3234488611
+-0.5206573471
+-0.8110913746
+-0.6314944471
+-5.582463522
+1.800820964
+-0.966769209
+-4.40659763
+2.910965962
+-2.926626714
+2.578476408
+-2.224667917
+2.876662766
+5.696763069
+-4.78518792
+-0.7648866253
+2.870425661
+0.8390672091
+0.84508954
+2.746810315
+-2.36658077
+-3.849140878
+-2.141429454
+4.000656486
+-2.291719352
+-4.604874301
+3.470343004
+-1.536544234
+-1.347026276
+-4.181617067
+1.591166209
+1.70389807
+-1.651367568
+-3.581197356
+-5.676300054
+1.704174879
+7.789485843
+1.212968733
+1.824965798
+0.4396836535
+1.048729813
+-0.6990493721
+0.8825659318
+-2.403020549
+-3.722079847
+0.3337159734
+0.2944867304
+-3.523267327
+-1.654294254
+-1.050219084
+2.14735045
+0.4760026468
+-0.502830237
+-4.776647654
+0.8112316776
+1.587597735
+6.594337489
+1.339000308
+2.772332087
+2.800981632
+-5.438106525
+-0.3738540518
+-0.5089360255
+-1.379908575
+2.569601386
+4.880162329
+-2.773408872
+-0.4679825859
+1.274992541
+-2.338654222
+-6.34960853
+-0.6451890772
+-3.312272128
+-5.815376864
+2.705691093
+4.906443871
+1.586778742
+1.247891781
+1.302249044
+-0.2328238955
+1.347506975
+-0.3939057224
+-2.252804946
+3.832955356
+2.246284657
+7.971819147
+-2.455821825
+-4.335453484
+4.025289574
+-0.3155686666
+4.070361735
+6.042042278
+-4.117888945
+-2.572285203
+-5.043865351
+-0.4517959626
+-2.16319199
+-5.822647285
+0.2997151788
+3.845509335
+-2.910238204
+3.736129648
+2.090614122
+-0.1936560569
+-3.173520975
+-1.407666829
+6.385186448
+-1.167722384
+1.708838812
+-0.8228983903
+-3.295250573
+2.069162586
+4.947744726
+3.195397924
+4.827134928
+0.4290500229
+-0.007671285615
+1.583041432
+-0.6678637773
+-1.47445506
+-4.781518526
+3.055119288
+0.1490556478
+-4.805546261
+-5.45523212
+5.314970003
+3.22680985
+1.150208402
+-4.40099238
+-0.7943452883
+-3.096237036
+-1.093305242
+-0.6506226328
+-2.175846141
+-4.181308352
+2.216115953
+0.7480408068
+1.645655335
+3.404694598
+3.308842209
+4.989690701
+2.777598588
+1.377347839
+-1.237036345
+-3.869194046
+1.770777024
+-0.8761818361
+5.992878871
+-1.51365892
+0.8402354994
+0.8539924579
+-4.419701641
+-2.295291504
+-5.959980824
+0.823510861
+0.5600422814
+2.231288884
+-2.175566106
+-3.178576722
+-0.9658880246
+1.239767913
+-3.248982389
+1.145546021
+1.470759257
+2.460949494
+-1.072397006
+0.2614132499
+3.685505688
+-2.09990556
+-0.1147308684
+6.018079201
+0.9121399996
+2.829821212
+0.9014351158
+3.020801475
+1.454040864
+-0.6582594473
+-0.7208531486
+-0.6852588489
+1.973365141
+0.07311629282
+-0.05021486504
+0.2413355259
+0.8234972362
+4.689742867
+-2.779739093
+3.235713858
+-1.278660938
+-1.005155495
+-0.4448777139
+-4.063753856
+-1.904532982
+-0.4076162008
+-1.790312463
+3.89124486
+-2.472441806
+-0.5017577088
+-1.812099257
+3.753876998
+-4.028599857
+1.245752378
+3.590609232
+4.223111487
+0.5306617844
+5.184995735
+-2.855050662
+-1.654730063
+-1.617358305
+0.7718140785
+-6.341795846
+2.845598767
+3.69382826
+-0.8645595949
+3.774590811
+1.721268595
+-2.930623923
+-2.073088572
+-1.521874346
+0.9862592284
+2.82176179
+2.016021041
+-1.86082675
+0.3385488999
+-1.839611438
+4.746812051
+-1.153314288
+-0.2021249958
+-0.8502300275
+-3.598553843
+-0.2371040322
+2.46561902
+-0.5122508157
+-4.953092182
+-0.6258769905
+-2.132841208
+0.1570405615
+2.896079007
+-2.100625437
+-0.4665226348
+0.1390842501
+-4.283026236
+1.058801461
+-0.8824758722
+-2.868935991
+-4.037319801
+-0.1274943294
+2.461506191
+1.472985518
+-3.53412697
+-1.023237629
+1.376040378
+3.578425935
+4.52284658
+0.6477897533
+3.228600971
+-4.198067912
+1.525868208
+4.777277122
+-0.1243280442
+4.127824738
+4.066812386
+1.875975536
+5.02650527
+-0.8705883931
+-0.6869862453
+4.573939292
+1.167584522
+-3.728832916
+0.08129692938
+8.939928515
+-7.106410358
+3.966582475
+-1.526025756
+1.585316296
+2.475650167
+-4.045294803
+-4.674372431
+-2.609596428
+-0.2935149987
+-5.047503446
+1.968778676
+1.776695051
+0.8950052558
+0.674353979
+-3.956633729
+-0.9477133075
+0.1250325447
+2.320552201
+0.3929451167
+5.001477655
+1.873341958
+0.1636841541
+1.357198254
+4.844389137
+-3.380522566
+-1.080252356
+-1.049073073
+-2.012275549
+-2.869740026
+1.793817618
+-1.370323181
+1.833287838
+-1.381361148
+-3.786057631
+3.594141824
+5.395236246
+0.6740365658
+1.569255977
+5.210301132
+1.525960465
+3.495116539
+2.13936095
+3.959930712
+0.9333282519
+0.8967971386
+1.826018098
+-4.048639068
+-2.619949016
+4.083125538
+4.261964283
+1.291122491
+-2.855975032
+3.608303582
+0.239778795
+-3.510783456
+1.858628473
+2.677467014
+2.628344298
+-0.9287427365
+-1.558812717
+-3.920614928
+4.55879656
+0.6385841615
+4.699493643
+-0.7767162028
+5.134466964
+-5.462448597
+0.4904835505
+-2.439351068
+-1.816063739
+-3.982571414
+-1.932514844
+5.726650306
+-1.690635929
+3.247417662
+-5.855732485
+7.323648478
+-0.0518552576
+2.736846083
+3.718975492
+-1.720102202
+1.274668461
+-0.8137800457
+-2.050702635
+-4.61231283
+-0.3041232838
+2.239997152
+2.787545431
+0.6882540229
+1.24321763
+0.9291714748
+-2.212368582
+-4.61075965
+-1.686764487
+-4.79853337
+2.473169791
+7.474458607
+3.035565491
+-0.8437138183
+0.05011952281
+3.461759007
+-1.802745109
+0.3988118013
+-6.509923282
+-3.349676629
+-1.708104017
+1.9088001
+-2.302947689
+1.85543845
+0.5494836605
+5.578053819
+-3.226543905
+-6.057659133
+-7.312393373
+-0.4456905297
+3.453454385
+0.5559701502
+1.975382779
+-0.1486083057
+0.7121965486
+-4.534740969
+5.797110998
+1.447266102
+-3.947349147
+-5.890845188
+1.599204552
+-0.3279696509
+-0.8495502584
+4.301231536
+-1.705851721
+-2.549539389
+2.17333949
+1.817695044
+-3.870775443
+2.368299319
+5.882741233
+-1.006619427
+-1.822836556
+-2.181725643
+2.554226014
+2.665249741
+-3.333969934
+3.413533095
+3.826647838
+0.8837982353
+-6.557038579
+2.377132359
+-4.875124268
+2.219492154
+3.042807323
+2.874624301
+-7.846112777
+-2.184392483
+2.227495402
+-0.2464318803
+-4.574705619
+-1.314537154
+-0.01617497661
+-5.136254586
+5.116758907
+2.433569588
+0.4480827371
+-2.206367045
+-0.938899582
+-1.960248643
+-2.973677211
+0.4468991421
+3.309970803
+-0.5701463957
+-1.236791642
+0.5358605965
+2.345043459
+-1.573921208
+-4.143290094
+2.836428551
+-4.08507324
+1.604962894
+-0.2878778922
+-2.689220651
+4.161544307
+2.992179184
+1.729402912
+1.320002515
+1.426410313
+-2.950732007
+-1.685981135
+-4.923009658
+0.8768482111
+4.299314673
+-1.151133904
+0.712477777
+-1.5982655
+-1.413539529
+-1.020253588
+-4.389616992
+3.415794767
+-0.01507448918
+2.914763092
+0.907023671
+-2.418707119
+-0.9507358438
+-4.760595608
+2.366061252
+0.4116743228
+-2.355541576
+-4.519710632
+-1.72922951
+-3.321865266
+0.4058475944
+-3.158332848
+6.156880275
+2.955926758
+-1.118520354
+-4.458707408
+-0.3349841308
+-5.878846066
+3.182103745
+2.373893843
+4.345934234
+-1.669963527
+2.416693048
+4.152122848
+-1.306994089
+-2.201525497
+4.044339567
+0.4364292792
+1.275893655
+-0.264119466
+-3.745420422
+3.313791665
+-6.088157769
+2.993927755
+-0.8377154054
+-0.5628973546
+-1.597622384
+1.580551328
+1.226235057
+4.834495474
+-0.5522167182
+-0.5461833329
+-1.061385542
+0.3117933174
+-1.346941588
+3.465799154
+4.111200427
+-5.767158338
+-3.866582156
+-3.0563506
+1.984848992
+-2.676115593
+1.655668176
+4.113989905
+2.312656318
+-3.134454762
+-3.59971339
+-8.004184046
+1.470036225
+-3.765116926
+0.1271830944
+0.69236456
+-3.929323221
+2.830178208
+-3.107899998
+-1.782467883
+-3.546827125
+0.1471189374
+-1.993931017
+6.810176377
+-1.93078218
+0.5591214659
+-0.8409442759
+2.659975806
+0.01172706216
+-4.38531397
+0.5966277976
+1.319924757
+-3.837405918
+-3.128381238
+-1.966821322
+0.7714626255
+-1.070427818
+-6.756740575
+-2.280826514
+3.405467796
+1.898043331
+1.961589558
+-0.1682054941
+6.518987759
+-0.2061923308
+-0.6939579004
+-1.417038543
+-1.196063552
+2.346841829
+-6.252000178
+-3.555654442
+4.202332936
+-2.327290607
+-3.382744842
+-0.5017452367
+-2.244895683
+0.8786121878
+-3.588995505
+4.497303542
+-3.93279062
+-0.2518397551
+0.1674624484
+0.7391759291
+-0.1818196863
+-0.01733804817
+-0.2100070972
+3.917050554
+-0.3761962668
+2.890659615
+-2.196794484
+-0.007256373828
+-0.3905111583
+3.001413059
+-1.759805662
+-2.07516761
+-0.4682412431
+-0.0636101608
+-6.307051726
+-2.575442367
+3.330516099
+-0.7637213227
+-0.7248771959
+1.710736245
+1.621605876
+5.217826296
+1.893731408
+-1.320853796
+0.165109775
+2.322312987
+2.885006683
+-2.707871574
+2.009349759
+5.301394747
+-0.5202625873
+0.03393078709
+-2.776387538
+-3.185622048
+0.03460342825
+2.364277102
+-0.89622862
+3.316953529
+2.723407832
+-1.098441046
+2.190281463
+-0.3880226084
+0.2788498081
+3.221575594
+7.31605199
+-4.188646099
+-0.9909936581
+3.480780213
+-0.7327232906
+-1.288087089
+5.003067538
+-0.1825094173
+2.36189421
+-0.9280077019
+-4.675912887
+-1.533304047
+2.051298109
+0.5789468128
+-2.393583297
+6.191614807
+0.3536861535
+-2.986080047
+3.898537235
+2.749808616
+-1.67980288
+1.962523285
+2.371641401
+1.387023944
+0.389563169
+-5.304233941
+-0.9701418199
+-0.1587435979
+-1.750088507
+-1.068737851
+2.104521387
+-1.496108639
+-5.088515991
+-1.877485444
+-1.60675113
+-0.4856740288
+-3.68028089
+-0.9319143399
+-2.630581224
+2.338641536
+-0.5806164968
+1.642705635
+0.8304357763
+-3.853711985
+-0.1270785926
+5.009653038
+-4.832551258
+2.843540263
+0.2959390899
+-4.531992525
+1.720248571
+3.010363194
+-0.1829724942
+0.921495404
+5.467177534
+-1.816253244
+5.484046025
+4.925364926
+-3.97587984
+0.3706229683
+0.2007969854
+3.880231275
+3.5072369
+4.530478259
+-4.857970013
+4.131467141
+1.703749505
+-5.516018777
+3.93924777
+-3.321276528
+2.318876585
+-1.758245655
+-0.617518892
+1.33081199
+-0.6290951759
+-4.356518227
+0.9174085498
+-3.457559939
+1.63306668
+-3.756809453
+0.4180006271
+1.092623699
+6.041152039
+-5.812792228
+0.9484806012
+-3.781008659
+1.435838732
+-0.3367432942
+2.307542712
+4.248557059
+-1.012391994
+-0.04011042153
+2.712426853
+-1.587423428
+1.2094929
+2.516576822
+-3.228563548
+-4.574917633
+0.5271387404
+2.630178778
+-4.514900599
+1.473281428
+-1.09617812
+-0.5148106293
+3.094977167
+0.4215136006
+-2.565254289
+-0.03676492599
+-0.7008666961
+-0.8434490361
+3.538005822
+-1.964063642
+-2.379337149
+0.7513606407
+1.916737758
+-0.4015123255
+-3.694654889
+0.326239287
+7.272764598
+1.698939883
+-4.986659831
+-2.854936504
+0.2805020769
+1.625481128
+-2.08702067
+6.492518788
+1.613557599
+0.9979315984
+3.770840539
+0.7368567935
+-5.896383007
+-1.182668142
+-1.917860035
+-1.011919312
+0.3420858869
+2.077521161
+-2.321290039
+-2.295677278
+-0.232919225
+1.727010937
+1.653101975
+1.800880158
+3.32867479
+-1.082955766
+3.360385891
+1.00363274
+0.473688864
+5.404333406
+-0.9562345603
+-2.298796903
+4.39545266
+-0.1345777021
+3.315895858
+1.195432596
+-5.257256774
+0.8430688856
+1.873827635
+-0.2176388178
+1.870053142
+3.576526161
+4.414596664
+2.375913133
+-2.534271303
+0.3724333156
+-2.141711132
+-1.381268374
+-1.427044966
+-0.160196875
+0.665638719
+6.251679943
+0.7425450462
+5.348238135
+-0.04046711379
+2.3039145
+-1.066475111
+0.1086360873
+-2.149930242
+2.078227495
+-2.337401967
+-0.8922637841
+0.6610082539
+1.304952508
+1.574710602
+-1.421371386
+-4.077960374
+-6.779927024
+-2.680443282
+-1.97014591
+-2.078971076
+-2.524961163
+1.381861103
+-0.8247064778
+-0.4114592588
+-2.358853117
+4.895338107
+-0.8280772236
+-7.053458453
+-2.33170068
+-3.985135142
+-4.203591598
+1.388078629
+7.145059218
+-3.626957468
+-1.256602335
+-2.355964256
+-6.493654267
+3.43374357
+-2.851505389
+2.292369645
+3.958469311
+-0.3609740239
+-3.162928638
+-8.276782573
+1.979266253
+6.430216534
+-1.352630817
+1.395322396
+-1.163232048
+-1.820206704
+4.609676665
+0.5134706904
+0.04068965573
+0.3855654836
+0.3713553071
+-4.838059732
+-0.5097187873
+5.156373404
+2.385828198
+-1.686558569
+0.5818508192
+3.780922807
+0.9978694417
+7.487983687
+1.004617498
+0.7322553935
+-3.244423626
+-5.013631763
+3.088354514
+-1.186656901
+-2.294345915
+1.692004528
+-1.841787923
+2.116909838
+0.7232169791
+-1.875793644
+0.7727879123
+-4.429499698
+1.318891555
+-1.540231387
+-0.1107195641
+3.70219365
+0.09328179552
+-1.963863113
+2.959287351
+-0.1366722007
+3.609846328
+-2.237586986
+-0.893536836
+-2.946705908
+-3.965475706
+0.4900704579
+-1.87490171
+-2.225137242
+0.4086683392
+-3.178348281
+-0.2429218175
+-1.573644546
+5.514797545
+-2.508214575
+-4.077473658
+-1.660479518
+0.4642097097
+-2.633583826
+-1.663569415
+-3.827667494
+-2.541826794
+1.018470422
+2.660351816
+1.191002433
+2.888878928
+-0.2391807009
+1.934528388
+1.214015553
+-0.06384897857
+-7.314397679
+-0.497131634
+2.767065261
+-2.416467439
+5.45297607
+2.479738405
+4.555553077
+5.29035981
+-6.30203878
+2.871937213
+0.743625803
+3.547715501
+2.93555802
+-1.719493283
+-2.953338199
+-2.98255906
+0.5079242937
+-2.795142831
+-2.863089484
+-1.837819573
+0.9794270498
+-2.404708486
+3.145639071
+-2.344735567
+4.102450378
+-3.06427799
+-0.6027422666
+0.3076563176
+-2.890828153
+-2.203897896
+0.7406504995
+-1.398484797
+-1.701795418
+-1.250316276
+0.5484066624
+-2.518252076
+4.990263443
+-5.6509368
+0.1172115216
+-0.4463545349
+-1.068526708
+-4.204115981
+1.859672164
+-5.014691498
+1.566036358
+-0.3082208725
+-1.616982718
+-3.835157489
+-2.163960972
+-7.053933473
+1.851518406
+0.4142832366
+1.537624454
+-3.603359625
+-1.78924497
+1.78540585
+0.7017209006
+3.301894246
+1.274207448
+1.01172884
+0.4168094113
+4.21783114
+-1.435060259
+-1.934755915
+0.03945010144
+-0.1124279907
+-0.730842424
+2.63821325
+1.161790428
+-1.51276492
+6.473104289
+-1.707857006
+1.76695915
+-2.555729893
+-1.621863022
+-1.05377534
+5.577617374
+0.3213835424
+0.5643644893
+-4.316332049
+0.6835437182
+-3.090515521
+-2.02858866
+1.331986731
+-1.413477357
+4.54031961
+3.87621326
+0.5551519635
+0.2173048921
+-0.5428932801
+0.9714423111
+1.41013314
+-0.7629786338
+-3.492664031
+0.7701883191
+0.5306144459
+-2.022366535
+-0.1632077425
+-2.45027792
+1.807989086
+0.471502079
+0.5545077397
+2.173871473
+6.57490241
+0.1185877268
+1.765590047
+3.258709552
+-0.2800354633
+2.692267628
+3.763814728
+0.03725129035
+8.525302034
+-5.241750049
+-2.318132168
+-3.494626046
+3.446660051
+0.8352195827
+-2.246483785
+2.396284851
+-0.8748004287
+7.890170472
+-1.512284109
+3.267261918
+-3.021096102
+1.616995813
+-1.34970632
+-3.901889902
+-6.150071636
+-0.8557111029
+2.945611907
+0.1176176305
+-4.248476219
+4.231864632
+1.274264611
+2.346682514
+1.341339569
+7.610742594
+0.5415719781
+-2.40184617
+3.239458861
+-6.548602073
+0.8649304559
+-1.136209342
+3.848943632
+0.1390568134
+-2.265727925
+0.4174859187
+-3.924513354
+5.542242059
+-0.6896998291
+2.066838548
+-1.887650553
+1.318854337
+-0.2509406638
+5.779663906
+-4.415224624
+-1.23990392
+-1.526900505
+-3.693150068
+-0.3856967886
+2.560910931
+-2.183255052
+-0.03788733496
+1.363234798
+1.649431215
+-1.553929135
+-7.237085101
+-1.340973892
+6.208426175
+-2.818272956
+-3.156372501
+0.6110889176
+0.02139357629
+-2.061151206
+-0.04674601261
+-0.4942345587
+1.117453161
+1.325339146
+-3.248880861
+2.08711976
+-0.6602655853
+-1.915280119
+3.135136854
+-0.08260272111
+-1.079896529
+-0.7888079242
+1.586293253
+0.5487531899
+2.030494872
+-5.479036778
+3.391140664
+-0.2526884368
+1.664066588
+4.19208194
+4.10954234
+-4.119223659
+3.045359281
+0.7941583622
+3.094567746
+-4.735375871
+-2.972289752
+0.7701783071
+-2.698883409
+-1.160326221
+4.229318184
+6.689921738
+-0.5688552917
+2.857399879
+0.5106282023
+2.819654439
+1.596485714
+-3.716323754
+3.868296126
+-2.574618012
+-3.902393324
+3.594561281
+-1.009950244
+2.525842358
+1.630116747
+-2.888962801
+-4.802865831
+5.272011907
+2.080785927
+4.396441112
+-0.5392152196
+3.731273877
+5.137708762
+-0.7470134902
+-0.8059210826
+0.2791144359
+-0.1126855058
+-7.980065753
+-2.852738501
+0.8419180909
+0.8810420736
+0.7701940179
+-0.904277116
+-6.099861314
+0.369129612
+0.6411812645
+-2.72260716
+1.05807682
+0.7690740665
+-1.622329279
+-0.3710206167
+2.511073289
+0.8792618311
+-2.794101478
+4.701482212
+3.484652204
+-2.450283894
+-2.154629136
+-1.900128087
+1.756918135
+2.034265704
+1.767094266
+2.137078002
+-3.854686743
+-1.682790919
+-5.734249893
+2.513674555
+3.047152198
+3.28594032
+-1.200252463
+1.003072434
+1.158962952
+4.550005519
+-5.7374062
+2.227261108
+-1.014712403
+-1.052945393
+1.891131111
+1.293247728
+-2.549116147
+1.566413679
+1.213818627
+4.950767343
+0.7476625014
+2.35247552
+-4.447260083
+-1.363637022
+-2.916821506
+-0.1528043413
+5.122360472
+-5.176255135
+-0.9270050977
+-0.1361376269
+-1.517456647
+4.161479293
+3.362314421
+3.037281312
+-0.9112208701
+-0.3162264614
+1.57130508
+0.428922995
+-2.456243993
+2.237492002
+-6.331101096
+3.218470604
+5.193854138
+1.077914476
+2.629748835
+-0.08471785007
+-3.112207334
+4.048591889
+-2.63943219
+6.644458423
+-1.060609138
+0.1904510515
+0.01934061547
+1.230742931
+-1.733027272
+-0.984705908
+3.637089837
+-4.294242787
+-2.047170464
+-2.659388174
+-0.3197067974
+0.2019903951
+-0.6224847307
+0.873647554
+2.86043868
+2.393591816
+-0.5104219947
+0.6860351136
+-2.610307769
+3.966657961
+0.5445165521
+-7.318227731
+-1.042236924
+-2.720956135
+2.964452101
+-1.783196329
+-2.033079845
+-1.51640441
+-5.268062894
+-4.389976334
+1.596947102
+-2.400083363
+3.504992349
+-3.134302979
+0.1907122986
+-1.007047194
+-3.442943116
+0.4289408156
+-1.944817651
+0.02167749764
+1.307766562
+-2.66355719
+7.396189491
+-1.759673162
+2.362450892
+-0.2316559249
+0.2719996914
+0.5223975615
+-2.144833312
+-0.1303566377
+0.07193022735
+0.5022710869
+-1.146088104
+-0.09784249835
+-3.844947345
+-0.8691768474
+-1.78408494
+0.1291706225
+1.124852033
+0.03635474799
+5.290448557
+-4.053142126
+3.564450647
+1.474551019
+0.002801992607
+-5.674077441
+1.360963378
+-1.117008648
+0.6937821192
+-4.24108019
+-1.752151643
+-0.3193275962
+4.128608129
+-1.27535591
+-5.722745564
+0.8482111621
+4.485761431
+-0.8927945921
+-2.238342033
+0.9673316983
+-4.224805778
+0.4381302296
+-0.46463643
+-0.7732522618
+-0.6232927807
+-2.024202062
+-1.548517343
+-2.228293193
+0.7983161237
+0.2086765525
+-1.458120636
+1.573467095
+1.419212217
+5.287029359
+2.697336925
+-0.05529689808
+-3.151215649
+0.7654996475
+-3.561277416
+1.978071478
+-0.9409286007
+3.65309092
+-3.262396538
+-0.1546168273
+0.6183893981
+-1.879581135
+4.1765004
+8.477311502
+3.100671831
+-2.425943518
+-3.270382502
+-0.9320027624
+-0.4897885513
+-1.381023939
+-4.002423479
+1.546356635
+-1.469835974
+0.9098512766
+7.358989187
+-5.620903018
+-0.2043260709
+0.1716810432
+0.0132638389
+-0.1960771023
+0.7015081794
+-3.41759958
+-0.03119960734
+-1.56281819
+-3.26766363
+-1.038610009
+-5.536221656
+-7.796766767
+0.5946649845
+-1.452540762
+0.6210863188
+2.264961231
+4.078260778
+2.088216134
+2.046604166
+-0.03364247465
+4.034281191
+-2.494477198
+-1.223915452
+-3.992411659
+1.057795863
+-1.613654249
+1.180333292
+0.8595548115
+6.127608702
+-2.758383552
+0.3440100876
+-0.4122711111
+4.096580774
+-0.7849150421
+-3.858722732
+-4.963972469
+0.1116982196
+3.810903902
+-0.4298298349
+2.385765644
+-0.2162174267
+-2.227272017
+3.676961831
+-6.616164321
+-1.59191287
+0.5046431324
+-2.906538427
+0.9289620697
+2.820323606
+-0.4901710354
+-0.9626469348
+-1.210292359
+-1.99220016
+-0.3488623607
+-1.249213458
+-0.6318736637
+7.835400073
+-2.451288347
+0.6890803633
+0.4058591524
+6.045928405
+-2.950784374
+-0.1195196399
+-2.129956808
+0.7557107871
+3.030153163
+-2.240984223
+-0.681419894
+2.527401809
+-0.008536001908
+0.1719578023
+-2.373464336
+4.534522403
+-1.287611744
+-0.8444703858
+-0.8959515222
+2.914088652
+3.497802436
+-0.5535171637
+0.01975555386
+1.519644857
+0.587348372
+2.355647932
+3.297752466
+-1.914476365
+-0.677433256
+-0.155672619
+-1.473107641
+-6.73797006
+-2.395532612
+-2.428181146
+0.7212940122
+1.313087337
+0.9064902829
+0.8304360756
+-2.736933145
+-4.390931175
+2.403329979
+-4.432790731
+5.880858669
+0.8759950829
+0.3447086487
+1.167885564
+-1.385550722
+2.166062888
+-0.4001280273
+-2.513835515
+1.3322519
+8.170720474
+-3.347475369
+-0.68326335
+3.995138956
+-1.476437463
+4.077138222
+3.254317979
+0.04684806306
+-0.5202847512
+2.820852122
+-2.332392763
+2.282689477
+4.205257837
+3.694959999
+3.003474364
+-2.934154716
+2.033868058
+-0.2083922143
+-3.172083099
+-0.4203628629
+-4.300485672
+-0.5372436486
+-0.3691279068
+1.614586138
+3.196434279
+-4.203960505
+-3.982811191
+-6.138947664
+2.51560084
+-2.06079316
+-1.686039587
+-0.1328649315
+-0.01421028778
+2.052557762
+-6.480812637
+-0.5920779438
+-3.697597999
+5.075518913
+1.593863361
+1.055906519
+6.516276305
+-0.4386207343
+2.688585
+-4.383603738
+0.6042359613
+6.82396802
+1.494032515
+-2.255564999
+-2.926788117
+-4.721599064
+1.330912441
+2.583154985
+0.3813185158
+-2.434039963
+0.7254616051
+-2.060228432
+3.662204114
+-1.232607097
+-2.648307125
+-1.636885469
+1.160400425
+-3.691473824
+2.001087933
+-0.8137833901
+0.2454605142
+-0.3898975682
+6.792176515
+-0.5085161021
+2.535676276
+7.359686982
+1.277256895
+5.542787574
+0.2923642637
+2.390119908
+-1.76612423
+-3.336536783
+-2.906313122
+-0.07246533584
+0.857215215
+-3.350709381
+-4.13506899
+-5.630184361
+6.380127487
+0.3227796479
+-6.435804523
+-0.02727318911
+-0.4778125222
+-4.131520403
+3.477934642
+-1.372087374
+0.1238797756
+-0.8529369796
+0.1391562393
+3.052598813
+1.817011965
+-1.355660483
+4.726464474
+4.620579263
+-4.389607797
+-3.343648466
+-1.833492686
+4.57525267
+-0.5481396023
+-1.715763996
+-0.1019810985
+-0.672428303
+-0.467935967
+-3.208912351
+-2.379476238
+-0.8014835454
+4.144727282
+3.867483892
+2.747060142
+1.089978583
+-7.835626728
+5.341102084
+3.354036541
+-1.10795808
+-1.945150114
+0.5582160804
+0.134130143
+-2.078020155
+4.481941577
+-1.965160226
+0.7496136272
+-3.612754504
+-0.7658678775
+3.246798479
+0.1277089359
+-1.760739993
+-5.844528428
+-1.022974026
+-1.063960924
+2.200037781
+3.96665658
+-3.655712816
+2.405071654
+-2.906208745
+3.448013499
+-1.310386627
+1.671837255
+4.646488413
+-5.11101053
+0.4405757411
+4.732183939
+2.337364918
+6.497824076
+-1.488744199
+3.255631397
+2.155320573
+0.1517648725
+-3.036958674
+0.6711970888
+5.801280306
+3.749642432
+1.465248238
+-1.481751731
+-4.222537555
+-0.5970895487
+-2.726961317
+-1.067729369
+3.307883808
+3.675723174
+3.261532675
+1.63246268
+-1.589389062
+1.316994051
+-5.180124184
+3.312138166
+-3.298028751
+4.002409647
+-1.900633927
+6.699342673
+-0.7915739144
+-0.3470915911
+2.28720069
+-4.025598357
+0.6557992764
+-3.015849215
+2.030552259
+1.499269121
+0.6729906095
+3.708546987
+0.4304911009
+-6.584299368
+-2.259648913
+-2.878744674
+1.990157667
+-0.607079866
+-1.929087181
+-2.440357592
+-1.024852302
+1.26552019
+2.66852005
+0.1125189011
+-1.328636595
+0.1177541463
+-3.633298871
+-1.373768391
+4.285838873
+3.216613286
+6.709390036
+-2.199605588
+7.800728055
+-1.520553729
+-1.959457229
+0.8909928446
+1.473910942
+0.5827212816
+-0.2327241521
+6.185479112
+-3.593830519
+-3.289647831
+0.6385137997
+-0.2919179243
+0.1527403473
+6.953644573
+5.01503736
+1.929803181
+-2.29759644
+0.76531026
+-5.225487052
+-2.546528523
+2.249249156
+-2.818422775
+-1.842177682
+0.6726461506
+-8.812391233
+0.6378872036
+0.9405638259
+1.703477877
+5.047980603
+-1.548859637
+-0.6175644671
+-2.35783601
+-1.86265438
+-2.166913204
+-2.158011613
+-5.882605774
+-3.425125372
+2.387629971
+-1.020550078
+-1.476450546
+-1.30488568
+0.9413739058
+-3.981492122
+2.731859655
+-6.238458401
+3.053362067
+1.280023679
+-6.177239595
+0.2596994648
+1.199906186
+-3.582520531
+-0.1967894595
+-4.550205557
+2.603630061
+2.112106515
+-0.04248903705
+-7.654011976
+-0.1773138599
+-0.5347898975
+-2.016393352
+-4.373208197
+-2.524582153
+-1.477284293
+-0.3163773844
+1.976119617
+1.88327821
+0.608117335
+-3.085849385
+0.5995784888
+1.971536504
+2.071434663
+2.876854874
+-6.966201638
+-4.329460835
+-1.179316628
+2.35148075
+2.52932385
+-1.882486046
+6.240616003
+-5.587049256
+-0.9755615367
+2.075579738
+-1.393401572
+-2.816749527
+3.63701647
+-0.3916816085
+0.6369270189
+3.603863747
+-2.398293954
+0.6086051412
+-1.245945524
+-3.595135169
+3.204404818
+1.616953933
+0.8538523036
+0.2476457318
+4.218602205
+-7.741077765
+-0.8639927486
+-4.362452983
+0.7272447883
+3.671395009
+-2.55368497
+4.579761743
+1.108352964
+2.345208812
+2.422758698
+1.185728434
+-2.808865484
+-2.174159119
+-0.09840398796
+-1.414839764
+1.691306027
+-6.803781962
+1.027961964
+-0.2939017199
+-0.7207338409
+-0.2889110135
+-6.583159321
+2.08282851
+0.08736419741
+7.359106349
+2.156379538
+0.6401738661
+-3.26236857
+-2.662025604
+-2.820914369
+5.766356175
+-2.480091592
+-4.567091557
+2.766072357
+2.618888871
+-0.3016497932
+2.821366077
+0.8248144688
+-3.82056619
+6.320990027
+-6.64487163
+-1.02686417
+4.400491364
+5.910872678
+-2.775277581
+-0.01821424497
+-2.964875535
+4.466310779
+0.8412326843
+-1.046732589
+1.662757703
+-4.626723708
+-3.772591654
+0.8145070983
+3.87068555
+-0.7396219089
+1.027437574
+-3.091298486
+5.294826655
+2.542678574
+4.004036387
+5.024199774
+-0.7106429519
+-1.06710438
+-6.097489915
+-1.328504863
+2.014331616
+3.253083842
+0.8294055792
+-0.3466443189
+2.965119266
+1.233881966
+-1.881020215
+-0.4381687703
+0.8187923623
+-3.296830379
+-8.271791501
+2.268407517
+-2.94830497
+2.732546777
+1.981240592
+-0.3867973297
+5.484037111
+2.027882923
+-1.05586658
+4.864578446
+-3.264797356
+-7.58140921
+-1.071399155
+2.843929691
+1.310646087
+-0.8151855711
+2.09809914
+-2.334066458
+-3.559106184
+-1.675111461
+-2.207929777
+-3.075570401
+-0.4916712645
+3.753136582
+-0.951762839
+-2.762823952
+-1.613471319
+-0.6730711048
+1.672030452
+2.33651183
+5.299696823
+-1.694435359
+1.522070661
+-0.563275335
+-3.009270734
+0.006050447237
+-6.627191304
+-1.175913369
+-0.2678804634
+-0.8304226325
+-2.214876578
+1.434506069
+-1.581369231
+-2.569548936
+-0.03446587192
+-1.022904272
+2.766110853
+1.364471773
+3.331531127
+-2.562137671
+-1.602714256
+-0.4761707624
+1.135972925
+4.867691554
+-7.216535629
+-2.900181453
+2.117312335
+0.6506314092
+-5.56172007
+-3.936267525
+-3.495961305
+-1.612336518
+-1.48543328
+1.831827817
+4.395209774
+0.8500360593
+0.01023007547
+-1.380481509
+-2.123236191
+-0.4859674431
+-1.1132204
+3.657321199
+4.441925563
+-3.260612329
+-6.194612031
+-2.737282723
+-5.967859276
+2.68543897
+2.432898473
+2.389113127
+2.287911904
+2.009708537
+3.929982529
+0.533782059
+1.194030984
+-0.6670889942
+2.226087867
+-7.217282028
+2.227619563
+2.321943505
+5.42103051
+-4.153998384
+0.5640043859
+-0.572854028
+-4.552211372
+3.7330113
+1.327446604
+2.245445526
+-5.507872133
+-3.288460868
+-1.560347937
+-1.432116139
+-6.364168313
+-2.374660606
+-0.506314043
+-1.169735751
+0.868793683
+-1.053364583
+-4.046343962
+-0.2790718392
+1.108971622
+-1.178356953
+0.4537667488
+8.834952943
+4.886453772
+-1.039255714
+-3.056298343
+0.40398607
+-0.4221166516
+-0.7829309273
+2.451146294
+0.2212615568
+1.794639022
+0.4489808992
+8.160255629
+-4.841351694
+4.569016457
+-7.15504869
+2.750132729
+-3.254095945
+0.5506285363
+5.54639847
+1.19684136
+2.67588995
+3.694502034
+-0.07024239684
+-2.244607056
+0.4463858032
+1.31444447
+1.150962593
+4.647406692
+-2.179750539
+2.925587591
+-3.854362516
+6.312556199
+0.6817711927
+-3.387498899
+-0.8439959004
+-2.218250101
+-7.752963318
+-3.5299429
+2.913604319
+-3.720066753
+2.035713522
+2.34180501
+2.793030486
+0.6924085276
+-2.856560427
+-3.170813733
+0.03031344756
+3.872433295
+2.530305506
+-3.094238614
+-4.145159837
+-0.1712153788
+1.229408245
+2.16855714
+-0.4858248708
+-0.3383864628
+-4.081613105
+5.087953688
+-0.3057456869
+3.257237062
+-0.5791870223
+1.53910757
+0.6080003663
+2.345580468
+-1.78679248
+0.5817217667
+-0.7383542319
+-0.8858733286
+3.307476446
+1.325732225
+-3.535550112
+-0.4021112505
+-1.12755526
+0.3496664728
+-3.41095017
+2.916885196
+0.5098526302
+-3.449286437
+-1.673294213
+7.297667386
+6.090190476
+0.951654135
+3.126164891
+4.19100813
+-4.158095208
+2.026947988
+-0.6264067512
+0.1248369851
+-1.094377732
+-4.147986751
+0.09814261438
+-5.190134707
+-1.836109609
+3.497601262
+2.354634661
+-1.600153043
+4.110577838
+-1.819197599
+-2.726021062
+6.854655991
+2.064917478
+1.987190202
+2.666689337
+1.633121565
+-2.179562165
+-2.060840384
+1.007728091
+1.465486032
+2.764561929
+-0.3289004999
+5.543901255
+-3.975460553
+5.790407927
+4.209870339
+0.9807286086
+0.9207363088
+-0.7354102685
+-2.450943822
+-1.34907993
+1.219512557
+6.722079272
+2.656324822
+-4.320446663
+-2.993191451
+2.821294474
+0.08304038319
+-3.08917318
+-2.87758394
+-3.573141099
+5.266546089
+-0.1373827239
+-0.04613104481
+-1.02721318
+-1.807386524
+-4.522831254
+0.9504778996
+3.896911493
+-1.031355885
+1.080182313
+3.44227896
+2.482978709
+-2.384587853
+-0.9644577543
+0.4498403282
+5.074517859
+3.732864885
+-0.3351691304
+-5.659800134
+-0.1958297361
+-2.545235295
+2.747379865
+-2.643047702
+-2.030067804
+0.2152620178
+-0.2830986527
+-2.643045399
+4.541774632
+-3.195837068
+-9.207620483
+-5.170063436
+0.6436174627
+-0.2285056928
+-4.957479979
+-5.57732463
+0.01933398079
+4.330559732
+1.316368004
+-2.488541339
+1.336881832
+-2.489293577
+-6.853849305
+0.9201426938
+0.7154927325
+2.794032297
+2.214882847
+-0.08215064057
+2.294550508
+-2.49518128
+-4.232571567
+-5.394836397
+-2.094476464
+1.820705849
+2.550561048
+-2.552704442
+1.315100951
+1.874539216
+2.621835179
+1.142060517
+-2.890352971
+-0.3159940445
+-3.151453264
+-3.651956427
+4.413032359
+2.001175058
+0.07721576536
+-2.763419959
+-1.612273844
+-0.1111366097
+2.704801503
+1.872886966
+-0.0150446225
+2.515047703
+-1.969709162
+5.485825012
+1.736705752
+-6.953349232
+-1.757560958
+-1.021132241
+5.163582096
+-0.1210935776
+-0.001716104749
+2.951175293
+3.511381504
+-6.165169133
+1.797224969
+-3.917431452
+-0.3099990273
+-0.9950705456
+2.712135946
+8.8691963
+-4.754277118
+1.491289044
+3.796990925
+-0.5460703279
+-1.91371178
+5.292605331
+-1.060564654
+-1.171394033
+0.2457709509
+-1.488135549
+1.920301423
+-3.459841184
+-2.161845742
+-1.207457994
+2.227977007
+2.00831986
+4.304353008
+-0.919688209
+1.103731906
+3.804462876
+0.1963581306
+2.503706373
+-3.346954214
+2.542973006
+0.7157137949
+-1.390762874
+-3.437263228
+-0.0562525233
+1.616148177
+0.7646039688
+-0.2747314681
+3.205436763
+3.255640415
+-2.518225218
+-0.5429091816
+-1.177292044
+0.4352813724
+-0.1761253704
+2.059410226
+-3.125303714
+0.889022321
+8.852387059
+-5.775204417
+-0.4300712554
+-3.559120715
+0.5599967248
+2.878390338
+0.9523446464
+4.360029504
+1.70119143
+3.928646767
+0.3998991687
+-2.898870204
+1.079295458
+0.4808346406
+0.6215207034
+2.548911241
+-2.16291192
+0.3568079504
+-2.263477992
+2.622965066
+-2.004505177
+1.015018632
+-3.567393516
+-0.06217226342
+1.080290685
+3.247165031
+1.317256423
+2.001946834
+-0.5788641699
+-0.1354257167
+-1.372791256
+0.8061062297
+1.624239226
+1.681098748
+1.3902694
+3.893419071
+-0.6927287108
+5.13653108
+0.7452829608
+-2.21604911
+0.9912950008
+-0.173417285
+-0.09174836677
+2.82388039
+-1.795446702
+-2.941065072
+0.6210623631
+-1.965065746
+0.3960524419
+2.37006563
+-4.106711871
+2.814145195
+1.454194061
+0.7300190751
+-4.292115592
+-3.2018466
+-2.27126443
+-1.425031578
+0.2423075103
+3.887043463
+1.590248794
+-1.273904457
+-1.802239702
+4.130961457
+1.242032875
+3.083284488
+-2.474584153
+0.7713322415
+-2.129069981
+-0.4560079798
+-1.868671302
+-0.4202944087
+-0.5829179155
+-4.104349271
+-3.491977674
+1.292471096
+0.4017208173
+-2.435013004
+-1.58483562
+1.388401885
+3.939710678
+2.499525851
+-0.605676905
+0.2799324638
+-3.029917332
+1.251158167
+1.299624283
+-0.6001894419
+-1.445774391
+0.158026784
+1.771296453
+1.258463063
+4.314161603
+-0.6275010237
+0.4216477443
+2.536638434
+-0.4730587123
+2.374215868
+1.680935205
+1.867789843
+-1.948536279
+4.817320627
+-4.369546726
+-0.4777401341
+2.835820762
+-3.452797261
+3.558702504
+-2.769602637
+-4.460469167
+3.866120571
+-1.511940158
+-2.788071282
+4.234249248
+-3.914407045
+-1.577882182
+0.4424777085
+-1.916588122
+-1.363380989
+4.802045505
+5.69432321
+3.885668159
+-2.031152611
+-0.1029397426
+0.1273223104
+0.1780996072
+0.3375848675
+0.5164591234
+0.6971228688
+3.021417357
+3.485653173
+6.221431768
+-4.655210552
+1.737877667
+-4.590410309
+-2.82376615
+4.64329868
+-0.4766599966
+-1.542374069
+-0.4822733823
+1.765726592
+2.249856437
+-3.245933151
+0.8602743431
+-2.527878558
+-1.339930481
+-2.149805386
+4.545568399
+-1.089163912
+-3.885713576
+0.6699391798
+2.10688745
+3.899397505
+-0.6557657955
+-1.067794236
+2.797229325
+-3.518914717
+2.609697197
+1.054593806
+1.604218391
+1.75301258
+-2.713349073
+0.6132549238
+-3.388083521
+3.217890266
+-1.746865301
+3.7134537
+0.8681033069
+-3.013751022
+-3.097597078
+-2.703215379
+-1.544634492
+1.25356272
+-6.146498276
+-2.969233165
+-1.014882569
+4.511479508
+-0.7746268539
+-0.4637869253
+-4.967481077
+-0.2806637589
+-3.270243023
+2.334024528
+6.506861751
+1.762446441
+-3.304332647
+1.942866228
+-2.593817654
+-0.9574620067
+0.413733035
+3.741977338
+0.3154841431
+1.795973234
+0.1995703951
+1.855774718
+-0.3082546094
+3.684540875
+-4.30176023
+-2.284159094
+-3.33872456
+-2.079872336
+-2.937854532
+1.483150218
+-1.953005238
+-0.1092390099
+-1.605197906
+-2.270791657
+0.3005846635
+-3.924752923
+-3.267342875
+-4.992056769
+-2.100839639
+-0.2277822004
+3.479729584
+-2.509511792
+4.746313238
+-0.3815394922
+1.300968414
+0.5082254731
+1.717394527
+5.489679683
+4.255953191
+-2.932883335
+-1.258700457
+1.289143013
+-3.189983578
+1.173547045
+-0.2243578167
+-2.998082304
+1.033208995
+2.921043465
+-2.829260297
+4.807785587
+0.7128473216
+-0.3845870412
+1.176967666
+-7.778681956
+2.325874389
+0.7947503221
+-1.370271661
+1.011464927
+1.214801336
+-3.182842949
+0.2810819976
+-4.776877623
+5.441418708
+-0.3103730964
+-0.9157232545
+-4.214124009
+-1.097250698
+-0.2918237116
+0.8254094951
+-4.676667815
+-1.106362732
+2.239693956
+0.9838609543
+0.4502908874
+2.013833695
+-1.194064041
+-2.400315394
+-1.661366575
+2.13993516
+2.672084577
+0.01350678976
+-2.956188505
+-0.5348367629
+2.771439454
+2.143632229
+-3.063762024
+0.6968969071
+-0.4647496641
+-1.199980165
+-7.975161397
+-3.01028689
+4.167851356
+-0.2140552454
+0.4166643139
+-0.2902867746
+1.209345901
+1.884447588
+1.703991768
+3.545942362
+1.376117551
+5.111326457
+4.531882775
+0.05644436199
+-3.639640896
+-3.47861967
+-2.98813228
+0.5460429285
+-3.77459012
+-0.0327188221
+3.661126709
+1.860239394
+-0.6101988678
+-0.1793388304
+-3.33649521
+1.109639604
+0.7289649528
+-4.367060101
+0.6137872994
+0.7088926974
+-0.6259688177
+-2.455803026
+-0.8161963394
+-1.637563545
+-3.874170942
+3.72387643
+4.486007446
+-0.6642844681
+1.52669134
+-4.643207934
+-2.202327357
+-0.185354353
+-2.750100469
+5.244883181
+1.834073862
+0.3734147422
+-5.296408662
+-2.439467213
+-0.6800164575
+-0.7299493588
+-2.875985504
+-1.079477189
+-0.5360106256
+-5.564878759
+1.448460659
+-0.7122444512
+-0.6704548529
+-2.378435385
+-0.0264010713
+-0.3415157859
+-3.483910072
+1.67392391
+-3.589244941
+3.828306804
+-1.628551996
+-2.302824678
+-6.114064556
+-2.512254265
+5.423078209
+2.0176545
+-1.24314657
+0.05717637725
+1.876251283
+-0.8460976208
+2.624630181
+-1.548907149
+-3.26959652
+0.3827214575
+-0.418580751
+-4.672536991
+1.274735464
+-0.4823219816
+3.945717625
+-2.298684505
+-0.4258108629
+-3.432821173
+1.625821052
+-0.1810957125
+0.03474050349
+-1.278074979
+-2.608000601
+0.9963164282
+-0.6696903706
+0.5577540256
+0.2266797211
+1.443768402
+0.2416622724
+-0.5645353372
+-3.933577425
+-0.2661732399
+4.538310341
+1.721124521
+-1.623011929
+0.3035324708
+2.983655941
+0.05613909395
+0.7670145169
+-2.1335317
+3.311525778
+2.249628072
+-2.070533156
+-1.848343023
+-2.626442292
+4.150196578
+-4.392778375
+-3.871722917
+-3.410963486
+-5.449009741
+-6.177921891
+-4.732048545
+-0.5427310891
+7.899007368
+-2.62156046
+1.387947651
+1.715159344
+-1.730564723
+-1.134383635
+-0.5623296638
+0.5901597744
+1.086459627
+-5.363562348
+3.369853183
+6.694451934
+-0.7776102927
+1.259112828
+1.094160085
+-1.494864943
+2.560111302
+2.009595049
+4.372474505
+0.5601573444
+9.018154659
+0.2134281322
+-0.6464899257
+0.08797030013
+-0.2669592308
+0.3731810415
+0.1935982145
+-0.6884832217
+-3.146331555
+0.5086153132
+-1.447161336
+-0.8491515527
+-3.741892909
+0.3849432207
+1.343657348
+-2.092631936
+0.4964641712
+-1.008849834
+-0.4971796097
+-2.024513519
+-1.98215025
+-3.85723224
+0.6613772929
+-4.350532198
+-0.1009479922
+2.458106357
+-2.332065073
+3.891288468
+-1.589577984
+-0.8617554097
+-0.2589944033
+1.001756311
+0.9015288163
+2.813975811
+-1.40164221
+5.845324235
+-0.9262348312
+-6.08176854
+0.6906842421
+0.4464622724
+9.878082965
+-1.507124136
+2.810492376
+1.267136128
+-3.643845879
+-1.090060492
+-3.04912633
+2.448463747
+-7.926194494
+-2.998770075
+-2.052889916
+-4.135860331
+-0.349986887
+-1.502781593
+3.914781929
+-3.51018185
+1.282010939
+-1.460629826
+-2.819904415
+0.5810139852
+-0.3913995745
+4.909232357
+-3.741950657
+1.366644034
+2.362461961
+3.164636375
+4.208685861
+-1.020946126
+-2.298728524
+2.373182445
+-1.704252456
+-5.059313331
+5.385319975
+-1.551227362
+4.15607371
+-1.462682156
+2.861476331
+-1.238215192
+3.763698062
+2.943407355
+7.695611646
+1.456504175
+-4.895888295
+-5.948272922
+2.158875226
+0.9920321054
+-1.163961436
+4.843103435
+-5.288671632
+-0.8977104482
+-0.8448159788
+-1.47400069
+0.3186329802
+1.833131982
+1.344687186
+2.433152121
+-0.1514775923
+-3.095356556
+1.747004875
+2.53349567
+-1.154824126
+-4.065248833
+1.89206255
+0.9513336358
+0.02862006604
+2.570490893
+5.405957322
+-2.985718277
+9.635542415
+-0.4983037513
+5.329909487
+-1.002267936
+-0.6856006689
+-0.2432755492
+-5.181470913
+1.330380054
+-2.114277759
+1.597475536
+1.376524447
+1.820726584
+-3.350635718
+-1.26158708
+-1.224670967
+2.747745194
+0.05934802338
+-2.89786468
+-0.009415997523
+-3.327829058
+3.598190959
+-2.75080009
+-0.9752937667
+-1.966379061
+3.120903736
+-2.540524489
+-0.06033018343
+3.144968484
+4.154352567
+0.8630203283
+1.062736294
+1.4958399
+-0.7296343361
+-0.4117829364
+1.570395782
+-3.796812334
+1.442022627
+9.009369886
+-0.4538163916
+-2.173185745
+0.1163692475
+-0.3594558403
+2.462545808
+-3.022491561
+-2.003378751
+0.144909812
+0.5251138162
+0.624947736
+-5.757178876
+2.929953237
+5.673954173
+1.282031555
+-3.985784159
+-0.4408029725
+-4.068817867
+-1.100888647
+0.5758748072
+4.148977386
+-3.194434248
+-0.812551116
+8.28307902
+1.801346991
+3.933496805
+2.92980929
+-0.3559806214
+-1.334670096
+-3.293609717
+-1.279051006
+-0.8220729065
+-0.3206008975
+3.264945786
+-8.944116031
+-3.463788073
+-0.1044608208
+0.795595838
+-1.209935427
+-2.523233039
+3.092910256
+1.210812832
+0.4937095313
+-1.497237537
+2.481160226
+-9.378604434
+0.8234460301
+2.430399231
+2.274482965
+-2.154381597
+-4.142612581
+-1.522979986
+0.2516336338
+-2.65601749
+1.836984647
+-0.4878413759
+0.8032381898
+-4.237956659
+-1.332723285
+-3.787504849
+4.509886998
+1.833071714
+-1.390174445
+-0.7840314973
+5.612272515
+2.02861553
+-1.166432524
+-3.122086836
+-7.273611641
+1.365720004
+-1.259735138
+6.026248433
+1.91679217
+-0.9439967681
+-0.1594520733
+-0.3243925885
+-2.682710562
+-0.8160070025
+3.523248474
+-1.545633305
+-4.515627323
+-4.19178744
+-0.1534808474
+-0.1237179987
+-0.7063240947
+-3.827030814
+0.5323505706
+-0.5965459811
+2.609458701
+1.245187024
+-3.560368247
+-3.799861991
+4.759656623
+0.1832960234
+-0.5312844235
+-1.756296014
+-1.315604367
+0.05278862426
+3.994387479
+4.752226488
+-0.9709912836
+7.023364969
+-1.840671031
+2.774771162
+-0.6713443793
+2.673362633
+0.4354681162
+0.7344459125
+1.132837989
+6.089097088
+1.897222964
+1.076829646
+1.349062723
+-0.9175369146
+3.328225606
+1.461841579
+-0.9115524428
+-4.371951651
+-2.761571017
+2.047995437
+-1.066418761
+1.17821673
+-1.143228788
+-5.119146414
+-0.480766389
+-4.850911872
+1.8487899
+7.219759767
+0.9456072418
+3.782368746
+0.9930098519
+-3.900663097
+1.658320652
+-2.293680493
+-4.809228324
+0.8478133264
+0.5652767911
+-3.315763832
+-0.07687563319
+-4.385310751
+6.920793524
+0.3042324162
+-1.766341336
+-0.1446867877
+2.281478089
+2.13781848
+-3.386649916
+1.166286892
+-0.6527485361
+4.477209727
+-0.3611667681
+-1.202552217
+-1.49965959
+-2.727804285
+-4.304535819
+-3.739218697
+1.471749762
+-1.375463236
+-5.287326677
+-3.854627032
+0.5607703576
+5.00418705
+4.457200623
+-3.927846139
+-1.20041277
+-2.070784779
+-0.8555526726
+1.683509397
+-0.6673454506
+0.3077709841
+-4.089741137
+-1.651509489
+2.825571086
+1.250137954
+4.676415451
+-1.387283966
+-1.056164532
+2.07711793
+-4.03787754
+-4.190334313
+-3.756920797
+3.578984808
+-2.573539063
+0.7379412272
+3.554680865
+-5.002851412
+0.9657071462
+0.4277653253
+2.663407966
+4.153174826
+-6.190591905
+1.254393424
+-5.034006912
+8.596804939
+-2.026544853
+-3.641923934
+-5.170630674
+-0.03467712263
+-3.850337571
+1.982745512
+-0.3471121397
+0.9021321392
+-2.88560217
+2.036526291
+1.231994368
+2.307489248
+-5.581047588
+-0.7808049446
+-1.966443043
+2.445387229
+-3.313432069
+-0.07753343496
+-2.054084217
+2.229086531
+0.2783205792
+-5.432498368
+4.392706405
+6.32921089
+1.53390748
+2.76441102
+-2.38833488
+0.4673528643
+4.8794716
+5.051923993
+-0.3053331771
+-0.08100080163
+-1.668292182
+-1.004825939
+1.29169341
+-0.9445550995
+1.596999886
+1.442590752
+1.910010198
+3.572619438
+3.655132085
+-0.2615312561
+0.399511879
+0.1597925187
+-3.883438542
+-1.881287173
+3.099625934
+2.523475514
+-3.356463377
+2.731906105
+7.390482131
+3.916429252
+-1.523547311
+1.920496371
+-6.284708052
+-4.607701328
+-6.398818706
+-3.664256798
+-0.1532812022
+-1.880861307
+2.725613031
+-5.310416488
+0.381337083
+0.6076073432
+0.6581601972
+-0.425858265
+1.41377617
+-3.36489605
+0.7046703136
+0.7982140265
+0.3663639259
+-0.1018765447
+-1.235737012
+0.7188239986
+1.335118067
+0.4368413763
+0.5351297189
+-2.638688176
+0.2487535369
+0.6662127865
+-0.7795811347
+3.891277175
+-4.952237025
+1.834529105
+-0.9759452108
+0.335109319
+2.243780822
+1.371523786
+0.3022853459
+4.315060883
+-4.20056685
+-5.864161176
+-2.276569663
+0.3582786865
+2.209230405
+-1.99761451
+-0.1563333594
+0.4260445231
+-3.602471424
+-0.04238637385
+0.5168453347
+3.055507374
+1.087665912
+-0.6578432828
+2.056023559
+3.032897344
+0.2161169106
+-1.5953152
+-0.7814674416
+-0.6522918148
+2.958276979
+0.95992305
+-0.1179656956
+4.542662846
+-5.620238695
+-2.568917626
+2.218260292
+2.765995162
+-2.667281083
+-1.639894562
+1.682294945
+2.451841905
+-0.7039677749
+4.306767512
+-1.640460232
+0.3742915306
+-1.884825701
+-0.7537496162
+0.1216784055
+1.49006586
+2.157793465
+-1.536542286
+0.8360496948
+6.983146353
+5.197392399
+-0.4065169328
+2.822108809
+5.335518767
+6.195452789
+3.524965176
+0.1933961809
+1.003569277
+-0.8278041543
+-2.711608157
+0.221380631
+5.143561224
+-0.01483935465
+-1.374240909
+2.681795258
+-4.682876763
+3.599282121
+-4.071335023
+0.6443255319
+1.812450952
+-1.448108601
+1.278939198
+1.074161834
+6.286802106
+-0.8380265452
+-4.86587728
+-0.8108968096
+3.00776427
+2.10352711
+0.5167533914
+-0.5321551885
+2.337298506
+2.590800222
+-3.014703121
+1.896970348
+-2.29145948
+0.9237676048
+-0.9864042273
+1.183890233
+2.635468139
+-0.3919970006
+9.284938535
+-4.243973131
+0.9994119707
+3.455734668
+-0.385082211
+-2.082428421
+0.3441346663
+-0.08231771566
+-5.188162496
+6.993831121
+4.962763126
+-5.28968794
+-5.824657314
+-3.572214819
+-0.01454806171
+1.266725705
+0.1025929786
+4.563945588
+-0.5298162109
+0.673198938
+2.184788817
+0.3477965982
+-4.246462471
+0.9497049328
+2.63496671
+-3.46830861
+1.67179467
+4.50124801
+-2.553488807
+-1.781847986
+-3.580890453
+2.045942224
+-0.09400417214
+-0.0859412625
+2.666697085
+3.005622399
+-0.427575545
+0.7670470556
+2.295675029
+0.4893962785
+-0.7495903678
+-4.502558866
+-8.782001174
+1.982219746
+0.3982433664
+1.781171773
+0.3376389296
+-4.931261053
+4.602446021
+6.385725243
+-3.238847361
+-0.8639938746
+-6.874415416
+-2.473355251
+1.21984349
+1.844150606
+-1.557944702
+-2.197703836
+1.383495929
+-1.280409366
+-3.553038695
+-0.3291406903
+-3.498858238
+3.998585973
+-4.478474949
+-0.7146895214
+-3.813424023
+-3.208905983
+2.092849305
+1.177623102
+3.731777471
+-1.070169982
+3.789283428
+0.2946893025
+-1.7361089
+-3.886960694
+2.456688466
+1.394029742
+3.618690964
+-0.2265435052
+0.6701821518
+0.06590286384
+-0.678712773
+2.401657929
+0.7750024923
+0.04025037176
+-2.869907423
+1.832340314
+-0.9848631026
+-1.597924108
+1.074100267
+5.014250891
+4.269219033
+-1.699045384
+-2.177460963
+1.690426561
+-1.306896259
+-0.3136576431
+-6.963818498
+-0.6422830972
+1.630216277
+-1.612362306
+-1.140826006
+0.7964187903
+-0.4362952186
+1.170224265
+-0.4287791222
+-0.04235414212
+-1.623876988
+2.746020059
+2.304334087
+0.3049044018
+2.428326305
+0.001366930405
+-0.6801520492
+3.845151979
+-0.2204982097
+3.208903703
+2.376045673
+1.01912274
+1.900539491
+-0.9380697126
+1.097047355
+0.9682979191
+-0.4019220798
+0.9076111587
+-4.981984286
+0.5438218478
+-0.9460509767
+-3.02209936
+-2.245271651
+-5.15004728
+-0.471616334
+2.585684927
+-2.986826217
+-3.474650857
+3.95288858
+-4.869900187
+0.5396857645
+2.057576704
+0.1808905708
+-1.811640635
+3.146741284
+-6.771503453
+-0.1753013201
+-0.3416582795
+0.2566652321
+-2.306623279
+-3.76239818
+-4.470873045
+0.3884861688
+0.2780494782
+-1.556455118
+-2.354178074
+-3.01287867
+-0.2122486903
+-4.610991932
+-2.643458248
+-2.712592712
+2.112080544
+3.597180854
+5.513012563
+3.980500745
+-0.5184417731
+-0.3751555321
+-4.578574129
+-5.431056507
+1.192620236
+5.24822653
+5.171634733
+-3.984594816
+0.5724954054
+-2.565143746
+0.4308595258
+-0.992488999
+0.4041309642
+-1.794582746
+-2.710846878
+2.534552832
+-1.795278433
+-1.191488131
+-0.5935859134
+-3.769624367
+-1.315552492
+-2.017659942
+-1.691751854
+0.1381109767
+-5.721013259
+1.376518296
+-1.488460346
+1.598604672
+0.827641733
+3.199792286
+-0.5691245987
+-3.217751852
+2.809098381
+3.325416216
+-1.082905077
+-1.813259482
+2.192437343
+-0.8686980121
+2.764401698
+3.581011504
+0.4260625212
+2.970911422
+3.074563908
+2.345948915
+-4.546755494
+-0.361419616
+-0.7938103437
+-1.434467788
+-3.773405244
+-2.663886094
+2.65021077
+1.104299301
+-1.036657477
+-0.3250589526
+2.50879082
+-2.435588811
+-2.512975284
+3.9458626
+-1.093570406
+5.980712015
+4.754635357
+-6.313987833
+-7.659354841
+-3.727998847
+0.6059599568
+-0.9159952754
+-3.586760335
+-4.733709525
+2.549736694
+0.9827704267
+-0.005008765061
+-0.106690288
+-1.467754651
+5.791494654
+-0.7879341603
+2.477796915
+-1.929801034
+-2.486943257
+-0.6082037389
+-0.7735994259
+0.212443562
+2.993534268
+0.7802421714
+2.775196846
+4.42822756
+-5.637756841
+-2.347585626
+-4.206615181
+-4.365857412
+-3.457006236
+0.2896456578
+0.8768407351
+2.66016436
+0.3396618743
+-0.08844494057
+0.8347675005
+2.911299139
+-4.293788451
+-4.206704325
+-0.5838740806
+-1.606491436
+1.812830144
+-4.247135241
+-2.916951862
+3.093848985
+4.361623439
+0.7011225628
+3.924071948
+2.285306418
+1.776498608
+-3.708488997
+-2.725224436
+-2.289655951
+-2.406115038
+-4.129262929
+-4.650698138
+-0.4991802866
+2.279668648
+-0.8626389648
+-1.022505925
+-1.314202503
+0.4272412586
+-0.8985503238
+-6.301576421
+7.217146389
+1.014654053
+1.08972443
+0.9399141856
+1.273069301
+0.5484080069
+1.213067051
+7.627003803
+-1.13743026
+-0.4487232904
+-2.504099992
+-2.322822384
+3.644894212
+2.281850155
+0.951323189
+-0.501656939
+0.3691396042
+-1.60201704
+-0.1869845699
+1.498138574
+-1.833784587
+0.6839335176
+-3.789887507
+-3.231906316
+1.082233608
+-0.7729871905
+2.34554187
+-1.429063802
+3.916336233
+2.052936087
+1.358308499
+-7.341605115
+1.908454678
+-1.776843285
+-0.4222323136
+-3.355948299
+-0.8137262118
+1.005965
+2.712844116
+-6.567036881
+-1.170717897
+-3.647572109
+-4.404263542
+-0.8244146719
+2.625139217
+-3.025021848
+-1.394354908
+-0.5597953885
+-6.266839335
+-1.680261287
+-4.046044566
+-1.092510604
+3.538193965
+0.5991563044
+5.059602908
+-3.225690934
+1.743471625
+0.9071192075
+-1.784836157
+4.150289552
+0.9782678208
+-4.513577282
+-1.835592168
+0.5960294843
+3.283828344
+2.948385344
+-0.2041805687
+-3.137179763
+-5.240953704
+-1.787631642
+-1.180529877
+2.345955832
+0.3947363815
+4.009708516
+3.641232413
+1.29895198
+2.326468829
+3.609599447
+-1.476321418
+9.059008788
+1.807367794
+0.6831929849
+1.580737801
+-0.4549365965
+-0.776654303
+-1.5736024
+0.8151384459
+-2.662460988
+-2.689392027
+-0.5905999265
+0.2735928533
+-2.661910712
+-5.604546553
+-0.2282944476
+-2.341790567
+1.44073279
+0.0961095104
+-2.120121617
+-1.389464926
+-3.520631238
+1.633571834
+-3.905129922
+1.109928845
+-0.2550063171
+-2.171106791
+-2.239377798
+0.7528671147
+-6.374071575
+5.017110776
+-2.15096369
+-1.604481304
+1.072786837
+-0.7186165606
+5.976977571
+0.5946143274
+-4.389081689
+-1.515987278
+2.59515561
+-3.919738741
+-1.958446452
+5.104200857
+0.6605952059
+-4.852810681
+-1.757448913
+1.03852431
+5.377552794
+-2.597597202
+0.05827053337
+-0.7418368876
+-2.949047284
+-3.738051078
+-4.20356564
+-7.021159155
+-2.367750153
+-0.563633604
+-0.07232393922
+-3.712308693
+1.33347921
+4.339487027
+-1.88422147
+0.2002912016
+2.057747238
+5.558120907
+4.745073676
+0.2831635262
+-2.000386593
+1.998134558
+1.596116299
+-3.152423397
+-1.586755634
+-5.936981375
+-0.2809518008
+-1.661124472
+0.4732858637
+1.114309351
+1.360922046
+3.408641108
+1.238267357
+0.2238204467
+4.418779805
+-0.1565683759
+-1.000204404
+-0.6749188654
+-1.55378707
+-3.139904413
+2.954597508
+-0.2983312897
+5.225606636
+3.394041624
+4.689200974
+-3.180622786
+5.000791536
+-4.436939883
+-5.71731147
+1.065819488
+-2.234173194
+0.392027796
+2.786210545
+-0.3277621476
+1.073792161
+0.1861633845
+2.802388324
+-3.965223739
+-0.566354083
+1.635007725
+3.583840005
+0.3466439301
+-0.04700445778
+0.2454560835
+0.9384522686
+-1.552739089
+-2.847992707
+-1.50275794
+1.074584373
+-2.074994324
+2.125822737
+3.634986819
+-1.751912651
+-0.3069806047
+-1.209483914
+-0.2327092354
+-0.3348777682
+1.671368253
+1.960866024
+0.3525461635
+-3.679786445
+0.8537657761
+-1.002582546
+-2.710418635
+1.14482025
+-0.156238747
+4.077088957
+0.7205933049
+-1.531021115
+4.211966514
+3.029703311
+-1.404614158
+-0.5709446835
+0.6827133605
+0.9890123865
+3.941804409
+1.063574087
+5.027045358
+-1.379686567
+0.2906087605
+2.70362493
+-1.838798813
+1.682276205
+5.271169418
+2.05493894
+-0.5606346695
+-1.230892073
+-4.333121866
+-0.1567754918
+6.735059457
+0.5395849151
+2.264587581
+3.556813859
+0.8530105752
+-1.23222195
+1.309303539
+3.777269384
+-0.9192760141
+2.114358634
+1.441755159
+-0.5177043692
+-3.169164115
+3.062519462
+2.780325893
+0.5675266584
+-1.146606188
+-4.445237888
+3.713859047
+-4.7287432
+-2.646318564
+5.16981484
+-1.696443901
+-0.1980794963
+-3.504555273
+-1.988537492
+2.316745749
+0.7821685283
+6.606893926
+-2.306449612
+0.01012057137
+-0.3519785013
+-2.741054914
+0.9802591733
+-0.4323126618
+-3.667249024
+2.650453066
+-1.976531662
+-0.6744135448
+-2.440759128
+-3.371163225
+-3.196601365
+1.385730485
+-2.251179633
+1.043210837
+0.7967130205
+2.483501689
+-3.860943786
+0.9564769844
+-2.568774516
+2.344184342
+1.846367145
+1.972712535
+0.5391112866
+-6.835138082
+-4.198458852
+2.291164899
+-1.806714159
+3.172038019
+-3.725138152
+2.533301535
+1.257292596
+1.622547161
+0.4280552387
+-2.979533164
+-1.138412087
+1.786191721
+-2.673417584
+3.764702539
+3.212821857
+4.104353981
+2.262126108
+-4.085369485
+0.6446695522
+2.300008977
+-1.716440095
+-2.797812619
+-4.038956639
+-3.175062122
+0.9246588503
+0.378917681
+4.423964786
+0.05959691508
+-0.4600210105
+1.628175051
+-2.694729169
+3.21850252
+2.763602308
+-3.137948007
+0.7196544383
+-0.7199617102
+0.6045796741
+3.286121229
+-2.292437169
+-3.177244262
+2.912931683
+-8.173646292
+0.07902863317
+0.09340695686
+-0.5361279901
+1.258497941
+-2.605165593
+1.424118271
+-1.493077876
+-1.839541694
+-2.697924464
+-2.085411779
+0.7645739785
+7.388344848
+3.864067781
+4.099053278
+-6.252420219
+3.163620726
+-1.975338271
+2.105012189
+-4.452629669
+2.10550265
+-2.21010784
+-3.406104933
+2.410279838
+5.841415059
+0.8454456276
+1.849040144
+5.070326935
+-5.279049584
+-0.2820861152
+-4.606871482
+-1.446191941
+-0.8441916507
+5.738824107
+0.5369096685
+0.809516744
+-1.426884896
+-0.1747328364
+1.831208025
+-0.461295463
+-0.9214730401
+0.00942607602
+-3.547571558
+-5.533866821
+-3.95097477
+0.4438020319
+-1.961907251
+-1.098253773
+-1.731775501
+-1.755210534
+-0.8772503998
+-5.545591006
+-0.4468014544
+-2.253816675
+-2.145902969
+3.233524724
+1.869521184
+-5.090513671
+-2.555097039
+-2.767576303
+2.76997229
+-1.185013292
+2.12980619
+-0.1288025467
+-1.948918753
+-0.9556125389
+-5.6162726
+0.2163814071
+0.8736172307
+-0.8350449056
+1.814864928
+2.011827813
+2.185192973
+4.00778697
+-2.618251123
+-0.5461438191
+-0.8299465812
+1.615646066
+-3.726573025
+-1.946801107
+-2.682508879
+0.3044037988
+-0.1562980626
+-1.831812414
+-8.939236876
+-2.067712375
+-6.620756047
+-1.298368798
+-2.032439464
+0.4987644555
+-0.4123332564
+-2.3298866
+1.207139042
+-5.515384357
+-2.201330825
+-6.031440021
+-2.60676749
+-0.1485795869
+-4.032698611
+0.180701633
+-5.306503789
+-2.520913501
+-3.034590807
+5.710591195
+-3.853193243
+-1.469667731
+2.274516541
+3.441647321
+-4.106564894
+1.824242593
+-1.59028443
+-1.82836464
+3.187237381
+-0.1204494543
+-0.8292632035
+4.732678045
+0.7910461188
+3.801123517
+3.55424431
+1.801442436
+1.988281735
+-2.889364182
+-0.1955507079
+1.189610662
+3.674189342
+-4.789985234
+-2.748456245
+6.170681561
+0.5412591425
+-0.2001277469
+-0.08506193936
+1.454414253
+2.451903723
+2.685917274
+-2.2875488
+4.312783075
+3.592308036
+-1.994635006
+1.473399432
+1.308536178
+7.450876434
+3.752624984
+-2.595674167
+-3.457148633
+-7.595294018
+2.030403396
+-2.470648301
+-0.004964582318
+-0.877974101
+-5.140006945
+0.8325386068
+-1.405236217
+-3.063712176
+0.9333233093
+-1.663114199
+-1.583115238
+0.280302069
+0.1660913709
+0.551880232
+3.223306706
+-2.426670804
+0.05312687668
+-3.166126272
+0.1611765859
+2.676014199
+-0.4310490248
+1.628659452
+7.845542067
+2.726766315
+-2.01032233
+0.4388969509
+-1.253250262
+-0.9215236833
+0.8109545242
+0.01843638672
+-0.1242375368
+3.756143518
+-1.756011701
+0.0551023208
+-1.16475502
+3.304841113
+5.662267053
+-1.950109754
+4.353167838
+0.6018652908
+0.3225754606
+1.233013578
+0.6603810575
+-2.867530088
+-0.21873226
+-0.6601661653
+-0.5867639323
+-1.166498435
+-0.4476799054
+0.6194725395
+-1.472164248
+4.014157296
+3.100046187
+-1.177330422
+0.8285647647
+-0.1500042046
+0.8350310314
+-0.6626535751
+1.222827405
+-5.060514859
+-3.396898486
+-1.347596315
+-4.885679452
+-0.224254139
+-2.970051608
+-1.506331135
+-0.0507010712
+1.985234365
+1.565811952
+0.2132759487
+-0.3099955079
+-0.3725495827
+1.515216933
+5.239597191
+-2.815426626
+-0.6150546194
+-4.322539954
+6.197987379
+-3.652937686
+3.131073421
+-4.910399757
+-2.493518413
+0.1151793015
+-4.298319334
+4.950664077
+-0.2871201334
+6.668606179
+0.9230476495
+-5.172966667
+-5.085596817
+0.834908022
+2.814903633
+-2.622308848
+-3.43862447
+-1.937307501
+-2.462619327
+3.43088779
+4.237738254
+0.8412587397
+-5.04675055
+-1.272708041
+1.981597066
+-0.09941585956
+-0.1153124853
+-2.434970197
+0.5225493425
+4.433511962
+-0.6578656189
+-1.684353596
+-2.64757523
+-3.702753596
+3.406175752
+2.561066946
+1.985856491
+0.582128339
+3.75595598
+4.362106145
+-4.463073444
+-1.585883216
+-1.684086002
+1.378258045
+1.38445514
+-2.524667391
+-7.214269522
+-4.483365418
+-6.614185625
+-2.131409809
+-2.059512401
+1.46155671
+2.910998101
+0.05749524121
+0.09167230262
+6.378117512
+1.14762114
+0.3053290084
+3.731308954
+0.2525627799
+0.07807391464
+-1.188918539
+0.6213484065
+-1.464779819
+-0.3505632837
+-2.785985175
+3.318378152
+-0.7362545434
+-0.1906338062
+-3.987197218
+-0.7884137948
+4.452127141
+1.755852937
+-2.037733161
+-1.224858834
+-1.027591953
+-1.593179465
+-0.7577385491
+3.71813571
+-1.848497166
+-2.623162346
+-3.425645804
+-1.736588642
+7.061322966
+4.017479422
+2.125907397
+3.039993898
+-1.920889495
+-1.425667112
+3.745014876
+-0.1236680901
+-1.048276412
+3.860841325
+-3.978572309
+3.277876103
+1.15006569
+-2.072592632
+-0.2164311297
+1.418843639
+-1.39355585
+2.445506133
+-2.235029481
+1.075630436
+-3.967502261
+-1.608740354
+0.1670218271
+-1.531944217
+-4.260652758
+3.497819927
+2.232863512
+-1.935968698
+1.420054671
+-3.10335117
+5.338192298
+-2.241097676
+5.300226916
+3.082688025
+0.1566129055
+-5.921901149
+-3.334213258
+-0.9738293989
+-1.051810799
+-1.11323068
+-5.70527584
+6.177646117
+0.5056918344
+0.1283306236
+-4.063493412
+1.582315654
+-2.449870592
+-1.899486867
+-0.05332461831
+4.612802974
+4.752104747
+-4.522000928
+0.1997288465
+1.133884065
+2.706473946
+0.05362596969
+-0.3181842083
+2.849325888
+3.43672084
+3.528664704
+-2.51359233
+-1.519479488
+-1.501604367
+0.222667923
+1.627193386
+2.015951791
+1.186583964
+0.5787562408
+-0.1250471491
+1.746919692
+1.222502472
+2.803321067
+4.847058359
+-1.209200919
+-1.624439704
+1.112044249
+-1.243010646
+3.673508798
+-5.283702253
+0.06625270878
+0.2890985092
+-2.803038048
+-6.091580315
+-1.908482041
+-1.258534708
+2.13481542
+1.831920051
+-0.793281868
+1.263582085
+-3.332241858
+-1.950231476
+-0.4669769875
+5.54318971
+-4.372781989
+1.363350266
+1.608440769
+-5.497371982
+0.1286999579
+1.70190198
+-1.143686996
+0.4758174777
+-2.229622988
+-6.901076255
+-9.053634962
+-1.257758608
+1.102049614
+-1.133859714
+1.109012954
+2.30024504
+3.39704074
+0.5141072031
+5.976092853
+3.11133857
+2.391780567
+-4.604460405
+-0.6721139018
+-2.163494261
+3.717360077
+-1.575359554
+1.101696313
+-0.8621590959
+0.3249164194
+-1.081574427
+0.2138369411
+2.939881214
+1.987272414
+-5.345357874
+-3.254534575
+1.651279418
+-1.25000263
+4.837980794
+-0.6147730888
+-3.06332837
+1.036545627
+-1.595212651
+-2.213119417
+-1.256602032
+2.55637742
+0.8458638576
+2.535192166
+-3.084016541
+2.926561393
+-0.1889080023
+-1.851081865
+-4.174275067
+3.562232001
+0.4102240549
+1.338058908
+-3.783440062
+0.1158764994
+-2.892710564
+1.24354082
+-0.5256656976
+-7.726252931
+-4.962074949
+-0.1047827495
+0.1346877094
+-1.205694679
+-2.154028736
+-0.2382814496
+-3.058107091
+0.1398266037
+3.110702297
+-1.24677996
+-1.867484418
+0.7091311636
+6.104509857
+-3.94652119
+4.208267701
+2.196989412
+3.700484622
+4.097736081
+-0.2425232702
+1.598697727
+-0.2645064408
+-5.492755471
+-1.630365348
+1.87177283
+2.474469414
+-1.609656272
+-3.72466195
+2.231482185
+3.377450253
+0.4859925743
+0.6514405138
+-0.2835617535
+-2.311608721
+-0.7957627314
+1.1893262
+-3.073449059
+4.461123217
+-0.478553052
+-7.566145239
+2.516547739
+-3.695170531
+-2.868721721
+-1.974396985
+-0.6162029526
+0.2594121055
+-4.640295414
+-0.05013003166
+0.2925624503
+-4.867514236
+-1.95955965
+3.331136991
+0.5342943603
+4.237656099
+1.997744215
+2.346544445
+-6.185217655
+2.588370697
+-1.163575332
+-0.495828453
+0.04263046661
+0.1426871694
+2.642639816
+0.2792195236
+5.956073578
+0.6226043011
+0.1477058551
+5.415418961
+-1.59215933
+-3.551098477
+6.972316019
+-1.10817596
+-0.1068463285
+5.162366069
+-0.0657443145
+-3.248753929
+-4.730102193
+-0.4227671797
+4.043359918
+-0.4604793004
+-3.518574562
+-2.143440085
+-0.6723758961
+1.062011395
+-0.3459405792
+-2.779605722
+0.5055756064
+-1.943201359
+-1.691511586
+0.3149639754
+-0.2525162891
+-1.518344834
+-3.71301675
+-3.690634407
+-0.7255288594
+-0.1426861784
+1.041166374
+-2.372234903
+0.2489360829
+-2.895739953
+-2.686059125
+2.268387053
+1.481160524
+-1.078994463
+2.777004971
+3.548410146
+-3.332691123
+1.841987074
+4.164686455
+-0.7554005599
+-2.269173346
+-2.805669457
+2.817698676
+1.638142452
+2.881123792
+-2.846566851
+-1.494367904
+-1.208096263
+1.776137687
+0.02716958174
+-2.658965473
+0.1472994201
+-0.5344412161
+0.8402032518
+-2.912307429
+4.166330658
+-1.823176936
+-0.6728098328
+5.798941564
+-2.67415095
+0.0563335037
+3.904634471
+4.115604833
+1.643400987
+-3.148736675
+-6.512671228
+3.957735415
+-2.708094812
+-4.2034544
+6.13245326
+-6.069952073
+-0.02420384851
+-4.865270209
+1.328709829
+0.1420074618
+2.740740803
+-0.1368824945
+0.08644297463
+-1.669842618
+-0.4806377157
+2.368331552
+-7.030761457
+-2.681088202
+-1.897382614
+4.462170716
+-2.206581852
+0.05557663723
+0.873176593
+5.42649785
+-3.651750408
+-4.425150772
+-1.58296919
+6.105763245
+1.37397053
+0.159320217
+0.564503707
+-2.437872263
+-3.243141098
+2.052349021
+4.251237822
+1.331186187
+-0.2309181164
+-3.274603076
+-1.312370431
+5.022030939
+-8.772459426
+5.04759076
+-0.4413392278
+-1.103577667
+0.4121246528
+-0.6603214297
+-7.504271736
+-1.811463664
+2.179068623
+3.618793505
+-3.113558419
+-0.7375754609
+-4.168959722
+-0.2358930503
+2.938538289
+-0.6213972144
+-1.484180291
+-5.017569247
+0.6450048313
+-2.016930546
+-0.6505631632
+-2.700950515
+-3.743331106
+-0.5315534082
+-1.977227427
+3.59338668
+-4.78121468
+-2.377540012
+-1.86644004
+-4.97928327
+1.305134184
+-7.721508295
+-1.874570569
+1.008674129
+3.220759325
+-4.455815483
+-0.8839366371
+-0.9335569573
+3.838758693
+4.352901176
+-2.726313868
+-2.625168239
+-1.936164594
+-7.69424805
+0.7312483985
+1.72043201
+3.308202754
+-2.242714321
+6.286010807
+-4.031919301
+-3.892198795
+3.478835104
+-2.85113024
+0.004493689406
+0.5480912738
+0.5653949914
+1.192786543
+-1.993743344
+-0.3999942251
+-8.524653364
+1.254289463
+-8.329311758
+0.7974218743
+0.6826763904
+4.203465982
+4.666533287
+2.528647445
+2.708692151
+0.9636900417
+-1.799082084
+-3.072725976
+-1.847411468
+5.07812023
+0.8062623849
+-1.198500099
+-0.901720084
+0.6649120939
+-0.6614672437
+2.070828944
+-4.250998085
+-2.445559155
+-5.971440546
+1.327191768
+2.012040335
+2.155579463
+-0.8918321988
+3.332629282
+-2.453100146
+-1.726459978
+3.593271666
+-7.884448351
+4.760221303
+4.248312855
+2.301506426
+0.4975141632
+2.445217825
+-4.883198374
+0.9009564307
+4.001036936
+2.487888663
+-1.454679262
+0.4854776331
+-1.754934537
+-2.090185173
+-3.441154924
+2.158891409
+-2.818708005
+-3.745568737
+2.931773932
+-2.92490842
+-2.758364733
+0.4657947436
+-4.022388491
+3.171090212
+-0.2336074159
+5.111489849
+-0.8217622873
+-0.9307426619
+-5.264671424
+1.257441507
+3.847779337
+-1.588999913
+3.088376511
+0.4583120312
+-2.574130033
+1.398195918
+0.8131597075
+-2.272017955
+5.125745767
+0.7780598805
+0.8181945663
+0.09152889357
+1.962954499
+2.152924806
+-0.8175018021
+3.49389535
+-0.5658562593
+1.964508665
+2.2454568
+4.678843162
+-3.78265325
+-1.891248136
+1.896353147
+0.8736463651
+-2.493792304
+-0.6272726457
+-2.115364976
+-4.671478017
+5.220249945
+-3.524111468
+-1.117503578
+-1.091393629
+1.455739331
+-5.003735923
+-1.227735636
+1.462385974
+-0.2055380002
+-0.7046418436
+0.5485047223
+3.076038328
+-1.185710627
+-3.230232298
+-1.359282199
+-1.514026274
+-1.472811456
+-1.150090603
+-5.476497609
+-3.306729071
+1.07077799
+-0.6731166791
+-5.365555431
+2.946665163
+-4.207618286
+2.46402211
+1.160931694
+-3.558294962
+-3.615848538
+-0.4600127641
+5.494426493
+2.446279819
+-3.217256087
+2.515286032
+-6.299950178
+0.7310431939
+-0.1047375234
+2.379784036
+3.333125544
+7.492439435
+-8.514593831
+-3.181537308
+3.176721236
+2.875681895
+2.47428543
+-7.569087
+4.701749826
+-0.6080552092
+6.09264198
+-0.1912836785
+1.597287983
+2.895048434
+-1.068494146
+-6.732482323
+1.716399163
+-0.1261896088
+2.500140858
+-0.3884397091
+0.654606976
+1.087637561
+-1.020270857
+-4.061271394
+-3.885628251
+2.317135024
+-0.1945218903
+-3.720230795
+5.048384036
+3.420472825
+-4.57769088
+2.447778791
+-3.587775155
+-4.651775749
+-1.810201314
+-1.825006203
+-3.214517018
+-0.3583911205
+0.04207818637
+-2.989383628
+-0.3518137628
+-1.631835789
+-5.09866486
+-0.002587526857
+-2.993652632
+1.078838077
+-2.107889139
+-1.59734
+-2.28015874
+-3.969615888
+-1.602157662
+-6.493286585
+1.220177858
+-4.921599492
+-1.046380199
+3.482773657
+0.8712315023
+-0.4407901001
+-4.604110924
+0.8568615867
+0.04027895389
+-6.531584874
+3.013738806
+2.623961821
+3.347285965
+-0.2722250714
+4.425969655
+1.520356803
+-2.157569376
+-1.072765376
+-0.3266700469
+-1.373597722
+5.073194313
+-1.053663487
+-1.043201074
+-0.004851108709
+4.80339204
+2.437306207
+0.4811872134
+-1.080131212
+-0.746186569
+-1.732099822
+2.489422969
+-1.4689446
+-2.159363334
+-0.1832240446
+-1.012366807
+-4.690721258
+-1.831634932
+1.551817522
+-3.693278566
+1.915655998
+0.7159199761
+4.579473541
+1.747872328
+-2.039800317
+-1.603886972
+-0.6110925638
+-2.231792716
+1.244239578
+0.02342319358
+-3.130795401
+-3.629192736
+-0.9797567158
+-2.617746006
+5.283284257
+-2.914304894
+4.604955909
+0.844226036
+3.713916707
+1.415651162
+3.502883918
+-3.841200573
+-4.732953205
+1.311810449
+-3.310042649
+1.94271919
+1.342112076
+-0.4403118843
+2.338371242
+-2.040978703
+2.886755397
+-2.576167534
+3.652498724
+0.8691012822
+-7.794589854
+-4.625430951
+0.2459089759
+4.761974593
+-2.204821004
+2.187228189
+2.780945666
+2.124225258
+-3.773163343
+3.531063313
+-5.761141973
+2.114378428
+-3.281085012
+-0.8488989167
+2.06631867
+3.750798641
+0.5544607508
+1.279100718
+0.05460799972
+-4.737626915
+-1.178394148
+2.633787624
+-1.205852829
+1.407210041
+-4.50482329
+1.10905795
+-2.729193824
+2.190680773
+-2.342514266
+1.713131042
+-2.094650606
+5.604931406
+0.1608867495
+8.202654668
+2.989601241
+-4.119850525
+1.583785649
+-4.783961859
+1.534447381
+-0.02792824135
+-5.734820879
+1.738759786
+-3.971231037
+-2.744105894
+-1.751844876
+-0.4406280334
+2.737517848
+-0.3640691243
+1.890905114
+-1.304670809
+3.129319659
+-1.038459079
+3.217594699
+2.813054343
+-1.901484191
+-5.358867788
+-2.507007376
+1.389594967
+-4.122526362
+-0.4537616618
+1.377282029
+-2.260385826
+-2.412512631
+-0.5395690828
+-0.8381278597
+4.048953091
+2.73535453
+1.885327794
+-0.3544045196
+1.568366681
+-2.421421837
+-4.32832527
+-1.575304081
+-1.413625045
+-1.298644288
+-0.1875241129
+0.8103921404
+-3.718579493
+5.945851377
+1.766873602
+2.124754819
+0.4062959739
+-1.302662259
+2.50516596
+-4.614129757
+6.604522622
+-3.876042163
+4.951127022
+1.311259552
+-2.076723755
+-5.498211353
+-0.3526850493
+0.05671406493
+-0.3212793505
+-5.295893264
+1.714048746
+-2.499740063
+0.9232603887
+-1.635528883
+1.629664387
+2.82932696
+0.6993947541
+1.378663112
+1.81612387
+-1.572491065
+1.990186771
+-1.541060474
+1.108631018
+7.784885659
+-5.551748548
+4.121033406
+-0.8917143377
+-5.167732172
+0.9807724481
+-2.967146588
+5.864856359
+1.587847395
+1.929621425
+0.629309404
+-0.9414474394
+0.03311201463
+-2.510562787
+1.901694422
+6.517607221
+-3.928819921
+1.672999642
+-2.408030143
+-0.00747458568
+2.160339582
+3.578469076
+0.6813695334
+-0.01869290104
+-7.103009538
+-0.7207359929
+-1.716118008
+2.503874975
+0.5815889111
+2.04604115
+-0.3416481721
+0.2976739851
+1.896930851
+-5.530106441
+-0.7413948946
+2.584993327
+1.910189506
+1.961770846
+1.663213412
+-0.9532603371
+-2.292998583
+1.770239289
+2.37393761
+2.273201375
+2.335769962
+-3.132118952
+-1.990098066
+4.503899348
+-0.02748831136
+2.268063529
+2.69266132
+-2.920853861
+-0.683080511
+2.992181852
+-1.000375505
+-2.426493814
+-1.055190116
+7.046582499
+2.056311505
+0.9192551426
+-1.317511398
+7.889036383
+0.7154919253
+-2.797089069
+-0.4205838377
+-2.616026071
+2.123312455
+-0.9410967735
+-0.2797848052
+1.938082019
+-1.370874596
+5.166741953
+0.7460165844
+-1.784345631
+-1.717336878
+-3.878403453
+1.055570096
+-0.8305329297
+0.5234630703
+2.314744062
+-0.9465667569
+-1.803600389
+-0.2336765281
+1.964257751
+-4.580640938
+-2.609664711
+-0.6497432843
+3.445206258
+1.81309498
+-2.226118745
+-0.1339721109
+-4.15110225
+1.791930863
+-3.605169715
+-1.407767708
+3.299088669
+1.453144902
+1.177478883
+1.553213413
+6.395183836
+5.339261789
+5.406963281
+1.620820434
+4.947744408
+-3.599484854
+-3.415147192
+-4.063266316
+3.153383223
+-1.0991662
+-0.1998403501
+-5.137805479
+-0.4689443233
+-5.055388239
+-4.98065641
+-4.00667663
+-0.6494319779
+4.07661363
+-2.324913134
+-1.79152403
+-4.540295747
+1.847915554
+-3.072146249
+1.319936265
+-0.8814554201
+4.147201084
+2.719019723
+5.231933188
+-2.406976477
+2.360427788
+0.001374283901
+1.334091653
+4.121091207
+-0.9959425982
+5.071154907
+-2.434349763
+5.121070022
+1.078649033
+-0.3498202831
+1.939190799
+7.654619749
+-2.722968576
+-0.5333472101
+-6.587286045
+-5.994490546
+1.300376287
+-2.255959565
+-3.031384109
+-2.258523696
+-0.776592443
+-3.711593601
+-0.2096675079
+0.6637465046
+1.238442966
+1.634510193
+-1.067826257
+0.5969868317
+-2.104155578
+-2.032547219
+-1.402313456
+3.052744488
+-2.826957527
+-4.393477648
+3.03576319
+-1.613718856
+7.137139236
+-2.329869122
+-0.7460216466
+-5.205806448
+-0.1470766574
+1.146880211
+2.208649143
+2.328996137
+-0.4583838024
+3.745693628
+0.6719926044
+1.845118621
+0.3886915095
+0.2882493105
+-0.4263313306
+1.840007533
+2.506961281
+2.322659268
+0.5286749415
+0.5111112365
+-0.9772957615
+1.641357251
+-4.637946632
+-4.531390168
+-1.021409409
+3.305951858
+2.475858904
+-0.683146198
+-1.290362128
+-0.2066632862
+2.400696035
+4.287670738
+1.303626863
+-4.326214197
+0.4820626154
+0.9707286485
+0.4234147081
+0.4072960539
+-1.266880167
+-3.254216958
+5.406929374
+-4.100121786
+4.733674135
+-0.03956292081
+0.9572056106
+2.53508209
+3.492588508
+-2.148711745
+1.181642688
+-0.9658622482
+-5.171949544
+-3.555117335
+-0.8022226958
+3.541231134
+-2.919723077
+0.4591043099
+-1.539484018
+1.745406487
+-0.5389559434
+-1.152841707
+1.406120515
+-0.9241070855
+1.938138321
+-5.964365652
+-5.202535931
+0.1217054805
+-3.767266012
+3.587925641
+-0.8421446547
+-3.316375239
+-2.998264025
+4.119572027
+1.574648555
+3.560089429
+-2.584006786
+-0.7638206422
+-1.439881648
+-5.690908792
+0.6110469735
+0.08214521213
+-5.750786442
+-2.972443158
+0.5350363855
+1.498598663
+-1.090709367
+-0.1350740669
+5.010517985
+-0.3039744963
+3.130628016
+-2.609089662
+-3.489625984
+0.5495013266
+1.937198663
+0.6019918718
+4.729248981
+4.304507701
+1.460274776
+0.2994106037
+0.6366704506
+-0.2058078164
+-0.6790825961
+1.054921051
+2.322776035
+-1.106275557
+-4.571695503
+-4.525764874
+0.8331703995
+-1.100400244
+0.3684921493
+-2.683934579
+-1.724691928
+-0.1657313679
+0.3919290733
+1.322073186
+7.252377846
+-2.914201432
+-1.557350581
+-1.55656333
+3.953430234
+0.3125942592
+3.739121873
+-0.2371286187
+1.856011005
+3.859354056
+-2.445613164
+1.47510273
+-3.320339695
+0.2782916362
+-0.5433852181
+-1.409352788
+1.050172401
+0.988255835
+0.5843582712
+2.690012525
+5.814326791
+-2.758515447
+2.178287346
+2.598856135
+-1.543731069
+0.5271601565
+-2.471679369
+0.3169701376
+-0.4123977451
+-3.858546972
+1.754728998
+5.593861122
+-5.046230487
+-2.950211076
+4.142323549
+-3.730787841
+-4.83926993
+-2.216692141
+6.67278909
+-1.246288256
+-5.244219283
+-0.6748089784
+-2.397960956
+1.93811931
+0.529813858
+-4.931171569
+-0.0331652912
+-4.34292091
+-0.8413250824
+3.785198177
+-0.7067330778
+-5.061900319
+2.436558874
+-4.881688648
+2.288071945
+0.4242398079
+-2.973232953
+2.688900848
+4.46876031
+-2.255775071
+-0.3420620946
+-0.7192143438
+5.495276594
+2.913185821
+-6.416866804
+-3.41441141
+-2.260327666
+-3.704991528
+-2.951621839
+2.360787086
+2.218068545
+-2.703244569
+-0.3551649609
+-4.558138698
+3.070218857
+1.478918041
+-1.794967962
+-2.563986524
+-2.978546136
+2.574263799
+2.569948845
+0.9594820854
+-0.7292528462
+0.7587639836
+-1.43764857
+-4.459484985
+4.366596755
+3.991890919
+3.600071879
+-3.766944759
+1.416650543
+2.215729158
+-1.136680616
+-1.421261843
+2.916621457
+-2.756851429
+1.989721488
+-0.4004741989
+-4.699111009
+-5.245954328
+-3.367775812
+2.395652433
+-0.2642794049
+-0.653478745
+1.102779521
+-6.491033928
+4.730511631
+0.09987345032
+-1.845345882
+2.221208331
+2.178247137
+-2.494340061
+1.967566683
+-0.9083284656
+-4.156576736
+0.2519043911
+-2.674283424
+-4.704085949
+-1.898433597
+-0.3579753846
+0.8497509763
+0.6273416736
+0.2295120795
+3.212237644
+3.393932596
+1.87052239
+3.535378269
+-4.308999369
+-1.4715616
+0.3744805615
+1.173505292
+0.6298433673
+-4.497267494
+1.623896774
+-3.513233473
+3.656189008
+2.097347967
+3.806037458
+0.2952772513
+0.3075810979
+4.807128944
+0.9893642441
+-2.795176193
+-3.833177741
+4.718807162
+2.178466475
+-8.236996215
+6.807038474
+-1.215044244
+5.34260643
+5.705063857
+-0.9655710164
+-0.6131040279
+0.4469296853
+-4.378149812
+-4.505221758
+-2.601107132
+0.637871283
+4.005317558
+4.893827659
+4.891333543
+-1.314282755
+-4.095274054
+-4.353531284
+3.094809208
+2.442869689
+-4.828551552
+2.199174309
+-1.143606078
+1.731656139
+-3.127174221
+-5.181965738
+-0.1705665989
+3.676983054
+4.802480681
+1.26195606
+-1.717421165
+-0.7960325036
+1.711331095
+-0.7885579762
+-2.315539097
+-0.3832354696
+3.546129093
+1.417440262
+4.38200784
+0.1474508769
+1.228782358
+-1.591482609
+3.902150736
+-5.085843746
+-1.127007128
+1.045207369
+-4.855500487
+-0.5763029142
+0.2125427895
+7.307185516
+2.915043593
+-2.798886624
+8.595610622
+-5.37614398
+1.63480316
+7.348347503
+0.0512504378
+-4.188264248
+1.773898092
+2.37247017
+-0.6303585778
+3.272508169
+2.732788733
+0.316055481
+2.782051611
+2.679061563
+1.613411414
+-2.071082869
+-3.563559025
+-1.482561739
+3.531197255
+3.174785343
+1.533126159
+1.556405445
+4.084660025
+-0.6414714692
+1.346562387
+4.394116963
+-1.150654574
+2.182937946
+3.581868026
+0.6367939596
+-3.03871976
+-1.695947532
+0.3916976797
+0.821720328
+2.223899447
+0.1847004962
+-1.400625925
+7.647337026
+3.297470193
+2.07094114
+2.024397953
+-1.481876749
+-5.400459824
+-0.6129080039
+0.01061060953
+-0.01719996021
+3.18379147
+-4.387932789
+1.294793659
+-1.868403075
+3.721431166
+0.5113388561
+5.960694774
+0.3339034983
+3.6289651
+-1.371989305
+2.76955048
+3.976556446
+-2.859499096
+-2.034389389
+1.002298797
+-2.264784725
+-1.16514755
+-1.879726959
+-3.919263494
+-0.1154875547
+0.4307021623
+-2.367220948
+-0.2955111024
+-4.358599237
+-2.843597893
+-2.608736078
+-0.9165518253
+-1.815442059
+0.6744616132
+-3.115417281
+2.315457506
+-1.440027883
+5.504235296
+-0.3262962756
+1.363424972
+0.2961280484
+-1.374916337
+-2.571132083
+-2.323208843
+2.126361984
+0.05542080609
+-0.3122417318
+-0.7045732141
+-0.7527190537
+-2.888250749
+1.480215461
+6.399150148
+2.951664881
+-5.42784507
+0.1270764425
+1.550616537
+-0.09876207915
+3.894334296
+-0.6063510814
+-2.499693002
+5.200800742
+0.5719470122
+-0.5334311809
+-3.255075357
+2.916786999
@@ -0,0 +1,1002 @@
+# mt01 ex 10.0 1234567890 1001 mV -30.5 140.25 10 
+1.3671042
+0.40332288
+0.061229429
+0.16763161
+-0.36462176
+-0.35852668
+-0.42005508
+-0.29453802
+-0.026316533
+0.56771299
+0.29244783
+0.63741154
+0.41059227
+0.010768135
+0.13282689
+0.05169894
+-0.20167112
+0.2164021
+-0.77812955
+-0.14809084
+0.48694572
+-0.0068686632
+-0.014103052
+-0.37830041
+-0.10226269
+-0.22618442
+-0.46126357
+-0.19651376
+0.23897985
+0.42193829
+0.0032658209
+-0.30963703
+-0.2181196
+-0.1749555
+-0.23322805
+-0.26703685
+-0.16615873
+0.073483386
+-0.65630778
+-0.19241121
+0.053875366
+0.076361103
+0.37162201
+-0.3694524
+0.056255554
+-0.019330921
+-0.25223081
+-0.28071296
+0.30869332
+0.18709663
+-0.024443267
+-0.33982
+0.036562911
+-0.37115811
+-0.10661238
+-0.11012971
+-0.23983587
+0.038429105
+-0.49060641
+-0.26869187
+-0.55922956
+-0.37939161
+0.090142268
+-0.12706983
+0.31123103
+-0.10454493
+-0.3645989
+-0.58289855
+0.27526544
+-0.14317734
+-0.027752597
+0.37094928
+-0.33235111
+-0.18987697
+-0.3599774
+0.064280193
+0.086032843
+-0.2174412
+-0.10695624
+-0.19753829
+-0.092214096
+0.16774741
+0.12069364
+0.25095344
+0.4109046
+-0.68890091
+-0.26430036
+-0.059646534
+-0.41039033
+-0.098630603
+0.038756606
+-0.31246664
+0.29089089
+0.24668597
+0.22336315
+0.52455871
+0.15197531
+0.56200407
+-0.023532901
+0.19526688
+-0.071368898
+0.062682626
+-0.11063002
+-0.073048443
+0.50120435
+0.13751062
+0.032249834
+-0.19945863
+-0.37728953
+-0.24921544
+0.10685998
+0.52762131
+0.46124117
+-0.19057243
+0.037801183
+-0.0063302652
+0.52786321
+0.41059039
+0.15051123
+0.14759973
+-0.21751201
+0.17923213
+0.19939567
+-0.0091273766
+0.25681035
+-0.22129895
+-0.23334073
+0.28268343
+-0.31300471
+0.17593179
+-0.47075359
+-0.32346229
+-0.32132344
+0.11375366
+-0.20524151
+0.5315271
+-0.027051127
+0.13001283
+0.47297146
+0.045567943
+0.063946519
+-0.09306141
+-0.63340556
+-0.12407423
+0.1324928
+0.19530145
+-0.24082867
+0.089479475
+0.13548069
+0.12446422
+-0.2665615
+-0.1235344
+0.33453956
+-0.057882224
+-0.25738452
+0.42504825
+0.11560143
+-0.12758998
+0.0057989477
+0.3545635
+-0.14563031
+-0.18603521
+0.11174263
+-0.032269195
+0.047315867
+0.19232022
+-0.21225101
+-0.13048813
+0.56370361
+0.30739628
+-0.047141903
+-0.20321446
+-0.47137525
+0.71275558
+-0.23424801
+-0.15763518
+0.1115192
+0.26277922
+0.10364243
+-0.60793764
+0.14823381
+-0.2992409
+-0.32340243
+-0.18309053
+-0.3292893
+0.12069756
+-0.13962775
+-0.32870715
+0.083591893
+0.14381493
+0.018780194
+-0.15847481
+0.19929835
+0.32065845
+0.33236163
+-0.41659889
+0.33116029
+0.38033089
+-0.56135058
+0.092033873
+-0.56660295
+0.0032789754
+-0.26369014
+0.50701424
+0.25192699
+-0.25169916
+0.14582602
+0.31734199
+0.27526212
+-0.11625753
+0.4761122
+0.068669122
+-0.27864729
+0.1099013
+-0.31968932
+-0.55199637
+-0.69076319
+0.38059012
+-0.26552185
+-0.23665813
+0.23844275
+-0.12119589
+-0.074143109
+-0.13568537
+-0.12157223
+-0.03493008
+-0.43832592
+0.22915732
+-0.096872548
+-0.071537013
+0.20720763
+-0.065080836
+0.21338953
+-0.12591964
+-0.20023662
+0.37585159
+-0.88140201
+0.021244754
+0.14326048
+-0.06123884
+0.036817806
+0.41847351
+0.24387454
+-0.46318302
+-0.06028613
+0.46401607
+-0.12321147
+-0.66740802
+-0.25829719
+0.64365474
+0.1580528
+-0.66067975
+0.12659842
+-0.13753082
+0.36553607
+0.11297535
+0.078924446
+-0.041692511
+-0.33528617
+0.013695789
+-0.50276066
+-0.34346936
+0.3730661
+0.5145151
+-0.2758648
+-0.29401199
+0.20570097
+0.29730915
+-0.33291519
+-0.097811222
+-0.37453804
+-0.15839974
+-0.29370344
+0.065152932
+0.22342625
+-0.30590852
+0.077839525
+-0.34145418
+0.20190205
+0.028441732
+-0.38058695
+0.071566085
+-0.18332614
+0.13133443
+-0.043983941
+0.18196947
+-0.037763269
+0.075344064
+-0.61720993
+0.8743052
+-0.34042455
+-0.5687816
+0.1446349
+-0.192031
+-0.25683932
+-0.45575583
+0.025016114
+0.036305366
+-0.044847713
+-0.20817834
+0.15119364
+-0.48737104
+-0.31988452
+-0.00031897257
+0.33364533
+0.24161568
+-0.5668558
+-0.32456223
+0.11821394
+-0.0062395763
+-0.20915735
+0.05298469
+0.44735502
+-0.62434709
+-0.26553625
+-0.24638232
+0.40560668
+-0.48404358
+0.03772289
+0.55725331
+-0.52201883
+-0.4187911
+-0.20447988
+0.64371585
+-0.29695615
+0.59419728
+-0.12605895
+-0.43012583
+0.42771305
+-0.11240101
+-0.12646657
+-0.45347763
+-0.43907296
+0.24992757
+0.39668784
+0.58228567
+-0.14386158
+-0.68403003
+0.26864456
+-0.24190244
+-0.2973947
+0.14896697
+0.22990476
+-0.14303016
+0.072467271
+0.22058149
+-0.024828479
+0.31558021
+-0.32906081
+-0.011276232
+0.4671456
+0.15218458
+0.13674516
+0.48933403
+-0.1098311
+0.06443403
+0.10900832
+-0.22362358
+0.19669267
+-0.30229182
+0.070369644
+0.10251175
+0.48559781
+-0.27591755
+0.14756688
+0.28279102
+-0.047661236
+-0.63099354
+-0.42974294
+0.38972365
+-0.017084506
+0.073139708
+0.19647074
+-0.26561347
+-0.12252719
+-0.12552847
+-0.19803189
+0.30363747
+0.065566289
+-0.27147901
+-0.19016853
+-0.35661409
+-0.14806897
+0.073591371
+0.067878604
+0.24353548
+0.38133993
+-0.057957749
+-0.28454106
+-0.013890921
+0.023418724
+-0.12140339
+-0.43893513
+0.091403967
+0.13664587
+-0.42988005
+-0.39916808
+0.30498202
+0.52140271
+-0.18853172
+0.56556356
+-0.46184689
+-0.078592901
+0.41574162
+0.14299332
+0.0057545517
+-0.15646211
+-0.13695863
+-1.1024006
+0.12946934
+-0.075645999
+-0.171207
+-0.27818099
+0.19203186
+-0.31151497
+0.017070744
+0.18843742
+0.21562537
+0.039606402
+-0.067656268
+0.09926907
+-0.52978293
+-0.06094127
+-0.26925457
+-0.031535368
+0.10927673
+-0.25686264
+0.29647838
+-0.15764172
+-0.010073015
+0.28509302
+-0.10033255
+0.36728654
+0.41015112
+-0.082120744
+-0.021834189
+0.51917006
+0.64145971
+-0.15432013
+-0.24847008
+0.031381333
+-0.10994399
+0.40135669
+0.38605264
+0.027658541
+0.081292932
+0.0051445247
+-0.36731672
+-0.016957789
+-0.52159812
+0.18769925
+-0.30824275
+0.14441882
+0.45691267
+0.71643289
+-0.17817098
+0.080216659
+0.022259843
+-0.26756707
+-0.42325841
+-0.076414281
+0.43739171
+-0.26522281
+0.27783901
+-0.049831076
+-0.0012409454
+-0.062027824
+-0.25820303
+0.09676769
+-0.23935513
+0.38703864
+-0.50511314
+0.52456184
+0.01697075
+-0.24082726
+0.52888018
+-0.079852117
+-0.35404294
+0.56596469
+-0.28063226
+-0.16217143
+0.52018324
+0.21112343
+-0.22552064
+0.17909937
+0.078286322
+0.06589344
+-0.20514894
+-0.3777395
+0.1941109
+0.82949927
+-0.032586179
+-0.24825397
+0.27468861
+-0.042484185
+0.76746196
+0.16993477
+0.1778456
+-0.050639556
+0.18781555
+-0.074572171
+0.014553079
+-0.35758097
+-0.057038813
+-0.015731696
+0.2513587
+-0.29564605
+-0.17577012
+-0.066033061
+0.062380506
+-0.078707485
+-0.28714932
+-0.26463565
+0.34863951
+-0.078280329
+0.16503754
+-0.40482827
+-0.35181176
+-0.15213823
+-0.25063969
+0.015009527
+-0.42487824
+0.24475346
+-0.29805328
+0.46069105
+0.066251185
+0.45622107
+0.021435417
+0.31575962
+-0.46410297
+-0.29233357
+0.22057912
+0.6011583
+-0.088122399
+-0.20930931
+0.18096666
+-0.11970242
+-0.089694314
+0.17080351
+-0.017073025
+0.099865104
+0.53193611
+0.099517266
+0.44399643
+-0.21088893
+-0.59306154
+-0.39366478
+-0.15520888
+0.10378031
+0.40610698
+-0.12695459
+0.030830068
+-0.2846151
+-0.42124646
+-0.01050017
+0.44900865
+-0.15846227
+-0.29923424
+-0.23466464
+-0.6042386
+0.031860179
+0.29807507
+-0.034479716
+0.12138363
+-0.018189643
+0.59051482
+0.23924816
+-0.13856558
+0.25270021
+0.076207514
+-0.069679405
+-0.27135299
+-0.13554254
+0.1378091
+0.18506395
+0.24648224
+0.17069893
+0.30359552
+-0.46794835
+0.1397372
+-0.0040217241
+0.16657125
+0.10607984
+-0.012006468
+0.28920412
+0.21168965
+-0.13041641
+-0.014070388
+-0.6794548
+0.04147703
+-0.043470875
+-0.086546047
+-0.11068784
+-0.3015418
+-0.058379604
+0.20682672
+0.10280201
+-0.090071523
+-0.56400773
+0.1483207
+0.074267864
+-0.12015558
+-0.19616881
+0.22111132
+0.035052898
+0.34002101
+-0.38650187
+-0.021469159
+0.36006239
+0.49670473
+-0.25091215
+-0.4897933
+0.41667853
+-0.14232556
+-0.039365629
+0.69307446
+-0.67561111
+0.15247092
+-0.04174473
+0.049647104
+0.11348133
+-0.31657235
+0.41417438
+0.47231048
+0.047203095
+0.25146666
+-0.10952321
+-0.26468105
+0.42066302
+0.33210579
+-0.058846053
+-0.36623845
+-0.46632867
+-0.32516704
+-0.47695181
+-0.10286397
+-0.025467182
+0.017759046
+0.024056937
+-0.0070032889
+-0.21125107
+0.085268854
+0.16501111
+-0.023844354
+0.41830124
+-0.15832483
+0.12385232
+-0.28528708
+-0.087831574
+-0.23240577
+-0.13267961
+-0.25459831
+-0.27381178
+-0.044718149
+0.31180303
+-0.18302543
+-0.62935197
+0.43633252
+0.11543775
+0.4923473
+-0.11484616
+-0.244029
+0.077371701
+0.16579872
+-0.023937085
+0.38313893
+-0.16202478
+0.42291733
+0.44364401
+0.064291989
+-0.25032962
+0.36993922
+-0.39057803
+-0.66743911
+-0.11499129
+-0.171033
+0.01378853
+0.12203868
+0.079460786
+0.2207735
+0.050385035
+0.27058098
+0.006937908
+0.15780226
+0.31507323
+-0.068982912
+0.3637006
+0.24034886
+-0.29322665
+0.12452326
+-0.247105
+-0.077515065
+0.34799584
+0.20342931
+-0.25380639
+0.38259137
+0.24247046
+-0.17790745
+0.11206543
+0.1204127
+-0.49266541
+-0.07375815
+0.30507848
+-0.62802156
+-0.2470158
+0.36815346
+-0.069933582
+-0.12481618
+-0.2579997
+0.083101435
+-0.27066273
+0.43546404
+-0.18414262
+-0.18522149
+-0.071446031
+-0.43793157
+-0.38615813
+-0.075902619
+-0.11096445
+-0.22824185
+0.2421089
+-0.15729096
+-0.68264419
+0.28857003
+0.59782964
+-0.14913393
+-0.44569531
+-0.013956715
+0.38016875
+-0.64604506
+-0.034472994
+0.27253203
+0.33549369
+-0.10762965
+0.12635072
+0.50010767
+-0.16922649
+-0.13549188
+0.34541693
+0.085970565
+-0.14210295
+0.38277671
+-0.37741913
+-0.17831831
+-0.31497184
+0.051955395
+-0.10839229
+-0.36645867
+0.0032689266
+0.7264288
+0.14316383
+-0.12603648
+-0.090292974
+0.067872146
+-0.38758477
+-0.21955702
+-0.028984621
+-0.16810617
+-0.087170892
+-0.37187138
+0.16832601
+0.42276458
+0.29763852
+0.11447013
+-0.57920612
+0.054511128
+0.042711268
+-0.12296917
+-0.06049953
+0.28198416
+-0.12204289
+0.51210992
+0.75711293
+-0.035864977
+0.19882691
+0.24362741
+0.17599713
+-0.16262391
+0.14747969
+-0.012892113
+-0.12316415
+-0.30736644
+-0.34307947
+0.21773259
+0.16891705
+-0.025620142
+-0.22482437
+0.64781893
+-0.21742837
+-0.36347199
+-0.3586574
+-0.52761226
+0.24845203
+-0.21488682
+-0.5158374
+0.27815701
+0.1819202
+-0.079126316
+-0.29269017
+-0.14835346
+0.11952148
+-0.48238097
+0.13708124
+-0.3433791
+-0.19753988
+0.51832184
+-0.19072778
+0.02008661
+-0.50047624
+-0.55840124
+0.21038572
+-0.18428272
+0.82811215
+-0.37150113
+-0.44895764
+-0.28820233
+0.1501932
+-0.65547787
+-0.03947858
+0.12600563
+0.048271291
+0.31085826
+-0.051392254
+0.10666591
+-0.071486709
+0.02053546
+0.47763134
+0.3106951
+0.48222354
+0.015276484
+-0.036150109
+-0.19366541
+-0.24651588
+-0.13922374
+0.1471631
+0.00022676634
+0.064783797
+-0.17657196
+-0.15606767
+0.22209061
+0.07180314
+-0.12464728
+-0.68918229
+-0.37408653
+0.02755471
+-0.23003974
+-0.93736201
+-0.71648188
+-0.069912477
+0.49040054
+0.15392108
+0.56456679
+-0.58734775
+-0.052297791
+0.27655223
+0.28450714
+0.16399138
+-0.018139608
+-0.43611308
+0.10635088
+-0.15978567
+-0.13326961
+-0.13648043
+0.29074624
+-0.645534
+0.21930044
+0.037963597
+-0.2276077
+0.40576525
+0.0086954695
+-0.15223179
+0.044487257
+-0.30491597
+0.31601154
+0.26333279
+0.25840623
+-0.40556876
+-0.088827419
+-0.54804077
+0.39551236
+-0.086019318
+-0.10949787
+0.068489845
+-0.70315154
+0.062835347
+0.3379826
+-0.03762553
+-0.38750216
+-0.31881216
+0.39451559
+0.30890969
+-0.19819632
+-0.4891151
+-0.13336992
+0.21980406
+-0.14524322
+0.23506742
+-0.2853667
+-0.21402577
+-0.007886691
+0.089954864
+-0.30550926
+-0.31601691
+-0.64784601
+-0.4354187
+0.010874901
+-0.36665311
+0.1004214
+0.017706626
+-0.22396974
+0.42639133
+-0.40887861
+-0.049102033
+0.15992038
+0.49176728
+-0.24798659
+-0.19610154
+-0.50425463
+-0.28480623
+0.15451902
+0.21493892
+-0.00059201525
+-0.27645732
+-0.57311709
+-0.70459638
+-0.21091959
+0.36303263
+-0.00090310581
+-0.1879611
+-0.16166499
+0.12396901
+-0.046705421
+-0.058385947
+0.014706771
+-0.063822456
+0.1898196
+-0.26823831
+-0.02915713
+-0.21285305
+-0.01560554
+0.16365329
+-0.28220629
+0.27096836
+0.11206622
+0.2204848
+-0.1332931
+0.19536705
+0.18546041
+0.34251946
+0.1390664
+-0.012638896
+-0.37276419
+0.49163342
+0.16076857
+-0.89820965
+0.57137806
+0.40721954
+-0.5620728
+-0.15798042
+-0.054321605
+0.43401829
+-0.038498838
+0.10101218
+0.16093
+-0.12103286
+-0.36874087
+-0.18175173
+-0.39772161
+0.51208374
+-0.12753879
+-0.08806634
+0.31549446
+0.16439714
+0.056633518
+-0.41102408
+-0.34483522
+0.048276567
+-0.35279709
+-0.12613486
+0.27439788
+-0.32571465
+-0.17952691
+-0.18011393
+0.13939936
+0.22661157
+0.24291757
+0.044372009
+-0.13190179
+0.20369385
+0.072718764
+0.33588185
+0.4524875
+0.31146372
+0.48013169
+0.067358252
+0.33514879
+-0.0027967117
+-0.65802471
+0.059734106
+-0.021724461
+0.26363174
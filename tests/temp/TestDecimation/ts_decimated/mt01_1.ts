@@ -0,0 +1,1002 @@
+# mt01 ex 10.0 1234567890 1001 mV -30.5 140.25 10 
+2.7342083
+0.80664575
+0.12245886
+0.33526321
+-0.72924352
+-0.71705337
+-0.84011016
+-0.58907605
+-0.052633067
+1.135426
+0.58489566
+1.2748231
+0.82118453
+0.021536269
+0.26565378
+0.10339788
+-0.40334224
+0.43280421
+-1.5562591
+-0.29618168
+0.97389143
+-0.013737327
+-0.028206103
+-0.75660083
+-0.20452538
+-0.45236885
+-0.92252715
+-0.39302752
+0.4779597
+0.84387658
+0.0065316417
+-0.61927406
+-0.4362392
+-0.349911
+-0.46645609
+-0.5340737
+-0.33231745
+0.14696677
+-1.3126156
+-0.38482242
+0.10775073
+0.15272221
+0.74324403
+-0.73890481
+0.11251111
+-0.038661842
+-0.50446163
+-0.56142592
+0.61738665
+0.37419326
+-0.048886535
+-0.67964
+0.073125823
+-0.74231621
+-0.21322476
+-0.22025942
+-0.47967173
+0.076858209
+-0.98121281
+-0.53738374
+-1.1184591
+-0.75878323
+0.18028454
+-0.25413966
+0.62246206
+-0.20908986
+-0.7291978
+-1.1657971
+0.55053088
+-0.28635467
+-0.055505193
+0.74189856
+-0.66470221
+-0.37975395
+-0.71995481
+0.12856039
+0.17206569
+-0.4348824
+-0.21391248
+-0.39507659
+-0.18442819
+0.33549481
+0.24138729
+0.50190688
+0.82180921
+-1.3778018
+-0.52860072
+-0.11929307
+-0.82078065
+-0.19726121
+0.077513212
+-0.62493327
+0.58178178
+0.49337193
+0.4467263
+1.0491174
+0.30395061
+1.1240081
+-0.047065801
+0.39053376
+-0.1427378
+0.12536525
+-0.22126003
+-0.14609689
+1.0024087
+0.27502123
+0.064499668
+-0.39891726
+-0.75457906
+-0.49843089
+0.21371996
+1.0552426
+0.92248234
+-0.38114485
+0.075602366
+-0.01266053
+1.0557264
+0.82118078
+0.30102246
+0.29519946
+-0.43502402
+0.35846426
+0.39879134
+-0.018254753
+0.51362071
+-0.44259789
+-0.46668145
+0.56536687
+-0.62600942
+0.35186358
+-0.94150719
+-0.64692458
+-0.64264688
+0.22750732
+-0.41048302
+1.0630542
+-0.054102254
+0.26002566
+0.94594291
+0.091135885
+0.12789304
+-0.18612282
+-1.2668111
+-0.24814846
+0.26498561
+0.39060289
+-0.48165735
+0.17895895
+0.27096137
+0.24892844
+-0.53312299
+-0.2470688
+0.66907912
+-0.11576445
+-0.51476905
+0.8500965
+0.23120286
+-0.25517996
+0.011597896
+0.70912699
+-0.29126062
+-0.37207042
+0.22348527
+-0.064538391
+0.094631733
+0.38464045
+-0.42450203
+-0.26097626
+1.1274072
+0.61479256
+-0.094283806
+-0.40642893
+-0.94275049
+1.4255112
+-0.46849601
+-0.31527036
+0.2230384
+0.52555844
+0.20728485
+-1.2158753
+0.29646763
+-0.59848181
+-0.64680485
+-0.36618107
+-0.6585786
+0.24139511
+-0.27925549
+-0.6574143
+0.16718379
+0.28762985
+0.037560388
+-0.31694963
+0.3985967
+0.64131691
+0.66472327
+-0.83319777
+0.66232058
+0.76066177
+-1.1227012
+0.18406775
+-1.1332059
+0.006557951
+-0.52738027
+1.0140285
+0.50385399
+-0.50339833
+0.29165205
+0.63468397
+0.55052423
+-0.23251506
+0.9522244
+0.13733824
+-0.55729458
+0.2198026
+-0.63937864
+-1.1039927
+-1.3815264
+0.76118024
+-0.53104369
+-0.47331625
+0.4768855
+-0.24239178
+-0.14828622
+-0.27137074
+-0.24314445
+-0.069860159
+-0.87665185
+0.45831463
+-0.1937451
+-0.14307403
+0.41441525
+-0.13016167
+0.42677905
+-0.25183928
+-0.40047325
+0.75170319
+-1.762804
+0.042489508
+0.28652096
+-0.12247768
+0.073635613
+0.83694703
+0.48774909
+-0.92636604
+-0.12057226
+0.92803215
+-0.24642294
+-1.334816
+-0.51659438
+1.2873095
+0.31610561
+-1.3213595
+0.25319683
+-0.27506164
+0.73107214
+0.22595069
+0.15784889
+-0.083385023
+-0.67057233
+0.027391577
+-1.0055213
+-0.68693872
+0.74613219
+1.0290302
+-0.5517296
+-0.58802398
+0.41140195
+0.5946183
+-0.66583038
+-0.19562244
+-0.74907607
+-0.31679948
+-0.58740687
+0.13030586
+0.44685251
+-0.61181704
+0.15567905
+-0.68290835
+0.4038041
+0.056883463
+-0.7611739
+0.14313217
+-0.36665228
+0.26266886
+-0.087967882
+0.36393895
+-0.075526538
+0.15068813
+-1.2344199
+1.7486104
+-0.6808491
+-1.1375632
+0.28926981
+-0.38406201
+-0.51367864
+-0.91151167
+0.050032229
+0.072610731
+-0.089695426
+-0.41635668
+0.30238728
+-0.97474207
+-0.63976905
+-0.0006379451
+0.66729065
+0.48323137
+-1.1337116
+-0.64912446
+0.23642788
+-0.012479153
+-0.4183147
+0.10596938
+0.89471005
+-1.2486942
+-0.5310725
+-0.49276463
+0.81121336
+-0.96808715
+0.075445781
+1.1145066
+-1.0440377
+-0.8375822
+-0.40895976
+1.2874317
+-0.59391231
+1.1883946
+-0.25211791
+-0.86025165
+0.85542609
+-0.22480202
+-0.25293313
+-0.90695525
+-0.87814593
+0.49985514
+0.79337569
+1.1645713
+-0.28772315
+-1.3680601
+0.53728912
+-0.48380488
+-0.5947894
+0.29793394
+0.45980953
+-0.28606031
+0.14493454
+0.44116297
+-0.049656958
+0.63116042
+-0.65812161
+-0.022552464
+0.9342912
+0.30436916
+0.27349033
+0.97866806
+-0.21966221
+0.12886806
+0.21801663
+-0.44724717
+0.39338534
+-0.60458364
+0.14073929
+0.2050235
+0.97119562
+-0.5518351
+0.29513377
+0.56558203
+-0.095322471
+-1.2619871
+-0.85948588
+0.7794473
+-0.034169012
+0.14627942
+0.39294148
+-0.53122695
+-0.24505439
+-0.25105693
+-0.39606378
+0.60727493
+0.13113258
+-0.54295802
+-0.38033705
+-0.71322818
+-0.29613794
+0.14718274
+0.13575721
+0.48707096
+0.76267986
+-0.1159155
+-0.56908212
+-0.027781843
+0.046837447
+-0.24280678
+-0.87787025
+0.18280793
+0.27329174
+-0.85976009
+-0.79833617
+0.60996404
+1.0428054
+-0.37706344
+1.1311271
+-0.92369378
+-0.1571858
+0.83148323
+0.28598665
+0.011509103
+-0.31292423
+-0.27391725
+-2.2048011
+0.25893869
+-0.151292
+-0.342414
+-0.55636198
+0.38406372
+-0.62302993
+0.034141488
+0.37687485
+0.43125075
+0.079212805
+-0.13531254
+0.19853814
+-1.0595659
+-0.12188254
+-0.53850915
+-0.063070736
+0.21855346
+-0.51372528
+0.59295675
+-0.31528344
+-0.020146029
+0.57018605
+-0.20066511
+0.73457307
+0.82030223
+-0.16424149
+-0.043668378
+1.0383401
+1.2829194
+-0.30864026
+-0.49694016
+0.062762667
+-0.21988797
+0.80271337
+0.77210528
+0.055317082
+0.16258586
+0.010289049
+-0.73463343
+-0.033915578
+-1.0431962
+0.37539849
+-0.6164855
+0.28883763
+0.91382535
+1.4328658
+-0.35634195
+0.16043332
+0.044519685
+-0.53513414
+-0.84651682
+-0.15282856
+0.87478343
+-0.53044561
+0.55567802
+-0.099662152
+-0.0024818908
+-0.12405565
+-0.51640606
+0.19353538
+-0.47871026
+0.77407728
+-1.0102263
+1.0491237
+0.0339415
+-0.48165451
+1.0577604
+-0.15970423
+-0.70808589
+1.1319294
+-0.56126452
+-0.32434286
+1.0403665
+0.42224686
+-0.45104128
+0.35819873
+0.15657264
+0.13178688
+-0.41029787
+-0.75547901
+0.3882218
+1.6589985
+-0.065172357
+-0.49650795
+0.54937723
+-0.084968371
+1.5349239
+0.33986954
+0.3556912
+-0.10127911
+0.3756311
+-0.14914434
+0.029106157
+-0.71516194
+-0.11407763
+-0.031463393
+0.50271741
+-0.5912921
+-0.35154023
+-0.13206612
+0.12476101
+-0.15741497
+-0.57429863
+-0.5292713
+0.69727902
+-0.15656066
+0.33007509
+-0.80965654
+-0.70362353
+-0.30427646
+-0.50127938
+0.030019055
+-0.84975648
+0.48950692
+-0.59610655
+0.92138209
+0.13250237
+0.91244214
+0.042870834
+0.63151924
+-0.92820595
+-0.58466715
+0.44115825
+1.2023166
+-0.1762448
+-0.41861863
+0.36193332
+-0.23940484
+-0.17938863
+0.34160702
+-0.03414605
+0.19973021
+1.0638722
+0.19903453
+0.88799287
+-0.42177787
+-1.1861231
+-0.78732957
+-0.31041776
+0.20756061
+0.81221397
+-0.25390918
+0.061660136
+-0.5692302
+-0.84249291
+-0.021000339
+0.89801729
+-0.31692454
+-0.59846849
+-0.46932927
+-1.2084772
+0.063720359
+0.59615013
+-0.068959431
+0.24276727
+-0.036379285
+1.1810296
+0.47849631
+-0.27713116
+0.50540042
+0.15241503
+-0.13935881
+-0.54270598
+-0.27108508
+0.27561819
+0.37012789
+0.49296448
+0.34139787
+0.60719103
+-0.93589671
+0.2794744
+-0.008043448
+0.33314251
+0.21215968
+-0.024012935
+0.57840825
+0.42337929
+-0.26083281
+-0.028140776
+-1.3589096
+0.08295406
+-0.086941749
+-0.17309209
+-0.22137568
+-0.6030836
+-0.11675921
+0.41365343
+0.20560403
+-0.18014305
+-1.1280155
+0.2966414
+0.14853573
+-0.24031116
+-0.39233762
+0.44222264
+0.070105796
+0.68004203
+-0.77300373
+-0.042938317
+0.72012478
+0.99340946
+-0.5018243
+-0.9795866
+0.83335705
+-0.28465111
+-0.078731259
+1.3861489
+-1.3512222
+0.30494183
+-0.083489461
+0.099294208
+0.22696265
+-0.63314471
+0.82834876
+0.94462095
+0.09440619
+0.50293332
+-0.21904643
+-0.52936209
+0.84132604
+0.66421159
+-0.11769211
+-0.73247691
+-0.93265734
+-0.65033408
+-0.95390362
+-0.20572794
+-0.050934364
+0.035518092
+0.048113874
+-0.014006578
+-0.42250214
+0.17053771
+0.33002221
+-0.047688709
+0.83660248
+-0.31664966
+0.24770465
+-0.57057416
+-0.17566315
+-0.46481154
+-0.26535922
+-0.50919662
+-0.54762355
+-0.089436299
+0.62360606
+-0.36605085
+-1.2587039
+0.87266504
+0.23087551
+0.98469461
+-0.22969233
+-0.488058
+0.1547434
+0.33159745
+-0.047874171
+0.76627786
+-0.32404955
+0.84583466
+0.88728803
+0.12858398
+-0.50065925
+0.73987844
+-0.78115607
+-1.3348782
+-0.22998259
+-0.34206599
+0.027577059
+0.24407737
+0.15892157
+0.441547
+0.10077007
+0.54116197
+0.013875816
+0.31560451
+0.63014646
+-0.13796582
+0.72740121
+0.48069773
+-0.58645329
+0.24904653
+-0.49420999
+-0.15503013
+0.69599167
+0.40685861
+-0.50761277
+0.76518274
+0.48494091
+-0.3558149
+0.22413087
+0.2408254
+-0.98533082
+-0.1475163
+0.61015696
+-1.2560431
+-0.4940316
+0.73630692
+-0.13986716
+-0.24963237
+-0.51599939
+0.16620287
+-0.54132546
+0.87092808
+-0.36828523
+-0.37044298
+-0.14289206
+-0.87586315
+-0.77231626
+-0.15180524
+-0.2219289
+-0.4564837
+0.4842178
+-0.31458192
+-1.3652884
+0.57714005
+1.1956593
+-0.29826786
+-0.89139061
+-0.02791343
+0.76033751
+-1.2920901
+-0.068945989
+0.54506406
+0.67098737
+-0.2152593
+0.25270144
+1.0002153
+-0.33845298
+-0.27098376
+0.69083387
+0.17194113
+-0.2842059
+0.76555343
+-0.75483826
+-0.35663662
+-0.62994368
+0.10391079
+-0.21678457
+-0.73291734
+0.0065378533
+1.4528576
+0.28632766
+-0.25207296
+-0.18058595
+0.13574429
+-0.77516954
+-0.43911404
+-0.057969242
+-0.33621234
+-0.17434178
+-0.74374277
+0.33665203
+0.84552917
+0.59527704
+0.22894027
+-1.1584122
+0.10902226
+0.085422536
+-0.24593833
+-0.12099906
+0.56396831
+-0.24408578
+1.0242198
+1.5142259
+-0.071729954
+0.39765382
+0.48725481
+0.35199426
+-0.32524782
+0.29495939
+-0.025784227
+-0.24632829
+-0.61473288
+-0.68615894
+0.43546518
+0.3378341
+-0.051240285
+-0.44964875
+1.2956379
+-0.43485673
+-0.72694397
+-0.7173148
+-1.0552245
+0.49690406
+-0.42977363
+-1.0316748
+0.55631402
+0.36384041
+-0.15825263
+-0.58538034
+-0.29670692
+0.23904296
+-0.96476193
+0.27416247
+-0.6867582
+-0.39507977
+1.0366437
+-0.38145556
+0.040173219
+-1.0009525
+-1.1168025
+0.42077143
+-0.36856543
+1.6562243
+-0.74300226
+-0.89791529
+-0.57640466
+0.3003864
+-1.3109557
+-0.078957161
+0.25201125
+0.096542583
+0.62171653
+-0.10278451
+0.21333182
+-0.14297342
+0.041070919
+0.95526268
+0.6213902
+0.96444708
+0.030552968
+-0.072300218
+-0.38733083
+-0.49303177
+-0.27844749
+0.2943262
+0.00045353265
+0.12956759
+-0.35314393
+-0.31213533
+0.44418123
+0.14360628
+-0.24929456
+-1.3783646
+-0.74817306
+0.05510942
+-0.46007947
+-1.874724
+-1.4329638
+-0.13982495
+0.98080108
+0.30784215
+1.1291336
+-1.1746955
+-0.10459558
+0.55310447
+0.56901427
+0.32798275
+-0.036279216
+-0.87222616
+0.21270175
+-0.31957133
+-0.26653921
+-0.27296086
+0.58149248
+-1.291068
+0.43860087
+0.075927194
+-0.4552154
+0.8115305
+0.017390939
+-0.30446357
+0.088974514
+-0.60983194
+0.63202308
+0.52666558
+0.51681247
+-0.81113752
+-0.17765484
+-1.0960815
+0.79102472
+-0.17203864
+-0.21899574
+0.13697969
+-1.4063031
+0.12567069
+0.6759652
+-0.07525106
+-0.77500431
+-0.63762432
+0.78903118
+0.61781937
+-0.39639265
+-0.9782302
+-0.26673983
+0.43960812
+-0.29048644
+0.47013485
+-0.5707334
+-0.42805154
+-0.015773382
+0.17990973
+-0.61101851
+-0.63203383
+-1.295692
+-0.8708374
+0.021749802
+-0.73330621
+0.20084281
+0.035413253
+-0.44793947
+0.85278265
+-0.81775723
+-0.098204066
+0.31984076
+0.98353457
+-0.49597318
+-0.39220308
+-1.0085093
+-0.56961246
+0.30903803
+0.42987784
+-0.0011840306
+-0.55291464
+-1.1462342
+-1.4091928
+-0.42183917
+0.72606526
+-0.0018062116
+-0.3759222
+-0.32332998
+0.24793801
+-0.093410842
+-0.11677189
+0.029413542
+-0.12764491
+0.3796392
+-0.53647662
+-0.05831426
+-0.4257061
+-0.03121108
+0.32730658
+-0.56441259
+0.54193672
+0.22413243
+0.44096959
+-0.26658619
+0.3907341
+0.37092083
+0.68503891
+0.27813281
+-0.025277792
+-0.74552839
+0.98326683
+0.32153714
+-1.7964193
+1.1427561
+0.81443909
+-1.1241456
+-0.31596083
+-0.10864321
+0.86803659
+-0.076997676
+0.20202436
+0.32185999
+-0.24206573
+-0.73748173
+-0.36350345
+-0.79544323
+1.0241675
+-0.25507758
+-0.17613268
+0.63098891
+0.32879428
+0.11326704
+-0.82204816
+-0.68967045
+0.096553133
+-0.70559417
+-0.25226972
+0.54879576
+-0.6514293
+-0.35905382
+-0.36022785
+0.27879873
+0.45322314
+0.48583515
+0.088744017
+-0.26380358
+0.4073877
+0.14543753
+0.67176369
+0.904975
+0.62292744
+0.96026339
+0.1347165
+0.67029758
+-0.0055934234
+-1.3160494
+0.11946821
+-0.043448923
+0.52726347
@@ -0,0 +1,1002 @@
+# mt01 ex 10.0 1234567890 1001 mV -30.5 140.25 10 
+4.1013125
+1.2099686
+0.18368829
+0.50289482
+-1.0938653
+-1.0755801
+-1.2601652
+-0.88361407
+-0.0789496
+1.703139
+0.87734349
+1.9122346
+1.2317768
+0.032304404
+0.39848067
+0.15509682
+-0.60501336
+0.64920631
+-2.3343886
+-0.44427252
+1.4608371
+-0.02060599
+-0.042309155
+-1.1349012
+-0.30678807
+-0.67855327
+-1.3837907
+-0.58954127
+0.71693954
+1.2658149
+0.0097974626
+-0.92891109
+-0.6543588
+-0.5248665
+-0.69968414
+-0.80111056
+-0.49847618
+0.22045016
+-1.9689234
+-0.57723363
+0.1616261
+0.22908331
+1.114866
+-1.1083572
+0.16876666
+-0.057992762
+-0.75669244
+-0.84213888
+0.92607997
+0.56128989
+-0.073329803
+-1.01946
+0.10968873
+-1.1134743
+-0.31983713
+-0.33038913
+-0.7195076
+0.11528731
+-1.4718192
+-0.80607561
+-1.6776887
+-1.1381748
+0.2704268
+-0.38120949
+0.93369309
+-0.31363478
+-1.0937967
+-1.7486957
+0.82579632
+-0.42953201
+-0.08325779
+1.1128478
+-0.99705332
+-0.56963092
+-1.0799322
+0.19284058
+0.25809853
+-0.65232361
+-0.32086872
+-0.59261488
+-0.27664229
+0.50324222
+0.36208093
+0.75286032
+1.2327138
+-2.0667027
+-0.79290109
+-0.1789396
+-1.231171
+-0.29589181
+0.11626982
+-0.93739991
+0.87267267
+0.7400579
+0.67008945
+1.5736761
+0.45592592
+1.6860122
+-0.070598702
+0.58580064
+-0.2141067
+0.18804788
+-0.33189005
+-0.21914533
+1.5036131
+0.41253185
+0.096749501
+-0.59837589
+-1.1318686
+-0.74764633
+0.32057994
+1.5828639
+1.3837235
+-0.57171728
+0.11340355
+-0.018990796
+1.5835896
+1.2317712
+0.4515337
+0.44279919
+-0.65253603
+0.53769639
+0.598187
+-0.02738213
+0.77043106
+-0.66389684
+-0.70002218
+0.8480503
+-0.93901413
+0.52779538
+-1.4122608
+-0.97038687
+-0.96397032
+0.34126097
+-0.61572454
+1.5945813
+-0.081153381
+0.39003849
+1.4189144
+0.13670383
+0.19183956
+-0.27918423
+-1.9002167
+-0.37222269
+0.39747841
+0.58590434
+-0.72248602
+0.26843842
+0.40644206
+0.37339265
+-0.79968449
+-0.37060319
+1.0036187
+-0.17364667
+-0.77215357
+1.2751448
+0.34680429
+-0.38276994
+0.017396843
+1.0636905
+-0.43689093
+-0.55810563
+0.3352279
+-0.096807586
+0.1419476
+0.57696067
+-0.63675304
+-0.39146439
+1.6911108
+0.92218885
+-0.14142571
+-0.60964339
+-1.4141257
+2.1382667
+-0.70274402
+-0.47290554
+0.3345576
+0.78833766
+0.31092728
+-1.8238129
+0.44470144
+-0.89772271
+-0.97020728
+-0.5492716
+-0.98786789
+0.36209267
+-0.41888324
+-0.98612144
+0.25077568
+0.43144478
+0.056340583
+-0.47542444
+0.59789505
+0.96197536
+0.9970849
+-1.2497967
+0.99348087
+1.1409927
+-1.6840517
+0.27610162
+-1.6998089
+0.0098369262
+-0.79107041
+1.5210427
+0.75578098
+-0.75509749
+0.43747807
+0.95202596
+0.82578635
+-0.34877259
+1.4283366
+0.20600737
+-0.83594188
+0.3297039
+-0.95906796
+-1.6559891
+-2.0722896
+1.1417704
+-0.79656554
+-0.70997438
+0.71532825
+-0.36358767
+-0.22242933
+-0.40705612
+-0.36471668
+-0.10479024
+-1.3149778
+0.68747195
+-0.29061764
+-0.21461104
+0.62162288
+-0.19524251
+0.64016858
+-0.37775892
+-0.60070987
+1.1275548
+-2.644206
+0.063734261
+0.42978145
+-0.18371652
+0.11045342
+1.2554205
+0.73162363
+-1.3895491
+-0.18085839
+1.3920482
+-0.36963441
+-2.0022241
+-0.77489157
+1.9309642
+0.47415841
+-1.9820392
+0.37979525
+-0.41259246
+1.0966082
+0.33892604
+0.23677334
+-0.12507753
+-1.0058585
+0.041087366
+-1.508282
+-1.0304081
+1.1191983
+1.5435453
+-0.8275944
+-0.88203597
+0.61710292
+0.89192745
+-0.99874558
+-0.29343367
+-1.1236141
+-0.47519922
+-0.88111031
+0.19545879
+0.67027876
+-0.91772556
+0.23351858
+-1.0243625
+0.60570616
+0.085325195
+-1.1417609
+0.21469825
+-0.54997842
+0.3940033
+-0.13195182
+0.54590842
+-0.11328981
+0.22603219
+-1.8516298
+2.6229156
+-1.0212736
+-1.7063448
+0.43390471
+-0.57609301
+-0.77051796
+-1.3672675
+0.075048344
+0.1089161
+-0.13454314
+-0.62453502
+0.45358092
+-1.4621131
+-0.95965357
+-0.00095691772
+1.000936
+0.72484705
+-1.7005674
+-0.97368669
+0.35464182
+-0.018718729
+-0.62747205
+0.15895407
+1.3420651
+-1.8730413
+-0.79660876
+-0.73914695
+1.21682
+-1.4521307
+0.11316867
+1.6717599
+-1.5660565
+-1.2563733
+-0.61343964
+1.9311476
+-0.89086846
+1.7825918
+-0.37817686
+-1.2903775
+1.2831391
+-0.33720303
+-0.3793997
+-1.3604329
+-1.3172189
+0.74978271
+1.1900635
+1.746857
+-0.43158473
+-2.0520901
+0.80593369
+-0.72570732
+-0.8921841
+0.44690091
+0.68971429
+-0.42909047
+0.21740181
+0.66174446
+-0.074485437
+0.94674062
+-0.98718242
+-0.033828696
+1.4014368
+0.45655374
+0.41023549
+1.4680021
+-0.32949331
+0.19330209
+0.32702495
+-0.67087075
+0.59007801
+-0.90687546
+0.21110893
+0.30753524
+1.4567934
+-0.82775264
+0.44270065
+0.84837305
+-0.14298371
+-1.8929806
+-1.2892288
+1.1691709
+-0.051253518
+0.21941912
+0.58941222
+-0.79684042
+-0.36758158
+-0.3765854
+-0.59409567
+0.9109124
+0.19669887
+-0.81443702
+-0.57050558
+-1.0698423
+-0.4442069
+0.22077411
+0.20363581
+0.73060644
+1.1440198
+-0.17387325
+-0.85362317
+-0.041672764
+0.07025617
+-0.36421017
+-1.3168054
+0.2742119
+0.40993762
+-1.2896401
+-1.1975043
+0.91494606
+1.5642081
+-0.56559515
+1.6966907
+-1.3855407
+-0.2357787
+1.2472248
+0.42897997
+0.017263655
+-0.46938634
+-0.41087588
+-3.3072017
+0.38840803
+-0.226938
+-0.51362099
+-0.83454297
+0.57609558
+-0.9345449
+0.051212232
+0.56531227
+0.64687612
+0.11881921
+-0.2029688
+0.29780721
+-1.5893488
+-0.18282381
+-0.80776372
+-0.094606104
+0.3278302
+-0.77058792
+0.88943513
+-0.47292515
+-0.030219044
+0.85527907
+-0.30099766
+1.1018596
+1.2304533
+-0.24636223
+-0.065502567
+1.5575102
+1.9243791
+-0.46296039
+-0.74541024
+0.094144
+-0.32983196
+1.2040701
+1.1581579
+0.082975623
+0.2438788
+0.015433574
+-1.1019501
+-0.050873366
+-1.5647944
+0.56309774
+-0.92472825
+0.43325645
+1.370738
+2.1492987
+-0.53451293
+0.24064998
+0.066779528
+-0.8027012
+-1.2697752
+-0.22924284
+1.3121751
+-0.79566842
+0.83351703
+-0.14949323
+-0.0037228362
+-0.18608347
+-0.7746091
+0.29030307
+-0.71806538
+1.1611159
+-1.5153394
+1.5736855
+0.05091225
+-0.72248177
+1.5866405
+-0.23955635
+-1.0621288
+1.6978941
+-0.84189679
+-0.48651429
+1.5605497
+0.63337029
+-0.67656191
+0.5372981
+0.23485897
+0.19768032
+-0.61544681
+-1.1332185
+0.5823327
+2.4884978
+-0.097758536
+-0.74476192
+0.82406584
+-0.12745256
+2.3023859
+0.5098043
+0.5335368
+-0.15191867
+0.56344665
+-0.22371651
+0.043659236
+-1.0727429
+-0.17111644
+-0.047195089
+0.75407611
+-0.88693814
+-0.52731035
+-0.19809918
+0.18714152
+-0.23612246
+-0.86144795
+-0.79390695
+1.0459185
+-0.23484099
+0.49511264
+-1.2144848
+-1.0554353
+-0.45641469
+-0.75191907
+0.045028582
+-1.2746347
+0.73426038
+-0.89415983
+1.3820731
+0.19875355
+1.3686632
+0.064306251
+0.94727885
+-1.3923089
+-0.87700072
+0.66173737
+1.8034749
+-0.2643672
+-0.62792794
+0.54289997
+-0.35910726
+-0.26908294
+0.51241053
+-0.051219075
+0.29959531
+1.5958083
+0.2985518
+1.3319893
+-0.6326668
+-1.7791846
+-1.1809943
+-0.46562663
+0.31134092
+1.218321
+-0.38086376
+0.092490205
+-0.8538453
+-1.2637394
+-0.031500509
+1.3470259
+-0.4753868
+-0.89770273
+-0.70399391
+-1.8127158
+0.095580538
+0.8942252
+-0.10343915
+0.3641509
+-0.054568928
+1.7715445
+0.71774447
+-0.41569673
+0.75810063
+0.22862254
+-0.20903822
+-0.81405898
+-0.40662762
+0.41342729
+0.55519184
+0.73944672
+0.5120968
+0.91078655
+-1.4038451
+0.4192116
+-0.012065172
+0.49971376
+0.31823952
+-0.036019403
+0.86761237
+0.63506894
+-0.39124922
+-0.042211164
+-2.0383644
+0.12443109
+-0.13041262
+-0.25963814
+-0.33206352
+-0.9046254
+-0.17513881
+0.62048015
+0.30840604
+-0.27021457
+-1.6920232
+0.44496209
+0.22280359
+-0.36046674
+-0.58850644
+0.66333397
+0.10515869
+1.020063
+-1.1595056
+-0.064407476
+1.0801872
+1.4901142
+-0.75273645
+-1.4693799
+1.2500356
+-0.42697667
+-0.11809689
+2.0792234
+-2.0268333
+0.45741275
+-0.12523419
+0.14894131
+0.34044398
+-0.94971706
+1.2425231
+1.4169314
+0.14160928
+0.75439997
+-0.32856964
+-0.79404314
+1.2619891
+0.99631738
+-0.17653816
+-1.0987154
+-1.398986
+-0.97550112
+-1.4308554
+-0.30859191
+-0.076401545
+0.053277138
+0.072170811
+-0.021009867
+-0.6337532
+0.25580656
+0.49503332
+-0.071533063
+1.2549037
+-0.47497449
+0.37155697
+-0.85586124
+-0.26349472
+-0.6972173
+-0.39803883
+-0.76379492
+-0.82143533
+-0.13415445
+0.93540908
+-0.54907628
+-1.8880559
+1.3089976
+0.34631326
+1.4770419
+-0.34453849
+-0.732087
+0.2321151
+0.49739617
+-0.071811256
+1.1494168
+-0.48607433
+1.268752
+1.330932
+0.19287597
+-0.75098887
+1.1098177
+-1.1717341
+-2.0023173
+-0.34497388
+-0.51309899
+0.041365588
+0.36611605
+0.23838236
+0.66232051
+0.1511551
+0.81174295
+0.020813724
+0.47340677
+0.94521969
+-0.20694874
+1.0911018
+0.72104659
+-0.87967994
+0.37356979
+-0.74131499
+-0.23254519
+1.0439875
+0.61028792
+-0.76141916
+1.1477741
+0.72741137
+-0.53372235
+0.3361963
+0.3612381
+-1.4779962
+-0.22127445
+0.91523545
+-1.8840647
+-0.7410474
+1.1044604
+-0.20980075
+-0.37444855
+-0.77399909
+0.24930431
+-0.81198818
+1.3063921
+-0.55242785
+-0.55566447
+-0.21433809
+-1.3137947
+-1.1584744
+-0.22770786
+-0.33289334
+-0.68472555
+0.7263267
+-0.47187288
+-2.0479326
+0.86571008
+1.7934889
+-0.44740178
+-1.3370859
+-0.041870144
+1.1405063
+-1.9381352
+-0.10341898
+0.81759609
+1.0064811
+-0.32288895
+0.37905216
+1.500323
+-0.50767947
+-0.40647565
+1.0362508
+0.2579117
+-0.42630884
+1.1483301
+-1.1322574
+-0.53495493
+-0.94491553
+0.15586619
+-0.32517686
+-1.099376
+0.00980678
+2.1792864
+0.42949149
+-0.37810945
+-0.27087892
+0.20361644
+-1.1627543
+-0.65867105
+-0.086953863
+-0.5043185
+-0.26151267
+-1.1156141
+0.50497804
+1.2682938
+0.89291556
+0.3434104
+-1.7376183
+0.16353338
+0.1281338
+-0.3689075
+-0.18149859
+0.84595247
+-0.36612867
+1.5363298
+2.2713388
+-0.10759493
+0.59648073
+0.73088222
+0.5279914
+-0.48787173
+0.44243908
+-0.03867634
+-0.36949244
+-0.92209932
+-1.0292384
+0.65319778
+0.50675115
+-0.076860427
+-0.67447312
+1.9434568
+-0.6522851
+-1.090416
+-1.0759722
+-1.5828368
+0.74535609
+-0.64466045
+-1.5475122
+0.83447104
+0.54576061
+-0.23737895
+-0.87807051
+-0.44506037
+0.35856443
+-1.4471429
+0.41124371
+-1.0301373
+-0.59261965
+1.5549655
+-0.57218334
+0.060259829
+-1.5014287
+-1.6752037
+0.63115715
+-0.55284815
+2.4843365
+-1.1145034
+-1.3468729
+-0.86460699
+0.4505796
+-1.9664336
+-0.11843574
+0.37801688
+0.14481387
+0.93257479
+-0.15417676
+0.31999774
+-0.21446013
+0.06160638
+1.432894
+0.9320853
+1.4466706
+0.045829452
+-0.10845033
+-0.58099624
+-0.73954765
+-0.41767123
+0.4414893
+0.00068029897
+0.19435139
+-0.52971589
+-0.468203
+0.66627184
+0.21540942
+-0.37394184
+-2.0675469
+-1.1222596
+0.08266413
+-0.69011921
+-2.812086
+-2.1494457
+-0.20973743
+1.4712016
+0.46176323
+1.6937004
+-1.7620432
+-0.15689337
+0.8296567
+0.85352141
+0.49197413
+-0.054418823
+-1.3083392
+0.31905263
+-0.479357
+-0.39980882
+-0.40944129
+0.87223871
+-1.936602
+0.65790131
+0.11389079
+-0.68282311
+1.2172957
+0.026086409
+-0.45669536
+0.13346177
+-0.91474791
+0.94803462
+0.78999837
+0.7752187
+-1.2167063
+-0.26648226
+-1.6441223
+1.1865371
+-0.25805795
+-0.32849361
+0.20546953
+-2.1094546
+0.18850604
+1.0139478
+-0.11287659
+-1.1625065
+-0.95643648
+1.1835468
+0.92672906
+-0.59458897
+-1.4673453
+-0.40010975
+0.65941217
+-0.43572967
+0.70520227
+-0.8561001
+-0.64207731
+-0.023660073
+0.26986459
+-0.91652777
+-0.94805074
+-1.943538
+-1.3062561
+0.032624703
+-1.0999593
+0.30126421
+0.053119879
+-0.67190921
+1.279174
+-1.2266358
+-0.1473061
+0.47976114
+1.4753019
+-0.74395977
+-0.58830461
+-1.5127639
+-0.85441868
+0.46355705
+0.64481677
+-0.0017760459
+-0.82937195
+-1.7193513
+-2.1137891
+-0.63275876
+1.0890979
+-0.0027093174
+-0.56388329
+-0.48499496
+0.37190702
+-0.14011626
+-0.17515784
+0.044120312
+-0.19146737
+0.5694588
+-0.80471493
+-0.08747139
+-0.63855915
+-0.046816619
+0.49095987
+-0.84661888
+0.81290508
+0.33619865
+0.66145439
+-0.39987929
+0.58610115
+0.55638124
+1.0275584
+0.41719921
+-0.037916689
+-1.1182926
+1.4749002
+0.48230571
+-2.694629
+1.7141342
+1.2216586
+-1.6862184
+-0.47394125
+-0.16296482
+1.3020549
+-0.11549651
+0.30303654
+0.48278999
+-0.36309859
+-1.1062226
+-0.54525518
+-1.1931648
+1.5362512
+-0.38261637
+-0.26419902
+0.94648337
+0.49319142
+0.16990056
+-1.2330722
+-1.0345057
+0.1448297
+-1.0583913
+-0.37840458
+0.82319363
+-0.97714395
+-0.53858072
+-0.54034178
+0.41819809
+0.6798347
+0.72875272
+0.13311603
+-0.39570537
+0.61108155
+0.21815629
+1.0076455
+1.3574625
+0.93439116
+1.4403951
+0.20207476
+1.0054464
+-0.008390135
+-1.9740741
+0.17920232
+-0.065173384
+0.79089521
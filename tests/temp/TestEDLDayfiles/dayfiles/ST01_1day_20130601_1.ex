@@ -0,0 +1,21 @@
+# ST01 ex 1.0 1370045100 20 
+2000
+2001
+2002
+2003
+2004
+2005
+2006
+2007
+2008
+2009
+2010
+2011
+2012
+2013
+2014
+2015
+2016
+2017
+2018
+2019
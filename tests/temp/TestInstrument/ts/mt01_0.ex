@@ -0,0 +1,1001 @@
+# mt01 ex 100.0 1234569140.0 25000 mV -30.5 140.25 10.0 
+10001.76405
+10000.40026
+10000.97894
+10002.24119
+10001.86796
+9999.023222
+10000.95069
+9999.849343
+9999.897581
+10000.4115
+10000.14504
+10001.45537
+10000.76224
+10000.12298
+10000.44526
+10000.33517
+10001.49568
+9999.796542
+10000.31487
+9999.147804
+9997.44901
+10000.65572
+10000.86664
+9999.260135
+10002.27215
+9998.548134
+10000.04836
+9999.815516
+10001.53558
+10001.47226
+10000.15795
+10000.38126
+9999.115414
+9998.022504
+9999.655488
+10000.15985
+10001.23389
+10001.20608
+9999.616473
+9999.701597
+9998.955447
+9998.584082
+9998.29793
+10001.95508
+9999.494748
+9999.566426
+9998.751805
+10000.78219
+9998.390902
+9999.79216
+9999.109533
+10000.392
+9999.494395
+9998.824668
+9999.977218
+10000.43383
+10000.07212
+10000.30817
+9999.371478
+9999.643159
+9999.33354
+9999.646547
+9999.193054
+9998.280017
+10000.18383
+9999.604719
+9998.376402
+10000.46948
+9999.099502
+10000.05885
+10000.73609
+10000.13608
+10001.1466
+9998.772474
+10000.40974
+9999.32269
+9999.136803
+9999.42885
+9999.696247
+10000.06407
+9998.84285
+10000.90893
+10000.47386
+9998.472056
+10001.49665
+10001.90439
+10001.18738
+9999.828775
+9998.938047
+10001.06335
+9999.605823
+10001.23155
+10000.21747
+10000.98594
+10000.36577
+10000.71607
+10000.0201
+10001.79557
+10000.13671
+10000.41189
+10001.89315
+9998.662341
+9998.739715
+10000.9797
+9998.837277
+10001.95412
+9999.596981
+9999.263245
+10001.93374
+10001.49141
+10001.87856
+10000.91714
+9999.149974
+10001.92136
+9999.743397
+10000.81396
+10000.95885
+9999.85669
+10000.62588
+10000.93411
+10000.38843
+9998.912699
+10000.31044
+10001.33869
+9999.317832
+9999.862865
+9999.577446
+10001.86196
+10000.68509
+10000.42036
+9999.243084
+10000.55235
+9999.338867
+10000.04513
+9999.377554
+10000.68993
+10000.59019
+9999.805401
+10000.40981
+9998.920838
+9998.522742
+10000.45349
+10000.18087
+10000.64933
+10002.39754
+10000.95898
+9999.101778
+10001.13172
+9998.698893
+9999.553315
+9999.946758
+10001.72844
+9999.270445
+9999.188861
+9999.916947
+9999.352022
+10001.14224
+9998.935768
+9998.868331
+9999.57808
+9999.517968
+10001.94563
+10000.96562
+10000.10385
+9998.790964
+10000.86086
+9999.016385
+9998.471929
+10001.20483
+10000.33384
+10000.93786
+10000.33583
+10000.87403
+9999.366274
+9998.983157
+10000.69909
+9999.21419
+9999.32815
+9999.562267
+10000.03538
+9999.664006
+9998.643149
+9999.374582
+9997.794897
+10000.64363
+9998.416442
+9998.914217
+10000.07087
+9999.279237
+10001.56191
+9998.726143
+10000.28615
+9999.979917
+9998.851207
+10000.54268
+9999.847954
+10000.79139
+10000.8432
+10002.18304
+10001.35643
+9999.650818
+9999.780721
+10001.11986
+10000.67556
+10000.66053
+9998.403544
+9999.996274
+9999.282669
+10000.30072
+9999.92275
+10000.93118
+10000.33832
+10000.80753
+9999.554881
+9999.076954
+9999.61145
+10000.00458
+10000.40085
+10002.28111
+9999.979643
+9999.066055
+9999.676118
+9999.558604
+10000.50378
+9998.481603
+10000.08576
+10000.17911
+10000.25488
+9999.425484
+9999.784978
+9998.598939
+9999.52978
+9999.480339
+10000.43935
+9998.867218
+10000.8047
+10001.51808
+9997.953715
+10000.45006
+10000.70081
+9999.386563
+9999.626828
+9999.891319
+9999.726509
+9999.715387
+9998.348496
+10001.17693
+10001.10432
+9999.211436
+9998.558476
+10000.54606
+9999.449312
+10000.16715
+9999.705972
+10000.71694
+10000.72025
+9999.300003
+9998.642336
+9998.442862
+10000.63628
+9998.837141
+9999.519284
+9999.429886
+9999.973733
+9998.09012
+10000.21528
+10000.55049
+10000.11512
+9999.715914
+10000.1243
+10000.42605
+9997.254507
+10001.98311
+10000.41739
+9999.374991
+9999.636547
+10000.52134
+9999.911596
+9997.997116
+10002.09239
+9999.917459
+10001.04827
+9999.33615
+10001.56468
+10000.31474
+10000.63734
+9998.983347
+10001.23985
+10000.71862
+10001.33075
+9999.400912
+9999.548073
+10002.33312
+9998.969284
+9999.89345
+10001.16639
+10000.12732
+10000.61265
+9999.630351
+10000.39996
+9998.723473
+10001.68823
+9999.912036
+9999.350122
+10000.69678
+9999.56978
+9998.696342
+9998.683982
+10000.72457
+9999.871327
+9999.897298
+10001.10884
+9998.904374
+9999.300622
+9999.64652
+10000.12585
+9999.989429
+9999.744813
+9999.970174
+9999.924595
+9999.312396
+9999.219107
+10000.30672
+9999.141385
+9998.875045
+9999.720208
+9999.874933
+10002.28942
+9999.3281
+10000.97616
+10000.78019
+9998.844155
+10000.80645
+9998.849419
+9997.374228
+10000.63982
+9998.277709
+10000.48463
+9999.349789
+10001.69345
+10001.10251
+9999.580714
+9999.346362
+9998.820223
+9999.593477
+9999.754145
+9999.669906
+10000.1914
+10000.61332
+10000.38455
+9999.270856
+9998.597309
+10001.39973
+9999.345851
+9999.383106
+9999.514311
+9998.19253
+9999.557726
+9999.556144
+10000.65626
+10000.73446
+10000.03987
+10000.96805
+10000.37626
+10000.02072
+10000.19743
+9999.845947
+9999.64185
+9999.769066
+9998.908889
+10000.31744
+9999.043976
+10000.87883
+9999.787841
+10000.08689
+10000.53134
+10000.68091
+9998.467077
+9999.830896
+10000.91808
+9998.339894
+10000.42538
+9997.782636
+9999.015793
+10000.07703
+9998.381785
+9999.053089
+9998.566865
+10001.68693
+10000.20313
+10000.60629
+9999.816425
+9999.685768
+9998.422826
+9999.747563
+9999.278008
+10000.89752
+10001.1808
+10001.50638
+10000.89245
+9999.441346
+9998.924203
+10000.80686
+10000.39659
+9998.271862
+10000.39598
+10000.85512
+10000.09963
+9999.855746
+9999.233252
+9998.594465
+10000.8414
+9999.732086
+9999.807833
+10001.77412
+10000.726
+10000.41243
+10000.18376
+10001.56179
+10001.76149
+10000.97151
+10000.62432
+9997.947597
+10000.16602
+9999.912293
+10000.13645
+10000.98565
+9997.303023
+9999.473488
+10000.3128
+9999.576154
+9998.626194
+10000.91216
+10000.32017
+9999.072295
+10000.35832
+10000.86519
+10000.04899
+10000.84436
+10000.12216
+9999.648771
+9998.884679
+9999.958269
+10000.23859
+10000.92023
+9999.929393
+10000.50202
+9999.080088
+9999.262171
+9999.934511
+9998.990372
+10000.86535
+10000.50833
+10000.3244
+10000.3843
+10002.06654
+9999.576736
+9997.844259
+10000.2451
+9999.995296
+9999.528481
+9999.06727
+9999.60701
+10000.22764
+9999.543583
+10002.45895
+9999.086096
+9999.253583
+9997.75818
+10000.29838
+9998.030593
+9999.507645
+9999.771529
+9999.337572
+10001.78627
+10001.04189
+10001.36674
+9999.165281
+10001.17639
+10000.5439
+10000.81941
+10001.07754
+9999.139437
+9999.623982
+10000.911
+9997.392881
+10001.56193
+10000.60183
+10000.0031
+10000.26941
+9999.019065
+9999.699157
+10001.14948
+10001.34732
+10002.74562
+9999.975575
+9999.391047
+9999.535466
+9999.031758
+9999.972045
+10000.43273
+10000.01586
+10001.14655
+9999.816084
+9999.702949
+9999.469232
+9998.417965
+9998.482932
+9998.871642
+10001.35233
+10000.94626
+10001.42606
+9998.718988
+9998.082675
+9999.391344
+10000.22732
+10000.55029
+10001.09967
+10000.33608
+10001.79457
+9999.829394
+9999.139021
+9998.370982
+9999.163329
+10000.29452
+9999.16378
+10000.98934
+10001.46503
+9997.683213
+10000.91695
+9997.813396
+10000.4546
+10001.27807
+10000.11816
+9998.773711
+9999.468069
+9999.791955
+9999.871455
+9999.850903
+9999.944017
+10000.26748
+9998.845526
+9999.81218
+10001.57256
+9999.669755
+9999.610664
+10001.1328
+9997.495515
+10001.23618
+9999.422996
+10000.21893
+10000.15142
+10000.99767
+9999.787705
+9999.377374
+10001.35335
+9997.691426
+10000.07603
+9998.707875
+9999.294327
+10002.06726
+10000.0115
+10000.25127
+9998.274737
+9999.327355
+10000.25306
+10000.41136
+10000.67359
+10000.06543
+10000.5839
+10000.51078
+9998.22736
+10000.09421
+10000.8252
+10000.64728
+9999.693641
+9999.251973
+9998.939388
+9999.926746
+10001.19098
+9998.106196
+9999.398208
+9998.918398
+10000.84326
+9999.50409
+9999.587862
+9999.84165
+10000.50409
+9999.666411
+9997.012757
+10000.60231
+10000.49814
+9999.839659
+9998.975263
+10000.41118
+10000.43874
+9999.589567
+9999.842969
+9999.129643
+9999.881311
+9998.509571
+10000.47742
+9999.115832
+10000.2984
+9998.654437
+9999.470442
+9999.950111
+9998.4
+10000.17595
+9999.681752
+9998.318644
+9998.757857
+10000.66632
+10000.95686
+9999.929491
+10000.46626
+10000.28544
+10000.39132
+10001.34778
+9998.554902
+10000.73846
+9999.680091
+9999.837941
+9999.76005
+9999.687253
+9998.836304
+10000.24594
+10001.73364
+10000.00667
+10000.06151
+9999.375701
+9999.945625
+10000.52937
+9999.693058
+9999.609596
+10000.46676
+9999.145595
+10000.3162
+10000.88412
+10001.42385
+9999.973618
+10001.4317
+10001.09861
+9999.068087
+9998.846461
+9999.759536
+10001.09354
+9999.992413
+9999.464142
+10001.61714
+10000.3519
+9997.744506
+10000.38236
+10000.58534
+10000.29101
+10000.51521
+9999.998324
+9998.747304
+9999.695096
+9999.120284
+9999.133259
+9998.803032
+10000.51869
+10000.1642
+9999.618235
+9999.417162
+10000.04318
+10001.14589
+9998.062584
+10000.44378
+9999.521288
+9998.182514
+9998.121497
+9999.154517
+10000.28691
+10000.46056
+9999.128618
+10001.08472
+10001.49078
+10000.46399
+9999.476597
+10001.19252
+10000.8236
+10000.93571
+9999.411936
+9997.233945
+10002.18539
+9998.457822
+10000.03303
+10002.44965
+10000.39958
+10001.01835
+9998.566803
+9998.291633
+9999.536697
+10001.16025
+9999.723351
+9999.275064
+10000.26777
+10001.15184
+9998.62506
+9998.859557
+9999.281531
+10001.16494
+10000.30522
+10002.20265
+10001.00705
+10000.0356
+10001.33588
+10000.2824
+9999.366079
+10000.75107
+9999.374873
+9999.780903
+10001.39918
+9999.970219
+9999.268459
+9999.607362
+10001.09359
+9999.519359
+9999.685129
+9999.561807
+10000.25613
+9999.68681
+9998.470564
+9999.185319
+9999.139811
+10001.31602
+10000.88547
+10000.66016
+9999.567642
+9999.257308
+9999.565682
+9999.02142
+10002.5706
+9997.828178
+10000.63761
+9998.789148
+9999.969457
+9999.085898
+9998.896371
+9998.933904
+10001.82919
+9999.941312
+9999.308698
+10000.63029
+10000.08495
+10000.79473
+9998.250543
+10000.3785
+10000.84769
+9998.413502
+10000.5234
+10001.77148
+10000.06054
+10000.89691
+10000.74617
+9999.368194
+10000.11557
+9998.508905
+9999.624697
+10000.34179
+10000.7993
+10000.10091
+10000.79638
+9998.973594
+9999.974903
+10000.09598
+10001.92639
+9999.862733
+9999.577983
+10000.09845
+9999.158087
+10000.27005
+9999.712345
+9998.286172
+10000.01901
+9999.760157
+9998.445377
+10000.01077
+10001.56736
+10000.5994
+10000.69013
+9998.736803
+10000.5553
+10000.22695
+10000.60765
+10000.50133
+9998.719019
+10000.0375
+9999.321129
+10000.02902
+9999.181799
+10001.39177
+9999.220428
+9999.180558
+10000.15419
+9999.002601
+9999.655137
+9999.249935
+10001.49117
+10000.8659
+10000.02273
+9999.689083
+10001.02132
+10000.4857
+10000.57865
+10000.05451
+9998.39257
+9999.968434
+9999.54851
+10000.72616
+10001.09304
+9999.423349
+10000.54979
+10001.81738
+9999.413887
+10001.76362
+9999.229214
+10000.10486
+10000.07085
+10000.0936
+9999.244522
+9999.491117
+9999.41468
+10000.40946
+10000.41264
+10002.30864
+10001.45379
+9999.573057
+10000.40787
+10001.08022
+10000.1138
+10000.01366
+10000.13497
+10000.95078
+9999.235279
+9999.758031
+10000.55423
+10000.39535
+10000.32358
+9999.714299
+10001.05674
+10002.21817
+10000.49082
+9999.891323
+10000.84034
+9999.545567
+9999.33511
+10000.11771
+9997.502203
+9998.93115
+9999.737238
+9998.731911
+9999.052757
+9999.648752
+9998.442635
+9999.679628
+9999.55053
+10000.11131
+10001.24018
+10000.2586
+10000.10726
+10000.18575
+10000.31379
+9999.069761
+9999.971825
+10000.39545
+9998.71604
+10000.95255
+10001.16838
+9999.455724
+9999.845862
+9999.20911
+10000.78678
+9999.026278
+9999.865123
+9999.22878
+10000.13875
+9998.293671
+10001.41446
+9999.123494
+10000.14809
+9999.875777
+9999.326285
+9999.20072
+10001.025
+9999.563059
+10000.35997
+9999.287403
+9999.441819
+10000.56135
+10001.01961
+9999.913984
+9998.66748
+10002.08746
+9999.233051
+9998.548113
+10002.68422
+9999.685868
+9998.628267
+9999.40666
+10000.45774
+10000.28061
+9999.238671
+10001.91322
+9999.56902
+9998.906013
+10001.05149
+10001.41996
+9999.273507
+9998.689753
+10001.12164
+9998.043976
+9998.864778
+10001.05895
+10000.03625
+9999.827763
+10000.44462
+9999.939126
+9998.793313
+10001.36818
+10001.41721
+10000.29763
+10000.13753
+10002.43212
+9999.816167
+9999.833123
+10000.45728
+10001.56422
+10001.68577
+9999.834527
+10000.40153
+9998.715217
+9999.781424
+9999.25321
+9999.086768
+10001.77528
+9999.301513
+9999.562294
+10000.45985
+10001.39193
+10000.57532
+10002.85366
+10000.01973
+10000.35322
+10000.3702
+10001.52975
+10000.60204
+9999.97867
+9999.147511
+10000.33954
+10001.49654
+9999.684918
+10000.62434
+10000.34165
+10000.95912
+9999.290946
+10002.44245
+9998.816739
+9999.730449
+10001.03419
+10000.39293
+10000.92629
+9999.600298
+10000.0217
+10000.10883
+10001.66596
+10000.78723
+10000.89357
+9999.439074
+10001.06598
+10000.32278
+10001.48645
+10002.11146
+9999.790734
+9999.691297
+9999.233655
+9999.95422
+9999.715875
+10000.4575
+9999.953533
+9999.736601
+10001.16289
+9999.16052
+10000.53161
+9999.692658
+10000.82307
+10001.48406
+9999.795802
+10000.54003
+10000.27789
+9999.299778
+10000.34009
+10000.38852
+10000.51237
+9999.901201
+10000.19389
+9998.952189
+9999.741786
@@ -0,0 +1,5 @@
+1
+2
+bad
+3
+4
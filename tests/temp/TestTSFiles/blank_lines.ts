@@ -0,0 +1,8 @@
+# MT01 ex 10.0 0.0 4 
+1.76405235e+00
+4.00157208e-01
+9.78737984e-01
+2.24089320e+00
+
+# a comment
+  
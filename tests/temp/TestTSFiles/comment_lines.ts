@@ -0,0 +1,5 @@
+1
+
+# comment
+2
+3
\ No newline at end of file
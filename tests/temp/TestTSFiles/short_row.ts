@@ -0,0 +1,4 @@
+1 2
+3 4
+5
+7 8
@@ -0,0 +1,50 @@
+0.00000000e+00 1.76405235e+00
+1.00000000e+00 4.00157208e-01
+2.00000000e+00 9.78737984e-01
+3.00000000e+00 2.24089320e+00
+4.00000000e+00 1.86755799e+00
+5.00000000e+00 -9.77277880e-01
+6.00000000e+00 9.50088418e-01
+7.00000000e+00 -1.51357208e-01
+8.00000000e+00 -1.03218852e-01
+9.00000000e+00 4.10598502e-01
+1.00000000e+01 1.44043571e-01
+1.10000000e+01 1.45427351e+00
+1.20000000e+01 7.61037725e-01
+1.30000000e+01 1.21675016e-01
+1.40000000e+01 4.43863233e-01
+1.50000000e+01 3.33674327e-01
+1.60000000e+01 1.49407907e+00
+1.70000000e+01 -2.05158264e-01
+1.80000000e+01 3.13067702e-01
+1.90000000e+01 -8.54095739e-01
+2.00000000e+01 -2.55298982e+00
+2.10000000e+01 6.53618595e-01
+2.20000000e+01 8.64436199e-01
+2.30000000e+01 -7.42165020e-01
+2.40000000e+01 2.26975462e+00
+2.50000000e+01 -1.45436567e+00
+2.60000000e+01 4.57585173e-02
+2.70000000e+01 -1.87183850e-01
+2.80000000e+01 1.53277921e+00
+2.90000000e+01 1.46935877e+00
+3.00000000e+01 1.54947426e-01
+3.10000000e+01 3.78162520e-01
+3.20000000e+01 -8.87785748e-01
+3.30000000e+01 -1.98079647e+00
+3.40000000e+01 -3.47912149e-01
+3.50000000e+01 1.56348969e-01
+3.60000000e+01 1.23029068e+00
+3.70000000e+01 1.20237985e+00
+3.80000000e+01 -3.87326817e-01
+3.90000000e+01 -3.02302751e-01
+4.00000000e+01 -1.04855297e+00
+4.10000000e+01 -1.42001794e+00
+4.20000000e+01 -1.70627019e+00
+4.30000000e+01 1.95077540e+00
+4.40000000e+01 -5.09652182e-01
+4.50000000e+01 -4.38074302e-01
+4.60000000e+01 -1.25279536e+00
+4.70000000e+01 7.77490356e-01
+4.80000000e+01 -1.61389785e+00
+4.90000000e+01 -2.12740280e-01
@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.gui.tstools.tspyramid import MinMaxPyramid, PyramidCache
+
+
+class TestMinMaxPyramid(TestCase):
+    def setUp(self):
+        self.rate = 100.
+        self.starttime = 1.5e9
+        rng = np.random.RandomState(0)
+        self.data = np.cumsum(rng.normal(size=10**6))
+
+    def _build(self, pieces, maxbins=2**12):
+        pyramid = MinMaxPyramid(self.starttime, self.starttime + (len(self.data) - 1) / self.rate,
+                                self.rate, maxbins)
+        for start, end in pieces:
+            pyramid.add(self.starttime + start / self.rate, self.data[start:end])
+        pyramid.finalize()
+        return pyramid
+
+    def test_levels(self):
+        # pieces that do not line up with the bins and overlap by a sample
+        pieces = [(0, 1000), (999, 123457), (123457, 600001), (600000, len(self.data))]
+        pyramid = self._build(pieces)
+        self.assertEqual(pyramid.baselevel, 8)
+        self.assertEqual(pyramid.gaps, [])
+
+        for ii, (mins, maxs) in enumerate(pyramid.levels):
+            binsize = 2**(pyramid.baselevel + ii)
+            nbins = -(-len(self.data) // binsize)
+            padded = np.append(self.data, np.full(nbins * binsize - len(self.data), np.nan))
+            self.assertTrue(np.array_equal(mins, np.nanmin(padded.reshape(nbins, binsize), axis=1)))
+            self.assertTrue(np.array_equal(maxs, np.nanmax(padded.reshape(nbins, binsize), axis=1)))
+        self.assertEqual(len(pyramid.levels[-1][0]), 1)
+
+    def test_window(self):
+        pyramid = self._build([(0, len(self.data))])
+        numofsamples = 400
+
+        # windows are served from the coarsest level with numofsamples bins
+        for window in [2000., 5000., 8765.]:
+            start = self.starttime + 1234.5
+            level = pyramid.getlevel(start, start + window, numofsamples)
+            self.assertGreaterEqual(window * self.rate / 2**level, numofsamples)
+            self.assertLess(window * self.rate / 2**(level + 1), numofsamples)
+
+            wave = pyramid.getwindow(start, start + window, numofsamples)
+            self.assertGreaterEqual(wave.shape[1], 2 * numofsamples)
+            self.assertLessEqual(wave[0, 0], start)
+            self.assertGreaterEqual(wave[0, -1] + 2**level / self.rate, start + window)
+            self.assertTrue(np.all(np.diff(wave[0]) > 0))
+
+            # the envelope covers the samples of the window
+            samples = self.data[int(1234.5 * self.rate):int((1234.5 + window) * self.rate)]
+            self.assertLessEqual(np.min(wave[1]), np.min(samples))
+            self.assertGreaterEqual(np.max(wave[1]), np.max(samples))
+
+        # the whole recording
+        wave = pyramid.getwindow(numofsamples=numofsamples)
+        self.assertEqual(np.min(wave[1]), np.min(self.data))
+        self.assertEqual(np.max(wave[1]), np.max(self.data))
+
+        # too short for the finest level
+        self.assertIsNone(pyramid.getwindow(self.starttime, self.starttime + 500., numofsamples))
+
+    def test_gaps(self):
+        pyramid = self._build([(0, 300000), (400000, len(self.data))])
+        self.assertEqual(pyramid.gaps, [(self.starttime + 299999 / self.rate,
+                                         self.starttime + 400000 / self.rate)])
+        mins, maxs = pyramid.levels[0]
+        binsize = 2**pyramid.baselevel
+        self.assertTrue(np.all(np.isnan(mins[300000 // binsize + 1:400000 // binsize])))
+        self.assertFalse(np.any(np.isnan(maxs[:300000 // binsize + 1])))
+
+
+class TestPyramidCache(TestCase):
+    def test_lru(self):
+        cache = PyramidCache(maxbytes=2500)
+        for key in ['a', 'b']:
+            cache.put(key, np.zeros(125))
+        self.assertIsNotNone(cache.get('a'))
+
+        # b is least recently used
+        cache.put('c', np.zeros(125))
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.nbytes, 2000)
+
+        # the most recent item is kept even if it is larger than the cache
+        cache.put('d', np.zeros(1000))
+        self.assertEqual(len(cache), 1)
+        self.assertIn('d', cache)
+        self.assertEqual(cache.nbytes, 8000)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Test streaming Z3D files into cache files and reading them back
+"""
+import os
+from unittest import TestCase
+
+import numpy as np
+import scipy.signal as sps
+
+from mtpy.usgs.zonge_cache import Cache, Z3DStream, ZenCache
+from tests import make_temp_dir
+
+
+def write_z3d(fn, component, channel, gps_start, data, df=256):
+    """
+    write a minimal Z3D file with a gps stamp before every second of data
+    """
+    header = ('\n\n\nGPS Brd339/Brd357 Header Record\n'
+              'ChannelSerial = 0xD474777C\nBox number = 26\n'
+              'Channel = {0}\nA/D Gain = 1\nA/D Rate = {1}\n'
+              'Lat = 0.706816081\nLong = -2.067178375\n'
+              'Alt = 1175.639\n'.format(channel, df))
+    schedule = ('\n\n\nGPS Brd339/Brd357 Schedule Record\n'
+                'Schedule.Date = 2017-08-29\nSchedule.Time = 19:00:00\n')
+    metadata = ('\n\n\nGPS Brd339/Brd357 Metadata Record\n'
+                '|RX.STN=100|CH.CMP={0}|CH.NUMBER={1}|CH.LENGTH=100|'
+                'CH.AZIMUTH=0|\n'.format(component, channel))
+
+    n_sec = data.size // df
+    stamps = np.zeros((n_sec, 16), dtype=np.int32)
+    stamps[:, 0] = 2147483647
+    stamps[:, 1] = -2147483648
+    stamps[:, 2] = (gps_start + np.arange(n_sec)) * 1024
+    blocks = np.hstack([stamps, data[:n_sec * df].reshape(n_sec, df)])
+
+    with open(fn, 'wb') as fid:
+        for block_str in [header, schedule, metadata]:
+            fid.write(block_str.encode().ljust(512, b'\x00'))
+        fid.write(blocks.astype('<i4').tobytes())
+
+
+class TestZenCache(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+        rng = np.random.RandomState(0)
+        cls.df = 256
+
+        # ey starts 2 seconds after ex and is shorter
+        cls.data = {}
+        cls.fn_list = []
+        for comp, ch, gps_start, n_sec in [('EX', 4, 300000, 40),
+                                           ('EY', 5, 300002, 35)]:
+            data = rng.randint(1, 2**20, n_sec * cls.df).astype(np.int32)
+            data[::2] *= -1
+            fn = os.path.join(cls._temp_dir,
+                              'mt01_20170829_190000_256_{0}.Z3D'.format(comp))
+            write_z3d(fn, comp, ch, gps_start, data, df=cls.df)
+            cls.data[comp.lower()] = data
+            cls.fn_list.append(fn)
+
+        # the first 3 seconds are skipped, so the merged data starts at
+        # 300005 which is 5 seconds into ex and 3 seconds into ey
+        n_points = 32 * cls.df
+        cls.ts = np.array([cls.data['ex'][5 * cls.df:5 * cls.df + n_points],
+                           cls.data['ey'][3 * cls.df:3 * cls.df + n_points]]).T
+
+    def test_z3d_stream(self):
+        zs = Z3DStream(self.fn_list[0], chunk_size=1000)
+        zs.read_info()
+        self.assertEqual(zs.df, 256)
+        self.assertEqual(zs.component, 'ex')
+        self.assertEqual(zs.n_samples, 37 * self.df)
+        self.assertTrue(np.array_equal(zs.gps_seconds,
+                                       300003 + np.arange(37)))
+        self.assertTrue(np.array_equal(zs.read(0, zs.n_samples),
+                                       self.data['ex'][3 * self.df:]))
+        self.assertTrue(np.array_equal(zs.read(1000, 1300),
+                                       self.data['ex'][3 * self.df + 1000:
+                                                       3 * self.df + 1300]))
+        self.assertEqual(zs.read(zs.n_samples - 10, zs.n_samples + 10).size,
+                         10)
+
+    def test_write_read_cache(self):
+        cache_fn = os.path.join(self._temp_dir, 'mt01_stream.cac')
+        zc = ZenCache()
+        zc.verbose = False
+        zc.write_cache_file(self.fn_list, cache_fn, chunk_size=1000)
+
+        # time series block is the merged channels interleaved
+        ts_block_len = self.ts.size * 4 + 2
+        with open(cache_fn, 'rb') as fid:
+            cache_str = fid.read()
+        self.assertEqual(cache_str[-ts_block_len - 12:],
+                         np.array([ts_block_len], dtype='<i4').tobytes() +
+                         np.array([-1], dtype='<i4').tobytes() +
+                         np.array([16], dtype='<i2').tobytes() +
+                         self.ts.astype('<i4').tobytes() +
+                         np.array([ts_block_len], dtype='<i4').tobytes())
+
+        zc_read = ZenCache()
+        zc_read.read_cache(cache_fn)
+        self.assertIsInstance(zc_read.ts, np.memmap)
+        self.assertTrue(np.array_equal(zc_read.ts, self.ts))
+        self.assertEqual(zc_read.meta_data['CH.CMP'], ['EX', 'EY'])
+        self.assertEqual(zc_read.meta_data['TS.NPNT'], [str(len(self.ts))])
+        self.assertEqual(zc_read.nav_data.size, 41)
+
+        # a cache file with only the calibration header
+        cac_fn = os.path.join(self._temp_dir, 'mt01_board_cal.cac')
+        meta_str = ''.join(['{0},{1}\n'.format(key, ','.join(value))
+                            for key, value in zc_read.meta_data.items()
+                            if key != ''])
+        cal_str = 'HEADER.TYPE,Calibrate\nCAL.VER,019\n'
+        with open(cac_fn, 'wb') as cfid:
+            zc._write_block(cfid, 'nav', b'\x00' * 41)
+            zc._write_block(cfid, 'meta', meta_str.encode())
+            zc._write_block(cfid, 'cal', cal_str.encode())
+            zc._write_ts_block(cfid, [self.ts[:100], self.ts[100:]],
+                               len(self.ts), 2)
+
+        cac_obj = Cache(cac_fn)
+        cac_obj.read_cache_file()
+        self.assertEqual(cac_obj.metadata.ts_adfreq, 256)
+        self.assertEqual(cac_obj.metadata.station_number, '100')
+        self.assertEqual(cac_obj.calibration.cal_ver, '019')
+        self.assertIsInstance(cac_obj.time_series, np.memmap)
+        self.assertTrue(np.array_equal(cac_obj.time_series, self.ts))
+
+        # rewriting gives the same file
+        zc_read.verbose = False
+        zc_read.rewrite_cache_file(chunk_size=1000)
+        zc_rewrite = ZenCache()
+        zc_rewrite.read_cache(zc_read.save_fn_rw)
+        self.assertTrue(np.array_equal(zc_rewrite.ts, self.ts))
+        self.assertEqual(zc_rewrite.meta_data, zc_read.meta_data)
+
+    def test_write_decimated_cache(self):
+        cache_fn = os.path.join(self._temp_dir, 'mt01_decimated.cac')
+        zc = ZenCache()
+        zc.verbose = False
+        zc.write_cache_file(self.fn_list, cache_fn, decimate=4,
+                            chunk_size=500)
+
+        zc_read = ZenCache()
+        zc_read.read_cache(cache_fn)
+        self.assertEqual(zc_read.meta_data['TS.ADFREQ'], ['64'])
+        self.assertEqual(zc_read.ts.shape, (len(self.ts) // 4, 2))
+
+        # same as decimating the whole time series away from the end
+        for ii, comp in enumerate(['ex', 'ey']):
+            ts_dec = sps.decimate(self.ts[:, ii].astype(float), 4,
+                                  ftype='fir')
+            self.assertTrue(np.allclose(zc_read.ts[:-20, ii],
+                                        ts_dec[:len(self.ts) // 4 - 20],
+                                        rtol=0, atol=1), comp)
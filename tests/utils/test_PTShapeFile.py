@@ -1,8 +1,14 @@
 import inspect
 import os
+import struct
 import unittest
 from unittest import TestCase
+
+import numpy as np
+
 from mtpy.utils.gis_tools import HAS_GDAL
+from mtpy.utils.shapefiles import (get_arrow_polygons, get_ellipse_polygons,
+                                   polygons_to_wkb)
 from tests import make_temp_dir
 
 edi_paths = [
@@ -15,8 +21,50 @@ edi_paths = [
     "data/edifiles2"
 ]
 
+
+class TestPolygons(TestCase):
+    def test_ellipse_polygons(self):
+        theta = np.linspace(0, 2 * np.pi, 20, endpoint=False)
+        polygons = get_ellipse_polygons([100., 200.], [10., 20.], [1., .5],
+                                        [1., 1.], [0., 90.], 1000., theta)
+        self.assertEqual(polygons.shape, (2, 21, 2))
+        self.assertTrue(np.array_equal(polygons[:, 0], polygons[:, -1]))
+
+        # a circle of radius ellipse_size
+        radius = np.hypot(polygons[0, :, 0] - 100., polygons[0, :, 1] - 10.)
+        self.assertTrue(np.allclose(radius, 1000.))
+        # phimax is along the azimuth, phimin across it
+        self.assertTrue(np.allclose(polygons[1, 0], [200., 20. - 500.]))
+        self.assertTrue(np.allclose(polygons[1, 5], [200. + 1000., 20.]))
+
+    def test_arrow_polygons(self):
+        polygons = get_arrow_polygons([100., 200.], [10., 20.], [1., .5],
+                                      [0., 90.], 1000., 10., 20., 100.)
+        self.assertEqual(polygons.shape, (2, 9, 2))
+        self.assertTrue(np.array_equal(polygons[:, 0], polygons[:, -1]))
+        self.assertTrue(np.allclose(polygons[:, 0], [[100., 10.],
+                                                     [200., 20.]]))
+        # the tips point north and east
+        self.assertTrue(np.allclose(polygons[0, 4], [100., 1010.]))
+        self.assertTrue(np.allclose(polygons[1, 4], [700., 20.]))
+
+    def test_polygons_to_wkb(self):
+        polygons = get_arrow_polygons([100., 200., 300.], [10., 20., 30.],
+                                      [1., .5, .2], [0., 90., 45.], 1000.,
+                                      10., 20., 100.)
+        wkb_list = polygons_to_wkb(polygons)
+        self.assertEqual(len(wkb_list), 3)
+        for wkb, polygon in zip(wkb_list, polygons):
+            self.assertEqual(len(wkb), 13 + 16 * 9)
+            self.assertEqual(struct.unpack('<BIII', wkb[:13]), (1, 3, 1, 9))
+            xy = struct.unpack('<18d', wkb[13:])
+            self.assertTrue(np.array_equal(np.reshape(xy, (9, 2)), polygon))
+
+
 if HAS_GDAL:
-    from mtpy.utils.shapefiles import create_phase_tensor_shpfiles
+    import glob
+    from osgeo import ogr
+    from mtpy.utils.shapefiles import create_phase_tensor_shpfiles, PTShapeFile
 
     class TestPTShapeFile(TestCase):
         @classmethod
@@ -53,3 +101,15 @@ if HAS_GDAL:
                 os.mkdir(save_path)
             create_phase_tensor_shpfiles(edi_path, save_path, ellipse_size=6000, every_site=1)
 
+        def test_geopackage(self):
+            edi_list = glob.glob(os.path.join(edi_paths[1], '*.edi'))
+            pts = PTShapeFile(edi_list, ellipse_size=6000)
+            gpkg_fn = os.path.join(self._temp_dir, 'pt.gpkg')
+            pts.write_shape_files(geopackage_fn=gpkg_fn)
+
+            data_source = ogr.Open(gpkg_fn)
+            self.assertEqual(data_source.GetLayerCount(), len(pts.plot_period))
+            for plot_per in pts.plot_period:
+                layer = data_source.GetLayerByName('PT_{0:.5g}s'.format(plot_per))
+                self.assertEqual(layer.GetFeatureCount(),
+                                 pts.pt_dict[plot_per].size)
@@ -2,8 +2,15 @@ from unittest import TestCase
 import numpy as np
 import pytest
 
+from mtpy.analysis.pt import PhaseTensor
 from mtpy.utils.calculator import get_period_list, make_log_increasing_array,\
-                                  z_error2r_phi_error, nearest_index
+                                  z_error2r_phi_error, nearest_index,\
+                                  compute_determinant_error,\
+                                  compute_resistivity_phase_error,\
+                                  compute_phase_tensor,\
+                                  compute_phase_tensor_error,\
+                                  monte_carlo_error
+import mtpy.utils.exceptions as MTex
 
 
 class TestCalculator(TestCase):
@@ -107,3 +114,69 @@ class TestCalculator(TestCase):
         
         self.assertTrue(np.all(np.abs(res_rel_err-res_rel_err_test[0,0,1])/res_rel_err_test[0,0,1] < 1e-8))
         self.assertTrue(np.all(np.abs(phase_err-phase_err_test[0,0,1])/phase_err_test[0,0,1] < 1e-8))        
+
+
+    def test_compute_determinant_error(self):
+        det_err = compute_determinant_error(self.z, self.z_err)
+        det_err_test = np.abs(self.z_err[:, 0, 0] * np.abs(self.z[:, 1, 1]) +
+                              self.z_err[:, 1, 1] * np.abs(self.z[:, 0, 0]) -
+                              self.z_err[:, 0, 1] * np.abs(self.z[:, 1, 0]) -
+                              self.z_err[:, 1, 0] * np.abs(self.z[:, 0, 1]))
+        self.assertTrue(np.allclose(det_err, det_err_test))
+
+        det_err = compute_determinant_error(self.z, self.z_err,
+                                            method='stochastic',
+                                            repeats=1000, seed=0)
+        # same seed gives the same error whatever the chunk size
+        for chunk_size in [1, 100, 10000]:
+            self.assertTrue(np.allclose(
+                compute_determinant_error(self.z, self.z_err,
+                                          method='stochastic', repeats=1000,
+                                          seed=0, chunk_size=chunk_size),
+                det_err, rtol=1e-10))
+
+        # draw all realizations at once
+        errmag = np.random.RandomState(0).standard_normal(
+            (1000,) + self.z.shape + (2,)).view(complex)[..., 0]
+        det_err_test = np.std(np.linalg.det(self.z + errmag * self.z_err),
+                              axis=0)
+        self.assertTrue(np.allclose(det_err, det_err_test, rtol=1e-10))
+
+        # stack of stations
+        z_stack = np.array([self.z, 2 * self.z])
+        det_err = compute_determinant_error(z_stack,
+                                            np.array([self.z_err,
+                                                      2 * self.z_err]),
+                                            method='stochastic',
+                                            repeats=5000, seed=1)
+        self.assertEqual(det_err.shape, (2, 3))
+        self.assertTrue(np.allclose(det_err[1], 4 * det_err[0], rtol=0.1))
+
+    def test_compute_resistivity_phase_error(self):
+        z_err = 0.01 * np.abs(self.z)
+        res_err, phase_err = compute_resistivity_phase_error(
+            self.z, z_err, self.freq, repeats=5000, seed=0)
+        self.assertEqual(res_err.shape, self.z.shape)
+
+        # small errors, compare with linear error propagation
+        res = 0.2 * np.abs(self.z)**2 / self.freq[:, np.newaxis, np.newaxis]
+        res_rel_err, phase_err_test = z_error2r_phi_error(self.z.real,
+                                                          self.z.imag, z_err)
+        self.assertTrue(np.allclose(res_err / res, res_rel_err,
+                                    rtol=0.05))
+        self.assertTrue(np.allclose(phase_err, phase_err_test, rtol=0.05))
+
+    def test_compute_phase_tensor_error(self):
+        pt_obj = PhaseTensor(z_array=self.z, z_err_array=self.z_err,
+                             freq=self.freq)
+        self.assertTrue(np.allclose(compute_phase_tensor(self.z), pt_obj.pt))
+
+        pt_err = compute_phase_tensor_error(self.z, 0.01 * np.abs(self.z),
+                                            repeats=2000, seed=0)
+        self.assertEqual(pt_err.shape, self.z.shape)
+        self.assertTrue(np.all(pt_err > 0))
+
+        self.assertRaises(MTex.MTpyError_inputarguments, monte_carlo_error,
+                          compute_phase_tensor, self.z, self.z_err[:2])
+        self.assertRaises(MTex.MTpyError_inputarguments, monte_carlo_error,
+                          compute_phase_tensor, self.z, self.z_err, repeats=0)
@@ -0,0 +1,146 @@
+"""
+Test reading, writing and merging MTpy time series (TS) data files
+"""
+import calendar
+import os
+from unittest import TestCase
+
+import numpy as np
+
+import mtpy.utils.exceptions as MTex
+import mtpy.utils.filehandling as MTfh
+from tests import make_temp_dir
+
+
+class TestTSFiles(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+
+    def _write_ts(self, fn, data, header='# MT01 ex 10.0 0.0 {0} \n'):
+        with open(fn, 'w') as fid:
+            if header is not None:
+                fid.write(header.format(len(data)))
+            np.savetxt(fid, data, fmt='%.8e')
+        return fn
+
+    def test_read_ts_data(self):
+        data = self.rng.normal(size=1001)
+        fn = self._write_ts(os.path.join(self._temp_dir, 'one_column.ts'),
+                            data)
+
+        self.assertEqual(MTfh.count_ts_samples(fn), 1001)
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn), np.loadtxt(fn)))
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn, 10, 500),
+                                       np.loadtxt(fn)[10:500]))
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn, 990, 2000),
+                                       np.loadtxt(fn)[990:]))
+        self.assertEqual(MTfh.read_ts_data(fn, 500, 500).size, 0)
+
+        blocks = list(MTfh.iter_ts_data(fn, block_len=64))
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(np.array_equal(np.concatenate(blocks),
+                                       np.loadtxt(fn)))
+
+    def test_read_ts_data_columns(self):
+        data = np.column_stack((np.arange(50.), self.rng.normal(size=50)))
+        fn = self._write_ts(os.path.join(self._temp_dir, 'two_columns.ts'),
+                            data, header=None)
+
+        self.assertEqual(MTfh.count_ts_samples(fn), 50)
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn), np.loadtxt(fn)))
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn, 5, 7),
+                                       np.loadtxt(fn)[5:7]))
+
+    def test_read_ts_data_bad_row(self):
+        fn = os.path.join(self._temp_dir, 'bad_row.ts')
+        with open(fn, 'w') as fid:
+            fid.write('1\n2\nbad\n3\n4\n')
+        self.assertRaises(MTex.MTpyError_ts_data, MTfh.read_ts_data, fn)
+
+        fn = os.path.join(self._temp_dir, 'short_row.ts')
+        with open(fn, 'w') as fid:
+            fid.write('1 2\n3 4\n5\n7 8\n')
+        self.assertRaises(MTex.MTpyError_ts_data, MTfh.read_ts_data, fn)
+        self.assertRaises(MTex.MTpyError_ts_data, list,
+                          MTfh.iter_ts_data(fn))
+
+    def test_count_ts_samples_blank_lines(self):
+        data = self.rng.normal(size=4)
+        fn = self._write_ts(os.path.join(self._temp_dir, 'blank_lines.ts'),
+                            data)
+        with open(fn, 'a') as fid:
+            fid.write('\n# a comment\n  \n')
+        self.assertEqual(MTfh.count_ts_samples(fn), 4)
+        self.assertTrue(np.allclose(MTfh.read_ts_data(fn), data,
+                                    rtol=1e-8))
+
+        fn = os.path.join(self._temp_dir, 'comment_lines.ts')
+        with open(fn, 'w') as fid:
+            fid.write('1\n\n# comment\n2\n3')
+        self.assertEqual(MTfh.count_ts_samples(fn), 3)
+        self.assertTrue(np.array_equal(MTfh.read_ts_data(fn), [1., 2., 3.]))
+
+    def test_ts_file_round_trip(self):
+        data = self.rng.normal(size=2000)
+        ts_tuple = ('MT01', 'ex', 10., 1000., 2000, 'mV', -30., 140., 10.,
+                    data)
+        fn = MTfh.write_ts_file_from_tuple(
+            os.path.join(self._temp_dir, 'round_trip.ts'), ts_tuple)
+        self.assertTrue(MTfh.validate_ts_file(fn))
+
+        ts_read = MTfh.read_ts_file(fn)
+        self.assertEqual(ts_read[:9], ts_tuple[:9])
+        self.assertTrue(np.allclose(ts_read[-1], data, rtol=1e-8))
+
+        ts_part = MTfh.read_ts_file(fn, start=100, stop=300)
+        self.assertEqual(ts_part[3], 1010.)
+        self.assertEqual(ts_part[4], 200)
+        self.assertTrue(np.allclose(ts_part[-1], data[100:300], rtol=1e-8))
+
+
+class TestEDLDayfiles(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def _write_edl(self, in_dir, timestamp, data):
+        fn = os.path.join(in_dir, 'EDL.st01{0}.ex'.format(timestamp))
+        np.savetxt(fn, data, fmt='%d')
+
+    def test_make_dayfiles(self):
+        in_dir = os.path.join(self._temp_dir, 'edl')
+        out_dir = os.path.join(self._temp_dir, 'dayfiles')
+        os.makedirs(in_dir)
+
+        # the second file overlaps the first by 10 samples, the third starts
+        # after a gap and the fourth on the next day
+        self._write_edl(in_dir, '130601000000', np.arange(100))
+        self._write_edl(in_dir, '130601000130', np.arange(1000, 1050))
+        self._write_edl(in_dir, '130601000500', np.arange(2000, 2020))
+        self._write_edl(in_dir, '130602000000', np.arange(3000, 3030))
+
+        MTfh.EDL_make_dayfiles(in_dir, 1., outputdir=out_dir)
+        self.assertEqual(sorted(os.listdir(out_dir)),
+                         ['ST01_1day_20130601_0.ex', 'ST01_1day_20130601_1.ex',
+                          'ST01_1day_20130602_0.ex'])
+
+        expected = [('ST01_1day_20130601_0.ex', '2013-06-01 00:00:00',
+                     np.r_[np.arange(90), np.arange(1000, 1050)]),
+                    ('ST01_1day_20130601_1.ex', '2013-06-01 00:05:00',
+                     np.arange(2000, 2020)),
+                    ('ST01_1day_20130602_0.ex', '2013-06-02 00:00:00',
+                     np.arange(3000, 3030))]
+        for fn, start, data in expected:
+            fn = os.path.join(out_dir, fn)
+            header = MTfh.read_ts_header(fn)
+            t_min = calendar.timegm(tuple(
+                int(ii) for ii in start.replace('-', ' ').replace(':', ' ')
+                .split()))
+            self.assertEqual(header['t_min'], t_min)
+            self.assertEqual(header['nsamples'], data.size)
+            self.assertEqual(header['samplingrate'], 1)
+            self.assertTrue(np.array_equal(MTfh.read_ts_data(fn), data))
@@ -0,0 +1,48 @@
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.utils.gocad import Sgrid
+from tests import make_temp_dir
+
+
+class TestSgrid(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = make_temp_dir(cls.__name__)
+
+    def setUp(self):
+        # values exactly representable in ascii and single precision
+        ny, nx, nz = 5, 4, 3
+        gx, gy, gz = np.meshgrid(np.arange(nx) * 250. - 500.,
+                                 np.arange(ny) * 125. + 1000.5,
+                                 -np.arange(nz) * 50.)
+        self.grid_xyz = (gx, gy, gz)
+        self.resistivity = 2. ** np.arange((ny - 1) * (nx - 1) * (nz - 1),
+                                           dtype=float).reshape(ny - 1, nx - 1, nz - 1) % 1000
+
+    def _write_read(self, fn, binary, double_precision=False):
+        sg = Sgrid(fn=fn, workdir=self._temp_dir, grid_xyz=self.grid_xyz,
+                   resistivity=self.resistivity, binary=binary,
+                   double_precision=double_precision)
+        sg.write_sgrid_file()
+
+        sg_read = Sgrid()
+        sg_read.read_sgrid_file(os.path.join(self._temp_dir, fn + '.sg'))
+        self.assertEqual(sg_read.binary, binary)
+        return sg_read
+
+    def test_binary_matches_ascii(self):
+        sg_ascii = self._write_read('model_ascii', False)
+        for double_precision in [False, True]:
+            sg_binary = self._write_read('model_binary', True, double_precision)
+            self.assertTrue(np.array_equal(sg_binary.resistivity,
+                                           sg_ascii.resistivity))
+            self.assertTrue(np.array_equal(sg_binary.resistivity,
+                                           self.resistivity))
+            for ii in range(3):
+                self.assertTrue(np.array_equal(sg_binary.grid_xyz[ii],
+                                               sg_ascii.grid_xyz[ii]))
+                self.assertTrue(np.array_equal(sg_binary.grid_xyz[ii],
+                                               self.grid_xyz[ii]))
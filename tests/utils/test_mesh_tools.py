@@ -0,0 +1,75 @@
+"""
+Test ordering points along a profile
+"""
+from unittest import TestCase
+
+import numpy as np
+
+from mtpy.modeling.occam2d import Profile
+from mtpy.utils.mesh_tools import order_profile_points
+
+
+def _greedy_path(coords, start):
+    """
+    nearest neighbour walk by brute force, points at the same distance are
+    taken in order
+    """
+    visited = np.zeros(coords.shape[0], dtype=bool)
+    order = [start]
+    visited[start] = True
+    for ii in range(1, coords.shape[0]):
+        dist = np.hypot(*(coords - coords[order[-1]]).T)
+        dist[visited] = np.inf
+        order.append(int(np.flatnonzero(dist == dist.min())[0]))
+        visited[order[-1]] = True
+    return np.array(order)
+
+
+def _path_length(coords, order):
+    return np.hypot(*np.diff(coords[order], axis=0).T).sum()
+
+
+class TestOrderProfilePoints(TestCase):
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+
+    def test_greedy(self):
+        for n_points in [1, 2, 3, 50, 1000]:
+            coords = self.rng.uniform(0, 1000, (n_points, 2))
+            # points on a grid have many neighbours at the same distance
+            coords[::3] = np.round(coords[::3] / 100.) * 100.
+            order = order_profile_points(coords[:, 0], coords[:, 1])
+            self.assertTrue(np.array_equal(
+                order, _greedy_path(coords, int(np.argmin(coords[:, 0])))),
+                n_points)
+
+            order = order_profile_points(coords[:, 0], coords[:, 1],
+                                         start=n_points - 1)
+            self.assertEqual(order[0], n_points - 1)
+            self.assertEqual(sorted(order.tolist()), list(range(n_points)))
+
+    def test_two_opt(self):
+        # a curved profile
+        n_points = 3000
+        distance = np.sort(self.rng.uniform(0, 1e5, n_points))
+        coords = np.column_stack((distance, 1e3 * np.sin(distance / 1e4))) + \
+            self.rng.normal(0, 20, (n_points, 2))
+        coords = coords[self.rng.permutation(n_points)]
+
+        order = order_profile_points(coords[:, 0], coords[:, 1])
+        order_2opt = order_profile_points(coords[:, 0], coords[:, 1],
+                                          two_opt=True)
+        self.assertEqual(order_2opt[0], order[0])
+        self.assertEqual(sorted(order_2opt.tolist()), list(range(n_points)))
+        self.assertLess(_path_length(coords, order_2opt),
+                        _path_length(coords, order))
+
+    def test_occam2d_profile(self):
+        # stations sharing eastings or northings
+        eastings = np.array([10., 0., 20., 10., 30.])
+        northings = np.array([5., 0., 5., 0., 10.])
+        self.assertEqual(Profile._optimized_path(eastings, northings),
+                         [1, 3, 0, 2, 4])
+        self.assertEqual(Profile._optimized_path(eastings, northings,
+                                                 start=[30., 10.]),
+                         [4, 2, 0, 3, 1])